@@ -0,0 +1,179 @@
+"""
+数据库批量写入基准测试
+
+对比全量同步写入 files 表的两种方式（WAL 模式）:
+- 旧方式: 每个批次先执行 5 条 PRAGMA，再在事务内 INSERT OR REPLACE
+- 普通方式: 不调整 PRAGMA，每个批次仅执行 INSERT OR REPLACE
+- 新方式: 批量导入会话开始时调整一次连接级 PRAGMA，之后每个批次仅执行 INSERT OR REPLACE
+
+另外在连接池中存在一个空闲读连接（与 302 跳转查询场景一致）时各跑一次：
+旧方式的 journal_mode = OFF 需要独占数据库，此时会直接报错 database is locked
+
+用法: python dev/benchmark_db_upsert.py [总行数] [批次大小]
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER NOT NULL,
+    name VARCHAR(255),
+    sha1 VARCHAR(40),
+    size BIGINT,
+    pickcode VARCHAR(50),
+    ctime BIGINT,
+    mtime BIGINT,
+    path TEXT UNIQUE,
+    extra TEXT
+)
+"""
+INDEX_SQL = "CREATE INDEX IF NOT EXISTS ix_files_parent_id ON files (parent_id)"
+INSERT_SQL = "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+LEGACY_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA cache_size = -100000",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+)
+BULK_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -100000",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def iter_batches(total: int, batch_size: int):
+    """
+    生成测试数据批次
+    """
+    for start in range(0, total, batch_size):
+        yield [
+            (
+                i,
+                i // 24,
+                f"Show.S01E{i % 24:02d}.{i}.mkv",
+                f"{i:040x}",
+                i * 1024,
+                f"a{i:016d}",
+                1700000000,
+                1700000000,
+                f"/media/Show {i // 24:06d}/Season 01/Show.S01E{i % 24:02d}.{i}.mkv",
+                '{"id": %d}' % i,
+            )
+            for i in range(start, min(start + batch_size, total))
+        ]
+
+
+def connect(db_file: Path) -> sqlite3.Connection:
+    """
+    按插件默认配置打开连接
+    """
+    conn = sqlite3.connect(db_file, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA busy_timeout = 60000")
+    conn.execute(CREATE_SQL)
+    conn.execute(INDEX_SQL)
+    return conn
+
+
+def open_reader(db_file: Path) -> sqlite3.Connection:
+    """
+    打开一个空闲读连接
+    """
+    reader = sqlite3.connect(db_file, isolation_level=None, timeout=0)
+    reader.execute("SELECT COUNT(*) FROM files").fetchone()
+    return reader
+
+
+def run_legacy(db_file: Path, total: int, batch_size: int) -> float:
+    """
+    旧方式
+    """
+    batches = list(iter_batches(total, batch_size))
+    conn = connect(db_file)
+    conn.execute("PRAGMA busy_timeout = 0")
+    start = time.perf_counter()
+    for batch in batches:
+        # 与 pysqlite 行为一致，PRAGMA 在隐式 BEGIN 之前执行
+        for pragma in LEGACY_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_SQL, batch)
+        conn.execute("COMMIT")
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def run_plain(db_file: Path, total: int, batch_size: int) -> float:
+    """
+    普通写入（不调整 PRAGMA）
+    """
+    batches = list(iter_batches(total, batch_size))
+    conn = connect(db_file)
+    start = time.perf_counter()
+    for batch in batches:
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_SQL, batch)
+        conn.execute("COMMIT")
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def run_bulk(db_file: Path, total: int, batch_size: int) -> float:
+    """
+    新方式
+    """
+    batches = list(iter_batches(total, batch_size))
+    conn = connect(db_file)
+    start = time.perf_counter()
+    for pragma in BULK_PRAGMAS:
+        conn.execute(pragma)
+    for batch in batches:
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_SQL, batch)
+        conn.execute("COMMIT")
+    conn.execute("PRAGMA synchronous = FULL")
+    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    print(f"{'mode':>8} {'reader':>7} {'rows':>10} {'seconds':>10} {'rows/s':>12}")
+    for name, func in (
+        ("legacy", run_legacy),
+        ("plain", run_plain),
+        ("bulk", run_bulk),
+    ):
+        for with_reader in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                db_file = Path(tmp) / "bench.db"
+                reader = None
+                if with_reader:
+                    connect(db_file).close()
+                    reader = open_reader(db_file)
+                try:
+                    elapsed = func(db_file, total, batch_size)
+                    result = f"{elapsed:>10.3f} {total / elapsed:>12.0f}"
+                except sqlite3.OperationalError as e:
+                    result = f"{'error':>10}  {e}"
+                finally:
+                    if reader:
+                        reader.close()
+            print(f"{name:>8} {str(with_reader):>7} {total:>10} {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+目录树差异对比基准测试
+
+对比增量同步中两种获取新增路径的方式:
+- 旧方式: compare_trees_lines 产出行号，再按行号两次调用 get_path_by_line_number 重新扫描文件
+- 新方式: compare_trees_aligned 单次遍历同时产出 (网盘路径, 本地路径)
+
+用法: python dev/benchmark_tree_diff.py [总行数 ...]
+"""
+
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+TREE_MODULE_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "plugins.v2"
+    / "p115strmhelper"
+    / "utils"
+    / "tree.py"
+)
+# 新增文件比例
+NEW_RATIO = 0.01
+# 旧方式在该行数以上耗时过长，跳过
+LEGACY_MAX_LINES = 50_000
+
+
+def load_directory_tree():
+    """
+    直接按文件加载 DirectoryTree，避免导入插件包
+    """
+    spec = importlib.util.spec_from_file_location("tree", TREE_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DirectoryTree
+
+
+def build_trees(workdir: Path, total: int):
+    """
+    生成测试用目录树文件
+    """
+    pan_tree = workdir / "pan_tree.txt"
+    pan_to_local_tree = workdir / "pan_to_local_tree.txt"
+    local_tree = workdir / "local_tree.txt"
+    step = max(int(1 / NEW_RATIO), 1)
+    with (
+        open(pan_tree, "w", encoding="utf-8") as f_pan,
+        open(pan_to_local_tree, "w", encoding="utf-8") as f_p2l,
+        open(local_tree, "w", encoding="utf-8") as f_local,
+    ):
+        for i in range(total):
+            name = f"Show {i // 24:06d}/Season 01/Show.S01E{i % 24:02d}.{i}"
+            f_pan.write(f"/media/{name}.mkv\n")
+            f_p2l.write(f"/strm/{name}.strm\n")
+            if i % step:
+                f_local.write(f"/strm/{name}.strm\n")
+    return pan_tree, pan_to_local_tree, local_tree
+
+
+def run_legacy(tree, pan_tree, pan_to_local_tree, local_tree) -> int:
+    """
+    旧方式
+    """
+    count = 0
+    for line in tree.compare_trees_lines(pan_to_local_tree, local_tree):
+        pan_path = tree.get_path_by_line_number(pan_tree, line)
+        local_path = tree.get_path_by_line_number(pan_to_local_tree, line)
+        if pan_path and local_path:
+            count += 1
+    return count
+
+
+def run_aligned(tree, pan_tree, pan_to_local_tree, local_tree) -> int:
+    """
+    新方式
+    """
+    count = 0
+    for _ in tree.compare_trees_aligned(pan_to_local_tree, local_tree, pan_tree):
+        count += 1
+    return count
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000, 200_000, 400_000]
+    tree = load_directory_tree()
+    print(f"{'lines':>10} {'new':>8} {'legacy(s)':>12} {'aligned(s)':>12}")
+    for total in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            files = build_trees(Path(tmp), total)
+
+            legacy = "skip"
+            if total <= LEGACY_MAX_LINES:
+                start = time.perf_counter()
+                legacy_count = run_legacy(tree, *files)
+                legacy = f"{time.perf_counter() - start:.3f}"
+
+            start = time.perf_counter()
+            aligned_count = run_aligned(tree, *files)
+            aligned = f"{time.perf_counter() - start:.3f}"
+
+            if legacy != "skip" and legacy_count != aligned_count:
+                raise AssertionError(f"结果不一致: {legacy_count} != {aligned_count}")
+            print(f"{total:>10} {aligned_count:>8} {legacy:>12} {aligned:>12}")
+
+
+if __name__ == "__main__":
+    main()
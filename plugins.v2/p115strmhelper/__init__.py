@@ -247,7 +247,9 @@ class P115StrmHelper(_PluginBase):
         return [
             {
                 "path": "/redirect_url",
-                "endpoint": self.api.redirect_url,
+                "endpoint": self.api.redirect_url_async
+                if configer.get_config("link_redirect_async_enabled")
+                else self.api.redirect_url,
                 "methods": ["GET", "POST", "HEAD"],
                 "summary": "302跳转",
                 "description": "115网盘302跳转",
@@ -293,6 +295,13 @@ class P115StrmHelper(_PluginBase):
                 "auth": "bear",
                 "summary": "获取状态",
             },
+            {
+                "path": "/metrics",
+                "endpoint": self.api.get_metrics_api,
+                "methods": ["GET"],
+                "summary": "302跳转服务指标",
+                "description": "Prometheus 文本格式，使用 apikey 参数认证",
+            },
             {
                 "path": "/full_sync",
                 "endpoint": self.api.trigger_full_sync_api,
@@ -307,6 +316,13 @@ class P115StrmHelper(_PluginBase):
                 "auth": "bear",
                 "summary": "执行全量同步",
             },
+            {
+                "path": "/compact_db",
+                "endpoint": self.api.trigger_compact_db_api,
+                "methods": ["POST"],
+                "auth": "bear",
+                "summary": "压缩数据库",
+            },
             {
                 "path": "/share_sync",
                 "endpoint": self.api.trigger_share_sync_api,
@@ -881,6 +897,14 @@ class P115StrmHelper(_PluginBase):
                 userid=event.event_data.get("user"),
             )
 
+    @eventmanager.register(EventType.TransferComplete)
+    def wake_monitor_life(self, event: Event):
+        """
+        整理完成时唤醒等待整理队列清空的生活事件监控
+        """
+        if servicer.monitorlife:
+            servicer.monitorlife.notify_transfer_complete()
+
     @eventmanager.register(EventType.TransferComplete)
     def fix_monitor_life_strm(self, event: Event):
         """
@@ -17,10 +17,18 @@ from fastapi import Request, Response
 
 from .service import servicer
 from .core.config import configer
-from .core.cache import idpathcacher
+from .core.cache import idpathcacher, r302cacher, shareresolvecacher
+from .helper.r302 import (
+    r302_async_limiter,
+    r302_async_singleflight,
+    r302_http_client,
+    r302_metrics,
+    r302_singleflight,
+)
 from .core.message import post_message
 from .core.i18n import i18n
 from .core.aliyunpan import AliyunPanLogin
+from .utils.metrics import PrometheusText
 from .utils.sentry import sentry_manager
 
 from app.log import logger
@@ -556,6 +564,7 @@ class Api:
         user_agent = request.headers.get("User-Agent") or b""
         logger.debug(f"【302跳转服务】获取到客户端UA: {user_agent}")
 
+        start = time.perf_counter()
         if share_code:
             try:
                 if not receive_code:
@@ -575,8 +584,10 @@ class Api:
                     share_code, receive_code, id, user_agent
                 )
                 logger.info(f"【302跳转服务】获取 115 下载地址成功: {url}")
+                r302_metrics.observe("share", time.perf_counter() - start)
             except Exception as e:
                 logger.error(f"【302跳转服务】获取 115 下载地址失败: {e}")
+                r302_metrics.error("share", e)
                 return f"获取 115 下载地址失败: {e}"
         else:
             if not pickcode:
@@ -587,8 +598,9 @@ class Api:
                 logger.debug(f"【302跳转服务】Bad pickcode: {pickcode} {file_name}")
                 return f"Bad pickcode: {pickcode} {file_name}"
 
+            mode = configer.get_config("link_redirect_mode")
             try:
-                if configer.get_config("link_redirect_mode") == "cookie":
+                if mode == "cookie":
                     url = servicer.redirect.get_downurl_cookie(
                         pickcode.lower(), user_agent
                     )
@@ -596,13 +608,26 @@ class Api:
                     url = servicer.redirect.get_downurl_open(
                         pickcode.lower(), user_agent
                     )
+                if servicer.r302_prefetcher:
+                    servicer.r302_prefetcher.on_resolved(
+                        mode, pickcode.lower(), user_agent
+                    )
                 logger.info(
                     f"【302跳转服务】获取 115 下载地址成功: {url} {url['file_name']}"  # pylint: disable=E1126
                 )
+                r302_metrics.observe(mode, time.perf_counter() - start)
             except Exception as e:
                 logger.error(f"【302跳转服务】获取 115 下载地址失败: {e}")
+                r302_metrics.error(mode, e)
                 return f"获取 115 下载地址失败: {e}"
 
+        return self._redirect_response(url)
+
+    @staticmethod
+    def _redirect_response(url) -> Response:
+        """
+        生成 302 跳转响应
+        """
         return Response(
             status_code=302,
             headers={
@@ -613,6 +638,84 @@ class Api:
             content=dumps({"status": "redirecting", "url": url}),
         )
 
+    async def redirect_url_async(
+        self,
+        request: Request,
+        pickcode: str = "",
+        file_name: str = "",
+        id: int = 0,
+        share_code: str = "",
+        receive_code: str = "",
+    ):
+        """
+        115网盘302跳转（异步）
+
+        不占用线程池等待上游，请求上游时受并发上限限制
+        """
+        user_agent = request.headers.get("User-Agent") or b""
+        logger.debug(f"【302跳转服务】获取到客户端UA: {user_agent}")
+
+        start = time.perf_counter()
+        if share_code:
+            try:
+                if not receive_code:
+                    receive_code = await servicer.redirect.get_receive_code_async(
+                        share_code
+                    )
+                elif len(receive_code) != 4:
+                    return f"Bad receive_code: {receive_code}"
+                if not id:
+                    if file_name:
+                        id = await servicer.redirect.share_get_id_for_name_async(
+                            share_code,
+                            receive_code,
+                            file_name,
+                        )
+                if not id:
+                    return f"Please specify id or name: share_code={share_code!r}"
+                url = await servicer.redirect.get_share_downurl_async(
+                    share_code, receive_code, id, user_agent
+                )
+                logger.info(f"【302跳转服务】获取 115 下载地址成功: {url}")
+                r302_metrics.observe("share", time.perf_counter() - start)
+            except Exception as e:
+                logger.error(f"【302跳转服务】获取 115 下载地址失败: {e}")
+                r302_metrics.error("share", e)
+                return f"获取 115 下载地址失败: {e}"
+        else:
+            if not pickcode:
+                logger.debug("【302跳转服务】Missing pickcode parameter")
+                return "Missing pickcode parameter"
+
+            if not (len(pickcode) == 17 and pickcode.isalnum()):
+                logger.debug(f"【302跳转服务】Bad pickcode: {pickcode} {file_name}")
+                return f"Bad pickcode: {pickcode} {file_name}"
+
+            mode = configer.get_config("link_redirect_mode")
+            try:
+                if mode == "cookie":
+                    url = await servicer.redirect.get_downurl_cookie_async(
+                        pickcode.lower(), user_agent
+                    )
+                else:
+                    url = await servicer.redirect.get_downurl_open_async(
+                        pickcode.lower(), user_agent
+                    )
+                if servicer.r302_prefetcher:
+                    servicer.r302_prefetcher.on_resolved(
+                        mode, pickcode.lower(), user_agent
+                    )
+                logger.info(
+                    f"【302跳转服务】获取 115 下载地址成功: {url} {url['file_name']}"  # pylint: disable=E1126
+                )
+                r302_metrics.observe(mode, time.perf_counter() - start)
+            except Exception as e:
+                logger.error(f"【302跳转服务】获取 115 下载地址失败: {e}")
+                r302_metrics.error(mode, e)
+                return f"获取 115 下载地址失败: {e}"
+
+        return self._redirect_response(url)
+
     def trigger_full_sync_api(self) -> Dict:
         """
         触发全量同步
@@ -641,6 +744,17 @@ class Api:
         except Exception as e:
             return {"code": 1, "msg": f"启动全量同步数据库任务失败: {str(e)}"}
 
+    def trigger_compact_db_api(self) -> Dict:
+        """
+        触发数据库压缩
+        """
+        try:
+            servicer.start_compact_db()
+
+            return {"code": 0, "msg": "数据库压缩任务已启动"}
+        except Exception as e:
+            return {"code": 1, "msg": f"启动数据库压缩任务失败: {str(e)}"}
+
     def trigger_share_sync_api(self) -> Dict:
         """
         触发分享同步
@@ -678,9 +792,121 @@ class Api:
                     and servicer.monitor_life_thread.is_alive()
                 )
                 or bool(servicer.service_observer),
+                "r302_latency": r302_http_client.recorder.snapshot(),
+                "r302_metrics": r302_metrics.snapshot(),
+                "r302_singleflight": r302_singleflight.stats(),
+                "r302_async_singleflight": r302_async_singleflight.stats(),
+                "r302_async_limiter": r302_async_limiter.stats(),
+                "share_resolve_cache": shareresolvecacher.stats(),
+                "r302_copy_pool": servicer.redirect.copy_pool.stats()
+                if servicer.redirect and servicer.redirect.copy_pool
+                else None,
+                "r302_prefetch": servicer.r302_prefetcher.stats()
+                if servicer.r302_prefetcher
+                else None,
+                "life_poll": servicer.monitorlife.poller.stats()
+                if servicer.monitorlife
+                else None,
+                "life_latency": servicer.monitorlife.latency.snapshot()
+                if servicer.monitorlife
+                else None,
             },
         }
 
+    def get_metrics_api(self) -> Response:
+        """
+        获取 302 跳转服务与生活事件监控指标（Prometheus 文本格式）
+        """
+        metrics = PrometheusText(prefix="p115strmhelper_")
+        snapshot = r302_metrics.snapshot()
+
+        name = metrics.metric(
+            "redirect_requests_total",
+            "counter",
+            "302 redirect requests by kind and result, one result per request (hit/miss/error)",
+        )
+        for kind, results in snapshot["results"].items():
+            for result, count in results.items():
+                metrics.sample(name, count, {"kind": kind, "result": result})
+
+        name = metrics.metric(
+            "redirect_errors_total", "counter", "302 redirect errors by errno"
+        )
+        for kind, errors in snapshot["errors"].items():
+            for code, count in errors.items():
+                metrics.sample(name, count, {"kind": kind, "errno": code})
+
+        metrics.summary(
+            "redirect_duration_seconds",
+            "Time to resolve a 302 redirect, including cache lookup",
+            snapshot["latency"],
+            "kind",
+        )
+
+        upstream = r302_http_client.recorder.snapshot()
+        metrics.summary(
+            "upstream_duration_seconds",
+            "115 upstream request latency by endpoint",
+            upstream,
+            "endpoint",
+        )
+        name = metrics.metric(
+            "upstream_errors_total", "counter", "115 upstream failed requests"
+        )
+        for endpoint, stats in upstream.items():
+            metrics.sample(name, stats["errors"], {"endpoint": endpoint})
+
+        name = metrics.metric(
+            "redirect_coalesced_total",
+            "counter",
+            "Requests served by an in-flight upstream call for the same file",
+        )
+        metrics.sample(name, r302_singleflight.stats()["shared"], {"mode": "sync"})
+        metrics.sample(
+            name, r302_async_singleflight.stats()["shared"], {"mode": "async"}
+        )
+
+        limiter = r302_async_limiter.stats()
+        metrics.summary(
+            "redirect_async_queue_seconds",
+            "Time async redirects wait for an upstream slot",
+            {"queue": limiter["queue_time"]} if limiter["queue_time"] else {},
+            "stage",
+        )
+
+        name = metrics.metric(
+            "redirect_cache_entries", "gauge", "Entries in the 302 URL cache"
+        )
+        metrics.sample(name, len(r302cacher))
+
+        if servicer.monitorlife:
+            metrics.summary(
+                "life_event_to_strm_seconds",
+                "Time from a 115 life event to its STRM file being written",
+                servicer.monitorlife.latency.snapshot(),
+                "stage",
+            )
+            poll = servicer.monitorlife.poller.stats()
+            name = metrics.metric(
+                "life_poll_interval_seconds",
+                "gauge",
+                "Current life-event polling interval",
+            )
+            metrics.sample(name, poll["interval"])
+            name = metrics.metric(
+                "life_polls_total", "counter", "Life-event polls by result"
+            )
+            metrics.sample(name, poll["active_polls"], {"result": "events"})
+            metrics.sample(
+                name, poll["polls"] - poll["active_polls"], {"result": "idle"}
+            )
+            metrics.sample(name, poll["risk_controls"], {"result": "risk_control"})
+
+        return Response(
+            content=metrics.render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     def add_transfer_share(self, share_url: str = "") -> Dict:
         """
         添加分享转存整理
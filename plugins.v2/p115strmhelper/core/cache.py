@@ -1,9 +1,14 @@
-from typing import List, Dict, MutableMapping, Optional
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import List, Dict, MutableMapping, Optional, Tuple
 from time import time
 
 from cachetools import TTLCache as MemoryTTLCache
 
-from app.core.cache import Cache, LRUCache
+from app.core.cache import LRUCache
+from app.log import logger
 
 
 class IdPathCache:
@@ -80,9 +85,292 @@ class LifeEventCache:
         )
 
 
+class R302CacheStore:
+    """
+    302 跳转缓存持久化存储
+
+    独立的 SQLite 文件，保存下载链接与分享文件解析索引；
+    写入先进入内存待写队列，由后台线程批量落盘，不阻塞 302 跳转请求
+    """
+
+    # 待写队列落盘间隔（秒）
+    flush_interval = 5
+    # 过期条目清理间隔（秒）
+    prune_interval = 600
+
+    def __init__(self, db_path: Path):
+        """
+        :param db_path: 数据库文件路径
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(
+            str(db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS r302_cache (
+                pick_code TEXT NOT NULL,
+                ua_code TEXT NOT NULL,
+                url TEXT NOT NULL,
+                expires REAL NOT NULL,
+                PRIMARY KEY (pick_code, ua_code)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS share_ids (
+                share_code TEXT NOT NULL,
+                name TEXT NOT NULL,
+                file_id INTEGER NOT NULL,
+                PRIMARY KEY (share_code, name)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS share_receive_codes (
+                share_code TEXT PRIMARY KEY,
+                receive_code TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._db_lock = Lock()
+        # (pick_code, ua_code) -> (url, 过期时间)，url 为 None 表示删除
+        self._pending: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        # (share_code, 文件名) -> 文件 ID
+        self._pending_share_ids: Dict[Tuple[str, str], int] = {}
+        # share_code -> 接收码
+        self._pending_receive_codes: Dict[str, str] = {}
+        self._pending_clear = False
+        self._pending_lock = Lock()
+        self._stop_event = Event()
+        self._thread = Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _key(value) -> str:
+        """
+        统一键类型
+        """
+        if isinstance(value, bytes):
+            return value.decode("utf-8", errors="replace")
+        return str(value)
+
+    def put(self, pick_code, ua_code, url: str, expires_time: float) -> None:
+        """
+        写入条目
+        """
+        with self._pending_lock:
+            self._pending[(self._key(pick_code), self._key(ua_code))] = (
+                url,
+                expires_time,
+            )
+
+    def delete(self, pick_code, ua_code=None) -> None:
+        """
+        删除条目，ua_code 为空时删除该 pick_code 下所有条目
+        """
+        pick_code = self._key(pick_code)
+        if ua_code is not None:
+            with self._pending_lock:
+                self._pending[(pick_code, self._key(ua_code))] = (None, 0)
+            return
+        self.flush()
+        with self._db_lock:
+            self._conn.execute(
+                "DELETE FROM r302_cache WHERE pick_code = ?", (pick_code,)
+            )
+
+    def clear(self) -> None:
+        """
+        清空所有条目
+        """
+        with self._pending_lock:
+            self._pending.clear()
+            self._pending_clear = True
+
+    def get(self, pick_code, ua_code) -> Optional[Tuple[str, float]]:
+        """
+        查询单个未过期条目
+
+        :return: (url, 过期时间) | None
+        """
+        key = (self._key(pick_code), self._key(ua_code))
+        with self._pending_lock:
+            if self._pending_clear and key not in self._pending:
+                return None
+            entry = self._pending.get(key)
+        if entry is None:
+            with self._db_lock:
+                entry = self._conn.execute(
+                    "SELECT url, expires FROM r302_cache "
+                    "WHERE pick_code = ? AND ua_code = ?",
+                    key,
+                ).fetchone()
+        if entry is None or entry[0] is None or entry[1] <= time():
+            return None
+        return entry[0], entry[1]
+
+    def put_share_id(self, share_code: str, name: str, file_id: int) -> None:
+        """
+        写入分享文件 ID
+        """
+        with self._pending_lock:
+            self._pending_share_ids[(share_code, name)] = file_id
+
+    def get_share_id(self, share_code: str, name: str) -> Optional[int]:
+        """
+        查询分享文件 ID
+        """
+        with self._pending_lock:
+            file_id = self._pending_share_ids.get((share_code, name))
+        if file_id is not None:
+            return file_id
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT file_id FROM share_ids WHERE share_code = ? AND name = ?",
+                (share_code, name),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_receive_code(self, share_code: str, receive_code: str) -> None:
+        """
+        写入分享接收码
+        """
+        with self._pending_lock:
+            self._pending_receive_codes[share_code] = receive_code
+
+    def get_receive_code(self, share_code: str) -> Optional[str]:
+        """
+        查询分享接收码
+        """
+        with self._pending_lock:
+            receive_code = self._pending_receive_codes.get(share_code)
+        if receive_code is not None:
+            return receive_code
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT receive_code FROM share_receive_codes WHERE share_code = ?",
+                (share_code,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def clear_share(self) -> None:
+        """
+        清空分享文件解析索引
+        """
+        self.flush()
+        with self._db_lock:
+            self._conn.execute("DELETE FROM share_ids")
+            self._conn.execute("DELETE FROM share_receive_codes")
+
+    def load(self) -> List[Tuple[str, str, str, float]]:
+        """
+        读取所有未过期条目，并清理已过期条目
+
+        :return: [(pick_code, ua_code, url, 过期时间)]
+        """
+        self.prune()
+        with self._db_lock:
+            return self._conn.execute(
+                "SELECT pick_code, ua_code, url, expires FROM r302_cache "
+                "ORDER BY expires"
+            ).fetchall()
+
+    def flush(self) -> None:
+        """
+        待写队列落盘
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            pending_clear, self._pending_clear = self._pending_clear, False
+            share_ids, self._pending_share_ids = self._pending_share_ids, {}
+            receive_codes, self._pending_receive_codes = (
+                self._pending_receive_codes,
+                {},
+            )
+        if not pending and not pending_clear and not share_ids and not receive_codes:
+            return
+        upserts = [
+            (k[0], k[1], url, expires)
+            for k, (url, expires) in pending.items()
+            if url is not None
+        ]
+        deletes = [k for k, (url, _) in pending.items() if url is None]
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                if pending_clear:
+                    self._conn.execute("DELETE FROM r302_cache")
+                if deletes:
+                    self._conn.executemany(
+                        "DELETE FROM r302_cache WHERE pick_code = ? AND ua_code = ?",
+                        deletes,
+                    )
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO r302_cache VALUES (?, ?, ?, ?)",
+                        upserts,
+                    )
+                if share_ids:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO share_ids VALUES (?, ?, ?)",
+                        [(k[0], k[1], file_id) for k, file_id in share_ids.items()],
+                    )
+                if receive_codes:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO share_receive_codes VALUES (?, ?)",
+                        receive_codes.items(),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def prune(self) -> None:
+        """
+        清理已过期条目
+        """
+        with self._db_lock:
+            self._conn.execute("DELETE FROM r302_cache WHERE expires <= ?", (time(),))
+
+    def _flush_loop(self) -> None:
+        """
+        定时落盘与清理
+        """
+        last_prune = time()
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+                if time() - last_prune >= self.prune_interval:
+                    self.prune()
+                    last_prune = time()
+            except Exception as e:
+                logger.error(f"【302跳转服务】缓存持久化写入失败: {e}")
+
+    def close(self) -> None:
+        """
+        落盘并关闭
+        """
+        self._stop_event.set()
+        self._thread.join(timeout=self.flush_interval)
+        try:
+            self.flush()
+        finally:
+            with self._db_lock:
+                self._conn.close()
+
+
 class R302Cache:
     """
     302 跳转缓存
+
+    两级映射 pick_code -> {ua_code -> (url, 过期时间)}，每个条目独立过期，
+    外层按 pick_code 维护 LRU 顺序，查询、计数与失效均为常数时间；
+    可挂载 R302CacheStore 持久化，挂载后在后台预加载，预加载完成前未命中时回查存储
     """
 
     def __init__(self, maxsize=8096):
@@ -92,8 +380,88 @@ class R302Cache:
         参数:
         maxsize (int): 缓存可以容纳的最大条目数
         """
-        self._cache = Cache(maxsize=maxsize)
-        self.region = "p115strmhelper_r302_cache"
+        self.maxsize = maxsize
+        self._cache: OrderedDict[str, Dict[str, Tuple[str, float]]] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self._store: Optional[R302CacheStore] = None
+        self._preloaded = Event()
+
+    def attach_store(self, store: R302CacheStore) -> None:
+        """
+        挂载持久化存储，并在后台线程预加载未过期条目
+
+        :param store: 持久化存储
+        """
+        self.detach_store()
+        self._preloaded.clear()
+        self._store = store
+        Thread(target=self._preload, args=(store,), daemon=True).start()
+
+    def detach_store(self) -> None:
+        """
+        卸载持久化存储，落盘后关闭
+        """
+        store, self._store = self._store, None
+        if store is not None:
+            store.close()
+
+    def _preload(self, store: R302CacheStore) -> None:
+        """
+        从持久化存储预加载，不覆盖内存中已有的条目
+        """
+        try:
+            rows = store.load()
+            with self._lock:
+                for pick_code, ua_code, url, expires in rows:
+                    self._insert(pick_code, ua_code, url, expires, overwrite=False)
+            logger.info(f"【302跳转服务】从持久化缓存加载 {len(rows)} 条下载链接")
+        except Exception as e:
+            logger.error(f"【302跳转服务】持久化缓存加载失败: {e}")
+        finally:
+            if self._store is store:
+                self._preloaded.set()
+
+    def _insert(self, pick_code, ua_code, url, expires_time, overwrite=True) -> None:
+        """
+        写入内存，调用方需持有锁
+        """
+        entries = self._cache.get(pick_code)
+        if entries is None:
+            entries = self._cache[pick_code] = {}
+        elif ua_code in entries and not overwrite:
+            return
+        else:
+            self._cache.move_to_end(pick_code)
+        if ua_code not in entries:
+            self._size += 1
+        entries[ua_code] = (url, expires_time)
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        超出容量时按最久未使用的 pick_code 整组淘汰
+        """
+        while self._size > self.maxsize and self._cache:
+            _, entries = self._cache.popitem(last=False)
+            self._size -= len(entries)
+
+    def _purge_expired(self, pick_code, now: float) -> Optional[Dict]:
+        """
+        清理指定 pick_code 下已过期的条目
+
+        return: 清理后的条目字典，不存在时返回 None
+        """
+        entries = self._cache.get(pick_code)
+        if entries is None:
+            return None
+        for ua_code in [k for k, (_, expires) in entries.items() if expires <= now]:
+            del entries[ua_code]
+            self._size -= 1
+        if not entries:
+            del self._cache[pick_code]
+            return None
+        return entries
 
     def set(self, pick_code, ua_code, url, expires_time):
         """
@@ -105,12 +473,12 @@ class R302Cache:
         url (str): 需要缓存的URL
         expires_time (int): 过期时间
         """
-        self._cache.set(
-            key=f"{pick_code}○{ua_code}",
-            value=url,
-            ttl=int(expires_time - time()),
-            region=self.region,
-        )
+        if expires_time <= time():
+            return
+        with self._lock:
+            self._insert(pick_code, ua_code, url, expires_time)
+        if (store := self._store) is not None:
+            store.put(pick_code, ua_code, url, expires_time)
 
     def get(self, pick_code, ua_code) -> Optional[str]:
         """
@@ -124,7 +492,59 @@ class R302Cache:
         str: 如果URL存在且未过期，则返回该URL
         None: 如果URL不存在或已过期
         """
-        return self._cache.get(key=f"{pick_code}○{ua_code}", region=self.region)
+        with self._lock:
+            entries = self._cache.get(pick_code)
+            entry = entries.get(ua_code) if entries is not None else None
+            if entry is not None:
+                url, expires = entry
+                if expires > time():
+                    self._cache.move_to_end(pick_code)
+                    return url
+                del entries[ua_code]
+                self._size -= 1
+                if not entries:
+                    del self._cache[pick_code]
+                return None
+        return self._get_from_store(pick_code, ua_code)
+
+    def _get_from_store(self, pick_code, ua_code) -> Optional[str]:
+        """
+        预加载完成前回查持久化存储
+        """
+        store = self._store
+        if store is None or self._preloaded.is_set():
+            return None
+        try:
+            entry = store.get(pick_code, ua_code)
+        except Exception as e:
+            logger.debug(f"【302跳转服务】持久化缓存查询失败: {e}")
+            return None
+        if entry is None:
+            return None
+        with self._lock:
+            self._insert(pick_code, ua_code, entry[0], entry[1], overwrite=False)
+        return entry[0]
+
+    def get_expires(self, pick_code, ua_code) -> Optional[float]:
+        """
+        获取条目的过期时间，不更新 LRU 顺序
+
+        参数:
+        pick_code (str): 第一层键
+        ua_code (str): 第二层键
+
+        return: float | None
+        float: 条目的过期时间
+        None: 如果条目不存在或已过期
+        """
+        with self._lock:
+            entries = self._cache.get(pick_code)
+            if entries is None:
+                return None
+            entry = entries.get(ua_code)
+            if entry is None or entry[1] <= time():
+                return None
+            return entry[1]
 
     def count_by_pick_code(self, pick_code) -> int:
         """
@@ -136,21 +556,193 @@ class R302Cache:
         return: int
         int: 匹配的缓存条目数量
         """
-        count = 0
-        for key_str, _ in self._cache.items(region=self.region):
-            key = key_str.split("○")
-            if key[0] == pick_code:
-                count += 1
-        return count
+        with self._lock:
+            entries = self._purge_expired(pick_code, time())
+            return len(entries) if entries else 0
+
+    def invalidate(self, pick_code, ua_code=None) -> None:
+        """
+        使缓存失效
+
+        参数:
+        pick_code (str): 第一层键
+        ua_code (str): 第二层键，为空时使该 pick_code 下所有条目失效
+        """
+        if (store := self._store) is not None:
+            store.delete(pick_code, ua_code)
+        with self._lock:
+            entries = self._cache.get(pick_code)
+            if entries is None:
+                return
+            if ua_code is None:
+                del self._cache[pick_code]
+                self._size -= len(entries)
+                return
+            if entries.pop(ua_code, None) is not None:
+                self._size -= 1
+                if not entries:
+                    del self._cache[pick_code]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self):
+        """
+        清空所有缓存
+        """
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+        if (store := self._store) is not None:
+            store.clear()
+
+
+class ShareResolveCache:
+    """
+    分享文件解析索引
+
+    share_code + 文件名 -> 文件 ID，share_code -> 接收码；
+    由分享 STRM 生成时的分享列表与 302 跳转的搜索结果填充，
+    使按文件名生成的分享 STRM 播放时无需再次搜索；
+    可挂载 R302CacheStore 持久化，内存未命中时回查存储，重启后仍可命中
+    """
+
+    def __init__(self, maxsize=100_000):
+        """
+        :param maxsize: 文件 ID 索引最大条目数
+        """
+        self.maxsize = maxsize
+        self._ids: OrderedDict[Tuple[str, str], int] = OrderedDict()
+        self._receive_codes: Dict[str, str] = {}
+        self._lock = Lock()
+        self._store: Optional[R302CacheStore] = None
+        self.hits = 0
+        self.misses = 0
+
+    def attach_store(self, store: R302CacheStore) -> None:
+        """
+        挂载持久化存储，存储的关闭由 R302Cache 负责
+
+        :param store: 持久化存储
+        """
+        self._store = store
+
+    def detach_store(self) -> None:
+        """
+        卸载持久化存储
+        """
+        self._store = None
+
+    def _insert_id(self, key: Tuple[str, str], file_id: int) -> None:
+        """
+        写入内存，调用方需持有锁
+        """
+        self._ids[key] = file_id
+        self._ids.move_to_end(key)
+        while len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+
+    def add_id(self, share_code: str, name: str, file_id: int) -> None:
+        """
+        添加文件 ID
+        """
+        with self._lock:
+            self._insert_id((share_code, name), int(file_id))
+        if (store := self._store) is not None:
+            store.put_share_id(share_code, name, int(file_id))
+
+    def get_id(self, share_code: str, name: str) -> Optional[int]:
+        """
+        通过文件名获取文件 ID
+
+        return: int | None
+        """
+        key = (share_code, name)
+        with self._lock:
+            file_id = self._ids.get(key)
+            if file_id is not None:
+                self._ids.move_to_end(key)
+                self.hits += 1
+                return file_id
+        file_id = self._get_from_store(lambda store: store.get_share_id(*key))
+        with self._lock:
+            if file_id is None:
+                self.misses += 1
+                return None
+            self._insert_id(key, file_id)
+            self.hits += 1
+            return file_id
+
+    def add_receive_code(self, share_code: str, receive_code: str) -> None:
+        """
+        添加接收码
+        """
+        with self._lock:
+            self._receive_codes[share_code] = receive_code
+        if (store := self._store) is not None:
+            store.put_receive_code(share_code, receive_code)
+
+    def get_receive_code(self, share_code: str) -> Optional[str]:
+        """
+        获取接收码
+
+        return: str | None
+        """
+        with self._lock:
+            receive_code = self._receive_codes.get(share_code)
+            if receive_code is not None:
+                self.hits += 1
+                return receive_code
+        receive_code = self._get_from_store(
+            lambda store: store.get_receive_code(share_code)
+        )
+        with self._lock:
+            if receive_code is None:
+                self.misses += 1
+                return None
+            self._receive_codes.setdefault(share_code, receive_code)
+            self.hits += 1
+            return receive_code
+
+    def _get_from_store(self, query):
+        """
+        内存未命中时回查持久化存储
+        """
+        store = self._store
+        if store is None:
+            return None
+        try:
+            return query(store)
+        except Exception as e:
+            logger.debug(f"【302跳转服务】分享解析索引查询失败: {e}")
+            return None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        输出统计
+
+        :return: {size, hits, misses}
+        """
+        with self._lock:
+            return {
+                "size": len(self._ids) + len(self._receive_codes),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
 
     def clear(self):
         """
         清空所有缓存
         """
-        self._cache.clear(region=self.region)
+        with self._lock:
+            self._ids.clear()
+            self._receive_codes.clear()
+        if (store := self._store) is not None:
+            store.clear_share()
 
 
 idpathcacher = IdPathCache(maxsize=4096)
 pantransfercacher = PanTransferCache()
 lifeeventcacher = LifeEventCache()
 r302cacher = R302Cache(maxsize=8096)
+shareresolvecacher = ShareResolveCache(maxsize=100_000)
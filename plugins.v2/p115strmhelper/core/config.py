@@ -1,5 +1,5 @@
 from platform import system, release
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Literal, Union
 from pathlib import Path
 
 from orjson import loads, JSONDecodeError
@@ -37,6 +37,15 @@ class ConfigManager(BaseModel):
             ConfigManager._get_default_plugin_config_path() / "p115strmhelper_file.db"
         )
 
+    @staticmethod
+    def _get_default_plugin_r302_cache_db_path() -> Path:
+        """
+        返回默认的 302 跳转缓存数据库文件路径
+        """
+        return (
+            ConfigManager._get_default_plugin_config_path() / "p115strmhelper_r302.db"
+        )
+
     @staticmethod
     def _get_default_plugin_database_script_location() -> Path:
         """
@@ -61,10 +70,16 @@ class ConfigManager(BaseModel):
     PLUSIN_NAME: str = Field("P115StrmHelper", min_length=1)
     # 是否开启数据库WAL模式
     DB_WAL_ENABLE: bool = True
+    # 数据库 files.extra 原始数据存储方式 lean（不存储）/compressed（压缩存储）/full（JSON 存储）
+    DB_EXTRA_MODE: Literal["lean", "compressed", "full"] = "full"
     # 插件配置目录
     PLUGIN_CONFIG_PATH: Path = Field(default_factory=_get_default_plugin_config_path)
     # 插件数据库目录
     PLUGIN_DB_PATH: Path = Field(default_factory=_get_default_plugin_db_path)
+    # 插件 302 跳转缓存数据库
+    PLUGIN_R302_CACHE_DB_PATH: Path = Field(
+        default_factory=_get_default_plugin_r302_cache_db_path
+    )
     # 插件数据库表目录
     PLUGIN_DATABASE_SCRIPT_LOCATION: Path = Field(
         default_factory=_get_default_plugin_database_script_location
@@ -86,6 +101,20 @@ class ConfigManager(BaseModel):
     strm_url_format: str = Field("pickcode", min_length=1)
     # 302 跳转方式
     link_redirect_mode: str = Field("cookie", min_length=1)
+    # 302 跳转请求使用 HTTP/2
+    link_redirect_http2_enabled: bool = False
+    # 302 跳转使用异步接口
+    link_redirect_async_enabled: bool = False
+    # 异步 302 跳转请求上游的最大并发数
+    link_redirect_async_concurrency: int = 64
+    # 302 跳转缓存持久化，重启后保留未过期的下载链接
+    link_redirect_cache_persist_enabled: bool = True
+    # 302 跳转后台刷新最近播放文件即将过期的下载链接
+    link_redirect_refresh_enabled: bool = False
+    # 302 跳转播放剧集时预取同目录下一集的下载链接
+    link_redirect_prefetch_next_enabled: bool = False
+    # 302 跳转后台刷新与预取每分钟最多请求次数
+    link_redirect_prefetch_rate: int = 20
     # 115 Cookie
     cookies: Optional[str] = None
     # 阿里云盘 Token
@@ -117,7 +146,7 @@ class ConfigManager(BaseModel):
     # 刷新媒体服务器开关
     transfer_monitor_media_server_refresh_enabled: bool = False
 
-    # 全量同步覆盖模式
+    # 全量同步覆盖模式 always/never/changed
     full_sync_overwrite_mode: str = "never"
     # 清理无效 STRM 文件
     full_sync_remove_unless_strm: bool = False
@@ -139,6 +168,8 @@ class ConfigManager(BaseModel):
     full_sync_process_num: Union[int, str] = 128
     # 全量同步使用的函数
     full_sync_iter_function: str = Field("iter_files_with_path_skim", min_length=1)
+    # 全量同步清理无效 STRM 目录树对比模式 memory/hash/external
+    full_sync_tree_compare_mode: str = Field("hash", min_length=1)
 
     # 增量同步开关
     increment_sync_strm_enabled: bool = False
@@ -160,6 +191,10 @@ class ConfigManager(BaseModel):
     increment_sync_mediaservers: Optional[List[str]] = None
     # 增量生成最小文件大小
     increment_sync_min_file_size: Optional[int] = None
+    # 增量同步目录树对比模式 memory/hash/external
+    increment_sync_tree_compare_mode: str = Field("hash", min_length=1)
+    # 增量同步使用本地目录清单，跳过未变化目录的扫描
+    increment_sync_local_manifest_enabled: bool = True
 
     # 监控生活事件开关
     monitor_life_enabled: bool = False
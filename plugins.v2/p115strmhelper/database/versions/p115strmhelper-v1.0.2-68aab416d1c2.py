@@ -0,0 +1,29 @@
+"""1.0.2
+
+Revision ID: 68aab416d1c2
+Revises: 2606909750bf
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+version = '1.0.2'
+revision = "68aab416d1c2"
+down_revision = "2606909750bf"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_files_parent_id ON files (parent_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_folders_parent_id ON folders (parent_id)")
+    op.execute("ANALYZE files")
+    op.execute("ANALYZE folders")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_files_parent_id")
+    op.execute("DROP INDEX IF EXISTS ix_folders_parent_id")
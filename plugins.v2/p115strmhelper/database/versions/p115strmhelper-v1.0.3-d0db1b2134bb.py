@@ -0,0 +1,29 @@
+"""1.0.3
+
+Revision ID: d0db1b2134bb
+Revises: 68aab416d1c2
+Create Date: 2026-10-18 14:36:05.817263
+
+"""
+
+
+# revision identifiers, used by Alembic.
+version = '1.0.3'
+revision = "d0db1b2134bb"
+down_revision = "68aab416d1c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    无结构变更
+
+    清理 extra 原始数据与 VACUUM 耗时长且需要独占数据库，不在启动迁移中执行，
+    改为由用户手动触发数据库压缩
+    """
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Generator, List, Optional, Self, Tuple
 
@@ -35,6 +36,12 @@ class __DBManager:
     SessionFactory: Optional[sessionmaker] = None
     # 多线程全局使用的数据库会话
     ScopedSession: Optional[scoped_session] = None
+    # 批量导入时在连接上临时调整的 PRAGMA（均为连接级别，不影响其它连接）
+    BulkLoadPragmas = {
+        "synchronous": "OFF",
+        "cache_size": "-100000",
+        "temp_store": "MEMORY",
+    }
 
     @staticmethod
     def _setup_sqlite_pragmas(dbapi_connection, _connection_record):
@@ -110,6 +117,26 @@ class __DBManager:
             mode = conn.execute(text("PRAGMA journal_mode;")).scalar()
             logger.debug(f"当前日志模式设置为: {mode.upper()}")
 
+    @contextmanager
+    def batch_session(self) -> Generator[Session, None, None]:
+        """
+        批量写入会话
+
+        会话内的 db_update 操作不单独提交，退出时统一提交，出错时整体回滚
+        """
+        if not self.is_initialized():
+            raise RuntimeError("数据库未初始化")
+        db = self.SessionFactory()
+        db.info["batch"] = True
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
     def perform_checkpoint(self, mode: str = "PASSIVE"):
         """
         执行 SQLite 的 checkpoint 操作
@@ -137,6 +164,61 @@ class __DBManager:
         except Exception as e:
             logger.error(f"执行 WAL checkpoint 操作期间发生错误: {e}", exc_info=True)
 
+    @contextmanager
+    def bulk_load_session(self) -> Generator[Session, None, None]:
+        """
+        批量导入会话，用于全量重建数据库
+
+        独占一个连接，仅在开始时调整一次连接级 PRAGMA，结束后恢复原值并执行 checkpoint；
+        不修改 journal_mode 与 locking_mode，WAL 模式下其它连接（如 302 跳转查询）可以继续读取
+        """
+        if not self.Engine:
+            raise RuntimeError("数据库未初始化")
+        with self.Engine.connect() as conn:
+            saved = {
+                name: conn.exec_driver_sql(f"PRAGMA {name};").scalar()
+                for name in self.BulkLoadPragmas
+            }
+            for name, value in self.BulkLoadPragmas.items():
+                conn.exec_driver_sql(f"PRAGMA {name} = {value};")
+            conn.commit()
+            db = Session(bind=conn)
+            try:
+                yield db
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+                for name, value in saved.items():
+                    conn.exec_driver_sql(f"PRAGMA {name} = {value};")
+                conn.commit()
+        if configer.get_config("DB_WAL_ENABLE"):
+            self.perform_checkpoint(mode="PASSIVE")
+
+    def compact_database(self, clear_extra: bool = False):
+        """
+        压缩数据库，回收已删除数据占用的空间
+
+        VACUUM 期间独占数据库，且需要最多约等于数据库大小的额外磁盘空间，仅由用户手动触发
+        :param clear_extra: 是否先清空 files.extra 原始数据
+        """
+        if not self.Engine:
+            raise RuntimeError("数据库未初始化")
+        with self.Engine.connect() as conn:
+            if clear_extra:
+                result = conn.execute(
+                    text("UPDATE files SET extra = NULL WHERE extra IS NOT NULL")
+                )
+                conn.commit()
+                logger.info(f"已清空 {result.rowcount} 条 extra 原始数据")
+            conn.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql(
+                "VACUUM;"
+            )
+        if configer.get_config("DB_WAL_ENABLE"):
+            self.perform_checkpoint(mode="TRUNCATE")
+
     def close_database(self):
         """
         关闭所有数据库连接并清理资源
@@ -232,11 +314,13 @@ def db_update(func):
         try:
             # 执行函数
             result = func(*args, **kwargs)
-            # 提交事务
-            db.commit()
+            # 提交事务，批量写入会话由外层统一提交
+            if not db.info.get("batch"):
+                db.commit()
         except Exception as err:
-            # 回滚事务
-            db.rollback()
+            # 回滚事务，批量写入会话由外层统一回滚
+            if not db.info.get("batch"):
+                db.rollback()
             raise err
         finally:
             # 关闭数据库会话
@@ -8,10 +8,11 @@ from sqlalchemy import (
     BigInteger,
     select,
     delete,
-    text,
+    and_,
+    or_,
 )
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, deferred
 
 from ...db_manager import db_update, db_query, P115StrmHelperBase
 
@@ -24,7 +25,7 @@ class File(P115StrmHelperBase):
     __tablename__ = "files"
 
     id = Column(Integer, primary_key=True)
-    parent_id = Column(Integer, nullable=False)
+    parent_id = Column(Integer, nullable=False, index=True)
     name = Column(String(255), default="")
     sha1 = Column(String(40), default="")
     size = Column(BigInteger, default=0)
@@ -32,7 +33,8 @@ class File(P115StrmHelperBase):
     ctime = Column(BigInteger, default=0)
     mtime = Column(BigInteger, default=0)
     path = Column(Text, unique=True)
-    extra = Column(Text)
+    # 原始数据，按需加载
+    extra = deferred(Column(Text))
 
     @staticmethod
     @db_query
@@ -85,13 +87,9 @@ class File(P115StrmHelperBase):
     def upsert_batch_by_list(db: Session, batch: List[Dict]):
         """
         通过列表批量写入或更新数据
-        """
-        db.execute(text("PRAGMA synchronous = OFF"))
-        db.execute(text("PRAGMA journal_mode = OFF"))
-        db.execute(text("PRAGMA cache_size = -100000"))
-        db.execute(text("PRAGMA locking_mode = EXCLUSIVE"))
-        db.execute(text("PRAGMA temp_store = MEMORY"))
 
+        不在此处调整 PRAGMA，批量导入请使用 ct_db_manager.bulk_load_session
+        """
         stmt = sqlite_insert(File).prefix_with("OR REPLACE")
         db.execute(stmt, batch)
         return True
@@ -100,9 +98,19 @@ class File(P115StrmHelperBase):
     @db_update
     def remove_by_path_batch(db: Session, path: str):
         """
-        通过路径批量删除
+        通过路径批量删除（路径本身及其下所有路径）
+
+        使用范围条件代替 LIKE 前缀匹配，以便命中 path 唯一索引
         """
-        db.execute(delete(File).where(File.path.startswith(path)))
+        prefix = path.rstrip("/")
+        db.execute(
+            delete(File).where(
+                or_(
+                    File.path == prefix,
+                    and_(File.path >= prefix + "/", File.path < prefix + "0"),
+                )
+            )
+        )
         return True
 
     @staticmethod
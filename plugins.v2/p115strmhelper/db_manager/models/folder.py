@@ -7,7 +7,8 @@ from sqlalchemy import (
     Text,
     select,
     delete,
-    text,
+    and_,
+    or_,
 )
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
@@ -23,7 +24,7 @@ class Folder(P115StrmHelperBase):
     __tablename__ = "folders"
 
     id = Column(Integer, primary_key=True)
-    parent_id = Column(Integer, nullable=False)
+    parent_id = Column(Integer, nullable=False, index=True)
     name = Column(String(255), nullable=False)
     path = Column(Text, nullable=False, unique=True)
 
@@ -57,6 +58,16 @@ class Folder(P115StrmHelperBase):
             .all()
         )
 
+    @staticmethod
+    @db_query
+    def get_paths_by_ids(db: Session, file_ids: List[int]):
+        """
+        通过ID列表批量获取路径
+        """
+        return db.execute(
+            select(Folder.id, Folder.path).where(Folder.id.in_(file_ids))
+        ).all()
+
     @staticmethod
     @db_update
     def delete_by_path(db: Session, file_path: str):
@@ -80,13 +91,9 @@ class Folder(P115StrmHelperBase):
     def upsert_batch_by_list(db: Session, batch: List[Dict]):
         """
         通过列表批量写入或更新数据
-        """
-        db.execute(text("PRAGMA synchronous = OFF"))
-        db.execute(text("PRAGMA journal_mode = OFF"))
-        db.execute(text("PRAGMA cache_size = -100000"))
-        db.execute(text("PRAGMA locking_mode = EXCLUSIVE"))
-        db.execute(text("PRAGMA temp_store = MEMORY"))
 
+        不在此处调整 PRAGMA，批量导入请使用 ct_db_manager.bulk_load_session
+        """
         stmt = sqlite_insert(Folder).prefix_with("OR REPLACE")
         db.execute(stmt, batch)
         return True
@@ -95,7 +102,17 @@ class Folder(P115StrmHelperBase):
     @db_update
     def remove_by_path_batch(db: Session, path: str):
         """
-        通过路径批量删除
+        通过路径批量删除（路径本身及其下所有路径）
+
+        使用范围条件代替 LIKE 前缀匹配，以便命中 path 唯一索引
         """
-        db.execute(delete(Folder).where(Folder.path.startswith(path)))
+        prefix = path.rstrip("/")
+        db.execute(
+            delete(Folder).where(
+                or_(
+                    Folder.path == prefix,
+                    and_(Folder.path >= prefix + "/", Folder.path < prefix + "0"),
+                )
+            )
+        )
         return True
@@ -1,9 +1,15 @@
-from typing import Dict, Optional, List
+import re
+from base64 import b64encode
+from typing import Any, Collection, Dict, Optional, List, Tuple
 from pathlib import Path
+from zlib import compress
 
-from . import DbOper
+from orjson import dumps
+
+from . import DbOper, ct_db_manager
 from .models.folder import Folder
 from .models.file import File
+from ..core.config import configer
 from ..utils.exception import PathNotInKey
 
 from app.schemas import FileItem
@@ -14,6 +20,27 @@ class FileDbHelper(DbOper):
     文件类数据库操作
     """
 
+    # 压缩存储的 extra 前缀
+    EXTRA_COMPRESSED_PREFIX = "z:"
+
+    @staticmethod
+    def encode_extra(item: Any) -> Optional[str]:
+        """
+        按 DB_EXTRA_MODE 编码 files.extra 字段
+
+        :param item: 原始数据
+        :return: lean 模式返回 None，compressed 模式返回带前缀的 zlib 压缩数据，full 模式返回 JSON
+        """
+        mode = configer.get_config("DB_EXTRA_MODE")
+        if not item or mode == "lean":
+            return None
+        data = dumps(item, default=str)
+        if mode == "compressed":
+            return FileDbHelper.EXTRA_COMPRESSED_PREFIX + b64encode(
+                compress(data, 6)
+            ).decode("ascii")
+        return data.decode("utf-8")
+
     def process_item(self, item: Dict) -> List[Dict]:
         """
         处理单个项目，分离文件夹和文件数据
@@ -53,7 +80,7 @@ class FileDbHelper(DbOper):
                     "ctime": item.get("ctime", 0),
                     "mtime": item.get("mtime", 0),
                     "path": item.get("path"),
-                    "extra": str(item) if item else None,
+                    "extra": self.encode_extra(item),
                 },
             }
         )
@@ -77,7 +104,7 @@ class FileDbHelper(DbOper):
                     "ctime": event.get("create_time", 0),
                     "mtime": event.get("update_time", 0),
                     "path": str(file_path),
-                    "extra": str(event),
+                    "extra": self.encode_extra(event),
                 },
             }
         ]
@@ -131,7 +158,7 @@ class FileDbHelper(DbOper):
                         "ctime": item.get("tp", 0),
                         "mtime": item.get("tu", 0),
                         "path": item.get("path"),
-                        "extra": str(item),
+                        "extra": self.encode_extra(item),
                     },
                 }
             ]
@@ -156,7 +183,7 @@ class FileDbHelper(DbOper):
                         "ctime": 0,
                         "mtime": int(fileitem.modify_time),
                         "path": str(Path(fileitem.path)),
-                        "extra": "",
+                        "extra": None,
                     },
                 }
             ]
@@ -243,6 +270,59 @@ class FileDbHelper(DbOper):
             return {**folder.__dict__, "type": "folder", "_sa_instance_state": None}
         return None
 
+    def get_folder_paths_by_ids(self, ids: Collection[int]) -> Dict[int, str]:
+        """
+        通过文件夹 ID 批量获取路径
+
+        :param ids: 文件夹 ID 列表
+        :return: {ID: 路径}，不存在的 ID 不返回
+        """
+        ids = list(dict.fromkeys(int(i) for i in ids))
+        result: Dict[int, str] = {}
+        # 分段查询，避免超出 SQLite 参数数量上限
+        for start in range(0, len(ids), 500):
+            for folder_id, path in Folder.get_paths_by_ids(
+                self._db, ids[start : start + 500]
+            ):
+                result[int(folder_id)] = path
+        return result
+
+    def get_next_sibling_file(
+        self, id: int, suffixes: Optional[Collection[str]] = None
+    ) -> Optional[Dict]:
+        """
+        获取同一目录下按名称自然排序的下一个文件
+
+        :param id: 当前文件 ID
+        :param suffixes: 限定的文件后缀（小写，不含点），为空时不限制
+        :return: 下一个文件，不存在时返回 None
+        """
+        current = File.get_by_id(self._db, id)
+        if not current:
+            return None
+
+        def natural_key(name: str):
+            return [
+                int(part) if part.isdigit() else part.lower()
+                for part in re.split(r"(\d+)", name or "")
+            ]
+
+        siblings = [
+            f
+            for f in File.get_by_parent_id(self._db, current.parent_id)
+            if not suffixes or Path(f.name or "").suffix[1:].lower() in suffixes
+        ]
+        siblings.sort(key=lambda f: natural_key(f.name))
+        current_key = natural_key(current.name)
+        for f in siblings:
+            if f.id != current.id and natural_key(f.name) > current_key:
+                return {
+                    **f.__dict__,
+                    "type": "file",
+                    "_sa_instance_state": None,
+                }
+        return None
+
     def get_children(self, path: str) -> Dict:
         """
         获取路径下的所有子项
@@ -340,3 +420,91 @@ class FileDbHelper(DbOper):
             return False
 
         return True
+
+
+class FileDbBatchWriter(FileDbHelper):
+    """
+    文件类数据库批量写入
+
+    写入与删除操作按调用顺序缓存，flush 时在单个事务中依次执行，相邻的写入合并为一次批量写入；
+    查询操作直接访问数据库，不包含尚未 flush 的修改
+    """
+
+    # 缓存的写入条目达到该数量时自动 flush，避免超大目录占用过多内存
+    max_pending = 50_000
+
+    def __init__(self):
+        super().__init__()
+        self._ops: List[Tuple[str, tuple]] = []
+        self._pending = 0
+
+    def _queue(self, op: str, *args, rows: int = 1) -> None:
+        """
+        缓存一项操作
+
+        :param op: FileDbHelper 方法名
+        :param rows: 操作涉及的条目数
+        """
+        if op == "upsert_batch" and self._ops and self._ops[-1][0] == op:
+            self._ops[-1][1][0].extend(args[0])
+        else:
+            self._ops.append((op, args))
+        self._pending += rows
+        if self._pending >= self.max_pending:
+            self.flush()
+
+    def upsert_batch(self, batch: List[Dict]):
+        """
+        缓存批量写入或更新数据
+        """
+        if batch:
+            self._queue("upsert_batch", list(batch), rows=len(batch))
+        return True
+
+    def remove_by_path_batch(self, path: str, only_file: bool = False):
+        """
+        缓存通过路径批量删除
+        """
+        self._queue("remove_by_path_batch", path, only_file)
+        return True
+
+    def remove_by_id_batch(self, id: int, only_file: bool = False):
+        """
+        缓存通过文件夹 ID 批量删除
+        """
+        self._queue("remove_by_id_batch", id, only_file)
+        return True
+
+    def remove_by_path(self, path_type: str, path: str):
+        """
+        缓存删除指定路径的记录
+        """
+        self._queue("remove_by_path", path_type, path)
+
+    def remove_by_id(self, id_type: str, id: int):
+        """
+        缓存通过 ID 删除记录
+        """
+        self._queue("remove_by_id", id_type, id)
+
+    def has_pending(self) -> bool:
+        """
+        是否存在未 flush 的操作
+        """
+        return bool(self._ops)
+
+    def flush(self) -> int:
+        """
+        在单个事务中执行所有缓存的操作
+
+        :return: 执行的操作数
+        """
+        if not self._ops:
+            return 0
+        ops, self._ops = self._ops, []
+        self._pending = 0
+        with ct_db_manager.batch_session() as db:
+            helper = FileDbHelper(db)
+            for op, args in ops:
+                getattr(helper, op)(*args)
+        return len(ops)
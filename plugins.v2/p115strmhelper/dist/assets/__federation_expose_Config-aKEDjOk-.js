@@ -0,0 +1 @@
+import{importShared as e}from"./__federation_fn_import-B6DyUTOO.js";import{_ as l}from"./_plugin-vue_export-helper-BCo6x5W8.js";const{resolveComponent:a,createVNode:t,createElementVNode:o,withCtx:n,toDisplayString:i,createTextVNode:r,openBlock:d,createBlock:s,createCommentVNode:c,renderList:u,Fragment:m,createElementBlock:_,withKeys:p}=await e("vue"),f={class:"plugin-config"},y={key:2,class:"my-1"},v={class:"d-flex flex-column"},h={class:"d-flex flex-column"},b={class:"path-selector flex-grow-1 mr-2"},g={class:"path-selector flex-grow-1 ml-2"},V={class:"d-flex flex-column"},x={class:"path-selector flex-grow-1 mr-2"},k={class:"path-selector flex-grow-1 ml-2"},w={class:"basic-config"},U={class:"d-flex flex-column"},C={class:"path-selector flex-grow-1 mr-2"},T={class:"path-selector flex-grow-1 ml-2"},z={class:"d-flex flex-column"},M={class:"d-flex flex-column"},S={class:"path-selector flex-grow-1 mr-2"},P={class:"path-selector flex-grow-1 ml-2"},R={class:"d-flex flex-column"},$={class:"path-selector flex-grow-1 mr-2"},I={class:"path-selector flex-grow-1 ml-2"},L={class:"d-flex flex-column"},q={class:"d-flex flex-column"},E={class:"path-selector flex-grow-1 mr-2"},A={class:"path-selector flex-grow-1 ml-2"},B={class:"d-flex flex-column"},N={class:"path-selector flex-grow-1 mr-2"},j={class:"path-selector flex-grow-1 ml-2"},K={class:"d-flex flex-column"},O={class:"d-flex ga-2"},D={key:0,class:"d-flex justify-center my-3"},G={key:1},F={key:1,class:"d-flex flex-column align-center py-3"},J={key:2,class:"d-flex flex-column align-center"},W={class:"d-flex flex-column align-center mb-3"},H=["src"],Y={class:"text-body-2 text-grey mb-1"},Z={class:"text-subtitle-2 font-weight-medium text-primary"},Q={key:3,class:"d-flex flex-column align-center py-3"},X={class:"text-caption mt-2 text-grey"},ee={key:1,class:"d-flex flex-column align-center py-3"},le={key:2,class:"d-flex flex-column align-center"},ae=["src"],te={class:"text-subtitle-2 font-weight-medium text-primary"},oe={key:3,class:"d-flex flex-column align-center py-3"},{ref:ne,reactive:ie,computed:re,onMounted:de,onBeforeUnmount:se,watch:ce}=await e("vue"),ue="P115StrmHelper",me=l({__name:"Config",props:{api:{type:[Object,Function],required:!0},initialConfig:{type:Object,default:()=>({})}},emits:["save","close","switch"],setup(e,{emit:l}){const me=e,_e=l,pe=ne(!0),fe=ne(!1),ye=ne(!1);ne(!1);const ve=ne("tab-transfer"),he=ne([]),be=ne(!1),ge=ne(!1),Ve=ie({language:"zh_CN",enabled:!1,notify:!1,strm_url_format:"pickcode",link_redirect_mode:"cookie",link_redirect_http2_enabled:!1,link_redirect_async_enabled:!1,link_redirect_async_concurrency:64,link_redirect_cache_persist_enabled:!0,link_redirect_refresh_enabled:!1,link_redirect_prefetch_next_enabled:!1,link_redirect_prefetch_rate:20,cookies:"",aliyundrive_token:"",password:"",moviepilot_address:"",user_rmt_mediaext:"mp4,mkv,ts,iso,rmvb,avi,mov,mpeg,mpg,wmv,3gp,asf,m4v,flv,m2ts,tp,f4v",user_download_mediaext:"srt,ssa,ass",transfer_monitor_enabled:!1,transfer_monitor_scrape_metadata_enabled:!1,transfer_monitor_scrape_metadata_exclude_paths:"",transfer_monitor_paths:"",transfer_mp_mediaserver_paths:"",transfer_monitor_media_server_refresh_enabled:!1,transfer_monitor_mediaservers:[],timing_full_sync_strm:!1,full_sync_overwrite_mode:"never",full_sync_remove_unless_strm:!1,full_sync_auto_download_mediainfo_enabled:!1,full_sync_strm_log:!0,full_sync_batch_num:5e3,full_sync_process_num:128,cron_full_sync_strm:"0 */7 * * *",full_sync_strm_paths:"",full_sync_iter_function:"iter_files_with_path_skim",full_sync_tree_compare_mode:"hash",full_sync_min_file_size:0,increment_sync_strm_enabled:!1,increment_sync_auto_download_mediainfo_enabled:!1,increment_sync_cron:"0 * * * *",increment_sync_strm_paths:"",increment_sync_mp_mediaserver_paths:"",increment_sync_scrape_metadata_enabled:!1,increment_sync_scrape_metadata_exclude_paths:"",increment_sync_media_server_refresh_enabled:!1,increment_sync_mediaservers:[],increment_sync_min_file_size:0,increment_sync_tree_compare_mode:"hash",increment_sync_local_manifest_enabled:!0,monitor_life_enabled:!1,monitor_life_auto_download_mediainfo_enabled:!1,monitor_life_paths:"",monitor_life_mp_mediaserver_paths:"",monitor_life_media_server_refresh_enabled:!1,monitor_life_mediaservers:[],monitor_life_event_modes:[],monitor_life_scrape_metadata_enabled:!1,monitor_life_scrape_metadata_exclude_paths:"",monitor_life_remove_mp_history:!1,monitor_life_remove_mp_source:!1,monitor_life_min_file_size:0,share_strm_auto_download_mediainfo_enabled:!1,user_share_code:"",user_receive_code:"",user_share_link:"",user_share_pan_path:"/",user_share_local_path:"",clear_recyclebin_enabled:!1,clear_receive_path_enabled:!1,cron_clear:"0 */7 * * *",pan_transfer_enabled:!1,pan_transfer_paths:"",pan_transfer_unrecognized_path:"",directory_upload_enabled:!1,directory_upload_mode:"compatibility",directory_upload_uploadext:"mp4,mkv,ts,iso,rmvb,avi,mov,mpeg,mpg,wmv,3gp,asf,m4v,flv,m2ts,tp,f4v",directory_upload_copyext:"srt,ssa,ass",directory_upload_path:[],nullbr_app_id:"",nullbr_api_key:"",tg_search_channels:[],same_playback:!1,error_info_upload:!1,upload_module_enhancement:!1,upload_module_wait_time:300,upload_module_wait_timeout:3600,upload_module_skip_upload_wait_size:0,upload_module_force_upload_wait_size:0,upload_share_info:!0,upload_offline_info:!0,transfer_module_enhancement:!1,strm_url_mode_custom:"",strm_generate_blacklist:[]}),xe=ie({text:"",type:"info"}),ke=re({get:()=>!Ve.upload_module_skip_upload_wait_size||Ve.upload_module_skip_upload_wait_size<=0?"":Me(Ve.upload_module_skip_upload_wait_size),set(e){Ve.upload_module_skip_upload_wait_size=ze(e)}}),we=re({get:()=>!Ve.upload_module_force_upload_wait_size||Ve.upload_module_force_upload_wait_size<=0?"":Me(Ve.upload_module_force_upload_wait_size),set(e){Ve.upload_module_force_upload_wait_size=ze(e)}}),Ue=re({get:()=>!Ve.full_sync_min_file_size||Ve.full_sync_min_file_size<=0?"":Me(Ve.full_sync_min_file_size),set(e){Ve.full_sync_min_file_size=ze(e)}}),Ce=re({get:()=>!Ve.increment_sync_min_file_size||Ve.increment_sync_min_file_size<=0?"":Me(Ve.increment_sync_min_file_size),set(e){Ve.increment_sync_min_file_size=ze(e)}}),Te=re({get:()=>!Ve.monitor_life_min_file_size||Ve.monitor_life_min_file_size<=0?"":Me(Ve.monitor_life_min_file_size),set(e){Ve.monitor_life_min_file_size=ze(e)}}),ze=e=>{if(!e||"string"!=typeof e)return 0;const l=e.trim().match(/^(\d*\.?\d+)\s*(k|m|g|t)?b?$/i);if(!l)return 0;const a=parseFloat(l[1]);switch((l[2]||"").toLowerCase()){case"t":return Math.round(1024*a*1024*1024*1024);case"g":return Math.round(1024*a*1024*1024);case"m":return Math.round(1024*a*1024);case"k":return Math.round(1024*a);default:return Math.round(a)}},Me=(e,l=2)=>{if(!+e)return"0 B";const a=l<0?0:l,t=Math.floor(Math.log(e)/Math.log(1024));return`${parseFloat((e/Math.pow(1024,t)).toFixed(a))} ${["B","K","M","G","T"][t]}`},Se=ne([{local:"",remote:""}]),Pe=ne([{local:"",remote:""}]),Re=ne([{local:"",remote:""}]),$e=ne([{local:"",remote:""}]),Ie=ne([{local:"",remote:""}]),Le=ne([{local:"",remote:""}]),qe=ne([{local:"",remote:""}]),Ee=ne([{path:""}]),Ae=ne([{path:""}]),Be=ne([{local:"",remote:""}]),Ne=ne([{path:""}]),je=ne([{src:"",dest_remote:"",dest_local:"",delete:!1}]),Ke=ne(!1),Oe=ne(""),De=ne([{name:"",id:""}]),Ge=()=>{De.value.push({name:"",id:""})},Fe=ie({show:!1,jsonText:"",error:""}),Je=ie({show:!1,isLocal:!0,loading:!1,error:null,currentPath:"/",items:[],selectedPath:"",callback:null,type:"",index:-1,fieldKey:null,targetConfigKeyForExclusion:null,originalPathTypeBackup:"",originalIndexBackup:-1}),We=ie({show:!1,loading:!1,error:null,qrcode:"",uid:"",time:"",sgin:"",tips:"请使用支付宝扫描二维码登录",status:"等待扫码",checkInterval:null,clientType:"alipaymini"}),He=[{label:"支付宝",value:"alipaymini"},{label:"微信",value:"wechatmini"},{label:"安卓",value:"115android"},{label:"iOS",value:"115ios"},{label:"网页",value:"web"},{label:"PAD",value:"115ipad"},{label:"TV",value:"tv"}],Ye=ie({show:!1,loading:!1,error:null,qrcode:"",t:"",ck:"",status:"等待扫码",checkIntervalId:null});ce(()=>Ve.transfer_monitor_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());Se.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===Se.value.length&&(Se.value=[{local:"",remote:""}])}catch(l){console.error("解析transfer_monitor_paths出错:",l),Se.value=[{local:"",remote:""}]}else Se.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.transfer_mp_mediaserver_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());Pe.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===Pe.value.length&&(Pe.value=[{local:"",remote:""}])}catch(l){console.error("解析transfer_mp_mediaserver_paths出错:",l),Pe.value=[{local:"",remote:""}]}else Pe.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.full_sync_strm_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());Re.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===Re.value.length&&(Re.value=[{local:"",remote:""}])}catch(l){console.error("解析full_sync_strm_paths出错:",l),Re.value=[{local:"",remote:""}]}else Re.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.increment_sync_strm_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());$e.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===$e.value.length&&($e.value=[{local:"",remote:""}])}catch(l){console.error("解析increment_sync_strm_paths出错:",l),$e.value=[{local:"",remote:""}]}else $e.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.increment_sync_mp_mediaserver_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());Ie.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===Ie.value.length&&(Ie.value=[{local:"",remote:""}])}catch(l){console.error("解析increment_sync_mp_mediaserver_paths出错:",l),Ie.value=[{local:"",remote:""}]}else Ie.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.monitor_life_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());Le.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===Le.value.length&&(Le.value=[{local:"",remote:""}])}catch(l){console.error("解析monitor_life_paths出错:",l),Le.value=[{local:"",remote:""}]}else Le.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.monitor_life_mp_mediaserver_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());qe.value=l.map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}}),0===qe.value.length&&(qe.value=[{local:"",remote:""}])}catch(l){console.error("解析monitor_life_mp_mediaserver_paths出错:",l),qe.value=[{local:"",remote:""}]}else qe.value=[{local:"",remote:""}]},{immediate:!0}),ce(()=>Ve.pan_transfer_paths,e=>{if(e)try{const l=e.split("\n").filter(e=>e.trim());Ee.value=l.map(e=>({path:e})),0===Ee.value.length&&(Ee.value=[{path:""}])}catch(l){console.error("解析pan_transfer_paths出错:",l),Ee.value=[{path:""}]}else Ee.value=[{path:""}]},{immediate:!0}),ce(()=>Ve.transfer_monitor_scrape_metadata_exclude_paths,e=>{if("string"==typeof e&&e.trim())try{const l=e.split("\n").filter(e=>e.trim());Ae.value=l.map(e=>({path:e})),0===Ae.value.length&&(Ae.value=[{path:""}])}catch(l){console.error("解析 transfer_monitor_scrape_metadata_exclude_paths 出错:",l),Ae.value=[{path:""}]}else Ae.value=[{path:""}]},{immediate:!0}),ce(Ae,e=>{if(!Array.isArray(e))return;const l=e.map(e=>e.path?.trim()).filter(e=>e).join("\n");Ve.transfer_monitor_scrape_metadata_exclude_paths!==l&&(Ve.transfer_monitor_scrape_metadata_exclude_paths=l)},{deep:!0}),ce(()=>Ve.increment_sync_scrape_metadata_exclude_paths,e=>{if("string"==typeof e&&e.trim())try{const l=e.split("\n").filter(e=>e.trim());Be.value=l.map(e=>({path:e})),0===Be.value.length&&(Be.value=[{path:""}])}catch(l){console.error("解析 increment_sync_scrape_metadata_exclude_paths 出错:",l),Be.value=[{path:""}]}else Be.value=[{path:""}]},{immediate:!0}),ce(Be,e=>{if(!Array.isArray(e))return;const l=e.map(e=>e.path?.trim()).filter(e=>e).join("\n");Ve.increment_sync_scrape_metadata_exclude_paths!==l&&(Ve.increment_sync_scrape_metadata_exclude_paths=l)},{deep:!0}),ce(()=>Ve.monitor_life_scrape_metadata_exclude_paths,e=>{if("string"==typeof e&&e.trim())try{const l=e.split("\n").filter(e=>e.trim());Ne.value=l.map(e=>({path:e})),0===Ne.value.length&&(Ne.value=[{path:""}])}catch(l){console.error("解析 monitor_life_scrape_metadata_exclude_paths 出错:",l),Ne.value=[{path:""}]}else Ne.value=[{path:""}]},{immediate:!0}),ce(Ne,e=>{if(!Array.isArray(e))return;const l=e.map(e=>e.path?.trim()).filter(e=>e).join("\n");Ve.monitor_life_scrape_metadata_exclude_paths!==l&&(Ve.monitor_life_scrape_metadata_exclude_paths=l)},{deep:!0});const Ze=(e,l)=>e.map(e=>"panTransfer"===l?e.path?.trim():`${e.local?.trim()}#${e.remote?.trim()}`).filter(e=>"panTransfer"===l?e&&""!==e:"#"!==e&&""!==e).join("\n"),Qe=async()=>{fe.value=!0,xe.text="",xe.type="info";try{Ve.transfer_monitor_paths=Ze(Se.value,"transfer"),Ve.transfer_mp_mediaserver_paths=Ze(Pe.value,"mp"),Ve.full_sync_strm_paths=Ze(Re.value,"fullSync"),Ve.increment_sync_strm_paths=Ze($e.value,"incrementSync"),Ve.increment_sync_mp_mediaserver_paths=Ze(Ie.value,"increment-mp"),Ve.monitor_life_paths=Ze(Le.value,"monitorLife"),Ve.monitor_life_mp_mediaserver_paths=Ze(qe.value,"monitorLifeMp"),Ve.pan_transfer_paths=Ze(Ee.value,"panTransfer"),Ve.directory_upload_path=je.value.filter(e=>e.src?.trim()||e.dest_remote?.trim()||e.dest_local?.trim());const e=De.value.filter(e=>e.name&&""!==e.name.trim()&&e.id&&""!==e.id.trim());Ve.tg_search_channels=e,_e("save",JSON.parse(JSON.stringify(Ve))),xe.text="配置已发送保存请求，请稍候...",xe.type="info"}catch(e){console.error("发送保存事件时出错:",e),xe.text=`发送保存请求时出错: ${e.message||"未知错误"}`,xe.type="error"}finally{fe.value=!1,setTimeout(()=>{"info"!==xe.type&&"error"!==xe.type||(xe.text="")},5e3)}},Xe=async()=>{Oe.value="正在获取...";try{const e=await me.api.get(`plugin/${ue}/get_machine_id`);if(!e||!e.machine_id)throw new Error(e?.msg||"未能获取设备ID");Oe.value=e.machine_id,xe.text="设备ID获取成功！",xe.type="success"}catch(e){Oe.value="获取失败，请重试",xe.text=`获取设备ID失败: ${e.message||"未知错误"}`,xe.type="error"}setTimeout(()=>{"success"!==xe.type&&"info"!==xe.type||(xe.text="")},3e3)},el=async()=>{Ke.value=!1,await ll()},ll=async()=>{ye.value=!0,xe.text="";try{if(!Ve.enabled)throw new Error("插件未启用，请先启用插件");if(!Ve.cookies||""===Ve.cookies.trim())throw new Error("请先设置115 Cookie");if(Ve.full_sync_strm_paths=Ze(Re.value,"fullSync"),!Ve.full_sync_strm_paths)throw new Error("请先配置全量同步路径");const e=await me.api.post(`plugin/${ue}/full_sync`);if(!e||0!==e.code)throw new Error(e?.msg||"启动全量同步失败");xe.text=e.msg||"全量同步任务已启动",xe.type="success"}catch(e){xe.text=`启动全量同步失败: ${e.message||"未知错误"}`,xe.type="error",console.error("启动全量同步失败:",e)}finally{ye.value=!1}},al=e=>{switch(e){case"transfer":Se.value.push({local:"",remote:""});break;case"mp":Pe.value.push({local:"",remote:""});break;case"fullSync":Re.value.push({local:"",remote:""});break;case"incrementSync":$e.value.push({local:"",remote:""});break;case"increment-mp":Ie.value.push({local:"",remote:""});break;case"monitorLife":Le.value.push({local:"",remote:""});break;case"monitorLifeMp":qe.value.push({local:"",remote:""});break;case"directoryUpload":je.value.push({src:"",dest_remote:"",dest_local:"",delete:!1})}},tl=(e,l)=>{switch(l){case"transfer":Se.value.splice(e,1),0===Se.value.length&&(Se.value=[{local:"",remote:""}]);break;case"mp":Pe.value.splice(e,1),0===Pe.value.length&&(Pe.value=[{local:"",remote:""}]);break;case"fullSync":Re.value.splice(e,1),0===Re.value.length&&(Re.value=[{local:"",remote:""}]);break;case"incrementSync":$e.value.splice(e,1),0===$e.value.length&&($e.value=[{local:"",remote:""}]);break;case"increment-mp":Ie.value.splice(e,1),0===Ie.value.length&&(Ie.value=[{local:"",remote:""}]);break;case"monitorLife":Le.value.splice(e,1),0===Le.value.length&&(Le.value=[{local:"",remote:""}]);break;case"monitorLifeMp":qe.value.splice(e,1),0===qe.value.length&&(qe.value=[{local:"",remote:""}]);break;case"directoryUpload":je.value.splice(e,1),0===je.value.length&&(je.value=[{src:"",dest_remote:"",dest_local:"",delete:!1}])}},ol=()=>{Ee.value.push({path:""})},nl=()=>{Fe.jsonText="",Fe.error="",Fe.show=!0},il=()=>{Fe.show=!1},rl=()=>{if(Fe.error="",Fe.jsonText&&Fe.jsonText.trim())try{const e=JSON.parse(Fe.jsonText);if(!Array.isArray(e))throw new Error("数据必须是一个数组。");if(!e.every(e=>"object"==typeof e&&null!==e&&"name"in e&&"id"in e))throw new Error("数组中的每个元素都必须是包含 'name' 和 'id' 键的对象。");De.value=e.length>0?e:[{name:"",id:""}],xe.text="频道配置导入成功！",xe.type="success",il()}catch(e){Fe.error=`导入失败: ${e.message}`,console.error("频道导入解析失败:",e)}else Fe.error="输入内容不能为空。"},dl=(e,l,a,t=null)=>{Je.show=!0,Je.isLocal="local"===l,Je.loading=!1,Je.error=null,Je.items=[],Je.index=e,Je.type=a,Je.fieldKey=t,Je.targetConfigKeyForExclusion=null,Je.originalPathTypeBackup="",Je.originalIndexBackup=-1,Je.isLocal,Je.currentPath="/",sl()},sl=async()=>{Je.loading=!0,Je.error=null,Je.items=[];try{if(Je.isLocal)try{const e=await me.api.post("storage/list",{path:Je.currentPath||"/",type:"share",flag:"ROOT"});if(!e||!Array.isArray(e))throw new Error("浏览目录失败：无效响应");Je.items=e.filter(e=>"dir"===e.type).map(e=>({name:e.name,path:e.path,is_dir:!0})).sort((e,l)=>e.name.localeCompare(l.name,void 0,{numeric:!0,sensitivity:"base"}))}catch(e){console.error("浏览本地目录失败:",e),Je.error=`浏览本地目录失败: ${e.message||"未知错误"}`,Je.items=[]}else{if(!Ve.cookies||""===Ve.cookies.trim())throw new Error("请先设置115 Cookie才能浏览网盘目录");const e=await me.api.get(`plugin/${ue}/browse_dir?path=${encodeURIComponent(Je.currentPath)}&is_local=${Je.isLocal}`);if(!e||0!==e.code||!e.items)throw new Error(e?.msg||"获取网盘目录内容失败");Je.items=e.items.filter(e=>e.is_dir).sort((e,l)=>e.name.localeCompare(l.name,void 0,{numeric:!0,sensitivity:"base"})),Je.currentPath=e.path||Je.currentPath}}catch(e){console.error("加载目录内容失败:",e),Je.error=e.message||"获取目录内容失败",(e.message.includes("Cookie")||e.message.includes("cookie"))&&(Je.items=[])}finally{Je.loading=!1}},cl=()=>{const e=Je.currentPath;if(!Je.isLocal){if("/"===e)return;let l=e.replace(/\\/g,"/");l.length>1&&l.endsWith("/")&&(l=l.slice(0,-1));const a=l.substring(0,l.lastIndexOf("/"));return Je.currentPath=""===a?"/":a,void sl()}if("/"===e||"C:\\"===e||"C:/"===e)return;const l=e.replace(/\\/g,"/"),a=l.split("/").filter(Boolean);0===a.length?Je.currentPath="/":1===a.length&&l.includes(":")?Je.currentPath=a[0]+":/":(a.pop(),Je.currentPath=0===a.length?"/":(l.startsWith("/")?"/":"")+a.join("/")+"/"),sl()},ul=()=>{if(!Je.currentPath)return;let e=Je.currentPath;if("/"===e||/^[a-zA-Z]:[\\\/]$/.test(e)||!e.endsWith("/")&&!e.endsWith("\\\\")||(e=e.slice(0,-1)),"excludePath"===Je.type&&Je.targetConfigKeyForExclusion){const l=Je.targetConfigKeyForExclusion;let a;"transfer_monitor_scrape_metadata_exclude_paths"===l?a=Ae:"monitor_life_scrape_metadata_exclude_paths"===l?a=Ne:"increment_sync_scrape_metadata_exclude_paths"===l&&(a=Be),a&&(1!==a.value.length||a.value[0].path?a.value.some(l=>l.path===e)?(xe.text="该排除路径已存在。",xe.type="warning",setTimeout(()=>{xe.text=""},3e3)):a.value.push({path:e}):a.value[0]={path:e}),Je.type=Je.originalPathTypeBackup,Je.index=Je.originalIndexBackup,Je.targetConfigKeyForExclusion=null,Je.originalPathTypeBackup="",Je.originalIndexBackup=-1}else if(Je.index>=0&&"excludePath"!==Je.type)switch(Je.type){case"transfer":Je.isLocal?Se.value[Je.index].local=e:Se.value[Je.index].remote=e;break;case"fullSync":Je.isLocal?Re.value[Je.index].local=e:Re.value[Je.index].remote=e;break;case"incrementSync":Je.isLocal?$e.value[Je.index].local=e:$e.value[Je.index].remote=e;break;case"monitorLife":Je.isLocal?Le.value[Je.index].local=e:Le.value[Je.index].remote=e;break;case"panTransfer":Ee.value[Je.index].path=e;break;case"directoryUpload":Je.fieldKey&&je.value[Je.index]&&(je.value[Je.index][Je.fieldKey]=e)}else"panTransferUnrecognized"===Je.type?Ve.pan_transfer_unrecognized_path=e:"sharePath"===Je.type&&(Je.isLocal?Ve.user_share_local_path=e:Ve.user_share_pan_path=e);ml()},ml=()=>{Je.show=!1,Je.items=[],Je.error=null},_l=async()=>{if(!Ve.cookies)return xe.text="Cookie为空，无法复制。",void(xe.type="warning");try{await navigator.clipboard.writeText(Ve.cookies),xe.text="Cookie已复制到剪贴板！",xe.type="success"}catch(e){console.error("复制Cookie失败:",e),xe.text="复制Cookie失败。请检查浏览器权限或确保通过HTTPS访问，或尝试手动复制。",xe.type="error"}setTimeout(()=>{"success"!==xe.type&&"warning"!==xe.type&&"error"!==xe.type||(xe.text="")},3e3)},pl=async()=>{if(!Ve.aliyundrive_token)return xe.text="Token为空，无法复制。",void(xe.type="warning");try{await navigator.clipboard.writeText(Ve.aliyundrive_token),xe.text="阿里云盘Token已复制到剪贴板！",xe.type="success"}catch(e){console.error("复制Token失败:",e),xe.text="复制Token失败。请检查浏览器权限或手动复制。",xe.type="error"}setTimeout(()=>{xe.text=""},3e3)},fl=()=>{We.show=!0,We.loading=!1,We.error=null,We.qrcode="",We.uid="",We.time="",We.sign="",He.some(e=>e.value===We.clientType)||(We.clientType="alipaymini");const e=He.find(e=>e.value===We.clientType);e?We.tips=`请使用${e.label}扫描二维码登录`:(We.clientType="alipaymini",We.tips="请使用支付宝扫描二维码登录"),We.status="等待扫码",yl()},yl=async()=>{We.loading=!0,We.error=null,We.qrcode="",We.uid="",We.time="",We.sign="",console.warn(`【115STRM助手 DEBUG】准备获取二维码，前端选择的 clientType: ${We.clientType}`);try{const e=await me.api.get(`plugin/${ue}/get_qrcode?client_type=${We.clientType}`);e&&0===e.code?(We.uid=e.uid,We.time=e.time,We.sign=e.sign,We.qrcode=e.qrcode,We.tips=e.tips||"请扫描二维码登录",We.status="等待扫码",e.client_type&&(We.clientType=e.client_type),hl()):(We.error=e?.error||"获取二维码失败",console.error("【115STRM助手 DEBUG】获取二维码API调用失败或返回错误码: ",e))}catch(e){We.error=`获取二维码出错: ${e.message||"未知错误"}`,console.error("【115STRM助手 DEBUG】获取二维码 JS 捕获异常:",e)}finally{We.loading=!1}},vl=async()=>{if(We.uid&&We.show&&We.time&&We.show&&We.sign&&We.show)try{const e=await me.api.get(`plugin/${ue}/check_qrcode?uid=${We.uid}&time=${We.time}&sign=${We.sign}&client_type=${We.clientType}`);e&&0===e.code?"waiting"===e.status?We.status="等待扫码":"scanned"===e.status?We.status="已扫码，请在设备上确认":"success"===e.status&&(e.cookie?(Cl(),We.status="登录成功！",Ve.cookies=e.cookie,xe.text='登录成功！Cookie已获取，请点击下方"保存配置"按钮保存。',xe.type="success",setTimeout(()=>{We.show=!1},3e3)):(We.status="登录似乎成功，但未获取到Cookie",xe.text="登录成功但未获取到Cookie信息，请重试或检查账号。",xe.type="warning",Cl())):e&&-1===e.code&&"登录成功，正在处理..."!==We.status&&(Cl(),We.error=e.error||"二维码已失效，请刷新",We.status="二维码已失效")}catch(e){"登录成功，正在处理..."!==We.status&&console.error("检查二维码状态JS捕获异常:",e)}},hl=()=>{Cl(),We.checkIntervalId=setInterval(vl,3e3)},bl=()=>{Ye.show=!0,Ye.loading=!1,Ye.error=null,Ye.qrcode="",Ye.t="",Ye.ck="",Ye.status="等待扫码",gl()},gl=async()=>{Ye.loading=!0,Ye.error=null,Ye.qrcode="";try{const e=await me.api.get(`plugin/${ue}/get_aliyundrive_qrcode`);e&&0===e.code?(Ye.qrcode=e.qrcode,Ye.t=e.t,Ye.ck=e.ck,Ye.status="等待扫码",xl()):Ye.error=e?.msg||"获取阿里云盘二维码失败"}catch(e){Ye.error=`获取二维码出错: ${e.message||"未知错误"}`}finally{Ye.loading=!1}},Vl=async()=>{if(Ye.t&&Ye.ck&&Ye.show)try{const e=await me.api.get(`plugin/${ue}/check_aliyundrive_qrcode?t=${Ye.t}&ck=${encodeURIComponent(Ye.ck)}`);e&&0===e.code?"success"===e.status&&e.token?(kl(),Ye.status="登录成功！",Ve.aliyundrive_token=e.token,xe.text="阿里云盘登录成功！Token已获取，请点击下方“保存配置”按钮。",xe.type="success",setTimeout(()=>{Ye.show=!1},2e3)):(Ye.status=e.msg||"等待扫码","expired"!==e.status&&"invalid"!==e.status||(kl(),Ye.error="二维码已失效，请刷新")):e&&(kl(),Ye.status="二维码已失效",Ye.error=e.msg||"二维码检查失败，请刷新。")}catch(e){console.error("检查阿里云盘二维码状态出错:",e)}},xl=()=>{kl(),Ye.checkIntervalId=setInterval(Vl,2e3)},kl=()=>{Ye.checkIntervalId&&(clearInterval(Ye.checkIntervalId),Ye.checkIntervalId=null)},wl=()=>{kl(),Ye.error=null,gl()},Ul=()=>{kl(),Ye.show=!1},Cl=()=>{We.checkIntervalId&&(clearInterval(We.checkIntervalId),We.checkIntervalId=null)},Tl=()=>{switch(Cl(),We.error=null,We.clientType){case"alipaymini":We.tips="请使用支付宝扫描二维码登录";break;case"wechatmini":We.tips="请使用微信扫描二维码登录";break;case"115android":We.tips="请使用115安卓客户端扫描登录";break;case"115ios":We.tips="请使用115 iOS客户端扫描登录";break;case"web":We.tips="请使用115网页版扫码登录";break;default:const e=He.find(e=>e.value===We.clientType);We.tips=e?`请使用${e.label}扫描二维码登录`:"请扫描二维码登录"}yl()},zl=()=>{Cl(),We.show=!1};de(()=>{(async()=>{try{pe.value=!0;const l=await me.api.get(`plugin/${ue}/get_config`);if(l){Object.assign(Ve,l),je.value=Array.isArray(Ve.directory_upload_path)&&Ve.directory_upload_path.length>0?JSON.parse(JSON.stringify(Ve.directory_upload_path)):[{src:"",dest_remote:"",dest_local:"",delete:!1}];let a=[];if(Ve.tg_search_channels)if(Array.isArray(Ve.tg_search_channels))a=Ve.tg_search_channels;else if("string"==typeof Ve.tg_search_channels)try{a=JSON.parse(Ve.tg_search_channels)}catch(e){console.error("解析旧的TG频道配置字符串失败:",e),a=[]}Array.isArray(a)&&a.length>0?De.value=a:De.value=[{name:"",id:""}],l.mediaservers&&(he.value=l.mediaservers);const t=new Set;Ve.transfer_monitor_paths&&Ve.transfer_monitor_paths.split("\n").map(e=>e.split("#")[0]?.trim()).filter(e=>e).forEach(e=>t.add(e)),Ve.full_sync_strm_paths&&Ve.full_sync_strm_paths.split("\n").map(e=>e.split("#")[0]?.trim()).filter(e=>e).forEach(e=>t.add(e)),Ve.monitor_life_paths&&Ve.monitor_life_paths.split("\n").map(e=>e.split("#")[0]?.trim()).filter(e=>e).forEach(e=>t.add(e))}}catch(l){console.error("加载配置失败:",l),xe.text=`加载配置失败: ${l.message||"未知错误"}`,xe.type="error"}finally{pe.value=!1}})()}),se(()=>{console.log("组件即将卸载，清理定时器..."),Cl(),kl()}),ce(()=>We.clientType,(e,l)=>{e!==l&&We.show&&(console.log(`【115STRM助手 DEBUG】qrDialog.clientType 从 ${l} 变为 ${e}，准备刷新二维码`),Tl())});const Ml=()=>{window&&window.location&&window.location.origin?(Ve.moviepilot_address=window.location.origin,xe.text="MoviePilot地址已设置为当前站点地址！",xe.type="success"):(xe.text="无法获取当前站点地址。",xe.type="error"),setTimeout(()=>{"success"!==xe.type&&"error"!==xe.type||(xe.text="")},3e3)},Sl=e=>{Je.show=!0,Je.isLocal=!0,Je.loading=!1,Je.error=null,Je.items=[],Je.currentPath="/",Je.originalPathTypeBackup=Je.type,Je.originalIndexBackup=Je.index,Je.targetConfigKeyForExclusion=e,Je.type="excludePath",Je.index=-1,sl()},Pl=(e,l)=>{let a;"transfer_exclude"===l?a=Ae:"life_exclude"===l?a=Ne:"increment_exclude"===l&&(a=Be),a&&a.value&&e<a.value.length&&(a.value.splice(e,1),0===a.value.length&&(a.value=[{path:""}]))};return(e,l)=>{const ne=a("v-icon"),ie=a("v-card-title"),re=a("v-alert"),de=a("v-skeleton-loader"),se=a("v-switch"),ce=a("v-col"),ue=a("v-select"),me=a("v-row"),ze=a("v-text-field"),Me=a("v-card-text"),Ze=a("v-card"),ll=a("v-tab"),yl=a("v-tabs"),vl=a("v-divider"),hl=a("v-btn"),gl=a("v-window-item"),Vl=a("VCronField"),xl=a("v-expansion-panel-title"),kl=a("v-expansion-panel-text"),Cl=a("v-expansion-panel"),Rl=a("v-expansion-panels"),$l=a("v-card-item"),Il=a("v-textarea"),Ll=a("v-combobox"),ql=a("v-window"),El=a("v-spacer"),Al=a("v-card-actions"),Bl=a("v-dialog"),Nl=a("v-progress-circular"),jl=a("v-list-item-title"),Kl=a("v-list-item-subtitle"),Ol=a("v-list-item"),Dl=a("v-list"),Gl=a("v-chip"),Fl=a("v-chip-group");return d(),_("div",f,[t(Ze,{flat:"",class:"rounded border",style:{display:"flex","flex-direction":"column","max-height":"85vh"}},{default:n(()=>[t(ie,{class:"text-subtitle-1 d-flex align-center px-3 py-1 bg-primary-lighten-5"},{default:n(()=>[t(ne,{icon:"mdi-cog",class:"mr-2",color:"primary",size:"small"}),l[93]||(l[93]=o("span",null,"115网盘STRM助手配置",-1))]),_:1}),t(Me,{class:"px-3 py-2",style:{"flex-grow":"1","overflow-y":"auto","padding-bottom":"56px"}},{default:n(()=>[xe.text?(d(),s(re,{key:0,type:xe.type,density:"compact",class:"mb-2 text-caption",variant:"tonal",closable:""},{default:n(()=>[r(i(xe.text),1)]),_:1},8,["type"])):c("",!0),pe.value?(d(),s(de,{key:1,type:"article, actions"})):(d(),_("div",y,[t(Ze,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(ie,{class:"text-subtitle-2 d-flex align-center px-3 py-1 bg-primary-lighten-5"},{default:n(()=>[t(ne,{icon:"mdi-cog",class:"mr-2",color:"primary",size:"small"}),l[94]||(l[94]=o("span",null,"基础设置",-1))]),_:1}),t(Me,{class:"pa-3"},{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.enabled,"onUpdate:modelValue":l[0]||(l[0]=e=>Ve.enabled=e),label:"启用插件",color:"success",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ue,{modelValue:Ve.strm_url_format,"onUpdate:modelValue":l[1]||(l[1]=e=>Ve.strm_url_format=e),label:"STRM文件URL格式",items:[{title:"pickcode",value:"pickcode"},{title:"pickcode + name",value:"pickname"}],chips:"","closable-chips":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ue,{modelValue:Ve.link_redirect_mode,"onUpdate:modelValue":l[2]||(l[2]=e=>Ve.link_redirect_mode=e),label:"直链获取模式",items:[{title:"Cookie",value:"cookie"},{title:"OpenAPI",value:"open"}],chips:"","closable-chips":""},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.notify,"onUpdate:modelValue":l[3]||(l[3]=e=>Ve.notify=e),label:"发送通知",color:"success",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.link_redirect_http2_enabled,"onUpdate:modelValue":l[320]||(l[320]=e=>Ve.link_redirect_http2_enabled=e),label:"302跳转使用HTTP/2",color:"primary",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ue,{modelValue:Ve.language,"onUpdate:modelValue":l[4]||(l[4]=e=>Ve.language=e),label:"通知语言",items:[{title:"简体中文",value:"zh_CN"},{title:"繁中台湾",value:"zh_TW"},{title:"繁中港澳",value:"zh_HK"},{title:"柔情猫娘",value:"zh_CN_catgirl"},{title:"粤韵风华",value:"zh_yue"},{title:"咚咚搬砖",value:"zh_CN_dong"}],chips:"","closable-chips":""},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.link_redirect_async_enabled,"onUpdate:modelValue":l[330]||(l[330]=e=>Ve.link_redirect_async_enabled=e),label:"302跳转使用异步接口",color:"primary",density:"compact",hint:"不占用线程池，适合大量并发播放请求，修改后需重启插件","persistent-hint":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ze,{modelValue:Ve.link_redirect_async_concurrency,"onUpdate:modelValue":l[331]||(l[331]=e=>Ve.link_redirect_async_concurrency=e),modelModifiers:{number:!0},label:"异步302跳转最大上游并发数",type:"number",density:"compact",disabled:!Ve.link_redirect_async_enabled},null,8,["modelValue","disabled"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.link_redirect_cache_persist_enabled,"onUpdate:modelValue":l[350]||(l[350]=e=>Ve.link_redirect_cache_persist_enabled=e),label:"302跳转缓存持久化",color:"primary",density:"compact",hint:"重启后保留未过期的下载链接","persistent-hint":""},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.link_redirect_refresh_enabled,"onUpdate:modelValue":l[340]||(l[340]=e=>Ve.link_redirect_refresh_enabled=e),label:"302跳转后台刷新下载链接",color:"primary",density:"compact",hint:"最近播放的文件在下载链接过期前自动续期","persistent-hint":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.link_redirect_prefetch_next_enabled,"onUpdate:modelValue":l[341]||(l[341]=e=>Ve.link_redirect_prefetch_next_enabled=e),label:"302跳转预取下一集",color:"primary",density:"compact",hint:"播放时根据数据库中同目录文件预取下一集下载链接","persistent-hint":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ze,{modelValue:Ve.link_redirect_prefetch_rate,"onUpdate:modelValue":l[342]||(l[342]=e=>Ve.link_redirect_prefetch_rate=e),modelModifiers:{number:!0},label:"刷新与预取每分钟最多请求次数",type:"number",density:"compact",disabled:!Ve.link_redirect_refresh_enabled&&!Ve.link_redirect_prefetch_next_enabled},null,8,["modelValue","disabled"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ze,{modelValue:Ve.cookies,"onUpdate:modelValue":l[6]||(l[6]=e=>Ve.cookies=e),label:"115 Cookie",hint:"点击图标切换显隐、复制或扫码","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto",type:be.value?"text":"password"},{"append-inner":n(()=>[t(ne,{icon:be.value?"mdi-eye-off":"mdi-eye",onClick:l[5]||(l[5]=e=>be.value=!be.value),"aria-label":be.value?"隐藏Cookie":"显示Cookie",title:be.value?"隐藏Cookie":"显示Cookie",class:"mr-1",size:"small"},null,8,["icon","aria-label","title"]),t(ne,{icon:"mdi-content-copy",onClick:_l,disabled:!Ve.cookies,"aria-label":"复制Cookie",title:"复制Cookie到剪贴板",size:"small",class:"mr-1"},null,8,["disabled"])]),append:n(()=>[t(ne,{icon:"mdi-qrcode-scan",onClick:fl,color:Ve.cookies?"success":"default","aria-label":Ve.cookies?"更新/更换Cookie (重新扫码)":"扫码获取Cookie",title:Ve.cookies?"更新/更换Cookie (重新扫码)":"扫码获取Cookie"},null,8,["color","aria-label","title"])]),_:1},8,["modelValue","type"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ze,{modelValue:Ve.aliyundrive_token,"onUpdate:modelValue":l[8]||(l[8]=e=>Ve.aliyundrive_token=e),label:"阿里云盘 Token (可选)",hint:"非必填。点击图标切换显隐、复制或扫码获取","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto",type:ge.value?"text":"password"},{"append-inner":n(()=>[t(ne,{icon:ge.value?"mdi-eye-off":"mdi-eye",onClick:l[7]||(l[7]=e=>ge.value=!ge.value),"aria-label":ge.value?"隐藏Token":"显示Token",title:ge.value?"隐藏Token":"显示Token",class:"mr-1",size:"small"},null,8,["icon","aria-label","title"]),t(ne,{icon:"mdi-content-copy",onClick:pl,disabled:!Ve.aliyundrive_token,"aria-label":"复制Token",title:"复制Token到剪贴板",size:"small",class:"mr-1"},null,8,["disabled"])]),append:n(()=>[t(ne,{icon:"mdi-qrcode-scan",onClick:bl,color:Ve.aliyundrive_token?"success":"default","aria-label":Ve.aliyundrive_token?"更新/更换Token":"扫码获取Token",title:Ve.aliyundrive_token?"更新/更换Token":"扫码获取Token"},null,8,["color","aria-label","title"])]),_:1},8,["modelValue","type"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ze,{modelValue:Ve.moviepilot_address,"onUpdate:modelValue":l[9]||(l[9]=e=>Ve.moviepilot_address=e),label:"MoviePilot 内网访问地址",hint:"点右侧图标自动填充当前站点地址。","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto"},{append:n(()=>[t(ne,{icon:"mdi-web",onClick:Ml,"aria-label":"使用当前站点地址",title:"使用当前站点地址",color:"info"})]),_:1},8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.user_rmt_mediaext,"onUpdate:modelValue":l[10]||(l[10]=e=>Ve.user_rmt_mediaext=e),label:"可整理媒体文件扩展名",hint:"支持的媒体文件扩展名，多个用逗号分隔","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.user_download_mediaext,"onUpdate:modelValue":l[11]||(l[11]=e=>Ve.user_download_mediaext=e),label:"可下载媒体数据文件扩展名",hint:"下载的字幕等附属文件扩展名，多个用逗号分隔","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto"},null,8,["modelValue"])]),_:1})]),_:1})]),_:1})]),_:1}),t(Ze,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(yl,{modelValue:ve.value,"onUpdate:modelValue":l[12]||(l[12]=e=>ve.value=e),color:"primary","bg-color":"grey-lighten-3",class:"rounded-t",grow:""},{default:n(()=>[t(ll,{value:"tab-transfer",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[95]||(l[95]=[r("mdi-file-move-outline")])),_:1}),l[96]||(l[96]=r("监控MP整理 "))]),_:1}),t(ll,{value:"tab-sync",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[97]||(l[97]=[r("mdi-sync")])),_:1}),l[98]||(l[98]=r("全量同步 "))]),_:1}),t(ll,{value:"tab-increment-sync",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[99]||(l[99]=[r("mdi-book-sync")])),_:1}),l[100]||(l[100]=r("增量同步 "))]),_:1}),t(ll,{value:"tab-life",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[101]||(l[101]=[r("mdi-calendar-heart")])),_:1}),l[102]||(l[102]=r("监控115生活事件 "))]),_:1}),t(ll,{value:"tab-cleanup",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[103]||(l[103]=[r("mdi-broom")])),_:1}),l[104]||(l[104]=r("定期清理 "))]),_:1}),t(ll,{value:"tab-pan-transfer",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[105]||(l[105]=[r("mdi-transfer")])),_:1}),l[106]||(l[106]=r("网盘整理 "))]),_:1}),t(ll,{value:"tab-directory-upload",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[107]||(l[107]=[r("mdi-upload")])),_:1}),l[108]||(l[108]=r("目录上传 "))]),_:1}),t(ll,{value:"tab-tg-search",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[109]||(l[109]=[r("mdi-tab-search")])),_:1}),l[110]||(l[110]=r("频道搜索 "))]),_:1}),t(ll,{value:"tab-same-playback",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[111]||(l[111]=[r("mdi:code-block-parentheses")])),_:1}),l[112]||(l[112]=r("多端播放 "))]),_:1}),t(ll,{value:"tab-data-enhancement",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[113]||(l[113]=[r("mdi-database-eye-outline")])),_:1}),l[114]||(l[114]=r("数据增强 "))]),_:1}),t(ll,{value:"tab-advanced-configuration",class:"text-caption"},{default:n(()=>[t(ne,{size:"small",start:""},{default:n(()=>l[115]||(l[115]=[r("mdi-tune")])),_:1}),l[116]||(l[116]=r("高级配置 "))]),_:1})]),_:1},8,["modelValue"]),t(vl),t(ql,{modelValue:ve.value,"onUpdate:modelValue":l[81]||(l[81]=e=>ve.value=e)},{default:n(()=>[t(gl,{value:"tab-transfer"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.transfer_monitor_enabled,"onUpdate:modelValue":l[13]||(l[13]=e=>Ve.transfer_monitor_enabled=e),label:"启用",color:"info"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.transfer_monitor_scrape_metadata_enabled,"onUpdate:modelValue":l[14]||(l[14]=e=>Ve.transfer_monitor_scrape_metadata_enabled=e),label:"STRM自动刮削",color:"primary"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.transfer_monitor_media_server_refresh_enabled,"onUpdate:modelValue":l[15]||(l[15]=e=>Ve.transfer_monitor_media_server_refresh_enabled=e),label:"媒体服务器刷新",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.transfer_monitor_mediaservers,"onUpdate:modelValue":l[16]||(l[16]=e=>Ve.transfer_monitor_mediaservers=e),label:"媒体服务器",items:he.value,multiple:"",chips:"","closable-chips":""},null,8,["modelValue","items"])]),_:1})]),_:1}),Ve.transfer_monitor_scrape_metadata_enabled?(d(),s(me,{key:0,class:"mt-2 mb-2"},{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",v,[(d(!0),_(m,null,u(Ae.value,(e,a)=>(d(),_("div",{key:`transfer-exclude-${a}`,class:"mb-2 d-flex align-center"},[t(ze,{modelValue:e.path,"onUpdate:modelValue":l=>e.path=l,label:"刮削排除目录",density:"compact",variant:"outlined",readonly:"","hide-details":"",class:"flex-grow-1 mr-2"},null,8,["modelValue","onUpdate:modelValue"]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>Pl(a,"transfer_exclude"),disabled:!e.path},{default:n(()=>[t(ne,null,{default:n(()=>l[117]||(l[117]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick","disabled"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-folder-plus-outline",variant:"tonal",class:"mt-1 align-self-start",onClick:l[17]||(l[17]=e=>Sl("transfer_monitor_scrape_metadata_exclude_paths"))},{default:n(()=>l[118]||(l[118]=[r(" 添加刮削排除目录 ")])),_:1})]),t(re,{density:"compact",variant:"text",color:"info",class:"text-caption pa-0 mt-1"},{default:n(()=>l[119]||(l[119]=[r(" 此处添加的本地目录，在STRM文件生成后将不会自动触发刮削。 ")])),_:1})]),_:1})]),_:1})):c("",!0),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",h,[(d(!0),_(m,null,u(Se.value,(e,a)=>(d(),_("div",{key:`transfer-${a}`,class:"mb-2 d-flex align-center"},[o("div",b,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"本地STRM目录",density:"compact","append-icon":"mdi-folder","onClick:append":e=>dl(a,"local","transfer")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(ne,null,{default:n(()=>l[120]||(l[120]=[r("mdi-pound")])),_:1}),o("div",g,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"网盘媒体库目录",density:"compact","append-icon":"mdi-folder-network","onClick:append":e=>dl(a,"remote","transfer")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"transfer")},{default:n(()=>[t(ne,null,{default:n(()=>l[121]||(l[121]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[18]||(l[18]=e=>al("transfer"))},{default:n(()=>l[122]||(l[122]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[123]||(l[123]=[r(" 监控MoviePilot整理入库事件，自动在本地对应目录生成STRM文件。"),o("br",null,null,-1),r(" 本地STRM目录：本地STRM文件生成路径 网盘媒体库目录：需要生成本地STRM文件的网盘媒体库路径 ")])),_:1})]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",V,[(d(!0),_(m,null,u(Pe.value,(e,a)=>(d(),_("div",{key:`mp-${a}`,class:"mb-2 d-flex align-center"},[o("div",x,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"媒体库服务器映射目录",density:"compact"},null,8,["modelValue","onUpdate:modelValue"])]),t(ne,null,{default:n(()=>l[124]||(l[124]=[r("mdi-pound")])),_:1}),o("div",k,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"MP映射目录",density:"compact"},null,8,["modelValue","onUpdate:modelValue"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"mp")},{default:n(()=>[t(ne,null,{default:n(()=>l[125]||(l[125]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[19]||(l[19]=e=>al("mp"))},{default:n(()=>l[126]||(l[126]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[127]||(l[127]=[r(" 媒体服务器映射路径和MP映射路径不一样时请配置此项，如果不配置则无法正常刷新。"),o("br",null,null,-1),r(" 当映射路径一样时可省略此配置。 ")])),_:1})]),_:1})]),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-sync"},{default:n(()=>[t(Me,null,{default:n(()=>[o("div",w,[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.full_sync_overwrite_mode,"onUpdate:modelValue":l[20]||(l[20]=e=>Ve.full_sync_overwrite_mode=e),label:"覆盖模式",items:[{title:"总是",value:"always"},{title:"从不",value:"never"},{title:"仅内容变化时",value:"changed"}],chips:"","closable-chips":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.full_sync_remove_unless_strm,"onUpdate:modelValue":l[21]||(l[21]=e=>Ve.full_sync_remove_unless_strm=e),label:"清理失效STRM文件",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.full_sync_auto_download_mediainfo_enabled,"onUpdate:modelValue":l[22]||(l[22]=e=>Ve.full_sync_auto_download_mediainfo_enabled=e),label:"下载媒体数据文件",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ze,{modelValue:Ue.value,"onUpdate:modelValue":l[23]||(l[23]=e=>Ue.value=e),label:"STRM最小文件大小",hint:"小于此值的文件将不生成STRM(单位K,M,G)","persistent-hint":"",density:"compact",placeholder:"例如: 100M (可为空)",clearable:""},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(se,{modelValue:Ve.timing_full_sync_strm,"onUpdate:modelValue":l[24]||(l[24]=e=>Ve.timing_full_sync_strm=e),label:"定期全量同步",color:"info"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(Vl,{modelValue:Ve.cron_full_sync_strm,"onUpdate:modelValue":l[25]||(l[25]=e=>Ve.cron_full_sync_strm=e),label:"运行全量同步周期",hint:"设置全量同步的执行周期","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",U,[(d(!0),_(m,null,u(Re.value,(e,a)=>(d(),_("div",{key:`full-${a}`,class:"mb-2 d-flex align-center"},[o("div",C,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"本地STRM目录",density:"compact","append-icon":"mdi-folder","onClick:append":e=>dl(a,"local","fullSync")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(ne,null,{default:n(()=>l[128]||(l[128]=[r("mdi-pound")])),_:1}),o("div",T,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"网盘媒体库目录",density:"compact","append-icon":"mdi-folder-network","onClick:append":e=>dl(a,"remote","fullSync")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"fullSync")},{default:n(()=>[t(ne,null,{default:n(()=>l[129]||(l[129]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[26]||(l[26]=e=>al("fullSync"))},{default:n(()=>l[130]||(l[130]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[131]||(l[131]=[r(" 全量扫描配置的网盘目录，并在对应的本地目录生成STRM文件。"),o("br",null,null,-1),r(" 本地STRM目录：本地STRM文件生成路径 网盘媒体库目录：需要生成本地STRM文件的网盘媒体库路径 ")])),_:1})]),_:1})]),_:1})]),t(Rl,{variant:"tonal",class:"mt-6"},{default:n(()=>[t(Cl,null,{default:n(()=>[t(xl,null,{default:n(()=>[t(ne,{icon:"mdi-tune-variant",class:"mr-2"}),l[132]||(l[132]=r(" 高级配置 "))]),_:1}),t(kl,{class:"pa-4"},{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.full_sync_strm_log,"onUpdate:modelValue":l[27]||(l[27]=e=>Ve.full_sync_strm_log=e),label:"输出STRM同步日志",color:"primary"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ze,{modelValue:Ve.full_sync_batch_num,"onUpdate:modelValue":l[28]||(l[28]=e=>Ve.full_sync_batch_num=e),modelModifiers:{number:!0},label:"全量同步批处理数量",type:"number",hint:"每次批量处理的文件/目录数量","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ze,{modelValue:Ve.full_sync_process_num,"onUpdate:modelValue":l[29]||(l[29]=e=>Ve.full_sync_process_num=e),modelModifiers:{number:!0},label:"全量同步生成进程数",type:"number",hint:"同时执行同步任务的进程数量","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.full_sync_iter_function,"onUpdate:modelValue":l[30]||(l[30]=e=>Ve.full_sync_iter_function=e),label:"迭代函数",items:[{title:"iter_files_with_path_skim",value:"iter_files_with_path_skim"},{title:"iter_files_with_path",value:"iter_files_with_path"}],chips:"","closable-chips":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.full_sync_tree_compare_mode,"onUpdate:modelValue":l[300]||(l[300]=e=>Ve.full_sync_tree_compare_mode=e),label:"失效STRM对比模式",items:[{title:"内存集合",value:"memory"},{title:"路径哈希",value:"hash"},{title:"外部排序",value:"external"}],hint:"外部排序内存占用恒定，适合超大媒体库","persistent-hint":"",chips:"","closable-chips":""},null,8,["modelValue"])]),_:1})]),_:1})]),_:1})]),_:1})]),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-increment-sync"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.increment_sync_strm_enabled,"onUpdate:modelValue":l[31]||(l[31]=e=>Ve.increment_sync_strm_enabled=e),label:"启用",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(Vl,{modelValue:Ve.increment_sync_cron,"onUpdate:modelValue":l[32]||(l[32]=e=>Ve.increment_sync_cron=e),label:"运行增量同步周期",hint:"设置增量同步的执行周期","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.increment_sync_tree_compare_mode,"onUpdate:modelValue":l[301]||(l[301]=e=>Ve.increment_sync_tree_compare_mode=e),label:"目录树对比模式",items:[{title:"内存集合",value:"memory"},{title:"路径哈希",value:"hash"},{title:"外部排序",value:"external"}],hint:"外部排序内存占用恒定，适合超大媒体库","persistent-hint":"",chips:"","closable-chips":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ze,{modelValue:Ce.value,"onUpdate:modelValue":l[33]||(l[33]=e=>Ce.value=e),label:"STRM最小文件大小",hint:"小于此值的文件将不生成STRM(单位K,M,G)","persistent-hint":"",density:"compact",placeholder:"例如: 100M (可为空)",clearable:""},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.increment_sync_auto_download_mediainfo_enabled,"onUpdate:modelValue":l[34]||(l[34]=e=>Ve.increment_sync_auto_download_mediainfo_enabled=e),label:"下载媒体数据文件",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.increment_sync_scrape_metadata_enabled,"onUpdate:modelValue":l[35]||(l[35]=e=>Ve.increment_sync_scrape_metadata_enabled=e),label:"STRM自动刮削",color:"primary"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.increment_sync_media_server_refresh_enabled,"onUpdate:modelValue":l[36]||(l[36]=e=>Ve.increment_sync_media_server_refresh_enabled=e),label:"媒体服务器刷新",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.increment_sync_mediaservers,"onUpdate:modelValue":l[37]||(l[37]=e=>Ve.increment_sync_mediaservers=e),label:"媒体服务器",items:he.value,multiple:"",chips:"","closable-chips":""},null,8,["modelValue","items"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.increment_sync_local_manifest_enabled,"onUpdate:modelValue":l[310]||(l[310]=e=>Ve.increment_sync_local_manifest_enabled=e),label:"本地目录清单",hint:"记录本地目录状态，仅重新扫描有变化的目录","persistent-hint":"",color:"primary"},null,8,["modelValue"])]),_:1})]),_:1}),Ve.increment_sync_scrape_metadata_enabled?(d(),s(me,{key:0,class:"mt-2 mb-2"},{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",z,[(d(!0),_(m,null,u(Be.value,(e,a)=>(d(),_("div",{key:`increment-exclude-${a}`,class:"mb-2 d-flex align-center"},[t(ze,{modelValue:e.path,"onUpdate:modelValue":l=>e.path=l,label:"刮削排除目录",density:"compact",variant:"outlined",readonly:"","hide-details":"",class:"flex-grow-1 mr-2"},null,8,["modelValue","onUpdate:modelValue"]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>Pl(a,"increment_exclude"),disabled:!e.path},{default:n(()=>[t(ne,null,{default:n(()=>l[133]||(l[133]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick","disabled"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-folder-plus-outline",variant:"tonal",class:"mt-1 align-self-start",onClick:l[38]||(l[38]=e=>Sl("increment_sync_scrape_metadata_exclude_paths"))},{default:n(()=>l[134]||(l[134]=[r(" 添加刮削排除目录 ")])),_:1})]),t(re,{density:"compact",variant:"text",color:"info",class:"text-caption pa-0 mt-1"},{default:n(()=>l[135]||(l[135]=[r(" 此处添加的本地目录，在STRM文件生成后将不会自动触发刮削。 ")])),_:1})]),_:1})]),_:1})):c("",!0),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",M,[(d(!0),_(m,null,u($e.value,(e,a)=>(d(),_("div",{key:`increment-${a}`,class:"mb-2 d-flex align-center"},[o("div",S,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"本地STRM目录",density:"compact","append-icon":"mdi-folder","onClick:append":e=>dl(a,"local","incrementSync")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(ne,null,{default:n(()=>l[136]||(l[136]=[r("mdi-pound")])),_:1}),o("div",P,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"网盘媒体库目录",density:"compact","append-icon":"mdi-folder-network","onClick:append":e=>dl(a,"remote","incrementSync")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"incrementSync")},{default:n(()=>[t(ne,null,{default:n(()=>l[137]||(l[137]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[39]||(l[39]=e=>al("incrementSync"))},{default:n(()=>l[138]||(l[138]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[139]||(l[139]=[r(" 增量扫描配置的网盘目录，并在对应的本地目录生成STRM文件。"),o("br",null,null,-1),r(" 本地STRM目录：本地STRM文件生成路径 网盘媒体库目录：需要生成本地STRM文件的网盘媒体库路径 ")])),_:1})]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",R,[(d(!0),_(m,null,u(Ie.value,(e,a)=>(d(),_("div",{key:`increment-mp-${a}`,class:"mb-2 d-flex align-center"},[o("div",$,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"媒体库服务器映射目录",density:"compact"},null,8,["modelValue","onUpdate:modelValue"])]),t(ne,null,{default:n(()=>l[140]||(l[140]=[r("mdi-pound")])),_:1}),o("div",I,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"MP映射目录",density:"compact"},null,8,["modelValue","onUpdate:modelValue"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"increment-mp")},{default:n(()=>[t(ne,null,{default:n(()=>l[141]||(l[141]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[40]||(l[40]=e=>al("increment-mp"))},{default:n(()=>l[142]||(l[142]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[143]||(l[143]=[r(" 媒体服务器映射路径和MP映射路径不一样时请配置此项，如果不配置则无法正常刷新。"),o("br",null,null,-1),r(" 当映射路径一样时可省略此配置。 ")])),_:1})]),_:1})]),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-life"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.monitor_life_enabled,"onUpdate:modelValue":l[41]||(l[41]=e=>Ve.monitor_life_enabled=e),label:"启用",color:"info"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ue,{modelValue:Ve.monitor_life_event_modes,"onUpdate:modelValue":l[42]||(l[42]=e=>Ve.monitor_life_event_modes=e),label:"处理事件类型",items:[{title:"新增事件",value:"creata"},{title:"删除事件",value:"remove"},{title:"网盘整理",value:"transfer"}],multiple:"",chips:"","closable-chips":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.monitor_life_remove_mp_history,"onUpdate:modelValue":l[43]||(l[43]=e=>Ve.monitor_life_remove_mp_history=e),label:"同步删除历史记录",color:"warning",disabled:Ve.monitor_life_remove_mp_source},null,8,["modelValue","disabled"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.monitor_life_remove_mp_source,"onUpdate:modelValue":l[44]||(l[44]=e=>Ve.monitor_life_remove_mp_source=e),label:"同步删除源文件",color:"warning",onChange:l[45]||(l[45]=e=>{e&&(Ve.monitor_life_remove_mp_history=!0)})},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.monitor_life_media_server_refresh_enabled,"onUpdate:modelValue":l[46]||(l[46]=e=>Ve.monitor_life_media_server_refresh_enabled=e),label:"媒体服务器刷新",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"8"},{default:n(()=>[t(ue,{modelValue:Ve.monitor_life_mediaservers,"onUpdate:modelValue":l[47]||(l[47]=e=>Ve.monitor_life_mediaservers=e),label:"媒体服务器",items:he.value,multiple:"",chips:"","closable-chips":""},null,8,["modelValue","items"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.monitor_life_auto_download_mediainfo_enabled,"onUpdate:modelValue":l[48]||(l[48]=e=>Ve.monitor_life_auto_download_mediainfo_enabled=e),label:"下载媒体数据文件",color:"warning"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.monitor_life_scrape_metadata_enabled,"onUpdate:modelValue":l[49]||(l[49]=e=>Ve.monitor_life_scrape_metadata_enabled=e),label:"STRM自动刮削",color:"primary"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(ze,{modelValue:Te.value,"onUpdate:modelValue":l[50]||(l[50]=e=>Te.value=e),label:"STRM最小文件大小",hint:"小于此值的文件将不生成STRM(单位K,M,G)","persistent-hint":"",density:"compact",placeholder:"例如: 100M (可为空)",clearable:""},null,8,["modelValue"])]),_:1})]),_:1}),Ve.monitor_life_scrape_metadata_enabled?(d(),s(me,{key:0,class:"mt-2 mb-2"},{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",L,[(d(!0),_(m,null,u(Ne.value,(e,a)=>(d(),_("div",{key:`life-exclude-${a}`,class:"mb-2 d-flex align-center"},[t(ze,{modelValue:e.path,"onUpdate:modelValue":l=>e.path=l,label:"刮削排除目录",density:"compact",variant:"outlined",readonly:"","hide-details":"",class:"flex-grow-1 mr-2"},null,8,["modelValue","onUpdate:modelValue"]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>Pl(a,"life_exclude"),disabled:!e.path},{default:n(()=>[t(ne,null,{default:n(()=>l[144]||(l[144]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick","disabled"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-folder-plus-outline",variant:"tonal",class:"mt-1 align-self-start",onClick:l[51]||(l[51]=e=>Sl("monitor_life_scrape_metadata_exclude_paths"))},{default:n(()=>l[145]||(l[145]=[r(" 添加刮削排除目录 ")])),_:1})]),t(re,{density:"compact",variant:"text",color:"info",class:"text-caption pa-0 mt-1"},{default:n(()=>l[146]||(l[146]=[r(" 此处添加的本地目录，在115生活事件监控生成STRM后将不会自动触发刮削。 ")])),_:1})]),_:1})]),_:1})):c("",!0),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",q,[(d(!0),_(m,null,u(Le.value,(e,a)=>(d(),_("div",{key:`life-${a}`,class:"mb-2 d-flex align-center"},[o("div",E,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"本地STRM目录",density:"compact","append-icon":"mdi-folder","onClick:append":e=>dl(a,"local","monitorLife")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(ne,null,{default:n(()=>l[147]||(l[147]=[r("mdi-pound")])),_:1}),o("div",A,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"网盘媒体库目录",density:"compact","append-icon":"mdi-folder-network","onClick:append":e=>dl(a,"remote","monitorLife")},null,8,["modelValue","onUpdate:modelValue","onClick:append"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"monitorLife")},{default:n(()=>[t(ne,null,{default:n(()=>l[148]||(l[148]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[52]||(l[52]=e=>al("monitorLife"))},{default:n(()=>l[149]||(l[149]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[150]||(l[150]=[r(" 监控115生活（上传、移动、接收文件、删除、复制）事件，自动在本地对应目录生成STRM文件或者删除STRM文件。"),o("br",null,null,-1),r(" 本地STRM目录：本地STRM文件生成路径 网盘媒体库目录：需要生成本地STRM文件的网盘媒体库路径 ")])),_:1})]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",B,[(d(!0),_(m,null,u(qe.value,(e,a)=>(d(),_("div",{key:`life-mp-${a}`,class:"mb-2 d-flex align-center"},[o("div",N,[t(ze,{modelValue:e.local,"onUpdate:modelValue":l=>e.local=l,label:"媒体库服务器映射目录",density:"compact"},null,8,["modelValue","onUpdate:modelValue"])]),t(ne,null,{default:n(()=>l[151]||(l[151]=[r("mdi-pound")])),_:1}),o("div",j,[t(ze,{modelValue:e.remote,"onUpdate:modelValue":l=>e.remote=l,label:"MP映射目录",density:"compact"},null,8,["modelValue","onUpdate:modelValue"])]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>tl(a,"monitorLifeMp")},{default:n(()=>[t(ne,null,{default:n(()=>l[152]||(l[152]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:l[53]||(l[53]=e=>al("monitorLifeMp"))},{default:n(()=>l[153]||(l[153]=[r(" 添加路径 ")])),_:1})]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[154]||(l[154]=[r(" 媒体服务器映射路径和MP映射路径不一样时请配置此项，如果不配置则无法正常刷新。"),o("br",null,null,-1),r(" 当映射路径一样时可省略此配置。 ")])),_:1})]),_:1})]),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[155]||(l[155]=[r(" 注意：当 MoviePilot 主程序运行整理任务时 115生活事件 监控会自动暂停，整理运行完成后会继续监控。 ")])),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-cleanup"},{default:n(()=>[t(Me,null,{default:n(()=>[t(re,{type:"warning",variant:"tonal",density:"compact",class:"mb-4"},{default:n(()=>l[156]||(l[156]=[r(" 注意，清空 回收站/最近接收 后文件不可恢复，如果产生重要数据丢失本程序不负责！ ")])),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.clear_recyclebin_enabled,"onUpdate:modelValue":l[54]||(l[54]=e=>Ve.clear_recyclebin_enabled=e),label:"清空回收站",color:"error"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(se,{modelValue:Ve.clear_receive_path_enabled,"onUpdate:modelValue":l[55]||(l[55]=e=>Ve.clear_receive_path_enabled=e),label:"清空最近接收目录",color:"error"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(ze,{modelValue:Ve.password,"onUpdate:modelValue":l[56]||(l[56]=e=>Ve.password=e),label:"115访问密码",hint:"115网盘登录密码","persistent-hint":"",type:"password",density:"compact",variant:"outlined","hide-details":"auto"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"3"},{default:n(()=>[t(Vl,{modelValue:Ve.cron_clear,"onUpdate:modelValue":l[57]||(l[57]=e=>Ve.cron_clear=e),label:"清理周期",hint:"设置清理任务的执行周期","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-pan-transfer"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.pan_transfer_enabled,"onUpdate:modelValue":l[58]||(l[58]=e=>Ve.pan_transfer_enabled=e),label:"启用",color:"info"},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[o("div",K,[(d(!0),_(m,null,u(Ee.value,(e,a)=>(d(),_("div",{key:`pan-${a}`,class:"mb-2 d-flex align-center"},[t(ze,{modelValue:e.path,"onUpdate:modelValue":l=>e.path=l,label:"网盘待整理目录",density:"compact","append-icon":"mdi-folder-network","onClick:append":e=>dl(a,"remote","panTransfer"),class:"flex-grow-1"},null,8,["modelValue","onUpdate:modelValue","onClick:append"]),t(hl,{icon:"",size:"small",color:"error",class:"ml-2",onClick:e=>(e=>{Ee.value.splice(e,1),0===Ee.value.length&&(Ee.value=[{path:""}])})(a)},{default:n(()=>[t(ne,null,{default:n(()=>l[157]||(l[157]=[r("mdi-delete")])),_:1})]),_:2},1032,["onClick"])]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus",variant:"outlined",class:"mt-2 align-self-start",onClick:ol},{default:n(()=>l[158]||(l[158]=[r(" 添加路径 ")])),_:1})])]),_:1})]),_:1}),t(me,{class:"mt-4"},{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[t(ze,{modelValue:Ve.pan_transfer_unrecognized_path,"onUpdate:modelValue":l[59]||(l[59]=e=>Ve.pan_transfer_unrecognized_path=e),label:"网盘整理未识别目录",density:"compact","append-icon":"mdi-folder-network","onClick:append":l[60]||(l[60]=e=>dl("unrecognized","remote","panTransferUnrecognized"))},null,8,["modelValue"]),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[159]||(l[159]=[r(" 提示：此目录用于存放整理过程中未能识别的媒体文件。 ")])),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[160]||(l[160]=[r(" 注意：未识别目录不能设置在任何媒体库目录或待整理目录的内部。 ")])),_:1})]),_:1})]),_:1}),t(vl,{class:"my-3"}),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[161]||(l[161]=[r(" 使用本功能需要先进入 设定-目录 进行配置："),o("br",null,null,-1),r(" 1. 添加目录配置卡，按需配置媒体类型和媒体类别，资源存储选择115网盘，资源目录输入网盘待整理文件夹"),o("br",null,null,-1),r(" 2. 自动整理模式选择手动整理，媒体库存储依旧选择115网盘，并配置好媒体库路径，整理方式选择移动，按需配置分类、重命名、通知"),o("br",null,null,-1),r(" 3. 配置完成目录设置后只需要在上方 网盘待整理目录 填入 网盘待整理文件夹 即可"),o("br",null,null,-1)])),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[162]||(l[162]=[r(" 注意：配置目录时不能选择刮削元数据，否则可能导致风控！ ")])),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[163]||(l[163]=[r(" 注意："),o("br",null,null,-1),r(" 1. 阿里云盘，115网盘分享链接秒传或转存都依赖于网盘整理"),o("br",null,null,-1),r(" 2. TG/Slack资源搜索转存也依赖于网盘整理"),o("br",null,null,-1),r(" 3. 当阿里云盘分享秒传未能识别分享媒体信息时，会自动将资源转存到网盘整理未识别目录，后续需要用户手动重命名整理 ")])),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[164]||(l[164]=[r(" 注意：115生活事件监控默认会忽略网盘整理触发的移动事件，所以推荐使用MP整理事件监控生成STRM ")])),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-directory-upload"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.directory_upload_enabled,"onUpdate:modelValue":l[61]||(l[61]=e=>Ve.directory_upload_enabled=e),label:"启用",color:"info",density:"compact","hide-details":""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"8"},{default:n(()=>[t(ue,{modelValue:Ve.directory_upload_mode,"onUpdate:modelValue":l[62]||(l[62]=e=>Ve.directory_upload_mode=e),label:"监控模式",items:[{title:"兼容模式",value:"compatibility"},{title:"性能模式",value:"fast"}],chips:"","closable-chips":"",density:"compact","hide-details":""},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.directory_upload_uploadext,"onUpdate:modelValue":l[63]||(l[63]=e=>Ve.directory_upload_uploadext=e),label:"上传文件扩展名",hint:"指定哪些扩展名的文件会被上传到115网盘，多个用逗号分隔","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.directory_upload_copyext,"onUpdate:modelValue":l[64]||(l[64]=e=>Ve.directory_upload_copyext=e),label:"复制文件扩展名",hint:"指定哪些扩展名的文件会被复制到本地目标目录，多个用逗号分隔","persistent-hint":"",density:"compact",variant:"outlined","hide-details":"auto"},null,8,["modelValue"])]),_:1})]),_:1}),t(vl,{class:"my-3"}),l[170]||(l[170]=o("div",{class:"text-subtitle-2 mb-2"},"路径配置:",-1)),(d(!0),_(m,null,u(je.value,(e,a)=>(d(),_("div",{key:`upload-${a}`,class:"path-group mb-3 pa-2 border rounded"},[t(me,{dense:""},{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:e.src,"onUpdate:modelValue":l=>e.src=l,label:"本地监控目录",density:"compact",variant:"outlined","hide-details":"","append-icon":"mdi-folder-search-outline","onClick:append":e=>dl(a,"local","directoryUpload","src")},{"prepend-inner":n(()=>[t(ne,{color:"blue"},{default:n(()=>l[165]||(l[165]=[r("mdi-folder-table")])),_:1})]),_:2},1032,["modelValue","onUpdate:modelValue","onClick:append"])]),_:2},1024),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:e.dest_remote,"onUpdate:modelValue":l=>e.dest_remote=l,label:"网盘上传目标目录",density:"compact",variant:"outlined","hide-details":"","append-icon":"mdi-folder-network-outline","onClick:append":e=>dl(a,"remote","directoryUpload","dest_remote")},{"prepend-inner":n(()=>[t(ne,{color:"green"},{default:n(()=>l[166]||(l[166]=[r("mdi-cloud-upload")])),_:1})]),_:2},1032,["modelValue","onUpdate:modelValue","onClick:append"])]),_:2},1024)]),_:2},1024),t(me,{dense:"",class:"mt-1"},{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:e.dest_local,"onUpdate:modelValue":l=>e.dest_local=l,label:"本地复制目标目录 (可选)",density:"compact",variant:"outlined","hide-details":"","append-icon":"mdi-folder-plus-outline","onClick:append":e=>dl(a,"local","directoryUpload","dest_local")},{"prepend-inner":n(()=>[t(ne,{color:"orange"},{default:n(()=>l[167]||(l[167]=[r("mdi-content-copy")])),_:1})]),_:2},1032,["modelValue","onUpdate:modelValue","onClick:append"])]),_:2},1024),t(ce,{cols:"12",md:"4",class:"d-flex align-center"},{default:n(()=>[t(se,{modelValue:e.delete,"onUpdate:modelValue":l=>e.delete=l,label:"处理后删除源文件",color:"error",density:"compact","hide-details":""},null,8,["modelValue","onUpdate:modelValue"])]),_:2},1024),t(ce,{cols:"12",md:"2",class:"d-flex align-center justify-end"},{default:n(()=>[t(hl,{icon:"mdi-delete-outline",size:"small",color:"error",variant:"text",title:"删除此路径配置",onClick:e=>tl(a,"directoryUpload")},null,8,["onClick"])]),_:2},1024)]),_:2},1024)]))),128)),t(hl,{size:"small","prepend-icon":"mdi-plus-box-multiple-outline",variant:"tonal",class:"mt-2",color:"primary",onClick:l[65]||(l[65]=e=>al("directoryUpload"))},{default:n(()=>l[168]||(l[168]=[r(" 添加监控路径组 ")])),_:1}),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-3 text-caption"},{default:n(()=>l[169]||(l[169]=[o("strong",null,"功能说明:",-1),o("br",null,null,-1),r(' - 监控指定的"本地监控目录"。'),o("br",null,null,-1),r(" - 当目录中出现新文件时："),o("br",null,null,-1),r('   - 如果文件扩展名匹配"上传文件扩展名"，则将其上传到对应的"网盘上传目标目录"。'),o("br",null,null,-1),r('   - 如果文件扩展名匹配"复制文件扩展名"，则将其复制到对应的"本地复制目标目录"。'),o("br",null,null,-1),r(' - 处理完成后，如果"删除源文件"开关打开，则会删除原始文件。'),o("br",null,null,-1),r(" - 扩展名不匹配的文件将被忽略。"),o("br",null,null,-1),o("strong",null,"注意:",-1),o("br",null,null,-1),r(" - 请确保MoviePilot对本地目录有读写权限，对网盘目录有写入权限。"),o("br",null,null,-1),r(' - "本地复制目标目录"是可选的，如果不填，则仅执行上传操作（如果匹配）。'),o("br",null,null,-1),r(' - 监控模式："兼容模式"适用于Docker或网络共享目录（如SMB），性能较低；"性能模式"仅适用于物理路径，性能较高。 ')])),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-tg-search"},{default:n(()=>[t(Me,null,{default:n(()=>[t(Ze,{variant:"outlined",class:"mb-6"},{default:n(()=>[t($l,null,{default:n(()=>[t(ie,{class:"d-flex align-center"},{default:n(()=>[t(ne,{start:""},{default:n(()=>l[171]||(l[171]=[r("mdi-cog-outline")])),_:1}),l[172]||(l[172]=o("span",{class:"text-h6"},"Nullbr 搜索配置",-1))]),_:1})]),_:1}),t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.nullbr_app_id,"onUpdate:modelValue":l[66]||(l[66]=e=>Ve.nullbr_app_id=e),label:"Nullbr APP ID",hint:"从 Nullbr 官网申请","persistent-hint":"",density:"compact",variant:"outlined"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.nullbr_api_key,"onUpdate:modelValue":l[67]||(l[67]=e=>Ve.nullbr_api_key=e),label:"Nullbr API KEY",hint:"从 Nullbr 官网申请","persistent-hint":"",density:"compact",variant:"outlined"},null,8,["modelValue"])]),_:1})]),_:1})]),_:1})]),_:1}),t(Ze,{variant:"outlined"},{default:n(()=>[t($l,null,{default:n(()=>[t(ie,{class:"d-flex align-center"},{default:n(()=>[t(ne,{start:""},{default:n(()=>l[173]||(l[173]=[r("mdi-telegram")])),_:1}),l[174]||(l[174]=o("span",{class:"text-h6"},"自定义Telegram频道",-1))]),_:1})]),_:1}),t(Me,null,{default:n(()=>[(d(!0),_(m,null,u(De.value,(e,a)=>(d(),_("div",{key:a,class:"d-flex align-center mb-4"},[t(ze,{modelValue:e.name,"onUpdate:modelValue":l=>e.name=l,label:"频道名称",placeholder:"例如：爱影115资源分享频道",density:"compact",variant:"outlined","hide-details":"",class:"mr-3"},null,8,["modelValue","onUpdate:modelValue"]),t(ze,{modelValue:e.id,"onUpdate:modelValue":l=>e.id=l,label:"频道ID",placeholder:"例如：ayzgzf",density:"compact",variant:"outlined","hide-details":"",class:"mr-3"},null,8,["modelValue","onUpdate:modelValue"]),t(hl,{icon:"",size:"small",color:"error",variant:"tonal",onClick:e=>(e=>{De.value.splice(e,1),0===De.value.length&&De.value.push({name:"",id:""})})(a),title:"删除此频道"},{default:n(()=>[t(ne,null,{default:n(()=>l[175]||(l[175]=[r("mdi-delete-outline")])),_:1})]),_:2},1032,["onClick"])]))),128)),o("div",O,[t(hl,{size:"small","prepend-icon":"mdi-plus-circle-outline",variant:"tonal",color:"primary",onClick:Ge},{default:n(()=>l[176]||(l[176]=[r(" 添加频道 ")])),_:1}),t(hl,{size:"small","prepend-icon":"mdi-import",variant:"tonal",onClick:nl},{default:n(()=>l[177]||(l[177]=[r(" 一键导入 ")])),_:1})])]),_:1})]),_:1}),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-6 text-caption"},{default:n(()=>l[178]||(l[178]=[o("strong",null,"Telegram频道搜索功能说明",-1),o("br",null,null,-1),r(" - 您可以同时配置 Nullbr 和下方的自定义频道列表。"),o("br",null,null,-1),r(" - 系统会整合两者的搜索结果，为您提供更广泛的资源范围。 ")])),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-same-playback"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.same_playback,"onUpdate:modelValue":l[68]||(l[68]=e=>Ve.same_playback=e),label:"启用",color:"info",density:"compact","hide-details":""},null,8,["modelValue"])]),_:1})]),_:1}),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-3 text-caption"},{default:n(()=>l[179]||(l[179]=[o("strong",null,"多设备同步播放",-1),o("br",null,null,-1),r(" • 支持多个设备同时播放同一影片 ")])),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-2"},{default:n(()=>l[180]||(l[180]=[o("strong",null,"使用限制",-1),o("br",null,null,-1),r(" • 最多支持双IP同时播放"),o("br",null,null,-1),r(" • 禁止多IP滥用"),o("br",null,null,-1),r(" • 违规操作可能导致账号封禁 ")])),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-data-enhancement"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.error_info_upload,"onUpdate:modelValue":l[69]||(l[69]=e=>Ve.error_info_upload=e),label:"错误信息上传",color:"info",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.upload_module_enhancement,"onUpdate:modelValue":l[70]||(l[70]=e=>Ve.upload_module_enhancement=e),label:"上传模块增强",color:"info",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.transfer_module_enhancement,"onUpdate:modelValue":l[71]||(l[71]=e=>Ve.transfer_module_enhancement=e),label:"整理模块增强",color:"info",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.upload_share_info,"onUpdate:modelValue":l[72]||(l[72]=e=>Ve.upload_share_info=e),label:"上传分享链接",color:"info",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"4"},{default:n(()=>[t(se,{modelValue:Ve.upload_offline_info,"onUpdate:modelValue":l[73]||(l[73]=e=>Ve.upload_offline_info=e),label:"上传离线下载链接",color:"info",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"4",class:"d-flex align-center"},{default:n(()=>[t(hl,{onClick:Xe,size:"small","prepend-icon":"mdi-identifier"},{default:n(()=>l[181]||(l[181]=[r("显示设备ID")])),_:1})]),_:1})]),_:1}),Oe.value?(d(),s(me,{key:0},{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[t(ze,{modelValue:Oe.value,"onUpdate:modelValue":l[74]||(l[74]=e=>Oe.value=e),label:"Machine ID",readonly:"",density:"compact",variant:"outlined","hide-details":"auto"},null,8,["modelValue"])]),_:1})]),_:1})):c("",!0),t(Rl,{variant:"tonal",class:"mt-6"},{default:n(()=>[t(Cl,null,{default:n(()=>[t(xl,null,{default:n(()=>[t(ne,{icon:"mdi-tune-variant",class:"mr-2"}),l[182]||(l[182]=r(" 上传模块增强配置 "))]),_:1}),t(kl,{class:"pa-4"},{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.upload_module_wait_time,"onUpdate:modelValue":l[75]||(l[75]=e=>Ve.upload_module_wait_time=e),modelModifiers:{number:!0},label:"秒传休眠等待时间（单位秒）",type:"number",hint:"秒传休眠等待时间（单位秒）","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:Ve.upload_module_wait_timeout,"onUpdate:modelValue":l[76]||(l[76]=e=>Ve.upload_module_wait_timeout=e),modelModifiers:{number:!0},label:"秒传最长等待时间（单位秒）",type:"number",hint:"秒传最长等待时间（单位秒）","persistent-hint":"",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1}),t(me,null,{default:n(()=>[t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:ke.value,"onUpdate:modelValue":l[77]||(l[77]=e=>ke.value=e),label:"跳过等待秒传的文件大小阈值",hint:"文件小于此值将跳过等待秒传（单位支持K，M，G）","persistent-hint":"",density:"compact",placeholder:"例如: 5M, 1.5G (可为空)",clearable:""},null,8,["modelValue"])]),_:1}),t(ce,{cols:"12",md:"6"},{default:n(()=>[t(ze,{modelValue:we.value,"onUpdate:modelValue":l[78]||(l[78]=e=>we.value=e),label:"强制等待秒传的文件大小阈值",hint:"文件大于此值将强制等待秒传（单位支持K，M，G）","persistent-hint":"",density:"compact",placeholder:"例如: 5M, 1.5G (可为空)",clearable:""},null,8,["modelValue"])]),_:1})]),_:1})]),_:1})]),_:1})]),_:1}),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-3 text-caption"},{default:n(()=>l[183]||(l[183]=[o("strong",null,"115上传增强有效范围：",-1),o("br",null,null,-1),r(" 此功能开启后，将对整个MoviePilot系统内所有调用115网盘上传的功能生效。 ")])),_:1}),t(re,{type:"warning",variant:"tonal",density:"compact",class:"mt-3 text-caption"},{default:n(()=>l[184]||(l[184]=[o("strong",null,"风险与免责声明",-1),o("br",null,null,-1),r(" - 插件程序内包含可选的Sentry分析组件，详见"),o("a",{href:"https://sentry.io/privacy/",target:"_blank",style:{color:"inherit","text-decoration":"underline"}},"Sentry Privacy Policy",-1),r("。"),o("br",null,null,-1),r(" - 插件程序将在必要时上传错误信息及运行环境信息。"),o("br",null,null,-1),r(" - 插件程序将记录程序运行重要节点并保存追踪数据至少72小时。 ")])),_:1})]),_:1})]),_:1}),t(gl,{value:"tab-advanced-configuration"},{default:n(()=>[t(Me,null,{default:n(()=>[t(me,null,{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[t(Il,{modelValue:Ve.strm_url_mode_custom,"onUpdate:modelValue":l[79]||(l[79]=e=>Ve.strm_url_mode_custom=e),label:"自定义STRM URL格式",variant:"outlined",rows:"5","persistent-hint":"",hint:"为特定文件扩展名指定URL格式，优先级高于基础设置。格式：ext1,ext2 => format",placeholder:"例如：\niso => pickname\nmp4,mkv => pickcode",clearable:""},null,8,["modelValue"])]),_:1})]),_:1}),t(re,{type:"info",variant:"tonal",density:"compact",class:"mt-2 text-caption"},{default:n(()=>l[185]||(l[185]=[o("strong",null,"格式说明:",-1),o("br",null,null,-1),r(" - 每行一条规则，格式为：`文件后缀 => URL格式`。"),o("br",null,null,-1),r(" - 左侧为文件扩展名(不含`.`)，多个后缀用英文逗号(`,`)分隔。"),o("br",null,null,-1),r(" - 右侧为URL格式，可选值为 `pickcode` 或 `pickname`。"),o("br",null,null,-1),r(" - 此处未指定的扩展名将使用 “基础设置” 中的 “STRM文件URL格式” 配置。"),o("br",null,null,-1),r(" - "),o("strong",null,"示例:",-1),o("br",null,null,-1),r("   "),o("code",null,"iso => pickname",-1),r(" (iso文件使用 pickcode+name 格式)"),o("br",null,null,-1),r("   "),o("code",null,"mp4,mkv,ts => pickcode",-1),r(" (mp4, mkv, ts 文件使用 pickcode 格式) ")])),_:1}),t(me,{class:"mt-4"},{default:n(()=>[t(ce,{cols:"12"},{default:n(()=>[t(Ll,{modelValue:Ve.strm_generate_blacklist,"onUpdate:modelValue":l[80]||(l[80]=e=>Ve.strm_generate_blacklist=e),label:"STRM文件关键词过滤黑名单",hint:"输入关键词后按回车确认，可添加多个。包含这些词的视频文件将不会生成STRM文件。","persistent-hint":"",multiple:"",chips:"","closable-chips":"",variant:"outlined",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1})]),_:1})]),_:1})]),_:1},8,["modelValue"])]),_:1})]))]),_:1}),t(Al,{class:"px-3 py-2 d-flex",style:{"flex-shrink":"0"}},{default:n(()=>[t(hl,{color:"warning",variant:"text",onClick:l[82]||(l[82]=e=>_e("switch")),size:"small","prepend-icon":"mdi-arrow-left"},{default:n(()=>l[186]||(l[186]=[r(" 返回 ")])),_:1}),t(El),t(hl,{color:"warning",variant:"text",onClick:l[83]||(l[83]=e=>Ke.value=!0),size:"small","prepend-icon":"mdi-sync"},{default:n(()=>l[187]||(l[187]=[r(" 全量同步 ")])),_:1}),t(hl,{color:"success",variant:"text",onClick:Qe,loading:fe.value,size:"small","prepend-icon":"mdi-content-save"},{default:n(()=>l[188]||(l[188]=[r(" 保存配置 ")])),_:1},8,["loading"])]),_:1})]),_:1}),t(Bl,{modelValue:Ke.value,"onUpdate:modelValue":l[85]||(l[85]=e=>Ke.value=e),"max-width":"450",persistent:""},{default:n(()=>[t(Ze,null,{default:n(()=>[t(ie,{class:"text-h6 d-flex align-center"},{default:n(()=>[t(ne,{icon:"mdi-alert-circle-outline",color:"warning",class:"mr-2"}),l[189]||(l[189]=r(" 确认操作 "))]),_:1}),t(Me,null,{default:n(()=>l[190]||(l[190]=[r(" 您确定要立即执行全量同步吗？ ")])),_:1}),t(Al,null,{default:n(()=>[t(El),t(hl,{color:"grey",variant:"text",onClick:l[84]||(l[84]=e=>Ke.value=!1),disabled:ye.value},{default:n(()=>l[191]||(l[191]=[r(" 取消 ")])),_:1},8,["disabled"]),t(hl,{color:"warning",variant:"text",onClick:el,loading:ye.value},{default:n(()=>l[192]||(l[192]=[r(" 确认执行 ")])),_:1},8,["loading"])]),_:1})]),_:1})]),_:1},8,["modelValue"]),t(Bl,{modelValue:Je.show,"onUpdate:modelValue":l[87]||(l[87]=e=>Je.show=e),"max-width":"800"},{default:n(()=>[t(Ze,null,{default:n(()=>[t(ie,{class:"text-subtitle-1 d-flex align-center px-3 py-2 bg-primary-lighten-5"},{default:n(()=>[t(ne,{icon:Je.isLocal?"mdi-folder-search":"mdi-folder-network",class:"mr-2",color:"primary"},null,8,["icon"]),o("span",null,i(Je.isLocal?"选择本地目录":"选择网盘目录"),1)]),_:1}),t(Me,{class:"px-3 py-2"},{default:n(()=>[Je.loading?(d(),_("div",D,[t(Nl,{indeterminate:"",color:"primary"})])):(d(),_("div",G,[t(ze,{modelValue:Je.currentPath,"onUpdate:modelValue":l[86]||(l[86]=e=>Je.currentPath=e),label:"当前路径",variant:"outlined",density:"compact",class:"mb-2",onKeyup:p(sl,["enter"])},null,8,["modelValue"]),t(Dl,{class:"border rounded","max-height":"300px","overflow-y":"auto"},{default:n(()=>["/"!==Je.currentPath&&"C:\\"!==Je.currentPath&&"C:/"!==Je.currentPath?(d(),s(Ol,{key:0,onClick:cl,class:"py-1"},{prepend:n(()=>[t(ne,{icon:"mdi-arrow-up",size:"small",class:"mr-2",color:"grey"})]),default:n(()=>[t(jl,{class:"text-body-2"},{default:n(()=>l[193]||(l[193]=[r("上级目录")])),_:1}),t(Kl,null,{default:n(()=>l[194]||(l[194]=[r("..")])),_:1})]),_:1})):c("",!0),(d(!0),_(m,null,u(Je.items,(e,l)=>(d(),s(Ol,{key:l,onClick:l=>(e=>{e&&e.is_dir&&e.path&&(Je.currentPath=e.path,sl())})(e),disabled:!e.is_dir,class:"py-1"},{prepend:n(()=>[t(ne,{icon:e.is_dir?"mdi-folder":"mdi-file",size:"small",class:"mr-2",color:e.is_dir?"amber-darken-2":"blue"},null,8,["icon","color"])]),default:n(()=>[t(jl,{class:"text-body-2"},{default:n(()=>[r(i(e.name),1)]),_:2},1024)]),_:2},1032,["onClick","disabled"]))),128)),Je.items.length?c("",!0):(d(),s(Ol,{key:1,class:"py-2 text-center"},{default:n(()=>[t(jl,{class:"text-body-2 text-grey"},{default:n(()=>l[195]||(l[195]=[r("该目录为空或访问受限")])),_:1})]),_:1}))]),_:1})])),Je.error?(d(),s(re,{key:2,type:"error",density:"compact",class:"mt-2 text-caption",variant:"tonal"},{default:n(()=>[r(i(Je.error),1)]),_:1})):c("",!0)]),_:1}),t(Al,{class:"px-3 py-2"},{default:n(()=>[t(El),t(hl,{color:"primary",onClick:ul,disabled:!Je.currentPath||Je.loading,variant:"text",size:"small"},{default:n(()=>l[196]||(l[196]=[r(" 选择当前目录 ")])),_:1},8,["disabled"]),t(hl,{color:"grey",onClick:ml,variant:"text",size:"small"},{default:n(()=>l[197]||(l[197]=[r(" 取消 ")])),_:1})]),_:1})]),_:1})]),_:1},8,["modelValue"]),t(Bl,{modelValue:We.show,"onUpdate:modelValue":l[89]||(l[89]=e=>We.show=e),"max-width":"450"},{default:n(()=>[t(Ze,null,{default:n(()=>[t(ie,{class:"text-subtitle-1 d-flex align-center px-3 py-2 bg-primary-lighten-5"},{default:n(()=>[t(ne,{icon:"mdi-qrcode",class:"mr-2",color:"primary",size:"small"}),l[198]||(l[198]=o("span",null,"115网盘扫码登录",-1))]),_:1}),t(Me,{class:"text-center py-4"},{default:n(()=>[We.error?(d(),s(re,{key:0,type:"error",density:"compact",class:"mb-3 mx-3",variant:"tonal",closable:""},{default:n(()=>[r(i(We.error),1)]),_:1})):c("",!0),We.loading?(d(),_("div",F,[t(Nl,{indeterminate:"",color:"primary",class:"mb-3"}),l[199]||(l[199]=o("div",null,"正在获取二维码...",-1))])):We.qrcode?(d(),_("div",J,[l[202]||(l[202]=o("div",{class:"mb-2 font-weight-medium"},"请选择扫码方式",-1)),t(Fl,{modelValue:We.clientType,"onUpdate:modelValue":l[88]||(l[88]=e=>We.clientType=e),class:"mb-3",mandatory:"","selected-class":"primary"},{default:n(()=>[(d(),_(m,null,u(He,e=>t(Gl,{key:e.value,value:e.value,variant:"outlined",color:"primary",size:"small"},{default:n(()=>[r(i(e.label),1)]),_:2},1032,["value"])),64))]),_:1},8,["modelValue"]),o("div",W,[t(Ze,{flat:"",class:"border pa-2 mb-2"},{default:n(()=>[o("img",{src:We.qrcode,width:"220",height:"220"},null,8,H)]),_:1}),o("div",Y,i(We.tips),1),o("div",Z,i(We.status),1)]),t(hl,{color:"primary",variant:"tonal",onClick:Tl,size:"small",class:"mb-2"},{default:n(()=>[t(ne,{left:"",size:"small",class:"mr-1"},{default:n(()=>l[200]||(l[200]=[r("mdi-refresh")])),_:1}),l[201]||(l[201]=r("刷新二维码 "))]),_:1})])):(d(),_("div",Q,[t(ne,{icon:"mdi-qrcode-off",size:"64",color:"grey",class:"mb-3"}),l[204]||(l[204]=o("div",{class:"text-subtitle-1"},"二维码获取失败",-1)),l[205]||(l[205]=o("div",{class:"text-body-2 text-grey"},"请点击刷新按钮重试",-1)),o("div",X,[t(ne,{icon:"mdi-alert-circle",size:"small",class:"mr-1 text-warning"}),l[203]||(l[203]=r(" 如果多次获取失败，请检查网络连接 "))])]))]),_:1}),t(vl),t(Al,{class:"px-3 py-2"},{default:n(()=>[t(hl,{color:"grey",variant:"text",onClick:zl,size:"small","prepend-icon":"mdi-close"},{default:n(()=>l[206]||(l[206]=[r("关闭")])),_:1}),t(El),t(hl,{color:"primary",variant:"text",onClick:Tl,disabled:We.loading,size:"small","prepend-icon":"mdi-refresh"},{default:n(()=>l[207]||(l[207]=[r(" 刷新二维码 ")])),_:1},8,["disabled"])]),_:1})]),_:1})]),_:1},8,["modelValue"]),t(Bl,{modelValue:Ye.show,"onUpdate:modelValue":l[90]||(l[90]=e=>Ye.show=e),"max-width":"450"},{default:n(()=>[t(Ze,null,{default:n(()=>[t(ie,{class:"text-subtitle-1 d-flex align-center px-3 py-2 bg-primary-lighten-5"},{default:n(()=>[t(ne,{icon:"mdi-qrcode",class:"mr-2",color:"primary",size:"small"}),l[208]||(l[208]=o("span",null,"阿里云盘扫码登录",-1))]),_:1}),t(Me,{class:"text-center py-4"},{default:n(()=>[Ye.error?(d(),s(re,{key:0,type:"error",density:"compact",class:"mb-3 mx-3",variant:"tonal",closable:""},{default:n(()=>[r(i(Ye.error),1)]),_:1})):c("",!0),Ye.loading?(d(),_("div",ee,[t(Nl,{indeterminate:"",color:"primary",class:"mb-3"}),l[209]||(l[209]=o("div",null,"正在获取二维码...",-1))])):Ye.qrcode?(d(),_("div",le,[t(Ze,{flat:"",class:"border pa-2 mb-2"},{default:n(()=>[o("img",{src:Ye.qrcode,width:"220",height:"220"},null,8,ae)]),_:1}),l[210]||(l[210]=o("div",{class:"text-body-2 text-grey mb-1"},"请使用阿里云盘App扫描二维码",-1)),o("div",te,i(Ye.status),1)])):(d(),_("div",oe,[t(ne,{icon:"mdi-qrcode-off",size:"64",color:"grey",class:"mb-3"}),l[211]||(l[211]=o("div",{class:"text-subtitle-1"},"二维码获取失败",-1)),l[212]||(l[212]=o("div",{class:"text-body-2 text-grey"},"请点击刷新按钮重试",-1))]))]),_:1}),t(vl),t(Al,{class:"px-3 py-2"},{default:n(()=>[t(hl,{color:"grey",variant:"text",onClick:Ul,size:"small","prepend-icon":"mdi-close"},{default:n(()=>l[213]||(l[213]=[r("关闭")])),_:1}),t(El),t(hl,{color:"primary",variant:"text",onClick:wl,disabled:Ye.loading,size:"small","prepend-icon":"mdi-refresh"},{default:n(()=>l[214]||(l[214]=[r(" 刷新 ")])),_:1},8,["disabled"])]),_:1})]),_:1})]),_:1},8,["modelValue"]),t(Bl,{modelValue:Fe.show,"onUpdate:modelValue":l[92]||(l[92]=e=>Fe.show=e),"max-width":"600",persistent:""},{default:n(()=>[t(Ze,null,{default:n(()=>[t(ie,{class:"text-subtitle-1 d-flex align-center px-3 py-2 bg-primary-lighten-5"},{default:n(()=>[t(ne,{icon:"mdi-import",class:"mr-2",color:"primary",size:"small"}),l[215]||(l[215]=o("span",null,"一键导入频道配置",-1))]),_:1}),t(Me,{class:"py-4"},{default:n(()=>[Fe.error?(d(),s(re,{key:0,type:"error",density:"compact",class:"mb-3",variant:"tonal",closable:""},{default:n(()=>[r(i(Fe.error),1)]),_:1})):c("",!0),l[216]||(l[216]=o("p",{class:"text-caption mb-2 text-grey-darken-1"},[r(" 请在此处粘贴JSON格式的频道列表。格式应为："),o("br"),o("code",null,'[{"name":"名称1", "id":"id1"}, {"name":"名称2", "id":"id2"}]')],-1)),t(Il,{modelValue:Fe.jsonText,"onUpdate:modelValue":l[91]||(l[91]=e=>Fe.jsonText=e),label:"频道配置JSON",variant:"outlined",rows:"8","auto-grow":"","hide-details":"auto",placeholder:'[{"name":"Lsp115","id":"Lsp115"}]'},null,8,["modelValue"])]),_:1}),t(vl),t(Al,{class:"px-3 py-2"},{default:n(()=>[t(El),t(hl,{color:"grey",variant:"text",onClick:il,size:"small"},{default:n(()=>l[217]||(l[217]=[r(" 取消 ")])),_:1}),t(hl,{color:"primary",variant:"text",onClick:rl,size:"small"},{default:n(()=>l[218]||(l[218]=[r(" 确认导入 ")])),_:1})]),_:1})]),_:1})]),_:1},8,["modelValue"])])}}},[["__scopeId","data-v-d1a9dc16"]]);export{me as default};
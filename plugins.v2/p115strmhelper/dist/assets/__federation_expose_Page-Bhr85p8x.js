@@ -1 +0,0 @@
-import{importShared as e}from"./__federation_fn_import-B6DyUTOO.js";import{_ as l}from"./_plugin-vue_export-helper-BCo6x5W8.js";const{resolveComponent:a,createVNode:t,createElementVNode:i,withCtx:n,toDisplayString:s,createTextVNode:o,openBlock:r,createBlock:c,createCommentVNode:d,createElementBlock:u,renderList:m,Fragment:p,normalizeClass:f,mergeProps:_,withKeys:g}=await e("vue"),y={class:"plugin-page"},h={key:3,class:"my-1"},v={key:1},b={class:"path-mapping-item pa-2 border rounded-sm",style:{"background-color":"rgba(var(--v-theme-on-surface), 0.02)"}},x=["title"],k={class:"text-caption",style:{"line-height":"1.2"}},C=["title"],w={class:"text-caption",style:{"line-height":"1.2"}},P={key:1,class:"text-caption text-error mt-1"},z={class:"path-mapping-item pa-2 border rounded-sm",style:{"background-color":"rgba(var(--v-theme-on-surface), 0.02)"}},V=["title"],M={class:"text-caption",style:{"line-height":"1.2"}},$=["title"],E={class:"text-caption",style:{"line-height":"1.2"}},T={key:1,class:"text-caption text-error mt-1"},U={class:"path-mapping-item pa-2 border rounded-sm",style:{"background-color":"rgba(var(--v-theme-on-surface), 0.02)"}},L=["title"],S={class:"text-caption",style:{"line-height":"1.2"}},F=["title"],B={class:"text-caption",style:{"line-height":"1.2"}},I={key:1,class:"text-caption text-error mt-1"},j={class:"path-mapping-item pa-2 border rounded-sm",style:{"background-color":"rgba(var(--v-theme-on-surface), 0.02)"}},O=["title"],H={class:"text-caption",style:{"line-height":"1.2"}},R=["title"],N={class:"text-caption",style:{"line-height":"1.2"}},A={key:1,class:"text-caption text-error mt-1"},W={class:"path-item pa-2 border rounded-sm",style:{"background-color":"rgba(var(--v-theme-on-surface), 0.02)"}},K={class:"d-flex align-center"},G=["title"],q={class:"text-caption",style:{"line-height":"1.2"}},D={key:1,class:"text-caption text-error mt-1"},Z={class:"path-group-item pa-2 border rounded-sm",style:{"background-color":"rgba(var(--v-theme-on-surface), 0.02)"}},J=["title"],Q={class:"text-caption",style:{"line-height":"1.2"}},X=["title"],Y={class:"text-caption",style:{"line-height":"1.2"}},ee={key:0,class:"mt-1 pt-1",style:{"border-top":"1px dashed rgba(var(--v-border-color), 0.2)"}},le={key:0,class:"d-flex align-center"},ae=["title"],te={class:"text-caption",style:{"line-height":"1.2"}},ie={key:1,class:"text-caption text-error mt-1"},ne={class:"d-flex"},se={class:"text-body-2"},oe={class:"d-flex"},re={class:"text-body-2"},ce={class:"d-flex align-center",style:{gap:"4px"}},de={style:{"overflow-x":"auto"}},ue={class:"d-flex align-center"},me={class:"text-no-wrap text-caption font-weight-medium",style:{"min-width":"40px","text-align":"right"}},pe={class:"pa-3"},fe={class:"d-flex justify-end mt-3"},_e={key:0,class:"d-flex justify-center my-3"},ge={key:1},{ref:ye,reactive:he,computed:ve,onMounted:be,watch:xe}=await e("vue"),ke=l({__name:"Page",props:{api:{type:[Object,Function],required:!0},initialConfig:{type:Object,default:()=>({})}},emits:["close","switch","update:config","action"],setup(e,{emit:l}){const ke=e,Ce=l,we=ye(!0),Pe=ye(!1),ze=ye(!1),Ve=ye(!1),Me=ye(!1),$e=ye(!1),Ee=ye(null),Te=ye(null),Ue=ye("info"),Le=ye(!1),Se=ye(!1),Fe=ye(!1),Be=he({enabled:!1,has_client:!1,running:!1}),Ie=he({name:null,is_vip:null,is_forever_vip:null,vip_expire_date:null,avatar:null,error:null,loading:!0}),je=he({total:null,used:null,remaining:null,error:null,loading:!0}),Oe=he({show:!1,activeTab:"tasks",loading:!1,adding:!1,error:null,addError:null,tasks:[],totalTasks:0,itemsPerPage:10,headers:[{title:"文件名",key:"name",align:"start",sortable:!1},{title:"大小",key:"size_text",align:"end",sortable:!1,cellProps:{class:"text-no-wrap"},minWidth:"110px"},{title:"状态",key:"status_text",align:"center",sortable:!1},{title:"进度",key:"progress",align:"start",sortable:!1,minWidth:"160px"}],links:"",destPath:""}),He=(e,l)=>{if(!e||!l)return 0;const a=e=>{if(!e||"string"!=typeof e)return 0;const l=parseFloat(e);return isNaN(l)?0:e.toUpperCase().includes("TB")?1024*l*1024:e.toUpperCase().includes("GB")?1024*l:(e.toUpperCase().includes("MB"),l)},t=a(e),i=a(l);return 0===i?0:Math.min(Math.max(t/i*100,0),100)},Re=ve(()=>{if(!ke.initialConfig)return!1;if(!(ke.initialConfig.enabled&&ke.initialConfig.cookies&&ke.initialConfig.moviepilot_address))return!1;const e=Ne(ke.initialConfig.transfer_monitor_paths)>0&&ke.initialConfig.transfer_monitor_enabled,l=Ne(ke.initialConfig.full_sync_strm_paths)>0&&ke.initialConfig.timing_full_sync_strm,a=Ne(ke.initialConfig.increment_sync_strm_paths)>0&&ke.initialConfig.increment_sync_strm_enabled,t=Ne(ke.initialConfig.monitor_life_paths)>0&&ke.initialConfig.monitor_life_enabled,i=ke.initialConfig.user_share_local_path&&ke.initialConfig.user_share_pan_path;return e||l||a||t||i}),Ne=e=>{if(!e)return 0;try{return e.split("\n").filter(e=>e.trim()&&e.includes("#")).length}catch(l){return console.error("解析路径字符串失败:",l),0}},Ae=e=>{if(!e)return 0;try{return e.split("\n").filter(e=>e.trim()).length}catch(l){return console.error("解析网盘整理路径字符串失败:",l),0}},We=async()=>{we.value=!0,Ee.value=null;try{const l="P115StrmHelper",a=await ke.api.get(`plugin/${l}/get_status`);if(!a||0!==a.code||!a.data){if(ke.initialConfig){if(Be.enabled=Boolean(ke.initialConfig.enabled),Be.has_client=Boolean(ke.initialConfig.cookies&&""!==ke.initialConfig.cookies.trim()),Be.running=!1,$e.value=!0,Object.keys(ke.initialConfig).length<=1)try{const e=await ke.api.get(`plugin/${l}/get_config`);e&&(Object.assign(ke.initialConfig,e),console.log("从配置API获取配置:",ke.initialConfig))}catch(e){console.error("获取配置失败:",e)}throw new Error("状态API调用失败，使用配置数据显示状态")}throw new Error(a?.msg||"获取状态失败，请检查网络连接")}Be.enabled=Boolean(a.data.enabled),Be.has_client=Boolean(a.data.has_client),Be.running=Boolean(a.data.running);try{const e=await ke.api.get(`plugin/${l}/get_config`);e&&(Object.assign(ke.initialConfig,e),console.log("已获取最新配置:",ke.initialConfig))}catch(e){console.error("获取配置失败:",e)}$e.value=!0}catch(l){l.message.includes("使用配置数据显示状态")||(Ee.value=`获取状态失败: ${l.message||"未知错误"}`),console.error("获取状态失败:",l)}finally{we.value=!1}},Ke=async()=>{Pe.value=!0,await We(),Be.has_client&&ke.initialConfig?.cookies?await fl():(Ie.loading=!1,je.loading=!1,ke.initialConfig?.cookies?Be.has_client||(Ie.error="115客户端未连接或Cookie无效。",je.error="115客户端未连接或Cookie无效。"):(Ie.error="请先配置115 Cookie。",je.error="请先配置115 Cookie。")),Pe.value=!1,Te.value="状态已刷新",Ue.value="success",setTimeout(()=>{Te.value=null},3e3)},Ge=async()=>{Se.value=!1,await De()},qe=async()=>{Fe.value=!1,await Ze()},De=async()=>{ze.value=!0,Le.value=!0,Ee.value=null,Te.value=null;try{if(!Be.enabled)throw new Error("插件未启用，请先在配置页面启用插件");if(!Be.has_client)throw new Error("插件未配置Cookie或Cookie无效，请先在配置页面设置115 Cookie");if(0===Ne(ke.initialConfig?.full_sync_strm_paths))throw new Error("未配置全量同步路径，请先在配置页面设置同步路径");const e="P115StrmHelper",l=await ke.api.post(`plugin/${e}/full_sync`);if(!l||0!==l.code)throw new Error(l?.msg||"启动全量同步失败");Te.value=l.msg||"全量同步任务已启动",Ue.value="success",await We()}catch(e){Ee.value=`启动全量同步失败: ${e.message||"未知错误"}`,console.error("启动全量同步失败:",e)}finally{ze.value=!1,Le.value=!1}},Ze=async()=>{Ve.value=!0,Le.value=!0,Ee.value=null,Te.value=null;try{if(!Be.enabled)throw new Error("插件未启用，请先在配置页面启用插件");if(!Be.has_client)throw new Error("插件未配置Cookie或Cookie无效，请先在配置页面设置115 Cookie");const e="P115StrmHelper",l=await ke.api.post(`plugin/${e}/full_sync_db`);if(!l||0!==l.code)throw new Error(l?.msg||"启动全量同步数据库失败");Te.value=l.msg||"全量同步数据库任务已启动",Ue.value="success",await We()}catch(e){Ee.value=`启动全量同步数据库失败: ${e.message||"未知错误"}`,console.error("启动全量同步数据库失败:",e)}finally{Ve.value=!1,Le.value=!1}},Je=he({show:!1,error:null,shareLink:"",shareCode:"",receiveCode:"",panPath:"/",localPath:"",downloadMediaInfo:!1,shareMinFileSizeFormatted:""}),Qe=ve(()=>!!Je.localPath&&(!(!Je.shareLink&&!Je.shareCode)&&!(Je.shareCode&&!Je.receiveCode))),Xe=he({show:!1,isLocal:!0,loading:!1,error:null,currentPath:"/",items:[],selectedPath:"",callback:null}),Ye=()=>{Je.show=!0,Je.error=null,ke.initialConfig&&(Je.shareLink=ke.initialConfig.user_share_link||"",Je.shareCode=ke.initialConfig.user_share_code||"",Je.receiveCode=ke.initialConfig.user_receive_code||"",Je.panPath=ke.initialConfig.user_share_pan_path||"/",Je.localPath=ke.initialConfig.user_share_local_path||"",Je.downloadMediaInfo=ke.initialConfig.share_strm_auto_download_mediainfo_enabled||!1,Je.shareMinFileSizeFormatted=((e,l=2)=>{if(!+e)return"";const a=l<0?0:l,t=Math.floor(Math.log(e)/Math.log(1024));return`${parseFloat((e/Math.pow(1024,t)).toFixed(a))} ${["B","K","M","G","T"][t]}`})(ke.initialConfig.share_strm_min_file_size||0))},el=()=>{Je.show=!1},ll=async()=>{Xe.loading=!0,Xe.error=null,Xe.items=[];try{if(Xe.isLocal)try{const e=await ke.api.post("storage/list",{path:Xe.currentPath||"/",type:"share",flag:"ROOT"});if(!e||!Array.isArray(e))throw new Error("浏览目录失败：无效响应");Xe.items=e.filter(e=>"dir"===e.type).map(e=>({name:e.name,path:e.path,is_dir:!0})).sort((e,l)=>e.name.localeCompare(l.name,void 0,{numeric:!0,sensitivity:"base"}))}catch(Ee){console.error("浏览本地目录失败:",Ee),Xe.error=`浏览本地目录失败: ${Ee.message||"未知错误"}`,Xe.items=[]}else{const e="P115StrmHelper";if(!ke.initialConfig?.cookies||""===ke.initialConfig?.cookies.trim())throw new Error("请先设置115 Cookie才能浏览网盘目录");const l=await ke.api.get(`plugin/${e}/browse_dir?path=${encodeURIComponent(Xe.currentPath)}&is_local=${Xe.isLocal}`);if(!l||0!==l.code||!l.items)throw new Error(l?.msg||"获取网盘目录内容失败");Xe.items=l.items.filter(e=>e.is_dir),Xe.currentPath=l.path||Xe.currentPath}}catch(Ee){console.error("加载目录内容失败:",Ee),Xe.error=Ee.message||"获取目录内容失败",(Ee.message.includes("Cookie")||Ee.message.includes("cookie"))&&(Xe.items=[])}finally{Xe.loading=!1}},al=()=>{const e=Xe.currentPath;if(!Xe.isLocal){if("/"===e)return;let l=e.replace(/\\/g,"/");l.length>1&&l.endsWith("/")&&(l=l.slice(0,-1));const a=l.substring(0,l.lastIndexOf("/"));return Xe.currentPath=""===a?"/":a,void ll()}if("/"===e||"C:\\"===e||"C:/"===e)return;const l=e.replace(/\\/g,"/"),a=l.split("/").filter(Boolean);0===a.length?Xe.currentPath="/":1===a.length&&l.includes(":")?Xe.currentPath=a[0]+":/":(a.pop(),Xe.currentPath=0===a.length?"/":(l.startsWith("/")?"/":"")+a.join("/")+"/"),ll()},tl=()=>{if(!Xe.currentPath)return;let e=Xe.currentPath;"/"===e||/^[a-zA-Z]:[\\\/]$/.test(e)||!e.endsWith("/")&&!e.endsWith("\\\\")||(e=e.slice(0,-1)),"function"==typeof Xe.callback&&Xe.callback(e),il()},il=()=>{Xe.show=!1,Xe.items=[],Xe.error=null},nl=async()=>{Me.value=!0,Je.error=null;try{if(!Je.localPath)throw new Error("请先设置本地生成STRM路径");if(!Je.shareLink&&!Je.shareCode)throw new Error("请输入115网盘分享链接或分享码");if(Je.shareCode&&!Je.receiveCode)throw new Error("使用分享码时必须输入分享密码");const e="P115StrmHelper";ke.initialConfig&&(ke.initialConfig.user_share_link=Je.shareLink,ke.initialConfig.user_share_code=Je.shareCode,ke.initialConfig.user_receive_code=Je.receiveCode,ke.initialConfig.user_share_pan_path=Je.panPath,ke.initialConfig.user_share_local_path=Je.localPath,ke.initialConfig.share_strm_auto_download_mediainfo_enabled=Je.downloadMediaInfo,ke.initialConfig.share_strm_min_file_size=(e=>{if(!e||"string"!=typeof e)return 0;const l=e.trim().match(/^(\d*\.?\d+)\s*(k|m|g|t)?b?$/i);if(!l)return 0;const a=parseFloat(l[1]);switch((l[2]||"").toLowerCase()){case"t":return Math.round(1024*a*1024*1024*1024);case"g":return Math.round(1024*a*1024*1024);case"m":return Math.round(1024*a*1024);case"k":return Math.round(1024*a);default:return Math.round(a)}})(Je.shareMinFileSizeFormatted),await ke.api.post(`plugin/${e}/save_config`,ke.initialConfig));const l=await ke.api.post(`plugin/${e}/share_sync`);if(!l||0!==l.code)throw new Error(l?.msg||"启动分享同步失败");Te.value=l.msg||"分享同步任务已启动",Ue.value="success",await We(),el()}catch(e){Je.error=`启动分享同步失败: ${e.message||"未知错误"}`,console.error("启动分享同步失败:",e)}finally{Me.value=!1}},sl=()=>{Oe.show=!0,Oe.activeTab="tasks",Oe.error=null,Oe.addError=null},ol=()=>{Oe.show=!1,Oe.tasks=[],Oe.totalTasks=0,Oe.links="",Oe.destPath=""},rl=async({page:e,itemsPerPage:l})=>{Oe.loading=!0,Oe.error=null;try{const a="P115StrmHelper",t=await ke.api.post(`plugin/${a}/offline_tasks`,{page:e,limit:l});if(!t||0!==t.code||!t.data)throw new Error(t?.msg||"获取离线任务列表失败");Oe.tasks=t.data.tasks||[],Oe.totalTasks=t.data.total||0}catch(a){Oe.error=`获取任务失败: ${a.message||"未知错误"}`,console.error("获取离线任务失败:",a),Oe.tasks=[],Oe.totalTasks=0}finally{Oe.loading=!1}},cl=async()=>{if(Oe.links.trim()){Oe.adding=!0,Oe.addError=null;try{const e="P115StrmHelper",l=Oe.links.split("\n").map(e=>e.trim()).filter(Boolean),a=await ke.api.post(`plugin/${e}/add_offline_task`,{links:l,path:Oe.destPath||null});if(!a||0!==a.code)throw new Error(a?.msg||"添加离线任务失败");Te.value=a.msg||"离线任务添加成功",Ue.value="success",Oe.links="",Oe.destPath="",Oe.activeTab="tasks",rl({page:1,itemsPerPage:Oe.itemsPerPage})}catch(e){Oe.addError=`添加任务失败: ${e.message||"未知错误"}`,console.error("添加离线任务失败:",e)}finally{Oe.adding=!1}}else Oe.addError="下载链接不能为空。"},dl=()=>{Xe.show=!0,Xe.isLocal=!1,Xe.loading=!1,Xe.error=null,Xe.items=[],Xe.currentPath=Oe.destPath||"/",Xe.callback=e=>{Oe.destPath=e},ll()},ul=e=>{switch(e){case 0:return"info";case 1:return"error";case 2:return"success";case 3:return"warning";default:return"grey"}},ml=e=>{if(!e)return[];try{return e.split("\n").filter(e=>e.trim()&&e.includes("#")).map(e=>{const l=e.split("#");return{local:l[0]||"",remote:l[1]||""}})}catch(l){return console.error("解析路径字符串失败:",l),[]}},pl=e=>{if(!e)return[];try{return e.split("\n").filter(e=>e.trim()).map(e=>({path:e}))}catch(l){return console.error("解析网盘整理路径字符串失败:",l),[]}};async function fl(){Ie.loading=!0,Ie.error=null,je.loading=!0,je.error=null;try{const e="P115StrmHelper",l=await ke.api.get(`plugin/${e}/user_storage_status`);if(l&&l.success)l.user_info?Object.assign(Ie,l.user_info):Ie.error="未能获取有效的用户信息。",l.storage_info?Object.assign(je,l.storage_info):je.error="未能获取有效的存储空间信息。";else{const e=l?.error_message||"获取用户和存储信息失败。";Ie.error=e,je.error=e,(e.includes("Cookie")||e.includes("未配置"))&&(Be.has_client=!1)}}catch(e){console.error("获取用户/存储状态失败:",e);const l=`请求用户/存储状态时出错: ${e.message||"未知网络错误"}`;Ie.error=l,je.error=l}finally{Ie.loading=!1,je.loading=!1}}return xe(()=>ke.initialConfig,e=>{e&&(Be.enabled=e.enabled||!1,Be.has_client=Boolean(e.cookies&&""!==e.cookies.trim()))},{immediate:!0}),be(async()=>{await We(),Be.has_client&&ke.initialConfig?.cookies?await fl():(Ie.loading=!1,je.loading=!1,ke.initialConfig?.cookies?Be.has_client||(Ie.error="115客户端未连接或Cookie无效。",je.error="115客户端未连接或Cookie无效。"):(Ie.error="请先配置115 Cookie。",je.error="请先配置115 Cookie。"))}),(l,ye)=>{const he=a("v-icon"),ve=a("v-card-title"),be=a("v-alert"),xe=a("v-skeleton-loader"),ke=a("v-list-item-title"),We=a("v-chip"),De=a("v-list-item"),Ze=a("v-divider"),fl=a("v-list"),_l=a("v-card-text"),gl=a("v-card"),yl=a("v-img"),hl=a("v-avatar"),vl=a("v-list-item-subtitle"),bl=a("v-progress-linear"),xl=a("v-col"),kl=a("v-row"),Cl=a("v-btn"),wl=a("v-menu"),Pl=a("v-card-actions"),zl=a("v-text-field"),Vl=a("v-switch"),Ml=a("v-spacer"),$l=a("v-dialog"),El=a("v-tab"),Tl=a("v-tabs"),Ul=a("v-data-table-server"),Ll=a("v-window-item"),Sl=a("v-textarea"),Fl=a("v-window"),Bl=a("v-progress-circular");return r(),u(p,null,[i("div",y,[t(gl,{flat:"",class:"rounded border",style:{display:"flex","flex-direction":"column","max-height":"85vh"}},{default:n(()=>[t(ve,{class:"text-subtitle-1 d-flex align-center px-3 py-1 bg-primary-gradient"},{default:n(()=>[t(he,{icon:"mdi-file-link",class:"mr-2",color:"primary",size:"small"}),ye[26]||(ye[26]=i("span",null,"115网盘STRM助手",-1))]),_:1}),t(_l,{class:"px-3 py-1",style:{"flex-grow":"1","overflow-y":"auto","padding-bottom":"48px"}},{default:n(()=>[Ee.value?(r(),c(be,{key:0,type:"error",density:"compact",class:"mb-2",variant:"tonal",closable:""},{default:n(()=>[o(s(Ee.value),1)]),_:1})):d("",!0),Te.value?(r(),c(be,{key:1,type:Ue.value,density:"compact",class:"mb-2",variant:"tonal",closable:""},{default:n(()=>[o(s(Te.value),1)]),_:1},8,["type"])):d("",!0),we.value&&!$e.value?(r(),c(xe,{key:2,type:"article, actions"})):d("",!0),$e.value?(r(),u("div",h,[t(kl,null,{default:n(()=>[t(xl,{cols:"12",md:"6"},{default:n(()=>[t(gl,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(ve,{class:"text-subtitle-2 d-flex align-center px-3 py-1 bg-primary-gradient"},{default:n(()=>[t(he,{icon:"mdi-information",class:"mr-2",color:"primary",size:"small"}),ye[27]||(ye[27]=i("span",null,"系统状态",-1))]),_:1}),t(_l,{class:"pa-0"},{default:n(()=>[t(fl,{class:"bg-transparent pa-0"},{default:n(()=>[t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:Be.enabled?"success":"grey",icon:"mdi-power",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:Be.enabled?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(Be.enabled?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[28]||(ye[28]=[o("插件状态")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:Be.has_client&&e.initialConfig?.cookies?"success":"error",icon:"mdi-account-check",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:Be.has_client&&e.initialConfig?.cookies?"success":"error",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(Be.has_client&&e.initialConfig?.cookies?"已连接":"未连接"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[29]||(ye[29]=[o("115客户端状态")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:Be.running?"warning":"success",icon:"mdi-play-circle",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:Be.running?"warning":"success",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(Be.running?"运行中":"空闲"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[30]||(ye[30]=[o("任务状态")])),_:1})]),_:1})]),_:1})]),_:1})]),_:1}),t(gl,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(ve,{class:"text-subtitle-2 d-flex align-center px-3 py-1 bg-primary-gradient"},{default:n(()=>[t(he,{icon:"mdi-account-box",class:"mr-2",color:"primary",size:"small"}),ye[31]||(ye[31]=i("span",null,"115账户信息",-1))]),_:1}),t(_l,{class:"pa-0"},{default:n(()=>[Ie.loading||je.loading?(r(),c(xe,{key:0,type:"list-item-avatar-three-line, list-item-three-line"})):(r(),u("div",v,[Ie.error||je.error?(r(),c(be,{key:0,type:"warning",density:"compact",class:"ma-2",variant:"tonal"},{default:n(()=>[o(s(Ie.error||je.error),1)]),_:1})):(r(),c(fl,{key:1,class:"bg-transparent pa-0"},{default:n(()=>[t(De,{class:"px-3 py-1"},{prepend:n(()=>[t(hl,{size:"32",class:"mr-2"},{default:n(()=>[Ie.avatar?(r(),c(yl,{key:0,src:Ie.avatar,alt:Ie.name},null,8,["src","alt"])):(r(),c(he,{key:1,icon:"mdi-account-circle"}))]),_:1})]),default:n(()=>[t(ke,{class:"text-body-1 font-weight-medium"},{default:n(()=>[o(s(Ie.name||"未知用户"),1)]),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-1"},{prepend:n(()=>[t(he,{color:Ie.is_vip?"amber-darken-2":"grey",icon:"mdi-shield-crown",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:Ie.is_vip?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(Ie.is_vip?Ie.is_forever_vip?"永久VIP":`VIP (至 ${Ie.vip_expire_date||"N/A"})`:"非VIP"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[32]||(ye[32]=[o("VIP状态")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-1"},{default:n(()=>[t(ke,{class:"text-body-2 mb-1"},{default:n(()=>ye[33]||(ye[33]=[o("存储空间")])),_:1}),je.used&&je.total?(r(),c(vl,{key:0,class:"text-caption"},{default:n(()=>[o(" 已用 "+s(je.used)+" / 总共 "+s(je.total)+" (剩余 "+s(je.remaining)+") ",1)]),_:1})):d("",!0),je.used&&je.total?(r(),c(bl,{key:1,"model-value":He(je.used,je.total),color:"primary",height:"6",rounded:"",class:"mt-1"},null,8,["model-value"])):(r(),c(vl,{key:2,class:"text-caption text-grey"},{default:n(()=>ye[34]||(ye[34]=[o(" 存储信息不可用 ")])),_:1}))]),_:1})]),_:1}))]))]),_:1})]),_:1}),t(gl,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(ve,{class:"text-subtitle-2 d-flex align-center px-3 py-1 bg-primary-gradient"},{default:n(()=>[t(he,{icon:"mdi-puzzle",class:"mr-2",color:"primary",size:"small"}),ye[35]||(ye[35]=i("span",null,"功能配置",-1))]),_:1}),t(_l,{class:"pa-0"},{default:n(()=>[t(fl,{class:"bg-transparent pa-0"},{default:n(()=>[t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:e.initialConfig?.transfer_monitor_enabled?"success":"grey",icon:"mdi-file-move",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:e.initialConfig?.transfer_monitor_enabled?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.initialConfig?.transfer_monitor_enabled?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[36]||(ye[36]=[o("监控MP整理")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:e.initialConfig?.timing_full_sync_strm?"success":"grey",icon:"mdi-sync",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:e.initialConfig?.timing_full_sync_strm?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.initialConfig?.timing_full_sync_strm?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[37]||(ye[37]=[o("定期全量同步")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:e.initialConfig?.increment_sync_strm_enabled?"success":"grey",icon:"mdi-book-sync",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:e.initialConfig?.increment_sync_strm_enabled?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.initialConfig?.increment_sync_strm_enabled?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[38]||(ye[38]=[o("定期增量同步")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:e.initialConfig?.monitor_life_enabled?"success":"grey",icon:"mdi-calendar-heart",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:e.initialConfig?.monitor_life_enabled?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.initialConfig?.monitor_life_enabled?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[39]||(ye[39]=[o("监控115生活事件")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:e.initialConfig?.pan_transfer_enabled?"success":"grey",icon:"mdi-transfer",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:e.initialConfig?.pan_transfer_enabled?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.initialConfig?.pan_transfer_enabled?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[40]||(ye[40]=[o("网盘整理")])),_:1})]),_:1}),t(Ze,{class:"my-0"}),t(De,{class:"px-3 py-0",style:{"min-height":"34px"}},{prepend:n(()=>[t(he,{color:e.initialConfig?.clear_recyclebin_enabled||e.initialConfig?.clear_receive_path_enabled?"success":"grey",icon:"mdi-broom",size:"small"},null,8,["color"])]),append:n(()=>[t(We,{color:e.initialConfig?.clear_recyclebin_enabled||e.initialConfig?.clear_receive_path_enabled?"success":"grey",size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.initialConfig?.clear_recyclebin_enabled||e.initialConfig?.clear_receive_path_enabled?"已启用":"已禁用"),1)]),_:1},8,["color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[41]||(ye[41]=[o("定期清理")])),_:1})]),_:1}),t(Ze,{class:"my-0"})]),_:1})]),_:1})]),_:1})]),_:1}),t(xl,{cols:"12",md:"6"},{default:n(()=>[t(gl,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(ve,{class:"text-subtitle-2 d-flex align-center px-3 py-1 bg-primary-gradient"},{default:n(()=>[t(he,{icon:"mdi-folder-search",class:"mr-2",color:"primary",size:"small"}),ye[42]||(ye[42]=i("span",null,"路径配置",-1))]),_:1}),t(_l,{class:"pa-0"},{default:n(()=>[t(fl,{class:"bg-transparent pa-0"},{default:n(()=>[e.initialConfig?.transfer_monitor_enabled?(r(),c(De,{key:0,class:"px-3 py-2"},{default:n(()=>[i("div",null,[ye[48]||(ye[48]=i("div",{class:"text-body-2 font-weight-medium mb-1"},"监控MP整理路径",-1)),Ne(e.initialConfig?.transfer_monitor_paths)>0?(r(!0),u(p,{key:0},m(ml(e.initialConfig?.transfer_monitor_paths),(e,l)=>(r(),u(p,{key:`transfer-${l}`},[l>0?(r(),c(Ze,{key:0,class:"my-1"})):d("",!0),i("div",b,[t(kl,{dense:"",align:"center"},{default:n(()=>[t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"primary",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[43]||(ye[43]=[o("mdi-folder-home")])),_:1}),i("div",{class:"text-truncate w-100",title:e.local},[ye[44]||(ye[44]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"本地目录",-1)),i("span",k,s(e.local||"-"),1)],8,x)]),_:2},1024),t(xl,{cols:"12",sm:"2",class:"text-center my-1 my-sm-0"},{default:n(()=>[t(he,{color:"primary",class:"icon-spin-animation"},{default:n(()=>ye[45]||(ye[45]=[o("mdi-sync")])),_:1})]),_:1}),t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"success",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[46]||(ye[46]=[o("mdi-cloud")])),_:1}),i("div",{class:"text-truncate w-100",title:e.remote},[ye[47]||(ye[47]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"网盘目录",-1)),i("span",w,s(e.remote||"-"),1)],8,C)]),_:2},1024)]),_:2},1024)])],64))),128)):(r(),u("div",P,"未配置路径"))])]),_:1})):d("",!0),e.initialConfig?.transfer_monitor_enabled&&(e.initialConfig?.increment_sync_strm_enabled||e.initialConfig?.timing_full_sync_strm||e.initialConfig?.monitor_life_enabled||e.initialConfig?.pan_transfer_enabled||e.initialConfig?.directory_upload_enabled)?(r(),c(Ze,{key:1,class:"my-0"})):d("",!0),e.initialConfig?.timing_full_sync_strm?(r(),c(De,{key:2,class:"px-3 py-2"},{default:n(()=>[i("div",null,[ye[54]||(ye[54]=i("div",{class:"text-body-2 font-weight-medium mb-1"},"全量同步路径",-1)),Ne(e.initialConfig?.full_sync_strm_paths)>0?(r(!0),u(p,{key:0},m(ml(e.initialConfig?.full_sync_strm_paths),(e,l)=>(r(),u(p,{key:`fullsync-${l}`},[l>0?(r(),c(Ze,{key:0,class:"my-1"})):d("",!0),i("div",z,[t(kl,{dense:"",align:"center"},{default:n(()=>[t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"primary",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[49]||(ye[49]=[o("mdi-folder-home")])),_:1}),i("div",{class:"text-truncate w-100",title:e.local},[ye[50]||(ye[50]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"本地目录",-1)),i("span",M,s(e.local||"-"),1)],8,V)]),_:2},1024),t(xl,{cols:"12",sm:"2",class:"text-center my-1 my-sm-0"},{default:n(()=>[t(he,{color:"primary",class:"icon-spin-animation"},{default:n(()=>ye[51]||(ye[51]=[o("mdi-sync")])),_:1})]),_:1}),t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"success",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[52]||(ye[52]=[o("mdi-cloud")])),_:1}),i("div",{class:"text-truncate w-100",title:e.remote},[ye[53]||(ye[53]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"网盘目录",-1)),i("span",E,s(e.remote||"-"),1)],8,$)]),_:2},1024)]),_:2},1024)])],64))),128)):(r(),u("div",T,"未配置路径"))])]),_:1})):d("",!0),e.initialConfig?.timing_full_sync_strm&&(e.initialConfig?.increment_sync_strm_enabled||e.initialConfig?.monitor_life_enabled||e.initialConfig?.pan_transfer_enabled||e.initialConfig?.directory_upload_enabled)?(r(),c(Ze,{key:3,class:"my-0"})):d("",!0),e.initialConfig?.increment_sync_strm_enabled?(r(),c(De,{key:4,class:"px-3 py-2"},{default:n(()=>[i("div",null,[ye[60]||(ye[60]=i("div",{class:"text-body-2 font-weight-medium mb-1"},"增量同步路径",-1)),Ne(e.initialConfig?.increment_sync_strm_paths)>0?(r(!0),u(p,{key:0},m(ml(e.initialConfig?.increment_sync_strm_paths),(e,l)=>(r(),u(p,{key:`incsync-${l}`},[l>0?(r(),c(Ze,{key:0,class:"my-1"})):d("",!0),i("div",U,[t(kl,{dense:"",align:"center"},{default:n(()=>[t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"primary",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[55]||(ye[55]=[o("mdi-folder-home")])),_:1}),i("div",{class:"text-truncate w-100",title:e.local},[ye[56]||(ye[56]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"本地目录",-1)),i("span",S,s(e.local||"-"),1)],8,L)]),_:2},1024),t(xl,{cols:"12",sm:"2",class:"text-center my-1 my-sm-0"},{default:n(()=>[t(he,{color:"primary",class:"icon-spin-animation"},{default:n(()=>ye[57]||(ye[57]=[o("mdi-sync")])),_:1})]),_:1}),t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"success",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[58]||(ye[58]=[o("mdi-cloud")])),_:1}),i("div",{class:"text-truncate w-100",title:e.remote},[ye[59]||(ye[59]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"网盘目录",-1)),i("span",B,s(e.remote||"-"),1)],8,F)]),_:2},1024)]),_:2},1024)])],64))),128)):(r(),u("div",I,"未配置路径"))])]),_:1})):d("",!0),e.initialConfig?.increment_sync_strm_enabled&&(e.initialConfig?.monitor_life_enabled||e.initialConfig?.pan_transfer_enabled||e.initialConfig?.directory_upload_enabled)?(r(),c(Ze,{key:5,class:"my-0"})):d("",!0),e.initialConfig?.monitor_life_enabled?(r(),c(De,{key:6,class:"px-3 py-2"},{default:n(()=>[i("div",null,[ye[66]||(ye[66]=i("div",{class:"text-body-2 font-weight-medium mb-1"},"监控115生活事件路径",-1)),Ne(e.initialConfig?.monitor_life_paths)>0?(r(!0),u(p,{key:0},m(ml(e.initialConfig?.monitor_life_paths),(e,l)=>(r(),u(p,{key:`life-${l}`},[l>0?(r(),c(Ze,{key:0,class:"my-1"})):d("",!0),i("div",j,[t(kl,{dense:"",align:"center"},{default:n(()=>[t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"primary",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[61]||(ye[61]=[o("mdi-folder-home")])),_:1}),i("div",{class:"text-truncate w-100",title:e.local},[ye[62]||(ye[62]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"本地目录",-1)),i("span",H,s(e.local||"-"),1)],8,O)]),_:2},1024),t(xl,{cols:"12",sm:"2",class:"text-center my-1 my-sm-0"},{default:n(()=>[t(he,{color:"primary",class:"icon-spin-animation"},{default:n(()=>ye[63]||(ye[63]=[o("mdi-sync")])),_:1})]),_:1}),t(xl,{cols:"12",sm:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"success",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[64]||(ye[64]=[o("mdi-cloud")])),_:1}),i("div",{class:"text-truncate w-100",title:e.remote},[ye[65]||(ye[65]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"网盘目录",-1)),i("span",N,s(e.remote||"-"),1)],8,R)]),_:2},1024)]),_:2},1024)])],64))),128)):(r(),u("div",A,"未配置路径"))])]),_:1})):d("",!0),e.initialConfig?.monitor_life_enabled&&(e.initialConfig?.pan_transfer_enabled||e.initialConfig?.directory_upload_enabled)?(r(),c(Ze,{key:7,class:"my-0"})):d("",!0),e.initialConfig?.pan_transfer_enabled?(r(),c(De,{key:8,class:"px-3 py-2"},{default:n(()=>[i("div",null,[ye[69]||(ye[69]=i("div",{class:"text-body-2 font-weight-medium mb-1"},"网盘整理目录",-1)),Ae(e.initialConfig?.pan_transfer_paths)>0?(r(!0),u(p,{key:0},m(pl(e.initialConfig?.pan_transfer_paths),(e,l)=>(r(),u(p,{key:`pan-${l}`},[l>0?(r(),c(Ze,{key:0,class:"my-1"})):d("",!0),i("div",W,[i("div",K,[t(he,{size:"small",color:"success",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[67]||(ye[67]=[o("mdi-folder-arrow-down")])),_:1}),i("div",{class:"text-truncate w-100",title:e.path},[ye[68]||(ye[68]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"待整理网盘目录",-1)),i("span",q,s(e.path),1)],8,G)])])],64))),128)):(r(),u("div",D,"未配置网盘整理目录"))])]),_:1})):d("",!0),e.initialConfig?.pan_transfer_enabled&&e.initialConfig?.directory_upload_enabled?(r(),c(Ze,{key:9,class:"my-0"})):d("",!0),e.initialConfig?.directory_upload_enabled?(r(),c(De,{key:10,class:"px-3 py-2"},{default:n(()=>[i("div",null,[ye[77]||(ye[77]=i("div",{class:"text-body-2 font-weight-medium mb-1"},"目录上传路径",-1)),e.initialConfig?.directory_upload_path&&e.initialConfig.directory_upload_path.length>0?(r(!0),u(p,{key:0},m(e.initialConfig.directory_upload_path,(e,l)=>(r(),u(p,{key:`upload-group-${l}`},[l>0?(r(),c(Ze,{key:0,class:"my-1"})):d("",!0),i("div",Z,[t(kl,{dense:"",align:"center"},{default:n(()=>[t(xl,{cols:"12",md:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"primary",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[70]||(ye[70]=[o("mdi-folder-table")])),_:1}),i("div",{class:"text-truncate w-100",title:e.src},[ye[71]||(ye[71]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"本地监控",-1)),i("span",Q,s(e.src||"-"),1)],8,J)]),_:2},1024),t(xl,{cols:"12",md:"2",class:"text-center my-1 my-md-0"},{default:n(()=>[t(he,{color:"primary",class:"icon-spin-animation"},{default:n(()=>ye[72]||(ye[72]=[o("mdi-sync")])),_:1})]),_:1}),t(xl,{cols:"12",md:"5",class:"d-flex align-center"},{default:n(()=>[t(he,{size:"small",color:"success",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[73]||(ye[73]=[o("mdi-cloud-upload")])),_:1}),i("div",{class:"text-truncate w-100",title:e.dest_remote},[ye[74]||(ye[74]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"网盘上传",-1)),i("span",Y,s(e.dest_remote||"-"),1)],8,X)]),_:2},1024)]),_:2},1024),e.dest_local||"boolean"==typeof e.delete?(r(),u("div",ee,[t(kl,{dense:"",align:"center",class:"mt-1"},{default:n(()=>[t(xl,{cols:"12",md:"boolean"==typeof e.delete?7:12},{default:n(()=>[e.dest_local?(r(),u("div",le,[t(he,{size:"small",color:"warning",class:"mr-2 flex-shrink-0"},{default:n(()=>ye[75]||(ye[75]=[o("mdi-content-copy")])),_:1}),i("div",{class:"text-truncate w-100",title:e.dest_local},[ye[76]||(ye[76]=i("span",{class:"text-caption font-weight-medium d-block",style:{"line-height":"1.2"}},"本地复制",-1)),i("span",te,s(e.dest_local),1)],8,ae)])):d("",!0)]),_:2},1032,["md"]),"boolean"==typeof e.delete?(r(),c(xl,{key:0,cols:"12",md:e.dest_local?5:12,class:f(["d-flex align-center",{"justify-md-end":e.dest_local,"mt-1 mt-md-0":e.dest_local}])},{default:n(()=>[t(he,{size:"small",color:e.delete?"error":"grey-darken-1",class:"mr-1 flex-shrink-0"},{default:n(()=>[o(s(e.delete?"mdi-delete":"mdi-delete-off"),1)]),_:2},1032,["color"]),i("span",{class:f(["text-caption",e.delete?"text-error":"text-grey-darken-1"])},s(e.delete?"删除源":"不删源"),3)]),_:2},1032,["md","class"])):d("",!0)]),_:2},1024)])):d("",!0)])],64))),128)):(r(),u("div",ie,"未配置路径"))])]),_:1})):d("",!0)]),_:1})]),_:1})]),_:1}),Be.has_client&&e.initialConfig.cookies?Re.value?d("",!0):(r(),c(gl,{key:1,flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(_l,{class:"pa-3"},{default:n(()=>[i("div",oe,[t(he,{icon:"mdi-alert-circle",color:"warning",class:"mr-2",size:"small"}),i("div",re,[ye[84]||(ye[84]=i("p",{class:"mb-1"},[i("strong",null,"路径配置不完整")],-1)),ye[85]||(ye[85]=i("p",{class:"mb-0"},"您已配置115 Cookie，但部分功能路径未配置。请前往配置页面完善路径设置。",-1)),t(Cl,{color:"primary",variant:"text",size:"small",class:"mt-1 px-2 py-0",onClick:ye[1]||(ye[1]=e=>Ce("switch"))},{default:n(()=>[t(he,{size:"small",class:"mr-1"},{default:n(()=>ye[82]||(ye[82]=[o("mdi-cog")])),_:1}),ye[83]||(ye[83]=o("前往配置 "))]),_:1})])])]),_:1})]),_:1})):(r(),c(gl,{key:0,flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(_l,{class:"pa-3"},{default:n(()=>[i("div",ne,[t(he,{icon:"mdi-alert-circle",color:"error",class:"mr-2",size:"small"}),i("div",se,[ye[80]||(ye[80]=i("p",{class:"mb-1"},[i("strong",null,"未配置115 Cookie或Cookie无效")],-1)),ye[81]||(ye[81]=i("p",{class:"mb-0"},"请在配置页面中设置有效的115网盘Cookie，可通过扫码登录获取。",-1)),t(Cl,{color:"primary",variant:"text",size:"small",class:"mt-1 px-2 py-0",onClick:ye[0]||(ye[0]=e=>Ce("switch"))},{default:n(()=>[t(he,{size:"small",class:"mr-1"},{default:n(()=>ye[78]||(ye[78]=[o("mdi-cog")])),_:1}),ye[79]||(ye[79]=o("前往配置 "))]),_:1})])])]),_:1})]),_:1}))]),_:1})]),_:1}),t(gl,{flat:"",class:"rounded mb-3 border config-card"},{default:n(()=>[t(_l,{class:"d-flex align-center px-3 py-1"},{default:n(()=>[t(he,{icon:"mdi-information",color:"info",class:"mr-2",size:"small"}),ye[86]||(ye[86]=i("span",{class:"text-body-2"},' 点击"配置"按钮进行设置，"全量同步"和"分享同步"按钮可立即执行相应任务。 ',-1))]),_:1})]),_:1})])):d("",!0)]),_:1}),t(Ze),t(Pl,{class:"px-2 py-1 sticky-actions d-flex justify-space-between align-center",style:{"flex-shrink":"0",gap:"8px"}},{default:n(()=>[t(Cl,{color:"info",onClick:Ke,"prepend-icon":"mdi-refresh",disabled:Pe.value,loading:Pe.value,variant:"text",size:"small"},{default:n(()=>ye[87]||(ye[87]=[o("刷新状态")])),_:1},8,["disabled","loading"]),i("div",ce,[t(wl,{"offset-y":""},{activator:n(({props:e})=>[t(Cl,_(e,{variant:"text",size:"small","append-icon":"mdi-dots-vertical"}),{default:n(()=>ye[88]||(ye[88]=[o(" 更多 ")])),_:2},1040)]),default:n(()=>[t(fl,{density:"compact"},{default:n(()=>[t(De,{onClick:ye[2]||(ye[2]=e=>Se.value=!0),disabled:!Be.enabled||!Be.has_client||Le.value},{prepend:n(()=>[t(he,{color:"warning"},{default:n(()=>ye[89]||(ye[89]=[o("mdi-sync")])),_:1})]),default:n(()=>[t(ke,null,{default:n(()=>ye[90]||(ye[90]=[o("全量同步")])),_:1})]),_:1},8,["disabled"]),t(De,{onClick:ye[3]||(ye[3]=e=>Fe.value=!0),disabled:!Be.enabled||!Be.has_client||Le.value},{prepend:n(()=>[t(he,{color:"primary"},{default:n(()=>ye[91]||(ye[91]=[o("mdi-database-sync")])),_:1})]),default:n(()=>[t(ke,null,{default:n(()=>ye[92]||(ye[92]=[o("全量同步数据库")])),_:1})]),_:1},8,["disabled"]),t(De,{onClick:Ye,disabled:!Be.enabled||!Be.has_client||Le.value,loading:Me.value},{prepend:n(()=>[t(he,{color:"info"},{default:n(()=>ye[93]||(ye[93]=[o("mdi-share-variant")])),_:1})]),default:n(()=>[t(ke,null,{default:n(()=>ye[94]||(ye[94]=[o("分享同步")])),_:1})]),_:1},8,["disabled","loading"]),t(De,{onClick:sl,disabled:!Be.enabled||!Be.has_client||Le.value},{prepend:n(()=>[t(he,{color:"secondary"},{default:n(()=>ye[95]||(ye[95]=[o("mdi-cloud-download-outline")])),_:1})]),default:n(()=>[t(ke,null,{default:n(()=>ye[96]||(ye[96]=[o("离线下载")])),_:1})]),_:1},8,["disabled"])]),_:1})]),_:1}),t(Cl,{color:"primary",onClick:ye[4]||(ye[4]=e=>Ce("switch")),"prepend-icon":"mdi-cog",variant:"text",size:"small"},{default:n(()=>ye[97]||(ye[97]=[o("配置")])),_:1}),t(Cl,{color:"error",onClick:ye[5]||(ye[5]=e=>Ce("close")),variant:"flat",size:"small",class:"custom-close-btn","aria-label":"关闭",style:{"min-width":"auto !important",padding:"0 10px !important",height:"28px !important","line-height":"28px !important"}},{default:n(()=>[t(he,{size:"small"},{default:n(()=>ye[98]||(ye[98]=[o("mdi-close")])),_:1})]),_:1})])]),_:1})]),_:1})]),t($l,{modelValue:Je.show,"onUpdate:modelValue":ye[14]||(ye[14]=e=>Je.show=e),"max-width":"600"},{default:n(()=>[t(gl,null,{default:n(()=>[t(ve,{class:"text-subtitle-1 d-flex align-center px-3 py-1 bg-primary-lighten-5"},{default:n(()=>[t(he,{icon:"mdi-share-variant",class:"mr-2",color:"primary",size:"small"}),ye[99]||(ye[99]=i("span",null,"115网盘分享同步",-1))]),_:1}),t(_l,{class:"px-3 py-2"},{default:n(()=>[Je.error?(r(),c(be,{key:0,type:"error",density:"compact",class:"mb-3",variant:"tonal"},{default:n(()=>[o(s(Je.error),1)]),_:1})):d("",!0),t(kl,null,{default:n(()=>[t(xl,{cols:"12"},{default:n(()=>[t(zl,{modelValue:Je.shareLink,"onUpdate:modelValue":ye[6]||(ye[6]=e=>Je.shareLink=e),label:"分享链接",hint:"115网盘分享链接","persistent-hint":"",variant:"outlined",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1}),t(kl,null,{default:n(()=>[t(xl,{cols:"12",md:"6"},{default:n(()=>[t(zl,{modelValue:Je.shareCode,"onUpdate:modelValue":ye[7]||(ye[7]=e=>Je.shareCode=e),label:"分享码",hint:"分享码，和分享链接选填一项","persistent-hint":"",variant:"outlined",density:"compact"},null,8,["modelValue"])]),_:1}),t(xl,{cols:"12",md:"6"},{default:n(()=>[t(zl,{modelValue:Je.receiveCode,"onUpdate:modelValue":ye[8]||(ye[8]=e=>Je.receiveCode=e),label:"分享密码",hint:"分享密码，如有则必填","persistent-hint":"",variant:"outlined",density:"compact"},null,8,["modelValue"])]),_:1})]),_:1}),t(kl,null,{default:n(()=>[t(xl,{cols:"12",md:"6"},{default:n(()=>[t(zl,{modelValue:Je.panPath,"onUpdate:modelValue":ye[9]||(ye[9]=e=>Je.panPath=e),label:"分享文件夹路径",hint:"分享内容列表中的相对路径，默认为根目录 /。例如，若分享链接指向一个文件夹，此路径为该文件夹内的子路径。","persistent-hint":"",variant:"outlined",density:"compact"},null,8,["modelValue"])]),_:1}),t(xl,{cols:"12",md:"6"},{default:n(()=>[t(zl,{modelValue:Je.localPath,"onUpdate:modelValue":ye[10]||(ye[10]=e=>Je.localPath=e),label:"本地生成STRM路径",hint:"本地生成STRM文件的路径","persistent-hint":"",variant:"outlined",density:"compact","append-icon":"mdi-folder","onClick:append":ye[11]||(ye[11]=e=>{return l="local",Xe.show=!0,Xe.isLocal="local"===l,Xe.loading=!1,Xe.error=null,Xe.items=[],Xe.isLocal?Xe.currentPath=Je.localPath||"/":Xe.currentPath=Je.panPath||"/",Xe.callback=e=>{Xe.isLocal?Je.localPath=e:Je.panPath=e},void ll();var l})},null,8,["modelValue"])]),_:1})]),_:1}),t(kl,null,{default:n(()=>[t(xl,{cols:"12",md:"6"},{default:n(()=>[t(Vl,{modelValue:Je.downloadMediaInfo,"onUpdate:modelValue":ye[12]||(ye[12]=e=>Je.downloadMediaInfo=e),label:"下载媒体数据文件",color:"primary",density:"compact"},null,8,["modelValue"])]),_:1}),t(xl,{cols:"12",md:"6"},{default:n(()=>[t(zl,{modelValue:Je.shareMinFileSizeFormatted,"onUpdate:modelValue":ye[13]||(ye[13]=e=>Je.shareMinFileSizeFormatted=e),label:"STRM最小文件大小",hint:"小于此值不生成STRM(K,M,G)","persistent-hint":"",variant:"outlined",density:"compact",placeholder:"例如: 100M",clearable:""},null,8,["modelValue"])]),_:1})]),_:1}),t(be,{type:"info",variant:"tonal",density:"compact",class:"mt-1"},{default:n(()=>ye[100]||(ye[100]=[o(" 分享链接/分享码和分享密码 只需要二选一配置即可。"),i("br",null,null,-1),o(" 同时填写分享链接，分享码和分享密码时，优先读取分享链接。 ")])),_:1})]),_:1}),t(Ze),t(Pl,{class:"px-3 py-1"},{default:n(()=>[t(Cl,{color:"grey",variant:"text",onClick:el,size:"small"},{default:n(()=>ye[101]||(ye[101]=[o("取消")])),_:1}),t(Ml),t(Cl,{color:"primary",variant:"text",onClick:nl,loading:Me.value,disabled:!Qe.value,size:"small"},{default:n(()=>ye[102]||(ye[102]=[o(" 开始同步 ")])),_:1},8,["loading","disabled"])]),_:1})]),_:1})]),_:1},8,["modelValue"]),t($l,{modelValue:Oe.show,"onUpdate:modelValue":ye[19]||(ye[19]=e=>Oe.show=e),"max-width":"800",persistent:""},{default:n(()=>[t(gl,null,{default:n(()=>[t(ve,{class:"text-subtitle-1 d-flex align-center px-3 py-1 bg-primary-lighten-5"},{default:n(()=>[t(he,{icon:"mdi-cloud-download-outline",class:"mr-2",color:"primary",size:"small"}),ye[103]||(ye[103]=i("span",null,"115离线下载",-1)),t(Ml),t(Cl,{icon:"mdi-close",variant:"text",size:"small",onClick:ol})]),_:1}),t(_l,{class:"pa-0"},{default:n(()=>[t(Tl,{modelValue:Oe.activeTab,"onUpdate:modelValue":ye[15]||(ye[15]=e=>Oe.activeTab=e),"bg-color":"primary-gradient",grow:""},{default:n(()=>[t(El,{value:"tasks"},{default:n(()=>ye[104]||(ye[104]=[o("任务列表")])),_:1}),t(El,{value:"add"},{default:n(()=>ye[105]||(ye[105]=[o("添加任务")])),_:1})]),_:1},8,["modelValue"]),t(Fl,{modelValue:Oe.activeTab,"onUpdate:modelValue":ye[18]||(ye[18]=e=>Oe.activeTab=e),touchless:""},{default:n(()=>[t(Ll,{value:"tasks"},{default:n(()=>[i("div",de,[Oe.error?(r(),c(be,{key:0,type:"error",density:"compact",class:"ma-3",variant:"tonal"},{default:n(()=>[o(s(Oe.error),1)]),_:1})):d("",!0),t(Ul,{headers:Oe.headers,items:Oe.tasks,"items-length":Oe.totalTasks,loading:Oe.loading,"items-per-page":Oe.itemsPerPage,"onUpdate:options":rl,density:"compact",class:"ma-2","no-data-text":"没有离线下载任务","loading-text":"正在加载任务...","items-per-page-text":"每页条目数",style:{"min-width":"700px"}},{"item.progress":n(({item:e})=>[i("div",ue,[t(bl,{"model-value":e.percent,color:ul(e.status),stream:0===e.status||3===e.status,striped:0===e.status||3===e.status,height:"8",rounded:"",class:"flex-grow-1 mr-3"},null,8,["model-value","color","stream","striped"]),i("div",me,s(e.percent)+"% ",1)])]),"item.status_text":n(({item:e})=>[t(We,{color:ul(e.status),size:"x-small",variant:"tonal"},{default:n(()=>[o(s(e.status_text),1)]),_:2},1032,["color"])]),_:1},8,["headers","items","items-length","loading","items-per-page"])])]),_:1}),t(Ll,{value:"add"},{default:n(()=>[i("div",pe,[Oe.addError?(r(),c(be,{key:0,type:"error",density:"compact",class:"mb-3",variant:"tonal"},{default:n(()=>[o(s(Oe.addError),1)]),_:1})):d("",!0),t(Sl,{modelValue:Oe.links,"onUpdate:modelValue":ye[16]||(ye[16]=e=>Oe.links=e),label:"下载链接",hint:"每行一个链接，支持 http(s)/ftp/magnet/ed2k","persistent-hint":"",variant:"outlined",rows:"5",clearable:""},null,8,["modelValue"]),t(zl,{modelValue:Oe.destPath,"onUpdate:modelValue":ye[17]||(ye[17]=e=>Oe.destPath=e),label:"网盘保存路径 (可选)",hint:"可选，默认为网盘待整理目录","persistent-hint":"",variant:"outlined",density:"compact",class:"mt-3","append-inner-icon":"mdi-folder-network-outline","onClick:appendInner":dl,clearable:""},null,8,["modelValue"]),i("div",fe,[t(Cl,{color:"primary",onClick:cl,loading:Oe.adding,disabled:!Oe.links||Oe.adding,"prepend-icon":"mdi-plus"},{default:n(()=>ye[106]||(ye[106]=[o(" 添加任务 ")])),_:1},8,["loading","disabled"])])])]),_:1})]),_:1},8,["modelValue"])]),_:1})]),_:1})]),_:1},8,["modelValue"]),t($l,{modelValue:Xe.show,"onUpdate:modelValue":ye[21]||(ye[21]=e=>Xe.show=e),"max-width":"800"},{default:n(()=>[t(gl,null,{default:n(()=>[t(ve,{class:"text-subtitle-1 d-flex align-center px-3 py-1 bg-primary-lighten-5"},{default:n(()=>[t(he,{icon:Xe.isLocal?"mdi-folder-search":"mdi-folder-network",class:"mr-2",color:"primary"},null,8,["icon"]),i("span",null,s(Xe.isLocal?"选择本地目录":"选择网盘目录"),1)]),_:1}),t(_l,{class:"px-3 py-2"},{default:n(()=>[Xe.loading?(r(),u("div",_e,[t(Bl,{indeterminate:"",color:"primary"})])):(r(),u("div",ge,[t(zl,{modelValue:Xe.currentPath,"onUpdate:modelValue":ye[20]||(ye[20]=e=>Xe.currentPath=e),label:"当前路径",variant:"outlined",density:"compact",class:"mb-2",onKeyup:g(ll,["enter"])},null,8,["modelValue"]),t(fl,{class:"border rounded","max-height":"300px","overflow-y":"auto"},{default:n(()=>["/"!==Xe.currentPath&&"C:\\"!==Xe.currentPath&&"C:/"!==Xe.currentPath?(r(),c(De,{key:0,onClick:al,class:"py-0",style:{"min-height":"auto"}},{prepend:n(()=>[t(he,{icon:"mdi-arrow-up",size:"small",class:"mr-2",color:"grey"})]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>ye[107]||(ye[107]=[o("上级目录")])),_:1}),t(vl,null,{default:n(()=>ye[108]||(ye[108]=[o("..")])),_:1})]),_:1})):d("",!0),(r(!0),u(p,null,m(Xe.items,(e,l)=>(r(),c(De,{key:l,onClick:l=>(e=>{e&&e.is_dir&&e.path&&(Xe.currentPath=e.path,ll())})(e),disabled:!e.is_dir,class:"py-0",style:{"min-height":"auto"}},{prepend:n(()=>[t(he,{icon:e.is_dir?"mdi-folder":"mdi-file",size:"small",class:"mr-2",color:e.is_dir?"success":"blue"},null,8,["icon","color"])]),default:n(()=>[t(ke,{class:"text-body-2"},{default:n(()=>[o(s(e.name),1)]),_:2},1024)]),_:2},1032,["onClick","disabled"]))),128)),Xe.items.length?d("",!0):(r(),c(De,{key:1,class:"py-2 text-center"},{default:n(()=>[t(ke,{class:"text-body-2 text-grey"},{default:n(()=>ye[109]||(ye[109]=[o("该目录为空或访问受限")])),_:1})]),_:1}))]),_:1})])),"/"!==Xe.currentPath||Xe.isLocal?d("",!0):(r(),c(be,{key:2,type:"warning",density:"compact",class:"mt-2 text-caption",variant:"tonal",icon:"mdi-alert-circle-outline"},{default:n(()=>ye[110]||(ye[110]=[o(" 115离线下载不支持选择根目录，请选择或进入一个子目录。 ")])),_:1})),Xe.error?(r(),c(be,{key:3,type:"error",density:"compact",class:"mt-2 text-caption",variant:"tonal"},{default:n(()=>[o(s(Xe.error),1)]),_:1})):d("",!0)]),_:1}),t(Pl,{class:"px-3 py-1"},{default:n(()=>[t(Ml),t(Cl,{color:"primary",onClick:tl,disabled:!Xe.currentPath||Xe.loading||"/"===Xe.currentPath&&!Xe.isLocal,variant:"text",size:"small"},{default:n(()=>ye[111]||(ye[111]=[o(" 选择当前目录 ")])),_:1},8,["disabled"]),t(Cl,{color:"grey",onClick:il,variant:"text",size:"small"},{default:n(()=>ye[112]||(ye[112]=[o(" 取消 ")])),_:1})]),_:1})]),_:1})]),_:1},8,["modelValue"]),t($l,{modelValue:Se.value,"onUpdate:modelValue":ye[23]||(ye[23]=e=>Se.value=e),"max-width":"450",persistent:""},{default:n(()=>[t(gl,null,{default:n(()=>[t(ve,{class:"text-h6 d-flex align-center"},{default:n(()=>[t(he,{icon:"mdi-alert-circle-outline",color:"warning",class:"mr-2"}),ye[113]||(ye[113]=o(" 确认操作 "))]),_:1}),t(_l,null,{default:n(()=>ye[114]||(ye[114]=[o(" 您确定要立即执行全量同步吗？ ")])),_:1}),t(Pl,null,{default:n(()=>[t(Ml),t(Cl,{color:"grey",variant:"text",onClick:ye[22]||(ye[22]=e=>Se.value=!1),disabled:ze.value},{default:n(()=>ye[115]||(ye[115]=[o(" 取消 ")])),_:1},8,["disabled"]),t(Cl,{color:"warning",variant:"text",onClick:Ge,loading:ze.value},{default:n(()=>ye[116]||(ye[116]=[o(" 确认执行 ")])),_:1},8,["loading"])]),_:1})]),_:1})]),_:1},8,["modelValue"]),t($l,{modelValue:Fe.value,"onUpdate:modelValue":ye[25]||(ye[25]=e=>Fe.value=e),"max-width":"450",persistent:""},{default:n(()=>[t(gl,null,{default:n(()=>[t(ve,{class:"text-h6 d-flex align-center"},{default:n(()=>[t(he,{icon:"mdi-alert-circle-outline",color:"warning",class:"mr-2"}),ye[117]||(ye[117]=o(" 确认操作 "))]),_:1}),t(_l,null,{default:n(()=>ye[118]||(ye[118]=[o(" 您确定要立即执行全量同步数据库吗？该操作会清理缓存并覆盖数据库 ")])),_:1}),t(Pl,null,{default:n(()=>[t(Ml),t(Cl,{color:"grey",variant:"text",onClick:ye[24]||(ye[24]=e=>Fe.value=!1),disabled:Ve.value},{default:n(()=>ye[119]||(ye[119]=[o(" 取消 ")])),_:1},8,["disabled"]),t(Cl,{color:"warning",variant:"text",onClick:qe,loading:Ve.value},{default:n(()=>ye[120]||(ye[120]=[o(" 确认执行 ")])),_:1},8,["loading"])]),_:1})]),_:1})]),_:1},8,["modelValue"])],64)}}},[["__scopeId","data-v-35835a16"]]);export{ke as default};
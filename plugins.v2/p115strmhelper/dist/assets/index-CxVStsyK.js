@@ -1 +1 @@
-import{importShared as e}from"./__federation_fn_import-B6DyUTOO.js";import{p as t,i as a,a as l,e as n,g as o,b as i,c as r,d as s,u,m as c,f as d,h as v,j as p,k as f,l as m,n as g,o as h,q as y,r as b,s as w,S,t as k,v as x,w as V,x as C,y as _,z as I,A as B,B as P,C as A,D as N,E as T,I as E,F as D,G as R,H as $,J as L,K as F,L as M,M as O,N as z,O as j,P as H,Q as W,R as U,T as G,U as Y,V as q,W as K,X,Y as J,Z as Q,_ as Z,$ as ee,a0 as te,a1 as ae,a2 as le,a3 as ne,a4 as oe,a5 as ie,a6 as re,a7 as se,a8 as ue,a9 as ce,aa as de,ab as ve,ac as pe,ad as fe,ae as me,af as ge,ag as he,ah as ye,ai as be,aj as we,ak as Se,al as ke,am as xe,an as Ve,ao as Ce,ap as _e,aq as Ie,ar as Be,as as Pe,at as Ae,au as Ne,av as Te,aw as Ee,ax as De,ay as Re,az as $e,aA as Le,aB as Fe,aC as Me,aD as Oe,aE as ze,aF as je,aG as He,aH as We}from"./date-CpfvPJBx.js";import Ue from"./__federation_expose_Page-Bhr85p8x.js";import Ge from"./__federation_expose_Config-CPCf08ib.js";import{_ as Ye}from"./_plugin-vue_export-helper-BCo6x5W8.js";!function(){const e=document.createElement("link").relList;if(!(e&&e.supports&&e.supports("modulepreload"))){for(const e of document.querySelectorAll('link[rel="modulepreload"]'))t(e);new MutationObserver(e=>{for(const a of e)if("childList"===a.type)for(const e of a.addedNodes)"LINK"===e.tagName&&"modulepreload"===e.rel&&t(e)}).observe(document,{childList:!0,subtree:!0})}function t(e){if(e.ep)return;e.ep=!0;const t=function(e){const t={};return e.integrity&&(t.integrity=e.integrity),e.referrerPolicy&&(t.referrerPolicy=e.referrerPolicy),"use-credentials"===e.crossOrigin?t.credentials="include":"anonymous"===e.crossOrigin?t.credentials="omit":t.credentials="same-origin",t}(e);fetch(e.href,t)}}();const qe=t({class:[String,Array,Object],style:{type:[String,Array,Object],default:null}},"component"),Ke=["top","bottom"],Xe=["start","end","left","right"];function Je(e,t){let[l,n]=e.split(" ");return n||(n=a(Ke,l)?"start":a(Xe,l)?"top":"center"),{side:Qe(l,t),align:Qe(n,t)}}function Qe(e,t){return"start"===e?t?"right":"left":"end"===e?t?"left":"right":e}function Ze(e){return{side:{center:"center",top:"bottom",bottom:"top",left:"right",right:"left"}[e.side],align:e.align}}function et(e){return{side:e.side,align:{center:"center",top:"bottom",bottom:"top",left:"right",right:"left"}[e.align]}}function tt(e){return{side:e.align,align:e.side}}function at(e){return a(Ke,e.side)?"y":"x"}class lt{constructor(e){let{x:t,y:a,width:l,height:n}=e;this.x=t,this.y=a,this.width=l,this.height=n}get top(){return this.y}get bottom(){return this.y+this.height}get left(){return this.x}get right(){return this.x+this.width}}function nt(e,t){return{x:{before:Math.max(0,t.left-e.left),after:Math.max(0,e.right-t.right)},y:{before:Math.max(0,t.top-e.top),after:Math.max(0,e.bottom-t.bottom)}}}function ot(e){return Array.isArray(e)?new lt({x:e[0],y:e[1],width:0,height:0}):e.getBoundingClientRect()}function it(e){const t=e.getBoundingClientRect(),a=getComputedStyle(e),l=a.transform;if(l){let n,o,i,r,s;if(l.startsWith("matrix3d("))n=l.slice(9,-1).split(/, /),o=Number(n[0]),i=Number(n[5]),r=Number(n[12]),s=Number(n[13]);else{if(!l.startsWith("matrix("))return new lt(t);n=l.slice(7,-1).split(/, /),o=Number(n[0]),i=Number(n[3]),r=Number(n[4]),s=Number(n[5])}const u=a.transformOrigin,c=t.x-r-(1-o)*parseFloat(u),d=t.y-s-(1-i)*parseFloat(u.slice(u.indexOf(" ")+1)),v=o?t.width/o:e.offsetWidth+1,p=i?t.height/i:e.offsetHeight+1;return new lt({x:c,y:d,width:v,height:p})}return new lt(t)}function rt(e,t,a){if(void 0===e.animate)return{finished:Promise.resolve()};let l;try{l=e.animate(t,a)}catch(n){return{finished:Promise.resolve()}}return void 0===l.finished&&(l.finished=new Promise(e=>{l.onfinish=()=>{e(l)}})),l}const st=new WeakMap;const{camelize:ut,capitalize:ct,h:dt}=await e("vue");function vt(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"div",a=arguments.length>2?arguments[2]:void 0;return o()({name:a??ct(ut(e.replace(/__/g,"-"))),props:{tag:{type:String,default:t},...qe()},setup(t,a){let{slots:l}=a;return()=>dt(t.tag,{class:[e,t.class],style:t.style},l.default?.())}})}function pt(e){if("function"!=typeof e.getRootNode){for(;e.parentNode;)e=e.parentNode;return e!==document?null:document}const t=e.getRootNode();return t!==document&&t.getRootNode({composed:!0})!==document?null:t}const ft="cubic-bezier(0.4, 0, 0.2, 1)";function mt(e,t,a){return Object.keys(e).filter(e=>l(e)&&e.endsWith(t)).reduce((l,n)=>(l[n.slice(0,-t.length)]=t=>e[n](t,a(t)),l),{})}function gt(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];for(;e;){if(t?bt(e):yt(e))return e;e=e.parentElement}return document.scrollingElement}function ht(e,t){const a=[];if(t&&e&&!t.contains(e))return a;for(;e&&(yt(e)&&a.push(e),e!==t);)e=e.parentElement;return a}function yt(e){if(!e||e.nodeType!==Node.ELEMENT_NODE)return!1;const t=window.getComputedStyle(e);return"scroll"===t.overflowY||"auto"===t.overflowY&&e.scrollHeight>e.clientHeight}function bt(e){if(!e||e.nodeType!==Node.ELEMENT_NODE)return!1;const t=window.getComputedStyle(e);return["scroll","auto"].includes(t.overflowY)}function wt(e){i("useRender").render=e}const{createVNode:St}=await e("vue"),kt=t({...qe(),...d({fullHeight:!0}),...c()},"VApp"),xt=o()({name:"VApp",props:kt(),setup(e,t){let{slots:a}=t;const l=r(e),{layoutClasses:n,getLayoutItem:o,items:i,layoutRef:c}=s(e),{rtlClasses:d}=u();return wt(()=>St("div",{ref:c,class:["v-application",l.themeClasses.value,n.value,d.value,e.class],style:[e.style]},[St("div",{class:"v-application__wrap"},[a.default?.()])])),{getLayoutItem:o,items:i,theme:l}}}),Vt=t({tag:{type:[String,Object,Function],default:"div"}},"tag"),{createVNode:Ct}=await e("vue"),_t=t({text:String,...qe(),...Vt()},"VToolbarTitle"),It=o()({name:"VToolbarTitle",props:_t(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=!!(a.default||a.text||e.text);return Ct(e.tag,{class:["v-toolbar-title",e.class],style:e.style},{default:()=>[t&&Ct("div",{class:"v-toolbar-title__placeholder"},[a.text?a.text():e.text,a.default?.()])]})}),{}}}),{h:Bt,Transition:Pt,TransitionGroup:At}=await e("vue"),Nt=t({disabled:Boolean,group:Boolean,hideOnLeave:Boolean,leaveAbsolute:Boolean,mode:String,origin:String},"transition");function Tt(e,t,a){return o()({name:e,props:Nt({mode:a,origin:t}),setup(t,a){let{slots:l}=a;const n={onBeforeEnter(e){t.origin&&(e.style.transformOrigin=t.origin)},onLeave(e){if(t.leaveAbsolute){const{offsetTop:t,offsetLeft:a,offsetWidth:l,offsetHeight:n}=e;e._transitionInitialStyles={position:e.style.position,top:e.style.top,left:e.style.left,width:e.style.width,height:e.style.height},e.style.position="absolute",e.style.top=`${t}px`,e.style.left=`${a}px`,e.style.width=`${l}px`,e.style.height=`${n}px`}t.hideOnLeave&&e.style.setProperty("display","none","important")},onAfterLeave(e){if(t.leaveAbsolute&&e?._transitionInitialStyles){const{position:t,top:a,left:l,width:n,height:o}=e._transitionInitialStyles;delete e._transitionInitialStyles,e.style.position=t||"",e.style.top=a||"",e.style.left=l||"",e.style.width=n||"",e.style.height=o||""}}};return()=>{const a=t.group?At:Pt;return Bt(a,{name:t.disabled?"":e,css:!t.disabled,...t.group?void 0:{mode:t.mode},...t.disabled?{}:n},l.default)}}})}function Et(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"in-out";return o()({name:e,props:{mode:{type:String,default:a},disabled:Boolean,group:Boolean},setup(a,l){let{slots:n}=l;const o=a.group?At:Pt;return()=>Bt(o,{name:a.disabled?"":e,css:!a.disabled,...a.disabled?{}:t},n.default)}})}const{camelize:Dt}=await e("vue");function Rt(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"";const t=arguments.length>1&&void 0!==arguments[1]&&arguments[1]?"width":"height",a=Dt(`offset-${t}`);return{onBeforeEnter(e){e._parent=e.parentNode,e._initialStyle={transition:e.style.transition,overflow:e.style.overflow,[t]:e.style[t]}},onEnter(l){const n=l._initialStyle;if(!n)return;l.style.setProperty("transition","none","important"),l.style.overflow="hidden";const o=`${l[a]}px`;l.style[t]="0",l.offsetHeight,l.style.transition=n.transition,e&&l._parent&&l._parent.classList.add(e),requestAnimationFrame(()=>{l.style[t]=o})},onAfterEnter:n,onEnterCancelled:n,onLeave(e){e._initialStyle={transition:"",overflow:e.style.overflow,[t]:e.style[t]},e.style.overflow="hidden",e.style[t]=`${e[a]}px`,e.offsetHeight,requestAnimationFrame(()=>e.style[t]="0")},onAfterLeave:l,onLeaveCancelled:l};function l(t){e&&t._parent&&t._parent.classList.remove(e),n(t)}function n(e){if(!e._initialStyle)return;const a=e._initialStyle[t];e.style.overflow=e._initialStyle.overflow,null!=a&&(e.style[t]=a),delete e._initialStyle}}const{Transition:$t,mergeProps:Lt,createVNode:Ft}=await e("vue"),Mt=t({target:[Object,Array]},"v-dialog-transition"),Ot=new WeakMap,zt=o()({name:"VDialogTransition",props:Mt(),setup(e,t){let{slots:a}=t;const l={onBeforeEnter(e){e.style.pointerEvents="none",e.style.visibility="hidden"},async onEnter(t,a){await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>requestAnimationFrame(e)),t.style.visibility="";const l=Ht(e.target,t),{x:n,y:o,sx:i,sy:r,speed:s}=l;Ot.set(t,l);const u=rt(t,[{transform:`translate(${n}px, ${o}px) scale(${i}, ${r})`,opacity:0},{}],{duration:225*s,easing:"cubic-bezier(0.0, 0, 0.2, 1)"});jt(t)?.forEach(e=>{rt(e,[{opacity:0},{opacity:0,offset:.33},{}],{duration:450*s,easing:ft})}),u.finished.then(()=>a())},onAfterEnter(e){e.style.removeProperty("pointer-events")},onBeforeLeave(e){e.style.pointerEvents="none"},async onLeave(t,a){let l;await new Promise(e=>requestAnimationFrame(e)),l=!Ot.has(t)||Array.isArray(e.target)||e.target.offsetParent||e.target.getClientRects().length?Ht(e.target,t):Ot.get(t);const{x:n,y:o,sx:i,sy:r,speed:s}=l;rt(t,[{},{transform:`translate(${n}px, ${o}px) scale(${i}, ${r})`,opacity:0}],{duration:125*s,easing:"cubic-bezier(0.4, 0, 1, 1)"}).finished.then(()=>a()),jt(t)?.forEach(e=>{rt(e,[{},{opacity:0,offset:.2},{opacity:0}],{duration:250*s,easing:ft})})},onAfterLeave(e){e.style.removeProperty("pointer-events")}};return()=>e.target?Ft($t,Lt({name:"dialog-transition"},l,{css:!1}),a):Ft($t,{name:"dialog-transition"},a)}});function jt(e){const t=e.querySelector(":scope > .v-card, :scope > .v-sheet, :scope > .v-list")?.children;return t&&[...t]}function Ht(e,t){const a=ot(e),l=it(t),[n,o]=getComputedStyle(t).transformOrigin.split(" ").map(e=>parseFloat(e)),[i,r]=getComputedStyle(t).getPropertyValue("--v-overlay-anchor-origin").split(" ");let s=a.left+a.width/2;"left"===i||"left"===r?s-=a.width/2:"right"!==i&&"right"!==r||(s+=a.width/2);let u=a.top+a.height/2;"top"===i||"top"===r?u-=a.height/2:"bottom"!==i&&"bottom"!==r||(u+=a.height/2);const c=a.width/l.width,d=a.height/l.height,v=Math.max(1,c,d),p=c/v||0,f=d/v||0,m=l.width*l.height/(window.innerWidth*window.innerHeight),g=m>.12?Math.min(1.5,10*(m-.12)+1):1;return{x:s-(n+l.left),y:u-(o+l.top),sx:p,sy:f,speed:g}}const Wt=Tt("fab-transition","center center","out-in"),Ut=Tt("dialog-bottom-transition"),Gt=Tt("dialog-top-transition"),Yt=Tt("fade-transition"),qt=Tt("scale-transition"),Kt=Tt("scroll-x-transition"),Xt=Tt("scroll-x-reverse-transition"),Jt=Tt("scroll-y-transition"),Qt=Tt("scroll-y-reverse-transition"),Zt=Tt("slide-x-transition"),ea=Tt("slide-x-reverse-transition"),ta=Tt("slide-y-transition"),aa=Tt("slide-y-reverse-transition"),la=Et("expand-transition",Rt()),na=Et("expand-x-transition",Rt("",!0)),{toRefs:oa}=await e("vue"),ia=t({defaults:Object,disabled:Boolean,reset:[Number,String],root:[Boolean,String],scoped:Boolean},"VDefaultsProvider"),ra=o(!1)({name:"VDefaultsProvider",props:ia(),setup(e,t){let{slots:a}=t;const{defaults:l,disabled:n,reset:o,root:i,scoped:r}=oa(e);return v(l,{reset:o,root:i,scoped:r,disabled:n}),()=>a.default?.()}}),{computed:sa}=await e("vue"),ua=t({height:[Number,String],maxHeight:[Number,String],maxWidth:[Number,String],minHeight:[Number,String],minWidth:[Number,String],width:[Number,String]},"dimension");function ca(e){return{dimensionStyles:sa(()=>{const t={},a=p(e.height),l=p(e.maxHeight),n=p(e.maxWidth),o=p(e.minHeight),i=p(e.minWidth),r=p(e.width);return null!=a&&(t.height=a),null!=l&&(t.maxHeight=l),null!=n&&(t.maxWidth=n),null!=o&&(t.minHeight=o),null!=i&&(t.minWidth=i),null!=r&&(t.width=r),t})}}const{createVNode:da}=await e("vue"),{computed:va}=await e("vue");const pa=t({aspectRatio:[String,Number],contentClass:null,inline:Boolean,...qe(),...ua()},"VResponsive"),fa=o()({name:"VResponsive",props:pa(),setup(e,t){let{slots:a}=t;const{aspectStyles:l}=function(e){return{aspectStyles:va(()=>{const t=Number(e.aspectRatio);return t?{paddingBottom:String(1/t*100)+"%"}:void 0})}}(e),{dimensionStyles:n}=ca(e);return wt(()=>da("div",{class:["v-responsive",{"v-responsive--inline":e.inline},e.class],style:[n.value,e.style]},[da("div",{class:"v-responsive__sizer",style:l.value},null),a.additional?.(),a.default&&da("div",{class:["v-responsive__content",e.contentClass]},[a.default()])])),{}}}),{toValue:ma}=await e("vue");function ga(e){return f(()=>{const t=ma(e),a=[],l={};if(t.background)if(m(t.background)){if(l.backgroundColor=t.background,!t.text&&g(t.background)){const e=h(t.background);if(null==e.a||1===e.a){const t=y(e);l.color=t,l.caretColor=t}}}else a.push(`bg-${t.background}`);return t.text&&(m(t.text)?(l.color=t.text,l.caretColor=t.text):a.push(`text-${t.text}`)),{colorClasses:a,colorStyles:l}})}function ha(e){const{colorClasses:t,colorStyles:a}=ga(()=>({text:ma(e)}));return{textColorClasses:t,textColorStyles:a}}function ya(e){const{colorClasses:t,colorStyles:a}=ga(()=>({background:ma(e)}));return{backgroundColorClasses:t,backgroundColorStyles:a}}const{computed:ba,isRef:wa}=await e("vue"),Sa=t({rounded:{type:[Boolean,Number,String],default:void 0},tile:Boolean},"rounded");function ka(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{roundedClasses:ba(()=>{const a=wa(e)?e.value:e.rounded,l=wa(e)?e.value:e.tile,n=[];if(!0===a||""===a)n.push(`${t}--rounded`);else if("string"==typeof a||0===a)for(const e of String(a).split(" "))n.push(`rounded-${e}`);else(l||!1===a)&&n.push("rounded-0");return n})}}const{h:xa,mergeProps:Va,Transition:Ca,TransitionGroup:_a}=await e("vue"),Ia=t({transition:{type:null,default:"fade-transition",validator:e=>!0!==e}},"transition"),Ba=(e,t)=>{let{slots:a}=t;const{transition:l,disabled:n,group:o,...i}=e,{component:r=(o?_a:Ca),...s}=w(l)?l:{};let u;return u=w(l)?Va(s,JSON.parse(JSON.stringify({disabled:n,group:o})),i):Va({name:n||!l?"":l},i),xa(r,u,a)};function Pa(e,t){const a=e._observe?.[t.instance.$.uid];a&&(a.observer.unobserve(e),delete e._observe[t.instance.$.uid])}const Aa={mounted:function(e,t){if(!S)return;const a=t.modifiers||{},l=t.value,{handler:n,options:o}="object"==typeof l?l:{handler:l,options:{}},i=new IntersectionObserver(function(){let l=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],o=arguments.length>1?arguments[1]:void 0;const i=e._observe?.[t.instance.$.uid];if(!i)return;const r=l.some(e=>e.isIntersecting);!n||a.quiet&&!i.init||a.once&&!r&&!i.init||n(r,l,o),r&&a.once?Pa(e,t):i.init=!0},o);e._observe=Object(e._observe),e._observe[t.instance.$.uid]={init:!1,observer:i},i.observe(e)},unmounted:Pa},{createVNode:Na,Fragment:Ta,resolveDirective:Ea,mergeProps:Da,withDirectives:Ra}=await e("vue"),{computed:$a,nextTick:La,onBeforeMount:Fa,onBeforeUnmount:Ma,ref:Oa,shallowRef:za,toRef:ja,vShow:Ha,watch:Wa,withDirectives:Ua}=await e("vue"),Ga=t({absolute:Boolean,alt:String,cover:Boolean,color:String,draggable:{type:[Boolean,String],default:void 0},eager:Boolean,gradient:String,lazySrc:String,options:{type:Object,default:()=>({root:void 0,rootMargin:void 0,threshold:void 0})},sizes:String,src:{type:[String,Object],default:""},crossorigin:String,referrerpolicy:String,srcset:String,position:String,...pa(),...qe(),...Sa(),...Ia()},"VImg"),Ya=o()({name:"VImg",directives:{intersect:Aa},props:Ga(),emits:{loadstart:e=>!0,load:e=>!0,error:e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{roundedClasses:r}=ka(e),s=i("VImg"),u=za(""),c=Oa(),d=za(e.eager?"loading":"idle"),v=za(),f=za(),m=$a(()=>e.src&&"object"==typeof e.src?{src:e.src.src,srcset:e.srcset||e.src.srcset,lazySrc:e.lazySrc||e.src.lazySrc,aspect:Number(e.aspectRatio||e.src.aspect||0)}:{src:e.src,srcset:e.srcset,lazySrc:e.lazySrc,aspect:Number(e.aspectRatio||0)}),g=$a(()=>m.value.aspect||v.value/f.value||0);function h(t){if((!e.eager||!t)&&(!S||t||e.eager)){if(d.value="loading",m.value.lazySrc){const e=new Image;e.src=m.value.lazySrc,x(e,null)}m.value.src&&La(()=>{a("loadstart",c.value?.currentSrc||m.value.src),setTimeout(()=>{if(!s.isUnmounted)if(c.value?.complete){if(c.value.naturalWidth||b(),"error"===d.value)return;g.value||x(c.value,null),"loading"===d.value&&y()}else g.value||x(c.value),w()})})}}function y(){s.isUnmounted||(w(),x(c.value),d.value="loaded",a("load",c.value?.currentSrc||m.value.src))}function b(){s.isUnmounted||(d.value="error",a("error",c.value?.currentSrc||m.value.src))}function w(){const e=c.value;e&&(u.value=e.currentSrc||e.src)}Wa(()=>e.src,()=>{h("idle"!==d.value)}),Wa(g,(e,t)=>{!e&&t&&c.value&&x(c.value)}),Fa(()=>h());let k=-1;function x(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:100;const a=()=>{if(clearTimeout(k),s.isUnmounted)return;const{naturalHeight:l,naturalWidth:n}=e;l||n?(v.value=n,f.value=l):e.complete||"loading"!==d.value||null==t?(e.currentSrc.endsWith(".svg")||e.currentSrc.startsWith("data:image/svg+xml"))&&(v.value=1,f.value=1):k=window.setTimeout(a,t)};a()}Ma(()=>{clearTimeout(k)});const V=ja(()=>({"v-img__img--cover":e.cover,"v-img__img--contain":!e.cover})),C=()=>{if(!m.value.src||"idle"===d.value)return null;const t=Na("img",{class:["v-img__img",V.value],style:{objectPosition:e.position},crossorigin:e.crossorigin,src:m.value.src,srcset:m.value.srcset,alt:e.alt,referrerpolicy:e.referrerpolicy,draggable:e.draggable,sizes:e.sizes,ref:c,onLoad:y,onError:b},null),a=l.sources?.();return Na(Ba,{transition:e.transition,appear:!0},{default:()=>[Ua(a?Na("picture",{class:"v-img__picture"},[a,t]):t,[[Ha,"loaded"===d.value]])]})},_=()=>Na(Ba,{transition:e.transition},{default:()=>[m.value.lazySrc&&"loaded"!==d.value&&Na("img",{class:["v-img__img","v-img__img--preload",V.value],style:{objectPosition:e.position},crossorigin:e.crossorigin,src:m.value.lazySrc,alt:e.alt,referrerpolicy:e.referrerpolicy,draggable:e.draggable},null)]}),I=()=>l.placeholder?Na(Ba,{transition:e.transition,appear:!0},{default:()=>[("loading"===d.value||"error"===d.value&&!l.error)&&Na("div",{class:"v-img__placeholder"},[l.placeholder()])]}):null,B=()=>l.error?Na(Ba,{transition:e.transition,appear:!0},{default:()=>["error"===d.value&&Na("div",{class:"v-img__error"},[l.error()])]}):null,P=()=>e.gradient?Na("div",{class:"v-img__gradient",style:{backgroundImage:`linear-gradient(${e.gradient})`}},null):null,A=za(!1);{const e=Wa(g,t=>{t&&(requestAnimationFrame(()=>{requestAnimationFrame(()=>{A.value=!0})}),e())})}return wt(()=>{const t=fa.filterProps(e);return Ra(Na(fa,Da({class:["v-img",{"v-img--absolute":e.absolute,"v-img--booting":!A.value},n.value,r.value,e.class],style:[{width:p("auto"===e.width?v.value:e.width)},o.value,e.style]},t,{aspectRatio:g.value,"aria-label":e.alt,role:e.alt?"img":void 0}),{additional:()=>Na(Ta,null,[Na(C,null,null),Na(_,null,null),Na(P,null,null),Na(I,null,null),Na(B,null,null)]),default:l.default}),[[Ea("intersect"),{handler:h,options:e.options},null,{once:!0}]])}),{currentSrc:u,image:c,state:d,naturalWidth:v,naturalHeight:f}}}),{computed:qa}=await e("vue"),Ka=t({border:[Boolean,Number,String]},"border");function Xa(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{borderClasses:qa(()=>{const a=e.border;return!0===a||""===a?`${t}--border`:"string"==typeof a||0===a?String(a).split(" ").map(e=>`border-${e}`):[]})}}const{isRef:Ja,toRef:Qa}=await e("vue"),Za=t({elevation:{type:[Number,String],validator(e){const t=parseInt(e);return!isNaN(t)&&t>=0&&t<=24}}},"elevation");function el(e){return{elevationClasses:Qa(()=>{const t=Ja(e)?e.value:e.elevation;return null==t?[]:[`elevation-${t}`]})}}const{createVNode:tl}=await e("vue"),{computed:al,shallowRef:ll}=await e("vue"),nl=[null,"prominent","default","comfortable","compact"],ol=t({absolute:Boolean,collapse:Boolean,color:String,density:{type:String,default:"default",validator:e=>nl.includes(e)},extended:Boolean,extensionHeight:{type:[Number,String],default:48},flat:Boolean,floating:Boolean,height:{type:[Number,String],default:64},image:String,title:String,...Ka(),...qe(),...Za(),...Sa(),...Vt({tag:"header"}),...c()},"VToolbar"),il=o()({name:"VToolbar",props:ol(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.color),{borderClasses:o}=Xa(e),{elevationClasses:i}=el(e),{roundedClasses:s}=ka(e),{themeClasses:c}=r(e),{rtlClasses:d}=u(),f=ll(!(!e.extended&&!a.extension?.())),m=al(()=>parseInt(Number(e.height)+("prominent"===e.density?Number(e.height):0)-("comfortable"===e.density?8:0)-("compact"===e.density?16:0),10)),g=al(()=>f.value?parseInt(Number(e.extensionHeight)+("prominent"===e.density?Number(e.extensionHeight):0)-("comfortable"===e.density?4:0)-("compact"===e.density?8:0),10):0);return v({VBtn:{variant:"text"}}),wt(()=>{const t=!(!e.title&&!a.title),r=!(!a.image&&!e.image),u=a.extension?.();return f.value=!(!e.extended&&!u),tl(e.tag,{class:["v-toolbar",{"v-toolbar--absolute":e.absolute,"v-toolbar--collapse":e.collapse,"v-toolbar--flat":e.flat,"v-toolbar--floating":e.floating,[`v-toolbar--density-${e.density}`]:!0},l.value,o.value,i.value,s.value,c.value,d.value,e.class],style:[n.value,e.style]},{default:()=>[r&&tl("div",{key:"image",class:"v-toolbar__image"},[a.image?tl(ra,{key:"image-defaults",disabled:!e.image,defaults:{VImg:{cover:!0,src:e.image}}},a.image):tl(Ya,{key:"image-img",cover:!0,src:e.image},null)]),tl(ra,{defaults:{VTabs:{height:p(m.value)}}},{default:()=>[tl("div",{class:"v-toolbar__content",style:{height:p(m.value)}},[a.prepend&&tl("div",{class:"v-toolbar__prepend"},[a.prepend?.()]),t&&tl(It,{key:"title",text:e.title},{text:a.title}),a.default?.(),a.append&&tl("div",{class:"v-toolbar__append"},[a.append?.()])])]}),tl(ra,{defaults:{VTabs:{height:p(g.value)}}},{default:()=>[tl(la,null,{default:()=>[f.value&&tl("div",{class:"v-toolbar__extension",style:{height:p(g.value)}},[u])]})]})]})}),{contentHeight:m,extensionHeight:g}}}),{computed:rl,onBeforeUnmount:sl,onMounted:ul,ref:cl,shallowRef:dl,watch:vl}=await e("vue"),pl=t({scrollTarget:{type:String},scrollThreshold:{type:[String,Number],default:300}},"scroll");const{onMounted:fl,readonly:ml,shallowRef:gl,toRef:hl}=await e("vue");function yl(){const e=gl(!1);fl(()=>{window.requestAnimationFrame(()=>{e.value=!0})});return{ssrBootStyles:hl(()=>e.value?void 0:{transition:"none !important"}),isBooted:ml(e)}}const{mergeProps:bl,createVNode:wl}=await e("vue"),{computed:Sl,ref:kl,shallowRef:xl,toRef:Vl,watchEffect:Cl}=await e("vue"),_l=t({scrollBehavior:String,modelValue:{type:Boolean,default:!0},location:{type:String,default:"top",validator:e=>["top","bottom"].includes(e)},...ol(),...I(),...pl(),height:{type:[Number,String],default:64}},"VAppBar"),Il=o()({name:"VAppBar",props:_l(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=kl(),n=V(e,"modelValue"),o=Sl(()=>{const t=new Set(e.scrollBehavior?.split(" ")??[]);return{hide:t.has("hide"),fullyHide:t.has("fully-hide"),inverted:t.has("inverted"),collapse:t.has("collapse"),elevate:t.has("elevate"),fadeImage:t.has("fade-image")}}),i=Sl(()=>{const e=o.value;return e.hide||e.fullyHide||e.inverted||e.collapse||e.elevate||e.fadeImage||!n.value}),{currentScroll:r,scrollThreshold:s,isScrollingUp:u,scrollRatio:c}=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{canScroll:a}=t;let l=0,n=0;const o=cl(null),i=dl(0),r=dl(0),s=dl(0),u=dl(!1),c=dl(!1),d=rl(()=>Number(e.scrollThreshold)),v=rl(()=>k((d.value-i.value)/d.value||0)),p=()=>{const e=o.value;if(!e||a&&!a.value)return;l=i.value,i.value="window"in e?e.pageYOffset:e.scrollTop;const t=e instanceof Window?document.documentElement.scrollHeight:e.scrollHeight;n===t?(c.value=i.value<l,s.value=Math.abs(i.value-d.value)):n=t};return vl(c,()=>{r.value=r.value||i.value}),vl(u,()=>{r.value=0}),ul(()=>{vl(()=>e.scrollTarget,e=>{const t=e?document.querySelector(e):window;t?t!==o.value&&(o.value?.removeEventListener("scroll",p),o.value=t,o.value.addEventListener("scroll",p,{passive:!0})):x(`Unable to locate element with identifier ${e}`)},{immediate:!0})}),sl(()=>{o.value?.removeEventListener("scroll",p)}),a&&vl(a,p,{immediate:!0}),{scrollThreshold:d,currentScroll:i,currentThreshold:s,isScrollActive:u,scrollRatio:v,isScrollingUp:c,savedScroll:r}}(e,{canScroll:i}),d=Vl(()=>o.value.hide||o.value.fullyHide),v=Sl(()=>e.collapse||o.value.collapse&&(o.value.inverted?c.value>0:0===c.value)),p=Sl(()=>e.flat||o.value.fullyHide&&!n.value||o.value.elevate&&(o.value.inverted?r.value>0:0===r.value)),f=Sl(()=>o.value.fadeImage?o.value.inverted?1-c.value:c.value:void 0),m=Sl(()=>{if(o.value.hide&&o.value.inverted)return 0;const e=l.value?.contentHeight??0,t=l.value?.extensionHeight??0;return d.value?r.value<s.value||o.value.fullyHide?e+t:e:e+t});C(()=>!!e.scrollBehavior,()=>{Cl(()=>{d.value?o.value.inverted?n.value=r.value>s.value:n.value=u.value||r.value<s.value:n.value=!0})});const{ssrBootStyles:g}=yl(),{layoutItemStyles:h}=_({id:e.name,order:Sl(()=>parseInt(e.order,10)),position:Vl(()=>e.location),layoutSize:m,elementSize:xl(void 0),active:n,absolute:Vl(()=>e.absolute)});return wt(()=>{const t=il.filterProps(e);return wl(il,bl({ref:l,class:["v-app-bar",{"v-app-bar--bottom":"bottom"===e.location},e.class],style:[{...h.value,"--v-toolbar-image-opacity":f.value,height:void 0,...g.value},e.style]},t,{collapse:v.value,flat:p.value}),a)}),{}}}),{toRef:Bl}=await e("vue"),Pl=[null,"default","comfortable","compact"],Al=t({density:{type:String,default:"default",validator:e=>Pl.includes(e)}},"density");function Nl(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{densityClasses:Bl(()=>`${t}--density-${e.density}`)}}const{Fragment:Tl,createVNode:El}=await e("vue"),{toRef:Dl,toValue:Rl}=await e("vue"),$l=["elevated","flat","tonal","outlined","text","plain"];function Ll(e,t){return El(Tl,null,[e&&El("span",{key:"overlay",class:`${t}__overlay`},null),El("span",{key:"underlay",class:`${t}__underlay`},null)])}const Fl=t({color:String,variant:{type:String,default:"elevated",validator:e=>$l.includes(e)}},"variant");function Ml(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();const a=Dl(()=>{const{variant:a}=Rl(e);return`${t}--variant-${a}`}),{colorClasses:l,colorStyles:n}=ga(()=>{const{variant:t,color:a}=Rl(e);return{[["elevated","flat"].includes(t)?"background":"text"]:a}});return{colorClasses:l,colorStyles:n,variantClasses:a}}const{createVNode:Ol}=await e("vue"),{toRef:zl}=await e("vue"),jl=t({baseColor:String,divided:Boolean,...Ka(),...qe(),...Al(),...Za(),...Sa(),...Vt(),...c(),...Fl()},"VBtnGroup"),Hl=o()({name:"VBtnGroup",props:jl(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{densityClasses:n}=Nl(e),{borderClasses:o}=Xa(e),{elevationClasses:i}=el(e),{roundedClasses:s}=ka(e);v({VBtn:{height:"auto",baseColor:zl(()=>e.baseColor),color:zl(()=>e.color),density:zl(()=>e.density),flat:!0,variant:zl(()=>e.variant)}}),wt(()=>Ol(e.tag,{class:["v-btn-group",{"v-btn-group--divided":e.divided},l.value,o.value,n.value,i.value,s.value,e.class],style:e.style},a))}}),{computed:Wl,inject:Ul,onBeforeUnmount:Gl,onMounted:Yl,onUpdated:ql,provide:Kl,reactive:Xl,toRef:Jl,unref:Ql,useId:Zl,watch:en}=await e("vue"),tn=t({modelValue:{type:null,default:void 0},multiple:Boolean,mandatory:[Boolean,String],max:Number,selectedClass:String,disabled:Boolean},"group"),an=t({value:null,disabled:Boolean,selectedClass:String},"group-item");function ln(e,t){let a=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];const l=i("useGroupItem");if(!l)throw new Error("[Vuetify] useGroupItem composable must be used inside a component setup function");const n=Zl();Kl(Symbol.for(`${t.description}:id`),n);const o=Ul(t,null);if(!o){if(!a)return o;throw new Error(`[Vuetify] Could not find useGroup injection with symbol ${t.description}`)}const r=Jl(()=>e.value),s=Wl(()=>!(!o.disabled.value&&!e.disabled));o.register({id:n,value:r,disabled:s},l),Gl(()=>{o.unregister(n)});const u=Wl(()=>o.isSelected(n)),c=Wl(()=>o.items.value[0].id===n),d=Wl(()=>o.items.value[o.items.value.length-1].id===n),v=Wl(()=>u.value&&[o.selectedClass.value,e.selectedClass]);return en(u,e=>{l.emit("group:selected",{value:e})},{flush:"sync"}),{id:n,isSelected:u,isFirst:c,isLast:d,toggle:()=>o.select(n,!u.value),select:e=>o.select(n,e),selectedClass:v,value:r,disabled:s,group:o}}function nn(e,t){let a=!1;const l=Xl([]),n=V(e,"modelValue",[],e=>null==e?[]:on(l,P(e)),t=>{const a=function(e,t){const a=[];return t.forEach(t=>{const l=e.findIndex(e=>e.id===t);if(~l){const t=e[l];a.push(null!=t.value?t.value:l)}}),a}(l,t);return e.multiple?a:a[0]}),o=i("useGroup");function r(){const t=l.find(e=>!e.disabled);t&&"force"===e.mandatory&&!n.value.length&&(n.value=[t.id])}function s(t){if(e.multiple&&x('This method is not supported when using "multiple" prop'),n.value.length){const e=n.value[0],a=l.findIndex(t=>t.id===e);let o=(a+t)%l.length,i=l[o];for(;i.disabled&&o!==a;)o=(o+t)%l.length,i=l[o];if(i.disabled)return;n.value=[l[o].id]}else{const e=l.find(e=>!e.disabled);e&&(n.value=[e.id])}}Yl(()=>{r()}),Gl(()=>{a=!0}),ql(()=>{for(let e=0;e<l.length;e++)l[e].useIndexAsValue&&(l[e].value=e)});const u={register:function(e,a){const n=e,i=Symbol.for(`${t.description}:id`),r=A(i,o?.vnode).indexOf(a);null==Ql(n.value)&&(n.value=r,n.useIndexAsValue=!0),r>-1?l.splice(r,0,n):l.push(n)},unregister:function(e){if(a)return;r();const t=l.findIndex(t=>t.id===e);l.splice(t,1)},selected:n,select:function(t,a){const o=l.find(e=>e.id===t);if(!a||!o?.disabled)if(e.multiple){const l=n.value.slice(),o=l.findIndex(e=>e===t),i=~o;if(a=a??!i,i&&e.mandatory&&l.length<=1)return;if(!i&&null!=e.max&&l.length+1>e.max)return;o<0&&a?l.push(t):o>=0&&!a&&l.splice(o,1),n.value=l}else{const l=n.value.includes(t);if(e.mandatory&&l)return;n.value=a??!l?[t]:[]}},disabled:Jl(()=>e.disabled),prev:()=>s(l.length-1),next:()=>s(1),isSelected:e=>n.value.includes(e),selectedClass:Jl(()=>e.selectedClass),items:Jl(()=>l),getItemIndex:e=>function(e,t){const a=on(e,[t]);return a.length?e.findIndex(e=>e.id===a[0]):-1}(l,e)};return Kl(t,u),u}function on(e,t){const a=[];return t.forEach(t=>{const l=e.find(e=>B(t,e.value)),n=e[t];null!=l?.value?a.push(l.id):null!=n&&a.push(n.id)}),a}const{mergeProps:rn,createVNode:sn}=await e("vue"),un=Symbol.for("vuetify:v-btn-toggle"),cn=t({...jl(),...tn()},"VBtnToggle"),dn=o()({name:"VBtnToggle",props:cn(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{isSelected:l,next:n,prev:o,select:i,selected:r}=nn(e,un);return wt(()=>{const t=Hl.filterProps(e);return sn(Hl,rn({class:["v-btn-toggle",e.class]},t,{style:e.style}),{default:()=>[a.default?.({isSelected:l,next:n,prev:o,select:i,selected:r})]})}),{next:n,prev:o,select:i}}}),vn=["x-small","small","default","large","x-large"],pn=t({size:{type:[String,Number],default:"default"}},"size");function fn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return f(()=>{const l=e.size;let n,o;return a(vn,l)?n=`${t}--size-${l}`:l&&(o={width:p(l),height:p(l)}),{sizeClasses:n,sizeStyles:o}})}const{createVNode:mn}=await e("vue"),{shallowRef:gn,Text:hn}=await e("vue"),yn=t({color:String,disabled:Boolean,start:Boolean,end:Boolean,icon:E,opacity:[String,Number],...qe(),...pn(),...Vt({tag:"i"}),...c()},"VIcon"),bn=o()({name:"VIcon",props:yn(),setup(e,t){let{attrs:a,slots:l}=t;const n=gn(),{themeClasses:o}=N(),{iconData:i}=T(()=>n.value||e.icon),{sizeClasses:r}=fn(e),{textColorClasses:s,textColorStyles:u}=ha(()=>e.color);return wt(()=>{const t=l.default?.();t&&(n.value=D(t).filter(e=>e.type===hn&&e.children&&"string"==typeof e.children)[0]?.children);const c=!(!a.onClick&&!a.onClickOnce);return mn(i.value.component,{tag:e.tag,icon:i.value.icon,class:["v-icon","notranslate",o.value,r.value,s.value,{"v-icon--clickable":c,"v-icon--disabled":e.disabled,"v-icon--start":e.start,"v-icon--end":e.end},e.class],style:[{"--v-icon-opacity":e.opacity},r.value?void 0:{fontSize:p(e.size),height:p(e.size),width:p(e.size)},u.value,e.style],role:c?"button":void 0,"aria-hidden":!c,tabindex:c?e.disabled?-1:0:void 0},{default:()=>[t]})}),{}}}),{onBeforeUnmount:wn,ref:Sn,shallowRef:kn,watch:xn}=await e("vue");function Vn(e,t){const a=Sn(),l=kn(!1);if(S){const e=new IntersectionObserver(e=>{l.value=!!e.find(e=>e.isIntersecting)},t);wn(()=>{e.disconnect()}),xn(a,(t,a)=>{a&&(e.unobserve(a),l.value=!1),t&&e.observe(t)},{flush:"post"})}return{intersectionRef:a,isIntersecting:l}}const{createVNode:Cn}=await e("vue"),{ref:_n,toRef:In,watchEffect:Bn}=await e("vue"),Pn=t({bgColor:String,color:String,indeterminate:[Boolean,String],modelValue:{type:[Number,String],default:0},rotate:{type:[Number,String],default:0},width:{type:[Number,String],default:4},...qe(),...pn(),...Vt({tag:"div"}),...c()},"VProgressCircular"),An=o()({name:"VProgressCircular",props:Pn(),setup(e,t){let{slots:a}=t;const l=2*Math.PI*20,n=_n(),{themeClasses:o}=r(e),{sizeClasses:i,sizeStyles:s}=fn(e),{textColorClasses:u,textColorStyles:c}=ha(()=>e.color),{textColorClasses:d,textColorStyles:v}=ha(()=>e.bgColor),{intersectionRef:f,isIntersecting:m}=Vn(),{resizeRef:g,contentRect:h}=R(),y=In(()=>Math.max(0,Math.min(100,parseFloat(e.modelValue)))),b=In(()=>Number(e.width)),w=In(()=>s.value?Number(e.size):h.value?h.value.width:Math.max(b.value,32)),S=In(()=>20/(1-b.value/w.value)*2),k=In(()=>b.value/w.value*S.value),x=In(()=>p((100-y.value)/100*l));return Bn(()=>{f.value=n.value,g.value=n.value}),wt(()=>Cn(e.tag,{ref:n,class:["v-progress-circular",{"v-progress-circular--indeterminate":!!e.indeterminate,"v-progress-circular--visible":m.value,"v-progress-circular--disable-shrink":"disable-shrink"===e.indeterminate},o.value,i.value,u.value,e.class],style:[s.value,c.value,e.style],role:"progressbar","aria-valuemin":"0","aria-valuemax":"100","aria-valuenow":e.indeterminate?void 0:y.value},{default:()=>[Cn("svg",{style:{transform:`rotate(calc(-90deg + ${Number(e.rotate)}deg))`},xmlns:"http://www.w3.org/2000/svg",viewBox:`0 0 ${S.value} ${S.value}`},[Cn("circle",{class:["v-progress-circular__underlay",d.value],style:v.value,fill:"transparent",cx:"50%",cy:"50%",r:20,"stroke-width":k.value,"stroke-dasharray":l,"stroke-dashoffset":0},null),Cn("circle",{class:"v-progress-circular__overlay",fill:"transparent",cx:"50%",cy:"50%",r:20,"stroke-width":k.value,"stroke-dasharray":l,"stroke-dashoffset":x.value},null)]),a.default&&Cn("div",{class:"v-progress-circular__content"},[a.default({value:y.value})])]})),{}}}),{computed:Nn}=await e("vue"),Tn={center:"center",top:"bottom",bottom:"top",left:"right",right:"left"},En=t({location:String},"location");function Dn(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],a=arguments.length>2?arguments[2]:void 0;const{isRtl:l}=u(),n=Nn(()=>{if(!e.location)return{};const{side:n,align:o}=Je(e.location.split(" ").length>1?e.location:`${e.location} center`,l.value);function i(e){return a?a(e):0}const r={};return"center"!==n&&(t?r[Tn[n]]=`calc(100% - ${i(n)}px)`:r[n]=0),"center"!==o?t?r[Tn[o]]=`calc(100% - ${i(o)}px)`:r[o]=0:("center"===n?r.top=r.left="50%":r[{top:"left",bottom:"left",left:"top",right:"top"}[n]]="50%",r.transform={top:"translateX(-50%)",bottom:"translateX(-50%)",left:"translateY(-50%)",right:"translateY(-50%)",center:"translate(-50%, -50%)"}[n]),r});return{locationStyles:n}}const{createVNode:Rn}=await e("vue"),{computed:$n,Transition:Ln}=await e("vue"),Fn=t({absolute:Boolean,active:{type:Boolean,default:!0},bgColor:String,bgOpacity:[Number,String],bufferValue:{type:[Number,String],default:0},bufferColor:String,bufferOpacity:[Number,String],clickable:Boolean,color:String,height:{type:[Number,String],default:4},indeterminate:Boolean,max:{type:[Number,String],default:100},modelValue:{type:[Number,String],default:0},opacity:[Number,String],reverse:Boolean,stream:Boolean,striped:Boolean,roundedBar:Boolean,...qe(),...En({location:"top"}),...Sa(),...Vt(),...c()},"VProgressLinear"),Mn=o()({name:"VProgressLinear",props:Fn(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{isRtl:n,rtlClasses:o}=u(),{themeClasses:i}=r(e),{locationStyles:s}=Dn(e),{textColorClasses:c,textColorStyles:d}=ha(()=>e.color),{backgroundColorClasses:v,backgroundColorStyles:f}=ya(()=>e.bgColor||e.color),{backgroundColorClasses:m,backgroundColorStyles:g}=ya(()=>e.bufferColor||e.bgColor||e.color),{backgroundColorClasses:h,backgroundColorStyles:y}=ya(()=>e.color),{roundedClasses:b}=ka(e),{intersectionRef:w,isIntersecting:S}=Vn(),x=$n(()=>parseFloat(e.max)),C=$n(()=>parseFloat(e.height)),_=$n(()=>k(parseFloat(e.bufferValue)/x.value*100,0,100)),I=$n(()=>k(parseFloat(l.value)/x.value*100,0,100)),B=$n(()=>n.value!==e.reverse),P=$n(()=>e.indeterminate?"fade-transition":"slide-x-transition"),A=$&&window.matchMedia?.("(forced-colors: active)").matches;function N(e){if(!w.value)return;const{left:t,right:a,width:n}=w.value.getBoundingClientRect(),o=B.value?n-e.clientX+(a-n):e.clientX-t;l.value=Math.round(o/n*x.value)}return wt(()=>Rn(e.tag,{ref:w,class:["v-progress-linear",{"v-progress-linear--absolute":e.absolute,"v-progress-linear--active":e.active&&S.value,"v-progress-linear--reverse":B.value,"v-progress-linear--rounded":e.rounded,"v-progress-linear--rounded-bar":e.roundedBar,"v-progress-linear--striped":e.striped},b.value,i.value,o.value,e.class],style:[{bottom:"bottom"===e.location?0:void 0,top:"top"===e.location?0:void 0,height:e.active?p(C.value):0,"--v-progress-linear-height":p(C.value),...e.absolute?s.value:{}},e.style],role:"progressbar","aria-hidden":e.active?"false":"true","aria-valuemin":"0","aria-valuemax":e.max,"aria-valuenow":e.indeterminate?void 0:Math.min(parseFloat(l.value),x.value),onClick:e.clickable&&N},{default:()=>[e.stream&&Rn("div",{key:"stream",class:["v-progress-linear__stream",c.value],style:{...d.value,[B.value?"left":"right"]:p(-C.value),borderTop:`${p(C.value/2)} dotted`,opacity:parseFloat(e.bufferOpacity),top:`calc(50% - ${p(C.value/4)})`,width:p(100-_.value,"%"),"--v-progress-linear-stream-to":p(C.value*(B.value?1:-1))}},null),Rn("div",{class:["v-progress-linear__background",A?void 0:v.value],style:[f.value,{opacity:parseFloat(e.bgOpacity),width:e.stream?0:void 0}]},null),Rn("div",{class:["v-progress-linear__buffer",A?void 0:m.value],style:[g.value,{opacity:parseFloat(e.bufferOpacity),width:p(_.value,"%")}]},null),Rn(Ln,{name:P.value},{default:()=>[e.indeterminate?Rn("div",{class:"v-progress-linear__indeterminate"},[["long","short"].map(e=>Rn("div",{key:e,class:["v-progress-linear__indeterminate",e,A?void 0:h.value],style:y.value},null))]):Rn("div",{class:["v-progress-linear__determinate",A?void 0:h.value],style:[y.value,{width:p(I.value,"%")}]},null)]}),a.default&&Rn("div",{class:"v-progress-linear__content"},[a.default({value:I.value,buffer:_.value})])]})),{}}}),{createVNode:On}=await e("vue"),{toRef:zn}=await e("vue"),jn=t({loading:[Boolean,String]},"loader");function Hn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{loaderClasses:zn(()=>({[`${t}--loading`]:e.loading}))}}function Wn(e,t){let{slots:a}=t;return On("div",{class:`${e.name}__loader`},[a.default?.({color:e.color,isActive:e.active})||On(Mn,{absolute:e.absolute,active:e.active,color:e.color,height:"2",indeterminate:!0},null)])}const{toRef:Un}=await e("vue"),Gn=["static","relative","fixed","absolute","sticky"],Yn=t({position:{type:String,validator:e=>Gn.includes(e)}},"position");function qn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{positionClasses:Un(()=>e.position?`${t}--${e.position}`:void 0)}}const{computed:Kn,nextTick:Xn,onScopeDispose:Jn,reactive:Qn,resolveDynamicComponent:Zn,toRef:eo}=await e("vue");function to(){return i("useRouter")?.proxy?.$router}function ao(e,t){const a=Zn("RouterLink"),l=eo(()=>!(!e.href&&!e.to)),n=Kn(()=>l?.value||L(t,"click")||L(e,"click"));if("string"==typeof a||!("useLink"in a)){const t=eo(()=>e.href);return{isLink:l,isClickable:n,href:t,linkProps:Qn({href:t})}}const o=a.useLink({to:eo(()=>e.to||""),replace:eo(()=>e.replace)}),r=Kn(()=>e.to?o:void 0),s=function(){const e=i("useRoute");return Kn(()=>e?.proxy?.$route)}(),u=Kn(()=>!!r.value&&(e.exact?s.value?r.value.isExactActive?.value&&B(r.value.route.value.query,s.value.query):r.value.isExactActive?.value??!1:r.value.isActive?.value??!1)),c=Kn(()=>e.to?r.value?.route.value.href:e.href);return{isLink:l,isClickable:n,isActive:u,route:r.value?.route,navigate:r.value?.navigate,href:c,linkProps:Qn({href:c,"aria-current":eo(()=>u.value?"page":void 0)})}}const lo=t({href:String,replace:Boolean,to:[String,Object],exact:Boolean},"router");let no=!1;const{nextTick:oo,watch:io}=await e("vue");const ro=Symbol("rippleStop");function so(e,t){e.style.transform=t,e.style.webkitTransform=t}function uo(e){return"TouchEvent"===e.constructor.name}function co(e){return"KeyboardEvent"===e.constructor.name}const vo={show(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(!t?._ripple?.enabled)return;const l=document.createElement("span"),n=document.createElement("span");l.appendChild(n),l.className="v-ripple__container",a.class&&(l.className+=` ${a.class}`);const{radius:o,scale:i,x:r,y:s,centerX:u,centerY:c}=function(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},l=0,n=0;if(!co(e)){const a=t.getBoundingClientRect(),o=uo(e)?e.touches[e.touches.length-1]:e;l=o.clientX-a.left,n=o.clientY-a.top}let o=0,i=.3;t._ripple?.circle?(i=.15,o=t.clientWidth/2,o=a.center?o:o+Math.sqrt((l-o)**2+(n-o)**2)/4):o=Math.sqrt(t.clientWidth**2+t.clientHeight**2)/2;const r=(t.clientWidth-2*o)/2+"px",s=(t.clientHeight-2*o)/2+"px";return{radius:o,scale:i,x:a.center?r:l-o+"px",y:a.center?s:n-o+"px",centerX:r,centerY:s}}(e,t,a),d=2*o+"px";n.className="v-ripple__animation",n.style.width=d,n.style.height=d,t.appendChild(l);const v=window.getComputedStyle(t);v&&"static"===v.position&&(t.style.position="relative",t.dataset.previousPosition="static"),n.classList.add("v-ripple__animation--enter"),n.classList.add("v-ripple__animation--visible"),so(n,`translate(${r}, ${s}) scale3d(${i},${i},${i})`),n.dataset.activated=String(performance.now()),requestAnimationFrame(()=>{requestAnimationFrame(()=>{n.classList.remove("v-ripple__animation--enter"),n.classList.add("v-ripple__animation--in"),so(n,`translate(${u}, ${c}) scale3d(1,1,1)`)})})},hide(e){if(!e?._ripple?.enabled)return;const t=e.getElementsByClassName("v-ripple__animation");if(0===t.length)return;const a=t[t.length-1];if(a.dataset.isHiding)return;a.dataset.isHiding="true";const l=performance.now()-Number(a.dataset.activated),n=Math.max(250-l,0);setTimeout(()=>{a.classList.remove("v-ripple__animation--in"),a.classList.add("v-ripple__animation--out"),setTimeout(()=>{1===e.getElementsByClassName("v-ripple__animation").length&&e.dataset.previousPosition&&(e.style.position=e.dataset.previousPosition,delete e.dataset.previousPosition),a.parentNode?.parentNode===e&&e.removeChild(a.parentNode)},300)},n)}};function po(e){return void 0===e||!!e}function fo(e){const t={},a=e.currentTarget;if(a?._ripple&&!a._ripple.touched&&!e[ro]){if(e[ro]=!0,uo(e))a._ripple.touched=!0,a._ripple.isTouch=!0;else if(a._ripple.isTouch)return;if(t.center=a._ripple.centered||co(e),a._ripple.class&&(t.class=a._ripple.class),uo(e)){if(a._ripple.showTimerCommit)return;a._ripple.showTimerCommit=()=>{vo.show(e,a,t)},a._ripple.showTimer=window.setTimeout(()=>{a?._ripple?.showTimerCommit&&(a._ripple.showTimerCommit(),a._ripple.showTimerCommit=null)},80)}else vo.show(e,a,t)}}function mo(e){e[ro]=!0}function go(e){const t=e.currentTarget;if(t?._ripple){if(window.clearTimeout(t._ripple.showTimer),"touchend"===e.type&&t._ripple.showTimerCommit)return t._ripple.showTimerCommit(),t._ripple.showTimerCommit=null,void(t._ripple.showTimer=window.setTimeout(()=>{go(e)}));window.setTimeout(()=>{t._ripple&&(t._ripple.touched=!1)}),vo.hide(t)}}function ho(e){const t=e.currentTarget;t?._ripple&&(t._ripple.showTimerCommit&&(t._ripple.showTimerCommit=null),window.clearTimeout(t._ripple.showTimer))}let yo=!1;function bo(e){yo||e.keyCode!==F.enter&&e.keyCode!==F.space||(yo=!0,fo(e))}function wo(e){yo=!1,go(e)}function So(e){yo&&(yo=!1,go(e))}function ko(e,t,a){const{value:l,modifiers:n}=t,o=po(l);if(o||vo.hide(e),e._ripple=e._ripple??{},e._ripple.enabled=o,e._ripple.centered=n.center,e._ripple.circle=n.circle,w(l)&&l.class&&(e._ripple.class=l.class),o&&!a){if(n.stop)return e.addEventListener("touchstart",mo,{passive:!0}),void e.addEventListener("mousedown",mo);e.addEventListener("touchstart",fo,{passive:!0}),e.addEventListener("touchend",go,{passive:!0}),e.addEventListener("touchmove",ho,{passive:!0}),e.addEventListener("touchcancel",go),e.addEventListener("mousedown",fo),e.addEventListener("mouseup",go),e.addEventListener("mouseleave",go),e.addEventListener("keydown",bo),e.addEventListener("keyup",wo),e.addEventListener("blur",So),e.addEventListener("dragstart",go,{passive:!0})}else!o&&a&&xo(e)}function xo(e){e.removeEventListener("mousedown",fo),e.removeEventListener("touchstart",fo),e.removeEventListener("touchend",go),e.removeEventListener("touchmove",ho),e.removeEventListener("touchcancel",go),e.removeEventListener("mouseup",go),e.removeEventListener("mouseleave",go),e.removeEventListener("keydown",bo),e.removeEventListener("keyup",wo),e.removeEventListener("dragstart",go),e.removeEventListener("blur",So)}const Vo={mounted:function(e,t){ko(e,t,!1)},unmounted:function(e){delete e._ripple,xo(e)},updated:function(e,t){if(t.value===t.oldValue)return;ko(e,t,po(t.oldValue))}},{createVNode:Co,mergeProps:_o}=await e("vue"),{computed:Io,toDisplayString:Bo,toRef:Po,withDirectives:Ao}=await e("vue"),No=t({active:{type:Boolean,default:void 0},activeColor:String,baseColor:String,symbol:{type:null,default:un},flat:Boolean,icon:[Boolean,String,Function,Object],prependIcon:E,appendIcon:E,block:Boolean,readonly:Boolean,slim:Boolean,stacked:Boolean,ripple:{type:[Boolean,Object],default:!0},text:{type:[String,Number,Boolean],default:void 0},...Ka(),...qe(),...Al(),...ua(),...Za(),...an(),...jn(),...En(),...Yn(),...Sa(),...lo(),...pn(),...Vt({tag:"button"}),...c(),...Fl({variant:"elevated"})},"VBtn"),To=o()({name:"VBtn",props:No(),emits:{"group:selected":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{themeClasses:n}=r(e),{borderClasses:o}=Xa(e),{densityClasses:i}=Nl(e),{dimensionStyles:s}=ca(e),{elevationClasses:u}=el(e),{loaderClasses:c}=Hn(e),{locationStyles:d}=Dn(e),{positionClasses:v}=qn(e),{roundedClasses:p}=ka(e),{sizeClasses:f,sizeStyles:m}=fn(e),g=ln(e,e.symbol,!1),h=ao(e,a),y=Io(()=>void 0!==e.active?e.active:h.isLink.value?h.isActive?.value:g?.isSelected.value),b=Po(()=>y.value?e.activeColor??e.color:e.color),w=Io(()=>({color:g?.isSelected.value&&(!h.isLink.value||h.isActive?.value)||!g||h.isActive?.value?b.value??e.baseColor:e.baseColor,variant:e.variant})),{colorClasses:S,colorStyles:k,variantClasses:x}=Ml(w),V=Io(()=>g?.disabled.value||e.disabled),C=Po(()=>"elevated"===e.variant&&!(e.disabled||e.flat||e.border)),_=Io(()=>{if(void 0!==e.value&&"symbol"!=typeof e.value)return Object(e.value)===e.value?JSON.stringify(e.value,null,0):e.value});function I(e){V.value||h.isLink.value&&(e.metaKey||e.ctrlKey||e.shiftKey||0!==e.button||"_blank"===a.target)||(h.navigate?.(e),g?.toggle())}return function(e,t){io(()=>e.isActive?.value,a=>{e.isLink.value&&a&&t&&oo(()=>{t(!0)})},{immediate:!0})}(h,g?.select),wt(()=>{const t=h.isLink.value?"a":e.tag,a=!(!e.prependIcon&&!l.prepend),r=!(!e.appendIcon&&!l.append),b=!(!e.icon||!0===e.icon);return Ao(Co(t,_o({type:"a"===t?void 0:"button",class:["v-btn",g?.selectedClass.value,{"v-btn--active":y.value,"v-btn--block":e.block,"v-btn--disabled":V.value,"v-btn--elevated":C.value,"v-btn--flat":e.flat,"v-btn--icon":!!e.icon,"v-btn--loading":e.loading,"v-btn--readonly":e.readonly,"v-btn--slim":e.slim,"v-btn--stacked":e.stacked},n.value,o.value,S.value,i.value,u.value,c.value,v.value,p.value,f.value,x.value,e.class],style:[k.value,s.value,d.value,m.value,e.style],"aria-busy":!!e.loading||void 0,disabled:V.value||void 0,tabindex:e.loading||e.readonly?-1:void 0,onClick:I,value:_.value},h.linkProps),{default:()=>[Ll(!0,"v-btn"),!e.icon&&a&&Co("span",{key:"prepend",class:"v-btn__prepend"},[l.prepend?Co(ra,{key:"prepend-defaults",disabled:!e.prependIcon,defaults:{VIcon:{icon:e.prependIcon}}},l.prepend):Co(bn,{key:"prepend-icon",icon:e.prependIcon},null)]),Co("span",{class:"v-btn__content","data-no-activator":""},[!l.default&&b?Co(bn,{key:"content-icon",icon:e.icon},null):Co(ra,{key:"content-defaults",disabled:!b,defaults:{VIcon:{icon:e.icon}}},{default:()=>[l.default?.()??Bo(e.text)]})]),!e.icon&&r&&Co("span",{key:"append",class:"v-btn__append"},[l.append?Co(ra,{key:"append-defaults",disabled:!e.appendIcon,defaults:{VIcon:{icon:e.appendIcon}}},l.append):Co(bn,{key:"append-icon",icon:e.appendIcon},null)]),!!e.loading&&Co("span",{key:"loader",class:"v-btn__loader"},[l.loader?.()??Co(An,{color:"boolean"==typeof e.loading?void 0:e.loading,indeterminate:!0,width:"2"},null)])]}),[[Vo,!V.value&&e.ripple,"",{center:!!e.icon}]])}),{group:g}}}),{mergeProps:Eo,createVNode:Do}=await e("vue"),Ro=t({...No({icon:"$menu",variant:"text"})},"VAppBarNavIcon"),$o=o()({name:"VAppBarNavIcon",props:Ro(),setup(e,t){let{slots:a}=t;return wt(()=>Do(To,Eo(e,{class:["v-app-bar-nav-icon"]}),a)),{}}}),{mergeProps:Lo,createVNode:Fo}=await e("vue"),Mo=o()({name:"VAppBarTitle",props:_t(),setup(e,t){let{slots:a}=t;return wt(()=>Fo(It,Lo(e,{class:"v-app-bar-title"}),a)),{}}}),Oo=vt("v-alert-title"),{createVNode:zo,mergeProps:jo}=await e("vue"),{toRef:Ho}=await e("vue"),Wo=["success","info","warning","error"],Uo=t({border:{type:[Boolean,String],validator:e=>"boolean"==typeof e||["top","end","bottom","start"].includes(e)},borderColor:String,closable:Boolean,closeIcon:{type:E,default:"$close"},closeLabel:{type:String,default:"$vuetify.close"},icon:{type:[Boolean,String,Function,Object],default:null},modelValue:{type:Boolean,default:!0},prominent:Boolean,title:String,text:String,type:{type:String,validator:e=>Wo.includes(e)},...qe(),...Al(),...ua(),...Za(),...En(),...Yn(),...Sa(),...Vt(),...c(),...Fl({variant:"flat"})},"VAlert"),Go=o()({name:"VAlert",props:Uo(),emits:{"click:close":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=V(e,"modelValue"),o=Ho(()=>{if(!1!==e.icon)return e.type?e.icon??`$${e.type}`:e.icon}),{themeClasses:i}=r(e),{colorClasses:s,colorStyles:u,variantClasses:c}=Ml(()=>({color:e.color??e.type,variant:e.variant})),{densityClasses:d}=Nl(e),{dimensionStyles:v}=ca(e),{elevationClasses:p}=el(e),{locationStyles:f}=Dn(e),{positionClasses:m}=qn(e),{roundedClasses:g}=ka(e),{textColorClasses:h,textColorStyles:y}=ha(()=>e.borderColor),{t:b}=M(),w=Ho(()=>({"aria-label":b(e.closeLabel),onClick(e){n.value=!1,a("click:close",e)}}));return()=>{const t=!(!l.prepend&&!o.value),a=!(!l.title&&!e.title),r=!(!l.close&&!e.closable);return n.value&&zo(e.tag,{class:["v-alert",e.border&&{"v-alert--border":!!e.border,[`v-alert--border-${!0===e.border?"start":e.border}`]:!0},{"v-alert--prominent":e.prominent},i.value,s.value,d.value,p.value,m.value,g.value,c.value,e.class],style:[u.value,v.value,f.value,e.style],role:"alert"},{default:()=>[Ll(!1,"v-alert"),e.border&&zo("div",{key:"border",class:["v-alert__border",h.value],style:y.value},null),t&&zo("div",{key:"prepend",class:"v-alert__prepend"},[l.prepend?zo(ra,{key:"prepend-defaults",disabled:!o.value,defaults:{VIcon:{density:e.density,icon:o.value,size:e.prominent?44:28}}},l.prepend):zo(bn,{key:"prepend-icon",density:e.density,icon:o.value,size:e.prominent?44:28},null)]),zo("div",{class:"v-alert__content"},[a&&zo(Oo,{key:"title"},{default:()=>[l.title?.()??e.title]}),l.text?.()??e.text,l.default?.()]),l.append&&zo("div",{key:"append",class:"v-alert__append"},[l.append()]),r&&zo("div",{key:"close",class:"v-alert__close"},[l.close?zo(ra,{key:"close-defaults",defaults:{VBtn:{icon:e.closeIcon,size:"x-small",variant:"text"}}},{default:()=>[l.close?.({props:w.value})]}):zo(To,jo({key:"close-btn",icon:e.closeIcon,size:"x-small",variant:"text"},w.value),null)])]})}}}),{createVNode:Yo}=await e("vue"),qo=t({start:Boolean,end:Boolean,icon:E,image:String,text:String,...Ka(),...qe(),...Al(),...Sa(),...pn(),...Vt(),...c(),...Fl({variant:"flat"})},"VAvatar"),Ko=o()({name:"VAvatar",props:qo(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{borderClasses:n}=Xa(e),{colorClasses:o,colorStyles:i,variantClasses:s}=Ml(e),{densityClasses:u}=Nl(e),{roundedClasses:c}=ka(e),{sizeClasses:d,sizeStyles:v}=fn(e);return wt(()=>Yo(e.tag,{class:["v-avatar",{"v-avatar--start":e.start,"v-avatar--end":e.end},l.value,n.value,o.value,u.value,c.value,d.value,s.value,e.class],style:[i.value,v.value,e.style]},{default:()=>[a.default?Yo(ra,{key:"content-defaults",defaults:{VImg:{cover:!0,src:e.image},VIcon:{icon:e.icon}}},{default:()=>[a.default()]}):e.image?Yo(Ya,{key:"image",src:e.image,alt:"",cover:!0},null):e.icon?Yo(bn,{key:"icon",icon:e.icon},null):e.text,Ll(!1,"v-avatar")]})),{}}}),{createVNode:Xo}=await e("vue"),Jo=t({text:String,onClick:O(),...qe(),...c()},"VLabel"),Qo=o()({name:"VLabel",props:Jo(),setup(e,t){let{slots:a}=t;return wt(()=>Xo("label",{class:["v-label",{"v-label--clickable":!!e.onClick},e.class],style:e.style,onClick:e.onClick},[e.text,a.default?.()])),{}}}),{createVNode:Zo}=await e("vue"),{onScopeDispose:ei,provide:ti,toRef:ai,useId:li}=await e("vue"),ni=Symbol.for("vuetify:selection-control-group"),oi=t({color:String,disabled:{type:Boolean,default:null},defaultsTarget:String,error:Boolean,id:String,inline:Boolean,falseIcon:E,trueIcon:E,ripple:{type:[Boolean,Object],default:!0},multiple:{type:Boolean,default:null},name:String,readonly:{type:Boolean,default:null},modelValue:null,type:String,valueComparator:{type:Function,default:B},...qe(),...Al(),...c()},"SelectionControlGroup"),ii=t({...oi({defaultsTarget:"VSelectionControl"})},"VSelectionControlGroup"),ri=o()({name:"VSelectionControlGroup",props:ii(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),n=li(),o=ai(()=>e.id||`v-selection-control-group-${n}`),i=ai(()=>e.name||o.value),r=new Set;return ti(ni,{modelValue:l,forceUpdate:()=>{r.forEach(e=>e())},onForceUpdate:e=>{r.add(e),ei(()=>{r.delete(e)})}}),v({[e.defaultsTarget]:{color:ai(()=>e.color),disabled:ai(()=>e.disabled),density:ai(()=>e.density),error:ai(()=>e.error),inline:ai(()=>e.inline),modelValue:l,multiple:ai(()=>!!e.multiple||null==e.multiple&&Array.isArray(l.value)),name:i,falseIcon:ai(()=>e.falseIcon),trueIcon:ai(()=>e.trueIcon),readonly:ai(()=>e.readonly),ripple:ai(()=>e.ripple),type:ai(()=>e.type),valueComparator:ai(()=>e.valueComparator)}}),wt(()=>Zo("div",{class:["v-selection-control-group",{"v-selection-control-group--inline":e.inline},e.class],style:e.style,role:"radio"===e.type?"radiogroup":void 0},[a.default?.()])),{}}}),{mergeProps:si,createVNode:ui,Fragment:ci,resolveDirective:di,withDirectives:vi}=await e("vue"),{computed:pi,inject:fi,nextTick:mi,ref:gi,shallowRef:hi,toRef:yi,useId:bi}=await e("vue"),wi=t({label:String,baseColor:String,trueValue:null,falseValue:null,value:null,...qe(),...oi()},"VSelectionControl");const Si=o()({name:"VSelectionControl",directives:{Ripple:Vo},inheritAttrs:!1,props:wi(),emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{group:n,densityClasses:o,icon:i,model:r,textColorClasses:s,textColorStyles:u,backgroundColorClasses:c,backgroundColorStyles:d,trueValue:v}=function(e){const t=fi(ni,void 0),{densityClasses:a}=Nl(e),l=V(e,"modelValue"),n=pi(()=>void 0!==e.trueValue?e.trueValue:void 0===e.value||e.value),o=pi(()=>void 0!==e.falseValue&&e.falseValue),i=pi(()=>!!e.multiple||null==e.multiple&&Array.isArray(l.value)),r=pi({get(){const a=t?t.modelValue.value:l.value;return i.value?P(a).some(t=>e.valueComparator(t,n.value)):e.valueComparator(a,n.value)},set(a){if(e.readonly)return;const r=a?n.value:o.value;let s=r;i.value&&(s=a?[...P(l.value),r]:P(l.value).filter(t=>!e.valueComparator(t,n.value))),t?t.modelValue.value=s:l.value=s}}),{textColorClasses:s,textColorStyles:u}=ha(()=>{if(!e.error&&!e.disabled)return r.value?e.color:e.baseColor}),{backgroundColorClasses:c,backgroundColorStyles:d}=ya(()=>!r.value||e.error||e.disabled?e.baseColor:e.color),v=pi(()=>r.value?e.trueIcon:e.falseIcon);return{group:t,densityClasses:a,trueValue:n,falseValue:o,model:r,textColorClasses:s,textColorStyles:u,backgroundColorClasses:c,backgroundColorStyles:d,icon:v}}(e),p=bi(),f=hi(!1),m=hi(!1),g=gi(),h=yi(()=>e.id||`input-${p}`),y=yi(()=>!e.disabled&&!e.readonly);function b(e){y.value&&(f.value=!0,!1!==j(e.target,":focus-visible")&&(m.value=!0))}function w(){f.value=!1,m.value=!1}function S(e){e.stopPropagation()}function k(t){y.value?(e.readonly&&n&&mi(()=>n.forceUpdate()),r.value=t.target.checked):g.value&&(g.value.checked=r.value)}return n?.onForceUpdate(()=>{g.value&&(g.value.checked=r.value)}),wt(()=>{const t=l.label?l.label({label:e.label,props:{for:h.value}}):e.label,[n,p]=z(a),y=ui("input",si({ref:g,checked:r.value,disabled:!!e.disabled,id:h.value,onBlur:w,onFocus:b,onInput:k,"aria-disabled":!!e.disabled,"aria-label":e.label,type:e.type,value:v.value,name:e.name,"aria-checked":"checkbox"===e.type?r.value:void 0},p),null);return ui("div",si({class:["v-selection-control",{"v-selection-control--dirty":r.value,"v-selection-control--disabled":e.disabled,"v-selection-control--error":e.error,"v-selection-control--focused":f.value,"v-selection-control--focus-visible":m.value,"v-selection-control--inline":e.inline},o.value,e.class]},n,{style:e.style}),[ui("div",{class:["v-selection-control__wrapper",s.value],style:u.value},[l.default?.({backgroundColorClasses:c,backgroundColorStyles:d}),vi(ui("div",{class:["v-selection-control__input"]},[l.input?.({model:r,textColorClasses:s,textColorStyles:u,backgroundColorClasses:c,backgroundColorStyles:d,inputNode:y,icon:i.value,props:{onFocus:b,onBlur:w,id:h.value}})??ui(ci,null,[i.value&&ui(bn,{key:"icon",icon:i.value},null),y])]),[[di("ripple"),e.ripple&&[!e.disabled&&!e.readonly,null,["center","circle"]]]])]),t&&ui(Qo,{for:h.value,onClick:S},{default:()=>[t]})])}),{isFocused:f,input:g}}}),{mergeProps:ki,createVNode:xi}=await e("vue"),{toRef:Vi}=await e("vue"),Ci=t({indeterminate:Boolean,indeterminateIcon:{type:E,default:"$checkboxIndeterminate"},...wi({falseIcon:"$checkboxOff",trueIcon:"$checkboxOn"})},"VCheckboxBtn"),_i=o()({name:"VCheckboxBtn",props:Ci(),emits:{"update:modelValue":e=>!0,"update:indeterminate":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"indeterminate"),n=V(e,"modelValue");function o(e){l.value&&(l.value=!1)}const i=Vi(()=>l.value?e.indeterminateIcon:e.falseIcon),r=Vi(()=>l.value?e.indeterminateIcon:e.trueIcon);return wt(()=>{const t=H(Si.filterProps(e),["modelValue"]);return xi(Si,ki(t,{modelValue:n.value,"onUpdate:modelValue":[e=>n.value=e,o],class:["v-checkbox-btn",e.class],style:e.style,type:"checkbox",falseIcon:i.value,trueIcon:r.value,"aria-checked":l.value?"mixed":void 0}),a)}),{}}}),{createVNode:Ii}=await e("vue");function Bi(e){const{t:t}=M();return{InputIcon:function(a){let{name:l,color:n}=a;const o={prepend:"prependAction",prependInner:"prependAction",append:"appendAction",appendInner:"appendAction",clear:"clear"}[l],i=e[`onClick:${l}`],r=i&&o?t(`$vuetify.input.${o}`,e.label??""):void 0;return Ii(bn,{icon:e[`${l}Icon`],"aria-label":r,onClick:i,onKeydown:function(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),W(i,new PointerEvent("click",e)))},color:n},null)}}}const{createVNode:Pi}=await e("vue"),{computed:Ai}=await e("vue"),Ni=t({active:Boolean,color:String,messages:{type:[Array,String],default:()=>[]},...qe(),...Ia({transition:{component:ta,leaveAbsolute:!0,group:!0}})},"VMessages"),Ti=o()({name:"VMessages",props:Ni(),setup(e,t){let{slots:a}=t;const l=Ai(()=>P(e.messages)),{textColorClasses:n,textColorStyles:o}=ha(()=>e.color);return wt(()=>Pi(Ba,{transition:e.transition,tag:"div",class:["v-messages",n.value,e.class],style:[o.value,e.style]},{default:()=>[e.active&&l.value.map((e,t)=>Pi("div",{class:"v-messages__message",key:`${t}-${l.value}`},[a.message?a.message({message:e}):e]))]})),{}}}),{toRef:Ei}=await e("vue"),Di=t({focused:Boolean,"onUpdate:focused":O()},"focus");function Ri(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();const a=V(e,"focused");return{focusClasses:Ei(()=>({[`${t}--focused`]:a.value})),isFocused:a,focus:function(){a.value=!0},blur:function(){a.value=!1}}}const{computed:$i,inject:Li,markRaw:Fi,provide:Mi,ref:Oi,shallowRef:zi,toRef:ji,watch:Hi}=await e("vue"),Wi=Symbol.for("vuetify:form"),Ui=t({disabled:Boolean,fastFail:Boolean,readonly:Boolean,modelValue:{type:Boolean,default:null},validateOn:{type:String,default:"input"}},"form");function Gi(e){const t=Li(Wi,null);return{...t,isReadonly:$i(()=>!!(e?.readonly??t?.isReadonly.value)),isDisabled:$i(()=>!!(e?.disabled??t?.isDisabled.value))}}const{computed:Yi,nextTick:qi,onBeforeMount:Ki,onBeforeUnmount:Xi,onMounted:Ji,ref:Qi,shallowRef:Zi,unref:er,useId:tr,watch:ar}=await e("vue"),lr=t({disabled:{type:Boolean,default:null},error:Boolean,errorMessages:{type:[Array,String],default:()=>[]},maxErrors:{type:[Number,String],default:1},name:String,label:String,readonly:{type:Boolean,default:null},rules:{type:Array,default:()=>[]},modelValue:null,validateOn:String,validationValue:null,...Di()},"validation");function nr(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b(),a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:tr();const l=V(e,"modelValue"),n=Yi(()=>void 0===e.validationValue?l.value:e.validationValue),o=Gi(e),r=Qi([]),s=Zi(!0),u=Yi(()=>!(!P(""===l.value?null:l.value).length&&!P(""===n.value?null:n.value).length)),c=Yi(()=>e.errorMessages?.length?P(e.errorMessages).concat(r.value).slice(0,Math.max(0,Number(e.maxErrors))):r.value),d=Yi(()=>{let t=(e.validateOn??o.validateOn?.value)||"input";"lazy"===t&&(t="input lazy"),"eager"===t&&(t="input eager");const a=new Set(t?.split(" ")??[]);return{input:a.has("input"),blur:a.has("blur")||a.has("input")||a.has("invalid-input"),invalidInput:a.has("invalid-input"),lazy:a.has("lazy"),eager:a.has("eager")}}),v=Yi(()=>!e.error&&!e.errorMessages?.length&&(!e.rules.length||(s.value?!r.value.length&&!d.value.lazy||null:!r.value.length))),p=Zi(!1),f=Yi(()=>({[`${t}--error`]:!1===v.value,[`${t}--dirty`]:u.value,[`${t}--disabled`]:o.isDisabled.value,[`${t}--readonly`]:o.isReadonly.value})),m=i("validation"),g=Yi(()=>e.name??er(a));async function h(){l.value=null,await qi(),await y()}async function y(){s.value=!0,d.value.lazy?r.value=[]:await w(!d.value.eager)}async function w(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];const a=[];p.value=!0;for(const l of e.rules){if(a.length>=Number(e.maxErrors??1))break;const t="function"==typeof l?l:()=>l,o=await t(n.value);!0!==o&&(!1===o||"string"==typeof o?a.push(o||""):console.warn(`${o} is not a valid value. Rule functions must return boolean true or a string.`))}return r.value=a,p.value=!1,s.value=t,r.value}return Ki(()=>{o.register?.({id:g.value,vm:m,validate:w,reset:h,resetValidation:y})}),Xi(()=>{o.unregister?.(g.value)}),Ji(async()=>{d.value.lazy||await w(!d.value.eager),o.update?.(g.value,v.value,c.value)}),C(()=>d.value.input||d.value.invalidInput&&!1===v.value,()=>{ar(n,()=>{if(null!=n.value)w();else if(e.focused){const t=ar(()=>e.focused,e=>{e||w(),t()})}})}),C(()=>d.value.blur,()=>{ar(()=>e.focused,e=>{e||w()})}),ar([v,c],()=>{o.update?.(g.value,v.value,c.value)}),{errorMessages:c,isDirty:u,isDisabled:o.isDisabled,isReadonly:o.isReadonly,isPristine:s,isValid:v,isValidating:p,reset:h,resetValidation:y,validate:w,validationClasses:f}}const{createVNode:or}=await e("vue"),{computed:ir,toRef:rr,useId:sr}=await e("vue"),ur=t({id:String,appendIcon:E,baseColor:String,centerAffix:{type:Boolean,default:!0},color:String,glow:Boolean,iconColor:[Boolean,String],prependIcon:E,hideDetails:[Boolean,String],hideSpinButtons:Boolean,hint:String,persistentHint:Boolean,messages:{type:[Array,String],default:()=>[]},direction:{type:String,default:"horizontal",validator:e=>["horizontal","vertical"].includes(e)},"onClick:prepend":O(),"onClick:append":O(),...qe(),...Al(),...U(ua(),["maxWidth","minWidth","width"]),...c(),...lr()},"VInput"),cr=o()({name:"VInput",props:{...ur()},emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l,emit:n}=t;const{densityClasses:o}=Nl(e),{dimensionStyles:i}=ca(e),{themeClasses:s}=r(e),{rtlClasses:c}=u(),{InputIcon:d}=Bi(e),v=sr(),p=ir(()=>e.id||`input-${v}`),f=ir(()=>`${p.value}-messages`),{errorMessages:m,isDirty:g,isDisabled:h,isReadonly:y,isPristine:b,isValid:w,isValidating:S,reset:k,resetValidation:x,validate:V,validationClasses:C}=nr(e,"v-input",p),_=ir(()=>({id:p,messagesId:f,isDirty:g,isDisabled:h,isReadonly:y,isPristine:b,isValid:w,isValidating:S,reset:k,resetValidation:x,validate:V})),I=rr(()=>e.error||e.disabled?void 0:e.focused?e.color:e.baseColor),B=rr(()=>{if(e.iconColor)return!0===e.iconColor?I.value:e.iconColor}),P=ir(()=>e.errorMessages?.length||!b.value&&m.value.length?m.value:e.hint&&(e.persistentHint||e.focused)?e.hint:e.messages);return wt(()=>{const t=!(!l.prepend&&!e.prependIcon),a=!(!l.append&&!e.appendIcon),n=P.value.length>0,r=!e.hideDetails||"auto"===e.hideDetails&&(n||!!l.details);return or("div",{class:["v-input",`v-input--${e.direction}`,{"v-input--center-affix":e.centerAffix,"v-input--focused":e.focused,"v-input--glow":e.glow,"v-input--hide-spin-buttons":e.hideSpinButtons},o.value,s.value,c.value,C.value,e.class],style:[i.value,e.style]},[t&&or("div",{key:"prepend",class:"v-input__prepend"},[l.prepend?.(_.value),e.prependIcon&&or(d,{key:"prepend-icon",name:"prepend",color:B.value},null)]),l.default&&or("div",{class:"v-input__control"},[l.default?.(_.value)]),a&&or("div",{key:"append",class:"v-input__append"},[e.appendIcon&&or(d,{key:"append-icon",name:"append",color:B.value},null),l.append?.(_.value)]),r&&or("div",{id:f.value,class:"v-input__details",role:"alert","aria-live":"polite"},[or(Ti,{active:n,messages:P.value},{message:l.message}),l.details?.(_.value)])])}),{reset:k,resetValidation:x,validate:V,isValid:w,errorMessages:m}}}),{mergeProps:dr,createVNode:vr}=await e("vue"),{useId:pr}=await e("vue"),fr=t({...ur(),...H(Ci(),["inline"])},"VCheckbox"),mr=o()({name:"VCheckbox",inheritAttrs:!1,props:fr(),emits:{"update:modelValue":e=>!0,"update:focused":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=V(e,"modelValue"),{isFocused:o,focus:i,blur:r}=Ri(e),s=pr();return wt(()=>{const[t,u]=z(a),c=cr.filterProps(e),d=_i.filterProps(e);return vr(cr,dr({class:["v-checkbox",e.class]},t,c,{modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,id:e.id||`checkbox-${s}`,focused:o.value,style:e.style}),{...l,default:e=>{let{id:t,messagesId:a,isDisabled:o,isReadonly:s,isValid:c}=e;return vr(_i,dr(d,{id:t.value,"aria-describedby":a.value,disabled:o.value,readonly:s.value},u,{error:!1===c.value,modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,onFocus:i,onBlur:r}),l)}})}),{}}});function gr(e,t){const a=e?"scrollWidth":"scrollHeight";return t?.[a]||0}function hr(e,t,a){if(!a)return 0;const{scrollLeft:l,offsetWidth:n,scrollWidth:o}=a;return e?t?o-n+l:l:a.scrollTop}function yr(e,t){const a=e?"offsetWidth":"offsetHeight";return t?.[a]||0}function br(e,t){const a=e?"offsetLeft":"offsetTop";return t?.[a]||0}const{createVNode:wr}=await e("vue"),{computed:Sr,shallowRef:kr,watch:xr}=await e("vue"),Vr=Symbol.for("vuetify:v-slide-group"),Cr=t({centerActive:Boolean,direction:{type:String,default:"horizontal"},symbol:{type:null,default:Vr},nextIcon:{type:E,default:"$next"},prevIcon:{type:E,default:"$prev"},showArrows:{type:[Boolean,String],validator:e=>"boolean"==typeof e||["always","desktop","mobile"].includes(e)},...qe(),...q({mobile:null}),...Vt(),...tn({selectedClass:"v-slide-group-item--active"})},"VSlideGroup"),_r=o()({name:"VSlideGroup",props:Cr(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{isRtl:l}=u(),{displayClasses:n,mobile:o}=G(e),i=nn(e,e.symbol),r=kr(!1),s=kr(0),c=kr(0),d=kr(0),v=Sr(()=>"horizontal"===e.direction),{resizeRef:p,contentRect:f}=R(),{resizeRef:m,contentRect:g}=R(),h=Y(),y=Sr(()=>({container:p.el,duration:200,easing:"easeOutQuart"})),b=Sr(()=>i.selected.value.length?i.items.value.findIndex(e=>e.id===i.selected.value[0]):-1),w=Sr(()=>i.selected.value.length?i.items.value.findIndex(e=>e.id===i.selected.value[i.selected.value.length-1]):-1);if($){let t=-1;xr(()=>[i.selected.value,f.value,g.value,v.value],()=>{cancelAnimationFrame(t),t=requestAnimationFrame(()=>{if(f.value&&g.value){const e=v.value?"width":"height";c.value=f.value[e],d.value=g.value[e],r.value=c.value+1<d.value}if(b.value>=0&&m.el){k(m.el.children[w.value],e.centerActive)}})})}const S=kr(!1);function k(e,t){let a=0;a=t?function(e){let{selectedElement:t,containerElement:a,isHorizontal:l}=e;const n=yr(l,a);return br(l,t)-n/2+yr(l,t)/2}({containerElement:p.el,isHorizontal:v.value,selectedElement:e}):function(e){let{selectedElement:t,containerElement:a,isRtl:l,isHorizontal:n}=e;const o=yr(n,a),i=hr(n,l,a),r=yr(n,t),s=br(n,t),u=.4*r;return i>s?s-u:i+o<s+r?s-o+r+u:i}({containerElement:p.el,isHorizontal:v.value,isRtl:l.value,selectedElement:e}),x(a)}function x(e){if(!$||!p.el)return;const t=yr(v.value,p.el),a=hr(v.value,l.value,p.el);if(!(gr(v.value,p.el)<=t||Math.abs(e-a)<16)){if(v.value&&l.value&&p.el){const{scrollWidth:t,offsetWidth:a}=p.el;e=t-a-e}v.value?h.horizontal(e,y.value):h(e,y.value)}}function V(e){const{scrollTop:t,scrollLeft:a}=e.target;s.value=v.value?a:t}function C(e){if(S.value=!0,r.value&&m.el)for(const t of e.composedPath())for(const e of m.el.children)if(e===t)return void k(e)}function _(e){S.value=!1}let I=!1;function B(e){I||S.value||e.relatedTarget&&m.el?.contains(e.relatedTarget)||T(),I=!1}function P(){I=!0}function A(e){function t(t){e.preventDefault(),T(t)}m.el&&(v.value?"ArrowRight"===e.key?t(l.value?"prev":"next"):"ArrowLeft"===e.key&&t(l.value?"next":"prev"):"ArrowDown"===e.key?t("next"):"ArrowUp"===e.key&&t("prev"),"Home"===e.key?t("first"):"End"===e.key&&t("last"))}function N(e,t){if(!e)return;let a=e;do{a=a?.["next"===t?"nextElementSibling":"previousElementSibling"]}while(a?.hasAttribute("disabled"));return a}function T(e){if(!m.el)return;let t;if(e)if("next"===e){if(t=N(m.el.querySelector(":focus"),e),!t)return T("first")}else if("prev"===e){if(t=N(m.el.querySelector(":focus"),e),!t)return T("last")}else"first"===e?(t=m.el.firstElementChild,t?.hasAttribute("disabled")&&(t=N(t,"next"))):"last"===e&&(t=m.el.lastElementChild,t?.hasAttribute("disabled")&&(t=N(t,"prev")));else{t=K(m.el)[0]}t&&t.focus({preventScroll:!0})}function E(e){const t=v.value&&l.value?-1:1,a=("prev"===e?-t:t)*c.value;let n=s.value+a;if(v.value&&l.value&&p.el){const{scrollWidth:e,offsetWidth:t}=p.el;n+=e-t}x(n)}const D=Sr(()=>({next:i.next,prev:i.prev,select:i.select,isSelected:i.isSelected})),L=Sr(()=>{switch(e.showArrows){case"always":return!0;case"desktop":return!o.value;case!0:return r.value||Math.abs(s.value)>0;case"mobile":return o.value||r.value||Math.abs(s.value)>0;default:return!o.value&&(r.value||Math.abs(s.value)>0)}}),F=Sr(()=>Math.abs(s.value)>1),M=Sr(()=>{if(!p.value)return!1;const e=gr(v.value,p.el),t=function(e,t){const a=e?"clientWidth":"clientHeight";return t?.[a]||0}(v.value,p.el);return e-t-Math.abs(s.value)>1});return wt(()=>wr(e.tag,{class:["v-slide-group",{"v-slide-group--vertical":!v.value,"v-slide-group--has-affixes":L.value,"v-slide-group--is-overflowing":r.value},n.value,e.class],style:e.style,tabindex:S.value||i.selected.value.length?-1:0,onFocus:B},{default:()=>[L.value&&wr("div",{key:"prev",class:["v-slide-group__prev",{"v-slide-group__prev--disabled":!F.value}],onMousedown:P,onClick:()=>F.value&&E("prev")},[a.prev?.(D.value)??wr(Yt,null,{default:()=>[wr(bn,{icon:l.value?e.nextIcon:e.prevIcon},null)]})]),wr("div",{key:"container",ref:p,class:"v-slide-group__container",onScroll:V},[wr("div",{ref:m,class:"v-slide-group__content",onFocusin:C,onFocusout:_,onKeydown:A},[a.default?.(D.value)])]),L.value&&wr("div",{key:"next",class:["v-slide-group__next",{"v-slide-group__next--disabled":!M.value}],onMousedown:P,onClick:()=>M.value&&E("next")},[a.next?.(D.value)??wr(Yt,null,{default:()=>[wr(bn,{icon:l.value?e.prevIcon:e.nextIcon},null)]})])]})),{selected:i.selected,scrollTo:E,scrollOffset:s,focus:T,hasPrev:F,hasNext:M}}}),{mergeProps:Ir,createVNode:Br}=await e("vue"),{toRef:Pr}=await e("vue"),Ar=Symbol.for("vuetify:v-chip-group"),Nr=t({baseColor:String,column:Boolean,filter:Boolean,valueComparator:{type:Function,default:B},...Cr(),...qe(),...tn({selectedClass:"v-chip--selected"}),...Vt(),...c(),...Fl({variant:"tonal"})},"VChipGroup"),Tr=o()({name:"VChipGroup",props:Nr(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{isSelected:n,select:o,next:i,prev:s,selected:u}=nn(e,Ar);return v({VChip:{baseColor:Pr(()=>e.baseColor),color:Pr(()=>e.color),disabled:Pr(()=>e.disabled),filter:Pr(()=>e.filter),variant:Pr(()=>e.variant)}}),wt(()=>{const t=_r.filterProps(e);return Br(_r,Ir(t,{class:["v-chip-group",{"v-chip-group--column":e.column},l.value,e.class],style:e.style}),{default:()=>[a.default?.({isSelected:n,select:o,next:i,prev:s,selected:u.value})]})}),{}}}),{createVNode:Er,vShow:Dr,withDirectives:Rr,Fragment:$r,mergeProps:Lr,resolveDirective:Fr}=await e("vue"),{computed:Mr,toDisplayString:Or,toRef:zr}=await e("vue"),jr=t({activeClass:String,appendAvatar:String,appendIcon:E,baseColor:String,closable:Boolean,closeIcon:{type:E,default:"$delete"},closeLabel:{type:String,default:"$vuetify.close"},draggable:Boolean,filter:Boolean,filterIcon:{type:E,default:"$complete"},label:Boolean,link:{type:Boolean,default:void 0},pill:Boolean,prependAvatar:String,prependIcon:E,ripple:{type:[Boolean,Object],default:!0},text:{type:[String,Number,Boolean],default:void 0},modelValue:{type:Boolean,default:!0},onClick:O(),onClickOnce:O(),...Ka(),...qe(),...Al(),...Za(),...an(),...Sa(),...lo(),...pn(),...Vt({tag:"span"}),...c(),...Fl({variant:"tonal"})},"VChip"),Hr=o()({name:"VChip",directives:{Ripple:Vo},props:jr(),emits:{"click:close":e=>!0,"update:modelValue":e=>!0,"group:selected":e=>!0,click:e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{t:o}=M(),{borderClasses:i}=Xa(e),{densityClasses:s}=Nl(e),{elevationClasses:u}=el(e),{roundedClasses:c}=ka(e),{sizeClasses:d}=fn(e),{themeClasses:v}=r(e),p=V(e,"modelValue"),f=ln(e,Ar,!1),m=ao(e,a),g=zr(()=>!1!==e.link&&m.isLink.value),h=Mr(()=>!e.disabled&&!1!==e.link&&(!!f||e.link||m.isClickable.value)),y=zr(()=>({"aria-label":o(e.closeLabel),onClick(e){e.preventDefault(),e.stopPropagation(),p.value=!1,l("click:close",e)}})),{colorClasses:b,colorStyles:w,variantClasses:S}=Ml(()=>({color:!f||f.isSelected.value?e.color??e.baseColor:e.baseColor,variant:e.variant}));function k(e){l("click",e),h.value&&(m.navigate?.(e),f?.toggle())}function x(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),k(e))}return()=>{const t=m.isLink.value?"a":e.tag,a=!(!e.appendIcon&&!e.appendAvatar),l=!(!a&&!n.append),o=!(!n.close&&!e.closable),r=!(!n.filter&&!e.filter)&&f,V=!(!e.prependIcon&&!e.prependAvatar),C=!(!V&&!n.prepend);return p.value&&Rr(Er(t,Lr({class:["v-chip",{"v-chip--disabled":e.disabled,"v-chip--label":e.label,"v-chip--link":h.value,"v-chip--filter":r,"v-chip--pill":e.pill,[`${e.activeClass}`]:e.activeClass&&m.isActive?.value},v.value,i.value,b.value,s.value,u.value,c.value,d.value,S.value,f?.selectedClass.value,e.class],style:[w.value,e.style],disabled:e.disabled||void 0,draggable:e.draggable,tabindex:h.value?0:void 0,onClick:k,onKeydown:h.value&&!g.value&&x},m.linkProps),{default:()=>[Ll(h.value,"v-chip"),r&&Er(na,{key:"filter"},{default:()=>[Rr(Er("div",{class:"v-chip__filter"},[n.filter?Er(ra,{key:"filter-defaults",disabled:!e.filterIcon,defaults:{VIcon:{icon:e.filterIcon}}},n.filter):Er(bn,{key:"filter-icon",icon:e.filterIcon},null)]),[[Dr,f.isSelected.value]])]}),C&&Er("div",{key:"prepend",class:"v-chip__prepend"},[n.prepend?Er(ra,{key:"prepend-defaults",disabled:!V,defaults:{VAvatar:{image:e.prependAvatar,start:!0},VIcon:{icon:e.prependIcon,start:!0}}},n.prepend):Er($r,null,[e.prependIcon&&Er(bn,{key:"prepend-icon",icon:e.prependIcon,start:!0},null),e.prependAvatar&&Er(Ko,{key:"prepend-avatar",image:e.prependAvatar,start:!0},null)])]),Er("div",{class:"v-chip__content","data-no-activator":""},[n.default?.({isSelected:f?.isSelected.value,selectedClass:f?.selectedClass.value,select:f?.select,toggle:f?.toggle,value:f?.value.value,disabled:e.disabled})??Or(e.text)]),l&&Er("div",{key:"append",class:"v-chip__append"},[n.append?Er(ra,{key:"append-defaults",disabled:!a,defaults:{VAvatar:{end:!0,image:e.appendAvatar},VIcon:{end:!0,icon:e.appendIcon}}},n.append):Er($r,null,[e.appendIcon&&Er(bn,{key:"append-icon",end:!0,icon:e.appendIcon},null),e.appendAvatar&&Er(Ko,{key:"append-avatar",end:!0,image:e.appendAvatar},null)])]),o&&Er("button",Lr({key:"close",class:"v-chip__close",type:"button","data-testid":"close-chip"},y.value),[n.close?Er(ra,{key:"close-defaults",defaults:{VIcon:{icon:e.closeIcon,size:"x-small"}}},n.close):Er(bn,{key:"close-icon",icon:e.closeIcon,size:"x-small"},null)])]}),[[Fr("ripple"),h.value&&e.ripple,null]])}}}),{computed:Wr,inject:Ur,provide:Gr,shallowRef:Yr}=await e("vue"),qr=Symbol.for("vuetify:list");function Kr(){const e=Ur(qr,{hasPrepend:Yr(!1),updateHasPrepend:()=>null}),t={hasPrepend:Yr(!1),updateHasPrepend:e=>{e&&(t.hasPrepend.value=e)}};return Gr(qr,t),e}function Xr(){return Ur(qr,null)}const{toRaw:Jr}=await e("vue"),Qr=e=>{const t={activate:t=>{let{id:a,value:l,activated:n}=t;return a=Jr(a),e&&!l&&1===n.size&&n.has(a)||(l?n.add(a):n.delete(a)),n},in:(e,a,l)=>{let n=new Set;if(null!=e)for(const o of P(e))n=t.activate({id:o,value:!0,activated:new Set(n),children:a,parents:l});return n},out:e=>Array.from(e)};return t},Zr=e=>{const t=Qr(e);return{activate:e=>{let{activated:a,id:l,...n}=e;l=Jr(l);const o=a.has(l)?new Set([l]):new Set;return t.activate({...n,id:l,activated:o})},in:(e,a,l)=>{let n=new Set;if(null!=e){const o=P(e);o.length&&(n=t.in(o.slice(0,1),a,l))}return n},out:(e,a,l)=>t.out(e,a,l)}},es={open:e=>{let{id:t,value:a,opened:l,parents:n}=e;if(a){const e=new Set;e.add(t);let a=n.get(t);for(;null!=a;)e.add(a),a=n.get(a);return e}return l.delete(t),l},select:()=>null},ts={open:e=>{let{id:t,value:a,opened:l,parents:n}=e;if(a){let e=n.get(t);for(l.add(t);null!=e&&e!==t;)l.add(e),e=n.get(e);return l}return l.delete(t),l},select:()=>null},as={open:ts.open,select:e=>{let{id:t,value:a,opened:l,parents:n}=e;if(!a)return l;const o=[];let i=n.get(t);for(;null!=i;)o.push(i),i=n.get(i);return new Set(o)}},{toRaw:ls}=await e("vue"),ns=e=>{const t={select:t=>{let{id:a,value:l,selected:n}=t;if(a=ls(a),e&&!l){const e=Array.from(n.entries()).reduce((e,t)=>{let[a,l]=t;return"on"===l&&e.push(a),e},[]);if(1===e.length&&e[0]===a)return n}return n.set(a,l?"on":"off"),n},in:(e,a,l)=>{const n=new Map;for(const o of e||[])t.select({id:o,value:!0,selected:n,children:a,parents:l});return n},out:e=>{const t=[];for(const[a,l]of e.entries())"on"===l&&t.push(a);return t}};return t},os=e=>{const t=ns(e);return{select:e=>{let{selected:a,id:l,...n}=e;l=ls(l);const o=a.has(l)?new Map([[l,a.get(l)]]):new Map;return t.select({...n,id:l,selected:o})},in:(e,a,l)=>e?.length?t.in(e.slice(0,1),a,l):new Map,out:(e,a,l)=>t.out(e,a,l)}},is=e=>{const t={select:t=>{let{id:a,value:l,selected:n,children:o,parents:i}=t;a=ls(a);const r=new Map(n),s=[a];for(;s.length;){const e=s.shift();n.set(ls(e),l?"on":"off"),o.has(e)&&s.push(...o.get(e))}let u=ls(i.get(a));for(;u;){const e=o.get(u),t=e.every(e=>"on"===n.get(ls(e))),a=e.every(e=>!n.has(ls(e))||"off"===n.get(ls(e)));n.set(u,t?"on":a?"off":"indeterminate"),u=ls(i.get(u))}if(e&&!l){const e=Array.from(n.entries()).reduce((e,t)=>{let[a,l]=t;return"on"===l&&e.push(a),e},[]);if(0===e.length)return r}return n},in:(e,a,l)=>{let n=new Map;for(const o of e||[])n=t.select({id:o,value:!0,selected:n,children:a,parents:l});return n},out:(e,t)=>{const a=[];for(const[l,n]of e.entries())"on"!==n||t.has(l)||a.push(l);return a}};return t},{computed:rs,inject:ss,onBeforeMount:us,onBeforeUnmount:cs,provide:ds,ref:vs,shallowRef:ps,toRaw:fs,toRef:ms,toValue:gs}=await e("vue"),hs=Symbol.for("vuetify:nested"),ys={id:ps(),root:{register:()=>null,unregister:()=>null,parents:vs(new Map),children:vs(new Map),open:()=>null,openOnSelect:()=>null,activate:()=>null,select:()=>null,activatable:vs(!1),selectable:vs(!1),opened:vs(new Set),activated:vs(new Set),selected:vs(new Map),selectedValues:vs([]),getPath:()=>[]}},bs=t({activatable:Boolean,selectable:Boolean,activeStrategy:[String,Function,Object],selectStrategy:[String,Function,Object],openStrategy:[String,Object],opened:null,activated:null,selected:null,mandatory:Boolean},"nested"),ws=e=>{let t=!1;const a=vs(new Map),l=vs(new Map),n=V(e,"opened",e.opened,e=>new Set(e),e=>[...e.values()]),o=rs(()=>{if("object"==typeof e.activeStrategy)return e.activeStrategy;if("function"==typeof e.activeStrategy)return e.activeStrategy(e.mandatory);switch(e.activeStrategy){case"leaf":return(e=>{const t=Qr(e);return{activate:e=>{let{id:a,activated:l,children:n,...o}=e;return a=Jr(a),n.has(a)?l:t.activate({id:a,activated:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"single-leaf":return(e=>{const t=Zr(e);return{activate:e=>{let{id:a,activated:l,children:n,...o}=e;return a=Jr(a),n.has(a)?l:t.activate({id:a,activated:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"independent":return Qr(e.mandatory);default:return Zr(e.mandatory)}}),r=rs(()=>{if("object"==typeof e.selectStrategy)return e.selectStrategy;if("function"==typeof e.selectStrategy)return e.selectStrategy(e.mandatory);switch(e.selectStrategy){case"single-leaf":return(e=>{const t=os(e);return{select:e=>{let{id:a,selected:l,children:n,...o}=e;return a=ls(a),n.has(a)?l:t.select({id:a,selected:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"leaf":return(e=>{const t=ns(e);return{select:e=>{let{id:a,selected:l,children:n,...o}=e;return a=ls(a),n.has(a)?l:t.select({id:a,selected:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"independent":return ns(e.mandatory);case"single-independent":return os(e.mandatory);case"trunk":return(e=>{const t=is(e);return{select:t.select,in:t.in,out:(e,t,a)=>{const l=[];for(const[n,o]of e.entries())if("on"===o){if(a.has(n)){const t=a.get(n);if("on"===e.get(t))continue}l.push(n)}return l}}})(e.mandatory);default:return is(e.mandatory)}}),s=rs(()=>{if("object"==typeof e.openStrategy)return e.openStrategy;switch(e.openStrategy){case"list":return as;case"single":return es;default:return ts}}),u=V(e,"activated",e.activated,e=>o.value.in(e,a.value,l.value),e=>o.value.out(e,a.value,l.value)),c=V(e,"selected",e.selected,e=>r.value.in(e,a.value,l.value),e=>r.value.out(e,a.value,l.value));function d(e){const t=[];let a=e;for(;null!=a;)t.unshift(a),a=l.value.get(a);return t}cs(()=>{t=!0});const v=i("nested"),p=new Set,f={id:ps(),root:{opened:n,activatable:ms(()=>e.activatable),selectable:ms(()=>e.selectable),activated:u,selected:c,selectedValues:rs(()=>{const e=[];for(const[t,a]of c.value.entries())"on"===a&&e.push(t);return e}),register:(e,t,n)=>{if(p.has(e)){const a=d(e).map(String).join(" -> "),l=d(t).concat(e).map(String).join(" -> ");return void X(`Multiple nodes with the same ID\n\t${a}\n\t${l}`)}p.add(e),t&&e!==t&&l.value.set(e,t),n&&a.value.set(e,[]),null!=t&&a.value.set(t,[...a.value.get(t)||[],e])},unregister:e=>{if(t)return;p.delete(e),a.value.delete(e);const n=l.value.get(e);if(n){const t=a.value.get(n)??[];a.value.set(n,t.filter(t=>t!==e))}l.value.delete(e)},open:(e,t,o)=>{v.emit("click:open",{id:e,value:t,path:d(e),event:o});const i=s.value.open({id:e,value:t,opened:new Set(n.value),children:a.value,parents:l.value,event:o});i&&(n.value=i)},openOnSelect:(e,t,o)=>{const i=s.value.select({id:e,value:t,selected:new Map(c.value),opened:new Set(n.value),children:a.value,parents:l.value,event:o});i&&(n.value=i)},select:(e,t,n)=>{v.emit("click:select",{id:e,value:t,path:d(e),event:n});const o=r.value.select({id:e,value:t,selected:new Map(c.value),children:a.value,parents:l.value,event:n});o&&(c.value=o),f.root.openOnSelect(e,t,n)},activate:(t,n,i)=>{if(!e.activatable)return f.root.select(t,!0,i);v.emit("click:activate",{id:t,value:n,path:d(t),event:i});const r=o.value.activate({id:t,value:n,activated:new Set(u.value),children:a.value,parents:l.value,event:i});if(r.size!==u.value.size)u.value=r;else{for(const e of r)if(!u.value.has(e))return void(u.value=r);for(const e of u.value)if(!r.has(e))return void(u.value=r)}},children:a,parents:l,getPath:d}};return ds(hs,f),f.root},Ss=(e,t)=>{const a=ss(hs,ys),l=Symbol("nested item"),n=rs(()=>gs(e)??l),o={...a,id:n,open:(e,t)=>a.root.open(n.value,e,t),openOnSelect:(e,t)=>a.root.openOnSelect(n.value,e,t),isOpen:rs(()=>a.root.opened.value.has(n.value)),parent:rs(()=>a.root.parents.value.get(n.value)),activate:(e,t)=>a.root.activate(n.value,e,t),isActivated:rs(()=>a.root.activated.value.has(fs(n.value))),select:(e,t)=>a.root.select(n.value,e,t),isSelected:rs(()=>"on"===a.root.selected.value.get(fs(n.value))),isIndeterminate:rs(()=>"indeterminate"===a.root.selected.value.get(fs(n.value))),isLeaf:rs(()=>!a.root.children.value.get(n.value)),isGroupActivator:a.isGroupActivator};return us(()=>{!a.isGroupActivator&&a.root.register(n.value,a.id.value,t)}),cs(()=>{!a.isGroupActivator&&a.root.unregister(n.value)}),t&&ds(hs,o),o},{createVNode:ks,vShow:xs,withDirectives:Vs}=await e("vue"),{computed:Cs}=await e("vue"),_s=J({name:"VListGroupActivator",setup(e,t){let{slots:a}=t;return(()=>{const e=ss(hs,ys);ds(hs,{...e,isGroupActivator:!0})})(),()=>a.default?.()}}),Is=t({activeColor:String,baseColor:String,color:String,collapseIcon:{type:E,default:"$collapse"},expandIcon:{type:E,default:"$expand"},prependIcon:E,appendIcon:E,fluid:Boolean,subgroup:Boolean,title:String,value:null,...qe(),...Vt()},"VListGroup"),Bs=o()({name:"VListGroup",props:Is(),setup(e,t){let{slots:a}=t;const{isOpen:l,open:n,id:o}=Ss(()=>e.value,!0),i=Cs(()=>`v-list-group--id-${String(o.value)}`),r=Xr(),{isBooted:s}=yl();function u(e){e.stopPropagation(),["INPUT","TEXTAREA"].includes(e.target?.tagName)||n(!l.value,e)}const c=Cs(()=>({onClick:u,class:"v-list-group__header",id:i.value})),d=Cs(()=>l.value?e.collapseIcon:e.expandIcon),v=Cs(()=>({VListItem:{active:l.value,activeColor:e.activeColor,baseColor:e.baseColor,color:e.color,prependIcon:e.prependIcon||e.subgroup&&d.value,appendIcon:e.appendIcon||!e.subgroup&&d.value,title:e.title,value:e.value}}));return wt(()=>ks(e.tag,{class:["v-list-group",{"v-list-group--prepend":r?.hasPrepend.value,"v-list-group--fluid":e.fluid,"v-list-group--subgroup":e.subgroup,"v-list-group--open":l.value},e.class],style:e.style},{default:()=>[a.activator&&ks(ra,{defaults:v.value},{default:()=>[ks(_s,null,{default:()=>[a.activator({props:c.value,isOpen:l.value})]})]}),ks(Ba,{transition:{component:la},disabled:!s.value},{default:()=>[Vs(ks("div",{class:"v-list-group__items",role:"group","aria-labelledby":i.value},[a.default?.()]),[[xs,l.value]])]})]})),{isOpen:l}}}),{createVNode:Ps}=await e("vue"),As=t({opacity:[Number,String],...qe(),...Vt()},"VListItemSubtitle"),Ns=o()({name:"VListItemSubtitle",props:As(),setup(e,t){let{slots:a}=t;return wt(()=>Ps(e.tag,{class:["v-list-item-subtitle",e.class],style:[{"--v-list-item-subtitle-opacity":e.opacity},e.style]},a)),{}}}),Ts=vt("v-list-item-title"),{Fragment:Es,createVNode:Ds,resolveDirective:Rs,mergeProps:$s,withDirectives:Ls}=await e("vue"),{computed:Fs,onBeforeMount:Ms,toDisplayString:Os,toRef:zs,watch:js}=await e("vue"),Hs=t({active:{type:Boolean,default:void 0},activeClass:String,activeColor:String,appendAvatar:String,appendIcon:E,baseColor:String,disabled:Boolean,lines:[Boolean,String],link:{type:Boolean,default:void 0},nav:Boolean,prependAvatar:String,prependIcon:E,ripple:{type:[Boolean,Object],default:!0},slim:Boolean,subtitle:{type:[String,Number,Boolean],default:void 0},title:{type:[String,Number,Boolean],default:void 0},value:null,onClick:O(),onClickOnce:O(),...Ka(),...qe(),...Al(),...ua(),...Za(),...Sa(),...lo(),...Vt(),...c(),...Fl({variant:"text"})},"VListItem"),Ws=o()({name:"VListItem",directives:{Ripple:Vo},props:Hs(),emits:{click:e=>!0},setup(e,t){let{attrs:a,slots:l,emit:n}=t;const o=ao(e,a),i=Fs(()=>void 0===e.value?o.href.value:e.value),{activate:s,isActivated:u,select:c,isOpen:d,isSelected:v,isIndeterminate:p,isGroupActivator:f,root:m,parent:g,openOnSelect:h,id:y}=Ss(i,!1),b=Xr(),w=Fs(()=>!1!==e.active&&(e.active||o.isActive?.value||(m.activatable.value?u.value:v.value))),S=zs(()=>!1!==e.link&&o.isLink.value),k=Fs(()=>!!b&&(m.selectable.value||m.activatable.value||null!=e.value)),x=Fs(()=>!e.disabled&&!1!==e.link&&(e.link||o.isClickable.value||k.value)),V=zs(()=>e.rounded||e.nav),C=zs(()=>e.color??e.activeColor),_=zs(()=>({color:w.value?C.value??e.baseColor:e.baseColor,variant:e.variant}));function I(){null!=g.value&&m.open(g.value,!0),h(!0)}js(()=>o.isActive?.value,e=>{e&&I()}),Ms(()=>{o.isActive?.value&&I()});const{themeClasses:B}=r(e),{borderClasses:P}=Xa(e),{colorClasses:A,colorStyles:N,variantClasses:T}=Ml(_),{densityClasses:E}=Nl(e),{dimensionStyles:D}=ca(e),{elevationClasses:R}=el(e),{roundedClasses:$}=ka(V),L=zs(()=>e.lines?`v-list-item--${e.lines}-line`:void 0),F=Fs(()=>({isActive:w.value,select:c,isOpen:d.value,isSelected:v.value,isIndeterminate:p.value}));function M(t){n("click",t),["INPUT","TEXTAREA"].includes(t.target?.tagName)||x.value&&(o.navigate?.(t),f||(m.activatable.value?s(!u.value,t):(m.selectable.value||null!=e.value)&&c(!v.value,t)))}function O(e){const t=e.target;["INPUT","TEXTAREA"].includes(t.tagName)||"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.target.dispatchEvent(new MouseEvent("click",e)))}return wt(()=>{const t=S.value?"a":e.tag,a=l.title||null!=e.title,n=l.subtitle||null!=e.subtitle,i=!(!e.appendAvatar&&!e.appendIcon),r=!(!i&&!l.append),s=!(!e.prependAvatar&&!e.prependIcon),c=!(!s&&!l.prepend);return b?.updateHasPrepend(c),e.activeColor&&Q("active-color",["color","base-color"]),Ls(Ds(t,$s({class:["v-list-item",{"v-list-item--active":w.value,"v-list-item--disabled":e.disabled,"v-list-item--link":x.value,"v-list-item--nav":e.nav,"v-list-item--prepend":!c&&b?.hasPrepend.value,"v-list-item--slim":e.slim,[`${e.activeClass}`]:e.activeClass&&w.value},B.value,P.value,A.value,E.value,R.value,L.value,$.value,T.value,e.class],style:[N.value,D.value,e.style],tabindex:x.value?b?-2:0:void 0,"aria-selected":k.value?m.activatable.value?u.value:m.selectable.value?v.value:w.value:void 0,onClick:M,onKeydown:x.value&&!S.value&&O},o.linkProps),{default:()=>[Ll(x.value||w.value,"v-list-item"),c&&Ds("div",{key:"prepend",class:"v-list-item__prepend"},[l.prepend?Ds(ra,{key:"prepend-defaults",disabled:!s,defaults:{VAvatar:{density:e.density,image:e.prependAvatar},VIcon:{density:e.density,icon:e.prependIcon},VListItemAction:{start:!0}}},{default:()=>[l.prepend?.(F.value)]}):Ds(Es,null,[e.prependAvatar&&Ds(Ko,{key:"prepend-avatar",density:e.density,image:e.prependAvatar},null),e.prependIcon&&Ds(bn,{key:"prepend-icon",density:e.density,icon:e.prependIcon},null)]),Ds("div",{class:"v-list-item__spacer"},null)]),Ds("div",{class:"v-list-item__content","data-no-activator":""},[a&&Ds(Ts,{key:"title"},{default:()=>[l.title?.({title:e.title})??Os(e.title)]}),n&&Ds(Ns,{key:"subtitle"},{default:()=>[l.subtitle?.({subtitle:e.subtitle})??Os(e.subtitle)]}),l.default?.(F.value)]),r&&Ds("div",{key:"append",class:"v-list-item__append"},[l.append?Ds(ra,{key:"append-defaults",disabled:!i,defaults:{VAvatar:{density:e.density,image:e.appendAvatar},VIcon:{density:e.density,icon:e.appendIcon},VListItemAction:{end:!0}}},{default:()=>[l.append?.(F.value)]}):Ds(Es,null,[e.appendIcon&&Ds(bn,{key:"append-icon",density:e.density,icon:e.appendIcon},null),e.appendAvatar&&Ds(Ko,{key:"append-avatar",density:e.density,image:e.appendAvatar},null)]),Ds("div",{class:"v-list-item__spacer"},null)])]}),[[Rs("ripple"),x.value&&e.ripple]])}),{activate:s,isActivated:u,isGroupActivator:f,isSelected:v,list:b,select:c,root:m,id:y,link:o}}}),{createVNode:Us}=await e("vue"),Gs=t({color:String,inset:Boolean,sticky:Boolean,title:String,...qe(),...Vt()},"VListSubheader"),Ys=o()({name:"VListSubheader",props:Gs(),setup(e,t){let{slots:a}=t;const{textColorClasses:l,textColorStyles:n}=ha(()=>e.color);return wt(()=>{const t=!(!a.default&&!e.title);return Us(e.tag,{class:["v-list-subheader",{"v-list-subheader--inset":e.inset,"v-list-subheader--sticky":e.sticky},l.value,e.class],style:[{textColorStyles:n},e.style]},{default:()=>[t&&Us("div",{class:"v-list-subheader__text"},[a.default?.()??e.title])]})}),{}}}),{createVNode:qs}=await e("vue"),{computed:Ks}=await e("vue"),Xs=t({color:String,inset:Boolean,length:[Number,String],opacity:[Number,String],thickness:[Number,String],vertical:Boolean,...qe(),...c()},"VDivider"),Js=o()({name:"VDivider",props:Xs(),setup(e,t){let{attrs:a,slots:l}=t;const{themeClasses:n}=r(e),{textColorClasses:o,textColorStyles:i}=ha(()=>e.color),s=Ks(()=>{const t={};return e.length&&(t[e.vertical?"height":"width"]=p(e.length)),e.thickness&&(t[e.vertical?"borderRightWidth":"borderTopWidth"]=p(e.thickness)),t});return wt(()=>{const t=qs("hr",{class:[{"v-divider":!0,"v-divider--inset":e.inset,"v-divider--vertical":e.vertical},n.value,o.value,e.class],style:[s.value,i.value,{"--v-border-opacity":e.opacity},e.style],"aria-orientation":a.role&&"separator"!==a.role?void 0:e.vertical?"vertical":"horizontal",role:`${a.role||"separator"}`},null);return l.default?qs("div",{class:["v-divider__wrapper",{"v-divider__wrapper--vertical":e.vertical,"v-divider__wrapper--inset":e.inset}]},[t,qs("div",{class:"v-divider__content"},[l.default()]),t]):t}),{}}}),{createVNode:Qs,mergeProps:Zs}=await e("vue"),eu=t({items:Array,returnObject:Boolean},"VListChildren"),tu=o()({name:"VListChildren",props:eu(),setup(e,t){let{slots:a}=t;return Kr(),()=>a.default?.()??e.items?.map(t=>{let{children:l,props:n,type:o,raw:i}=t;if("divider"===o)return a.divider?.({props:n})??Qs(Js,n,null);if("subheader"===o)return a.subheader?.({props:n})??Qs(Ys,n,null);const r={subtitle:a.subtitle?e=>a.subtitle?.({...e,item:i}):void 0,prepend:a.prepend?e=>a.prepend?.({...e,item:i}):void 0,append:a.append?e=>a.append?.({...e,item:i}):void 0,title:a.title?e=>a.title?.({...e,item:i}):void 0},s=Bs.filterProps(n);return l?Qs(Bs,Zs({value:n?.value},s),{activator:t=>{let{props:l}=t;const o={...n,...l,value:e.returnObject?i:n.value};return a.header?a.header({props:o}):Qs(Ws,o,r)},default:()=>Qs(tu,{items:l,returnObject:e.returnObject},a)}):a.item?a.item({props:n}):Qs(Ws,Zs(n,{value:e.returnObject?i:n.value}),r)})}}),{computed:au,shallowRef:lu,watchEffect:nu}=await e("vue"),ou=t({items:{type:Array,default:()=>[]},itemTitle:{type:[String,Array,Function],default:"title"},itemValue:{type:[String,Array,Function],default:"value"},itemChildren:{type:[Boolean,String,Array,Function],default:"children"},itemProps:{type:[Boolean,String,Array,Function],default:"props"},returnObject:Boolean,valueComparator:Function},"list-items");function iu(e,t){const a=ee(t,e.itemTitle,t),l=ee(t,e.itemValue,a),n=ee(t,e.itemChildren),o={title:a,value:l,...!0===e.itemProps?"object"!=typeof t||null==t||Array.isArray(t)?void 0:"children"in t?H(t,["children"]):t:ee(t,e.itemProps)};return{title:String(o.title??""),value:o.value,props:o,children:Array.isArray(n)?ru(e,n):void 0,raw:t}}function ru(e,t){const a=U(e,["itemTitle","itemValue","itemChildren","itemProps","returnObject","valueComparator"]),l=[];for(const n of t)l.push(iu(a,n));return l}function su(e){const t=au(()=>ru(e,e.items)),a=au(()=>t.value.some(e=>null===e.value)),l=lu(new Map),n=lu([]);return nu(()=>{const e=t.value,a=new Map,o=[];for(let t=0;t<e.length;t++){const l=e[t];if(Z(l.value)||null===l.value){let e=a.get(l.value);e||(e=[],a.set(l.value,e)),e.push(l)}else o.push(l)}l.value=a,n.value=o}),{items:t,transformIn:function(o){const i=l.value,r=t.value,s=n.value,u=a.value,c=e.returnObject,d=!!e.valueComparator,v=e.valueComparator||B,p=U(e,["itemTitle","itemValue","itemChildren","itemProps","returnObject","valueComparator"]),f=[];e:for(const e of o){if(!u&&null===e)continue;if(c&&"string"==typeof e){f.push(iu(p,e));continue}const t=i.get(e);if(!d&&t)f.push(...t);else{for(const t of d?r:s)if(v(e,t.value)){f.push(t);continue e}f.push(iu(p,e))}}return f},transformOut:function(t){return e.returnObject?t.map(e=>{let{raw:t}=e;return t}):t.map(e=>{let{value:t}=e;return t})}}}const{createVNode:uu}=await e("vue"),{computed:cu,ref:du,shallowRef:vu,toRef:pu}=await e("vue");function fu(e,t){const a=ee(t,e.itemType,"item"),l=Z(t)?t:ee(t,e.itemTitle),n=ee(t,e.itemValue,void 0),o=ee(t,e.itemChildren),i={title:l,value:n,...!0===e.itemProps?H(t,["children"]):ee(t,e.itemProps)};return{type:a,title:i.title,value:i.value,props:i,children:"item"===a&&o?mu(e,o):void 0,raw:t}}function mu(e,t){const a=[];for(const l of t)a.push(fu(e,l));return a}const gu=t({baseColor:String,activeColor:String,activeClass:String,bgColor:String,disabled:Boolean,expandIcon:E,collapseIcon:E,lines:{type:[Boolean,String],default:"one"},slim:Boolean,nav:Boolean,"onClick:open":O(),"onClick:select":O(),"onUpdate:opened":O(),...bs({selectStrategy:"single-leaf",openStrategy:"list"}),...Ka(),...qe(),...Al(),...ua(),...Za(),itemType:{type:String,default:"type"},...ou(),...Sa(),...Vt(),...c(),...Fl({variant:"text"})},"VList"),hu=o()({name:"VList",props:gu(),emits:{"update:selected":e=>!0,"update:activated":e=>!0,"update:opened":e=>!0,"click:open":e=>!0,"click:activate":e=>!0,"click:select":e=>!0},setup(e,t){let{slots:a}=t;const{items:l}=function(e){return{items:cu(()=>mu(e,e.items))}}(e),{themeClasses:n}=r(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.bgColor),{borderClasses:s}=Xa(e),{densityClasses:u}=Nl(e),{dimensionStyles:c}=ca(e),{elevationClasses:d}=el(e),{roundedClasses:p}=ka(e),{children:f,open:m,parents:g,select:h,getPath:y}=ws(e),b=pu(()=>e.lines?`v-list--${e.lines}-line`:void 0),w=pu(()=>e.activeColor),S=pu(()=>e.baseColor),k=pu(()=>e.color);Kr(),v({VListGroup:{activeColor:w,baseColor:S,color:k,expandIcon:pu(()=>e.expandIcon),collapseIcon:pu(()=>e.collapseIcon)},VListItem:{activeClass:pu(()=>e.activeClass),activeColor:w,baseColor:S,color:k,density:pu(()=>e.density),disabled:pu(()=>e.disabled),lines:pu(()=>e.lines),nav:pu(()=>e.nav),slim:pu(()=>e.slim),variant:pu(()=>e.variant)}});const x=vu(!1),V=du();function C(e){x.value=!0}function _(e){x.value=!1}function I(e){x.value||e.relatedTarget&&V.value?.contains(e.relatedTarget)||A()}function B(e){const t=e.target;if(V.value&&!["INPUT","TEXTAREA"].includes(t.tagName)){if("ArrowDown"===e.key)A("next");else if("ArrowUp"===e.key)A("prev");else if("Home"===e.key)A("first");else{if("End"!==e.key)return;A("last")}e.preventDefault()}}function P(e){x.value=!0}function A(e){if(V.value)return te(V.value,e)}return wt(()=>uu(e.tag,{ref:V,class:["v-list",{"v-list--disabled":e.disabled,"v-list--nav":e.nav,"v-list--slim":e.slim},n.value,o.value,s.value,u.value,d.value,b.value,p.value,e.class],style:[i.value,c.value,e.style],tabindex:e.disabled?-1:0,role:"listbox","aria-activedescendant":void 0,onFocusin:C,onFocusout:_,onFocus:I,onKeydown:B,onMousedown:P},{default:()=>[uu(tu,{items:l.value,returnObject:e.returnObject},a)]})),{open:m,select:h,focus:A,children:f,parents:g,getPath:y}}}),yu=vt("v-list-img"),{createVNode:bu}=await e("vue"),wu=t({start:Boolean,end:Boolean,...qe(),...Vt()},"VListItemAction"),Su=o()({name:"VListItemAction",props:wu(),setup(e,t){let{slots:a}=t;return wt(()=>bu(e.tag,{class:["v-list-item-action",{"v-list-item-action--start":e.start,"v-list-item-action--end":e.end},e.class],style:e.style},a)),{}}}),{createVNode:ku}=await e("vue"),xu=t({start:Boolean,end:Boolean,...qe(),...Vt()},"VListItemMedia"),Vu=o()({name:"VListItemMedia",props:xu(),setup(e,t){let{slots:a}=t;return wt(()=>ku(e.tag,{class:["v-list-item-media",{"v-list-item-media--start":e.start,"v-list-item-media--end":e.end},e.class],style:e.style},a)),{}}});function Cu(e,t){return{x:e.x+t.x,y:e.y+t.y}}function _u(e,t){if("top"===e.side||"bottom"===e.side){const{side:a,align:l}=e;return Cu({x:"left"===l?0:"center"===l?t.width/2:"right"===l?t.width:l,y:"top"===a?0:"bottom"===a?t.height:a},t)}if("left"===e.side||"right"===e.side){const{side:a,align:l}=e;return Cu({x:"left"===a?0:"right"===a?t.width:a,y:"top"===l?0:"center"===l?t.height/2:"bottom"===l?t.height:l},t)}return Cu({x:t.width/2,y:t.height/2},t)}const{computed:Iu,nextTick:Bu,onScopeDispose:Pu,ref:Au,watch:Nu}=await e("vue"),Tu={static:function(){},connected:function(e,t,a){(Array.isArray(e.target.value)||function(e){for(;e;){if("fixed"===window.getComputedStyle(e).position)return!0;e=e.offsetParent}return!1}(e.target.value))&&Object.assign(a.value,{position:"fixed",top:0,[e.isRtl.value?"right":"left"]:0});const{preferredAnchor:l,preferredOrigin:n}=f(()=>{const a=Je(t.location,e.isRtl.value),l="overlap"===t.origin?a:"auto"===t.origin?Ze(a):Je(t.origin,e.isRtl.value);return a.side===l.side&&a.align===et(l).align?{preferredAnchor:tt(a),preferredOrigin:tt(l)}:{preferredAnchor:a,preferredOrigin:l}}),[o,i,r,s]=["minWidth","minHeight","maxWidth","maxHeight"].map(e=>Iu(()=>{const a=parseFloat(t[e]);return isNaN(a)?1/0:a})),u=Iu(()=>{if(Array.isArray(t.offset))return t.offset;if("string"==typeof t.offset){const e=t.offset.split(" ").map(parseFloat);return e.length<2&&e.push(0),e}return"number"==typeof t.offset?[t.offset,0]:[0,0]});let c=!1,d=-1;const v=new ae(4),m=new ResizeObserver(()=>{if(!c)return;if(requestAnimationFrame(e=>{e!==d&&v.clear(),requestAnimationFrame(e=>{d=e})}),v.isFull){const e=v.values();if(B(e.at(-1),e.at(-3)))return}const e=h();e&&v.push(e.flipped)});Nu([e.target,e.contentEl],(e,t)=>{let[a,l]=e,[n,o]=t;n&&!Array.isArray(n)&&m.unobserve(n),a&&!Array.isArray(a)&&m.observe(a),o&&m.unobserve(o),l&&m.observe(l)},{immediate:!0}),Pu(()=>{m.disconnect()});let g=new lt({x:0,y:0,width:0,height:0});function h(){if(c=!1,requestAnimationFrame(()=>c=!0),!e.target.value||!e.contentEl.value)return;(Array.isArray(e.target.value)||e.target.value.offsetParent||e.target.value.getClientRects().length)&&(g=ot(e.target.value));const t=function(e,t){const a=it(e);t?a.x+=parseFloat(e.style.right||0):a.x-=parseFloat(e.style.left||0);return a.y-=parseFloat(e.style.top||0),a}(e.contentEl.value,e.isRtl.value),d=ht(e.contentEl.value);d.length||(d.push(document.documentElement),e.contentEl.value.style.top&&e.contentEl.value.style.left||(t.x-=parseFloat(document.documentElement.style.getPropertyValue("--v-body-scroll-x")||0),t.y-=parseFloat(document.documentElement.style.getPropertyValue("--v-body-scroll-y")||0)));const v=d.reduce((e,t)=>{const a=t.getBoundingClientRect(),l=new lt({x:t===document.documentElement?0:a.x,y:t===document.documentElement?0:a.y,width:t.clientWidth,height:t.clientHeight});return e?new lt({x:Math.max(e.left,l.left),y:Math.max(e.top,l.top),width:Math.min(e.right,l.right)-Math.max(e.left,l.left),height:Math.min(e.bottom,l.bottom)-Math.max(e.top,l.top)}):l},void 0);v.x+=12,v.y+=12,v.width-=24,v.height-=24;let f={anchor:l.value,origin:n.value};function m(e){const a=new lt(t),l=_u(e.anchor,g),n=_u(e.origin,a);let{x:o,y:i}=(d=n,{x:(c=l).x-d.x,y:c.y-d.y});var c,d;switch(e.anchor.side){case"top":i-=u.value[0];break;case"bottom":i+=u.value[0];break;case"left":o-=u.value[0];break;case"right":o+=u.value[0]}switch(e.anchor.align){case"top":i-=u.value[1];break;case"bottom":i+=u.value[1];break;case"left":o-=u.value[1];break;case"right":o+=u.value[1]}a.x+=o,a.y+=i,a.width=Math.min(a.width,r.value),a.height=Math.min(a.height,s.value);return{overflows:nt(a,v),x:o,y:i}}let h=0,y=0;const b={x:0,y:0},w={x:!1,y:!1};let S=-1;for(;;){if(S++>10){X("Infinite loop detected in connectedLocationStrategy");break}const{x:e,y:a,overflows:l}=m(f);h+=e,y+=a,t.x+=e,t.y+=a;{const e=at(f.anchor),t=l.x.before||l.x.after,a=l.y.before||l.y.after;let n=!1;if(["x","y"].forEach(o=>{if("x"===o&&t&&!w.x||"y"===o&&a&&!w.y){const t={anchor:{...f.anchor},origin:{...f.origin}},a="x"===o?"y"===e?et:Ze:"y"===e?Ze:et;t.anchor=a(t.anchor),t.origin=a(t.origin);const{overflows:i}=m(t);(i[o].before<=l[o].before&&i[o].after<=l[o].after||i[o].before+i[o].after<(l[o].before+l[o].after)/2)&&(f=t,n=w[o]=!0)}}),n)continue}l.x.before&&(h+=l.x.before,t.x+=l.x.before),l.x.after&&(h-=l.x.after,t.x-=l.x.after),l.y.before&&(y+=l.y.before,t.y+=l.y.before),l.y.after&&(y-=l.y.after,t.y-=l.y.after);{const e=nt(t,v);b.x=v.width-e.x.before-e.x.after,b.y=v.height-e.y.before-e.y.after,h+=e.x.before,t.x+=e.x.before,y+=e.y.before,t.y+=e.y.before}break}const x=at(f.anchor);return Object.assign(a.value,{"--v-overlay-anchor-origin":`${f.anchor.side} ${f.anchor.align}`,transformOrigin:`${f.origin.side} ${f.origin.align}`,top:p(Du(y)),left:e.isRtl.value?void 0:p(Du(h)),right:e.isRtl.value?p(Du(-h)):void 0,minWidth:p("y"===x?Math.min(o.value,g.width):o.value),maxWidth:p(Ru(k(b.x,o.value===1/0?0:o.value,r.value))),maxHeight:p(Ru(k(b.y,i.value===1/0?0:i.value,s.value)))}),{available:b,contentBox:t,flipped:w}}return Nu(()=>[l.value,n.value,t.offset,t.minWidth,t.minHeight,t.maxWidth,t.maxHeight],()=>h()),Bu(()=>{const e=h();if(!e)return;const{available:t,contentBox:a}=e;a.height>t.y&&requestAnimationFrame(()=>{h(),requestAnimationFrame(()=>{h()})})}),{updateLocation:h}}},Eu=t({locationStrategy:{type:[String,Function],default:"static",validator:e=>"function"==typeof e||e in Tu},location:{type:String,default:"bottom"},origin:{type:String,default:"auto"},offset:[Number,String,Array]},"VOverlay-location-strategies");function Du(e){return Math.round(e*devicePixelRatio)/devicePixelRatio}function Ru(e){return Math.ceil(e*devicePixelRatio)/devicePixelRatio}let $u=!0;const Lu=[];let Fu=-1;function Mu(){cancelAnimationFrame(Fu),Fu=requestAnimationFrame(()=>{const e=Lu.shift();e&&e(),Lu.length?Mu():$u=!0})}const{effectScope:Ou,onScopeDispose:zu,watchEffect:ju}=await e("vue"),Hu={none:null,close:function(e){Uu(e.targetEl.value??e.contentEl.value,function(t){e.isActive.value=!1})},block:function(e,t){const a=e.root.value?.offsetParent,l=[...new Set([...ht(e.targetEl.value,t.contained?a:void 0),...ht(e.contentEl.value,t.contained?a:void 0)])].filter(e=>!e.classList.contains("v-overlay-scroll-blocked")),n=window.innerWidth-document.documentElement.offsetWidth,o=(i=a||document.documentElement,yt(i)&&i);var i;o&&e.root.value.classList.add("v-overlay--scroll-blocked");l.forEach((e,t)=>{e.style.setProperty("--v-body-scroll-x",p(-e.scrollLeft)),e.style.setProperty("--v-body-scroll-y",p(-e.scrollTop)),e!==document.documentElement&&e.style.setProperty("--v-scrollbar-offset",p(n)),e.classList.add("v-overlay-scroll-blocked")}),zu(()=>{l.forEach((e,t)=>{const a=parseFloat(e.style.getPropertyValue("--v-body-scroll-x")),l=parseFloat(e.style.getPropertyValue("--v-body-scroll-y")),n=e.style.scrollBehavior;e.style.scrollBehavior="auto",e.style.removeProperty("--v-body-scroll-x"),e.style.removeProperty("--v-body-scroll-y"),e.style.removeProperty("--v-scrollbar-offset"),e.classList.remove("v-overlay-scroll-blocked"),e.scrollLeft=-a,e.scrollTop=-l,e.style.scrollBehavior=n}),o&&e.root.value.classList.remove("v-overlay--scroll-blocked")})},reposition:function(e,t,a){let l=!1,n=-1,o=-1;function i(t){var a;a=()=>{const a=performance.now();e.updateLocation.value?.(t);const n=performance.now()-a;l=n/(1e3/60)>2},!$u||Lu.length?(Lu.push(a),Mu()):($u=!1,a(),Mu())}o=("undefined"==typeof requestIdleCallback?e=>e():requestIdleCallback)(()=>{a.run(()=>{Uu(e.targetEl.value??e.contentEl.value,e=>{l?(cancelAnimationFrame(n),n=requestAnimationFrame(()=>{n=requestAnimationFrame(()=>{i(e)})})):i(e)})})}),zu(()=>{"undefined"!=typeof cancelIdleCallback&&cancelIdleCallback(o),cancelAnimationFrame(n)})}},Wu=t({scrollStrategy:{type:[String,Function],default:"block",validator:e=>"function"==typeof e||e in Hu}},"VOverlay-scroll-strategies");function Uu(e,t){const a=[document,...ht(e)];a.forEach(e=>{e.addEventListener("scroll",t,{passive:!0})}),zu(()=>{a.forEach(e=>{e.removeEventListener("scroll",t)})})}const Gu=Symbol.for("vuetify:v-menu"),Yu=t({closeDelay:[Number,String],openDelay:[Number,String]},"delay");function qu(e,t){let a=()=>{};function l(l){a?.();const n=Number(l?e.openDelay:e.closeDelay);return new Promise(e=>{a=le(n,()=>{t?.(l),e(l)})})}return{clearDelay:a,runOpenDelay:function(){return l(!0)},runCloseDelay:function(){return l(!1)}}}const{computed:Ku,effectScope:Xu,inject:Ju,mergeProps:Qu,nextTick:Zu,onScopeDispose:ec,ref:tc,watch:ac,watchEffect:lc}=await e("vue"),nc=t({target:[String,Object],activator:[String,Object],activatorProps:{type:Object,default:()=>({})},openOnClick:{type:Boolean,default:void 0},openOnHover:Boolean,openOnFocus:{type:Boolean,default:void 0},closeOnContentClick:Boolean,...Yu()},"VOverlay-activator");function oc(e,t){let{isActive:a,isTop:o,contentEl:r}=t;const s=i("useActivator"),u=tc();let c=!1,d=!1,v=!0;const p=Ku(()=>e.openOnFocus||null==e.openOnFocus&&e.openOnHover),f=Ku(()=>e.openOnClick||null==e.openOnClick&&!e.openOnHover&&!p.value),{runOpenDelay:m,runCloseDelay:g}=qu(e,t=>{t!==(e.openOnHover&&c||p.value&&d)||e.openOnHover&&a.value&&!o.value||(a.value!==t&&(v=!0),a.value=t)}),h=tc(),y=e=>{e.stopPropagation(),u.value=e.currentTarget||e.target,a.value||(h.value=[e.clientX,e.clientY]),a.value=!a.value},b=e=>{e.sourceCapabilities?.firesTouchEvents||(c=!0,u.value=e.currentTarget||e.target,m())},w=e=>{c=!1,g()},S=e=>{!1!==j(e.target,":focus-visible")&&(d=!0,e.stopPropagation(),u.value=e.currentTarget||e.target,m())},k=e=>{d=!1,e.stopPropagation(),g()},x=Ku(()=>{const t={};return f.value&&(t.onClick=y),e.openOnHover&&(t.onMouseenter=b,t.onMouseleave=w),p.value&&(t.onFocus=S,t.onBlur=k),t}),V=Ku(()=>{const t={};if(e.openOnHover&&(t.onMouseenter=()=>{c=!0,m()},t.onMouseleave=()=>{c=!1,g()}),p.value&&(t.onFocusin=()=>{d=!0,m()},t.onFocusout=()=>{d=!1,g()}),e.closeOnContentClick){const e=Ju(Gu,null);t.onClick=()=>{a.value=!1,e?.closeParents()}}return t}),C=Ku(()=>{const t={};return e.openOnHover&&(t.onMouseenter=()=>{v&&(c=!0,v=!1,m())},t.onMouseleave=()=>{c=!1,g()}),t});ac(o,t=>{!t||(!e.openOnHover||c||p.value&&d)&&(!p.value||d||e.openOnHover&&c)||r.value?.contains(document.activeElement)||(a.value=!1)}),ac(a,e=>{e||setTimeout(()=>{h.value=void 0})},{flush:"post"});const _=ne();lc(()=>{_.value&&Zu(()=>{u.value=_.el})});const I=ne(),B=Ku(()=>"cursor"===e.target&&h.value?h.value:I.value?I.el:ic(e.target,s)||u.value),P=Ku(()=>Array.isArray(B.value)?void 0:B.value);let A;return ac(()=>!!e.activator,t=>{t&&$?(A=Xu(),A.run(()=>{!function(e,t,a){let{activatorEl:o,activatorEvents:i}=a;function r(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:u(),a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.activatorProps;t&&function(e,t){Object.keys(t).forEach(a=>{if(l(a)){const l=n(a),o=st.get(e);if(null==t[a])o?.forEach(t=>{const[a,n]=t;a===l&&(e.removeEventListener(l,n),o.delete(t))});else if(!o||![...o]?.some(e=>e[0]===l&&e[1]===t[a])){e.addEventListener(l,t[a]);const n=o||new Set;n.add([l,t[a]]),st.has(e)||st.set(e,n)}}else null==t[a]?e.removeAttribute(a):e.setAttribute(a,t[a])})}(t,Qu(i.value,a))}function s(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:u(),a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.activatorProps;t&&function(e,t){Object.keys(t).forEach(t=>{if(l(t)){const a=n(t),l=st.get(e);l?.forEach(t=>{const[n,o]=t;n===a&&(e.removeEventListener(a,o),l.delete(t))})}else e.removeAttribute(t)})}(t,Qu(i.value,a))}function u(){const a=ic(arguments.length>0&&void 0!==arguments[0]?arguments[0]:e.activator,t);return o.value=a?.nodeType===Node.ELEMENT_NODE?a:void 0,o.value}ac(()=>e.activator,(e,t)=>{if(t&&e!==t){const e=u(t);e&&s(e)}e&&Zu(()=>r())},{immediate:!0}),ac(()=>e.activatorProps,()=>{r()}),ec(()=>{s()})}(e,s,{activatorEl:u,activatorEvents:x})})):A&&A.stop()},{flush:"post",immediate:!0}),ec(()=>{A?.stop()}),{activatorEl:u,activatorRef:_,target:B,targetEl:P,targetRef:I,activatorEvents:x,contentEvents:V,scrimEvents:C}}function ic(e,t){if(!e)return;let a;if("parent"===e){let e=t?.proxy?.$el?.parentNode;for(;e?.hasAttribute("data-no-activator");)e=e.parentNode;a=e}else a="string"==typeof e?document.querySelector(e):"$el"in e?e.$el:e;return a}const{onMounted:rc,shallowRef:sc}=await e("vue");function uc(){if(!$)return sc(!1);const{ssr:e}=G();if(e){const e=sc(!1);return rc(()=>{e.value=!0}),e}return sc(!0)}const{shallowRef:cc,toRef:dc,watch:vc}=await e("vue"),pc=t({eager:Boolean},"lazy");function fc(e,t){const a=cc(!1),l=dc(()=>a.value||e.eager||t.value);return vc(t,()=>a.value=!0),{isBooted:a,hasContent:l,onAfterLeave:function(){e.eager||(a.value=!1)}}}function mc(){const e=i("useScopeId").vnode.scopeId;return{scopeId:e?{[e]:""}:void 0}}const{inject:gc,onScopeDispose:hc,provide:yc,reactive:bc,readonly:wc,shallowRef:Sc,toRaw:kc,toRef:xc,toValue:Vc,watchEffect:Cc}=await e("vue"),_c=Symbol.for("vuetify:stack"),Ic=bc([]);const{computed:Bc,warn:Pc}=await e("vue");function Ac(){return!0}function Nc(e,t,a){if(!e||!1===Tc(e,a))return!1;const l=pt(t);if("undefined"!=typeof ShadowRoot&&l instanceof ShadowRoot&&l.host===e.target)return!1;const n=("object"==typeof a.value&&a.value.include||(()=>[]))();return n.push(t),!n.some(t=>t?.contains(e.target))}function Tc(e,t){return("object"==typeof t.value&&t.value.closeConditional||Ac)(e)}function Ec(e,t){const a=pt(e);t(document),"undefined"!=typeof ShadowRoot&&a instanceof ShadowRoot&&t(a)}const Dc={mounted(e,t){const a=a=>function(e,t,a){const l="function"==typeof a.value?a.value:a.value.handler;e.shadowTarget=e.target,t._clickOutside.lastMousedownWasOutside&&Nc(e,t,a)&&setTimeout(()=>{Tc(e,a)&&l&&l(e)},0)}(a,e,t),l=a=>{e._clickOutside.lastMousedownWasOutside=Nc(a,e,t)};Ec(e,e=>{e.addEventListener("click",a,!0),e.addEventListener("mousedown",l,!0)}),e._clickOutside||(e._clickOutside={lastMousedownWasOutside:!1}),e._clickOutside[t.instance.$.uid]={onClick:a,onMousedown:l}},beforeUnmount(e,t){e._clickOutside&&(Ec(e,a=>{if(!a||!e._clickOutside?.[t.instance.$.uid])return;const{onClick:l,onMousedown:n}=e._clickOutside[t.instance.$.uid];a.removeEventListener("click",l,!0),a.removeEventListener("mousedown",n,!0)}),delete e._clickOutside[t.instance.$.uid])}},{mergeProps:Rc,createVNode:$c,Fragment:Lc,vShow:Fc,resolveDirective:Mc,withDirectives:Oc}=await e("vue"),{computed:zc,mergeProps:jc,onBeforeUnmount:Hc,ref:Wc,Teleport:Uc,Transition:Gc,watch:Yc}=await e("vue");function qc(e){const{modelValue:t,color:a,...l}=e;return $c(Gc,{name:"fade-transition",appear:!0},{default:()=>[e.modelValue&&$c("div",Rc({class:["v-overlay__scrim",e.color.backgroundColorClasses.value],style:e.color.backgroundColorStyles.value},l),null)]})}const Kc=t({absolute:Boolean,attach:[Boolean,String,Object],closeOnBack:{type:Boolean,default:!0},contained:Boolean,contentClass:null,contentProps:null,disabled:Boolean,opacity:[Number,String],noClickAnimation:Boolean,modelValue:Boolean,persistent:Boolean,scrim:{type:[Boolean,String],default:!0},zIndex:{type:[Number,String],default:2e3},...nc(),...qe(),...ua(),...pc(),...Eu(),...Wu(),...c(),...Ia()},"VOverlay"),Xc=o()({name:"VOverlay",directives:{ClickOutside:Dc},inheritAttrs:!1,props:{_disableGlobalStack:Boolean,...Kc()},emits:{"click:outside":e=>!0,"update:modelValue":e=>!0,keydown:e=>!0,afterEnter:()=>!0,afterLeave:()=>!0},setup(e,t){let{slots:a,attrs:l,emit:n}=t;const o=i("VOverlay"),s=Wc(),c=Wc(),d=Wc(),v=V(e,"modelValue"),f=zc({get:()=>v.value,set:t=>{t&&e.disabled||(v.value=t)}}),{themeClasses:m}=r(e),{rtlClasses:g,isRtl:h}=u(),{hasContent:y,onAfterLeave:b}=fc(e,f),w=ya(()=>"string"==typeof e.scrim?e.scrim:null),{globalTop:S,localTop:k,stackStyles:x}=function(e,t,a){const l=i("useStack"),n=!a,o=gc(_c,void 0),r=bc({activeChildren:new Set});yc(_c,r);const s=Sc(Number(Vc(t)));C(e,()=>{const e=Ic.at(-1)?.[1];s.value=e?e+10:Number(Vc(t)),n&&Ic.push([l.uid,s.value]),o?.activeChildren.add(l.uid),hc(()=>{if(n){const e=kc(Ic).findIndex(e=>e[0]===l.uid);Ic.splice(e,1)}o?.activeChildren.delete(l.uid)})});const u=Sc(!0);n&&Cc(()=>{const e=Ic.at(-1)?.[0]===l.uid;setTimeout(()=>u.value=e)});const c=xc(()=>!r.activeChildren.size);return{globalTop:wc(u),localTop:c,stackStyles:xc(()=>({zIndex:s.value}))}}(f,()=>e.zIndex,e._disableGlobalStack),{activatorEl:_,activatorRef:I,target:B,targetEl:P,targetRef:A,activatorEvents:N,contentEvents:T,scrimEvents:E}=oc(e,{isActive:f,isTop:k,contentEl:d}),{teleportTarget:D}=function(e){return{teleportTarget:Bc(()=>{const t=e();if(!0===t||!$)return;const a=!1===t?document.body:"string"==typeof t?document.querySelector(t):t;if(null==a)return void Pc(`Unable to locate target ${t}`);let l=[...a.children].find(e=>e.matches(".v-overlay-container"));return l||(l=document.createElement("div"),l.className="v-overlay-container",a.appendChild(l)),l})}}(()=>{const t=e.attach||e.contained;if(t)return t;const a=_?.value?.getRootNode()||o.proxy?.$el?.getRootNode();return a instanceof ShadowRoot&&a}),{dimensionStyles:R}=ca(e),L=uc(),{scopeId:F}=mc();Yc(()=>e.disabled,e=>{e&&(f.value=!1)});const{contentStyles:M,updateLocation:O}=function(e,t){const a=Au({}),l=Au();function n(e){l.value?.(e)}return $&&C(()=>!(!t.isActive.value||!e.locationStrategy),o=>{Nu(()=>e.locationStrategy,o),Pu(()=>{window.removeEventListener("resize",n),l.value=void 0}),window.addEventListener("resize",n,{passive:!0}),"function"==typeof e.locationStrategy?l.value=e.locationStrategy(t,e,a)?.updateLocation:l.value=Tu[e.locationStrategy](t,e,a)?.updateLocation}),{contentStyles:a,updateLocation:l}}(e,{isRtl:h,contentEl:d,target:B,isActive:f});function z(t){n("click:outside",t),e.persistent?Y():f.value=!1}function j(t){return f.value&&S.value&&(!e.scrim||t.target===c.value||t instanceof MouseEvent&&t.shadowTarget===c.value)}function H(t){"Escape"===t.key&&S.value&&(d.value?.contains(document.activeElement)||n("keydown",t),e.persistent?Y():(f.value=!1,d.value?.contains(document.activeElement)&&_.value?.focus()))}function W(e){("Escape"!==e.key||S.value)&&n("keydown",e)}!function(e,t){if(!$)return;let a;ju(async()=>{a?.stop(),t.isActive.value&&e.scrollStrategy&&(a=Ou(),await new Promise(e=>setTimeout(e)),a.active&&a.run(()=>{"function"==typeof e.scrollStrategy?e.scrollStrategy(t,e,a):Hu[e.scrollStrategy]?.(t,e,a)}))}),zu(()=>{a?.stop()})}(e,{root:s,contentEl:d,targetEl:P,isActive:f,updateLocation:O}),$&&Yc(f,e=>{e?window.addEventListener("keydown",H):window.removeEventListener("keydown",H)},{immediate:!0}),Hc(()=>{$&&window.removeEventListener("keydown",H)});const U=to();C(()=>e.closeOnBack,()=>{!function(e,t){let a,l,n=!1;function o(e){e.state?.replaced||(n=!0,setTimeout(()=>n=!1))}$&&e?.beforeEach&&(Xn(()=>{window.addEventListener("popstate",o),a=e.beforeEach((e,a,l)=>{no?n?t(l):l():setTimeout(()=>n?t(l):l()),no=!0}),l=e?.afterEach(()=>{no=!1})}),Jn(()=>{window.removeEventListener("popstate",o),a?.(),l?.()}))}(U,t=>{S.value&&f.value?(t(!1),e.persistent?Y():f.value=!1):t()})});const G=Wc();function Y(){e.noClickAnimation||d.value&&rt(d.value,[{transformOrigin:"center"},{transform:"scale(1.03)"},{transformOrigin:"center"}],{duration:150,easing:ft})}function q(){n("afterEnter")}function K(){b(),n("afterLeave")}return Yc(()=>f.value&&(e.absolute||e.contained)&&null==D.value,e=>{if(e){const e=gt(s.value);e&&e!==document.scrollingElement&&(G.value=e.scrollTop)}}),wt(()=>$c(Lc,null,[a.activator?.({isActive:f.value,targetRef:A,props:jc({ref:I},N.value,e.activatorProps)}),L.value&&y.value&&$c(Uc,{disabled:!D.value,to:D.value},{default:()=>[$c("div",Rc({class:["v-overlay",{"v-overlay--absolute":e.absolute||e.contained,"v-overlay--active":f.value,"v-overlay--contained":e.contained},m.value,g.value,e.class],style:[x.value,{"--v-overlay-opacity":e.opacity,top:p(G.value)},e.style],ref:s,onKeydown:W},F,l),[$c(qc,Rc({color:w,modelValue:f.value&&!!e.scrim,ref:c},E.value),null),$c(Ba,{appear:!0,persisted:!0,transition:e.transition,target:B.value,onAfterEnter:q,onAfterLeave:K},{default:()=>[Oc($c("div",Rc({ref:d,class:["v-overlay__content",e.contentClass],style:[R.value,M.value]},T.value,e.contentProps),[a.default?.({isActive:f})]),[[Fc,f.value],[Mc("click-outside"),{handler:z,closeConditional:j,include:()=>[_.value]}]])]})])]})])),{activatorEl:_,scrimEl:c,target:B,animateClick:Y,contentEl:d,globalTop:S,localTop:k,updateLocation:O}}}),Jc=Symbol("Forwarded refs");function Qc(e,t){let a=e;for(;a;){const e=Reflect.getOwnPropertyDescriptor(a,t);if(e)return e;a=Object.getPrototypeOf(a)}}function Zc(e){for(var t=arguments.length,a=new Array(t>1?t-1:0),l=1;l<t;l++)a[l-1]=arguments[l];return e[Jc]=a,new Proxy(e,{get(e,t){if(Reflect.has(e,t))return Reflect.get(e,t);if("symbol"!=typeof t&&!t.startsWith("$")&&!t.startsWith("__"))for(const l of a)if(l.value&&Reflect.has(l.value,t)){const e=Reflect.get(l.value,t);return"function"==typeof e?e.bind(l.value):e}},has(e,t){if(Reflect.has(e,t))return!0;if("symbol"==typeof t||t.startsWith("$")||t.startsWith("__"))return!1;for(const l of a)if(l.value&&Reflect.has(l.value,t))return!0;return!1},set(e,t,l){if(Reflect.has(e,t))return Reflect.set(e,t,l);if("symbol"==typeof t||t.startsWith("$")||t.startsWith("__"))return!1;for(const n of a)if(n.value&&Reflect.has(n.value,t))return Reflect.set(n.value,t,l);return!1},getOwnPropertyDescriptor(e,t){const l=Reflect.getOwnPropertyDescriptor(e,t);if(l)return l;if("symbol"!=typeof t&&!t.startsWith("$")&&!t.startsWith("__")){for(const e of a){if(!e.value)continue;const a=Qc(e.value,t)??("_"in e.value?Qc(e.value._?.setupState,t):void 0);if(a)return a}for(const e of a){const a=e.value&&e.value[Jc];if(!a)continue;const l=a.slice();for(;l.length;){const e=l.shift(),a=Qc(e.value,t);if(a)return a;const n=e.value&&e.value[Jc];n&&l.push(...n)}}}}})}const{createVNode:ed,mergeProps:td}=await e("vue"),{computed:ad,inject:ld,mergeProps:nd,nextTick:od,onBeforeUnmount:id,onDeactivated:rd,provide:sd,ref:ud,shallowRef:cd,toRef:dd,useId:vd,watch:pd}=await e("vue"),fd=t({id:String,submenu:Boolean,...H(Kc({closeDelay:250,closeOnContentClick:!0,locationStrategy:"connected",location:void 0,openDelay:300,scrim:!1,scrollStrategy:"reposition",transition:{component:zt}}),["absolute"])},"VMenu"),md=o()({name:"VMenu",props:fd(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{scopeId:n}=mc(),{isRtl:o}=u(),i=vd(),r=dd(()=>e.id||`v-menu-${i}`),s=ud(),c=ld(Gu,null),d=cd(new Set);async function v(e){const t=e.relatedTarget,a=e.target;if(await od(),l.value&&t!==a&&s.value?.contentEl&&s.value?.globalTop&&![document,s.value.contentEl].includes(a)&&!s.value.contentEl.contains(a)){const e=K(s.value.contentEl);e[0]?.focus()}}function p(e){c?.closeParents(e)}function f(t){if(!e.disabled)if("Tab"===t.key||"Enter"===t.key&&!e.closeOnContentClick){if("Enter"===t.key&&(t.target instanceof HTMLTextAreaElement||t.target instanceof HTMLInputElement&&t.target.closest("form")))return;"Enter"===t.key&&t.preventDefault();ie(K(s.value?.contentEl,!1),t.shiftKey?"prev":"next",e=>e.tabIndex>=0)||(l.value=!1,s.value?.activatorEl?.focus())}else e.submenu&&t.key===(o.value?"ArrowRight":"ArrowLeft")&&(l.value=!1,s.value?.activatorEl?.focus())}function m(t){if(e.disabled)return;const a=s.value?.contentEl;a&&l.value?"ArrowDown"===t.key?(t.preventDefault(),t.stopImmediatePropagation(),te(a,"next")):"ArrowUp"===t.key?(t.preventDefault(),t.stopImmediatePropagation(),te(a,"prev")):e.submenu&&(t.key===(o.value?"ArrowRight":"ArrowLeft")?l.value=!1:t.key===(o.value?"ArrowLeft":"ArrowRight")&&(t.preventDefault(),te(a,"first"))):(e.submenu?t.key===(o.value?"ArrowLeft":"ArrowRight"):["ArrowDown","ArrowUp"].includes(t.key))&&(l.value=!0,t.preventDefault(),setTimeout(()=>setTimeout(()=>m(t))))}sd(Gu,{register(){d.value.add(i)},unregister(){d.value.delete(i)},closeParents(t){setTimeout(()=>{d.value.size||e.persistent||null!=t&&(!s.value?.contentEl||oe(t,s.value.contentEl))||(l.value=!1,c?.closeParents())},40)}}),id(()=>{c?.unregister(),document.removeEventListener("focusin",v)}),rd(()=>l.value=!1),pd(l,e=>{e?(c?.register(),$&&document.addEventListener("focusin",v,{once:!0})):(c?.unregister(),$&&document.removeEventListener("focusin",v))},{immediate:!0});const g=ad(()=>nd({"aria-haspopup":"menu","aria-expanded":String(l.value),"aria-controls":r.value,onKeydown:m},e.activatorProps));return wt(()=>{const t=Xc.filterProps(e);return ed(Xc,td({ref:s,id:r.value,class:["v-menu",e.class],style:e.style},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,absolute:!0,activatorProps:g.value,location:e.location??(e.submenu?"end":"bottom"),"onClick:outside":p,onKeydown:f},n),{activator:a.activator,default:function(){for(var e=arguments.length,t=new Array(e),l=0;l<e;l++)t[l]=arguments[l];return ed(ra,{root:"VMenu"},{default:()=>[a.default?.(...t)]})}})}),Zc({id:r,"ΨopenChildren":d},s)}}),{vShow:gd,createVNode:hd,withDirectives:yd}=await e("vue"),{toRef:bd}=await e("vue"),wd=t({active:Boolean,disabled:Boolean,max:[Number,String],value:{type:[Number,String],default:0},...qe(),...Ia({transition:{component:ta}})},"VCounter"),Sd=o()({name:"VCounter",functional:!0,props:wd(),setup(e,t){let{slots:a}=t;const l=bd(()=>e.max?`${e.value} / ${e.max}`:String(e.value));return wt(()=>hd(Ba,{transition:e.transition},{default:()=>[yd(hd("div",{class:["v-counter",{"text-error":e.max&&!e.disabled&&parseFloat(e.value)>parseFloat(e.max)},e.class],style:e.style},[a.default?a.default({counter:l.value,max:e.max,value:e.value}):l.value]),[[gd,e.active]])]})),{}}}),{createVNode:kd}=await e("vue"),xd=t({floating:Boolean,...qe()},"VFieldLabel"),Vd=o()({name:"VFieldLabel",props:xd(),setup(e,t){let{slots:a}=t;return wt(()=>kd(Qo,{class:["v-field-label",{"v-field-label--floating":e.floating},e.class],style:e.style,"aria-hidden":e.floating||void 0},a)),{}}}),{createVNode:Cd,vShow:_d,withDirectives:Id,Fragment:Bd,mergeProps:Pd}=await e("vue"),{computed:Ad,ref:Nd,toRef:Td,useId:Ed,watch:Dd}=await e("vue"),Rd=["underlined","outlined","filled","solo","solo-inverted","solo-filled","plain"],$d=t({appendInnerIcon:E,bgColor:String,clearable:Boolean,clearIcon:{type:E,default:"$clear"},active:Boolean,centerAffix:{type:Boolean,default:void 0},color:String,baseColor:String,dirty:Boolean,disabled:{type:Boolean,default:null},glow:Boolean,error:Boolean,flat:Boolean,iconColor:[Boolean,String],label:String,persistentClear:Boolean,prependInnerIcon:E,reverse:Boolean,singleLine:Boolean,variant:{type:String,default:"filled",validator:e=>Rd.includes(e)},"onClick:clear":O(),"onClick:appendInner":O(),"onClick:prependInner":O(),...qe(),...jn(),...Sa(),...c()},"VField"),Ld=o()({name:"VField",inheritAttrs:!1,props:{id:String,...Di(),...$d()},emits:{"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{themeClasses:o}=r(e),{loaderClasses:i}=Hn(e),{focusClasses:s,isFocused:c,focus:d,blur:v}=Ri(e),{InputIcon:f}=Bi(e),{roundedClasses:m}=ka(e),{rtlClasses:g}=u(),h=Td(()=>e.dirty||e.active),y=Td(()=>!(!e.label&&!n.label)),b=Td(()=>!e.singleLine&&y.value),w=Ed(),S=Ad(()=>e.id||`input-${w}`),k=Td(()=>`${S.value}-messages`),x=Nd(),V=Nd(),C=Nd(),_=Ad(()=>["plain","underlined"].includes(e.variant)),I=Ad(()=>e.error||e.disabled?void 0:h.value&&c.value?e.color:e.baseColor),B=Ad(()=>{if(e.iconColor&&(!e.glow||c.value))return!0===e.iconColor?I.value:e.iconColor}),{backgroundColorClasses:P,backgroundColorStyles:A}=ya(()=>e.bgColor),{textColorClasses:N,textColorStyles:T}=ha(I);Dd(h,e=>{if(b.value){const t=x.value.$el,a=V.value.$el;requestAnimationFrame(()=>{const l=it(t),n=a.getBoundingClientRect(),o=n.x-l.x,i=n.y-l.y-(l.height/2-n.height/2),r=n.width/.75,s=Math.abs(r-l.width)>1?{maxWidth:p(r)}:void 0,u=getComputedStyle(t),c=getComputedStyle(a),d=1e3*parseFloat(u.transitionDuration)||150,v=parseFloat(c.getPropertyValue("--v-field-label-scale")),f=c.getPropertyValue("color");t.style.visibility="visible",a.style.visibility="hidden",rt(t,{transform:`translate(${o}px, ${i}px) scale(${v})`,color:f,...s},{duration:d,easing:ft,direction:e?"normal":"reverse"}).finished.then(()=>{t.style.removeProperty("visibility"),a.style.removeProperty("visibility")})})}},{flush:"post"});const E=Ad(()=>({isActive:h,isFocused:c,controlRef:C,blur:v,focus:d}));function D(e){e.target!==document.activeElement&&e.preventDefault()}return wt(()=>{const t="outlined"===e.variant,l=!(!n["prepend-inner"]&&!e.prependInnerIcon),r=!(!e.clearable&&!n.clear||e.disabled),u=!!(n["append-inner"]||e.appendInnerIcon||r),c=()=>n.label?n.label({...E.value,label:e.label,props:{for:S.value}}):e.label;return Cd("div",Pd({class:["v-field",{"v-field--active":h.value,"v-field--appended":u,"v-field--center-affix":e.centerAffix??!_.value,"v-field--disabled":e.disabled,"v-field--dirty":e.dirty,"v-field--error":e.error,"v-field--glow":e.glow,"v-field--flat":e.flat,"v-field--has-background":!!e.bgColor,"v-field--persistent-clear":e.persistentClear,"v-field--prepended":l,"v-field--reverse":e.reverse,"v-field--single-line":e.singleLine,"v-field--no-label":!c(),[`v-field--variant-${e.variant}`]:!0},o.value,P.value,s.value,i.value,m.value,g.value,e.class],style:[A.value,e.style],onClick:D},a),[Cd("div",{class:"v-field__overlay"},null),Cd(Wn,{name:"v-field",active:!!e.loading,color:e.error?"error":"string"==typeof e.loading?e.loading:e.color},{default:n.loader}),l&&Cd("div",{key:"prepend",class:"v-field__prepend-inner"},[e.prependInnerIcon&&Cd(f,{key:"prepend-icon",name:"prependInner",color:B.value},null),n["prepend-inner"]?.(E.value)]),Cd("div",{class:"v-field__field","data-no-activator":""},[["filled","solo","solo-inverted","solo-filled"].includes(e.variant)&&b.value&&Cd(Vd,{key:"floating-label",ref:V,class:[N.value],floating:!0,for:S.value,style:T.value},{default:()=>[c()]}),y.value&&Cd(Vd,{key:"label",ref:x,for:S.value},{default:()=>[c()]}),n.default?.({...E.value,props:{id:S.value,class:"v-field__input","aria-describedby":k.value},focus:d,blur:v})??Cd("div",{id:S.value,class:"v-field__input","aria-describedby":k.value},null)]),r&&Cd(na,{key:"clear"},{default:()=>[Id(Cd("div",{class:"v-field__clearable",onMousedown:e=>{e.preventDefault(),e.stopPropagation()}},[Cd(ra,{defaults:{VIcon:{icon:e.clearIcon}}},{default:()=>[n.clear?n.clear({...E.value,props:{onFocus:d,onBlur:v,onClick:e["onClick:clear"]}}):Cd(f,{name:"clear",onFocus:d,onBlur:v},null)]})]),[[_d,e.dirty]])]}),u&&Cd("div",{key:"append",class:"v-field__append-inner"},[n["append-inner"]?.(E.value),e.appendInnerIcon&&Cd(f,{key:"append-icon",name:"appendInner",color:B.value},null)]),Cd("div",{class:["v-field__outline",N.value],style:T.value},[t&&Cd(Bd,null,[Cd("div",{class:"v-field__outline__start"},null),b.value&&Cd("div",{class:"v-field__outline__notch"},[Cd(Vd,{ref:V,floating:!0,for:S.value},{default:()=>[c()]})]),Cd("div",{class:"v-field__outline__end"},null)]),_.value&&b.value&&Cd(Vd,{ref:V,floating:!0,for:S.value},{default:()=>[c()]})])])}),{controlRef:C,fieldIconColor:B}}}),{resolveDirective:Fd,mergeProps:Md,createVNode:Od,withDirectives:zd,Fragment:jd}=await e("vue"),{cloneVNode:Hd,computed:Wd,nextTick:Ud,ref:Gd}=await e("vue"),Yd=["color","file","time","date","datetime-local","week","month"],qd=t({autofocus:Boolean,counter:[Boolean,Number,String],counterValue:[Number,Function],prefix:String,placeholder:String,persistentPlaceholder:Boolean,persistentCounter:Boolean,suffix:String,role:String,type:{type:String,default:"text"},modelModifiers:Object,...ur(),...$d()},"VTextField"),Kd=o()({name:"VTextField",directives:{Intersect:Aa},inheritAttrs:!1,props:qd(),emits:{"click:control":e=>!0,"mousedown:control":e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const o=V(e,"modelValue"),{isFocused:i,focus:r,blur:s}=Ri(e),u=Wd(()=>"function"==typeof e.counterValue?e.counterValue(o.value):"number"==typeof e.counterValue?e.counterValue:(o.value??"").toString().length),c=Wd(()=>a.maxlength?a.maxlength:!e.counter||"number"!=typeof e.counter&&"string"!=typeof e.counter?void 0:e.counter),d=Wd(()=>["plain","underlined"].includes(e.variant));function v(t,a){e.autofocus&&t&&a[0].target?.focus?.()}const p=Gd(),f=Gd(),m=Gd(),g=Wd(()=>Yd.includes(e.type)||e.persistentPlaceholder||i.value||e.active);function h(){m.value!==document.activeElement&&m.value?.focus(),i.value||r()}function y(e){l("mousedown:control",e),e.target!==m.value&&(h(),e.preventDefault())}function b(e){h(),l("click:control",e)}function w(t){const a=t.target;if(o.value=a.value,e.modelModifiers?.trim&&["text","search","password","tel","url"].includes(e.type)){const e=[a.selectionStart,a.selectionEnd];Ud(()=>{a.selectionStart=e[0],a.selectionEnd=e[1]})}}return wt(()=>{const t=!!(n.counter||!1!==e.counter&&null!=e.counter),l=!(!t&&!n.details),[r,S]=z(a),{modelValue:k,...x}=cr.filterProps(e),V=Ld.filterProps(e);return Od(cr,Md({ref:p,modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-text-field",{"v-text-field--prefixed":e.prefix,"v-text-field--suffixed":e.suffix,"v-input--plain-underlined":d.value},e.class],style:e.style},r,x,{centerAffix:!d.value,focused:i.value}),{...n,default:t=>{let{id:a,isDisabled:l,isDirty:r,isReadonly:u,isValid:c,reset:d}=t;return Od(Ld,Md({ref:f,onMousedown:y,onClick:b,"onClick:clear":t=>function(t,a){t.stopPropagation(),h(),Ud(()=>{o.value=null,a(),W(e["onClick:clear"],t)})}(t,d),"onClick:prependInner":e["onClick:prependInner"],"onClick:appendInner":e["onClick:appendInner"],role:e.role},V,{id:a.value,active:g.value||r.value,dirty:r.value||e.dirty,disabled:l.value,focused:i.value,error:!1===c.value}),{...n,default:t=>{let{props:{class:a,...i}}=t;const r=zd(Od("input",Md({ref:m,value:o.value,onInput:w,autofocus:e.autofocus,readonly:u.value,disabled:l.value,name:e.name,placeholder:e.placeholder,size:1,type:e.type,onFocus:h,onBlur:s},i,S),null),[[Fd("intersect"),{handler:v},null,{once:!0}]]);return Od(jd,null,[e.prefix&&Od("span",{class:"v-text-field__prefix"},[Od("span",{class:"v-text-field__prefix__text"},[e.prefix])]),n.default?Od("div",{class:a,"data-no-activator":""},[n.default(),r]):Hd(r,{class:a}),e.suffix&&Od("span",{class:"v-text-field__suffix"},[Od("span",{class:"v-text-field__suffix__text"},[e.suffix])])])}})},details:l?a=>Od(jd,null,[n.details?.(a),t&&Od(jd,null,[Od("span",null,null),Od(Sd,{active:e.persistentCounter||i.value,value:u.value,max:c.value,disabled:e.disabled},n.counter)])]):void 0})}),Zc({},p,f,m)}}),{Fragment:Xd,createVNode:Jd,mergeProps:Qd}=await e("vue"),{watch:Zd}=await e("vue"),ev=t({renderless:Boolean,...qe()},"VVirtualScrollItem"),tv=o()({name:"VVirtualScrollItem",inheritAttrs:!1,props:ev(),emits:{"update:height":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{resizeRef:o,contentRect:i}=R(void 0,"border");Zd(()=>i.value?.height,e=>{null!=e&&l("update:height",e)}),wt(()=>e.renderless?Jd(Xd,null,[n.default?.({itemRef:o})]):Jd("div",Qd({ref:o,class:["v-virtual-scroll__item",e.class],style:e.style},a),[n.default?.()]))}}),{computed:av,nextTick:lv,onScopeDispose:nv,ref:ov,shallowRef:iv,watch:rv,watchEffect:sv}=await e("vue"),uv=t({itemHeight:{type:[Number,String],default:null},itemKey:{type:[String,Array,Function],default:null},height:[Number,String]},"virtual");function cv(e,t){const a=G(),l=iv(0);sv(()=>{l.value=parseFloat(e.itemHeight||0)});const n=iv(0),o=iv(Math.ceil((parseInt(e.height)||a.height.value)/(l.value||16))||1),i=iv(0),r=iv(0),s=ov(),u=ov();let c=0;const{resizeRef:d,contentRect:v}=R();sv(()=>{d.value=s.value});const p=av(()=>s.value===document.documentElement?a.height.value:v.value?.height||parseInt(e.height)||0),f=av(()=>!!(s.value&&u.value&&p.value&&l.value));let m=Array.from({length:t.value.length}),g=Array.from({length:t.value.length});const h=iv(0);let y=-1;function b(e){return m[e]||l.value}const w=re(()=>{const e=performance.now();g[0]=0;const a=t.value.length;for(let t=1;t<=a-1;t++)g[t]=(g[t-1]||0)+b(t-1);h.value=Math.max(h.value,performance.now()-e)},h),S=rv(f,e=>{e&&(S(),c=u.value.offsetTop,w.immediate(),N(),~y&&lv(()=>{$&&window.requestAnimationFrame(()=>{E(y),y=-1})}))});function x(e){return e=k(e,0,t.value.length-1),g[e]||0}function V(e){return function(e,t){let a=e.length-1,l=0,n=0,o=null,i=-1;if(e[a]<t)return a;for(;l<=a;)if(n=l+a>>1,o=e[n],o>t)a=n-1;else{if(!(o<t))return o===t?n:l;i=n,l=n+1}return i}(g,e)}nv(()=>{w.clear()});let C=0,_=0,I=0;rv(p,(e,t)=>{t&&(N(),e<t&&requestAnimationFrame(()=>{_=0,N()}))});let B=-1;function P(){s.value&&u.value&&(_=0,I=0,window.clearTimeout(B),N())}let A=-1;function N(){cancelAnimationFrame(A),A=requestAnimationFrame(T)}function T(){if(!s.value||!p.value)return;const e=C-c,a=Math.sign(_),l=Math.max(0,e-100),u=k(V(l),0,t.value.length),d=e+p.value+100,v=k(V(d)+1,u+1,t.value.length);if((-1!==a||u<n.value)&&(1!==a||v>o.value)){const e=x(n.value)-x(u),a=x(v)-x(o.value);Math.max(e,a)>100?(n.value=u,o.value=v):(u<=0&&(n.value=u),v>=t.value.length&&(o.value=v))}i.value=x(n.value),r.value=x(t.value.length)-x(o.value)}function E(e){const t=x(e);!s.value||e&&!t?y=e:s.value.scrollTop=t}const D=av(()=>t.value.slice(n.value,o.value).map((t,a)=>{const l=a+n.value;return{raw:t,index:l,key:ee(t,e.itemKey,l)}}));return rv(t,()=>{m=Array.from({length:t.value.length}),g=Array.from({length:t.value.length}),w.immediate(),N()},{deep:1}),{calculateVisibleItems:N,containerRef:s,markerRef:u,computedItems:D,paddingTop:i,paddingBottom:r,scrollToIndex:E,handleScroll:function(){if(!s.value||!u.value)return;const e=s.value.scrollTop,t=performance.now();t-I>500?(_=Math.sign(e-C),c=u.value.offsetTop):_=e-C,C=e,I=t,window.clearTimeout(B),B=window.setTimeout(P,500),N()},handleScrollend:P,handleItemResize:function(e,t){const a=m[e],n=l.value;l.value=n?Math.min(l.value,t):t,a===t&&n===l.value||(m[e]=t,w())}}}const{createVNode:dv,Fragment:vv}=await e("vue"),{onMounted:pv,onScopeDispose:fv,toRef:mv}=await e("vue"),gv=t({items:{type:Array,default:()=>[]},renderless:Boolean,...uv(),...qe(),...ua()},"VVirtualScroll"),hv=o()({name:"VVirtualScroll",props:gv(),setup(e,t){let{slots:a}=t;const l=i("VVirtualScroll"),{dimensionStyles:n}=ca(e),{calculateVisibleItems:o,containerRef:r,markerRef:s,handleScroll:u,handleScrollend:c,handleItemResize:d,scrollToIndex:v,paddingTop:f,paddingBottom:m,computedItems:g}=cv(e,mv(()=>e.items));return C(()=>e.renderless,()=>{function e(){const e=arguments.length>0&&void 0!==arguments[0]&&arguments[0]?"addEventListener":"removeEventListener";r.value===document.documentElement?(document[e]("scroll",u,{passive:!0}),document[e]("scrollend",c)):(r.value?.[e]("scroll",u,{passive:!0}),r.value?.[e]("scrollend",c))}pv(()=>{r.value=gt(l.vnode.el,!0),e(!0)}),fv(e)}),wt(()=>{const t=g.value.map(t=>dv(tv,{key:t.key,renderless:e.renderless,"onUpdate:height":e=>d(t.index,e)},{default:e=>a.default?.({item:t.raw,index:t.index,...e})}));return e.renderless?dv(vv,null,[dv("div",{ref:s,class:"v-virtual-scroll__spacer",style:{paddingTop:p(f.value)}},null),t,dv("div",{class:"v-virtual-scroll__spacer",style:{paddingBottom:p(m.value)}},null)]):dv("div",{ref:r,class:["v-virtual-scroll",e.class],onScrollPassive:u,onScrollend:c,style:[n.value,e.style]},[dv("div",{ref:s,class:"v-virtual-scroll__container",style:{paddingTop:p(f.value),paddingBottom:p(m.value)}},[t])])}),{calculateVisibleItems:o,scrollToIndex:v}}}),{shallowRef:yv,watch:bv}=await e("vue");function wv(e,t){const a=yv(!1);let l;return{onScrollPassive:function(e){cancelAnimationFrame(l),a.value=!0,l=requestAnimationFrame(()=>{l=requestAnimationFrame(()=>{a.value=!1})})},onKeydown:async function(l){if("Tab"===l.key&&t.value?.focus(),!["PageDown","PageUp","Home","End"].includes(l.key))return;const n=e.value?.$el;if(!n)return;"Home"!==l.key&&"End"!==l.key||n.scrollTo({top:"Home"===l.key?0:n.scrollHeight,behavior:"smooth"}),await async function(){await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>{if(a.value){const t=bv(a,()=>{t(),e()})}else e()})}();const o=n.querySelectorAll(":scope > :not(.v-virtual-scroll__spacer)");if("PageDown"===l.key||"Home"===l.key){const e=n.getBoundingClientRect().top;for(const t of o)if(t.getBoundingClientRect().top>=e){t.focus();break}}else{const e=n.getBoundingClientRect().bottom;for(const t of[...o].reverse())if(t.getBoundingClientRect().bottom<=e){t.focus();break}}}}}const{Fragment:Sv,createVNode:kv,mergeProps:xv,createTextVNode:Vv}=await e("vue"),{computed:Cv,mergeProps:_v,nextTick:Iv,ref:Bv,shallowRef:Pv,toRef:Av,watch:Nv}=await e("vue"),Tv=t({chips:Boolean,closableChips:Boolean,closeText:{type:String,default:"$vuetify.close"},openText:{type:String,default:"$vuetify.open"},eager:Boolean,hideNoData:Boolean,hideSelected:Boolean,listProps:{type:Object},menu:Boolean,menuIcon:{type:E,default:"$dropdown"},menuProps:{type:Object},multiple:Boolean,noDataText:{type:String,default:"$vuetify.noDataText"},openOnClear:Boolean,itemColor:String,...ou({itemChildren:!1})},"Select"),Ev=t({...Tv(),...H(qd({modelValue:null,role:"combobox"}),["validationValue","dirty","appendInnerIcon"]),...Ia({transition:{component:zt}})},"VSelect"),Dv=o()({name:"VSelect",props:Ev(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,"update:menu":e=>!0},setup(e,t){let{slots:a}=t;const{t:l}=M(),n=Bv(),o=Bv(),i=Bv(),{items:r,transformIn:s,transformOut:u}=su(e),c=V(e,"modelValue",[],e=>s(null===e?[null]:P(e)),t=>{const a=u(t);return e.multiple?a:a[0]??null}),d=Cv(()=>"function"==typeof e.counterValue?e.counterValue(c.value):"number"==typeof e.counterValue?e.counterValue:c.value.length),v=Gi(e),p=Cv(()=>c.value.map(e=>e.value)),f=Pv(!1);let m,g="";const h=Cv(()=>e.hideSelected?r.value.filter(t=>!c.value.some(a=>(e.valueComparator||B)(a,t))):r.value),y=Cv(()=>e.hideNoData&&!h.value.length||v.isReadonly.value||v.isDisabled.value),b=V(e,"menu"),w=Cv({get:()=>b.value,set:e=>{b.value&&!e&&o.value?.ΨopenChildren.size||e&&y.value||(b.value=e)}}),S=Av(()=>w.value?e.closeText:e.openText),k=Cv(()=>({...e.menuProps,activatorProps:{...e.menuProps?.activatorProps||{},"aria-haspopup":"listbox"}})),x=Bv(),C=wv(x,n);function _(t){e.openOnClear&&(w.value=!0)}function I(){y.value||(w.value=!w.value)}function A(e){ue(e)&&N(e)}function N(e){if(!e.key||v.isReadonly.value)return;["Enter"," ","ArrowDown","ArrowUp","Home","End"].includes(e.key)&&e.preventDefault(),["Enter","ArrowDown"," "].includes(e.key)&&(w.value=!0),["Escape","Tab"].includes(e.key)&&(w.value=!1),"Home"===e.key?x.value?.focus("first"):"End"===e.key&&x.value?.focus("last");if(!ue(e))return;const t=performance.now();t-m>1e3&&(g=""),g+=e.key.toLowerCase(),m=t;const a=r.value.find(e=>e.title.toLowerCase().startsWith(g));if(void 0!==a){c.value=[a];const e=h.value.indexOf(a);$&&window.requestAnimationFrame(()=>{e>=0&&i.value?.scrollToIndex(e)})}}function T(t){let a=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(!t.props.disabled)if(e.multiple){const l=c.value.findIndex(a=>(e.valueComparator||B)(a.value,t.value)),n=null==a?!~l:a;if(~l){const e=n?[...c.value,t]:[...c.value];e.splice(l,1),c.value=e}else n&&(c.value=[...c.value,t])}else{const e=!1!==a;c.value=e?[t]:[],Iv(()=>{w.value=!1})}}function E(e){x.value?.$el.contains(e.relatedTarget)||(w.value=!1)}function D(){e.eager&&i.value?.calculateVisibleItems()}function R(){f.value&&n.value?.focus()}function L(e){f.value=!0}function F(e){if(null==e)c.value=[];else if(j(n.value,":autofill")||j(n.value,":-webkit-autofill")){const t=r.value.find(t=>t.title===e);t&&T(t)}else n.value&&(n.value.value="")}return Nv(w,()=>{if(!e.hideSelected&&w.value&&c.value.length){const t=h.value.findIndex(t=>c.value.some(a=>(e.valueComparator||B)(a.value,t.value)));$&&window.requestAnimationFrame(()=>{t>=0&&i.value?.scrollToIndex(t)})}}),Nv(()=>e.items,(e,t)=>{w.value||f.value&&!t.length&&e.length&&(w.value=!0)}),wt(()=>{const t=!(!e.chips&&!a.chip),r=!!(!e.hideNoData||h.value.length||a["prepend-item"]||a["append-item"]||a["no-data"]),s=c.value.length>0,u=Kd.filterProps(e),v=s||!f.value&&e.label&&!e.persistentPlaceholder?void 0:e.placeholder;return kv(Kd,xv({ref:n},u,{modelValue:c.value.map(e=>e.props.value).join(", "),"onUpdate:modelValue":F,focused:f.value,"onUpdate:focused":e=>f.value=e,validationValue:c.externalValue,counterValue:d.value,dirty:s,class:["v-select",{"v-select--active-menu":w.value,"v-select--chips":!!e.chips,["v-select--"+(e.multiple?"multiple":"single")]:!0,"v-select--selected":c.value.length,"v-select--selection-slot":!!a.selection},e.class],style:e.style,inputmode:"none",placeholder:v,"onClick:clear":_,"onMousedown:control":I,onBlur:E,onKeydown:N,"aria-label":l(S.value),title:l(S.value)}),{...a,default:()=>kv(Sv,null,[kv(md,xv({ref:o,modelValue:w.value,"onUpdate:modelValue":e=>w.value=e,activator:"parent",contentClass:"v-select__content",disabled:y.value,eager:e.eager,maxHeight:310,openOnClick:!1,closeOnContentClick:!1,transition:e.transition,onAfterEnter:D,onAfterLeave:R},k.value),{default:()=>[r&&kv(hu,xv({ref:x,selected:p.value,selectStrategy:e.multiple?"independent":"single-independent",onMousedown:e=>e.preventDefault(),onKeydown:A,onFocusin:L,tabindex:"-1","aria-live":"polite","aria-label":`${e.label}-list`,color:e.itemColor??e.color},C,e.listProps),{default:()=>[a["prepend-item"]?.(),!h.value.length&&!e.hideNoData&&(a["no-data"]?.()??kv(Ws,{key:"no-data",title:l(e.noDataText)},null)),kv(hv,{ref:i,renderless:!0,items:h.value,itemKey:"value"},{default:t=>{let{item:l,index:n,itemRef:o}=t;const i=_v(l.props,{ref:o,key:l.value,onClick:()=>T(l,null)});return a.item?.({item:l,index:n,props:i})??kv(Ws,xv(i,{role:"option"}),{prepend:t=>{let{isSelected:a}=t;return kv(Sv,null,[e.multiple&&!e.hideSelected?kv(_i,{key:l.value,modelValue:a,ripple:!1,tabindex:"-1"},null):void 0,l.props.prependAvatar&&kv(Ko,{image:l.props.prependAvatar},null),l.props.prependIcon&&kv(bn,{icon:l.props.prependIcon},null)])}})}}),a["append-item"]?.()]})]}),c.value.map((l,n)=>{function o(e){e.stopPropagation(),e.preventDefault(),T(l,!1)}const i={"onClick:close":o,onKeydown(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),o(e))},onMousedown(e){e.preventDefault(),e.stopPropagation()},modelValue:!0,"onUpdate:modelValue":void 0},r=t?!!a.chip:!!a.selection,s=r?se(t?a.chip({item:l,index:n,props:i}):a.selection({item:l,index:n})):void 0;if(!r||s)return kv("div",{key:l.value,class:"v-select__selection"},[t?a.chip?kv(ra,{key:"chip-defaults",defaults:{VChip:{closable:e.closableChips,size:"small",text:l.title}}},{default:()=>[s]}):kv(Hr,xv({key:"chip",closable:e.closableChips,size:"small",text:l.title,disabled:l.props.disabled},i),null):s??kv("span",{class:"v-select__selection-text"},[l.title,e.multiple&&n<c.value.length-1&&kv("span",{class:"v-select__selection-comma"},[Vv(",")])])])})]),"append-inner":function(){for(var t=arguments.length,l=new Array(t),o=0;o<t;o++)l[o]=arguments[o];return kv(Sv,null,[a["append-inner"]?.(...l),e.menuIcon?kv(bn,{class:"v-select__menu-icon",color:n.value?.fieldIconColor,icon:e.menuIcon},null):void 0])}})}),Zc({isFocused:f,menu:w,select:T},n)}}),{computed:Rv,shallowRef:$v,unref:Lv,watchEffect:Fv,createVNode:Mv,Fragment:Ov}=await e("vue"),zv=(e,t,a)=>{if(null==e||null==t)return-1;if(!t.length)return 0;e=e.toString().toLocaleLowerCase(),t=t.toString().toLocaleLowerCase();const l=[];let n=e.indexOf(t);for(;~n;)l.push([n,n+t.length]),n=e.indexOf(t,n+t.length);return l.length?l:-1};function jv(e,t){if(null!=e&&"boolean"!=typeof e&&-1!==e)return"number"==typeof e?[[e,e+t.length]]:Array.isArray(e[0])?e:[e]}const Hv=t({customFilter:Function,customKeyFilter:Object,filterKeys:[Array,String],filterMode:{type:String,default:"intersection"},noFilter:Boolean},"filter");function Wv(e,t,a,l){const n=$v([]),o=$v(new Map),i=Rv(()=>l?.transform?Lv(t).map(e=>[e,l.transform(e)]):Lv(t));return Fv(()=>{const r="function"==typeof a?a():Lv(a),s="string"!=typeof r&&"number"!=typeof r?"":String(r),u=function(e,t,a){const l=[],n=a?.default??zv,o=!!a?.filterKeys&&P(a.filterKeys),i=Object.keys(a?.customKeyFilter??{}).length;if(!e?.length)return l;e:for(let r=0;r<e.length;r++){const[s,u=s]=P(e[r]),c={},d={};let v=-1;if((t||i>0)&&!a?.noFilter){if("object"==typeof s){const e=o||Object.keys(u);for(const l of e){const e=ee(u,l),o=a?.customKeyFilter?.[l];if(v=o?o(e,t,s):n(e,t,s),-1!==v&&!1!==v)o?c[l]=jv(v,t):d[l]=jv(v,t);else if("every"===a?.filterMode)continue e}}else v=n(s,t,s),-1!==v&&!1!==v&&(d.title=jv(v,t));const e=Object.keys(d).length,l=Object.keys(c).length;if(!e&&!l)continue;if("union"===a?.filterMode&&l!==i&&!e)continue;if("intersection"===a?.filterMode&&(l!==i||!e))continue}l.push({index:r,matches:{...d,...c}})}return l}(i.value,s,{customKeyFilter:{...e.customKeyFilter,...Lv(l?.customKeyFilter)},default:e.customFilter,filterKeys:e.filterKeys,filterMode:e.filterMode,noFilter:e.noFilter}),c=Lv(t),d=[],v=new Map;u.forEach(e=>{let{index:t,matches:a}=e;const l=c[t];d.push(l),v.set(l.value,a)}),n.value=d,o.value=v}),{filteredItems:n,filteredMatches:o,getMatches:function(e){return o.value.get(e.value)}}}function Uv(e,t,a){return null!=a&&a.length?a.map((l,n)=>{const o=0===n?0:a[n-1][1],i=[Mv("span",{class:`${e}__unmask`},[t.slice(o,l[0])]),Mv("span",{class:`${e}__mask`},[t.slice(l[0],l[1])])];return n===a.length-1&&i.push(Mv("span",{class:`${e}__unmask`},[t.slice(l[1])])),Mv(Ov,null,[i])}):t}const{Fragment:Gv,createVNode:Yv,mergeProps:qv,createTextVNode:Kv}=await e("vue"),{computed:Xv,mergeProps:Jv,nextTick:Qv,ref:Zv,shallowRef:ep,watch:tp}=await e("vue"),ap=t({autoSelectFirst:{type:[Boolean,String]},clearOnSelect:Boolean,search:String,...Hv({filterKeys:["title"]}),...Tv(),...H(qd({modelValue:null,role:"combobox"}),["validationValue","dirty","appendInnerIcon"]),...Ia({transition:!1})},"VAutocomplete"),lp=o()({name:"VAutocomplete",props:ap(),emits:{"update:focused":e=>!0,"update:search":e=>!0,"update:modelValue":e=>!0,"update:menu":e=>!0},setup(e,t){let{slots:a}=t;const{t:l}=M(),n=Zv(),o=ep(!1),i=ep(!0),r=ep(!1),s=Zv(),u=Zv(),c=ep(-1),{items:d,transformIn:v,transformOut:p}=su(e),{textColorClasses:f,textColorStyles:m}=ha(()=>n.value?.color),g=V(e,"search",""),h=V(e,"modelValue",[],e=>v(null===e?[null]:P(e)),t=>{const a=p(t);return e.multiple?a:a[0]??null}),y=Xv(()=>"function"==typeof e.counterValue?e.counterValue(h.value):"number"==typeof e.counterValue?e.counterValue:h.value.length),b=Gi(e),{filteredItems:w,getMatches:S}=Wv(e,d,()=>i.value?"":g.value),k=Xv(()=>e.hideSelected?w.value.filter(e=>!h.value.some(t=>t.value===e.value)):w.value),x=Xv(()=>!(!e.chips&&!a.chip)),C=Xv(()=>x.value||!!a.selection),_=Xv(()=>h.value.map(e=>e.props.value)),I=Xv(()=>(!0===e.autoSelectFirst||"exact"===e.autoSelectFirst&&g.value===k.value[0]?.title)&&k.value.length>0&&!i.value&&!r.value),A=Xv(()=>e.hideNoData&&!k.value.length||b.isReadonly.value||b.isDisabled.value),N=V(e,"menu"),T=Xv({get:()=>N.value,set:e=>{N.value&&!e&&s.value?.ΨopenChildren.size||e&&A.value||(N.value=e)}}),E=Xv(()=>T.value?e.closeText:e.openText),D=Zv(),R=wv(D,n);function L(t){e.openOnClear&&(T.value=!0),g.value=""}function F(){A.value||(T.value=!0)}function O(e){A.value||(o.value&&(e.preventDefault(),e.stopPropagation()),T.value=!T.value)}function z(e){" "!==e.key&&ue(e)&&n.value?.focus()}function H(t){if(b.isReadonly.value)return;const a=n.value?.selectionStart,l=h.value.length;if(["Enter","ArrowDown","ArrowUp"].includes(t.key)&&t.preventDefault(),["Enter","ArrowDown"].includes(t.key)&&(T.value=!0),["Escape"].includes(t.key)&&(T.value=!1),I.value&&["Enter","Tab"].includes(t.key)&&!h.value.some(e=>{let{value:t}=e;return t===k.value[0].value})&&J(k.value[0]),"ArrowDown"===t.key&&I.value&&D.value?.focus("next"),["Backspace","Delete"].includes(t.key)){if(!e.multiple&&C.value&&h.value.length>0&&!g.value)return J(h.value[0],!1);if(~c.value){t.preventDefault();const e=c.value;J(h.value[c.value],!1),c.value=e>=l-1?l-2:e}else"Backspace"!==t.key||g.value||(c.value=l-1)}else if(e.multiple)if("ArrowLeft"===t.key){if(c.value<0&&a&&a>0)return;const e=c.value>-1?c.value-1:l-1;if(h.value[e])c.value=e;else{const e=g.value?.length??null;c.value=-1,n.value?.setSelectionRange(e,e)}}else if("ArrowRight"===t.key){if(c.value<0)return;const e=c.value+1;h.value[e]?c.value=e:(c.value=-1,n.value?.setSelectionRange(0,0))}else~c.value&&ue(t)&&(c.value=-1)}function W(e){if(j(n.value,":autofill")||j(n.value,":-webkit-autofill")){const t=d.value.find(t=>t.title===e.target.value);t&&J(t)}}function U(){e.eager&&u.value?.calculateVisibleItems()}function G(){o.value&&(i.value=!0,n.value?.focus())}function Y(e){o.value=!0,setTimeout(()=>{r.value=!0})}function q(e){r.value=!1}function K(t){null!=t&&(""!==t||e.multiple||C.value)||(h.value=[])}const X=ep(!1);function J(t){let a=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(t&&!t.props.disabled)if(e.multiple){const l=h.value.findIndex(a=>(e.valueComparator||B)(a.value,t.value)),n=null==a?!~l:a;if(~l){const e=n?[...h.value,t]:[...h.value];e.splice(l,1),h.value=e}else n&&(h.value=[...h.value,t]);e.clearOnSelect&&(g.value="")}else{const e=!1!==a;h.value=e?[t]:[],g.value=e&&!C.value?t.title:"",Qv(()=>{T.value=!1,i.value=!0})}}return tp(o,(t,a)=>{t!==a&&(t?(X.value=!0,g.value=e.multiple||C.value?"":String(h.value.at(-1)?.props.title??""),i.value=!0,Qv(()=>X.value=!1)):(e.multiple||null!=g.value||(h.value=[]),T.value=!1,(e.multiple||C.value)&&(g.value=""),c.value=-1))}),tp(g,e=>{o.value&&!X.value&&(e&&(T.value=!0),i.value=!e)}),tp(T,()=>{if(!e.hideSelected&&T.value&&h.value.length){const e=k.value.findIndex(e=>h.value.some(t=>e.value===t.value));$&&window.requestAnimationFrame(()=>{e>=0&&u.value?.scrollToIndex(e)})}}),tp(()=>e.items,(e,t)=>{T.value||o.value&&!t.length&&e.length&&(T.value=!0)}),tp(h,t=>{e.multiple||C.value||(g.value=t[0]?.title??"")}),wt(()=>{const t=!!(!e.hideNoData||k.value.length||a["prepend-item"]||a["append-item"]||a["no-data"]),r=h.value.length>0,d=Kd.filterProps(e);return Yv(Kd,qv({ref:n},d,{modelValue:g.value,"onUpdate:modelValue":[e=>g.value=e,K],focused:o.value,"onUpdate:focused":e=>o.value=e,validationValue:h.externalValue,counterValue:y.value,dirty:r,onChange:W,class:["v-autocomplete","v-autocomplete--"+(e.multiple?"multiple":"single"),{"v-autocomplete--active-menu":T.value,"v-autocomplete--chips":!!e.chips,"v-autocomplete--selection-slot":!!C.value,"v-autocomplete--selecting-index":c.value>-1},e.class],style:e.style,readonly:b.isReadonly.value,placeholder:r?void 0:e.placeholder,"onClick:clear":L,"onMousedown:control":F,onKeydown:H}),{...a,default:()=>Yv(Gv,null,[Yv(md,qv({ref:s,modelValue:T.value,"onUpdate:modelValue":e=>T.value=e,activator:"parent",contentClass:"v-autocomplete__content",disabled:A.value,eager:e.eager,maxHeight:310,openOnClick:!1,closeOnContentClick:!1,transition:e.transition,onAfterEnter:U,onAfterLeave:G},e.menuProps),{default:()=>[t&&Yv(hu,qv({ref:D,selected:_.value,selectStrategy:e.multiple?"independent":"single-independent",onMousedown:e=>e.preventDefault(),onKeydown:z,onFocusin:Y,onFocusout:q,tabindex:"-1","aria-live":"polite",color:e.itemColor??e.color},R,e.listProps),{default:()=>[a["prepend-item"]?.(),!k.value.length&&!e.hideNoData&&(a["no-data"]?.()??Yv(Ws,{key:"no-data",title:l(e.noDataText)},null)),Yv(hv,{ref:u,renderless:!0,items:k.value,itemKey:"value"},{default:t=>{let{item:l,index:n,itemRef:o}=t;const r=Jv(l.props,{ref:o,key:l.value,active:!(!I.value||0!==n)||void 0,onClick:()=>J(l,null)});return a.item?.({item:l,index:n,props:r})??Yv(Ws,qv(r,{role:"option"}),{prepend:t=>{let{isSelected:a}=t;return Yv(Gv,null,[e.multiple&&!e.hideSelected?Yv(_i,{key:l.value,modelValue:a,ripple:!1,tabindex:"-1"},null):void 0,l.props.prependAvatar&&Yv(Ko,{image:l.props.prependAvatar},null),l.props.prependIcon&&Yv(bn,{icon:l.props.prependIcon},null)])},title:()=>i.value?l.title:Uv("v-autocomplete",l.title,S(l)?.title)})}}),a["append-item"]?.()]})]}),h.value.map((t,l)=>{function n(e){e.stopPropagation(),e.preventDefault(),J(t,!1)}const o={"onClick:close":n,onKeydown(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),n(e))},onMousedown(e){e.preventDefault(),e.stopPropagation()},modelValue:!0,"onUpdate:modelValue":void 0},i=x.value?!!a.chip:!!a.selection,r=i?se(x.value?a.chip({item:t,index:l,props:o}):a.selection({item:t,index:l})):void 0;if(!i||r)return Yv("div",{key:t.value,class:["v-autocomplete__selection",l===c.value&&["v-autocomplete__selection--selected",f.value]],style:l===c.value?m.value:{}},[x.value?a.chip?Yv(ra,{key:"chip-defaults",defaults:{VChip:{closable:e.closableChips,size:"small",text:t.title}}},{default:()=>[r]}):Yv(Hr,qv({key:"chip",closable:e.closableChips,size:"small",text:t.title,disabled:t.props.disabled},o),null):r??Yv("span",{class:"v-autocomplete__selection-text"},[t.title,e.multiple&&l<h.value.length-1&&Yv("span",{class:"v-autocomplete__selection-comma"},[Kv(",")])])])})]),"append-inner":function(){for(var t=arguments.length,o=new Array(t),i=0;i<t;i++)o[i]=arguments[i];return Yv(Gv,null,[a["append-inner"]?.(...o),e.menuIcon?Yv(bn,{class:"v-autocomplete__menu-icon",color:n.value?.fieldIconColor,icon:e.menuIcon,onMousedown:O,onClick:ce,"aria-label":l(E.value),title:l(E.value),tabindex:"-1"},null):void 0])}})}),Zc({isFocused:o,isPristine:i,menu:T,search:g,filteredItems:w,select:J},n)}}),{createVNode:np,vShow:op,mergeProps:ip,withDirectives:rp}=await e("vue"),sp=t({bordered:Boolean,color:String,content:[Number,String],dot:Boolean,floating:Boolean,icon:E,inline:Boolean,label:{type:String,default:"$vuetify.badge"},max:[Number,String],modelValue:{type:Boolean,default:!0},offsetX:[Number,String],offsetY:[Number,String],textColor:String,...qe(),...En({location:"top end"}),...Sa(),...Vt(),...c(),...Ia({transition:"scale-rotate-transition"})},"VBadge"),up=o()({name:"VBadge",inheritAttrs:!1,props:sp(),setup(e,t){const{backgroundColorClasses:a,backgroundColorStyles:l}=ya(()=>e.color),{roundedClasses:n}=ka(e),{t:o}=M(),{textColorClasses:i,textColorStyles:r}=ha(()=>e.textColor),{themeClasses:s}=N(),{locationStyles:u}=Dn(e,!0,t=>(e.floating?e.dot?2:4:e.dot?8:12)+(["top","bottom"].includes(t)?Number(e.offsetY??0):["left","right"].includes(t)?Number(e.offsetX??0):0));return wt(()=>{const c=Number(e.content),d=!e.max||isNaN(c)?e.content:c<=Number(e.max)?c:`${e.max}+`,[v,p]=de(t.attrs,["aria-atomic","aria-label","aria-live","role","title"]);return np(e.tag,ip({class:["v-badge",{"v-badge--bordered":e.bordered,"v-badge--dot":e.dot,"v-badge--floating":e.floating,"v-badge--inline":e.inline},e.class]},p,{style:e.style}),{default:()=>[np("div",{class:"v-badge__wrapper"},[t.slots.default?.(),np(Ba,{transition:e.transition},{default:()=>[rp(np("span",ip({class:["v-badge__badge",s.value,a.value,n.value,i.value],style:[l.value,r.value,e.inline?{}:u.value],"aria-atomic":"true","aria-label":o(e.label,c),"aria-live":"polite",role:"status"},v),[e.dot?void 0:t.slots.badge?t.slots.badge?.():e.icon?np(bn,{icon:e.icon},null):d]),[[op,e.modelValue]])]})])]})}),{}}}),{createVNode:cp}=await e("vue"),dp=t({color:String,density:String,...qe()},"VBannerActions"),vp=o()({name:"VBannerActions",props:dp(),setup(e,t){let{slots:a}=t;return v({VBtn:{color:e.color,density:e.density,slim:!0,variant:"text"}}),wt(()=>cp("div",{class:["v-banner-actions",e.class],style:e.style},[a.default?.()])),{}}}),pp=vt("v-banner-text"),{createVNode:fp}=await e("vue"),{toRef:mp}=await e("vue"),gp=t({avatar:String,bgColor:String,color:String,icon:E,lines:String,stacked:Boolean,sticky:Boolean,text:String,...Ka(),...qe(),...Al(),...ua(),...q({mobile:null}),...Za(),...En(),...Yn(),...Sa(),...Vt(),...c()},"VBanner"),hp=o()({name:"VBanner",props:gp(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.bgColor),{borderClasses:o}=Xa(e),{densityClasses:i}=Nl(e),{displayClasses:s,mobile:u}=G(e),{dimensionStyles:c}=ca(e),{elevationClasses:d}=el(e),{locationStyles:p}=Dn(e),{positionClasses:f}=qn(e),{roundedClasses:m}=ka(e),{themeClasses:g}=r(e),h=mp(()=>e.color),y=mp(()=>e.density);v({VBannerActions:{color:h,density:y}}),wt(()=>{const t=!(!e.text&&!a.text),r=!(!e.avatar&&!e.icon),v=!(!r&&!a.prepend);return fp(e.tag,{class:["v-banner",{"v-banner--stacked":e.stacked||u.value,"v-banner--sticky":e.sticky,[`v-banner--${e.lines}-line`]:!!e.lines},g.value,l.value,o.value,i.value,s.value,d.value,f.value,m.value,e.class],style:[n.value,c.value,p.value,e.style],role:"banner"},{default:()=>[v&&fp("div",{key:"prepend",class:"v-banner__prepend"},[a.prepend?fp(ra,{key:"prepend-defaults",disabled:!r,defaults:{VAvatar:{color:h.value,density:y.value,icon:e.icon,image:e.avatar}}},a.prepend):fp(Ko,{key:"prepend-avatar",color:h.value,density:y.value,icon:e.icon,image:e.avatar},null)]),fp("div",{class:"v-banner__content"},[t&&fp(pp,{key:"text"},{default:()=>[a.text?.()??e.text]}),a.default?.()]),a.actions&&fp(vp,{key:"actions"},a.actions)]})})}}),{createVNode:yp}=await e("vue"),{computed:bp,toRef:wp}=await e("vue"),Sp=t({baseColor:String,bgColor:String,color:String,grow:Boolean,mode:{type:String,validator:e=>!e||["horizontal","shift"].includes(e)},height:{type:[Number,String],default:56},active:{type:Boolean,default:!0},...Ka(),...qe(),...Al(),...Za(),...Sa(),...I({name:"bottom-navigation"}),...Vt({tag:"header"}),...tn({selectedClass:"v-btn--selected"}),...c()},"VBottomNavigation"),kp=o()({name:"VBottomNavigation",props:Sp(),emits:{"update:active":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=N(),{borderClasses:n}=Xa(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.bgColor),{densityClasses:r}=Nl(e),{elevationClasses:s}=el(e),{roundedClasses:u}=ka(e),{ssrBootStyles:c}=yl(),d=bp(()=>Number(e.height)-("comfortable"===e.density?8:0)-("compact"===e.density?16:0)),f=V(e,"active",e.active),{layoutItemStyles:m}=_({id:e.name,order:bp(()=>parseInt(e.order,10)),position:wp(()=>"bottom"),layoutSize:wp(()=>f.value?d.value:0),elementSize:d,active:f,absolute:wp(()=>e.absolute)});return nn(e,un),v({VBtn:{baseColor:wp(()=>e.baseColor),color:wp(()=>e.color),density:wp(()=>e.density),stacked:wp(()=>"horizontal"!==e.mode),variant:"text"}},{scoped:!0}),wt(()=>yp(e.tag,{class:["v-bottom-navigation",{"v-bottom-navigation--active":f.value,"v-bottom-navigation--grow":e.grow,"v-bottom-navigation--shift":"shift"===e.mode},l.value,o.value,n.value,r.value,s.value,u.value,e.class],style:[i.value,m.value,{height:p(d.value)},c.value,e.style]},{default:()=>[a.default&&yp("div",{class:"v-bottom-navigation__content"},[a.default()])]})),{}}}),{createVNode:xp,mergeProps:Vp}=await e("vue"),{mergeProps:Cp,nextTick:_p,onBeforeUnmount:Ip,ref:Bp,watch:Pp}=await e("vue"),Ap=t({fullscreen:Boolean,retainFocus:{type:Boolean,default:!0},scrollable:Boolean,...Kc({origin:"center center",scrollStrategy:"block",transition:{component:zt},zIndex:2400})},"VDialog"),Np=o()({name:"VDialog",props:Ap(),emits:{"update:modelValue":e=>!0,afterEnter:()=>!0,afterLeave:()=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=V(e,"modelValue"),{scopeId:o}=mc(),i=Bp();function r(e){const t=e.relatedTarget,a=e.target;if(t!==a&&i.value?.contentEl&&i.value?.globalTop&&![document,i.value.contentEl].includes(a)&&!i.value.contentEl.contains(a)){const e=K(i.value.contentEl);if(!e.length)return;const a=e[0],l=e[e.length-1];t===a?l.focus():a.focus()}}function s(){a("afterEnter"),(e.scrim||e.retainFocus)&&i.value?.contentEl&&!i.value.contentEl.contains(document.activeElement)&&i.value.contentEl.focus({preventScroll:!0})}function u(){a("afterLeave")}return Ip(()=>{document.removeEventListener("focusin",r)}),$&&Pp(()=>n.value&&e.retainFocus,e=>{e?document.addEventListener("focusin",r):document.removeEventListener("focusin",r)},{immediate:!0}),Pp(n,async e=>{e||(await _p(),i.value.activatorEl?.focus({preventScroll:!0}))}),wt(()=>{const t=Xc.filterProps(e),a=Cp({"aria-haspopup":"dialog"},e.activatorProps),r=Cp({tabindex:-1},e.contentProps);return xp(Xc,Vp({ref:i,class:["v-dialog",{"v-dialog--fullscreen":e.fullscreen,"v-dialog--scrollable":e.scrollable},e.class],style:e.style},t,{modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,"aria-modal":"true",activatorProps:a,contentProps:r,height:e.fullscreen?void 0:e.height,width:e.fullscreen?void 0:e.width,maxHeight:e.fullscreen?void 0:e.maxHeight,maxWidth:e.fullscreen?void 0:e.maxWidth,role:"dialog",onAfterEnter:s,onAfterLeave:u},o),{activator:l.activator,default:function(){for(var e=arguments.length,t=new Array(e),a=0;a<e;a++)t[a]=arguments[a];return xp(ra,{root:"VDialog"},{default:()=>[l.default?.(...t)]})}})}),Zc({},i)}}),{mergeProps:Tp,createVNode:Ep}=await e("vue"),Dp=t({inset:Boolean,...Ap({transition:"bottom-sheet-transition"})},"VBottomSheet"),Rp=o()({name:"VBottomSheet",props:Dp(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue");return wt(()=>{const t=Np.filterProps(e);return Ep(Np,Tp(t,{contentClass:["v-bottom-sheet__content",e.contentClass],modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,class:["v-bottom-sheet",{"v-bottom-sheet--inset":e.inset},e.class],style:e.style}),a)}),{}}}),{createVNode:$p}=await e("vue"),Lp=t({divider:[Number,String],...qe()},"VBreadcrumbsDivider"),Fp=o()({name:"VBreadcrumbsDivider",props:Lp(),setup(e,t){let{slots:a}=t;return wt(()=>$p("li",{"aria-hidden":"true",class:["v-breadcrumbs-divider",e.class],style:e.style},[a?.default?.()??e.divider])),{}}}),{mergeProps:Mp,createVNode:Op}=await e("vue"),{computed:zp}=await e("vue"),jp=t({active:Boolean,activeClass:String,activeColor:String,color:String,disabled:Boolean,title:String,...qe(),...lo(),...Vt({tag:"li"})},"VBreadcrumbsItem"),Hp=o()({name:"VBreadcrumbsItem",props:jp(),setup(e,t){let{slots:a,attrs:l}=t;const n=ao(e,l),o=zp(()=>e.active||n.isActive?.value),{textColorClasses:i,textColorStyles:r}=ha(()=>o.value?e.activeColor:e.color);return wt(()=>Op(e.tag,{class:["v-breadcrumbs-item",{"v-breadcrumbs-item--active":o.value,"v-breadcrumbs-item--disabled":e.disabled,[`${e.activeClass}`]:o.value&&e.activeClass},i.value,e.class],style:[r.value,e.style],"aria-current":o.value?"page":void 0},{default:()=>[n.isLink.value?Op("a",Mp({class:"v-breadcrumbs-item--link",onClick:n.navigate},n.linkProps),[a.default?.()??e.title]):a.default?.()??e.title]})),{}}}),{createVNode:Wp,Fragment:Up,mergeProps:Gp}=await e("vue"),{computed:Yp,toRef:qp}=await e("vue"),Kp=t({activeClass:String,activeColor:String,bgColor:String,color:String,disabled:Boolean,divider:{type:String,default:"/"},icon:E,items:{type:Array,default:()=>[]},...qe(),...Al(),...Sa(),...Vt({tag:"ul"})},"VBreadcrumbs"),Xp=o()({name:"VBreadcrumbs",props:Kp(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.bgColor),{densityClasses:o}=Nl(e),{roundedClasses:i}=ka(e);v({VBreadcrumbsDivider:{divider:qp(()=>e.divider)},VBreadcrumbsItem:{activeClass:qp(()=>e.activeClass),activeColor:qp(()=>e.activeColor),color:qp(()=>e.color),disabled:qp(()=>e.disabled)}});const r=Yp(()=>e.items.map(e=>"string"==typeof e?{item:{title:e},raw:e}:{item:e,raw:e}));return wt(()=>{const t=!(!a.prepend&&!e.icon);return Wp(e.tag,{class:["v-breadcrumbs",l.value,o.value,i.value,e.class],style:[n.value,e.style]},{default:()=>[t&&Wp("li",{key:"prepend",class:"v-breadcrumbs__prepend"},[a.prepend?Wp(ra,{key:"prepend-defaults",disabled:!e.icon,defaults:{VIcon:{icon:e.icon,start:!0}}},a.prepend):Wp(bn,{key:"prepend-icon",start:!0,icon:e.icon},null)]),r.value.map((e,t,l)=>{let{item:n,raw:o}=e;return Wp(Up,null,[a.item?.({item:n,index:t})??Wp(Hp,Gp({key:t,disabled:t>=l.length-1},"string"==typeof n?{title:n}:n),{default:a.title?()=>a.title?.({item:n,index:t}):void 0}),t<l.length-1&&Wp(Fp,null,{default:a.divider?()=>a.divider?.({item:o,index:t}):void 0})])}),a.default?.()]})}),{}}}),{createVNode:Jp}=await e("vue"),Qp=o()({name:"VCardActions",props:qe(),setup(e,t){let{slots:a}=t;return v({VBtn:{slim:!0,variant:"text"}}),wt(()=>Jp("div",{class:["v-card-actions",e.class],style:e.style},[a.default?.()])),{}}}),{createVNode:Zp}=await e("vue"),ef=t({opacity:[Number,String],...qe(),...Vt()},"VCardSubtitle"),tf=o()({name:"VCardSubtitle",props:ef(),setup(e,t){let{slots:a}=t;return wt(()=>Zp(e.tag,{class:["v-card-subtitle",e.class],style:[{"--v-card-subtitle-opacity":e.opacity},e.style]},a)),{}}}),af=vt("v-card-title"),{Fragment:lf,createVNode:nf}=await e("vue"),{toDisplayString:of}=await e("vue"),rf=t({appendAvatar:String,appendIcon:E,prependAvatar:String,prependIcon:E,subtitle:{type:[String,Number,Boolean],default:void 0},title:{type:[String,Number,Boolean],default:void 0},...qe(),...Al()},"VCardItem"),sf=o()({name:"VCardItem",props:rf(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=!(!e.prependAvatar&&!e.prependIcon),l=!(!t&&!a.prepend),n=!(!e.appendAvatar&&!e.appendIcon),o=!(!n&&!a.append),i=!(null==e.title&&!a.title),r=!(null==e.subtitle&&!a.subtitle);return nf("div",{class:["v-card-item",e.class],style:e.style},[l&&nf("div",{key:"prepend",class:"v-card-item__prepend"},[a.prepend?nf(ra,{key:"prepend-defaults",disabled:!t,defaults:{VAvatar:{density:e.density,image:e.prependAvatar},VIcon:{density:e.density,icon:e.prependIcon}}},a.prepend):nf(lf,null,[e.prependAvatar&&nf(Ko,{key:"prepend-avatar",density:e.density,image:e.prependAvatar},null),e.prependIcon&&nf(bn,{key:"prepend-icon",density:e.density,icon:e.prependIcon},null)])]),nf("div",{class:"v-card-item__content"},[i&&nf(af,{key:"title"},{default:()=>[a.title?.()??of(e.title)]}),r&&nf(tf,{key:"subtitle"},{default:()=>[a.subtitle?.()??of(e.subtitle)]}),a.default?.()]),o&&nf("div",{key:"append",class:"v-card-item__append"},[a.append?nf(ra,{key:"append-defaults",disabled:!n,defaults:{VAvatar:{density:e.density,image:e.appendAvatar},VIcon:{density:e.density,icon:e.appendIcon}}},a.append):nf(lf,null,[e.appendIcon&&nf(bn,{key:"append-icon",density:e.density,icon:e.appendIcon},null),e.appendAvatar&&nf(Ko,{key:"append-avatar",density:e.density,image:e.appendAvatar},null)])])])}),{}}}),{createVNode:uf}=await e("vue"),cf=t({opacity:[Number,String],...qe(),...Vt()},"VCardText"),df=o()({name:"VCardText",props:cf(),setup(e,t){let{slots:a}=t;return wt(()=>uf(e.tag,{class:["v-card-text",e.class],style:[{"--v-card-text-opacity":e.opacity},e.style]},a)),{}}}),{createVNode:vf,resolveDirective:pf,mergeProps:ff,withDirectives:mf}=await e("vue"),gf=t({appendAvatar:String,appendIcon:E,disabled:Boolean,flat:Boolean,hover:Boolean,image:String,link:{type:Boolean,default:void 0},prependAvatar:String,prependIcon:E,ripple:{type:[Boolean,Object],default:!0},subtitle:{type:[String,Number,Boolean],default:void 0},text:{type:[String,Number,Boolean],default:void 0},title:{type:[String,Number,Boolean],default:void 0},...Ka(),...qe(),...Al(),...ua(),...Za(),...jn(),...En(),...Yn(),...Sa(),...lo(),...Vt(),...c(),...Fl({variant:"elevated"})},"VCard"),hf=o()({name:"VCard",directives:{Ripple:Vo},props:gf(),setup(e,t){let{attrs:a,slots:l}=t;const{themeClasses:n}=r(e),{borderClasses:o}=Xa(e),{colorClasses:i,colorStyles:s,variantClasses:u}=Ml(e),{densityClasses:c}=Nl(e),{dimensionStyles:d}=ca(e),{elevationClasses:v}=el(e),{loaderClasses:p}=Hn(e),{locationStyles:f}=Dn(e),{positionClasses:m}=qn(e),{roundedClasses:g}=ka(e),h=ao(e,a);return wt(()=>{const t=!1!==e.link&&h.isLink.value,a=!e.disabled&&!1!==e.link&&(e.link||h.isClickable.value),r=t?"a":e.tag,y=!(!l.title&&null==e.title),b=!(!l.subtitle&&null==e.subtitle),w=y||b,S=!!(l.append||e.appendAvatar||e.appendIcon),k=!!(l.prepend||e.prependAvatar||e.prependIcon),x=!(!l.image&&!e.image),V=w||k||S,C=!(!l.text&&null==e.text);return mf(vf(r,ff({class:["v-card",{"v-card--disabled":e.disabled,"v-card--flat":e.flat,"v-card--hover":e.hover&&!(e.disabled||e.flat),"v-card--link":a},n.value,o.value,i.value,c.value,v.value,p.value,m.value,g.value,u.value,e.class],style:[s.value,d.value,f.value,e.style],onClick:a&&h.navigate,tabindex:e.disabled?-1:void 0},h.linkProps),{default:()=>[x&&vf("div",{key:"image",class:"v-card__image"},[l.image?vf(ra,{key:"image-defaults",disabled:!e.image,defaults:{VImg:{cover:!0,src:e.image}}},l.image):vf(Ya,{key:"image-img",cover:!0,src:e.image},null)]),vf(Wn,{name:"v-card",active:!!e.loading,color:"boolean"==typeof e.loading?void 0:e.loading},{default:l.loader}),V&&vf(sf,{key:"item",prependAvatar:e.prependAvatar,prependIcon:e.prependIcon,title:e.title,subtitle:e.subtitle,appendAvatar:e.appendAvatar,appendIcon:e.appendIcon},{default:l.item,prepend:l.prepend,title:l.title,subtitle:l.subtitle,append:l.append}),C&&vf(df,{key:"text"},{default:()=>[l.text?.()??e.text]}),l.default?.(),l.actions&&vf(Qp,null,{default:l.actions}),Ll(a,"v-card")]}),[[pf("ripple"),a&&e.ripple]])}),{}}});function yf(e,t){const a=e.changedTouches[0];t.touchendX=a.clientX,t.touchendY=a.clientY,t.end?.({originalEvent:e,...t}),(e=>{const{touchstartX:t,touchendX:a,touchstartY:l,touchendY:n}=e;e.offsetX=a-t,e.offsetY=n-l,Math.abs(e.offsetY)<.5*Math.abs(e.offsetX)&&(e.left&&a<t-16&&e.left(e),e.right&&a>t+16&&e.right(e)),Math.abs(e.offsetX)<.5*Math.abs(e.offsetY)&&(e.up&&n<l-16&&e.up(e),e.down&&n>l+16&&e.down(e))})(t)}const bf={mounted:function(e,t){const a=t.value,l=a?.parent?e.parentElement:e,n=a?.options??{passive:!0},o=t.instance?.$.uid;if(!l||!o)return;const i=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const t={touchstartX:0,touchstartY:0,touchendX:0,touchendY:0,touchmoveX:0,touchmoveY:0,offsetX:0,offsetY:0,left:e.left,right:e.right,up:e.up,down:e.down,start:e.start,move:e.move,end:e.end};return{touchstart:e=>function(e,t){const a=e.changedTouches[0];t.touchstartX=a.clientX,t.touchstartY=a.clientY,t.start?.({originalEvent:e,...t})}(e,t),touchend:e=>yf(e,t),touchmove:e=>function(e,t){const a=e.changedTouches[0];t.touchmoveX=a.clientX,t.touchmoveY=a.clientY,t.move?.({originalEvent:e,...t})}(e,t)}}(t.value);l._touchHandlers=l._touchHandlers??Object.create(null),l._touchHandlers[o]=i,ve(i).forEach(e=>{l.addEventListener(e,i[e],n)})},unmounted:function(e,t){const a=t.value?.parent?e.parentElement:e,l=t.instance?.$.uid;if(!a?._touchHandlers||!l)return;const n=a._touchHandlers[l];ve(n).forEach(e=>{a.removeEventListener(e,n[e])}),delete a._touchHandlers[l]}},{createVNode:wf,resolveDirective:Sf,withDirectives:kf}=await e("vue"),{computed:xf,provide:Vf,ref:Cf,shallowRef:_f,toRef:If,watch:Bf}=await e("vue"),Pf=Symbol.for("vuetify:v-window"),Af=Symbol.for("vuetify:v-window-group"),Nf=t({continuous:Boolean,nextIcon:{type:[Boolean,String,Function,Object],default:"$next"},prevIcon:{type:[Boolean,String,Function,Object],default:"$prev"},reverse:Boolean,showArrows:{type:[Boolean,String],validator:e=>"boolean"==typeof e||"hover"===e},touch:{type:[Object,Boolean],default:void 0},direction:{type:String,default:"horizontal"},modelValue:null,disabled:Boolean,selectedClass:{type:String,default:"v-window-item--active"},mandatory:{type:[Boolean,String],default:"force"},...qe(),...Vt(),...c()},"VWindow"),Tf=o()({name:"VWindow",directives:{Touch:bf},props:Nf(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{isRtl:n}=u(),{t:o}=M(),i=nn(e,Af),s=Cf(),c=xf(()=>n.value?!e.reverse:e.reverse),d=_f(!1),v=xf(()=>`v-window-${"vertical"===e.direction?"y":"x"}${(c.value?!d.value:d.value)?"-reverse":""}-transition`),p=_f(0),f=Cf(void 0),m=xf(()=>i.items.value.findIndex(e=>i.selected.value.includes(e.id)));Bf(m,(e,t)=>{const a=i.items.value.length,l=a-1;d.value=a<=2?e<t:e===l&&0===t||(0!==e||t!==l)&&e<t}),Vf(Pf,{transition:v,isReversed:d,transitionCount:p,transitionHeight:f,rootRef:s});const g=If(()=>e.continuous||0!==m.value),h=If(()=>e.continuous||m.value!==i.items.value.length-1);function y(){g.value&&i.prev()}function b(){h.value&&i.next()}const w=xf(()=>{const t=[],l={icon:n.value?e.nextIcon:e.prevIcon,class:"v-window__"+(c.value?"right":"left"),onClick:i.prev,"aria-label":o("$vuetify.carousel.prev")};t.push(g.value?a.prev?a.prev({props:l}):wf(To,l,null):wf("div",null,null));const r={icon:n.value?e.prevIcon:e.nextIcon,class:"v-window__"+(c.value?"left":"right"),onClick:i.next,"aria-label":o("$vuetify.carousel.next")};return t.push(h.value?a.next?a.next({props:r}):wf(To,r,null):wf("div",null,null)),t}),S=xf(()=>{if(!1===e.touch)return e.touch;return{...{left:()=>{c.value?y():b()},right:()=>{c.value?b():y()},start:e=>{let{originalEvent:t}=e;t.stopPropagation()}},...!0===e.touch?{}:e.touch}});return wt(()=>kf(wf(e.tag,{ref:s,class:["v-window",{"v-window--show-arrows-on-hover":"hover"===e.showArrows},l.value,e.class],style:e.style},{default:()=>[wf("div",{class:"v-window__container",style:{height:f.value}},[a.default?.({group:i}),!1!==e.showArrows&&wf("div",{class:"v-window__controls"},[w.value])]),a.additional?.({group:i})]}),[[Sf("touch"),S.value]])),{group:i}}}),{Fragment:Ef,mergeProps:Df,createVNode:Rf}=await e("vue"),{onMounted:$f,ref:Lf,watch:Ff}=await e("vue"),Mf=t({color:String,cycle:Boolean,delimiterIcon:{type:E,default:"$delimiter"},height:{type:[Number,String],default:500},hideDelimiters:Boolean,hideDelimiterBackground:Boolean,interval:{type:[Number,String],default:6e3,validator:e=>Number(e)>0},progress:[Boolean,String],verticalDelimiters:[Boolean,String],...Nf({continuous:!0,mandatory:"force",showArrows:!0})},"VCarousel"),Of=o()({name:"VCarousel",props:Mf(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{t:n}=M(),o=Lf();let i=-1;function r(){e.cycle&&o.value&&(i=window.setTimeout(o.value.group.next,Number(e.interval)>0?Number(e.interval):6e3))}function s(){window.clearTimeout(i),window.requestAnimationFrame(r)}return Ff(l,s),Ff(()=>e.interval,s),Ff(()=>e.cycle,e=>{e?s():window.clearTimeout(i)}),$f(r),wt(()=>{const t=Tf.filterProps(e);return Rf(Tf,Df({ref:o},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,class:["v-carousel",{"v-carousel--hide-delimiter-background":e.hideDelimiterBackground,"v-carousel--vertical-delimiters":e.verticalDelimiters},e.class],style:[{height:p(e.height)},e.style]}),{default:a.default,additional:t=>{let{group:o}=t;return Rf(Ef,null,[!e.hideDelimiters&&Rf("div",{class:"v-carousel__controls",style:{left:"left"===e.verticalDelimiters&&e.verticalDelimiters?0:"auto",right:"right"===e.verticalDelimiters?0:"auto"}},[o.items.value.length>0&&Rf(ra,{defaults:{VBtn:{color:e.color,icon:e.delimiterIcon,size:"x-small",variant:"text"}},scoped:!0},{default:()=>[o.items.value.map((e,t)=>{const l={id:`carousel-item-${e.id}`,"aria-label":n("$vuetify.carousel.ariaLabel.delimiter",t+1,o.items.value.length),class:["v-carousel__controls__item",o.isSelected(e.id)&&"v-btn--active"],onClick:()=>o.select(e.id,!0)};return a.item?a.item({props:l,item:e}):Rf(To,Df(e,l),null)})]})]),e.progress&&Rf(Mn,{class:"v-carousel__progress",color:"string"==typeof e.progress?e.progress:void 0,modelValue:(o.getItemIndex(l.value)+1)/o.items.value.length*100},null)])},prev:a.prev,next:a.next})}),{}}}),{vShow:zf,createVNode:jf,withDirectives:Hf}=await e("vue"),{computed:Wf,inject:Uf,nextTick:Gf,shallowRef:Yf}=await e("vue"),qf=t({reverseTransition:{type:[Boolean,String],default:void 0},transition:{type:[Boolean,String],default:void 0},...qe(),...an(),...pc()},"VWindowItem"),Kf=o()({name:"VWindowItem",directives:{Touch:bf},props:qf(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=Uf(Pf),n=ln(e,Af),{isBooted:o}=yl();if(!l||!n)throw new Error("[Vuetify] VWindowItem must be used inside VWindow");const i=Yf(!1),r=Wf(()=>o.value&&(l.isReversed.value?!1!==e.reverseTransition:!1!==e.transition));function s(){i.value&&l&&(i.value=!1,l.transitionCount.value>0&&(l.transitionCount.value-=1,0===l.transitionCount.value&&(l.transitionHeight.value=void 0)))}function u(){!i.value&&l&&(i.value=!0,0===l.transitionCount.value&&(l.transitionHeight.value=p(l.rootRef.value?.clientHeight)),l.transitionCount.value+=1)}function c(){s()}function d(e){i.value&&Gf(()=>{r.value&&i.value&&l&&(l.transitionHeight.value=p(e.clientHeight))})}const v=Wf(()=>{const t=l.isReversed.value?e.reverseTransition:e.transition;return!!r.value&&{name:"string"!=typeof t?l.transition.value:t,onBeforeEnter:u,onAfterEnter:s,onEnterCancelled:c,onBeforeLeave:u,onAfterLeave:s,onLeaveCancelled:c,onEnter:d}}),{hasContent:f}=fc(e,n.isSelected);return wt(()=>jf(Ba,{transition:v.value,disabled:!o.value},{default:()=>[Hf(jf("div",{class:["v-window-item",n.selectedClass.value,e.class],style:e.style},[f.value&&a.default?.()]),[[zf,n.isSelected.value]])]})),{groupItem:n}}}),{mergeProps:Xf,createVNode:Jf}=await e("vue"),Qf=t({...Ga(),...qf()},"VCarouselItem"),Zf=o()({name:"VCarouselItem",inheritAttrs:!1,props:Qf(),setup(e,t){let{slots:a,attrs:l}=t;wt(()=>{const t=Ya.filterProps(e),n=Kf.filterProps(e);return Jf(Kf,Xf({class:["v-carousel-item",e.class]},n),{default:()=>[Jf(Ya,Xf(l,t),a)]})})}}),em=vt("v-code","code"),{createVNode:tm}=await e("vue"),{computed:am,onMounted:lm,ref:nm,shallowRef:om,watch:im}=await e("vue"),rm=J({name:"VColorPickerCanvas",props:t({color:{type:Object},disabled:Boolean,dotSize:{type:[Number,String],default:10},height:{type:[Number,String],default:150},width:{type:[Number,String],default:300},...qe()},"VColorPickerCanvas")(),emits:{"update:color":e=>!0,"update:position":e=>!0},setup(e,t){let{emit:a}=t;const l=om(!1),n=nm(),o=om(parseFloat(e.width)),i=om(parseFloat(e.height)),r=nm({x:0,y:0}),s=am({get:()=>r.value,set(t){if(!n.value)return;const{x:l,y:s}=t;r.value=t,a("update:color",{h:e.color?.h??0,s:k(l,0,o.value)/o.value,v:1-k(s,0,i.value)/i.value,a:e.color?.a??1})}}),u=am(()=>{const{x:t,y:a}=s.value,l=parseInt(e.dotSize,10)/2;return{width:p(e.dotSize),height:p(e.dotSize),transform:`translate(${p(t-l)}, ${p(a-l)})`}}),{resizeRef:c}=R(e=>{if(!c.el?.offsetParent)return;const{width:t,height:a}=e[0].contentRect;o.value=t,i.value=a});function d(t){"mousedown"===t.type&&t.preventDefault(),e.disabled||(v(t),window.addEventListener("mousemove",v),window.addEventListener("mouseup",f),window.addEventListener("touchmove",v),window.addEventListener("touchend",f))}function v(t){if(e.disabled||!n.value)return;l.value=!0;const a=pe(t);!function(e,t,a){const{left:l,top:n,width:o,height:i}=a;s.value={x:k(e-l,0,o),y:k(t-n,0,i)}}(a.clientX,a.clientY,n.value.getBoundingClientRect())}function f(){window.removeEventListener("mousemove",v),window.removeEventListener("mouseup",f),window.removeEventListener("touchmove",v),window.removeEventListener("touchend",f)}function m(){if(!n.value)return;const t=n.value,a=t.getContext("2d");if(!a)return;const l=a.createLinearGradient(0,0,t.width,0);l.addColorStop(0,"hsla(0, 0%, 100%, 1)"),l.addColorStop(1,`hsla(${e.color?.h??0}, 100%, 50%, 1)`),a.fillStyle=l,a.fillRect(0,0,t.width,t.height);const o=a.createLinearGradient(0,0,0,t.height);o.addColorStop(0,"hsla(0, 0%, 0%, 0)"),o.addColorStop(1,"hsla(0, 0%, 0%, 1)"),a.fillStyle=o,a.fillRect(0,0,t.width,t.height)}return im(()=>e.color?.h,m,{immediate:!0}),im(()=>[o.value,i.value],(e,t)=>{m(),r.value={x:s.value.x*e[0]/t[0],y:s.value.y*e[1]/t[1]}},{flush:"post"}),im(()=>e.color,()=>{l.value?l.value=!1:r.value=e.color?{x:e.color.s*o.value,y:(1-e.color.v)*i.value}:{x:0,y:0}},{deep:!0,immediate:!0}),lm(()=>m()),wt(()=>tm("div",{ref:c,class:["v-color-picker-canvas",e.class],style:e.style,onMousedown:d,onTouchstartPassive:d},[tm("canvas",{ref:n,width:o.value,height:i.value},null),e.color&&tm("div",{class:["v-color-picker-canvas__dot",{"v-color-picker-canvas__dot--disabled":e.disabled}],style:u.value},null)])),{}}});const sm={h:0,s:0,v:0,a:1},um={inputProps:{type:"number",min:0},inputs:[{label:"R",max:255,step:1,getValue:e=>Math.round(e.r),getColor:(e,t)=>({...e,r:Number(t)})},{label:"G",max:255,step:1,getValue:e=>Math.round(e.g),getColor:(e,t)=>({...e,g:Number(t)})},{label:"B",max:255,step:1,getValue:e=>Math.round(e.b),getColor:(e,t)=>({...e,b:Number(t)})},{label:"A",max:1,step:.01,getValue:e=>{let{a:t}=e;return null!=t?Math.round(100*t)/100:1},getColor:(e,t)=>({...e,a:Number(t)})}],to:be,from:ye},cm={...um,inputs:um.inputs?.slice(0,3)},dm={inputProps:{type:"number",min:0},inputs:[{label:"H",max:360,step:1,getValue:e=>Math.round(e.h),getColor:(e,t)=>({...e,h:Number(t)})},{label:"S",max:1,step:.01,getValue:e=>Math.round(100*e.s)/100,getColor:(e,t)=>({...e,s:Number(t)})},{label:"L",max:1,step:.01,getValue:e=>Math.round(100*e.l)/100,getColor:(e,t)=>({...e,l:Number(t)})},{label:"A",max:1,step:.01,getValue:e=>{let{a:t}=e;return null!=t?Math.round(100*t)/100:1},getColor:(e,t)=>({...e,a:Number(t)})}],to:he,from:ge},vm={...dm,inputs:dm.inputs.slice(0,3)},pm={inputProps:{type:"text"},inputs:[{label:"HEXA",getValue:e=>e,getColor:(e,t)=>t}],to:me,from:fe},fm={rgb:cm,rgba:um,hsl:vm,hsla:dm,hex:{...pm,inputs:[{label:"HEX",getValue:e=>e.slice(0,7),getColor:(e,t)=>t}]},hexa:pm},{createVNode:mm}=await e("vue"),{computed:gm}=await e("vue"),hm=e=>{let{label:t,...a}=e;return mm("div",{class:"v-color-picker-edit__input"},[mm("input",a,null),mm("span",null,[t])])},ym=J({name:"VColorPickerEdit",props:t({color:Object,disabled:Boolean,mode:{type:String,default:"rgba",validator:e=>Object.keys(fm).includes(e)},modes:{type:Array,default:()=>Object.keys(fm),validator:e=>Array.isArray(e)&&e.every(e=>Object.keys(fm).includes(e))},...qe()},"VColorPickerEdit")(),emits:{"update:color":e=>!0,"update:mode":e=>!0},setup(e,t){let{emit:a}=t;const l=gm(()=>e.modes.map(e=>({...fm[e],name:e}))),n=gm(()=>{const t=l.value.find(t=>t.name===e.mode);if(!t)return[];const n=e.color?t.to(e.color):null;return t.inputs?.map(l=>{let{getValue:o,getColor:i,...r}=l;return{...t.inputProps,...r,disabled:e.disabled,value:n&&o(n),onChange:e=>{const l=e.target;l&&a("update:color",t.from(i(n??t.to(sm),l.value)))}}})});return wt(()=>mm("div",{class:["v-color-picker-edit",e.class],style:e.style},[n.value?.map(e=>mm(hm,e,null)),l.value.length>1&&mm(To,{icon:"$unfold",size:"x-small",variant:"plain",onClick:()=>{const t=l.value.findIndex(t=>t.name===e.mode);a("update:mode",l.value[(t+1)%l.value.length].name)}},null)])),{}}}),{computed:bm,nextTick:wm,provide:Sm,ref:km,shallowRef:xm,toRef:Vm}=await e("vue"),Cm=Symbol.for("vuetify:v-slider");function _m(e,t,a){const l="vertical"===a,n=t.getBoundingClientRect(),o="touches"in e?e.touches[0]:e;return l?o.clientY-(n.top+n.height/2):o.clientX-(n.left+n.width/2)}const Im=t({disabled:{type:Boolean,default:null},error:Boolean,readonly:{type:Boolean,default:null},max:{type:[Number,String],default:100},min:{type:[Number,String],default:0},step:{type:[Number,String],default:0},thumbColor:String,thumbLabel:{type:[Boolean,String],default:void 0,validator:e=>"boolean"==typeof e||"always"===e},thumbSize:{type:[Number,String],default:20},showTicks:{type:[Boolean,String],default:!1,validator:e=>"boolean"==typeof e||"always"===e},ticks:{type:[Array,Object]},tickSize:{type:[Number,String],default:2},color:String,trackColor:String,trackFillColor:String,trackSize:{type:[Number,String],default:4},direction:{type:String,default:"horizontal",validator:e=>["vertical","horizontal"].includes(e)},reverse:Boolean,...Sa(),...Za({elevation:2}),ripple:{type:Boolean,default:!0}},"Slider"),Bm=e=>{const t=bm(()=>parseFloat(e.min)),a=bm(()=>parseFloat(e.max)),l=bm(()=>Number(e.step)>0?parseFloat(e.step):0),n=bm(()=>Math.max(Se(l.value),Se(t.value)));return{min:t,max:a,step:l,decimals:n,roundValue:function(e){if(e=parseFloat(e),l.value<=0)return e;const o=k(e,t.value,a.value),i=t.value%l.value,r=Math.round((o-i)/l.value)*l.value+i;return parseFloat(Math.min(r,a.value).toFixed(n.value))}}},Pm=e=>{let{props:t,steps:a,onSliderStart:l,onSliderMove:n,onSliderEnd:o,getActiveThumb:i}=e;const{isRtl:r}=u(),s=Vm(()=>t.reverse),c=bm(()=>"vertical"===t.direction),d=bm(()=>c.value!==s.value),{min:v,max:p,step:f,decimals:m,roundValue:g}=a,h=bm(()=>parseInt(t.thumbSize,10)),y=bm(()=>parseInt(t.tickSize,10)),b=bm(()=>parseInt(t.trackSize,10)),w=bm(()=>(p.value-v.value)/f.value),S=Vm(()=>t.disabled),x=bm(()=>t.error||t.disabled?void 0:t.thumbColor??t.color),V=bm(()=>t.error||t.disabled?void 0:t.trackColor??t.color),C=bm(()=>t.error||t.disabled?void 0:t.trackFillColor??t.color),_=xm(!1),I=xm(0),B=km(),P=km();function A(e){const a=B.value?.$el;if(!a)return;const l="vertical"===t.direction,n=l?"top":"left",o=l?"height":"width",i=l?"clientY":"clientX",{[n]:s,[o]:u}=a.getBoundingClientRect(),c=function(e,t){return"touches"in e&&e.touches.length?e.touches[0][t]:"changedTouches"in e&&e.changedTouches.length?e.changedTouches[0][t]:e[t]}(e,i);let f=Math.min(Math.max((c-s-I.value)/u,0),1)||0;return(l?d.value:d.value!==r.value)&&(f=1-f),g(v.value+f*(p.value-v.value))}const N=e=>{const t=A(e);null!=t&&o({value:t}),_.value=!1,I.value=0},T=e=>{const a=A(e);P.value=i(e),P.value&&(_.value=!0,P.value.contains(e.target)?I.value=_m(e,P.value,t.direction):(I.value=0,null!=a&&n({value:a})),null!=a&&l({value:a}),wm(()=>P.value?.focus()))},E={passive:!0,capture:!0};function D(e){const t=A(e);null!=t&&n({value:t})}function R(e){e.stopPropagation(),e.preventDefault(),N(e),window.removeEventListener("mousemove",D,E),window.removeEventListener("mouseup",R)}function $(e){N(e),window.removeEventListener("touchmove",D,E),e.target?.removeEventListener("touchend",$)}const L=e=>{const t=(e-v.value)/(p.value-v.value)*100;return k(isNaN(t)?0:t,0,100)},F=Vm(()=>t.showTicks),M=bm(()=>F.value?t.ticks?Array.isArray(t.ticks)?t.ticks.map(e=>({value:e,position:L(e),label:e.toString()})):Object.keys(t.ticks).map(e=>({value:parseFloat(e),position:L(parseFloat(e)),label:t.ticks[e]})):w.value!==1/0?ke(w.value+1).map(e=>{const t=v.value+e*f.value;return{value:t,position:L(t)}}):[]:[]),O=bm(()=>M.value.some(e=>{let{label:t}=e;return!!t})),z={activeThumbRef:P,color:Vm(()=>t.color),decimals:m,disabled:S,direction:Vm(()=>t.direction),elevation:Vm(()=>t.elevation),hasLabels:O,isReversed:s,indexFromEnd:d,min:v,max:p,mousePressed:_,numTicks:w,onSliderMousedown:function(e){0===e.button&&(e.preventDefault(),T(e),window.addEventListener("mousemove",D,E),window.addEventListener("mouseup",R,{passive:!1}))},onSliderTouchstart:function(e){T(e),window.addEventListener("touchmove",D,E),e.target?.addEventListener("touchend",$,{passive:!1})},parsedTicks:M,parseMouseMove:A,position:L,readonly:Vm(()=>t.readonly),rounded:Vm(()=>t.rounded),roundValue:g,showTicks:F,startOffset:I,step:f,thumbSize:h,thumbColor:x,thumbLabel:Vm(()=>t.thumbLabel),ticks:Vm(()=>t.ticks),tickSize:y,trackColor:V,trackContainerRef:B,trackFillColor:C,trackSize:b,vertical:c};return Sm(Cm,z),z},{createVNode:Am,resolveDirective:Nm,withDirectives:Tm,vShow:Em}=await e("vue"),{computed:Dm,inject:Rm}=await e("vue"),$m=t({focused:Boolean,max:{type:Number,required:!0},min:{type:Number,required:!0},modelValue:{type:Number,required:!0},position:{type:Number,required:!0},ripple:{type:[Boolean,Object],default:!0},name:String,...qe()},"VSliderThumb"),Lm=o()({name:"VSliderThumb",directives:{Ripple:Vo},props:$m(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=Rm(Cm),{isRtl:o,rtlClasses:i}=u();if(!n)throw new Error("[Vuetify] v-slider-thumb must be used inside v-slider or v-range-slider");const{thumbColor:r,step:s,disabled:c,thumbSize:d,thumbLabel:v,direction:f,isReversed:m,vertical:g,readonly:h,elevation:y,mousePressed:b,decimals:w,indexFromEnd:S}=n,k=Dm(()=>c.value?void 0:y.value),{elevationClasses:x}=el(k),{textColorClasses:V,textColorStyles:C}=ha(r),{pageup:_,pagedown:I,end:B,home:P,left:A,right:N,down:T,up:E}=xe,D=[_,I,B,P,A,N,T,E],R=Dm(()=>s.value?[1,2,3]:[1,5,10]);function $(t){const a=function(t,a){if(!D.includes(t.key))return;t.preventDefault();const l=s.value||.1,n=(e.max-e.min)/l;if([A,N,T,E].includes(t.key)){const e=(g.value?[o.value?A:N,m.value?T:E]:S.value!==o.value?[A,E]:[N,E]).includes(t.key)?1:-1,n=t.shiftKey?2:t.ctrlKey?1:0;a+=e*l*R.value[n]}else t.key===P?a=e.min:t.key===B?a=e.max:a-=(t.key===I?1:-1)*l*(n>100?n/10:10);return Math.max(e.min,Math.min(e.max,a))}(t,e.modelValue);null!=a&&l("update:modelValue",a)}return wt(()=>{const t=p(S.value?100-e.position:e.position,"%");return Am("div",{class:["v-slider-thumb",{"v-slider-thumb--focused":e.focused,"v-slider-thumb--pressed":e.focused&&b.value},e.class,i.value],style:[{"--v-slider-thumb-position":t,"--v-slider-thumb-size":p(d.value)},e.style],role:"slider",tabindex:c.value?-1:0,"aria-label":e.name,"aria-valuemin":e.min,"aria-valuemax":e.max,"aria-valuenow":e.modelValue,"aria-readonly":!!h.value,"aria-orientation":f.value,onKeydown:h.value?void 0:$},[Am("div",{class:["v-slider-thumb__surface",V.value,x.value],style:{...C.value}},null),Tm(Am("div",{class:["v-slider-thumb__ripple",V.value],style:C.value},null),[[Nm("ripple"),e.ripple,null,{circle:!0,center:!0}]]),Am(qt,{origin:"bottom center"},{default:()=>[Tm(Am("div",{class:"v-slider-thumb__label-container"},[Am("div",{class:["v-slider-thumb__label"]},[Am("div",null,[a["thumb-label"]?.({modelValue:e.modelValue})??e.modelValue.toFixed(s.value?w.value:1)])])]),[[Em,v.value&&e.focused||"always"===v.value]])]})])}),{}}}),{createVNode:Fm}=await e("vue"),{computed:Mm,inject:Om}=await e("vue"),zm=t({start:{type:Number,required:!0},stop:{type:Number,required:!0},...qe()},"VSliderTrack"),jm=o()({name:"VSliderTrack",props:zm(),emits:{},setup(e,t){let{slots:a}=t;const l=Om(Cm);if(!l)throw new Error("[Vuetify] v-slider-track must be inside v-slider or v-range-slider");const{color:n,parsedTicks:o,rounded:i,showTicks:r,tickSize:s,trackColor:u,trackFillColor:c,trackSize:d,vertical:v,min:f,max:m,indexFromEnd:g}=l,{roundedClasses:h}=ka(i),{backgroundColorClasses:y,backgroundColorStyles:b}=ya(c),{backgroundColorClasses:w,backgroundColorStyles:S}=ya(u),k=Mm(()=>`inset-${v.value?"block":"inline"}-${g.value?"end":"start"}`),x=Mm(()=>v.value?"height":"width"),V=Mm(()=>({[k.value]:"0%",[x.value]:"100%"})),C=Mm(()=>e.stop-e.start),_=Mm(()=>({[k.value]:p(e.start,"%"),[x.value]:p(C.value,"%")})),I=Mm(()=>{if(!r.value)return[];return(v.value?o.value.slice().reverse():o.value).map((t,l)=>{const n=t.value!==f.value&&t.value!==m.value?p(t.position,"%"):void 0;return Fm("div",{key:t.value,class:["v-slider-track__tick",{"v-slider-track__tick--filled":t.position>=e.start&&t.position<=e.stop,"v-slider-track__tick--first":t.value===f.value,"v-slider-track__tick--last":t.value===m.value}],style:{[k.value]:n}},[(t.label||a["tick-label"])&&Fm("div",{class:"v-slider-track__tick-label"},[a["tick-label"]?.({tick:t,index:l})??t.label])])})});return wt(()=>Fm("div",{class:["v-slider-track",h.value,e.class],style:[{"--v-slider-track-size":p(d.value),"--v-slider-tick-size":p(s.value)},e.style]},[Fm("div",{class:["v-slider-track__background",w.value,{"v-slider-track__background--opacity":!!n.value||!c.value}],style:{...V.value,...S.value}},null),Fm("div",{class:["v-slider-track__fill",y.value],style:{..._.value,...b.value}},null),r.value&&Fm("div",{class:["v-slider-track__ticks",{"v-slider-track__ticks--always-show":"always"===r.value}]},[I.value])])),{}}}),{Fragment:Hm,createVNode:Wm,mergeProps:Um}=await e("vue"),{computed:Gm,ref:Ym}=await e("vue"),qm=t({...Di(),...Im(),...ur(),modelValue:{type:[Number,String],default:0}},"VSlider"),Km=o()({name:"VSlider",props:qm(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,start:e=>!0,end:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=Ym(),{rtlClasses:o}=u(),i=Bm(e),r=V(e,"modelValue",void 0,e=>i.roundValue(null==e?i.min.value:e)),{min:s,max:c,mousePressed:d,roundValue:v,onSliderMousedown:p,onSliderTouchstart:f,trackContainerRef:m,position:g,hasLabels:h,readonly:y}=Pm({props:e,steps:i,onSliderStart:()=>{l("start",r.value)},onSliderEnd:e=>{let{value:t}=e;const a=v(t);r.value=a,l("end",a)},onSliderMove:e=>{let{value:t}=e;return r.value=v(t)},getActiveThumb:()=>n.value?.$el}),{isFocused:b,focus:w,blur:S}=Ri(e),k=Gm(()=>g(r.value));return wt(()=>{const t=cr.filterProps(e),l=!!(e.label||a.label||a.prepend);return Wm(cr,Um({class:["v-slider",{"v-slider--has-labels":!!a["tick-label"]||h.value,"v-slider--focused":b.value,"v-slider--pressed":d.value,"v-slider--disabled":e.disabled},o.value,e.class],style:e.style},t,{focused:b.value}),{...a,prepend:l?t=>Wm(Hm,null,[a.label?.(t)??(e.label?Wm(Qo,{id:t.id.value,class:"v-slider__label",text:e.label},null):void 0),a.prepend?.(t)]):void 0,default:t=>{let{id:l,messagesId:o}=t;return Wm("div",{class:"v-slider__container",onMousedown:y.value?void 0:p,onTouchstartPassive:y.value?void 0:f},[Wm("input",{id:l.value,name:e.name||l.value,disabled:!!e.disabled,readonly:!!e.readonly,tabindex:"-1",value:r.value},null),Wm(jm,{ref:m,start:0,stop:k.value},{"tick-label":a["tick-label"]}),Wm(Lm,{ref:n,"aria-describedby":o.value,focused:b.value,min:s.value,max:c.value,modelValue:r.value,"onUpdate:modelValue":e=>r.value=e,position:k.value,elevation:e.elevation,onFocus:w,onBlur:S,ripple:e.ripple,name:e.name},{"thumb-label":a["thumb-label"]})])}})}),{}}}),{createVNode:Xm}=await e("vue"),{onUnmounted:Jm}=await e("vue"),Qm=J({name:"VColorPickerPreview",props:t({color:{type:Object},disabled:Boolean,hideAlpha:Boolean,...qe()},"VColorPickerPreview")(),emits:{"update:color":e=>!0},setup(e,t){let{emit:a}=t;const l=new AbortController;async function n(){if(!Ve||e.disabled)return;const t=new window.EyeDropper;try{const n=await t.open({signal:l.signal}),o=ye(h(n.sRGBHex));a("update:color",{...e.color??sm,...o})}catch(n){}}return Jm(()=>l.abort()),wt(()=>Xm("div",{class:["v-color-picker-preview",{"v-color-picker-preview--hide-alpha":e.hideAlpha},e.class],style:e.style},[Ve&&Xm("div",{class:"v-color-picker-preview__eye-dropper",key:"eyeDropper"},[Xm(To,{density:"comfortable",disabled:e.disabled,icon:"$eyeDropper",variant:"plain",onClick:n},null)]),Xm("div",{class:"v-color-picker-preview__dot"},[Xm("div",{style:{background:Ce(e.color??sm)}},null)]),Xm("div",{class:"v-color-picker-preview__sliders"},[Xm(Km,{class:"v-color-picker-preview__track v-color-picker-preview__hue",modelValue:e.color?.h,"onUpdate:modelValue":t=>a("update:color",{...e.color??sm,h:t}),step:0,min:0,max:360,disabled:e.disabled,thumbSize:14,trackSize:8,trackFillColor:"white",hideDetails:!0},null),!e.hideAlpha&&Xm(Km,{class:"v-color-picker-preview__track v-color-picker-preview__alpha",modelValue:e.color?.a??1,"onUpdate:modelValue":t=>a("update:color",{...e.color??sm,a:t}),step:1/256,min:0,max:1,disabled:e.disabled,thumbSize:14,trackSize:8,trackFillColor:"white",hideDetails:!0},null)])])),{}}}),Zm={red:{base:"#f44336",lighten5:"#ffebee",lighten4:"#ffcdd2",lighten3:"#ef9a9a",lighten2:"#e57373",lighten1:"#ef5350",darken1:"#e53935",darken2:"#d32f2f",darken3:"#c62828",darken4:"#b71c1c",accent1:"#ff8a80",accent2:"#ff5252",accent3:"#ff1744",accent4:"#d50000"},pink:{base:"#e91e63",lighten5:"#fce4ec",lighten4:"#f8bbd0",lighten3:"#f48fb1",lighten2:"#f06292",lighten1:"#ec407a",darken1:"#d81b60",darken2:"#c2185b",darken3:"#ad1457",darken4:"#880e4f",accent1:"#ff80ab",accent2:"#ff4081",accent3:"#f50057",accent4:"#c51162"},purple:{base:"#9c27b0",lighten5:"#f3e5f5",lighten4:"#e1bee7",lighten3:"#ce93d8",lighten2:"#ba68c8",lighten1:"#ab47bc",darken1:"#8e24aa",darken2:"#7b1fa2",darken3:"#6a1b9a",darken4:"#4a148c",accent1:"#ea80fc",accent2:"#e040fb",accent3:"#d500f9",accent4:"#aa00ff"},deepPurple:{base:"#673ab7",lighten5:"#ede7f6",lighten4:"#d1c4e9",lighten3:"#b39ddb",lighten2:"#9575cd",lighten1:"#7e57c2",darken1:"#5e35b1",darken2:"#512da8",darken3:"#4527a0",darken4:"#311b92",accent1:"#b388ff",accent2:"#7c4dff",accent3:"#651fff",accent4:"#6200ea"},indigo:{base:"#3f51b5",lighten5:"#e8eaf6",lighten4:"#c5cae9",lighten3:"#9fa8da",lighten2:"#7986cb",lighten1:"#5c6bc0",darken1:"#3949ab",darken2:"#303f9f",darken3:"#283593",darken4:"#1a237e",accent1:"#8c9eff",accent2:"#536dfe",accent3:"#3d5afe",accent4:"#304ffe"},blue:{base:"#2196f3",lighten5:"#e3f2fd",lighten4:"#bbdefb",lighten3:"#90caf9",lighten2:"#64b5f6",lighten1:"#42a5f5",darken1:"#1e88e5",darken2:"#1976d2",darken3:"#1565c0",darken4:"#0d47a1",accent1:"#82b1ff",accent2:"#448aff",accent3:"#2979ff",accent4:"#2962ff"},lightBlue:{base:"#03a9f4",lighten5:"#e1f5fe",lighten4:"#b3e5fc",lighten3:"#81d4fa",lighten2:"#4fc3f7",lighten1:"#29b6f6",darken1:"#039be5",darken2:"#0288d1",darken3:"#0277bd",darken4:"#01579b",accent1:"#80d8ff",accent2:"#40c4ff",accent3:"#00b0ff",accent4:"#0091ea"},cyan:{base:"#00bcd4",lighten5:"#e0f7fa",lighten4:"#b2ebf2",lighten3:"#80deea",lighten2:"#4dd0e1",lighten1:"#26c6da",darken1:"#00acc1",darken2:"#0097a7",darken3:"#00838f",darken4:"#006064",accent1:"#84ffff",accent2:"#18ffff",accent3:"#00e5ff",accent4:"#00b8d4"},teal:{base:"#009688",lighten5:"#e0f2f1",lighten4:"#b2dfdb",lighten3:"#80cbc4",lighten2:"#4db6ac",lighten1:"#26a69a",darken1:"#00897b",darken2:"#00796b",darken3:"#00695c",darken4:"#004d40",accent1:"#a7ffeb",accent2:"#64ffda",accent3:"#1de9b6",accent4:"#00bfa5"},green:{base:"#4caf50",lighten5:"#e8f5e9",lighten4:"#c8e6c9",lighten3:"#a5d6a7",lighten2:"#81c784",lighten1:"#66bb6a",darken1:"#43a047",darken2:"#388e3c",darken3:"#2e7d32",darken4:"#1b5e20",accent1:"#b9f6ca",accent2:"#69f0ae",accent3:"#00e676",accent4:"#00c853"},lightGreen:{base:"#8bc34a",lighten5:"#f1f8e9",lighten4:"#dcedc8",lighten3:"#c5e1a5",lighten2:"#aed581",lighten1:"#9ccc65",darken1:"#7cb342",darken2:"#689f38",darken3:"#558b2f",darken4:"#33691e",accent1:"#ccff90",accent2:"#b2ff59",accent3:"#76ff03",accent4:"#64dd17"},lime:{base:"#cddc39",lighten5:"#f9fbe7",lighten4:"#f0f4c3",lighten3:"#e6ee9c",lighten2:"#dce775",lighten1:"#d4e157",darken1:"#c0ca33",darken2:"#afb42b",darken3:"#9e9d24",darken4:"#827717",accent1:"#f4ff81",accent2:"#eeff41",accent3:"#c6ff00",accent4:"#aeea00"},yellow:{base:"#ffeb3b",lighten5:"#fffde7",lighten4:"#fff9c4",lighten3:"#fff59d",lighten2:"#fff176",lighten1:"#ffee58",darken1:"#fdd835",darken2:"#fbc02d",darken3:"#f9a825",darken4:"#f57f17",accent1:"#ffff8d",accent2:"#ffff00",accent3:"#ffea00",accent4:"#ffd600"},amber:{base:"#ffc107",lighten5:"#fff8e1",lighten4:"#ffecb3",lighten3:"#ffe082",lighten2:"#ffd54f",lighten1:"#ffca28",darken1:"#ffb300",darken2:"#ffa000",darken3:"#ff8f00",darken4:"#ff6f00",accent1:"#ffe57f",accent2:"#ffd740",accent3:"#ffc400",accent4:"#ffab00"},orange:{base:"#ff9800",lighten5:"#fff3e0",lighten4:"#ffe0b2",lighten3:"#ffcc80",lighten2:"#ffb74d",lighten1:"#ffa726",darken1:"#fb8c00",darken2:"#f57c00",darken3:"#ef6c00",darken4:"#e65100",accent1:"#ffd180",accent2:"#ffab40",accent3:"#ff9100",accent4:"#ff6d00"},deepOrange:{base:"#ff5722",lighten5:"#fbe9e7",lighten4:"#ffccbc",lighten3:"#ffab91",lighten2:"#ff8a65",lighten1:"#ff7043",darken1:"#f4511e",darken2:"#e64a19",darken3:"#d84315",darken4:"#bf360c",accent1:"#ff9e80",accent2:"#ff6e40",accent3:"#ff3d00",accent4:"#dd2c00"},brown:{base:"#795548",lighten5:"#efebe9",lighten4:"#d7ccc8",lighten3:"#bcaaa4",lighten2:"#a1887f",lighten1:"#8d6e63",darken1:"#6d4c41",darken2:"#5d4037",darken3:"#4e342e",darken4:"#3e2723"},blueGrey:{base:"#607d8b",lighten5:"#eceff1",lighten4:"#cfd8dc",lighten3:"#b0bec5",lighten2:"#90a4ae",lighten1:"#78909c",darken1:"#546e7a",darken2:"#455a64",darken3:"#37474f",darken4:"#263238"},grey:{base:"#9e9e9e",lighten5:"#fafafa",lighten4:"#f5f5f5",lighten3:"#eeeeee",lighten2:"#e0e0e0",lighten1:"#bdbdbd",darken1:"#757575",darken2:"#616161",darken3:"#424242",darken4:"#212121"},shades:{black:"#000000",white:"#ffffff",transparent:"#ffffff00"}},{createVNode:eg}=await e("vue"),tg=t({swatches:{type:Array,default:()=>function(e){return Object.keys(e).map(t=>{const a=e[t];return a.base?[a.base,a.darken4,a.darken3,a.darken2,a.darken1,a.lighten1,a.lighten2,a.lighten3,a.lighten4,a.lighten5]:[a.black,a.white,a.transparent]})}(Zm)},disabled:Boolean,color:Object,maxHeight:[Number,String],...qe()},"VColorPickerSwatches");const ag=J({name:"VColorPickerSwatches",props:tg(),emits:{"update:color":e=>!0},setup(e,t){let{emit:a}=t;return wt(()=>eg("div",{class:["v-color-picker-swatches",e.class],style:[{maxHeight:p(e.maxHeight)},e.style]},[eg("div",null,[e.swatches.map(t=>eg("div",{class:"v-color-picker-swatches__swatch"},[t.map(t=>{const l=h(t),n=ye(l),o=_e(l);return eg("div",{class:"v-color-picker-swatches__color",onClick:()=>n&&a("update:color",n)},[eg("div",{style:{background:o}},[e.color&&B(e.color,n)?eg(bn,{size:"x-small",icon:"$success",color:Ie(t,"#FFFFFF")>2?"white":"black"},null):void 0])])})]))])])),{}}}),lg=vt("v-picker-title"),{createVNode:ng}=await e("vue"),og=t({color:String,...Ka(),...qe(),...ua(),...Za(),...En(),...Yn(),...Sa(),...Vt(),...c()},"VSheet"),ig=o()({name:"VSheet",props:og(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{borderClasses:i}=Xa(e),{dimensionStyles:s}=ca(e),{elevationClasses:u}=el(e),{locationStyles:c}=Dn(e),{positionClasses:d}=qn(e),{roundedClasses:v}=ka(e);return wt(()=>ng(e.tag,{class:["v-sheet",l.value,n.value,i.value,u.value,d.value,v.value,e.class],style:[o.value,s.value,c.value,e.style]},a)),{}}}),{createVNode:rg,mergeProps:sg}=await e("vue"),ug=t({bgColor:String,divided:Boolean,landscape:Boolean,title:String,hideHeader:Boolean,...og()},"VPicker"),cg=o()({name:"VPicker",props:ug(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.color);return wt(()=>{const t=ig.filterProps(e),o=!(!e.title&&!a.title);return rg(ig,sg(t,{color:e.bgColor,class:["v-picker",{"v-picker--divided":e.divided,"v-picker--landscape":e.landscape,"v-picker--with-actions":!!a.actions},e.class],style:e.style}),{default:()=>[!e.hideHeader&&rg("div",{key:"header",class:[l.value],style:[n.value]},[o&&rg(lg,{key:"picker-title"},{default:()=>[a.title?.()??e.title]}),a.header&&rg("div",{class:"v-picker__header"},[a.header()])]),rg("div",{class:"v-picker__body"},[a.default?.()]),a.actions&&rg(ra,{defaults:{VBtn:{slim:!0,variant:"text"}}},{default:()=>[rg("div",{class:"v-picker__actions"},[a.actions()])]})]})}),{}}}),{Fragment:dg,createVNode:vg,mergeProps:pg}=await e("vue"),{computed:fg,onBeforeMount:mg,ref:gg,watch:hg}=await e("vue"),yg=J({name:"VColorPicker",props:t({canvasHeight:{type:[String,Number],default:150},disabled:Boolean,dotSize:{type:[Number,String],default:10},hideCanvas:Boolean,hideSliders:Boolean,hideInputs:Boolean,mode:{type:String,default:"rgba",validator:e=>Object.keys(fm).includes(e)},modes:{type:Array,default:()=>Object.keys(fm),validator:e=>Array.isArray(e)&&e.every(e=>Object.keys(fm).includes(e))},showSwatches:Boolean,swatches:Array,swatchesMaxHeight:{type:[Number,String],default:150},modelValue:{type:[Object,String]},...ug({hideHeader:!0})},"VColorPicker")(),emits:{"update:modelValue":e=>!0,"update:mode":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"mode"),n=gg(null),o=V(e,"modelValue",void 0,e=>{if(null==e||""===e)return null;let t;try{t=ye(h(e))}catch(a){return x(a),null}return t},t=>t?function(e,t){if(null==t||"string"==typeof t){const a=1!==e.a;if(t?.startsWith("rgb(")){const{r:t,g:l,b:n,a:o}=be(e);return`rgb(${t} ${l} ${n}`+(a?` / ${o})`:")")}if(t?.startsWith("hsl(")){const{h:t,s:l,l:n,a:o}=he(e);return`hsl(${t} ${Math.round(100*l)} ${Math.round(100*n)}`+(a?` / ${o})`:")")}const l=me(e);return 1===e.a?l.slice(0,7):l}if("object"==typeof t){let a;return we(t,["r","g","b"])?a=be(e):we(t,["h","s","l"])?a=he(e):we(t,["h","s","v"])&&(a=e),function(e,t){if(t){const{a:t,...a}=e;return a}return e}(a,!we(t,["a"])&&1===e.a)}return e}(t,e.modelValue):null),i=fg(()=>o.value?{...o.value,h:n.value??o.value.h}:null),{rtlClasses:r}=u();let s=!0;hg(o,e=>{s?e&&(n.value=e.h):s=!0},{immediate:!0});const c=e=>{s=!1,n.value=e.h,o.value=e};return mg(()=>{e.modes.includes(l.value)||(l.value=e.modes[0])}),v({VSlider:{color:void 0,trackColor:void 0,trackFillColor:void 0}}),wt(()=>{const t=cg.filterProps(e);return vg(cg,pg(t,{class:["v-color-picker",r.value,e.class],style:[{"--v-color-picker-color-hsv":Ce({...i.value??sm,a:1})},e.style]}),{...a,default:()=>vg(dg,null,[!e.hideCanvas&&vg(rm,{key:"canvas",color:i.value,"onUpdate:color":c,disabled:e.disabled,dotSize:e.dotSize,width:e.width,height:e.canvasHeight},null),(!e.hideSliders||!e.hideInputs)&&vg("div",{key:"controls",class:"v-color-picker__controls"},[!e.hideSliders&&vg(Qm,{key:"preview",color:i.value,"onUpdate:color":c,hideAlpha:!l.value.endsWith("a"),disabled:e.disabled},null),!e.hideInputs&&vg(ym,{key:"edit",modes:e.modes,mode:l.value,"onUpdate:mode":e=>l.value=e,color:i.value,"onUpdate:color":c,disabled:e.disabled},null)]),e.showSwatches&&vg(ag,{key:"swatches",color:i.value,"onUpdate:color":c,maxHeight:e.swatchesMaxHeight,swatches:e.swatches,disabled:e.disabled},null)])})}),{}}}),{Fragment:bg,createVNode:wg,mergeProps:Sg,createTextVNode:kg}=await e("vue"),{computed:xg,mergeProps:Vg,nextTick:Cg,ref:_g,shallowRef:Ig,toRef:Bg,watch:Pg}=await e("vue"),Ag=t({autoSelectFirst:{type:[Boolean,String]},clearOnSelect:{type:Boolean,default:!0},delimiters:Array,...Hv({filterKeys:["title"]}),...Tv({hideNoData:!0,returnObject:!0}),...H(qd({modelValue:null,role:"combobox"}),["validationValue","dirty","appendInnerIcon"]),...Ia({transition:!1})},"VCombobox"),Ng=o()({name:"VCombobox",props:Ag(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,"update:search":e=>!0,"update:menu":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{t:n}=M(),o=_g(),i=Ig(!1),r=Ig(!0),s=Ig(!1),u=_g(),c=_g(),d=Ig(-1);let v=!1;const{items:p,transformIn:f,transformOut:m}=su(e),{textColorClasses:g,textColorStyles:h}=ha(()=>o.value?.color),y=V(e,"modelValue",[],e=>f(P(e)),t=>{const a=m(t);return e.multiple?a:a[0]??null}),b=Gi(e),w=xg(()=>!(!e.chips&&!l.chip)),S=xg(()=>w.value||!!l.selection),k=Ig(e.multiple||S.value?"":y.value[0]?.title??""),x=xg({get:()=>k.value,set:t=>{if(k.value=t??"",e.multiple||S.value||(y.value=[iu(e,t)]),t&&e.multiple&&e.delimiters?.length){const a=t.split(new RegExp(`(?:${e.delimiters.join("|")})+`));a.length>1&&(a.forEach(t=>{(t=t.trim())&&q(iu(e,t))}),k.value="")}t||(d.value=-1),r.value=!t}}),C=xg(()=>"function"==typeof e.counterValue?e.counterValue(y.value):"number"==typeof e.counterValue?e.counterValue:e.multiple?y.value.length:x.value.length),{filteredItems:_,getMatches:I}=Wv(e,p,()=>r.value?"":x.value),A=xg(()=>e.hideSelected?_.value.filter(e=>!y.value.some(t=>t.value===e.value)):_.value),N=xg(()=>e.hideNoData&&!A.value.length||b.isReadonly.value||b.isDisabled.value),T=V(e,"menu"),E=xg({get:()=>T.value,set:e=>{T.value&&!e&&u.value?.ΨopenChildren.size||e&&N.value||(T.value=e)}}),D=Bg(()=>E.value?e.closeText:e.openText);Pg(k,e=>{v?Cg(()=>v=!1):i.value&&!E.value&&(E.value=!0),a("update:search",e)}),Pg(y,t=>{e.multiple||S.value||(k.value=t[0]?.title??"")});const R=xg(()=>y.value.map(e=>e.value)),L=xg(()=>(!0===e.autoSelectFirst||"exact"===e.autoSelectFirst&&x.value===A.value[0]?.title)&&A.value.length>0&&!r.value&&!s.value),F=_g(),O=wv(F,o);function z(t){v=!0,e.openOnClear&&(E.value=!0)}function j(){N.value||(E.value=!0)}function H(e){N.value||(i.value&&(e.preventDefault(),e.stopPropagation()),E.value=!E.value)}function W(e){" "!==e.key&&ue(e)&&o.value?.focus()}function U(t){if(Be(t)||b.isReadonly.value)return;const a=o.value?.selectionStart,l=y.value.length;if(["Enter","ArrowDown","ArrowUp"].includes(t.key)&&t.preventDefault(),["Enter","ArrowDown"].includes(t.key)&&(E.value=!0),["Escape"].includes(t.key)&&(E.value=!1),["Enter","Escape","Tab"].includes(t.key)&&(L.value&&["Enter","Tab"].includes(t.key)&&!y.value.some(e=>{let{value:t}=e;return t===A.value[0].value})&&q(_.value[0]),r.value=!0),"ArrowDown"===t.key&&L.value&&F.value?.focus("next"),"Enter"===t.key&&x.value&&(q(iu(e,x.value)),S.value&&(k.value="")),["Backspace","Delete"].includes(t.key)){if(!e.multiple&&S.value&&y.value.length>0&&!x.value)return q(y.value[0],!1);if(~d.value){t.preventDefault();const e=d.value;q(y.value[d.value],!1),d.value=e>=l-1?l-2:e}else"Backspace"!==t.key||x.value||(d.value=l-1)}else if(e.multiple)if("ArrowLeft"===t.key){if(d.value<0&&a&&a>0)return;const e=d.value>-1?d.value-1:l-1;y.value[e]?d.value=e:(d.value=-1,o.value?.setSelectionRange(x.value.length,x.value.length))}else if("ArrowRight"===t.key){if(d.value<0)return;const e=d.value+1;y.value[e]?d.value=e:(d.value=-1,o.value?.setSelectionRange(0,0))}else~d.value&&ue(t)&&(d.value=-1)}function G(){e.eager&&c.value?.calculateVisibleItems()}function Y(){i.value&&(r.value=!0,o.value?.focus())}function q(t){let a=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(t&&!t.props.disabled)if(e.multiple){const l=y.value.findIndex(a=>(e.valueComparator||B)(a.value,t.value)),n=null==a?!~l:a;if(~l){const e=n?[...y.value,t]:[...y.value];e.splice(l,1),y.value=e}else n&&(y.value=[...y.value,t]);e.clearOnSelect&&(x.value="")}else{const e=!1!==a;y.value=e?[t]:[],k.value=e&&!S.value?t.title:"",Cg(()=>{E.value=!1,r.value=!0})}}function K(e){i.value=!0,setTimeout(()=>{s.value=!0})}function X(e){s.value=!1}function J(t){null!=t&&(""!==t||e.multiple||S.value)||(y.value=[])}return Pg(i,(t,a)=>{if(!t&&t!==a&&(d.value=-1,E.value=!1,x.value)){if(e.multiple)return void q(iu(e,x.value));if(!S.value)return;y.value.some(e=>{let{title:t}=e;return t===x.value})?k.value="":q(iu(e,x.value))}}),Pg(E,()=>{if(!e.hideSelected&&E.value&&y.value.length){const t=A.value.findIndex(t=>y.value.some(a=>(e.valueComparator||B)(a.value,t.value)));$&&window.requestAnimationFrame(()=>{t>=0&&c.value?.scrollToIndex(t)})}}),Pg(()=>e.items,(e,t)=>{E.value||i.value&&!t.length&&e.length&&(E.value=!0)}),wt(()=>{const t=!!(!e.hideNoData||A.value.length||l["prepend-item"]||l["append-item"]||l["no-data"]),a=y.value.length>0,s=Kd.filterProps(e);return wg(Kd,Sg({ref:o},s,{modelValue:x.value,"onUpdate:modelValue":[e=>x.value=e,J],focused:i.value,"onUpdate:focused":e=>i.value=e,validationValue:y.externalValue,counterValue:C.value,dirty:a,class:["v-combobox",{"v-combobox--active-menu":E.value,"v-combobox--chips":!!e.chips,"v-combobox--selection-slot":!!S.value,"v-combobox--selecting-index":d.value>-1,["v-combobox--"+(e.multiple?"multiple":"single")]:!0},e.class],style:e.style,readonly:b.isReadonly.value,placeholder:a?void 0:e.placeholder,"onClick:clear":z,"onMousedown:control":j,onKeydown:U}),{...l,default:()=>wg(bg,null,[wg(md,Sg({ref:u,modelValue:E.value,"onUpdate:modelValue":e=>E.value=e,activator:"parent",contentClass:"v-combobox__content",disabled:N.value,eager:e.eager,maxHeight:310,openOnClick:!1,closeOnContentClick:!1,transition:e.transition,onAfterEnter:G,onAfterLeave:Y},e.menuProps),{default:()=>[t&&wg(hu,Sg({ref:F,selected:R.value,selectStrategy:e.multiple?"independent":"single-independent",onMousedown:e=>e.preventDefault(),onKeydown:W,onFocusin:K,onFocusout:X,tabindex:"-1","aria-live":"polite",color:e.itemColor??e.color},O,e.listProps),{default:()=>[l["prepend-item"]?.(),!A.value.length&&!e.hideNoData&&(l["no-data"]?.()??wg(Ws,{key:"no-data",title:n(e.noDataText)},null)),wg(hv,{ref:c,renderless:!0,items:A.value,itemKey:"value"},{default:t=>{let{item:a,index:n,itemRef:o}=t;const i=Vg(a.props,{ref:o,key:a.value,active:!(!L.value||0!==n)||void 0,onClick:()=>q(a,null)});return l.item?.({item:a,index:n,props:i})??wg(Ws,Sg(i,{role:"option"}),{prepend:t=>{let{isSelected:l}=t;return wg(bg,null,[e.multiple&&!e.hideSelected?wg(_i,{key:a.value,modelValue:l,ripple:!1,tabindex:"-1"},null):void 0,a.props.prependAvatar&&wg(Ko,{image:a.props.prependAvatar},null),a.props.prependIcon&&wg(bn,{icon:a.props.prependIcon},null)])},title:()=>r.value?a.title:Uv("v-combobox",a.title,I(a)?.title)})}}),l["append-item"]?.()]})]}),y.value.map((t,a)=>{function n(e){e.stopPropagation(),e.preventDefault(),q(t,!1)}const o={"onClick:close":n,onKeydown(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),n(e))},onMousedown(e){e.preventDefault(),e.stopPropagation()},modelValue:!0,"onUpdate:modelValue":void 0},i=w.value?!!l.chip:!!l.selection,r=i?se(w.value?l.chip({item:t,index:a,props:o}):l.selection({item:t,index:a})):void 0;if(!i||r)return wg("div",{key:t.value,class:["v-combobox__selection",a===d.value&&["v-combobox__selection--selected",g.value]],style:a===d.value?h.value:{}},[w.value?l.chip?wg(ra,{key:"chip-defaults",defaults:{VChip:{closable:e.closableChips,size:"small",text:t.title}}},{default:()=>[r]}):wg(Hr,Sg({key:"chip",closable:e.closableChips,size:"small",text:t.title,disabled:t.props.disabled},o),null):r??wg("span",{class:"v-combobox__selection-text"},[t.title,e.multiple&&a<y.value.length-1&&wg("span",{class:"v-combobox__selection-comma"},[kg(",")])])])})]),"append-inner":function(){for(var t=arguments.length,a=new Array(t),i=0;i<t;i++)a[i]=arguments[i];return wg(bg,null,[l["append-inner"]?.(...a),e.hideNoData&&!e.items.length||!e.menuIcon?void 0:wg(bn,{class:"v-combobox__menu-icon",color:o.value?.fieldIconColor,icon:e.menuIcon,onMousedown:H,onClick:ce,"aria-label":n(D.value),title:n(D.value),tabindex:"-1"},null)])}})}),Zc({isFocused:i,isPristine:r,menu:E,search:x,selectionIndex:d,filteredItems:_,select:q},o)}}),{Fragment:Tg,mergeProps:Eg,createVNode:Dg}=await e("vue"),{computed:Rg,ref:$g,toRaw:Lg,watchEffect:Fg}=await e("vue"),Mg=t({modelValue:null,color:String,cancelText:{type:String,default:"$vuetify.confirmEdit.cancel"},okText:{type:String,default:"$vuetify.confirmEdit.ok"},disabled:{type:[Boolean,Array],default:void 0},hideActions:Boolean},"VConfirmEdit"),Og=o()({name:"VConfirmEdit",props:Mg(),emits:{cancel:()=>!0,save:e=>!0,"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=V(e,"modelValue"),o=$g();Fg(()=>{o.value=structuredClone(Lg(n.value))});const{t:i}=M(),r=Rg(()=>B(n.value,o.value));function s(t){return"boolean"==typeof e.disabled?e.disabled:Array.isArray(e.disabled)?e.disabled.includes(t):r.value}const u=Rg(()=>s("save")),c=Rg(()=>s("cancel"));function d(){n.value=o.value,a("save",o.value)}function v(){o.value=structuredClone(Lg(n.value)),a("cancel")}function p(t){return Dg(Tg,null,[Dg(To,Eg({disabled:c.value,variant:"text",color:e.color,onClick:v,text:i(e.cancelText)},t),null),Dg(To,Eg({disabled:u.value,variant:"text",color:e.color,onClick:d,text:i(e.okText)},t),null)])}let f=!1;return wt(()=>Dg(Tg,null,[l.default?.({model:o,save:d,cancel:v,isPristine:r.value,get actions(){return f=!0,p}}),!e.hideActions&&!f&&p()])),{save:d,cancel:v,isPristine:r}}}),{inject:zg,provide:jg,toRef:Hg}=await e("vue"),Wg=t({expandOnClick:Boolean,showExpand:Boolean,expanded:{type:Array,default:()=>[]}},"DataTable-expand"),Ug=Symbol.for("vuetify:datatable:expanded");function Gg(e){const t=Hg(()=>e.expandOnClick),a=V(e,"expanded",e.expanded,e=>new Set(e),e=>[...e.values()]);function l(e,t){const l=new Set(a.value);t?l.add(e.value):l.delete(e.value),a.value=l}function n(e){return a.value.has(e.value)}const o={expand:l,expanded:a,expandOnClick:t,isExpanded:n,toggleExpand:function(e){l(e,!n(e))}};return jg(Ug,o),o}function Yg(){const e=zg(Ug);if(!e)throw new Error("foo");return e}const{computed:qg,inject:Kg,provide:Xg,ref:Jg}=await e("vue"),Qg=t({groupBy:{type:Array,default:()=>[]}},"DataTable-group"),Zg=Symbol.for("vuetify:data-table-group");function eh(e){return{groupBy:V(e,"groupBy")}}function th(e){const{disableSort:t,groupBy:a,sortBy:l}=e,n=Jg(new Set);function o(e){return n.value.has(e.id)}const i={sortByWithGroups:qg(()=>a.value.map(e=>({...e,order:e.order??!1})).concat(t?.value?[]:l.value)),toggleGroup:function(e){const t=new Set(n.value);o(e)?t.delete(e.id):t.add(e.id),n.value=t},opened:n,groupBy:a,extractRows:function(e){return function e(t){const a=[];for(const l of t.items)"type"in l&&"group"===l.type?a.push(...e(l)):a.push(l);return[...new Set(a)]}({items:e})},isGroupOpen:o};return Xg(Zg,i),i}function ah(){const e=Kg(Zg);if(!e)throw new Error("Missing group!");return e}function lh(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,l=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"root";if(!t.length)return[];const n=function(e,t){if(!e.length)return[];const a=new Map;for(const l of e){const e=Pe(l.raw,t);a.has(e)||a.set(e,[]),a.get(e).push(l)}return a}(e,t[0]),o=[],i=t.slice(1);return n.forEach((e,n)=>{const r=t[0],s=`${l}_${r}_${n}`;o.push({depth:a,id:s,key:r,value:n,items:i.length?lh(e,i,a+1,s):e,type:"group"})}),o}function nh(e,t){const a=[];for(const l of e)"type"in l&&"group"===l.type?(null!=l.value&&a.push(l),(t.has(l.id)||null==l.value)&&a.push(...nh(l.items,t))):a.push(l);return a}function oh(e,t,a){return{flatItems:qg(()=>{if(!t.value.length)return e.value;return nh(lh(e.value,t.value.map(e=>e.key)),a.value)})}}const{watch:ih}=await e("vue");function rh(e){let{page:t,itemsPerPage:a,sortBy:l,groupBy:n,search:o}=e;const r=i("VDataTable");let s=null;ih(()=>({page:t.value,itemsPerPage:a.value,sortBy:l.value,groupBy:n.value,search:o.value}),e=>{B(s,e)||(s&&s.search!==e.search&&(t.value=1),r.emit("update:options",e),s=e)},{deep:!0,immediate:!0})}const{computed:sh,inject:uh,provide:ch,watch:dh}=await e("vue"),vh=t({page:{type:[Number,String],default:1},itemsPerPage:{type:[Number,String],default:10}},"DataTable-paginate"),ph=Symbol.for("vuetify:data-table-pagination");function fh(e){return{page:V(e,"page",void 0,e=>Number(e??1)),itemsPerPage:V(e,"itemsPerPage",void 0,e=>Number(e??10))}}function mh(e){const{page:t,itemsPerPage:a,itemsLength:l}=e,n=sh(()=>-1===a.value?0:a.value*(t.value-1)),o=sh(()=>-1===a.value?l.value:Math.min(l.value,n.value+a.value)),i=sh(()=>-1===a.value||0===l.value?1:Math.ceil(l.value/a.value));dh([t,i],()=>{t.value>i.value&&(t.value=i.value)});const r={page:t,itemsPerPage:a,startIndex:n,stopIndex:o,pageCount:i,itemsLength:l,nextPage:function(){t.value=k(t.value+1,1,i.value)},prevPage:function(){t.value=k(t.value-1,1,i.value)},setPage:function(e){t.value=k(e,1,i.value)},setItemsPerPage:function(e){a.value=e,t.value=1}};return ch(ph,r),r}function gh(e){const t=i("usePaginatedItems"),{items:a,startIndex:l,stopIndex:n,itemsPerPage:o}=e,r=sh(()=>o.value<=0?a.value:a.value.slice(l.value,n.value));return dh(r,e=>{t.emit("update:currentItems",e)},{immediate:!0}),{paginatedItems:r}}const{computed:hh,inject:yh,provide:bh,shallowRef:wh,toRef:Sh}=await e("vue"),kh={showSelectAll:!1,allSelected:()=>[],select:e=>{let{items:t,value:a}=e;return new Set(a?[t[0]?.value]:[])},selectAll:e=>{let{selected:t}=e;return t}},xh={showSelectAll:!0,allSelected:e=>{let{currentPage:t}=e;return t},select:e=>{let{items:t,value:a,selected:l}=e;for(const n of t)a?l.add(n.value):l.delete(n.value);return l},selectAll:e=>{let{value:t,currentPage:a,selected:l}=e;return xh.select({items:a,value:t,selected:l})}},Vh={showSelectAll:!0,allSelected:e=>{let{allItems:t}=e;return t},select:e=>{let{items:t,value:a,selected:l}=e;for(const n of t)a?l.add(n.value):l.delete(n.value);return l},selectAll:e=>{let{value:t,allItems:a,selected:l}=e;return Vh.select({items:a,value:t,selected:l})}},Ch=t({showSelect:Boolean,selectStrategy:{type:[String,Object],default:"page"},modelValue:{type:Array,default:()=>[]},valueComparator:{type:Function,default:B}},"DataTable-select"),_h=Symbol.for("vuetify:data-table-selection");function Ih(e,t){let{allItems:a,currentPage:l}=t;const n=V(e,"modelValue",e.modelValue,t=>new Set(P(t).map(t=>a.value.find(a=>e.valueComparator(t,a.value))?.value??t)),e=>[...e.values()]),o=hh(()=>a.value.filter(e=>e.selectable)),i=hh(()=>l.value.filter(e=>e.selectable)),r=hh(()=>{if("object"==typeof e.selectStrategy)return e.selectStrategy;switch(e.selectStrategy){case"single":return kh;case"all":return Vh;default:return xh}}),s=wh(null);function u(e){return P(e).every(e=>n.value.has(e.value))}function c(e,t){const a=r.value.select({items:e,value:t,selected:new Set(n.value)});n.value=a}const d=hh(()=>n.value.size>0),v=hh(()=>{const e=r.value.allSelected({allItems:o.value,currentPage:i.value});return!!e.length&&u(e)}),p={toggleSelect:function(t,a,n){const o=[];if(a=a??l.value.findIndex(e=>e.value===t.value),"single"!==e.selectStrategy&&n?.shiftKey&&null!==s.value){const[e,t]=[s.value,a].sort((e,t)=>e-t);o.push(...l.value.slice(e,t+1).filter(e=>e.selectable))}else o.push(t),s.value=a;c(o,!u([t]))},select:c,selectAll:function(e){const t=r.value.selectAll({value:e,allItems:o.value,currentPage:i.value,selected:new Set(n.value)});n.value=t},isSelected:u,isSomeSelected:function(e){return P(e).some(e=>n.value.has(e.value))},someSelected:d,allSelected:v,showSelectAll:Sh(()=>r.value.showSelectAll),lastSelectedIndex:s,selectStrategy:r};return bh(_h,p),p}function Bh(){const e=yh(_h);if(!e)throw new Error("Missing selection!");return e}const{computed:Ph,inject:Ah,provide:Nh,toRef:Th}=await e("vue"),Eh=t({sortBy:{type:Array,default:()=>[]},customKeySort:Object,multiSort:Boolean,mustSort:Boolean},"DataTable-sort"),Dh=Symbol.for("vuetify:data-table-sort");function Rh(e){return{sortBy:V(e,"sortBy"),mustSort:Th(()=>e.mustSort),multiSort:Th(()=>e.multiSort)}}function $h(e){const{sortBy:t,mustSort:a,multiSort:l,page:n}=e;const o={sortBy:t,toggleSort:e=>{if(null==e.key)return;let o=t.value.map(e=>({...e}))??[];const i=o.find(t=>t.key===e.key);i?"desc"===i.order?a.value&&1===o.length?i.order="asc":o=o.filter(t=>t.key!==e.key):i.order="desc":l.value?o.push({key:e.key,order:"asc"}):o=[{key:e.key,order:"asc"}],t.value=o,n&&(n.value=1)},isSorted:function(e){return!!t.value.find(t=>t.key===e.key)}};return Nh(Dh,o),o}function Lh(){const e=Ah(Dh);if(!e)throw new Error("Missing sort!");return e}function Fh(e,t,a,l){const n=M(),o=Ph(()=>a.value.length?function(e,t,a,l){const n=new Intl.Collator(a,{sensitivity:"accent",usage:"sort"}),o=e.map(e=>[e,l?.transform?l.transform(e):e]);return o.sort((e,a)=>{for(let o=0;o<t.length;o++){let i=!1;const r=t[o].key,s=t[o].order??"asc";if(!1===s)continue;let u=Pe(e[1],r),c=Pe(a[1],r),d=e[0].raw,v=a[0].raw;if("desc"===s&&([u,c]=[c,u],[d,v]=[v,d]),l?.sortRawFunctions?.[r]){const e=l.sortRawFunctions[r](d,v);if(null==e)continue;if(i=!0,e)return e}if(l?.sortFunctions?.[r]){const e=l.sortFunctions[r](u,c);if(null==e)continue;if(i=!0,e)return e}if(!i){if(u instanceof Date&&c instanceof Date)return u.getTime()-c.getTime();if([u,c]=[u,c].map(e=>null!=e?e.toString().toLocaleLowerCase():e),u!==c)return Ae(u)&&Ae(c)?0:Ae(u)?-1:Ae(c)?1:isNaN(u)||isNaN(c)?n.compare(u,c):Number(u)-Number(c)}}return 0}).map(e=>{let[t]=e;return t})}(t.value,a.value,n.current.value,{transform:l?.transform,sortFunctions:{...e.customKeySort,...l?.sortFunctions?.value},sortRawFunctions:l?.sortRawFunctions?.value}):t.value);return{sortedItems:o}}const{computed:Mh}=await e("vue"),Oh=t({items:{type:Array,default:()=>[]},itemValue:{type:[String,Array,Function],default:"id"},itemSelectable:{type:[String,Array,Function],default:null},returnObject:Boolean},"DataIterator-items");function zh(e,t){return{type:"item",value:e.returnObject?t:ee(t,e.itemValue),selectable:ee(t,e.itemSelectable,!0),raw:t}}function jh(e){const t=Mh(()=>function(e,t){const a=[];for(const l of t)a.push(zh(e,l));return a}(e,e.items));return{items:t}}const{createVNode:Hh}=await e("vue"),{computed:Wh,toRef:Uh}=await e("vue"),Gh=t({search:String,loading:Boolean,...qe(),...Oh(),...Ch(),...Eh(),...vh({itemsPerPage:5}),...Wg(),...Qg(),...Hv(),...Vt(),...Ia({transition:{component:Yt,hideOnLeave:!0}})},"VDataIterator"),Yh=o()({name:"VDataIterator",props:Gh(),emits:{"update:modelValue":e=>!0,"update:groupBy":e=>!0,"update:page":e=>!0,"update:itemsPerPage":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:expanded":e=>!0,"update:currentItems":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"groupBy"),n=Uh(()=>e.search),{items:o}=jh(e),{filteredItems:i}=Wv(e,o,n,{transform:e=>e.raw}),{sortBy:r,multiSort:s,mustSort:u}=Rh(e),{page:c,itemsPerPage:d}=fh(e),{toggleSort:v}=$h({sortBy:r,multiSort:s,mustSort:u,page:c}),{sortByWithGroups:p,opened:f,extractRows:m,isGroupOpen:g,toggleGroup:h}=th({groupBy:l,sortBy:r}),{sortedItems:y}=Fh(e,i,p,{transform:e=>e.raw}),{flatItems:b}=oh(y,l,f),w=Uh(()=>b.value.length),{startIndex:S,stopIndex:k,pageCount:x,prevPage:C,nextPage:_,setItemsPerPage:I,setPage:B}=mh({page:c,itemsPerPage:d,itemsLength:w}),{paginatedItems:P}=gh({items:b,startIndex:S,stopIndex:k,itemsPerPage:d}),A=Wh(()=>m(P.value)),{isSelected:N,select:T,selectAll:E,toggleSelect:D}=Ih(e,{allItems:o,currentPage:A}),{isExpanded:R,toggleExpand:$}=Gg(e);rh({page:c,itemsPerPage:d,sortBy:r,groupBy:l,search:n});const L=Wh(()=>({page:c.value,itemsPerPage:d.value,sortBy:r.value,pageCount:x.value,toggleSort:v,prevPage:C,nextPage:_,setPage:B,setItemsPerPage:I,isSelected:N,select:T,selectAll:E,toggleSelect:D,isExpanded:R,toggleExpand:$,isGroupOpen:g,toggleGroup:h,items:A.value,groupedItems:P.value}));return wt(()=>Hh(e.tag,{class:["v-data-iterator",{"v-data-iterator--loading":e.loading},e.class],style:e.style},{default:()=>[a.header?.(L.value),Hh(Ba,{transition:e.transition},{default:()=>[e.loading?Hh(Wn,{key:"loader",name:"v-data-iterator",active:!0},{default:e=>a.loader?.(e)}):Hh("div",{key:"items"},[P.value.length?a.default?.(L.value):a["no-data"]?.()])]}),a.footer?.(L.value)]})),{}}}),{onBeforeUpdate:qh,ref:Kh}=await e("vue");const{mergeProps:Xh,createVNode:Jh}=await e("vue"),{computed:Qh,nextTick:Zh,shallowRef:ey,toRef:ty}=await e("vue"),ay=t({activeColor:String,start:{type:[Number,String],default:1},modelValue:{type:Number,default:e=>e.start},disabled:Boolean,length:{type:[Number,String],default:1,validator:e=>e%1==0},totalVisible:[Number,String],firstIcon:{type:E,default:"$first"},prevIcon:{type:E,default:"$prev"},nextIcon:{type:E,default:"$next"},lastIcon:{type:E,default:"$last"},ariaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.root"},pageAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.page"},currentPageAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.currentPage"},firstAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.first"},previousAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.previous"},nextAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.next"},lastAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.last"},ellipsis:{type:String,default:"..."},showFirstLastPage:Boolean,...Ka(),...qe(),...Al(),...Za(),...Sa(),...pn(),...Vt({tag:"nav"}),...c(),...Fl({variant:"text"})},"VPagination"),ly=o()({name:"VPagination",props:ay(),emits:{"update:modelValue":e=>!0,first:e=>!0,prev:e=>!0,next:e=>!0,last:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=V(e,"modelValue"),{t:o,n:i}=M(),{isRtl:s}=u(),{themeClasses:c}=r(e),{width:d}=G(),p=ey(-1);v(void 0,{scoped:!0});const{resizeRef:f}=R(e=>{if(!e.length)return;const{target:t,contentRect:a}=e[0],l=t.querySelector(".v-pagination__list > *");if(!l)return;const n=a.width,o=l.offsetWidth+2*parseFloat(getComputedStyle(l).marginRight);p.value=y(n,o)}),m=Qh(()=>parseInt(e.length,10)),g=Qh(()=>parseInt(e.start,10)),h=Qh(()=>null!=e.totalVisible?parseInt(e.totalVisible,10):p.value>=0?p.value:y(d.value,58));function y(t,a){const l=e.showFirstLastPage?5:3;return Math.max(0,Math.floor(Number(((t-a*l)/a).toFixed(2))))}const b=Qh(()=>{if(m.value<=0||isNaN(m.value)||m.value>Number.MAX_SAFE_INTEGER)return[];if(h.value<=0)return[];if(1===h.value)return[n.value];if(m.value<=h.value)return ke(m.value,g.value);const t=h.value%2==0,a=t?h.value/2:Math.floor(h.value/2),l=t?a:a+1,o=m.value-a;if(l-n.value>=0)return[...ke(Math.max(1,h.value-1),g.value),e.ellipsis,m.value];if(n.value-o>=(t?1:0)){const t=h.value-1,a=m.value-t+g.value;return[g.value,e.ellipsis,...ke(t,a)]}{const t=Math.max(1,h.value-2),a=1===t?n.value:n.value-Math.ceil(t/2)+g.value;return[g.value,e.ellipsis,...ke(t,a),e.ellipsis,m.value]}});function w(e,t,a){e.preventDefault(),n.value=t,a&&l(a,t)}const{refs:S,updateRef:k}=function(){const e=Kh([]);return qh(()=>e.value=[]),{refs:e,updateRef:function(t,a){e.value[a]=t}}}();v({VPaginationBtn:{color:ty(()=>e.color),border:ty(()=>e.border),density:ty(()=>e.density),size:ty(()=>e.size),variant:ty(()=>e.variant),rounded:ty(()=>e.rounded),elevation:ty(()=>e.elevation)}});const x=Qh(()=>b.value.map((t,a)=>{const l=e=>k(e,a);if("string"==typeof t)return{isActive:!1,key:`ellipsis-${a}`,page:t,props:{ref:l,ellipsis:!0,icon:!0,disabled:!0}};{const a=t===n.value;return{isActive:a,key:t,page:i(t),props:{ref:l,ellipsis:!1,icon:!0,disabled:!!e.disabled||Number(e.length)<2,color:a?e.activeColor:e.color,"aria-current":a,"aria-label":o(a?e.currentPageAriaLabel:e.pageAriaLabel,t),onClick:e=>w(e,t)}}}})),C=Qh(()=>{const t=!!e.disabled||n.value<=g.value,a=!!e.disabled||n.value>=g.value+m.value-1;return{first:e.showFirstLastPage?{icon:s.value?e.lastIcon:e.firstIcon,onClick:e=>w(e,g.value,"first"),disabled:t,"aria-label":o(e.firstAriaLabel),"aria-disabled":t}:void 0,prev:{icon:s.value?e.nextIcon:e.prevIcon,onClick:e=>w(e,n.value-1,"prev"),disabled:t,"aria-label":o(e.previousAriaLabel),"aria-disabled":t},next:{icon:s.value?e.prevIcon:e.nextIcon,onClick:e=>w(e,n.value+1,"next"),disabled:a,"aria-label":o(e.nextAriaLabel),"aria-disabled":a},last:e.showFirstLastPage?{icon:s.value?e.firstIcon:e.lastIcon,onClick:e=>w(e,g.value+m.value-1,"last"),disabled:a,"aria-label":o(e.lastAriaLabel),"aria-disabled":a}:void 0}});function _(){const e=n.value-g.value;S.value[e]?.$el.focus()}function I(t){t.key===xe.left&&!e.disabled&&n.value>Number(e.start)?(n.value=n.value-1,Zh(_)):t.key===xe.right&&!e.disabled&&n.value<g.value+m.value-1&&(n.value=n.value+1,Zh(_))}return wt(()=>Jh(e.tag,{ref:f,class:["v-pagination",c.value,e.class],style:e.style,role:"navigation","aria-label":o(e.ariaLabel),onKeydown:I,"data-test":"v-pagination-root"},{default:()=>[Jh("ul",{class:"v-pagination__list"},[e.showFirstLastPage&&Jh("li",{key:"first",class:"v-pagination__first","data-test":"v-pagination-first"},[a.first?a.first(C.value.first):Jh(To,Xh({_as:"VPaginationBtn"},C.value.first),null)]),Jh("li",{key:"prev",class:"v-pagination__prev","data-test":"v-pagination-prev"},[a.prev?a.prev(C.value.prev):Jh(To,Xh({_as:"VPaginationBtn"},C.value.prev),null)]),x.value.map((e,t)=>Jh("li",{key:e.key,class:["v-pagination__item",{"v-pagination__item--is-active":e.isActive}],"data-test":"v-pagination-item"},[a.item?a.item(e):Jh(To,Xh({_as:"VPaginationBtn"},e.props),{default:()=>[e.page]})])),Jh("li",{key:"next",class:"v-pagination__next","data-test":"v-pagination-next"},[a.next?a.next(C.value.next):Jh(To,Xh({_as:"VPaginationBtn"},C.value.next),null)]),e.showFirstLastPage&&Jh("li",{key:"last",class:"v-pagination__last","data-test":"v-pagination-last"},[a.last?a.last(C.value.last):Jh(To,Xh({_as:"VPaginationBtn"},C.value.last),null)])])]})),{}}}),{createVNode:ny,mergeProps:oy}=await e("vue"),{computed:iy}=await e("vue"),ry=t({prevIcon:{type:E,default:"$prev"},nextIcon:{type:E,default:"$next"},firstIcon:{type:E,default:"$first"},lastIcon:{type:E,default:"$last"},itemsPerPageText:{type:String,default:"$vuetify.dataFooter.itemsPerPageText"},pageText:{type:String,default:"$vuetify.dataFooter.pageText"},firstPageLabel:{type:String,default:"$vuetify.dataFooter.firstPage"},prevPageLabel:{type:String,default:"$vuetify.dataFooter.prevPage"},nextPageLabel:{type:String,default:"$vuetify.dataFooter.nextPage"},lastPageLabel:{type:String,default:"$vuetify.dataFooter.lastPage"},itemsPerPageOptions:{type:Array,default:()=>[{value:10,title:"10"},{value:25,title:"25"},{value:50,title:"50"},{value:100,title:"100"},{value:-1,title:"$vuetify.dataFooter.itemsPerPageAll"}]},showCurrentPage:Boolean},"VDataTableFooter"),sy=o()({name:"VDataTableFooter",props:ry(),setup(e,t){let{slots:a}=t;const{t:l}=M(),{page:n,pageCount:o,startIndex:i,stopIndex:r,itemsLength:s,itemsPerPage:u,setItemsPerPage:c}=function(){const e=uh(ph);if(!e)throw new Error("Missing pagination!");return e}(),d=iy(()=>e.itemsPerPageOptions.map(e=>"number"==typeof e?{value:e,title:-1===e?l("$vuetify.dataFooter.itemsPerPageAll"):String(e)}:{...e,title:isNaN(Number(e.title))?l(e.title):e.title}));return wt(()=>{const t=ly.filterProps(e);return ny("div",{class:"v-data-table-footer"},[a.prepend?.(),ny("div",{class:"v-data-table-footer__items-per-page"},[ny("span",null,[l(e.itemsPerPageText)]),ny(Dv,{items:d.value,modelValue:u.value,"onUpdate:modelValue":e=>c(Number(e)),density:"compact",variant:"outlined","hide-details":!0},null)]),ny("div",{class:"v-data-table-footer__info"},[ny("div",null,[l(e.pageText,s.value?i.value+1:0,r.value,s.value)])]),ny("div",{class:"v-data-table-footer__pagination"},[ny(ly,oy({modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,density:"comfortable","first-aria-label":e.firstPageLabel,"last-aria-label":e.lastPageLabel,length:o.value,"next-aria-label":e.nextPageLabel,"previous-aria-label":e.prevPageLabel,rounded:!0,"show-first-last-page":!0,"total-visible":e.showCurrentPage?1:0,variant:"plain"},t),null)])])}),{}}}),{createVNode:uy}=await e("vue"),cy=Ne({align:{type:String,default:"start"},fixed:Boolean,fixedOffset:[Number,String],height:[Number,String],lastFixed:Boolean,noPadding:Boolean,tag:String,width:[Number,String],maxWidth:[Number,String],nowrap:Boolean},(e,t)=>{let{slots:a}=t;const l=e.tag??"td";return uy(l,{class:["v-data-table__td",{"v-data-table-column--fixed":e.fixed,"v-data-table-column--last-fixed":e.lastFixed,"v-data-table-column--no-padding":e.noPadding,"v-data-table-column--nowrap":e.nowrap},`v-data-table-column--align-${e.align}`],style:{height:p(e.height),width:p(e.width),maxWidth:p(e.maxWidth),left:p(e.fixedOffset||null)}},{default:()=>[a.default?.()]})}),{capitalize:dy,inject:vy,provide:py,ref:fy,watchEffect:my}=await e("vue"),gy=t({headers:Array},"DataTable-header"),hy=Symbol.for("vuetify:data-table-headers"),yy={title:"",sortable:!1},by={...yy,width:48};function wy(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];if(e.children)for(const a of e.children)wy(a,t);else t.push(e);return t}function Sy(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Set;for(const a of e)a.key&&t.add(a.key),a.children&&Sy(a.children,t);return t}function ky(e){if(e.key)return"data-table-group"===e.key?yy:["data-table-expand","data-table-select"].includes(e.key)?by:void 0}function xy(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return e.children?Math.max(t,...e.children.map(e=>xy(e,t+1))):t}function Vy(e,t){const a=[];let l=0;const n=function(){const e=(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).map(e=>({element:e,priority:0}));return{enqueue:(t,a)=>{let l=!1;for(let n=0;n<e.length;n++)if(e[n].priority>a){e.splice(n,0,{element:t,priority:a}),l=!0;break}l||e.push({element:t,priority:a})},size:()=>e.length,count:()=>{let t=0;if(!e.length)return 0;const a=Math.floor(e[0].priority);for(let l=0;l<e.length;l++)Math.floor(e[l].priority)===a&&(t+=1);return t},dequeue:()=>e.shift()}}(e);for(;n.size()>0;){let e=n.count();const o=[];let i=1;for(;e>0;){const{element:a,priority:r}=n.dequeue(),s=t-l-xy(a);if(o.push({...a,rowspan:s??1,colspan:a.children?wy(a).length:1}),a.children)for(const e of a.children){const t=r%1+i/Math.pow(10,l+2);n.enqueue(e,l+s+t)}i+=1,e-=1}l+=1,a.push(o)}return{columns:e.map(e=>wy(e)).flat(),headers:a}}function Cy(e){const t=[];for(const a of e){const e={...ky(a),...a},l=e.key??("string"==typeof e.value?e.value:null),n=e.value??l??null,o={...e,key:l,value:n,sortable:e.sortable??(null!=e.key||!!e.sort),children:e.children?Cy(e.children):void 0};t.push(o)}return t}function _y(e,t){const a=fy([]),l=fy([]),n=fy({}),o=fy({}),i=fy({});my(()=>{const r=(e.headers||Object.keys(e.items[0]??{}).map(e=>({key:e,title:dy(e)}))).slice(),s=Sy(r);t?.groupBy?.value.length&&!s.has("data-table-group")&&r.unshift({key:"data-table-group",title:"Group"}),t?.showSelect?.value&&!s.has("data-table-select")&&r.unshift({key:"data-table-select"}),t?.showExpand?.value&&!s.has("data-table-expand")&&r.push({key:"data-table-expand"});const u=Cy(r);!function(e){let t=!1;function a(e){if(e)if(arguments.length>1&&void 0!==arguments[1]&&arguments[1]&&(e.fixed=!0),e.fixed)if(e.children)for(let t=e.children.length-1;t>=0;t--)a(e.children[t],!0);else t?isNaN(Number(e.width))?X(`Multiple fixed columns should have a static width (key: ${e.key})`):e.minWidth=Math.max(Number(e.width)||0,Number(e.minWidth)||0):e.lastFixed=!0,t=!0;else if(e.children)for(let t=e.children.length-1;t>=0;t--)a(e.children[t]);else t=!1}for(let o=e.length-1;o>=0;o--)a(e[o]);function l(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(!e)return t;if(e.children){e.fixedOffset=t;for(const a of e.children)t=l(a,t)}else e.fixed&&(e.fixedOffset=t,t+=parseFloat(e.width||"0")||0);return t}let n=0;for(const o of e)n=l(o,n)}(u);const c=Math.max(...u.map(e=>xy(e)))+1,d=Vy(u,c);a.value=d.headers,l.value=d.columns;const v=d.headers.flat(1);for(const e of v)e.key&&(e.sortable&&(e.sort&&(n.value[e.key]=e.sort),e.sortRaw&&(o.value[e.key]=e.sortRaw)),e.filter&&(i.value[e.key]=e.filter))});const r={headers:a,columns:l,sortFunctions:n,sortRawFunctions:o,filterFunctions:i};return py(hy,r),r}function Iy(){const e=vy(hy);if(!e)throw new Error("Missing headers!");return e}const{createVNode:By,mergeProps:Py,Fragment:Ay}=await e("vue"),{computed:Ny,mergeProps:Ty}=await e("vue"),Ey=t({color:String,disableSort:Boolean,fixedHeader:Boolean,multiSort:Boolean,sortAscIcon:{type:E,default:"$sortAsc"},sortDescIcon:{type:E,default:"$sortDesc"},headerProps:{type:Object},sticky:Boolean,...q(),...jn()},"VDataTableHeaders"),Dy=o()({name:"VDataTableHeaders",props:Ey(),setup(e,t){let{slots:a}=t;const{t:l}=M(),{toggleSort:n,sortBy:o,isSorted:i}=Lh(),{someSelected:r,allSelected:s,selectAll:u,showSelectAll:c}=Bh(),{columns:d,headers:v}=Iy(),{loaderClasses:f}=Hn(e);function m(t,a){if(e.sticky||e.fixedHeader||t.fixed)return{position:"sticky",left:t.fixed?p(t.fixedOffset):void 0,top:e.sticky||e.fixedHeader?`calc(var(--v-table-header-height) * ${a})`:void 0}}function g(t){const a=o.value.find(e=>e.key===t.key);return a?"asc"===a.order?e.sortAscIcon:e.sortDescIcon:e.sortAscIcon}const{backgroundColorClasses:h,backgroundColorStyles:y}=ya(()=>e.color),{displayClasses:b,mobile:w}=G(e),S=Ny(()=>({headers:v.value,columns:d.value,toggleSort:n,isSorted:i,sortBy:o.value,someSelected:r.value,allSelected:s.value,selectAll:u,getSortIcon:g})),k=Ny(()=>["v-data-table__th",{"v-data-table__th--sticky":e.sticky||e.fixedHeader},b.value,f.value]),x=t=>{let{column:l,x:d,y:v}=t;const f="data-table-select"===l.key||"data-table-expand"===l.key,b=Ty(e.headerProps??{},l.headerProps??{});return By(cy,Py({tag:"th",align:l.align,class:[{"v-data-table__th--sortable":l.sortable&&!e.disableSort,"v-data-table__th--sorted":i(l),"v-data-table__th--fixed":l.fixed},...k.value],style:{width:p(l.width),minWidth:p(l.minWidth),maxWidth:p(l.maxWidth),...m(l,v)},colspan:l.colspan,rowspan:l.rowspan,onClick:l.sortable?()=>n(l):void 0,fixed:l.fixed,nowrap:l.nowrap,lastFixed:l.lastFixed,noPadding:f},b),{default:()=>{const t=`header.${l.key}`,d={column:l,selectAll:u,isSorted:i,toggleSort:n,sortBy:o.value,someSelected:r.value,allSelected:s.value,getSortIcon:g};return a[t]?a[t](d):"data-table-select"===l.key?a["header.data-table-select"]?.(d)??(c.value&&By(_i,{modelValue:s.value,indeterminate:r.value&&!s.value,"onUpdate:modelValue":u},null)):By("div",{class:"v-data-table-header__content"},[By("span",null,[l.title]),l.sortable&&!e.disableSort&&By(bn,{key:"icon",class:"v-data-table-header__sort-icon",icon:g(l)},null),e.multiSort&&i(l)&&By("div",{key:"badge",class:["v-data-table-header__sort-badge",...h.value],style:y.value},[o.value.findIndex(e=>e.key===l.key)+1])])}})},V=()=>{const t=Ny(()=>d.value.filter(t=>t?.sortable&&!e.disableSort)),c=Ny(()=>{if(null!=d.value.find(e=>"data-table-select"===e.key))return s.value?"$checkboxOn":r.value?"$checkboxIndeterminate":"$checkboxOff"});return By(cy,Py({tag:"th",class:[...k.value],colspan:v.value.length+1},e.headerProps),{default:()=>[By("div",{class:"v-data-table-header__content"},[By(Dv,{chips:!0,class:"v-data-table__td-sort-select",clearable:!0,density:"default",items:t.value,label:l("$vuetify.dataTable.sortBy"),multiple:e.multiSort,variant:"underlined","onClick:clear":()=>o.value=[],appendIcon:c.value,"onClick:append":()=>u(!s.value)},{...a,chip:e=>By(Hr,{onClick:e.item.raw?.sortable?()=>n(e.item.raw):void 0,onMousedown:e=>{e.preventDefault(),e.stopPropagation()}},{default:()=>[e.item.title,By(bn,{class:["v-data-table__td-sort-icon",i(e.item.raw)&&"v-data-table__td-sort-icon-active"],icon:g(e.item.raw),size:"small"},null)]})})])]})};wt(()=>w.value?By("tr",null,[By(V,null,null)]):By(Ay,null,[a.headers?a.headers(S.value):v.value.map((e,t)=>By("tr",null,[e.map((e,a)=>By(x,{column:e,x:a,y:t},null))])),e.loading&&By("tr",{class:"v-data-table-progress"},[By("th",{colspan:d.value.length},[By(Wn,{name:"v-data-table-progress",absolute:!0,active:!0,color:"boolean"==typeof e.loading?void 0:e.loading,indeterminate:!0},{default:a.loader})])])]))}}),{createVNode:Ry,createTextVNode:$y}=await e("vue"),{computed:Ly}=await e("vue"),Fy=t({item:{type:Object,required:!0}},"VDataTableGroupHeaderRow"),My=o()({name:"VDataTableGroupHeaderRow",props:Fy(),setup(e,t){let{slots:a}=t;const{isGroupOpen:l,toggleGroup:n,extractRows:o}=ah(),{isSelected:i,isSomeSelected:r,select:s}=Bh(),{columns:u}=Iy(),c=Ly(()=>o([e.item]));return()=>Ry("tr",{class:"v-data-table-group-header-row",style:{"--v-data-table-group-header-row-depth":e.item.depth}},[u.value.map(t=>{if("data-table-group"===t.key){const t=l(e.item)?"$expand":"$next",o=()=>n(e.item);return a["data-table-group"]?.({item:e.item,count:c.value.length,props:{icon:t,onClick:o}})??Ry(cy,{class:"v-data-table-group-header-row__column"},{default:()=>[Ry(To,{size:"small",variant:"text",icon:t,onClick:o},null),Ry("span",null,[e.item.value]),Ry("span",null,[$y("("),c.value.length,$y(")")])]})}if("data-table-select"===t.key){const e=i(c.value),t=r(c.value)&&!e,l=e=>s(c.value,e);return a["data-table-select"]?.({props:{modelValue:e,indeterminate:t,"onUpdate:modelValue":l}})??Ry("td",null,[Ry(_i,{modelValue:e,indeterminate:t,"onUpdate:modelValue":l},null)])}return Ry("td",null,null)})])}}),{createVNode:Oy,Fragment:zy,mergeProps:jy}=await e("vue"),{toDisplayString:Hy,withModifiers:Wy}=await e("vue"),Uy=t({index:Number,item:Object,cellProps:[Object,Function],onClick:O(),onContextmenu:O(),onDblclick:O(),...q()},"VDataTableRow"),Gy=o()({name:"VDataTableRow",props:Uy(),setup(e,t){let{slots:a}=t;const{displayClasses:l,mobile:n}=G(e,"v-data-table__tr"),{isSelected:o,toggleSelect:i,someSelected:r,allSelected:s,selectAll:u}=Bh(),{isExpanded:c,toggleExpand:d}=Yg(),{toggleSort:v,sortBy:p,isSorted:f}=Lh(),{columns:m}=Iy();wt(()=>Oy("tr",{class:["v-data-table__tr",{"v-data-table__tr--clickable":!!(e.onClick||e.onContextmenu||e.onDblclick)},l.value],onClick:e.onClick,onContextmenu:e.onContextmenu,onDblclick:e.onDblclick},[e.item&&m.value.map((t,l)=>{const m=e.item,g=`item.${t.key}`,h=`header.${t.key}`,y={index:e.index,item:m.raw,internalItem:m,value:Pe(m.columns,t.key),column:t,isSelected:o,toggleSelect:i,isExpanded:c,toggleExpand:d},b={column:t,selectAll:u,isSorted:f,toggleSort:v,sortBy:p.value,someSelected:r.value,allSelected:s.value,getSortIcon:()=>""},w="function"==typeof e.cellProps?e.cellProps({index:y.index,item:y.item,internalItem:y.internalItem,value:y.value,column:t}):e.cellProps,S="function"==typeof t.cellProps?t.cellProps({index:y.index,item:y.item,internalItem:y.internalItem,value:y.value}):t.cellProps;return Oy(cy,jy({align:t.align,class:{"v-data-table__td--expanded-row":"data-table-expand"===t.key,"v-data-table__td--select-row":"data-table-select"===t.key},fixed:t.fixed,fixedOffset:t.fixedOffset,lastFixed:t.lastFixed,maxWidth:n.value?void 0:t.maxWidth,noPadding:"data-table-select"===t.key||"data-table-expand"===t.key,nowrap:t.nowrap,width:n.value?void 0:t.width},w,S),{default:()=>{if("data-table-select"===t.key)return a["item.data-table-select"]?.({...y,props:{disabled:!m.selectable,modelValue:o([m]),onClick:Wy(()=>i(m),["stop"])}})??Oy(_i,{disabled:!m.selectable,modelValue:o([m]),onClick:Wy(t=>i(m,e.index,t),["stop"])},null);if("data-table-expand"===t.key)return a["item.data-table-expand"]?.({...y,props:{icon:c(m)?"$collapse":"$expand",size:"small",variant:"text",onClick:Wy(()=>d(m),["stop"])}})??Oy(To,{icon:c(m)?"$collapse":"$expand",size:"small",variant:"text",onClick:Wy(()=>d(m),["stop"])},null);if(a[g]&&!n.value)return a[g](y);const l=Hy(y.value);return n.value?Oy(zy,null,[Oy("div",{class:"v-data-table__td-title"},[a[h]?.(b)??t.title]),Oy("div",{class:"v-data-table__td-value"},[a[g]?.(y)??l])]):l}})})]))}}),{createVNode:Yy,Fragment:qy,mergeProps:Ky}=await e("vue"),{Fragment:Xy,mergeProps:Jy}=await e("vue"),Qy=t({loading:[Boolean,String],loadingText:{type:String,default:"$vuetify.dataIterator.loadingText"},hideNoData:Boolean,items:{type:Array,default:()=>[]},noDataText:{type:String,default:"$vuetify.noDataText"},rowProps:[Object,Function],cellProps:[Object,Function],...q()},"VDataTableRows"),Zy=o()({name:"VDataTableRows",inheritAttrs:!1,props:Qy(),setup(e,t){let{attrs:a,slots:l}=t;const{columns:n}=Iy(),{expandOnClick:o,toggleExpand:i,isExpanded:r}=Yg(),{isSelected:s,toggleSelect:u}=Bh(),{toggleGroup:c,isGroupOpen:d}=ah(),{t:v}=M(),{mobile:p}=G(e);return wt(()=>!e.loading||e.items.length&&!l.loading?e.loading||e.items.length||e.hideNoData?Yy(qy,null,[e.items.map((t,v)=>{if("group"===t.type){const e={index:v,item:t,columns:n.value,isExpanded:r,toggleExpand:i,isSelected:s,toggleSelect:u,toggleGroup:c,isGroupOpen:d};return l["group-header"]?l["group-header"](e):Yy(My,Ky({key:`group-header_${t.id}`,item:t},mt(a,":group-header",()=>e)),l)}const f={index:v,item:t.raw,internalItem:t,columns:n.value,isExpanded:r,toggleExpand:i,isSelected:s,toggleSelect:u},m={...f,props:Jy({key:`item_${t.key??t.index}`,onClick:o.value?()=>{i(t)}:void 0,index:v,item:t,cellProps:e.cellProps,mobile:p.value},mt(a,":row",()=>f),"function"==typeof e.rowProps?e.rowProps({item:f.item,index:f.index,internalItem:f.internalItem}):e.rowProps)};return Yy(qy,{key:m.props.key},[l.item?l.item(m):Yy(Gy,m.props,l),r(t)&&l["expanded-row"]?.(f)])})]):Yy("tr",{class:"v-data-table-rows-no-data",key:"no-data"},[Yy("td",{colspan:n.value.length},[l["no-data"]?.()??v(e.noDataText)])]):Yy("tr",{class:"v-data-table-rows-loading",key:"loading"},[Yy("td",{colspan:n.value.length},[l.loading?.()??v(e.loadingText)])])),{}}}),{createVNode:eb}=await e("vue"),tb=t({fixedHeader:Boolean,fixedFooter:Boolean,height:[Number,String],hover:Boolean,...qe(),...Al(),...Vt(),...c()},"VTable"),ab=o()({name:"VTable",props:tb(),setup(e,t){let{slots:a,emit:l}=t;const{themeClasses:n}=r(e),{densityClasses:o}=Nl(e);return wt(()=>eb(e.tag,{class:["v-table",{"v-table--fixed-height":!!e.height,"v-table--fixed-header":e.fixedHeader,"v-table--fixed-footer":e.fixedFooter,"v-table--has-top":!!a.top,"v-table--has-bottom":!!a.bottom,"v-table--hover":e.hover},n.value,o.value,e.class],style:e.style},{default:()=>[a.top?.(),a.default?eb("div",{class:"v-table__wrapper",style:{height:p(e.height)}},[eb("table",null,[a.default()])]):a.wrapper?.(),a.bottom?.()]})),{}}}),{computed:lb}=await e("vue"),nb=t({items:{type:Array,default:()=>[]},itemValue:{type:[String,Array,Function],default:"id"},itemSelectable:{type:[String,Array,Function],default:null},rowProps:[Object,Function],cellProps:[Object,Function],returnObject:Boolean},"DataTable-items");function ob(e,t,a){return t.map((t,l)=>function(e,t,a,l){const n=e.returnObject?t:ee(t,e.itemValue),o=ee(t,e.itemSelectable,!0),i=l.reduce((e,a)=>(null!=a.key&&(e[a.key]=ee(t,a.value)),e),{});return{type:"item",key:e.returnObject?ee(t,e.itemValue):n,index:a,value:n,selectable:o,columns:i,raw:t}}(e,t,l,a))}function ib(e,t){return{items:lb(()=>ob(e,e.items,t.value))}}const{Fragment:rb,createVNode:sb,mergeProps:ub}=await e("vue"),{computed:cb,toRef:db,toRefs:vb}=await e("vue"),pb=t({...Qy(),hideDefaultBody:Boolean,hideDefaultFooter:Boolean,hideDefaultHeader:Boolean,width:[String,Number],search:String,...Wg(),...Qg(),...gy(),...nb(),...Ch(),...Eh(),...Ey(),...tb()},"DataTable"),fb=t({...vh(),...pb(),...Hv(),...ry()},"VDataTable"),mb=o()({name:"VDataTable",props:fb(),emits:{"update:modelValue":e=>!0,"update:page":e=>!0,"update:itemsPerPage":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:groupBy":e=>!0,"update:expanded":e=>!0,"update:currentItems":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{groupBy:n}=eh(e),{sortBy:o,multiSort:i,mustSort:r}=Rh(e),{page:s,itemsPerPage:u}=fh(e),{disableSort:c}=vb(e),{columns:d,headers:p,sortFunctions:f,sortRawFunctions:m,filterFunctions:g}=_y(e,{groupBy:n,showSelect:db(()=>e.showSelect),showExpand:db(()=>e.showExpand)}),{items:h}=ib(e,d),y=db(()=>e.search),{filteredItems:b}=Wv(e,h,y,{transform:e=>e.columns,customKeyFilter:g}),{toggleSort:w}=$h({sortBy:o,multiSort:i,mustSort:r,page:s}),{sortByWithGroups:S,opened:k,extractRows:x,isGroupOpen:V,toggleGroup:C}=th({groupBy:n,sortBy:o,disableSort:c}),{sortedItems:_}=Fh(e,b,S,{transform:e=>({...e.raw,...e.columns}),sortFunctions:f,sortRawFunctions:m}),{flatItems:I}=oh(_,n,k),B=cb(()=>I.value.length),{startIndex:P,stopIndex:A,pageCount:N,setItemsPerPage:T}=mh({page:s,itemsPerPage:u,itemsLength:B}),{paginatedItems:E}=gh({items:I,startIndex:P,stopIndex:A,itemsPerPage:u}),D=cb(()=>x(E.value)),{isSelected:R,select:$,selectAll:L,toggleSelect:F,someSelected:M,allSelected:O}=Ih(e,{allItems:h,currentPage:D}),{isExpanded:z,toggleExpand:j}=Gg(e);rh({page:s,itemsPerPage:u,sortBy:o,groupBy:n,search:y}),v({VDataTableRows:{hideNoData:db(()=>e.hideNoData),noDataText:db(()=>e.noDataText),loading:db(()=>e.loading),loadingText:db(()=>e.loadingText)}});const H=cb(()=>({page:s.value,itemsPerPage:u.value,sortBy:o.value,pageCount:N.value,toggleSort:w,setItemsPerPage:T,someSelected:M.value,allSelected:O.value,isSelected:R,select:$,selectAll:L,toggleSelect:F,isExpanded:z,toggleExpand:j,isGroupOpen:V,toggleGroup:C,items:D.value.map(e=>e.raw),internalItems:D.value,groupedItems:E.value,columns:d.value,headers:p.value}));return wt(()=>{const t=sy.filterProps(e),n=Dy.filterProps(e),o=Zy.filterProps(e),i=ab.filterProps(e);return sb(ab,ub({class:["v-data-table",{"v-data-table--show-select":e.showSelect,"v-data-table--loading":e.loading},e.class],style:e.style},i,{fixedHeader:e.fixedHeader||e.sticky}),{top:()=>l.top?.(H.value),default:()=>l.default?l.default(H.value):sb(rb,null,[l.colgroup?.(H.value),!e.hideDefaultHeader&&sb("thead",{key:"thead"},[sb(Dy,n,l)]),l.thead?.(H.value),!e.hideDefaultBody&&sb("tbody",null,[l["body.prepend"]?.(H.value),l.body?l.body(H.value):sb(Zy,ub(a,o,{items:E.value}),l),l["body.append"]?.(H.value)]),l.tbody?.(H.value),l.tfoot?.(H.value)]),bottom:()=>l.bottom?l.bottom(H.value):!e.hideDefaultFooter&&sb(rb,null,[sb(Js,null,null),sb(sy,t,{prepend:l["footer.prepend"]})])})}),{}}}),{createVNode:gb,mergeProps:hb}=await e("vue"),{computed:yb,shallowRef:bb,toRef:wb,toRefs:Sb}=await e("vue"),kb=t({...H(pb(),["hideDefaultFooter"]),...Qg(),...uv(),...Hv()},"VDataTableVirtual"),xb=o()({name:"VDataTableVirtual",props:kb(),emits:{"update:modelValue":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:groupBy":e=>!0,"update:expanded":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{groupBy:n}=eh(e),{sortBy:o,multiSort:i,mustSort:r}=Rh(e),{disableSort:s}=Sb(e),{columns:u,headers:c,filterFunctions:d,sortFunctions:f,sortRawFunctions:m}=_y(e,{groupBy:n,showSelect:wb(()=>e.showSelect),showExpand:wb(()=>e.showExpand)}),{items:g}=ib(e,u),h=wb(()=>e.search),{filteredItems:y}=Wv(e,g,h,{transform:e=>e.columns,customKeyFilter:d}),{toggleSort:b}=$h({sortBy:o,multiSort:i,mustSort:r}),{sortByWithGroups:w,opened:S,extractRows:k,isGroupOpen:x,toggleGroup:V}=th({groupBy:n,sortBy:o,disableSort:s}),{sortedItems:C}=Fh(e,y,w,{transform:e=>({...e.raw,...e.columns}),sortFunctions:f,sortRawFunctions:m}),{flatItems:_}=oh(C,n,S),I=yb(()=>k(_.value)),{isSelected:B,select:P,selectAll:A,toggleSelect:N,someSelected:T,allSelected:E}=Ih(e,{allItems:I,currentPage:I}),{isExpanded:D,toggleExpand:R}=Gg(e),{containerRef:$,markerRef:L,paddingTop:F,paddingBottom:M,computedItems:O,handleItemResize:z,handleScroll:j,handleScrollend:H,calculateVisibleItems:W,scrollToIndex:U}=cv(e,_),G=yb(()=>O.value.map(e=>e.raw));rh({sortBy:o,page:bb(1),itemsPerPage:bb(-1),groupBy:n,search:h}),v({VDataTableRows:{hideNoData:wb(()=>e.hideNoData),noDataText:wb(()=>e.noDataText),loading:wb(()=>e.loading),loadingText:wb(()=>e.loadingText)}});const Y=yb(()=>({sortBy:o.value,toggleSort:b,someSelected:T.value,allSelected:E.value,isSelected:B,select:P,selectAll:A,toggleSelect:N,isExpanded:D,toggleExpand:R,isGroupOpen:x,toggleGroup:V,items:I.value.map(e=>e.raw),internalItems:I.value,groupedItems:_.value,columns:u.value,headers:c.value}));return wt(()=>{const t=Dy.filterProps(e),n=Zy.filterProps(e),o=ab.filterProps(e);return gb(ab,hb({class:["v-data-table",{"v-data-table--loading":e.loading},e.class],style:e.style},o,{fixedHeader:e.fixedHeader||e.sticky}),{top:()=>l.top?.(Y.value),wrapper:()=>gb("div",{ref:$,onScrollPassive:j,onScrollend:H,class:"v-table__wrapper",style:{height:p(e.height)}},[gb("table",null,[l.colgroup?.(Y.value),!e.hideDefaultHeader&&gb("thead",{key:"thead"},[gb(Dy,t,l)]),l.thead?.(Y.value),!e.hideDefaultBody&&gb("tbody",{key:"tbody"},[gb("tr",{ref:L,style:{height:p(F.value),border:0}},[gb("td",{colspan:u.value.length,style:{height:0,border:0}},null)]),l["body.prepend"]?.(Y.value),gb(Zy,hb(a,n,{items:G.value}),{...l,item:e=>gb(tv,{key:e.internalItem.index,renderless:!0,"onUpdate:height":t=>z(e.internalItem.index,t)},{default:t=>{let{itemRef:a}=t;return l.item?.({...e,itemRef:a})??gb(Gy,hb(e.props,{ref:a,key:e.internalItem.index,index:e.internalItem.index}),l)}})}),l["body.append"]?.(Y.value),gb("tr",{style:{height:p(M.value),border:0}},[gb("td",{colspan:u.value.length,style:{height:0,border:0}},null)])]),l.tbody?.(Y.value),l.tfoot?.(Y.value)])]),bottom:()=>l.bottom?.(Y.value)})}),{calculateVisibleItems:W,scrollToIndex:U}}}),{Fragment:Vb,createVNode:Cb,mergeProps:_b}=await e("vue"),{computed:Ib,provide:Bb,toRef:Pb,toRefs:Ab}=await e("vue"),Nb=t({itemsLength:{type:[Number,String],required:!0},...vh(),...pb(),...ry()},"VDataTableServer"),Tb=o()({name:"VDataTableServer",props:Nb(),emits:{"update:modelValue":e=>!0,"update:page":e=>!0,"update:itemsPerPage":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:expanded":e=>!0,"update:groupBy":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{groupBy:n}=eh(e),{sortBy:o,multiSort:i,mustSort:r}=Rh(e),{page:s,itemsPerPage:u}=fh(e),{disableSort:c}=Ab(e),d=Ib(()=>parseInt(e.itemsLength,10)),{columns:p,headers:f}=_y(e,{groupBy:n,showSelect:Pb(()=>e.showSelect),showExpand:Pb(()=>e.showExpand)}),{items:m}=ib(e,p),{toggleSort:g}=$h({sortBy:o,multiSort:i,mustSort:r,page:s}),{opened:h,isGroupOpen:y,toggleGroup:b,extractRows:w}=th({groupBy:n,sortBy:o,disableSort:c}),{pageCount:S,setItemsPerPage:k}=mh({page:s,itemsPerPage:u,itemsLength:d}),{flatItems:x}=oh(m,n,h),{isSelected:V,select:C,selectAll:_,toggleSelect:I,someSelected:B,allSelected:P}=Ih(e,{allItems:m,currentPage:m}),{isExpanded:A,toggleExpand:N}=Gg(e),T=Ib(()=>w(m.value));rh({page:s,itemsPerPage:u,sortBy:o,groupBy:n,search:Pb(()=>e.search)}),Bb("v-data-table",{toggleSort:g,sortBy:o}),v({VDataTableRows:{hideNoData:Pb(()=>e.hideNoData),noDataText:Pb(()=>e.noDataText),loading:Pb(()=>e.loading),loadingText:Pb(()=>e.loadingText)}});const E=Ib(()=>({page:s.value,itemsPerPage:u.value,sortBy:o.value,pageCount:S.value,toggleSort:g,setItemsPerPage:k,someSelected:B.value,allSelected:P.value,isSelected:V,select:C,selectAll:_,toggleSelect:I,isExpanded:A,toggleExpand:N,isGroupOpen:y,toggleGroup:b,items:T.value.map(e=>e.raw),internalItems:T.value,groupedItems:x.value,columns:p.value,headers:f.value}));wt(()=>{const t=sy.filterProps(e),n=Dy.filterProps(e),o=Zy.filterProps(e),i=ab.filterProps(e);return Cb(ab,_b({class:["v-data-table",{"v-data-table--loading":e.loading},e.class],style:e.style},i,{fixedHeader:e.fixedHeader||e.sticky}),{top:()=>l.top?.(E.value),default:()=>l.default?l.default(E.value):Cb(Vb,null,[l.colgroup?.(E.value),!e.hideDefaultHeader&&Cb("thead",{key:"thead",class:"v-data-table__thead",role:"rowgroup"},[Cb(Dy,n,l)]),l.thead?.(E.value),!e.hideDefaultBody&&Cb("tbody",{class:"v-data-table__tbody",role:"rowgroup"},[l["body.prepend"]?.(E.value),l.body?l.body(E.value):Cb(Zy,_b(a,o,{items:x.value}),l),l["body.append"]?.(E.value)]),l.tbody?.(E.value),l.tfoot?.(E.value)]),bottom:()=>l.bottom?l.bottom(E.value):!e.hideDefaultFooter&&Cb(Vb,null,[Cb(Js,null,null),Cb(sy,t,{prepend:l["footer.prepend"]})])})})}}),{createVNode:Eb}=await e("vue"),Db=t({fluid:{type:Boolean,default:!1},...qe(),...ua(),...Vt()},"VContainer"),Rb=o()({name:"VContainer",props:Db(),setup(e,t){let{slots:a}=t;const{rtlClasses:l}=u(),{dimensionStyles:n}=ca(e);return wt(()=>Eb(e.tag,{class:["v-container",{"v-container--fluid":e.fluid},l.value,e.class],style:[n.value,e.style]},a)),{}}}),{capitalize:$b,computed:Lb,h:Fb}=await e("vue"),Mb=Te.reduce((e,t)=>(e[t]={type:[Boolean,String,Number],default:!1},e),{}),Ob=Te.reduce((e,t)=>(e["offset"+$b(t)]={type:[String,Number],default:null},e),{}),zb=Te.reduce((e,t)=>(e["order"+$b(t)]={type:[String,Number],default:null},e),{}),jb={col:Object.keys(Mb),offset:Object.keys(Ob),order:Object.keys(zb)};function Hb(e,t,a){let l=e;if(null!=a&&!1!==a){if(t){l+=`-${t.replace(e,"")}`}return"col"===e&&(l="v-"+l),"col"!==e||""!==a&&!0!==a?(l+=`-${a}`,l.toLowerCase()):l.toLowerCase()}}const Wb=["auto","start","end","center","baseline","stretch"],Ub=t({cols:{type:[Boolean,String,Number],default:!1},...Mb,offset:{type:[String,Number],default:null},...Ob,order:{type:[String,Number],default:null},...zb,alignSelf:{type:String,default:null,validator:e=>Wb.includes(e)},...qe(),...Vt()},"VCol"),Gb=o()({name:"VCol",props:Ub(),setup(e,t){let{slots:a}=t;const l=Lb(()=>{const t=[];let a;for(a in jb)jb[a].forEach(l=>{const n=e[l],o=Hb(a,l,n);o&&t.push(o)});const l=t.some(e=>e.startsWith("v-col-"));return t.push({"v-col":!l||!e.cols,[`v-col-${e.cols}`]:e.cols,[`offset-${e.offset}`]:e.offset,[`order-${e.order}`]:e.order,[`align-self-${e.alignSelf}`]:e.alignSelf}),t});return()=>Fb(e.tag,{class:[l.value,e.class],style:e.style},a.default?.())}}),{capitalize:Yb,computed:qb,h:Kb}=await e("vue"),Xb=["start","end","center"],Jb=["space-between","space-around","space-evenly"];function Qb(e,t){return Te.reduce((a,l)=>(a[e+Yb(l)]=t(),a),{})}const Zb=[...Xb,"baseline","stretch"],ew=e=>Zb.includes(e),tw=Qb("align",()=>({type:String,default:null,validator:ew})),aw=[...Xb,...Jb],lw=e=>aw.includes(e),nw=Qb("justify",()=>({type:String,default:null,validator:lw})),ow=[...Xb,...Jb,"stretch"],iw=e=>ow.includes(e),rw=Qb("alignContent",()=>({type:String,default:null,validator:iw})),sw={align:Object.keys(tw),justify:Object.keys(nw),alignContent:Object.keys(rw)},uw={align:"align",justify:"justify",alignContent:"align-content"};function cw(e,t,a){let l=uw[e];if(null!=a){if(t){l+=`-${t.replace(e,"")}`}return l+=`-${a}`,l.toLowerCase()}}const dw=t({dense:Boolean,noGutters:Boolean,align:{type:String,default:null,validator:ew},...tw,justify:{type:String,default:null,validator:lw},...nw,alignContent:{type:String,default:null,validator:iw},...rw,...qe(),...Vt()},"VRow"),vw=o()({name:"VRow",props:dw(),setup(e,t){let{slots:a}=t;const l=qb(()=>{const t=[];let a;for(a in sw)sw[a].forEach(l=>{const n=e[l],o=cw(a,l,n);o&&t.push(o)});return t.push({"v-row--no-gutters":e.noGutters,"v-row--dense":e.dense,[`align-${e.align}`]:e.align,[`justify-${e.justify}`]:e.justify,[`align-content-${e.alignContent}`]:e.alignContent}),t});return()=>Kb(e.tag,{class:["v-row",l.value,e.class],style:e.style},a.default?.())}}),pw=vt("v-spacer","div","VSpacer"),{createVNode:fw}=await e("vue"),{computed:mw}=await e("vue"),gw=t({active:{type:[String,Array],default:void 0},controlHeight:[Number,String],disabled:{type:[Boolean,String,Array],default:null},nextIcon:{type:E,default:"$next"},prevIcon:{type:E,default:"$prev"},modeIcon:{type:E,default:"$subgroup"},text:String,viewMode:{type:String,default:"month"}},"VDatePickerControls"),hw=o()({name:"VDatePickerControls",props:gw(),emits:{"click:year":()=>!0,"click:month":()=>!0,"click:prev":()=>!0,"click:next":()=>!0,"click:text":()=>!0},setup(e,t){let{emit:a}=t;const l=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("text"):!!e.disabled),n=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("mode"):!!e.disabled),o=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("prev"):!!e.disabled),i=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("next"):!!e.disabled);function r(){a("click:prev")}function s(){a("click:next")}function u(){a("click:year")}function c(){a("click:month")}return wt(()=>fw("div",{class:["v-date-picker-controls"],style:{"--v-date-picker-controls-height":p(e.controlHeight)}},[fw(To,{class:"v-date-picker-controls__month-btn","data-testid":"month-btn",disabled:l.value,text:e.text,variant:"text",rounded:!0,onClick:c},null),fw(To,{class:"v-date-picker-controls__mode-btn","data-testid":"year-btn",disabled:n.value,density:"comfortable",icon:e.modeIcon,variant:"text",onClick:u},null),fw(pw,null,null),fw("div",{class:"v-date-picker-controls__month"},[fw(To,{"data-testid":"prev-month",disabled:o.value,density:"comfortable",icon:e.prevIcon,variant:"text",onClick:r},null),fw(To,{"data-testid":"next-month",disabled:i.value,icon:e.nextIcon,density:"comfortable",variant:"text",onClick:s},null)])])),{}}}),{createVNode:yw}=await e("vue"),bw=t({appendIcon:E,color:String,header:String,transition:String,onClick:O()},"VDatePickerHeader"),ww=o()({name:"VDatePickerHeader",props:bw(),emits:{click:()=>!0,"click:append":()=>!0},setup(e,t){let{emit:a,slots:l}=t;const{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color);function i(){a("click")}function r(){a("click:append")}return wt(()=>{const t=!(!l.default&&!e.header),a=!(!l.append&&!e.appendIcon);return yw("div",{class:["v-date-picker-header",{"v-date-picker-header--clickable":!!e.onClick},n.value],style:o.value,onClick:i},[l.prepend&&yw("div",{key:"prepend",class:"v-date-picker-header__prepend"},[l.prepend()]),t&&yw(Ba,{key:"content",name:e.transition},{default:()=>[yw("div",{key:e.header,class:"v-date-picker-header__content"},[l.default?.()??e.header])]}),a&&yw("div",{class:"v-date-picker-header__append"},[l.append?yw(ra,{key:"append-defaults",disabled:!e.appendIcon,defaults:{VBtn:{icon:e.appendIcon,variant:"text"}}},{default:()=>[l.append?.()]}):yw(To,{key:"append-btn",icon:e.appendIcon,variant:"text",onClick:r},null)])])}),{}}}),{computed:Sw}=await e("vue"),kw=t({allowedDates:[Array,Function],disabled:{type:Boolean,default:null},displayValue:null,modelValue:Array,month:[Number,String],max:null,min:null,showAdjacentMonths:Boolean,year:[Number,String],weekdays:{type:Array,default:()=>[0,1,2,3,4,5,6]},weeksInMonth:{type:String,default:"dynamic"},firstDayOfWeek:{type:[Number,String],default:void 0}},"calendar");const{createTextVNode:xw,createVNode:Vw}=await e("vue"),{computed:Cw,ref:_w,shallowRef:Iw,toRef:Bw,watch:Pw}=await e("vue"),Aw=t({color:String,hideWeekdays:Boolean,multiple:[Boolean,Number,String],showWeek:Boolean,transition:{type:String,default:"picker-transition"},reverseTransition:{type:String,default:"picker-reverse-transition"},...H(kw(),["displayValue"])},"VDatePickerMonth"),Nw=o()({name:"VDatePickerMonth",props:Aw(),emits:{"update:modelValue":e=>!0,"update:month":e=>!0,"update:year":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=_w(),{daysInMonth:o,model:i,weekNumbers:r}=function(e){const t=Ee(),a=V(e,"modelValue",[],e=>P(e).map(e=>t.date(e))),l=Sw(()=>e.displayValue?t.date(e.displayValue):a.value.length>0?t.date(a.value[0]):e.min?t.date(e.min):Array.isArray(e.allowedDates)?t.date(e.allowedDates[0]):t.date()),n=V(e,"year",void 0,e=>{const a=null!=e?Number(e):t.getYear(l.value);return t.startOfYear(t.setYear(t.date(),a))},e=>t.getYear(e)),o=V(e,"month",void 0,e=>{const a=null!=e?Number(e):t.getMonth(l.value),o=t.setYear(t.startOfMonth(t.date()),t.getYear(n.value));return t.setMonth(o,a)},e=>t.getMonth(e)),i=Sw(()=>{const a=t.toJsDate(t.startOfWeek(t.date(),e.firstDayOfWeek)).getDay();return[0,1,2,3,4,5,6].map(e=>(e+a)%7)}),r=Sw(()=>{const a=t.getWeekArray(o.value,e.firstDayOfWeek),l=a.flat();if("static"===e.weeksInMonth&&l.length<42){const e=l[l.length-1];let n=[];for(let o=1;o<=42-l.length;o++)n.push(t.addDays(e,o)),o%7==0&&(a.push(n),n=[])}return a});function s(l,n){return l.filter(e=>i.value.includes(t.toJsDate(e).getDay())).map((l,i)=>{const r=t.toISO(l),s=!t.isSameMonth(l,o.value),u=t.isSameDay(l,t.startOfMonth(o.value)),c=t.isSameDay(l,t.endOfMonth(o.value)),d=t.isSameDay(l,o.value);return{date:l,formatted:t.format(l,"keyboardDate"),isAdjacent:s,isDisabled:v(l),isEnd:c,isHidden:s&&!e.showAdjacentMonths,isSame:d,isSelected:a.value.some(e=>t.isSameDay(l,e)),isStart:u,isToday:t.isSameDay(l,n),isWeekEnd:i%7==6,isWeekStart:i%7==0,isoDate:r,localized:t.format(l,"dayOfMonth"),month:t.getMonth(l),year:t.getYear(l)}})}const u=Sw(()=>{const a=t.startOfWeek(l.value,e.firstDayOfWeek),n=[];for(let e=0;e<=6;e++)n.push(t.addDays(a,e));return s(n,t.date())}),c=Sw(()=>s(r.value.flat(),t.date())),d=Sw(()=>r.value.map(a=>a.length?t.getWeek(a[0],e.firstDayOfWeek):null));function v(a){if(e.disabled)return!0;const l=t.date(a);return!((!e.min||!t.isAfter(t.date(e.min),l))&&(!e.max||!t.isAfter(l,t.date(e.max)))&&(Array.isArray(e.allowedDates)&&e.allowedDates.length>0?e.allowedDates.some(e=>t.isSameDay(t.date(e),l)):"function"==typeof e.allowedDates?e.allowedDates(l):e.weekdays.includes(t.toJsDate(l).getDay())))}return{displayValue:l,daysInMonth:c,daysInWeek:u,genDays:s,model:a,weeksInMonth:r,weekDays:i,weekNumbers:d}}(e),s=Ee(),u=Iw(),c=Iw(),d=Iw(!1),v=Bw(()=>d.value?e.reverseTransition:e.transition);"range"===e.multiple&&i.value.length>0&&(u.value=i.value[0],i.value.length>1&&(c.value=i.value[i.value.length-1]));const p=Cw(()=>{const t=["number","string"].includes(typeof e.multiple)?Number(e.multiple):1/0;return i.value.length>=t});function f(t){"range"===e.multiple?function(e){const t=s.startOfDay(e);if(0===i.value.length?u.value=void 0:1===i.value.length&&(u.value=i.value[0],c.value=void 0),u.value)if(c.value)u.value=e,c.value=void 0,i.value=[u.value];else{if(s.isSameDay(t,u.value))return u.value=void 0,void(i.value=[]);s.isBefore(t,u.value)?(c.value=s.endOfDay(u.value),u.value=t):c.value=s.endOfDay(t);const e=s.getDiff(c.value,u.value,"days"),a=[u.value];for(let t=1;t<e;t++){const e=s.addDays(u.value,t);a.push(e)}a.push(c.value),i.value=a}else u.value=t,i.value=[u.value]}(t):e.multiple?function(e){const t=i.value.findIndex(t=>s.isSameDay(t,e));if(-1===t)i.value=[...i.value,e];else{const e=[...i.value];e.splice(t,1),i.value=e}}(t):i.value=[t]}Pw(o,(e,t)=>{t&&(d.value=s.isBefore(e[0].date,t[0].date))}),wt(()=>Vw("div",{class:"v-date-picker-month"},[e.showWeek&&Vw("div",{key:"weeks",class:"v-date-picker-month__weeks"},[!e.hideWeekdays&&Vw("div",{key:"hide-week-days",class:"v-date-picker-month__day"},[xw(" ")]),r.value.map(e=>Vw("div",{class:["v-date-picker-month__day","v-date-picker-month__day--adjacent"]},[e]))]),Vw(Ba,{name:v.value},{default:()=>[Vw("div",{ref:n,key:o.value[0].date?.toString(),class:"v-date-picker-month__days"},[!e.hideWeekdays&&s.getWeekdays(e.firstDayOfWeek).map(e=>Vw("div",{class:["v-date-picker-month__day","v-date-picker-month__weekday"]},[e])),o.value.map((t,a)=>{const n={props:{class:"v-date-picker-month__day-btn",color:t.isSelected||t.isToday?e.color:void 0,disabled:t.isDisabled,icon:!0,ripple:!1,text:t.localized,variant:t.isSelected?"flat":t.isToday?"outlined":"text",onClick:()=>f(t.date)},item:t,i:a};return p.value&&!t.isSelected&&(t.isDisabled=!0),Vw("div",{class:["v-date-picker-month__day",{"v-date-picker-month__day--adjacent":t.isAdjacent,"v-date-picker-month__day--hide-adjacent":t.isHidden,"v-date-picker-month__day--selected":t.isSelected,"v-date-picker-month__day--week-end":t.isWeekEnd,"v-date-picker-month__day--week-start":t.isWeekStart}],"data-v-date":t.isDisabled?void 0:t.isoDate},[(e.showAdjacentMonths||!t.isAdjacent)&&(l.day?.(n)??Vw(To,n.props,null))])})])]})]))}}),{mergeProps:Tw,createVNode:Ew}=await e("vue"),{computed:Dw,watchEffect:Rw}=await e("vue"),$w=t({color:String,height:[String,Number],min:null,max:null,modelValue:Number,year:Number},"VDatePickerMonths"),Lw=o()({name:"VDatePickerMonths",props:$w(),emits:{"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=Ee(),o=V(e,"modelValue"),i=Dw(()=>{let t=n.startOfYear(n.date());return e.year&&(t=n.setYear(t,e.year)),ke(12).map(a=>{const l=n.format(t,"monthShort"),o=!!(e.min&&n.isAfter(n.startOfMonth(n.date(e.min)),t)||e.max&&n.isAfter(t,n.startOfMonth(n.date(e.max))));return t=n.getNextMonth(t),{isDisabled:o,text:l,value:a}})});return Rw(()=>{o.value=o.value??n.getMonth(n.date())}),wt(()=>Ew("div",{class:"v-date-picker-months",style:{height:p(e.height)}},[Ew("div",{class:"v-date-picker-months__content"},[i.value.map((t,n)=>{const i={active:o.value===n,color:o.value===n?e.color:void 0,disabled:t.isDisabled,rounded:!0,text:t.text,variant:o.value===t.value?"flat":"text",onClick:()=>function(e){if(o.value===e)return void a("update:modelValue",o.value);o.value=e}(n)};return l.month?.({month:t,i:n,props:i})??Ew(To,Tw({key:"month"},i),null)})])])),{}}}),{mergeProps:Fw,createVNode:Mw}=await e("vue"),{computed:Ow,nextTick:zw,onMounted:jw,watchEffect:Hw}=await e("vue"),Ww=t({color:String,height:[String,Number],min:null,max:null,modelValue:Number},"VDatePickerYears"),Uw=o()({name:"VDatePickerYears",props:Ww(),emits:{"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=Ee(),o=V(e,"modelValue"),i=Ow(()=>{const t=n.getYear(n.date());let a=t-100,l=t+52;e.min&&(a=n.getYear(n.date(e.min))),e.max&&(l=n.getYear(n.date(e.max)));let o=n.startOfYear(n.date());return o=n.setYear(o,a),ke(l-a+1,a).map(e=>{const t=n.format(o,"year");return o=n.setYear(o,n.getYear(o)+1),{text:t,value:e}})});Hw(()=>{o.value=o.value??n.getYear(n.date())});const r=ne();return jw(async()=>{await zw(),r.el?.scrollIntoView({block:"center"})}),wt(()=>Mw("div",{class:"v-date-picker-years",style:{height:p(e.height)}},[Mw("div",{class:"v-date-picker-years__content"},[i.value.map((t,n)=>{const i={ref:o.value===t.value?r:void 0,active:o.value===t.value,color:o.value===t.value?e.color:void 0,rounded:!0,text:t.text,variant:o.value===t.value?"flat":"text",onClick:()=>{o.value!==t.value?o.value=t.value:a("update:modelValue",o.value)}};return l.year?.({year:t,i:n,props:i})??Mw(To,Fw({key:"month"},i),null)})])])),{}}}),{createVNode:Gw,mergeProps:Yw,Fragment:qw}=await e("vue"),{computed:Kw,ref:Xw,shallowRef:Jw,toRef:Qw,watch:Zw}=await e("vue"),eS=t({header:{type:String,default:"$vuetify.datePicker.header"},headerColor:String,...gw(),...Aw({weeksInMonth:"static"}),...H($w(),["modelValue"]),...H(Ww(),["modelValue"]),...ug({title:"$vuetify.datePicker.title"}),modelValue:null},"VDatePicker"),tS=o()({name:"VDatePicker",props:eS(),emits:{"update:modelValue":e=>!0,"update:month":e=>!0,"update:year":e=>!0,"update:viewMode":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=Ee(),{t:o}=M(),{rtlClasses:i}=u(),r=V(e,"modelValue",void 0,e=>P(e).map(e=>n.date(e)),t=>e.multiple?t:t[0]),s=V(e,"viewMode"),c=Kw(()=>{const t=n.date(e.min);return e.min&&n.isValid(t)?t:null}),d=Kw(()=>{const t=n.date(e.max);return e.max&&n.isValid(t)?t:null}),v=Kw(()=>{const e=n.date();let t=e;return r.value?.[0]?t=n.date(r.value[0]):c.value&&n.isBefore(e,c.value)?t=c.value:d.value&&n.isAfter(e,d.value)&&(t=d.value),t&&n.isValid(t)?t:e}),p=Qw(()=>e.headerColor??e.color),f=Xw(Number(e.month??n.getMonth(n.startOfMonth(v.value)))),m=Xw(Number(e.year??n.getYear(n.startOfYear(n.setMonth(v.value,f.value))))),g=Jw(!1),h=Kw(()=>e.multiple&&r.value.length>1?o("$vuetify.datePicker.itemsSelected",r.value.length):r.value[0]&&n.isValid(r.value[0])?n.format(n.date(r.value[0]),"normalDateWithWeekday"):o(e.header)),y=Kw(()=>{let e=n.date();return e=n.setDate(e,1),e=n.setMonth(e,f.value),e=n.setYear(e,m.value),n.format(e,"monthAndYear")}),b=Qw(()=>`date-picker-header${g.value?"-reverse":""}-transition`),w=Kw(()=>{if(e.disabled)return!0;const t=[];if("month"!==s.value)t.push("prev","next");else{let e=n.date();if(e=n.startOfMonth(e),e=n.setMonth(e,f.value),e=n.setYear(e,m.value),c.value){const a=n.addDays(n.startOfMonth(e),-1);n.isAfter(c.value,a)&&t.push("prev")}if(d.value){const a=n.addDays(n.endOfMonth(e),1);n.isAfter(a,d.value)&&t.push("next")}}return t});function S(){f.value<11?f.value++:(m.value++,f.value=0,B(m.value)),I(f.value)}function k(){f.value>0?f.value--:(m.value--,f.value=11,B(m.value)),I(f.value)}function x(){s.value="month"}function C(){s.value="months"===s.value?"month":"months"}function _(){s.value="year"===s.value?"month":"year"}function I(e){"months"===s.value&&C(),a("update:month",e)}function B(e){"year"===s.value&&_(),a("update:year",e)}return Zw(r,(e,t)=>{const a=P(t),l=P(e);if(!l.length)return;const o=n.date(a[a.length-1]),i=n.date(l[l.length-1]),r=n.getMonth(i),s=n.getYear(i);r!==f.value&&(f.value=r,I(f.value)),s!==m.value&&(m.value=s,B(m.value)),g.value=n.isBefore(o,i)}),wt(()=>{const t=cg.filterProps(e),a=hw.filterProps(e),n=ww.filterProps(e),u=Nw.filterProps(e),v=H(Lw.filterProps(e),["modelValue"]),g=H(Uw.filterProps(e),["modelValue"]),V={color:p.value,header:h.value,transition:b.value};return Gw(cg,Yw(t,{color:p.value,class:["v-date-picker",`v-date-picker--${s.value}`,{"v-date-picker--show-week":e.showWeek},i.value,e.class],style:e.style}),{title:()=>l.title?.()??Gw("div",{class:"v-date-picker__title"},[o(e.title)]),header:()=>l.header?Gw(ra,{defaults:{VDatePickerHeader:{...V}}},{default:()=>[l.header?.(V)]}):Gw(ww,Yw({key:"header"},n,V,{onClick:"month"!==s.value?x:void 0}),{...l,default:void 0}),default:()=>Gw(qw,null,[Gw(hw,Yw(a,{disabled:w.value,text:y.value,"onClick:next":S,"onClick:prev":k,"onClick:month":C,"onClick:year":_}),null),Gw(Yt,{hideOnLeave:!0},{default:()=>["months"===s.value?Gw(Lw,Yw({key:"date-picker-months"},v,{modelValue:f.value,"onUpdate:modelValue":[e=>f.value=e,I],min:c.value,max:d.value,year:m.value}),null):"year"===s.value?Gw(Uw,Yw({key:"date-picker-years"},g,{modelValue:m.value,"onUpdate:modelValue":[e=>m.value=e,B],min:c.value,max:d.value}),null):Gw(Nw,Yw({key:"date-picker-month"},u,{modelValue:r.value,"onUpdate:modelValue":e=>r.value=e,month:f.value,"onUpdate:month":[e=>f.value=e,I],year:m.value,"onUpdate:year":[e=>m.value=e,B],min:c.value,max:d.value}),null)]})]),actions:l.actions})}),{}}}),{Fragment:aS,createVNode:lS}=await e("vue"),nS=t({actionText:String,bgColor:String,color:String,icon:E,image:String,justify:{type:String,default:"center"},headline:String,title:String,text:String,textWidth:{type:[Number,String],default:500},href:String,to:String,...qe(),...ua(),...pn({size:void 0}),...c()},"VEmptyState"),oS=o()({name:"VEmptyState",props:nS(),emits:{"click:action":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{themeClasses:n}=r(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.bgColor),{dimensionStyles:s}=ca(e),{displayClasses:u}=G();function c(e){a("click:action",e)}return wt(()=>{const t=!(!l.actions&&!e.actionText),a=!(!l.headline&&!e.headline),r=!(!l.title&&!e.title),d=!(!l.text&&!e.text),v=!!(l.media||e.image||e.icon),f=e.size||(e.image?200:96);return lS("div",{class:["v-empty-state",{[`v-empty-state--${e.justify}`]:!0},n.value,o.value,u.value,e.class],style:[i.value,s.value,e.style]},[v&&lS("div",{key:"media",class:"v-empty-state__media"},[l.media?lS(ra,{key:"media-defaults",defaults:{VImg:{src:e.image,height:f},VIcon:{size:f,icon:e.icon}}},{default:()=>[l.media()]}):lS(aS,null,[e.image?lS(Ya,{key:"image",src:e.image,height:f},null):e.icon?lS(bn,{key:"icon",color:e.color,size:f,icon:e.icon},null):void 0])]),a&&lS("div",{key:"headline",class:"v-empty-state__headline"},[l.headline?.()??e.headline]),r&&lS("div",{key:"title",class:"v-empty-state__title"},[l.title?.()??e.title]),d&&lS("div",{key:"text",class:"v-empty-state__text",style:{maxWidth:p(e.textWidth)}},[l.text?.()??e.text]),l.default&&lS("div",{key:"content",class:"v-empty-state__content"},[l.default()]),t&&lS("div",{key:"actions",class:"v-empty-state__actions"},[lS(ra,{defaults:{VBtn:{class:"v-empty-state__action-btn",color:e.color??"surface-variant",href:e.href,text:e.actionText,to:e.to}}},{default:()=>[l.actions?.({props:{onClick:c}})??lS(To,{onClick:c},null)]})])])}),{}}}),iS=Symbol.for("vuetify:v-expansion-panel"),{createVNode:rS,vShow:sS,withDirectives:uS}=await e("vue"),{inject:cS}=await e("vue"),dS=t({...qe(),...pc()},"VExpansionPanelText"),vS=o()({name:"VExpansionPanelText",props:dS(),setup(e,t){let{slots:a}=t;const l=cS(iS);if(!l)throw new Error("[Vuetify] v-expansion-panel-text needs to be placed inside v-expansion-panel");const{hasContent:n,onAfterLeave:o}=fc(e,l.isSelected);return wt(()=>rS(la,{onAfterLeave:o},{default:()=>[uS(rS("div",{class:["v-expansion-panel-text",e.class],style:e.style},[a.default&&n.value&&rS("div",{class:"v-expansion-panel-text__wrapper"},[a.default?.()])]),[[sS,l.isSelected.value]])]})),{}}}),{createVNode:pS,resolveDirective:fS,withDirectives:mS}=await e("vue"),{computed:gS,inject:hS,toRef:yS}=await e("vue"),bS=t({color:String,expandIcon:{type:E,default:"$expand"},collapseIcon:{type:E,default:"$collapse"},hideActions:Boolean,focusable:Boolean,static:Boolean,ripple:{type:[Boolean,Object],default:!1},readonly:Boolean,...qe(),...ua()},"VExpansionPanelTitle"),wS=o()({name:"VExpansionPanelTitle",directives:{Ripple:Vo},props:bS(),setup(e,t){let{slots:a}=t;const l=hS(iS);if(!l)throw new Error("[Vuetify] v-expansion-panel-title needs to be placed inside v-expansion-panel");const{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{dimensionStyles:i}=ca(e),r=gS(()=>({collapseIcon:e.collapseIcon,disabled:l.disabled.value,expanded:l.isSelected.value,expandIcon:e.expandIcon,readonly:e.readonly})),s=yS(()=>l.isSelected.value?e.collapseIcon:e.expandIcon);return wt(()=>mS(pS("button",{class:["v-expansion-panel-title",{"v-expansion-panel-title--active":l.isSelected.value,"v-expansion-panel-title--focusable":e.focusable,"v-expansion-panel-title--static":e.static},n.value,e.class],style:[o.value,i.value,e.style],type:"button",tabindex:l.disabled.value?-1:void 0,disabled:l.disabled.value,"aria-expanded":l.isSelected.value,onClick:e.readonly?void 0:l.toggle},[pS("span",{class:"v-expansion-panel-title__overlay"},null),a.default?.(r.value),!e.hideActions&&pS(ra,{defaults:{VIcon:{icon:s.value}}},{default:()=>[pS("span",{class:"v-expansion-panel-title__icon"},[a.actions?.(r.value)??pS(bn,null,null)])]})]),[[fS("ripple"),e.ripple]])),{}}}),{createVNode:SS}=await e("vue"),{computed:kS,provide:xS,toRef:VS}=await e("vue"),CS=t({title:String,text:String,bgColor:String,...Za(),...an(),...Sa(),...Vt(),...bS(),...dS()},"VExpansionPanel"),_S=o()({name:"VExpansionPanel",props:CS(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=ln(e,iS),{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.bgColor),{elevationClasses:i}=el(e),{roundedClasses:r}=ka(e),s=VS(()=>l?.disabled.value||e.disabled),u=kS(()=>l.group.items.value.reduce((e,t,a)=>(l.group.selected.value.includes(t.id)&&e.push(a),e),[])),c=kS(()=>{const e=l.group.items.value.findIndex(e=>e.id===l.id);return!l.isSelected.value&&u.value.some(t=>t-e===1)}),d=kS(()=>{const e=l.group.items.value.findIndex(e=>e.id===l.id);return!l.isSelected.value&&u.value.some(t=>t-e===-1)});return xS(iS,l),wt(()=>{const t=!(!a.text&&!e.text),u=!(!a.title&&!e.title),v=wS.filterProps(e),p=vS.filterProps(e);return SS(e.tag,{class:["v-expansion-panel",{"v-expansion-panel--active":l.isSelected.value,"v-expansion-panel--before-active":c.value,"v-expansion-panel--after-active":d.value,"v-expansion-panel--disabled":s.value},r.value,n.value,e.class],style:[o.value,e.style]},{default:()=>[SS("div",{class:["v-expansion-panel__shadow",...i.value]},null),SS(ra,{defaults:{VExpansionPanelTitle:{...v},VExpansionPanelText:{...p}}},{default:()=>[u&&SS(wS,{key:"title"},{default:()=>[a.title?a.title():e.title]}),t&&SS(vS,{key:"text"},{default:()=>[a.text?a.text():e.text]}),a.default?.()]})]})}),{groupItem:l}}}),{createVNode:IS}=await e("vue"),{toRef:BS}=await e("vue"),PS=["default","accordion","inset","popout"],AS=t({flat:Boolean,...tn(),...U(CS(),["bgColor","collapseIcon","color","eager","elevation","expandIcon","focusable","hideActions","readonly","ripple","rounded","tile","static"]),...c(),...qe(),...Vt(),variant:{type:String,default:"default",validator:e=>PS.includes(e)}},"VExpansionPanels"),NS=o()({name:"VExpansionPanels",props:AS(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{next:l,prev:n}=nn(e,iS),{themeClasses:o}=r(e),i=BS(()=>e.variant&&`v-expansion-panels--variant-${e.variant}`);return v({VExpansionPanel:{bgColor:BS(()=>e.bgColor),collapseIcon:BS(()=>e.collapseIcon),color:BS(()=>e.color),eager:BS(()=>e.eager),elevation:BS(()=>e.elevation),expandIcon:BS(()=>e.expandIcon),focusable:BS(()=>e.focusable),hideActions:BS(()=>e.hideActions),readonly:BS(()=>e.readonly),ripple:BS(()=>e.ripple),rounded:BS(()=>e.rounded),static:BS(()=>e.static)}}),wt(()=>IS(e.tag,{class:["v-expansion-panels",{"v-expansion-panels--flat":e.flat,"v-expansion-panels--tile":e.tile},o.value,i.value,e.class],style:e.style},{default:()=>[a.default?.({prev:n,next:l})]})),{next:l,prev:n}}}),{vShow:TS,mergeProps:ES,createVNode:DS,withDirectives:RS}=await e("vue"),{computed:$S,ref:LS,shallowRef:FS,toRef:MS,watchEffect:OS}=await e("vue"),zS=t({app:Boolean,appear:Boolean,extended:Boolean,layout:Boolean,offset:Boolean,modelValue:{type:Boolean,default:!0},...H(No({active:!0}),["location"]),...I(),...En(),...Ia({transition:"fab-transition"})},"VFab"),jS=o()({name:"VFab",props:zS(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),n=FS(56),o=LS(),{resizeRef:i}=R(e=>{e.length&&(n.value=e[0].target.clientHeight)}),r=MS(()=>e.app||e.absolute),s=$S(()=>!!r.value&&(e.location?.split(" ").shift()??"bottom")),u=$S(()=>!!r.value&&(e.location?.split(" ")[1]??"end"));C(()=>e.app,()=>{const t=_({id:e.name,order:$S(()=>parseInt(e.order,10)),position:s,layoutSize:$S(()=>e.layout?n.value+24:0),elementSize:$S(()=>n.value+24),active:$S(()=>e.app&&l.value),absolute:MS(()=>e.absolute)});OS(()=>{o.value=t.layoutItemStyles.value})});const c=LS();return wt(()=>{const t=To.filterProps(e);return DS("div",{ref:c,class:["v-fab",{"v-fab--absolute":e.absolute,"v-fab--app":!!e.app,"v-fab--extended":e.extended,"v-fab--offset":e.offset,[`v-fab--${s.value}`]:r.value,[`v-fab--${u.value}`]:r.value},e.class],style:[e.app?{...o.value}:{height:e.absolute?"100%":"inherit"},e.style]},[DS("div",{class:"v-fab__container"},[DS(Ba,{appear:e.appear,transition:e.transition},{default:()=>[RS(DS(To,ES({ref:i},t,{active:void 0,location:void 0}),a),[[TS,e.active]])]})])])}),{}}}),{Fragment:HS,mergeProps:WS,createVNode:US}=await e("vue"),{computed:GS,nextTick:YS,ref:qS,shallowRef:KS,toRef:XS,watch:JS}=await e("vue"),QS=t({chips:Boolean,counter:Boolean,counterSizeString:{type:String,default:"$vuetify.fileInput.counterSize"},counterString:{type:String,default:"$vuetify.fileInput.counter"},hideInput:Boolean,multiple:Boolean,showSize:{type:[Boolean,Number,String],default:!1,validator:e=>"boolean"==typeof e||[1e3,1024].includes(Number(e))},...ur({prependIcon:"$file"}),modelValue:{type:[Array,Object],default:e=>e.multiple?[]:null,validator:e=>P(e).every(e=>null!=e&&"object"==typeof e)},...$d({clearable:!0})},"VFileInput"),ZS=o()({name:"VFileInput",inheritAttrs:!1,props:QS(),emits:{"click:control":e=>!0,"mousedown:control":e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{t:o}=M(),i=V(e,"modelValue",e.modelValue,e=>P(e),t=>!e.multiple&&Array.isArray(t)?t[0]:t),{isFocused:r,focus:s,blur:u}=Ri(e),c=GS(()=>"boolean"!=typeof e.showSize?e.showSize:void 0),d=GS(()=>(i.value??[]).reduce((e,t)=>{let{size:a=0}=t;return e+a},0)),v=GS(()=>De(d.value,c.value)),p=GS(()=>(i.value??[]).map(t=>{const{name:a="",size:l=0}=t;return e.showSize?`${a} (${De(l,c.value)})`:a})),f=GS(()=>{const t=i.value?.length??0;return e.showSize?o(e.counterSizeString,t,v.value):o(e.counterString,t)}),m=qS(),g=qS(),h=qS(),y=XS(()=>r.value||e.active),b=GS(()=>["plain","underlined"].includes(e.variant)),w=KS(!1);function S(){h.value!==document.activeElement&&h.value?.focus(),r.value||s()}function k(e){h.value?.click()}function x(e){l("mousedown:control",e)}function C(e){h.value?.click(),l("click:control",e)}function _(t){t.stopPropagation(),S(),YS(()=>{i.value=[],W(e["onClick:clear"],t)})}function I(e){e.preventDefault(),e.stopImmediatePropagation(),w.value=!0}function B(e){e.preventDefault(),w.value=!1}function A(e){if(e.preventDefault(),e.stopImmediatePropagation(),w.value=!1,!e.dataTransfer?.files?.length||!h.value)return;const t=new DataTransfer;for(const a of e.dataTransfer.files)t.items.add(a);h.value.files=t.files,h.value.dispatchEvent(new Event("change",{bubbles:!0}))}return JS(i,e=>{(!Array.isArray(e)||!e.length)&&h.value&&(h.value.value="")}),wt(()=>{const t=!(!n.counter&&!e.counter),l=!(!t&&!n.details),[o,s]=z(a),{modelValue:c,...V}=cr.filterProps(e),P=Ld.filterProps(e);return US(cr,WS({ref:m,modelValue:e.multiple?i.value:i.value[0],class:["v-file-input",{"v-file-input--chips":!!e.chips,"v-file-input--dragging":w.value,"v-file-input--hide":e.hideInput,"v-input--plain-underlined":b.value},e.class],style:e.style,"onClick:prepend":k},o,V,{centerAffix:!b.value,focused:r.value}),{...n,default:t=>{let{id:a,isDisabled:l,isDirty:o,isReadonly:c,isValid:f}=t;return US(Ld,WS({ref:g,"prepend-icon":e.prependIcon,onMousedown:x,onClick:C,"onClick:clear":_,"onClick:prependInner":e["onClick:prependInner"],"onClick:appendInner":e["onClick:appendInner"]},P,{id:a.value,active:y.value||o.value,dirty:o.value||e.dirty,disabled:l.value,focused:r.value,error:!1===f.value,onDragover:I,onDrop:A}),{...n,default:t=>{let{props:{class:a,...o}}=t;return US(HS,null,[US("input",WS({ref:h,type:"file",readonly:c.value,disabled:l.value,multiple:e.multiple,name:e.name,onClick:e=>{e.stopPropagation(),c.value&&e.preventDefault(),S()},onChange:e=>{if(!e.target)return;const t=e.target;i.value=[...t.files??[]]},onDragleave:B,onFocus:S,onBlur:u},o,s),null),US("div",{class:a},[!!i.value?.length&&!e.hideInput&&(n.selection?n.selection({fileNames:p.value,totalBytes:d.value,totalBytesReadable:v.value}):e.chips?p.value.map(e=>US(Hr,{key:e,size:"small",text:e},null)):p.value.join(", "))])])}})},details:l?a=>US(HS,null,[n.details?.(a),t&&US(HS,null,[US("span",null,null),US(Sd,{active:!!i.value?.length,value:f.value,disabled:e.disabled},n.counter)])]):void 0})}),Zc({},m,g,h)}}),{createVNode:ek}=await e("vue"),{computed:tk,ref:ak,shallowRef:lk,toRef:nk,watchEffect:ok}=await e("vue"),ik=t({app:Boolean,color:String,height:{type:[Number,String],default:"auto"},...Ka(),...qe(),...Za(),...I(),...Sa(),...Vt({tag:"footer"}),...c()},"VFooter"),rk=o()({name:"VFooter",props:ik(),setup(e,t){let{slots:a}=t;const l=ak(),{themeClasses:n}=r(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.color),{borderClasses:s}=Xa(e),{elevationClasses:u}=el(e),{roundedClasses:c}=ka(e),d=lk(32),{resizeRef:v}=R(e=>{e.length&&(d.value=e[0].target.clientHeight)}),f=tk(()=>"auto"===e.height?d.value:parseInt(e.height,10));return C(()=>e.app,()=>{const t=_({id:e.name,order:tk(()=>parseInt(e.order,10)),position:nk(()=>"bottom"),layoutSize:f,elementSize:tk(()=>"auto"===e.height?void 0:f.value),active:nk(()=>e.app),absolute:nk(()=>e.absolute)});ok(()=>{l.value=t.layoutItemStyles.value})}),wt(()=>ek(e.tag,{ref:v,class:["v-footer",n.value,o.value,s.value,u.value,c.value,e.class],style:[i.value,e.app?l.value:{height:p(e.height)},e.style]},a)),{}}}),{createVNode:sk}=await e("vue"),{ref:uk}=await e("vue"),ck=t({...qe(),...Ui()},"VForm"),dk=o()({name:"VForm",props:ck(),emits:{"update:modelValue":e=>!0,submit:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=function(e){const t=V(e,"modelValue"),a=ji(()=>e.disabled),l=ji(()=>e.readonly),n=zi(!1),o=Oi([]),i=Oi([]);return Hi(o,()=>{let e=0,a=0;const l=[];for(const t of o.value)!1===t.isValid?(a++,l.push({id:t.id,errorMessages:t.errorMessages})):!0===t.isValid&&e++;i.value=l,t.value=!(a>0)&&(e===o.value.length||null)},{deep:!0,flush:"post"}),Mi(Wi,{register:e=>{let{id:t,vm:a,validate:l,reset:n,resetValidation:i}=e;o.value.some(e=>e.id===t)&&x(`Duplicate input name "${t}"`),o.value.push({id:t,validate:l,reset:n,resetValidation:i,vm:Fi(a),isValid:null,errorMessages:[]})},unregister:e=>{o.value=o.value.filter(t=>t.id!==e)},update:(e,t,a)=>{const l=o.value.find(t=>t.id===e);l&&(l.isValid=t,l.errorMessages=a)},isDisabled:a,isReadonly:l,isValidating:n,isValid:t,items:o,validateOn:ji(()=>e.validateOn)}),{errors:i,isDisabled:a,isReadonly:l,isValidating:n,isValid:t,items:o,validate:async function(){const t=[];let a=!0;i.value=[],n.value=!0;for(const l of o.value){const n=await l.validate();if(n.length>0&&(a=!1,t.push({id:l.id,errorMessages:n})),!a&&e.fastFail)break}return i.value=t,n.value=!1,{valid:a,errors:i.value}},reset:function(){o.value.forEach(e=>e.reset())},resetValidation:function(){o.value.forEach(e=>e.resetValidation())}}}(e),o=uk();function i(e){e.preventDefault(),n.reset()}function r(e){const t=e,a=n.validate();t.then=a.then.bind(a),t.catch=a.catch.bind(a),t.finally=a.finally.bind(a),l("submit",t),t.defaultPrevented||a.then(e=>{let{valid:t}=e;t&&o.value?.submit()}),t.preventDefault()}return wt(()=>sk("form",{ref:o,class:["v-form",e.class],style:e.style,novalidate:!0,onReset:i,onSubmit:r},[a.default?.(n)])),Zc(n,o)}}),vk=t({disabled:Boolean,modelValue:{type:Boolean,default:null},...Yu()},"VHover"),pk=o()({name:"VHover",props:vk(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{runOpenDelay:n,runCloseDelay:o}=qu(e,t=>!e.disabled&&(l.value=t));return()=>a.default?.({isHovering:l.value,props:{onMouseenter:n,onMouseleave:o}})}}),{createTextVNode:fk,createVNode:mk}=await e("vue"),{computed:gk,nextTick:hk,onMounted:yk,ref:bk,shallowRef:wk,watch:Sk}=await e("vue"),kk=t({color:String,direction:{type:String,default:"vertical",validator:e=>["vertical","horizontal"].includes(e)},side:{type:String,default:"end",validator:e=>["start","end","both"].includes(e)},mode:{type:String,default:"intersect",validator:e=>["intersect","manual"].includes(e)},margin:[Number,String],loadMoreText:{type:String,default:"$vuetify.infiniteScroll.loadMore"},emptyText:{type:String,default:"$vuetify.infiniteScroll.empty"},...ua(),...Vt()},"VInfiniteScroll"),xk=J({name:"VInfiniteScrollIntersect",props:{side:{type:String,required:!0},rootMargin:String},emits:{intersect:(e,t)=>!0},setup(e,t){let{emit:a}=t;const{intersectionRef:l,isIntersecting:n}=Vn();return Sk(n,async t=>{a("intersect",e.side,t)}),wt(()=>mk("div",{class:"v-infinite-scroll-intersect",style:{"--v-infinite-margin-size":e.rootMargin},ref:l},[fk(" ")])),{}}}),Vk=o()({name:"VInfiniteScroll",props:kk(),emits:{load:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=bk(),o=wk("ok"),i=wk("ok"),r=gk(()=>p(e.margin)),s=wk(!1);function u(t){if(!n.value)return;const a="vertical"===e.direction?"scrollTop":"scrollLeft";n.value[a]=t}function c(){if(!n.value)return 0;const t="vertical"===e.direction?"scrollHeight":"scrollWidth";return n.value[t]}function d(e,t){"start"===e?o.value=t:"end"===e&&(i.value=t)}yk(()=>{n.value&&("start"===e.side?u(c()):"both"===e.side&&u(c()/2-function(){if(!n.value)return 0;const t="vertical"===e.direction?"clientHeight":"clientWidth";return n.value[t]}()/2))});let v=0;function f(e,t){s.value=t,s.value&&m(e)}function m(t){if("manual"!==e.mode&&!s.value)return;const a=function(e){return"start"===e?o.value:i.value}(t);n.value&&!["empty","loading"].includes(a)&&(v=c(),d(t,"loading"),l("load",{side:t,done:function(a){d(t,a),hk(()=>{"empty"!==a&&"error"!==a&&("ok"===a&&"start"===t&&u(c()-v+function(){if(!n.value)return 0;const t="vertical"===e.direction?"scrollTop":"scrollLeft";return n.value[t]}()),"manual"!==e.mode&&hk(()=>{window.requestAnimationFrame(()=>{window.requestAnimationFrame(()=>{window.requestAnimationFrame(()=>{m(t)})})})}))})}}))}const{t:g}=M();function h(t,l){if(e.side!==t&&"both"!==e.side)return;const n=()=>m(t),o={side:t,props:{onClick:n,color:e.color}};return"error"===l?a.error?.(o):"empty"===l?a.empty?.(o)??mk("div",null,[g(e.emptyText)]):"manual"===e.mode?"loading"===l?a.loading?.(o)??mk(An,{indeterminate:!0,color:e.color},null):a["load-more"]?.(o)??mk(To,{variant:"outlined",color:e.color,onClick:n},{default:()=>[g(e.loadMoreText)]}):a.loading?.(o)??mk(An,{indeterminate:!0,color:e.color},null)}const{dimensionStyles:y}=ca(e);wt(()=>{const t=e.tag,l="start"===e.side||"both"===e.side,s="end"===e.side||"both"===e.side,u="intersect"===e.mode;return mk(t,{ref:n,class:["v-infinite-scroll",`v-infinite-scroll--${e.direction}`,{"v-infinite-scroll--start":l,"v-infinite-scroll--end":s}],style:y.value},{default:()=>[mk("div",{class:"v-infinite-scroll__side"},[h("start",o.value)]),l&&u&&mk(xk,{key:"start",side:"start",onIntersect:f,rootMargin:r.value},null),a.default?.(),s&&u&&mk(xk,{key:"end",side:"end",onIntersect:f,rootMargin:r.value},null),mk("div",{class:"v-infinite-scroll__side"},[h("end",i.value)])]})})}}),{createVNode:Ck}=await e("vue"),_k=Symbol.for("vuetify:v-item-group"),Ik=t({...qe(),...tn({selectedClass:"v-item--selected"}),...Vt(),...c()},"VItemGroup"),Bk=o()({name:"VItemGroup",props:Ik(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{isSelected:n,select:o,next:i,prev:s,selected:u}=nn(e,_k);return()=>Ck(e.tag,{class:["v-item-group",l.value,e.class],style:e.style},{default:()=>[a.default?.({isSelected:n,select:o,next:i,prev:s,selected:u.value})]})}}),Pk=o()({name:"VItem",props:an(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const{isSelected:l,select:n,toggle:o,selectedClass:i,value:r,disabled:s}=ln(e,_k);return()=>a.default?.({isSelected:l.value,selectedClass:i.value,select:n,toggle:o,value:r.value,disabled:s.value})}}),Ak=vt("v-kbd","kbd"),{createVNode:Nk}=await e("vue"),Tk=t({...qe(),...ua(),...d()},"VLayout"),Ek=o()({name:"VLayout",props:Tk(),setup(e,t){let{slots:a}=t;const{layoutClasses:l,layoutStyles:n,getLayoutItem:o,items:i,layoutRef:r}=s(e),{dimensionStyles:u}=ca(e);return wt(()=>Nk("div",{ref:r,class:[l.value,e.class],style:[u.value,n.value,e.style]},[a.default?.()])),{getLayoutItem:o,items:i}}}),{createVNode:Dk}=await e("vue"),{computed:Rk,toRef:$k}=await e("vue"),Lk=t({position:{type:String,required:!0},size:{type:[Number,String],default:300},modelValue:Boolean,...qe(),...I()},"VLayoutItem"),Fk=o()({name:"VLayoutItem",props:Lk(),setup(e,t){let{slots:a}=t;const{layoutItemStyles:l}=_({id:e.name,order:Rk(()=>parseInt(e.order,10)),position:$k(()=>e.position),elementSize:$k(()=>e.size),layoutSize:$k(()=>e.size),active:$k(()=>e.modelValue),absolute:$k(()=>e.absolute)});return()=>Dk("div",{class:["v-layout-item",e.class],style:[l.value,e.style]},[a.default?.()])}}),{createVNode:Mk,resolveDirective:Ok,withDirectives:zk}=await e("vue"),jk=t({modelValue:Boolean,options:{type:Object,default:()=>({root:void 0,rootMargin:void 0,threshold:void 0})},...qe(),...ua(),...Vt(),...Ia({transition:"fade-transition"})},"VLazy"),Hk=o()({name:"VLazy",directives:{intersect:Aa},props:jk(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{dimensionStyles:l}=ca(e),n=V(e,"modelValue");function o(e){n.value||(n.value=e)}return wt(()=>zk(Mk(e.tag,{class:["v-lazy",e.class],style:[l.value,e.style]},{default:()=>[n.value&&Mk(Ba,{transition:e.transition,appear:!0},{default:()=>[a.default?.()]})]}),[[Ok("intersect"),{handler:o,options:e.options},null]])),{}}}),{createVNode:Wk}=await e("vue"),Uk=t({locale:String,fallbackLocale:String,messages:Object,rtl:{type:Boolean,default:void 0},...qe()},"VLocaleProvider"),Gk=o()({name:"VLocaleProvider",props:Uk(),setup(e,t){let{slots:a}=t;const{rtlClasses:l}=Re(e);return wt(()=>Wk("div",{class:["v-locale-provider",l.value,e.class],style:e.style},[a.default?.()])),{}}}),{createVNode:Yk}=await e("vue"),qk=t({scrollable:Boolean,...qe(),...ua(),...Vt({tag:"main"})},"VMain"),Kk=o()({name:"VMain",props:qk(),setup(e,t){let{slots:a}=t;const{dimensionStyles:l}=ca(e),{mainStyles:n}=$e(),{ssrBootStyles:o}=yl();return wt(()=>Yk(e.tag,{class:["v-main",{"v-main--scrollable":e.scrollable},e.class],style:[n.value,o.value,l.value,e.style]},{default:()=>[e.scrollable?Yk("div",{class:"v-main__scroller"},[a.default?.()]):a.default?.()]})),{}}}),{computed:Xk,onBeforeUnmount:Jk,onMounted:Qk,shallowRef:Zk,watch:ex}=await e("vue");function tx(e){return(e<0?-1:1)*Math.sqrt(Math.abs(e))*1.41421356237}function ax(e){if(e.length<2)return 0;if(2===e.length)return e[1].t===e[0].t?0:(e[1].d-e[0].d)/(e[1].t-e[0].t);let t=0;for(let a=e.length-1;a>0;a--){if(e[a].t===e[a-1].t)continue;const l=tx(t),n=(e[a].d-e[a-1].d)/(e[a].t-e[a-1].t);t+=(n-l)*Math.abs(n),a===e.length-1&&(t*=.5)}return 1e3*tx(t)}function lx(){const e={};return{addMovement:function(t){Array.from(t.changedTouches).forEach(a=>{(e[a.identifier]??(e[a.identifier]=new ae(20))).push([t.timeStamp,a])})},endTouch:function(t){Array.from(t.changedTouches).forEach(t=>{delete e[t.identifier]})},getVelocity:function(t){const a=e[t]?.values().reverse();if(!a)throw new Error(`No samples for touch id ${t}`);const l=a[0],n=[],o=[];for(const e of a){if(l[0]-e[0]>100)break;n.push({t:e[0],d:e[1].clientX}),o.push({t:e[0],d:e[1].clientY})}return{x:ax(n),y:ax(o),get direction(){const{x:e,y:t}=this,[a,l]=[Math.abs(e),Math.abs(t)];return a>l&&e>=0?"right":a>l&&e<=0?"left":l>a&&t>=0?"down":l>a&&t<=0?"up":function(){throw new Error}()}}}}}const{computed:nx,onBeforeUnmount:ox,onMounted:ix,onScopeDispose:rx,shallowRef:sx,watchEffect:ux}=await e("vue");function cx(){throw new Error}const{Fragment:dx,createVNode:vx,mergeProps:px}=await e("vue"),{computed:fx,nextTick:mx,readonly:gx,ref:hx,shallowRef:yx,toRef:bx,Transition:wx,watch:Sx}=await e("vue"),kx=["start","end","left","right","top","bottom"],xx=t({color:String,disableResizeWatcher:Boolean,disableRouteWatcher:Boolean,expandOnHover:Boolean,floating:Boolean,modelValue:{type:Boolean,default:null},permanent:Boolean,rail:{type:Boolean,default:null},railWidth:{type:[Number,String],default:56},scrim:{type:[Boolean,String],default:!0},image:String,temporary:Boolean,persistent:Boolean,touchless:Boolean,width:{type:[Number,String],default:256},location:{type:String,default:"start",validator:e=>kx.includes(e)},sticky:Boolean,...Ka(),...qe(),...Yu(),...q({mobile:null}),...Za(),...I(),...Sa(),...Vt({tag:"nav"}),...c()},"VNavigationDrawer"),Vx=o()({name:"VNavigationDrawer",props:xx(),emits:{"update:modelValue":e=>!0,"update:rail":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{isRtl:o}=u(),{themeClasses:i}=r(e),{borderClasses:s}=Xa(e),{backgroundColorClasses:c,backgroundColorStyles:d}=ya(()=>e.color),{elevationClasses:f}=el(e),{displayClasses:m,mobile:g}=G(e),{roundedClasses:h}=ka(e),y=to(),b=V(e,"modelValue",null,e=>!!e),{ssrBootStyles:w}=yl(),{scopeId:S}=mc(),k=hx(),x=yx(!1),{runOpenDelay:I,runCloseDelay:B}=qu(e,e=>{x.value=e}),P=fx(()=>e.rail&&e.expandOnHover&&x.value?Number(e.width):Number(e.rail?e.railWidth:e.width)),A=fx(()=>Qe(e.location,o.value)),N=bx(()=>e.persistent),T=fx(()=>!e.permanent&&(g.value||e.temporary)),E=fx(()=>e.sticky&&!T.value&&"bottom"!==A.value);C(()=>e.expandOnHover&&null!=e.rail,()=>{Sx(x,e=>l("update:rail",!e))}),C(()=>!e.disableResizeWatcher,()=>{Sx(T,t=>!e.permanent&&mx(()=>b.value=!t))}),C(()=>!e.disableRouteWatcher&&!!y,()=>{Sx(y.currentRoute,()=>T.value&&(b.value=!1))}),Sx(()=>e.permanent,e=>{e&&(b.value=!0)}),null!=e.modelValue||T.value||(b.value=e.permanent||!g.value);const{isDragging:D,dragProgress:R}=function(e){let{el:t,isActive:a,isTemporary:l,width:n,touchless:o,position:i}=e;ix(()=>{window.addEventListener("touchstart",y,{passive:!0}),window.addEventListener("touchmove",b,{passive:!1}),window.addEventListener("touchend",w,{passive:!0})}),ox(()=>{window.removeEventListener("touchstart",y),window.removeEventListener("touchmove",b),window.removeEventListener("touchend",w)});const r=nx(()=>["left","right"].includes(i.value)),{addMovement:s,endTouch:u,getVelocity:c}=lx();let d=!1;const v=sx(!1),p=sx(0),f=sx(0);let m;function g(e,t){return("left"===i.value?e:"right"===i.value?document.documentElement.clientWidth-e:"top"===i.value?e:"bottom"===i.value?document.documentElement.clientHeight-e:cx())-(t?n.value:0)}function h(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const a="left"===i.value?(e-f.value)/n.value:"right"===i.value?(document.documentElement.clientWidth-e-f.value)/n.value:"top"===i.value?(e-f.value)/n.value:"bottom"===i.value?(document.documentElement.clientHeight-e-f.value)/n.value:cx();return t?Math.max(0,Math.min(1,a)):a}function y(e){if(o.value)return;const t=e.changedTouches[0].clientX,c=e.changedTouches[0].clientY,v="left"===i.value?t<25:"right"===i.value?t>document.documentElement.clientWidth-25:"top"===i.value?c<25:"bottom"===i.value?c>document.documentElement.clientHeight-25:cx(),y=a.value&&("left"===i.value?t<n.value:"right"===i.value?t>document.documentElement.clientWidth-n.value:"top"===i.value?c<n.value:"bottom"===i.value?c>document.documentElement.clientHeight-n.value:cx());(v||y||a.value&&l.value)&&(m=[t,c],f.value=g(r.value?t:c,a.value),p.value=h(r.value?t:c),d=f.value>-20&&f.value<80,u(e),s(e))}function b(e){const t=e.changedTouches[0].clientX,a=e.changedTouches[0].clientY;if(d){if(!e.cancelable)return void(d=!1);const l=Math.abs(t-m[0]),n=Math.abs(a-m[1]);(r.value?l>n&&l>3:n>l&&n>3)?(v.value=!0,d=!1):(r.value?n:l)>3&&(d=!1)}if(!v.value)return;e.preventDefault(),s(e);const l=h(r.value?t:a,!1);p.value=Math.max(0,Math.min(1,l)),l>1?f.value=g(r.value?t:a,!0):l<0&&(f.value=g(r.value?t:a,!1))}function w(e){if(d=!1,!v.value)return;s(e),v.value=!1;const t=c(e.changedTouches[0].identifier),l=Math.abs(t.x),n=Math.abs(t.y),o=r.value?l>n&&l>400:n>l&&n>3;a.value=o?t.direction===({left:"right",right:"left",top:"down",bottom:"up"}[i.value]||cx()):p.value>.5}const S=nx(()=>v.value?{transform:"left"===i.value?`translateX(calc(-100% + ${p.value*n.value}px))`:"right"===i.value?`translateX(calc(100% - ${p.value*n.value}px))`:"top"===i.value?`translateY(calc(-100% + ${p.value*n.value}px))`:"bottom"===i.value?`translateY(calc(100% - ${p.value*n.value}px))`:cx(),transition:"none"}:void 0);return C(v,()=>{const e=t.value?.style.transform??null,a=t.value?.style.transition??null;ux(()=>{t.value?.style.setProperty("transform",S.value?.transform||"none"),t.value?.style.setProperty("transition",S.value?.transition||null)}),rx(()=>{t.value?.style.setProperty("transform",e),t.value?.style.setProperty("transition",a)})}),{isDragging:v,dragProgress:p,dragStyles:S}}({el:k,isActive:b,isTemporary:T,width:P,touchless:bx(()=>e.touchless),position:A}),$=fx(()=>{const t=T.value?0:e.rail&&e.expandOnHover?Number(e.railWidth):P.value;return D.value?t*R.value:t}),{layoutItemStyles:L,layoutItemScrimStyles:F}=_({id:e.name,order:fx(()=>parseInt(e.order,10)),position:A,layoutSize:$,elementSize:P,active:gx(b),disableTransitions:bx(()=>D.value),absolute:fx(()=>e.absolute||E.value&&"string"!=typeof M.value)}),{isStuck:M,stickyStyles:O}=function(e){let{rootEl:t,isSticky:a,layoutItemStyles:l}=e;const n=Zk(!1),o=Zk(0),i=Xk(()=>{const e="boolean"==typeof n.value?"top":n.value;return[a.value?{top:"auto",bottom:"auto",height:void 0}:void 0,n.value?{[e]:p(o.value)}:{top:l.value.top}]});Qk(()=>{ex(a,e=>{e?window.addEventListener("scroll",s,{passive:!0}):window.removeEventListener("scroll",s)},{immediate:!0})}),Jk(()=>{window.removeEventListener("scroll",s)});let r=0;function s(){const e=r>window.scrollY?"up":"down",a=t.value.getBoundingClientRect(),i=parseFloat(l.value.top??0),s=window.scrollY-Math.max(0,o.value-i),u=a.height+Math.max(o.value,i)-window.scrollY-window.innerHeight,c=parseFloat(getComputedStyle(t.value).getPropertyValue("--v-body-scroll-y"))||0;a.height<window.innerHeight-i?(n.value="top",o.value=i):"up"===e&&"bottom"===n.value||"down"===e&&"top"===n.value?(o.value=window.scrollY+a.top-c,n.value=!0):"down"===e&&u<=0?(o.value=0,n.value="bottom"):"up"===e&&s<=0&&(c?"top"!==n.value&&(o.value=-s+c+i,n.value="top"):(o.value=a.top+s,n.value="top")),r=window.scrollY}return{isStuck:n,stickyStyles:i}}({rootEl:k,isSticky:E,layoutItemStyles:L}),z=ya(()=>"string"==typeof e.scrim?e.scrim:null),j=fx(()=>({...D.value?{opacity:.2*R.value,transition:"none"}:void 0,...F.value}));return v({VList:{bgColor:"transparent"}}),wt(()=>{const t=n.image||e.image;return vx(dx,null,[vx(e.tag,px({ref:k,onMouseenter:I,onMouseleave:B,class:["v-navigation-drawer",`v-navigation-drawer--${A.value}`,{"v-navigation-drawer--expand-on-hover":e.expandOnHover,"v-navigation-drawer--floating":e.floating,"v-navigation-drawer--is-hovering":x.value,"v-navigation-drawer--rail":e.rail,"v-navigation-drawer--temporary":T.value,"v-navigation-drawer--persistent":N.value,"v-navigation-drawer--active":b.value,"v-navigation-drawer--sticky":E.value},i.value,c.value,s.value,m.value,f.value,h.value,e.class],style:[d.value,L.value,w.value,O.value,e.style]},S,a),{default:()=>[t&&vx("div",{key:"image",class:"v-navigation-drawer__img"},[n.image?vx(ra,{key:"image-defaults",disabled:!e.image,defaults:{VImg:{alt:"",cover:!0,height:"inherit",src:e.image}}},n.image):vx(Ya,{key:"image-img",alt:"",cover:!0,height:"inherit",src:e.image},null)]),n.prepend&&vx("div",{class:"v-navigation-drawer__prepend"},[n.prepend?.()]),vx("div",{class:"v-navigation-drawer__content"},[n.default?.()]),n.append&&vx("div",{class:"v-navigation-drawer__append"},[n.append?.()])]}),vx(wx,{name:"fade-transition"},{default:()=>[T.value&&(D.value||b.value)&&!!e.scrim&&vx("div",px({class:["v-navigation-drawer__scrim",z.backgroundColorClasses.value],style:[j.value,z.backgroundColorStyles.value],onClick:()=>{N.value||(b.value=!1)}},S),null)]})])}),{isStuck:M}}}),Cx=J({name:"VNoSsr",setup(e,t){let{slots:a}=t;const l=uc();return()=>l.value&&a.default?.()}}),{onScopeDispose:_x}=await e("vue");const{createVNode:Ix,Fragment:Bx,mergeProps:Px}=await e("vue"),{computed:Ax,nextTick:Nx,onMounted:Tx,ref:Ex,shallowRef:Dx,toRef:Rx,watch:$x,watchEffect:Lx}=await e("vue"),Fx=t({controlVariant:{type:String,default:"default"},inset:Boolean,hideInput:Boolean,modelValue:{type:Number,default:null},min:{type:Number,default:Number.MIN_SAFE_INTEGER},max:{type:Number,default:Number.MAX_SAFE_INTEGER},step:{type:Number,default:1},precision:{type:Number,default:0},...H(qd(),["modelValue","validationValue"])},"VNumberInput"),Mx=o()({name:"VNumberInput",props:{...Fx()},emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=Ex(),{holdStart:n,holdStop:o}=function(e){let{toggleUpDown:t}=e,a=-1,l=-1;function n(){window.clearTimeout(a),window.clearInterval(l)}function o(e){t("up"===e)}return _x(n),{holdStart:function(e){n(),o(e),a=window.setTimeout(()=>{l=window.setInterval(()=>o(e),50)},500)},holdStop:n}}({toggleUpDown:I}),i=Gi(e),r=Ax(()=>i.isDisabled.value||i.isReadonly.value),{isFocused:s,focus:u,blur:c}=Ri(e);function d(t){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.precision;const l=null==a?String(t):t.toFixed(a);return s.value?Number(l).toString():l}const v=V(e,"modelValue",null,e=>e??null,t=>null==t?t??null:k(Number(t),e.min,e.max)),p=Dx(null);Lx(()=>{s.value&&!r.value||(null==v.value?p.value=null:isNaN(v.value)||(p.value=d(v.value)))});const f=Ax({get:()=>p.value,set(t){null===t||""===t?(v.value=null,p.value=null):!isNaN(Number(t))&&Number(t)<=e.max&&Number(t)>=e.min&&(v.value=Number(t),p.value=t)}}),m=Ax(()=>!r.value&&(v.value??0)+e.step<=e.max),g=Ax(()=>!r.value&&(v.value??0)-e.step>=e.min),h=Ax(()=>e.hideInput?"stacked":e.controlVariant),y=Rx(()=>"split"===h.value?"$plus":"$collapse"),b=Rx(()=>"split"===h.value?"$minus":"$expand"),w=Rx(()=>"split"===h.value?"default":"small"),S=Rx(()=>"stacked"===h.value?"auto":"100%"),x={props:{onClick:A,onPointerup:N,onPointerdown:T}},C={props:{onClick:A,onPointerup:N,onPointerdown:E}};function _(e){if(null==e)return 0;const t=e.toString(),a=t.indexOf(".");return~a?t.length-a:0}function I(){let t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];if(r.value)return;if(null==v.value)return void(f.value=d(k(0,e.min,e.max)));let a=Math.max(_(v.value),_(e.step));null!=e.precision&&(a=Math.max(a,e.precision)),t?m.value&&(f.value=d(v.value+e.step,a)):g.value&&(f.value=d(v.value-e.step,a))}function B(t){if(!t.data)return;const a=t.target?.value,l=t.target?.selectionStart,n=t.target?.selectionEnd,o=a?a.slice(0,l)+t.data+a.slice(n):t.data;/^-?(\d+(\.\d*)?|(\.\d+)|\d*|\.)$/.test(o)||t.preventDefault(),null!=e.precision&&(o.split(".")[1]?.length>e.precision&&t.preventDefault(),0===e.precision&&o.includes(".")&&t.preventDefault())}async function P(e){["Enter","ArrowLeft","ArrowRight","Backspace","Delete","Tab"].includes(e.key)||e.ctrlKey||["ArrowDown","ArrowUp"].includes(e.key)&&(e.preventDefault(),D(),await Nx(),"ArrowDown"===e.key?I(!1):I())}function A(e){e.stopPropagation()}function N(e){const t=e.currentTarget;t?.releasePointerCapture(e.pointerId),e.preventDefault(),e.stopPropagation(),o()}function T(e){const t=e.currentTarget;t?.setPointerCapture(e.pointerId),e.preventDefault(),e.stopPropagation(),n("up")}function E(e){const t=e.currentTarget;t?.setPointerCapture(e.pointerId),e.preventDefault(),e.stopPropagation(),n("down")}function D(){if(r.value)return;if(!l.value)return;const t=l.value.value;t&&!isNaN(Number(t))?f.value=d(k(Number(t),e.min,e.max)):f.value=null}function R(){u(),r.value||(null===v.value||isNaN(v.value)?f.value=null:f.value=v.value.toString())}function $(){c(),D()}return $x(()=>e.precision,()=>function(){if(r.value)return;if(null===v.value||isNaN(v.value))return void(f.value=null);f.value=null==e.precision?String(v.value):v.value.toFixed(e.precision)}()),Tx(()=>{D()}),wt(()=>{const{modelValue:t,...n}=Kd.filterProps(e);function o(){return a.increment?Ix(ra,{key:"increment-defaults",defaults:{VBtn:{disabled:!m.value,flat:!0,height:S.value,size:w.value,icon:y.value}}},{default:()=>[a.increment(x)]}):Ix(To,{disabled:!m.value,flat:!0,key:"increment-btn",height:S.value,"data-testid":"increment","aria-hidden":"true",icon:y.value,onClick:A,onPointerup:N,onPointerdown:T,size:w.value,tabindex:"-1"},null)}function i(){return a.decrement?Ix(ra,{key:"decrement-defaults",defaults:{VBtn:{disabled:!g.value,flat:!0,height:S.value,size:w.value,icon:b.value}}},{default:()=>[a.decrement(C)]}):Ix(To,{disabled:!g.value,flat:!0,key:"decrement-btn",height:S.value,"data-testid":"decrement","aria-hidden":"true",icon:b.value,size:w.value,tabindex:"-1",onClick:A,onPointerup:N,onPointerdown:E},null)}function r(){return Ix("div",{class:"v-number-input__control"},[i(),Ix(Js,{vertical:"stacked"!==h.value},null),o()])}function s(){return e.hideInput||e.inset?void 0:Ix(Js,{vertical:!0},null)}const u="split"===h.value?Ix("div",{class:"v-number-input__control"},[Ix(Js,{vertical:!0},null),o()]):e.reverse||"hidden"===h.value?void 0:Ix(Bx,null,[s(),r()]),c=a["append-inner"]||u,d="split"===h.value?Ix("div",{class:"v-number-input__control"},[i(),Ix(Js,{vertical:!0},null)]):e.reverse&&"hidden"!==h.value?Ix(Bx,null,[r(),s()]):void 0,p=a["prepend-inner"]||d;return Ix(Kd,Px({ref:l,modelValue:f.value,"onUpdate:modelValue":e=>f.value=e,validationValue:v.value,onBeforeinput:B,onFocus:R,onBlur:$,onKeydown:P,class:["v-number-input",{"v-number-input--default":"default"===h.value,"v-number-input--hide-input":e.hideInput,"v-number-input--inset":e.inset,"v-number-input--reverse":e.reverse,"v-number-input--split":"split"===h.value,"v-number-input--stacked":"stacked"===h.value},e.class]},n,{style:e.style,inputmode:"decimal"}),{...a,"append-inner":c?function(){for(var e=arguments.length,t=new Array(e),l=0;l<e;l++)t[l]=arguments[l];return Ix(Bx,null,[a["append-inner"]?.(...t),u])}:void 0,"prepend-inner":p?function(){for(var e=arguments.length,t=new Array(e),l=0;l<e;l++)t[l]=arguments[l];return Ix(Bx,null,[d,a["prepend-inner"]?.(...t)])}:void 0})}),Zc({},l)}}),{Fragment:Ox,createVNode:zx,mergeProps:jx}=await e("vue"),{computed:Hx,nextTick:Wx,ref:Ux,toRef:Gx,watch:Yx}=await e("vue"),qx=t({autofocus:Boolean,divider:String,focusAll:Boolean,label:{type:String,default:"$vuetify.input.otp"},length:{type:[Number,String],default:6},modelValue:{type:[Number,String],default:void 0},placeholder:String,type:{type:String,default:"number"},...ua(),...Di(),...U($d({variant:"outlined"}),["baseColor","bgColor","class","color","disabled","error","loading","rounded","style","theme","variant"])},"VOtpInput"),Kx=o()({name:"VOtpInput",props:qx(),emits:{finish:e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{dimensionStyles:o}=ca(e),{isFocused:i,focus:r,blur:s}=Ri(e),u=V(e,"modelValue","",e=>null==e?[]:String(e).split(""),e=>e.join("")),{t:c}=M(),d=Hx(()=>Number(e.length)),p=Hx(()=>Array(d.value).fill(0)),f=Ux(-1),m=Ux(),g=Ux([]),h=Hx(()=>g.value[f.value]);function y(){if(S(h.value.value))return void(h.value.value="");const e=u.value.slice(),t=h.value.value;e[f.value]=t;let a=null;f.value>u.value.length?a=u.value.length+1:f.value+1!==d.value&&(a="next"),u.value=e,a&&te(m.value,a)}function b(e){const t=u.value.slice(),a=f.value;let l=null;["ArrowLeft","ArrowRight","Backspace","Delete"].includes(e.key)&&(e.preventDefault(),"ArrowLeft"===e.key?l="prev":"ArrowRight"===e.key?l="next":["Backspace","Delete"].includes(e.key)&&(t[f.value]="",u.value=t,f.value>0&&"Backspace"===e.key?l="prev":requestAnimationFrame(()=>{g.value[a]?.select()})),requestAnimationFrame(()=>{null!=l&&te(m.value,l)}))}function w(){s(),f.value=-1}function S(t){return"number"===e.type&&/[^0-9]/g.test(t)}return v({VField:{color:Gx(()=>e.color),bgColor:Gx(()=>e.color),baseColor:Gx(()=>e.baseColor),disabled:Gx(()=>e.disabled),error:Gx(()=>e.error),variant:Gx(()=>e.variant)}},{scoped:!0}),Yx(u,e=>{e.length===d.value&&l("finish",e.join(""))},{deep:!0}),Yx(f,e=>{e<0||Wx(()=>{g.value[e]?.select()})}),wt(()=>{const[t,l]=z(a);return zx("div",jx({class:["v-otp-input",{"v-otp-input--divided":!!e.divider},e.class],style:[e.style]},t),[zx("div",{ref:m,class:"v-otp-input__content",style:[o.value]},[p.value.map((t,a)=>zx(Ox,null,[e.divider&&0!==a&&zx("span",{class:"v-otp-input__divider"},[e.divider]),zx(Ld,{focused:i.value&&e.focusAll||f.value===a,key:a},{...n,loader:void 0,default:()=>zx("input",{ref:e=>g.value[a]=e,"aria-label":c(e.label,a+1),autofocus:0===a&&e.autofocus,autocomplete:"one-time-code",class:["v-otp-input__field"],disabled:e.disabled,inputmode:"number"===e.type?"numeric":"text",min:"number"===e.type?0:void 0,maxlength:0===a?d.value:"1",placeholder:e.placeholder,type:"number"===e.type?"text":e.type,value:u.value[a],onInput:y,onFocus:e=>{return t=a,r(),void(f.value=t);var t},onBlur:w,onKeydown:b,onPaste:e=>function(e,t){t.preventDefault(),t.stopPropagation();const a=t?.clipboardData?.getData("Text").slice(0,d.value)??"";S(a)||(u.value=a.split(""),g.value?.[e].blur())}(a,e)},null)})])),zx("input",jx({class:"v-otp-input-input",type:"hidden"},l,{value:u.value.join("")}),null),zx(Xc,{contained:!0,"content-class":"v-otp-input__loader","model-value":!!e.loading,persistent:!0},{default:()=>[n.loader?.()??zx(An,{color:"boolean"==typeof e.loading?void 0:e.loading,indeterminate:!0,size:"24",width:"2"},null)]}),n.default?.()])])}),{blur:()=>{g.value?.some(e=>e.blur())},focus:()=>{g.value?.[0].focus()},reset:function(){u.value=[]},isFocused:i}}}),{createVNode:Xx}=await e("vue"),{computed:Jx,onBeforeUnmount:Qx,ref:Zx,watch:eV,watchEffect:tV}=await e("vue");const aV=t({scale:{type:[Number,String],default:.5},...qe()},"VParallax"),lV=o()({name:"VParallax",props:aV(),setup(e,t){let{slots:a}=t;const{intersectionRef:l,isIntersecting:n}=Vn(),{resizeRef:o,contentRect:i}=R(),{height:r}=G(),s=Zx();let u;tV(()=>{l.value=o.value=s.value?.$el}),eV(n,e=>{e?(u=gt(l.value),u=u===document.scrollingElement?document:u,u.addEventListener("scroll",v,{passive:!0}),v()):u.removeEventListener("scroll",v)}),Qx(()=>{u?.removeEventListener("scroll",v)}),eV(r,v),eV(()=>i.value?.height,v);const c=Jx(()=>1-k(Number(e.scale)));let d=-1;function v(){n.value&&(cancelAnimationFrame(d),d=requestAnimationFrame(()=>{const e=(s.value?.$el).querySelector(".v-img__img");if(!e)return;const t=u instanceof Document?document.documentElement.clientHeight:u.clientHeight,a=u instanceof Document?window.scrollY:u.scrollTop,n=l.value.getBoundingClientRect().top+a,o=i.value.height,r=(d=(a-(n+(o-t)/2))*c.value,Math.floor(Math.abs(d))*Math.sign(d));var d;const v=Math.max(1,(c.value*(t-o)+o)/o);e.style.setProperty("transform",`translateY(${r}px) scale(${v})`)}))}return wt(()=>Xx(Ya,{class:["v-parallax",{"v-parallax--active":n.value},e.class],style:e.style,ref:s,cover:!0,onLoadstart:v,onLoad:v},a)),{}}}),{mergeProps:nV,createVNode:oV}=await e("vue"),iV=t({...wi({falseIcon:"$radioOff",trueIcon:"$radioOn"})},"VRadio"),rV=o()({name:"VRadio",props:iV(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=Si.filterProps(e);return oV(Si,nV(t,{class:["v-radio",e.class],style:e.style,type:"radio"}),a)}),{}}}),{Fragment:sV,createVNode:uV,mergeProps:cV}=await e("vue"),{computed:dV,useId:vV}=await e("vue"),pV=t({height:{type:[Number,String],default:"auto"},...ur(),...H(oi(),["multiple"]),trueIcon:{type:E,default:"$radioOn"},falseIcon:{type:E,default:"$radioOff"},type:{type:String,default:"radio"}},"VRadioGroup"),fV=o()({name:"VRadioGroup",inheritAttrs:!1,props:pV(),emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=vV(),o=dV(()=>e.id||`radio-group-${n}`),i=V(e,"modelValue");return wt(()=>{const[t,n]=z(a),r=cr.filterProps(e),s=Si.filterProps(e),u=l.label?l.label({label:e.label,props:{for:o.value}}):e.label;return uV(cr,cV({class:["v-radio-group",e.class],style:e.style},t,r,{modelValue:i.value,"onUpdate:modelValue":e=>i.value=e,id:o.value}),{...l,default:t=>{let{id:a,messagesId:o,isDisabled:r,isReadonly:c}=t;return uV(sV,null,[u&&uV(Qo,{id:a.value},{default:()=>[u]}),uV(ri,cV(s,{id:a.value,"aria-describedby":o.value,defaultsTarget:"VRadio",trueIcon:e.trueIcon,falseIcon:e.falseIcon,type:e.type,disabled:r.value,readonly:c.value,"aria-labelledby":u?a.value:void 0,multiple:!1},n,{modelValue:i.value,"onUpdate:modelValue":e=>i.value=e}),l)])}})}),{}}}),{Fragment:mV,createVNode:gV,mergeProps:hV}=await e("vue"),{computed:yV,ref:bV}=await e("vue"),wV=t({...Di(),...ur(),...Im(),strict:Boolean,modelValue:{type:Array,default:()=>[0,0]}},"VRangeSlider"),SV=o()({name:"VRangeSlider",props:wV(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,end:e=>!0,start:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=bV(),o=bV(),i=bV(),{rtlClasses:r}=u();const s=Bm(e),c=V(e,"modelValue",void 0,e=>e?.length?e.map(e=>s.roundValue(e)):[0,0]),{activeThumbRef:d,hasLabels:v,max:p,min:f,mousePressed:m,onSliderMousedown:g,onSliderTouchstart:h,position:y,trackContainerRef:b,readonly:w}=Pm({props:e,steps:s,onSliderStart:()=>{l("start",c.value)},onSliderEnd:t=>{let{value:a}=t;const o=d.value===n.value?.$el?[a,c.value[1]]:[c.value[0],a];!e.strict&&o[0]<o[1]&&(c.value=o),l("end",c.value)},onSliderMove:t=>{let{value:a}=t;const[l,i]=c.value;e.strict||l!==i||l===f.value||(d.value=a>l?o.value?.$el:n.value?.$el,d.value?.focus()),d.value===n.value?.$el?c.value=[Math.min(a,i),i]:c.value=[l,Math.max(l,a)]},getActiveThumb:function(t){if(!n.value||!o.value)return;const a=_m(t,n.value.$el,e.direction),l=_m(t,o.value.$el,e.direction),i=Math.abs(a),r=Math.abs(l);return i<r||i===r&&a<0?n.value.$el:o.value.$el}}),{isFocused:S,focus:k,blur:x}=Ri(e),C=yV(()=>y(c.value[0])),_=yV(()=>y(c.value[1]));return wt(()=>{const t=cr.filterProps(e),l=!!(e.label||a.label||a.prepend);return gV(cr,hV({class:["v-slider","v-range-slider",{"v-slider--has-labels":!!a["tick-label"]||v.value,"v-slider--focused":S.value,"v-slider--pressed":m.value,"v-slider--disabled":e.disabled},r.value,e.class],style:e.style,ref:i},t,{focused:S.value}),{...a,prepend:l?t=>gV(mV,null,[a.label?.(t)??(e.label?gV(Qo,{class:"v-slider__label",text:e.label},null):void 0),a.prepend?.(t)]):void 0,default:t=>{let{id:l,messagesId:i}=t;return gV("div",{class:"v-slider__container",onMousedown:w.value?void 0:g,onTouchstartPassive:w.value?void 0:h},[gV("input",{id:`${l.value}_start`,name:e.name||l.value,disabled:!!e.disabled,readonly:!!e.readonly,tabindex:"-1",value:c.value[0]},null),gV("input",{id:`${l.value}_stop`,name:e.name||l.value,disabled:!!e.disabled,readonly:!!e.readonly,tabindex:"-1",value:c.value[1]},null),gV(jm,{ref:b,start:C.value,stop:_.value},{"tick-label":a["tick-label"]}),gV(Lm,{ref:n,"aria-describedby":i.value,focused:S&&d.value===n.value?.$el,modelValue:c.value[0],"onUpdate:modelValue":e=>c.value=[e,c.value[1]],onFocus:e=>{k(),d.value=n.value?.$el,p.value!==f.value&&c.value[0]===c.value[1]&&c.value[1]===f.value&&e.relatedTarget!==o.value?.$el&&(n.value?.$el.blur(),o.value?.$el.focus())},onBlur:()=>{x(),d.value=void 0},min:f.value,max:c.value[1],position:C.value,ripple:e.ripple},{"thumb-label":a["thumb-label"]}),gV(Lm,{ref:o,"aria-describedby":i.value,focused:S&&d.value===o.value?.$el,modelValue:c.value[1],"onUpdate:modelValue":e=>c.value=[c.value[0],e],onFocus:e=>{k(),d.value=o.value?.$el,p.value!==f.value&&c.value[0]===c.value[1]&&c.value[0]===p.value&&e.relatedTarget!==n.value?.$el&&(o.value?.$el.blur(),n.value?.$el.focus())},onBlur:()=>{x(),d.value=void 0},min:c.value[0],max:p.value,position:_.value,ripple:e.ripple},{"thumb-label":a["thumb-label"]})])}})}),{}}}),{Fragment:kV,createVNode:xV,mergeProps:VV,createTextVNode:CV}=await e("vue"),{computed:_V,shallowRef:IV,useId:BV}=await e("vue"),PV=t({name:String,itemAriaLabel:{type:String,default:"$vuetify.rating.ariaLabel.item"},activeColor:String,color:String,clearable:Boolean,disabled:Boolean,emptyIcon:{type:E,default:"$ratingEmpty"},fullIcon:{type:E,default:"$ratingFull"},halfIncrements:Boolean,hover:Boolean,length:{type:[Number,String],default:5},readonly:Boolean,modelValue:{type:[Number,String],default:0},itemLabels:Array,itemLabelPosition:{type:String,default:"top",validator:e=>["top","bottom"].includes(e)},ripple:Boolean,...qe(),...Al(),...pn(),...Vt(),...c()},"VRating"),AV=o()({name:"VRating",props:PV(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{t:l}=M(),{themeClasses:n}=r(e),o=V(e,"modelValue"),i=_V(()=>k(parseFloat(o.value),0,Number(e.length))),s=_V(()=>ke(Number(e.length),1)),u=_V(()=>s.value.flatMap(t=>e.halfIncrements?[t-.5,t]:[t])),c=IV(-1),d=_V(()=>u.value.map(t=>{const a=e.hover&&c.value>-1,l=i.value>=t,n=c.value>=t,o=(a?n:l)?e.fullIcon:e.emptyIcon,r=e.activeColor??e.color;return{isFilled:l,isHovered:n,icon:o,color:l||n?r:e.color}})),v=_V(()=>[0,...u.value].map(t=>({onMouseenter:e.hover?function(){c.value=t}:void 0,onMouseleave:e.hover?function(){c.value=-1}:void 0,onClick:function(){e.disabled||e.readonly||(o.value=i.value===t&&e.clearable?0:t)}}))),p=BV(),f=_V(()=>e.name??`v-rating-${p}`);function m(t){let{value:n,index:o,showStar:r=!0}=t;const{onMouseenter:s,onMouseleave:u,onClick:c}=v.value[o+1],p=`${f.value}-${String(n).replace(".","-")}`,m={color:d.value[o]?.color,density:e.density,disabled:e.disabled,icon:d.value[o]?.icon,ripple:e.ripple,size:e.size,variant:"plain"};return xV(kV,null,[xV("label",{for:p,class:{"v-rating__item--half":e.halfIncrements&&n%1>0,"v-rating__item--full":e.halfIncrements&&n%1==0},onMouseenter:s,onMouseleave:u,onClick:c},[xV("span",{class:"v-rating__hidden"},[l(e.itemAriaLabel,n,e.length)]),r?a.item?a.item({...d.value[o],props:m,value:n,index:o,rating:i.value}):xV(To,VV({"aria-label":l(e.itemAriaLabel,n,e.length)},m),null):void 0]),xV("input",{class:"v-rating__hidden",name:f.value,id:p,type:"radio",value:n,checked:i.value===n,tabindex:-1,readonly:e.readonly,disabled:e.disabled},null)])}function g(e){return a["item-label"]?a["item-label"](e):e.label?xV("span",null,[e.label]):xV("span",null,[CV(" ")])}return wt(()=>{const t=!!e.itemLabels?.length||a["item-label"];return xV(e.tag,{class:["v-rating",{"v-rating--hover":e.hover,"v-rating--readonly":e.readonly},n.value,e.class],style:e.style},{default:()=>[xV(m,{value:0,index:-1,showStar:!1},null),s.value.map((a,l)=>xV("div",{class:"v-rating__wrapper"},[t&&"top"===e.itemLabelPosition?g({value:a,index:l,label:e.itemLabels?.[l]}):void 0,xV("div",{class:"v-rating__item"},[e.halfIncrements?xV(kV,null,[xV(m,{value:a-.5,index:2*l},null),xV(m,{value:a,index:2*l+1},null)]):xV(m,{value:a,index:l},null)]),t&&"bottom"===e.itemLabelPosition?g({value:a,index:l,label:e.itemLabels?.[l]}):void 0]))]})}),{}}}),{createVNode:NV,mergeProps:TV}=await e("vue"),{computed:EV}=await e("vue"),DV={actions:"button@2",article:"heading, paragraph",avatar:"avatar",button:"button",card:"image, heading","card-avatar":"image, list-item-avatar",chip:"chip","date-picker":"list-item, heading, divider, date-picker-options, date-picker-days, actions","date-picker-options":"text, avatar@2","date-picker-days":"avatar@28",divider:"divider",heading:"heading",image:"image","list-item":"text","list-item-avatar":"avatar, text","list-item-two-line":"sentences","list-item-avatar-two-line":"avatar, sentences","list-item-three-line":"paragraph","list-item-avatar-three-line":"avatar, paragraph",ossein:"ossein",paragraph:"text@3",sentences:"text@2",subtitle:"text",table:"table-heading, table-thead, table-tbody, table-tfoot","table-heading":"chip, text","table-thead":"heading@6","table-tbody":"table-row-divider@6","table-row-divider":"table-row, divider","table-row":"text@6","table-tfoot":"text@2, avatar@2",text:"text"};function RV(e){return NV("div",{class:["v-skeleton-loader__bone",`v-skeleton-loader__${e}`]},[arguments.length>1&&void 0!==arguments[1]?arguments[1]:[]])}function $V(e){const[t,a]=e.split("@");return Array.from({length:a}).map(()=>LV(t))}function LV(e){let t=[];if(!e)return t;const a=DV[e];if(e===a);else{if(e.includes(","))return FV(e);if(e.includes("@"))return $V(e);a.includes(",")?t=FV(a):a.includes("@")?t=$V(a):a&&t.push(LV(a))}return[RV(e,t)]}function FV(e){return e.replace(/\s/g,"").split(",").map(LV)}const MV=t({boilerplate:Boolean,color:String,loading:Boolean,loadingText:{type:String,default:"$vuetify.loading"},type:{type:[String,Array],default:"ossein"},...ua(),...Za(),...c()},"VSkeletonLoader"),OV=o()({name:"VSkeletonLoader",props:MV(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.color),{dimensionStyles:o}=ca(e),{elevationClasses:i}=el(e),{themeClasses:s}=r(e),{t:u}=M(),c=EV(()=>LV(P(e.type).join(",")));return wt(()=>{const t=!a.default||e.loading,r=e.boilerplate||!t?{}:{ariaLive:"polite",ariaLabel:u(e.loadingText),role:"alert"};return NV("div",TV({class:["v-skeleton-loader",{"v-skeleton-loader--boilerplate":e.boilerplate},s.value,l.value,i.value],style:[n.value,t?o.value:{}]},r),[t?c.value:a.default?.()])}),{}}}),zV=o()({name:"VSlideGroupItem",props:an(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=ln(e,Vr);return()=>a.default?.({isSelected:l.isSelected.value,select:l.select,toggle:l.toggle,selectedClass:l.selectedClass.value})}}),{createVNode:jV,mergeProps:HV}=await e("vue"),{computed:WV,inject:UV,mergeProps:GV,nextTick:YV,onMounted:qV,onScopeDispose:KV,ref:XV,shallowRef:JV,watch:QV,watchEffect:ZV}=await e("vue");const eC=t({multiLine:Boolean,text:String,timer:[Boolean,String],timeout:{type:[Number,String],default:5e3},vertical:Boolean,...En({location:"bottom"}),...Yn(),...Sa(),...Fl(),...c(),...H(Kc({transition:"v-snackbar-transition"}),["persistent","noClickAnimation","scrim","scrollStrategy"])},"VSnackbar"),tC=o()({name:"VSnackbar",props:eC(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{positionClasses:n}=qn(e),{scopeId:o}=mc(),{themeClasses:i}=r(e),{colorClasses:s,colorStyles:u,variantClasses:c}=Ml(e),{roundedClasses:d}=ka(e),v=function(e){const t=JV(e());let a=-1;function l(){clearInterval(a)}return KV(l),{clear:l,time:t,start:function(n){const o=n?getComputedStyle(n):{transitionDuration:.2},i=1e3*parseFloat(o.transitionDuration)||200;if(l(),t.value<=0)return;const r=performance.now();a=window.setInterval(()=>{const a=performance.now()-r+i;t.value=Math.max(e()-a,0),t.value<=0&&l()},i)},reset:function(){l(),YV(()=>t.value=e())}}}(()=>Number(e.timeout)),p=XV(),f=XV(),m=JV(!1),g=JV(0),h=XV(),y=UV(Le,void 0);C(()=>!!y,()=>{const e=$e();ZV(()=>{h.value=e.mainStyles.value})}),QV(l,w),QV(()=>e.timeout,w),qV(()=>{l.value&&w()});let b=-1;function w(){v.reset(),window.clearTimeout(b);const t=Number(e.timeout);if(!l.value||-1===t)return;const a=Fe(f.value);v.start(a),b=window.setTimeout(()=>{l.value=!1},t)}function S(){m.value=!0,v.reset(),window.clearTimeout(b)}function k(){m.value=!1,w()}function x(e){g.value=e.touches[0].clientY}function _(e){Math.abs(g.value-e.changedTouches[0].clientY)>50&&(l.value=!1)}function I(){m.value&&k()}const B=WV(()=>e.location.split(" ").reduce((e,t)=>(e[`v-snackbar--${t}`]=!0,e),{}));return wt(()=>{const t=Xc.filterProps(e),r=!!(a.default||a.text||e.text);return jV(Xc,HV({ref:p,class:["v-snackbar",{"v-snackbar--active":l.value,"v-snackbar--multi-line":e.multiLine&&!e.vertical,"v-snackbar--timer":!!e.timer,"v-snackbar--vertical":e.vertical},B.value,n.value,e.class],style:[h.value,e.style]},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,contentProps:GV({class:["v-snackbar__wrapper",i.value,s.value,d.value,c.value],style:[u.value],onPointerenter:S,onPointerleave:k},t.contentProps),persistent:!0,noClickAnimation:!0,scrim:!1,scrollStrategy:"none",_disableGlobalStack:!0,onTouchstartPassive:x,onTouchend:_,onAfterLeave:I},o),{default:()=>[Ll(!1,"v-snackbar"),e.timer&&!m.value&&jV("div",{key:"timer",class:"v-snackbar__timer"},[jV(Mn,{ref:f,color:"string"==typeof e.timer?e.timer:"info",max:e.timeout,"model-value":v.time.value},null)]),r&&jV("div",{key:"content",class:"v-snackbar__content",role:"status","aria-live":"polite"},[a.text?.()??e.text,a.default?.()]),a.actions&&jV(ra,{defaults:{VBtn:{variant:"text",ripple:!1,slim:!0}}},{default:()=>[jV("div",{class:"v-snackbar__actions"},[a.actions({isActive:l})])]})],activator:a.activator})}),Zc({},p)}}),{Fragment:aC,createVNode:lC,mergeProps:nC}=await e("vue"),{computed:oC,nextTick:iC,shallowRef:rC,watch:sC}=await e("vue"),uC=t({closable:[Boolean,String],closeText:{type:String,default:"$vuetify.dismiss"},modelValue:{type:Array,default:()=>[]},...H(eC(),["modelValue"])},"VSnackbarQueue"),cC=o()({name:"VSnackbarQueue",props:uC(),emits:{"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{t:n}=M(),o=rC(!1),i=rC(!1),r=rC();function s(){e.modelValue.length?u():(r.value=void 0,i.value=!1)}function u(){const[t,...l]=e.modelValue;a("update:modelValue",l),r.value="string"==typeof t?{text:t}:t,iC(()=>{o.value=!0})}function c(){o.value=!1}sC(()=>e.modelValue.length,(e,t)=>{!i.value&&e>t&&u()}),sC(o,e=>{e&&(i.value=!0)});const d=oC(()=>({color:"string"==typeof e.closable?e.closable:void 0,text:n(e.closeText)}));wt(()=>{const t=!(!e.closable&&!l.actions),{modelValue:a,...n}=tC.filterProps(e);return lC(aC,null,[i.value&&!!r.value&&(l.default?lC(ra,{defaults:{VSnackbar:r.value}},{default:()=>[l.default({item:r.value})]}):lC(tC,nC(n,r.value,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,onAfterLeave:s}),{text:l.text?()=>l.text?.({item:r.value}):void 0,actions:t?()=>lC(aC,null,[l.actions?lC(ra,{defaults:{VBtn:d.value}},{default:()=>[l.actions({item:r.value,props:{onClick:c}})]}):lC(To,nC(d.value,{onClick:c}),null)]):void 0}))])})}}),dC=t({autoDraw:Boolean,autoDrawDuration:[Number,String],autoDrawEasing:{type:String,default:"ease"},color:String,gradient:{type:Array,default:()=>[]},gradientDirection:{type:String,validator:e=>["top","bottom","left","right"].includes(e),default:"top"},height:{type:[String,Number],default:75},labels:{type:Array,default:()=>[]},labelSize:{type:[Number,String],default:7},lineWidth:{type:[String,Number],default:4},id:String,itemValue:{type:String,default:"value"},modelValue:{type:Array,default:()=>[]},min:[String,Number],max:[String,Number],padding:{type:[String,Number],default:8},showLabels:Boolean,smooth:[Boolean,String,Number],width:{type:[Number,String],default:300}},"Line"),{computed:vC,useId:pC,createVNode:fC,Fragment:mC}=await e("vue"),gC=t({autoLineWidth:Boolean,...dC()},"VBarline"),hC=o()({name:"VBarline",props:gC(),setup(e,t){let{slots:a}=t;const l=pC(),n=vC(()=>e.id||`barline-${l}`),o=vC(()=>Number(e.autoDrawDuration)||500),i=vC(()=>Boolean(e.showLabels||e.labels.length>0||!!a?.label)),r=vC(()=>parseFloat(e.lineWidth)||4),s=vC(()=>Math.max(e.modelValue.length*r.value,Number(e.width))),u=vC(()=>({minX:0,maxX:s.value,minY:0,maxY:parseInt(e.height,10)})),c=vC(()=>e.modelValue.map(t=>ee(t,e.itemValue,t)));function d(t,a){const{minX:l,maxX:n,minY:o,maxY:i}=a,r=t.length;let s=null!=e.max?Number(e.max):Math.max(...t),u=null!=e.min?Number(e.min):Math.min(...t);u>0&&null==e.min&&(u=0),s<0&&null==e.max&&(s=0);const c=n/r,d=(i-o)/(s-u||1),v=i-Math.abs(u*d);return t.map((e,t)=>{const a=Math.abs(d*e);return{x:l+t*c,y:v-a+Number(e<0)*a,height:a,value:e}})}const v=vC(()=>{const t=[],a=d(c.value,u.value),l=a.length;for(let n=0;t.length<l;n++){const l=a[n];let o=e.labels[n];o||(o="object"==typeof l?l.value:l),t.push({x:l.x,value:String(o)})}return t}),p=vC(()=>d(c.value,u.value)),f=vC(()=>(Math.abs(p.value[0].x-p.value[1].x)-r.value)/2),m=vC(()=>"boolean"==typeof e.smooth?e.smooth?2:0:Number(e.smooth));wt(()=>{const t=e.gradient.slice().length?e.gradient.slice().reverse():[""];return fC("svg",{display:"block"},[fC("defs",null,[fC("linearGradient",{id:n.value,gradientUnits:"userSpaceOnUse",x1:"left"===e.gradientDirection?"100%":"0",y1:"top"===e.gradientDirection?"100%":"0",x2:"right"===e.gradientDirection?"100%":"0",y2:"bottom"===e.gradientDirection?"100%":"0"},[t.map((e,a)=>fC("stop",{offset:a/Math.max(t.length-1,1),"stop-color":e||"currentColor"},null))])]),fC("clipPath",{id:`${n.value}-clip`},[p.value.map(t=>fC("rect",{x:t.x+f.value,y:t.y,width:r.value,height:t.height,rx:m.value,ry:m.value},[e.autoDraw&&fC(mC,null,[fC("animate",{attributeName:"y",from:t.y+t.height,to:t.y,dur:`${o.value}ms`,fill:"freeze"},null),fC("animate",{attributeName:"height",from:"0",to:t.height,dur:`${o.value}ms`,fill:"freeze"},null)])]))]),i.value&&fC("g",{key:"labels",style:{textAnchor:"middle",dominantBaseline:"mathematical",fill:"currentColor"}},[v.value.map((t,l)=>fC("text",{x:t.x+f.value+r.value/2,y:parseInt(e.height,10)-2+(parseInt(e.labelSize,10)||5.25),"font-size":Number(e.labelSize)||7},[a.label?.({index:l,value:t.value})??t.value]))]),fC("g",{"clip-path":`url(#${n.value}-clip)`,fill:`url(#${n.value})`},[fC("rect",{x:0,y:0,width:Math.max(e.modelValue.length*r.value,Number(e.width)),height:e.height},null)])])})}});function yC(e,t){let a=arguments.length>2&&void 0!==arguments[2]&&arguments[2],l=arguments.length>3&&void 0!==arguments[3]?arguments[3]:75;if(0===e.length)return"";const n=e.shift(),o=e[e.length-1];return(a?`M${n.x} ${l-n.x+2} L${n.x} ${n.y}`:`M${n.x} ${n.y}`)+e.map((a,l)=>{const o=e[l+1],i=e[l-1]||n,r=o&&(u=a,c=i,bC((s=o).x+c.x)===bC(2*u.x)&&bC(s.y+c.y)===bC(2*u.y));var s,u,c;if(!o||r)return`L${a.x} ${a.y}`;const d=Math.min(wC(i,a),wC(o,a)),v=d/2<t?d/2:t,p=SC(i,a,v),f=SC(o,a,v);return`L${p.x} ${p.y}S${a.x} ${a.y} ${f.x} ${f.y}`}).join("")+(a?`L${o.x} ${l-n.x+2} Z`:"")}function bC(e){return parseInt(e,10)}function wC(e,t){return Math.sqrt(Math.pow(t.x-e.x,2)+Math.pow(t.y-e.y,2))}function SC(e,t,a){const l=e.x-t.x,n=e.y-t.y,o=Math.sqrt(l*l+n*n),i=l/o,r=n/o;return{x:t.x+i*a,y:t.y+r*a}}const{computed:kC,nextTick:xC,ref:VC,useId:CC,watch:_C,createVNode:IC}=await e("vue"),BC=t({fill:Boolean,...dC()},"VTrendline"),PC=o()({name:"VTrendline",props:BC(),setup(e,t){let{slots:a}=t;const l=CC(),n=kC(()=>e.id||`trendline-${l}`),o=kC(()=>Number(e.autoDrawDuration)||(e.fill?500:2e3)),i=VC(0),r=VC(null);function s(t,a){const{minX:l,maxX:n,minY:o,maxY:i}=a,r=t.length,s=null!=e.max?Number(e.max):Math.max(...t),u=null!=e.min?Number(e.min):Math.min(...t),c=(n-l)/(r-1),d=(i-o)/(s-u||1);return t.map((e,t)=>({x:l+t*c,y:i-(e-u)*d,value:e}))}const u=kC(()=>Boolean(e.showLabels||e.labels.length>0||!!a?.label)),c=kC(()=>parseFloat(e.lineWidth)||4),d=kC(()=>Number(e.width)),v=kC(()=>{const t=Number(e.padding);return{minX:t,maxX:d.value-t,minY:t,maxY:parseInt(e.height,10)-t}}),p=kC(()=>e.modelValue.map(t=>ee(t,e.itemValue,t))),f=kC(()=>{const t=[],a=s(p.value,v.value),l=a.length;for(let n=0;t.length<l;n++){const l=a[n];let o=e.labels[n];o||(o="object"==typeof l?l.value:l),t.push({x:l.x,value:String(o)})}return t});function m(t){const a="boolean"==typeof e.smooth?e.smooth?8:0:Number(e.smooth);return yC(s(p.value,v.value),a,t,parseInt(e.height,10))}_C(()=>e.modelValue,async()=>{if(await xC(),!e.autoDraw||!r.value)return;const t=r.value,a=t.getTotalLength();e.fill?(t.style.transformOrigin="bottom center",t.style.transition="none",t.style.transform="scaleY(0)",t.getBoundingClientRect(),t.style.transition=`transform ${o.value}ms ${e.autoDrawEasing}`,t.style.transform="scaleY(1)"):(t.style.strokeDasharray=`${a}`,t.style.strokeDashoffset=`${a}`,t.getBoundingClientRect(),t.style.transition=`stroke-dashoffset ${o.value}ms ${e.autoDrawEasing}`,t.style.strokeDashoffset="0"),i.value=a},{immediate:!0}),wt(()=>{const t=e.gradient.slice().length?e.gradient.slice().reverse():[""];return IC("svg",{display:"block","stroke-width":parseFloat(e.lineWidth)??4},[IC("defs",null,[IC("linearGradient",{id:n.value,gradientUnits:"userSpaceOnUse",x1:"left"===e.gradientDirection?"100%":"0",y1:"top"===e.gradientDirection?"100%":"0",x2:"right"===e.gradientDirection?"100%":"0",y2:"bottom"===e.gradientDirection?"100%":"0"},[t.map((e,a)=>IC("stop",{offset:a/Math.max(t.length-1,1),"stop-color":e||"currentColor"},null))])]),u.value&&IC("g",{key:"labels",style:{textAnchor:"middle",dominantBaseline:"mathematical",fill:"currentColor"}},[f.value.map((t,l)=>IC("text",{x:t.x+c.value/2+c.value/2,y:parseInt(e.height,10)-4+(parseInt(e.labelSize,10)||5.25),"font-size":Number(e.labelSize)||7},[a.label?.({index:l,value:t.value})??t.value]))]),IC("path",{ref:r,d:m(e.fill),fill:e.fill?`url(#${n.value})`:"none",stroke:e.fill?"none":`url(#${n.value})`},null),e.fill&&IC("path",{d:m(!1),fill:"none",stroke:e.color??e.gradient?.[0]},null)])})}}),{mergeProps:AC,createVNode:NC}=await e("vue"),{computed:TC}=await e("vue"),EC=t({type:{type:String,default:"trend"},...gC(),...BC()},"VSparkline"),DC=o()({name:"VSparkline",props:EC(),setup(e,t){let{slots:a}=t;const{textColorClasses:l,textColorStyles:n}=ha(()=>e.color),o=TC(()=>Boolean(e.showLabels||e.labels.length>0||!!a?.label)),i=TC(()=>{let t=parseInt(e.height,10);return o.value&&(t+=1.5*parseInt(e.labelSize,10)),t});wt(()=>{const t="trend"===e.type?PC:hC,o="trend"===e.type?PC.filterProps(e):hC.filterProps(e);return NC(t,AC({key:e.type,class:l.value,style:n.value,viewBox:`0 0 ${e.width} ${parseInt(i.value,10)}`},o),a)})}}),{createVNode:RC,mergeProps:$C}=await e("vue"),{computed:LC,ref:FC}=await e("vue"),MC=t({...qe(),...fd({offset:8,minWidth:0,openDelay:0,closeDelay:100,location:"top center",transition:"scale-transition"})},"VSpeedDial"),OC=o()({name:"VSpeedDial",props:MC(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),n=FC(),o=LC(()=>{const[t,a="center"]=e.location?.split(" ")??[];return`${t} ${a}`}),i=LC(()=>({[`v-speed-dial__content--${o.value.replace(" ","-")}`]:!0}));return wt(()=>{const t=md.filterProps(e);return RC(md,$C(t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,class:e.class,style:e.style,contentClass:["v-speed-dial__content",i.value,e.contentClass],location:o.value,ref:n,transition:"fade-transition"}),{...a,default:t=>RC(ra,{defaults:{VBtn:{size:"small"}}},{default:()=>[RC(Ba,{appear:!0,group:!0,transition:e.transition},{default:()=>[a.default?.(t)]})]})})}),{}}}),zC=Symbol.for("vuetify:v-stepper"),{createVNode:jC}=await e("vue"),HC=t({color:String,disabled:{type:[Boolean,String],default:!1},prevText:{type:String,default:"$vuetify.stepper.prev"},nextText:{type:String,default:"$vuetify.stepper.next"}},"VStepperActions"),WC=o()({name:"VStepperActions",props:HC(),emits:{"click:prev":()=>!0,"click:next":()=>!0},setup(e,t){let{emit:a,slots:l}=t;const{t:n}=M();function o(){a("click:prev")}function i(){a("click:next")}return wt(()=>{const t={onClick:o},a={onClick:i};return jC("div",{class:"v-stepper-actions"},[jC(ra,{defaults:{VBtn:{disabled:["prev",!0].includes(e.disabled),text:n(e.prevText),variant:"text"}}},{default:()=>[l.prev?.({props:t})??jC(To,t,null)]}),jC(ra,{defaults:{VBtn:{color:e.color,disabled:["next",!0].includes(e.disabled),text:n(e.nextText),variant:"tonal"}}},{default:()=>[l.next?.({props:a})??jC(To,a,null)]})])}),{}}}),UC=vt("v-stepper-header"),{createVNode:GC,resolveDirective:YC,withDirectives:qC}=await e("vue"),{computed:KC}=await e("vue"),XC=t({color:String,title:String,subtitle:String,complete:Boolean,completeIcon:{type:E,default:"$complete"},editable:Boolean,editIcon:{type:E,default:"$edit"},error:Boolean,errorIcon:{type:E,default:"$error"},icon:E,ripple:{type:[Boolean,Object],default:!0},rules:{type:Array,default:()=>[]}},"StepperItem"),JC=t({...XC(),...an()},"VStepperItem"),QC=o()({name:"VStepperItem",directives:{Ripple:Vo},props:JC(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=ln(e,zC,!0),n=KC(()=>l?.value.value??e.value),o=KC(()=>e.rules.every(e=>!0===e())),i=KC(()=>!e.disabled&&e.editable),r=KC(()=>!e.disabled&&e.editable),s=KC(()=>e.error||!o.value),u=KC(()=>e.complete||e.rules.length>0&&o.value),c=KC(()=>s.value?e.errorIcon:u.value?e.completeIcon:l.isSelected.value&&e.editable?e.editIcon:e.icon),d=KC(()=>({canEdit:r.value,hasError:s.value,hasCompleted:u.value,title:e.title,subtitle:e.subtitle,step:n.value,value:e.value}));return wt(()=>{const t=(!l||l.isSelected.value||u.value||r.value)&&!s.value&&!e.disabled,o=!(null==e.title&&!a.title),v=!(null==e.subtitle&&!a.subtitle);return qC(GC("button",{class:["v-stepper-item",{"v-stepper-item--complete":u.value,"v-stepper-item--disabled":e.disabled,"v-stepper-item--error":s.value},l?.selectedClass.value],disabled:!e.editable,type:"button",onClick:function(){l?.toggle()}},[i.value&&Ll(!0,"v-stepper-item"),GC(Ko,{key:"stepper-avatar",class:"v-stepper-item__avatar",color:t?e.color:void 0,size:24},{default:()=>[a.icon?.(d.value)??(c.value?GC(bn,{icon:c.value},null):n.value)]}),GC("div",{class:"v-stepper-item__content"},[o&&GC("div",{key:"title",class:"v-stepper-item__title"},[a.title?.(d.value)??e.title]),v&&GC("div",{key:"subtitle",class:"v-stepper-item__subtitle"},[a.subtitle?.(d.value)??e.subtitle]),a.default?.(d.value)])]),[[YC("ripple"),e.ripple&&e.editable,null]])}),{}}}),{mergeProps:ZC,createVNode:e_}=await e("vue"),{computed:t_,inject:a_}=await e("vue"),l_=t({...H(Nf(),["continuous","nextIcon","prevIcon","showArrows","touch","mandatory"])},"VStepperWindow"),n_=o()({name:"VStepperWindow",props:l_(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=a_(zC,null),n=V(e,"modelValue"),o=t_({get:()=>null==n.value&&l?l.items.value.find(e=>l.selected.value.includes(e.id))?.value:n.value,set(e){n.value=e}});return wt(()=>{const t=Tf.filterProps(e);return e_(Tf,ZC({_as:"VStepperWindow"},t,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-stepper-window",e.class],style:e.style,mandatory:!1,touch:!1}),a)}),{}}}),{mergeProps:o_,createVNode:i_}=await e("vue"),r_=t({...qf()},"VStepperWindowItem"),s_=o()({name:"VStepperWindowItem",props:r_(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=Kf.filterProps(e);return i_(Kf,o_({_as:"VStepperWindowItem"},t,{class:["v-stepper-window-item",e.class],style:e.style}),a)}),{}}}),{Fragment:u_,createVNode:c_,mergeProps:d_}=await e("vue"),{computed:v_,toRefs:p_}=await e("vue"),f_=t({altLabels:Boolean,bgColor:String,completeIcon:E,editIcon:E,editable:Boolean,errorIcon:E,hideActions:Boolean,items:{type:Array,default:()=>[]},itemTitle:{type:String,default:"title"},itemValue:{type:String,default:"value"},nonLinear:Boolean,flat:Boolean,...q()},"Stepper"),m_=t({...f_(),...tn({mandatory:"force",selectedClass:"v-stepper-item--selected"}),...og(),...U(HC(),["prevText","nextText"])},"VStepper"),g_=o()({name:"VStepper",props:m_(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{items:l,next:n,prev:o,selected:i}=nn(e,zC),{displayClasses:r,mobile:s}=G(e),{completeIcon:u,editIcon:c,errorIcon:d,color:p,editable:f,prevText:m,nextText:g}=p_(e),h=v_(()=>e.items.map((t,a)=>({title:ee(t,e.itemTitle,t),value:ee(t,e.itemValue,a+1),raw:t}))),y=v_(()=>l.value.findIndex(e=>i.value.includes(e.id))),b=v_(()=>e.disabled?e.disabled:0===y.value?"prev":y.value===l.value.length-1&&"next");return v({VStepperItem:{editable:f,errorIcon:d,completeIcon:u,editIcon:c,prevText:m,nextText:g},VStepperActions:{color:p,disabled:b,prevText:m,nextText:g}}),wt(()=>{const t=ig.filterProps(e),l=!(!a.header&&!e.items.length),i=e.items.length>0,u=!(e.hideActions||!i&&!a.actions);return c_(ig,d_(t,{color:e.bgColor,class:["v-stepper",{"v-stepper--alt-labels":e.altLabels,"v-stepper--flat":e.flat,"v-stepper--non-linear":e.nonLinear,"v-stepper--mobile":s.value},r.value,e.class],style:e.style}),{default:()=>[l&&c_(UC,{key:"stepper-header"},{default:()=>[h.value.map((e,t)=>{let{raw:l,...n}=e;return c_(u_,null,[!!t&&c_(Js,null,null),c_(QC,n,{default:a[`header-item.${n.value}`]??a.header,icon:a.icon,title:a.title,subtitle:a.subtitle})])})]}),i&&c_(n_,{key:"stepper-window"},{default:()=>[h.value.map(e=>c_(s_,{value:e.value},{default:()=>a[`item.${e.value}`]?.(e)??a.item?.(e)}))]}),a.default?.({prev:o,next:n}),u&&(a.actions?.({next:n,prev:o})??c_(WC,{key:"stepper-actions","onClick:prev":o,"onClick:next":n},a))]})}),{prev:o,next:n}}}),{createVNode:h_,Fragment:y_,mergeProps:b_}=await e("vue"),{ref:w_,toRef:S_,useId:k_}=await e("vue"),x_=t({indeterminate:Boolean,inset:Boolean,flat:Boolean,loading:{type:[Boolean,String],default:!1},...ur(),...wi()},"VSwitch"),V_=o()({name:"VSwitch",inheritAttrs:!1,props:x_(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,"update:indeterminate":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=V(e,"indeterminate"),o=V(e,"modelValue"),{loaderClasses:i}=Hn(e),{isFocused:r,focus:s,blur:u}=Ri(e),c=w_(),d=$&&window.matchMedia("(forced-colors: active)").matches,v=S_(()=>"string"==typeof e.loading&&""!==e.loading?e.loading:e.color),p=k_(),f=S_(()=>e.id||`switch-${p}`);function m(){n.value&&(n.value=!1)}function g(e){e.stopPropagation(),e.preventDefault(),c.value?.input?.click()}return wt(()=>{const[t,p]=z(a),h=cr.filterProps(e),y=Si.filterProps(e);return h_(cr,b_({class:["v-switch",{"v-switch--flat":e.flat},{"v-switch--inset":e.inset},{"v-switch--indeterminate":n.value},i.value,e.class]},t,h,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,id:f.value,focused:r.value,style:e.style}),{...l,default:t=>{let{id:a,messagesId:i,isDisabled:r,isReadonly:f,isValid:h}=t;const b={model:o,isValid:h};return h_(Si,b_({ref:c},y,{modelValue:o.value,"onUpdate:modelValue":[e=>o.value=e,m],id:a.value,"aria-describedby":i.value,type:"checkbox","aria-checked":n.value?"mixed":void 0,disabled:r.value,readonly:f.value,onFocus:s,onBlur:u},p),{...l,default:e=>{let{backgroundColorClasses:t,backgroundColorStyles:a}=e;return h_("div",{class:["v-switch__track",d?void 0:t.value],style:a.value,onClick:g},[l["track-true"]&&h_("div",{key:"prepend",class:"v-switch__track-true"},[l["track-true"](b)]),l["track-false"]&&h_("div",{key:"append",class:"v-switch__track-false"},[l["track-false"](b)])])},input:t=>{let{inputNode:a,icon:n,backgroundColorClasses:o,backgroundColorStyles:i}=t;return h_(y_,null,[a,h_("div",{class:["v-switch__thumb",{"v-switch__thumb--filled":n||e.loading},e.inset||d?void 0:o.value],style:e.inset?void 0:i.value},[l.thumb?h_(ra,{defaults:{VIcon:{icon:n,size:"x-small"}}},{default:()=>[l.thumb({...b,icon:n})]}):h_(qt,null,{default:()=>[e.loading?h_(Wn,{name:"v-switch",active:!0,color:!1===h.value?void 0:v.value},{default:e=>l.loader?l.loader(e):h_(An,{active:e.isActive,color:e.color,indeterminate:!0,size:"16",width:"2"},null)}):n&&h_(bn,{key:String(n),icon:n,size:"x-small"},null)]})])])}})}})}),{}}}),{createVNode:C_}=await e("vue"),{computed:__,shallowRef:I_,toRef:B_}=await e("vue"),P_=t({color:String,height:[Number,String],window:Boolean,...qe(),...Za(),...I(),...Sa(),...Vt(),...c()},"VSystemBar"),A_=o()({name:"VSystemBar",props:P_(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{elevationClasses:i}=el(e),{roundedClasses:s}=ka(e),{ssrBootStyles:u}=yl(),c=__(()=>e.height??(e.window?32:24)),{layoutItemStyles:d}=_({id:e.name,order:__(()=>parseInt(e.order,10)),position:I_("top"),layoutSize:c,elementSize:c,active:__(()=>!0),absolute:B_(()=>e.absolute)});return wt(()=>C_(e.tag,{class:["v-system-bar",{"v-system-bar--window":e.window},l.value,n.value,i.value,s.value,e.class],style:[o.value,d.value,u.value,e.style]},a)),{}}}),N_=Symbol.for("vuetify:v-tabs"),{Fragment:T_,createVNode:E_,mergeProps:D_}=await e("vue"),{computed:R_,ref:$_}=await e("vue"),L_=t({fixed:Boolean,sliderColor:String,hideSlider:Boolean,direction:{type:String,default:"horizontal"},...H(No({selectedClass:"v-tab--selected",variant:"text"}),["active","block","flat","location","position","symbol"])},"VTab"),F_=o()({name:"VTab",props:L_(),setup(e,t){let{slots:a,attrs:l}=t;const{textColorClasses:n,textColorStyles:o}=ha(()=>e.sliderColor),i=$_(),r=$_(),s=R_(()=>"horizontal"===e.direction),u=R_(()=>i.value?.group?.isSelected.value??!1);function c(e){let{value:t}=e;if(t){const e=i.value?.$el.parentElement?.querySelector(".v-tab--selected .v-tab__slider"),t=r.value;if(!e||!t)return;const a=getComputedStyle(e).color,l=e.getBoundingClientRect(),n=t.getBoundingClientRect(),o=s.value?"x":"y",u=s.value?"X":"Y",c=s.value?"right":"bottom",d=s.value?"width":"height",v=l[o]>n[o]?l[c]-n[c]:l[o]-n[o],p=Math.sign(v)>0?s.value?"right":"bottom":Math.sign(v)<0?s.value?"left":"top":"center",f=(Math.abs(v)+(Math.sign(v)<0?l[d]:n[d]))/Math.max(l[d],n[d])||0,m=1.5;rt(t,{backgroundColor:[a,"currentcolor"],transform:[`translate${u}(${v}px) scale${u}(${l[d]/n[d]||0})`,`translate${u}(${v/m}px) scale${u}(${(f-1)/m+1})`,"none"],transformOrigin:Array(3).fill(p)},{duration:225,easing:ft})}}return wt(()=>{const t=To.filterProps(e);return E_(To,D_({symbol:N_,ref:i,class:["v-tab",e.class],style:e.style,tabindex:u.value?0:-1,role:"tab","aria-selected":String(u.value),active:!1},t,l,{block:e.fixed,maxWidth:e.fixed?300:void 0,"onGroup:selected":c}),{...a,default:()=>E_(T_,null,[a.default?.()??e.text,!e.hideSlider&&E_("div",{ref:r,class:["v-tab__slider",n.value],style:o.value},null)])})}),Zc({},i)}}),{mergeProps:M_,createVNode:O_}=await e("vue"),{computed:z_,inject:j_}=await e("vue"),H_=t({...H(Nf(),["continuous","nextIcon","prevIcon","showArrows","touch","mandatory"])},"VTabsWindow"),W_=o()({name:"VTabsWindow",props:H_(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=j_(N_,null),n=V(e,"modelValue"),o=z_({get:()=>null==n.value&&l?l.items.value.find(e=>l.selected.value.includes(e.id))?.value:n.value,set(e){n.value=e}});return wt(()=>{const t=Tf.filterProps(e);return O_(Tf,M_({_as:"VTabsWindow"},t,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-tabs-window",e.class],style:e.style,mandatory:!1,touch:!1}),a)}),{}}}),{mergeProps:U_,createVNode:G_}=await e("vue"),Y_=t({...qf()},"VTabsWindowItem"),q_=o()({name:"VTabsWindowItem",props:Y_(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=Kf.filterProps(e);return G_(Kf,U_({_as:"VTabsWindowItem"},t,{class:["v-tabs-window-item",e.class],style:e.style}),a)}),{}}}),{Fragment:K_,mergeProps:X_,createVNode:J_}=await e("vue"),{computed:Q_,toRef:Z_}=await e("vue");const eI=t({alignTabs:{type:String,default:"start"},color:String,fixedTabs:Boolean,items:{type:Array,default:()=>[]},stacked:Boolean,bgColor:String,grow:Boolean,height:{type:[Number,String],default:void 0},hideSlider:Boolean,sliderColor:String,...Cr({mandatory:"force",selectedClass:"v-tab-item--selected"}),...Al(),...Vt()},"VTabs"),tI=o()({name:"VTabs",props:eI(),emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=V(e,"modelValue"),o=Q_(()=>function(e){return e?e.map(e=>w(e)?e:{text:e,value:e}):[]}(e.items)),{densityClasses:i}=Nl(e),{backgroundColorClasses:r,backgroundColorStyles:s}=ya(()=>e.bgColor),{scopeId:u}=mc();return v({VTab:{color:Z_(()=>e.color),direction:Z_(()=>e.direction),stacked:Z_(()=>e.stacked),fixed:Z_(()=>e.fixedTabs),sliderColor:Z_(()=>e.sliderColor),hideSlider:Z_(()=>e.hideSlider)}}),wt(()=>{const t=_r.filterProps(e),c=!!(l.window||e.items.length>0);return J_(K_,null,[J_(_r,X_(t,{modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,class:["v-tabs",`v-tabs--${e.direction}`,`v-tabs--align-tabs-${e.alignTabs}`,{"v-tabs--fixed-tabs":e.fixedTabs,"v-tabs--grow":e.grow,"v-tabs--stacked":e.stacked},i.value,r.value,e.class],style:[{"--v-tabs-height":p(e.height)},s.value,e.style],role:"tablist",symbol:N_},u,a),{default:()=>[l.default?.()??o.value.map(e=>l.tab?.({item:e})??J_(F_,X_(e,{key:e.text,value:e.value}),{default:l[`tab.${e.value}`]?()=>l[`tab.${e.value}`]?.({item:e}):void 0}))]}),c&&J_(W_,X_({modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,key:"tabs-window"},u),{default:()=>[o.value.map(e=>l.item?.({item:e})??J_(q_,{value:e.value},{default:()=>l[`item.${e.value}`]?.({item:e})})),l.window?.()]})])}),{}}}),{Fragment:aI,createVNode:lI,resolveDirective:nI,mergeProps:oI,withDirectives:iI,vModelText:rI}=await e("vue"),{computed:sI,nextTick:uI,onBeforeUnmount:cI,onMounted:dI,ref:vI,shallowRef:pI,watch:fI,watchEffect:mI}=await e("vue"),gI=t({autoGrow:Boolean,autofocus:Boolean,counter:[Boolean,Number,String],counterValue:Function,prefix:String,placeholder:String,persistentPlaceholder:Boolean,persistentCounter:Boolean,noResize:Boolean,rows:{type:[Number,String],default:5,validator:e=>!isNaN(parseFloat(e))},maxRows:{type:[Number,String],validator:e=>!isNaN(parseFloat(e))},suffix:String,modelModifiers:Object,...ur(),...$d()},"VTextarea"),hI=o()({name:"VTextarea",directives:{Intersect:Aa},inheritAttrs:!1,props:gI(),emits:{"click:control":e=>!0,"mousedown:control":e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const o=V(e,"modelValue"),{isFocused:i,focus:r,blur:s}=Ri(e),u=sI(()=>"function"==typeof e.counterValue?e.counterValue(o.value):(o.value||"").toString().length),c=sI(()=>a.maxlength?a.maxlength:!e.counter||"number"!=typeof e.counter&&"string"!=typeof e.counter?void 0:e.counter);function d(t,a){e.autofocus&&t&&a[0].target?.focus?.()}const v=vI(),f=vI(),m=pI(""),g=vI(),h=sI(()=>e.persistentPlaceholder||i.value||e.active);function y(){g.value!==document.activeElement&&g.value?.focus(),i.value||r()}function b(e){y(),l("click:control",e)}function w(e){l("mousedown:control",e)}function S(t){t.stopPropagation(),y(),uI(()=>{o.value="",W(e["onClick:clear"],t)})}function x(t){const a=t.target;if(o.value=a.value,e.modelModifiers?.trim){const e=[a.selectionStart,a.selectionEnd];uI(()=>{a.selectionStart=e[0],a.selectionEnd=e[1]})}}const C=vI(),_=vI(Number(e.rows)),I=sI(()=>["plain","underlined"].includes(e.variant));function B(){e.autoGrow&&uI(()=>{if(!C.value||!f.value)return;const t=getComputedStyle(C.value),a=getComputedStyle(f.value.$el),l=parseFloat(t.getPropertyValue("--v-field-padding-top"))+parseFloat(t.getPropertyValue("--v-input-padding-top"))+parseFloat(t.getPropertyValue("--v-field-padding-bottom")),n=C.value.scrollHeight,o=parseFloat(t.lineHeight),i=Math.max(parseFloat(e.rows)*o+l,parseFloat(a.getPropertyValue("--v-input-control-height"))),r=parseFloat(e.maxRows)*o+l||1/0,s=k(n??0,i,r);_.value=Math.floor((s-l)/o),m.value=p(s)})}let P;return mI(()=>{e.autoGrow||(_.value=Number(e.rows))}),dI(B),fI(o,B),fI(()=>e.rows,B),fI(()=>e.maxRows,B),fI(()=>e.density,B),fI(C,e=>{e?(P=new ResizeObserver(B),P.observe(C.value)):P?.disconnect()}),cI(()=>{P?.disconnect()}),wt(()=>{const t=!!(n.counter||e.counter||e.counterValue),l=!(!t&&!n.details),[r,p]=z(a),{modelValue:k,...V}=cr.filterProps(e),B=Ld.filterProps(e);return lI(cr,oI({ref:v,modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-textarea v-text-field",{"v-textarea--prefixed":e.prefix,"v-textarea--suffixed":e.suffix,"v-text-field--prefixed":e.prefix,"v-text-field--suffixed":e.suffix,"v-textarea--auto-grow":e.autoGrow,"v-textarea--no-resize":e.noResize||e.autoGrow,"v-input--plain-underlined":I.value},e.class],style:e.style},r,V,{centerAffix:1===_.value&&!I.value,focused:i.value}),{...n,default:t=>{let{id:a,isDisabled:l,isDirty:r,isReadonly:u,isValid:c}=t;return lI(Ld,oI({ref:f,style:{"--v-textarea-control-height":m.value},onClick:b,onMousedown:w,"onClick:clear":S,"onClick:prependInner":e["onClick:prependInner"],"onClick:appendInner":e["onClick:appendInner"]},B,{id:a.value,active:h.value||r.value,centerAffix:1===_.value&&!I.value,dirty:r.value||e.dirty,disabled:l.value,focused:i.value,error:!1===c.value}),{...n,default:t=>{let{props:{class:a,...n}}=t;return lI(aI,null,[e.prefix&&lI("span",{class:"v-text-field__prefix"},[e.prefix]),iI(lI("textarea",oI({ref:g,class:a,value:o.value,onInput:x,autofocus:e.autofocus,readonly:u.value,disabled:l.value,placeholder:e.placeholder,rows:e.rows,name:e.name,onFocus:y,onBlur:s},n,p),null),[[nI("intersect"),{handler:d},null,{once:!0}]]),e.autoGrow&&iI(lI("textarea",{class:[a,"v-textarea__sizer"],id:`${n.id}-sizer`,"onUpdate:modelValue":e=>o.value=e,ref:C,readonly:!0,"aria-hidden":"true"},null),[[rI,o.value]]),e.suffix&&lI("span",{class:"v-text-field__suffix"},[e.suffix])])}})},details:l?a=>lI(aI,null,[n.details?.(a),t&&lI(aI,null,[lI("span",null,null),lI(Sd,{active:e.persistentCounter||i.value,value:u.value,max:c.value,disabled:e.disabled},n.counter)])]):void 0})}),Zc({},v,f,g)}}),{createVNode:yI}=await e("vue"),bI=t({withBackground:Boolean,...qe(),...c(),...Vt()},"VThemeProvider"),wI=o()({name:"VThemeProvider",props:bI(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e);return()=>e.withBackground?yI(e.tag,{class:["v-theme-provider",l.value,e.class],style:e.style},{default:()=>[a.default?.()]}):a.default?.()}}),{createVNode:SI}=await e("vue"),kI=t({dotColor:String,fillDot:Boolean,hideDot:Boolean,icon:E,iconColor:String,lineColor:String,...qe(),...Sa(),...pn(),...Za()},"VTimelineDivider"),xI=o()({name:"VTimelineDivider",props:kI(),setup(e,t){let{slots:a}=t;const{sizeClasses:l,sizeStyles:n}=fn(e,"v-timeline-divider__dot"),{backgroundColorStyles:o,backgroundColorClasses:i}=ya(()=>e.dotColor),{roundedClasses:r}=ka(e,"v-timeline-divider__dot"),{elevationClasses:s}=el(e),{backgroundColorClasses:u,backgroundColorStyles:c}=ya(()=>e.lineColor);return wt(()=>SI("div",{class:["v-timeline-divider",{"v-timeline-divider--fill-dot":e.fillDot},e.class],style:e.style},[SI("div",{class:["v-timeline-divider__before",u.value],style:c.value},null),!e.hideDot&&SI("div",{key:"dot",class:["v-timeline-divider__dot",s.value,r.value,l.value],style:n.value},[SI("div",{class:["v-timeline-divider__inner-dot",i.value,r.value],style:o.value},[a.default?SI(ra,{key:"icon-defaults",disabled:!e.icon,defaults:{VIcon:{color:e.iconColor,icon:e.icon,size:e.size}}},a.default):SI(bn,{key:"icon",color:e.iconColor,icon:e.icon,size:e.size},null)])]),SI("div",{class:["v-timeline-divider__after",u.value],style:c.value},null)])),{}}}),{createVNode:VI}=await e("vue"),{ref:CI,shallowRef:_I,watch:II}=await e("vue"),BI=t({density:String,dotColor:String,fillDot:Boolean,hideDot:Boolean,hideOpposite:{type:Boolean,default:void 0},icon:E,iconColor:String,lineInset:[Number,String],side:{type:String,validator:e=>null==e||["start","end"].includes(e)},...qe(),...ua(),...Za(),...Sa(),...pn(),...Vt()},"VTimelineItem"),PI=o()({name:"VTimelineItem",props:BI(),setup(e,t){let{slots:a}=t;const{dimensionStyles:l}=ca(e),n=_I(0),o=CI();return II(o,e=>{e&&(n.value=e.$el.querySelector(".v-timeline-divider__dot")?.getBoundingClientRect().width??0)},{flush:"post"}),wt(()=>VI("div",{class:["v-timeline-item",{"v-timeline-item--fill-dot":e.fillDot,"v-timeline-item--side-start":"start"===e.side,"v-timeline-item--side-end":"end"===e.side},e.class],style:[{"--v-timeline-dot-size":p(n.value),"--v-timeline-line-inset":e.lineInset?`calc(var(--v-timeline-dot-size) / 2 + ${p(e.lineInset)})`:p(0)},e.style]},[VI("div",{class:"v-timeline-item__body",style:l.value},[a.default?.()]),VI(xI,{ref:o,hideDot:e.hideDot,icon:e.icon,iconColor:e.iconColor,size:e.size,elevation:e.elevation,dotColor:e.dotColor,fillDot:e.fillDot,rounded:e.rounded},{default:a.icon}),"compact"!==e.density&&VI("div",{class:"v-timeline-item__opposite"},[!e.hideOpposite&&a.opposite?.()])])),{}}}),{createVNode:AI}=await e("vue"),{computed:NI,toRef:TI}=await e("vue"),EI=t({align:{type:String,default:"center",validator:e=>["center","start"].includes(e)},direction:{type:String,default:"vertical",validator:e=>["vertical","horizontal"].includes(e)},justify:{type:String,default:"auto",validator:e=>["auto","center"].includes(e)},side:{type:String,validator:e=>null==e||["start","end"].includes(e)},lineThickness:{type:[String,Number],default:2},lineColor:String,truncateLine:{type:String,validator:e=>["start","end","both"].includes(e)},...U(BI({lineInset:0}),["dotColor","fillDot","hideOpposite","iconColor","lineInset","size"]),...qe(),...Al(),...Vt(),...c()},"VTimeline"),DI=o()({name:"VTimeline",props:EI(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{densityClasses:n}=Nl(e),{rtlClasses:o}=u();v({VTimelineDivider:{lineColor:TI(()=>e.lineColor)},VTimelineItem:{density:TI(()=>e.density),dotColor:TI(()=>e.dotColor),fillDot:TI(()=>e.fillDot),hideOpposite:TI(()=>e.hideOpposite),iconColor:TI(()=>e.iconColor),lineColor:TI(()=>e.lineColor),lineInset:TI(()=>e.lineInset),size:TI(()=>e.size)}});const i=NI(()=>{const t=e.side?e.side:"default"!==e.density?"end":null;return t&&`v-timeline--side-${t}`}),s=NI(()=>{const t=["v-timeline--truncate-line-start","v-timeline--truncate-line-end"];switch(e.truncateLine){case"both":return t;case"start":return t[0];case"end":return t[1];default:return null}});return wt(()=>AI(e.tag,{class:["v-timeline",`v-timeline--${e.direction}`,`v-timeline--align-${e.align}`,`v-timeline--justify-${e.justify}`,s.value,{"v-timeline--inset-line":!!e.lineInset},l.value,n.value,i.value,o.value,e.class],style:[{"--v-timeline-line-thickness":p(e.lineThickness)},e.style]},a)),{}}}),{createVNode:RI}=await e("vue"),{toRef:$I}=await e("vue"),LI=t({...qe(),...Fl({variant:"text"})},"VToolbarItems"),FI=o()({name:"VToolbarItems",props:LI(),setup(e,t){let{slots:a}=t;return v({VBtn:{color:$I(()=>e.color),height:"inherit",variant:$I(()=>e.variant)}}),wt(()=>RI("div",{class:["v-toolbar-items",e.class],style:e.style},[a.default?.()])),{}}}),{mergeProps:MI,createVNode:OI}=await e("vue"),{computed:zI,mergeProps:jI,ref:HI,toRef:WI,useId:UI}=await e("vue"),GI=t({id:String,interactive:Boolean,text:String,...H(Kc({closeOnBack:!1,location:"end",locationStrategy:"connected",eager:!0,minWidth:0,offset:10,openOnClick:!1,openOnHover:!0,origin:"auto",scrim:!1,scrollStrategy:"reposition",transition:null}),["absolute","persistent"])},"VTooltip"),YI=o()({name:"VTooltip",props:GI(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{scopeId:n}=mc(),o=UI(),i=WI(()=>e.id||`v-tooltip-${o}`),r=HI(),s=zI(()=>e.location.split(" ").length>1?e.location:e.location+" center"),u=zI(()=>"auto"===e.origin||"overlap"===e.origin||e.origin.split(" ").length>1||e.location.split(" ").length>1?e.origin:e.origin+" center"),c=WI(()=>null!=e.transition?e.transition:l.value?"scale-transition":"fade-transition"),d=zI(()=>jI({"aria-describedby":i.value},e.activatorProps));return wt(()=>{const t=Xc.filterProps(e);return OI(Xc,MI({ref:r,class:["v-tooltip",{"v-tooltip--interactive":e.interactive},e.class],style:e.style,id:i.value},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,transition:c.value,absolute:!0,location:s.value,origin:u.value,persistent:!0,role:"tooltip",activatorProps:d.value,_disableGlobalStack:!0},n),{activator:a.activator,default:function(){for(var t=arguments.length,l=new Array(t),n=0;n<t;n++)l[n]=arguments[n];return a.default?.(...l)??e.text}})}),Zc({},r)}}),qI=o()({name:"VValidation",props:lr(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=nr(e,"validation");return()=>a.default?.(l)}}),KI=Object.freeze(Object.defineProperty({__proto__:null,VAlert:Go,VAlertTitle:Oo,VApp:xt,VAppBar:Il,VAppBarNavIcon:$o,VAppBarTitle:Mo,VAutocomplete:lp,VAvatar:Ko,VBadge:up,VBanner:hp,VBannerActions:vp,VBannerText:pp,VBottomNavigation:kp,VBottomSheet:Rp,VBreadcrumbs:Xp,VBreadcrumbsDivider:Fp,VBreadcrumbsItem:Hp,VBtn:To,VBtnGroup:Hl,VBtnToggle:dn,VCard:hf,VCardActions:Qp,VCardItem:sf,VCardSubtitle:tf,VCardText:df,VCardTitle:af,VCarousel:Of,VCarouselItem:Zf,VCheckbox:mr,VCheckboxBtn:_i,VChip:Hr,VChipGroup:Tr,VClassIcon:Me,VCode:em,VCol:Gb,VColorPicker:yg,VCombobox:Ng,VComponentIcon:Oe,VConfirmEdit:Og,VContainer:Rb,VCounter:Sd,VDataIterator:Yh,VDataTable:mb,VDataTableFooter:sy,VDataTableHeaders:Dy,VDataTableRow:Gy,VDataTableRows:Zy,VDataTableServer:Tb,VDataTableVirtual:xb,VDatePicker:tS,VDatePickerControls:hw,VDatePickerHeader:ww,VDatePickerMonth:Nw,VDatePickerMonths:Lw,VDatePickerYears:Uw,VDefaultsProvider:ra,VDialog:Np,VDialogBottomTransition:Ut,VDialogTopTransition:Gt,VDialogTransition:zt,VDivider:Js,VEmptyState:oS,VExpandTransition:la,VExpandXTransition:na,VExpansionPanel:_S,VExpansionPanelText:vS,VExpansionPanelTitle:wS,VExpansionPanels:NS,VFab:jS,VFabTransition:Wt,VFadeTransition:Yt,VField:Ld,VFieldLabel:Vd,VFileInput:ZS,VFooter:rk,VForm:dk,VHover:pk,VIcon:bn,VImg:Ya,VInfiniteScroll:Vk,VInput:cr,VItem:Pk,VItemGroup:Bk,VKbd:Ak,VLabel:Qo,VLayout:Ek,VLayoutItem:Fk,VLazy:Hk,VLigatureIcon:ze,VList:hu,VListGroup:Bs,VListImg:yu,VListItem:Ws,VListItemAction:Su,VListItemMedia:Vu,VListItemSubtitle:Ns,VListItemTitle:Ts,VListSubheader:Ys,VLocaleProvider:Gk,VMain:Kk,VMenu:md,VMessages:Ti,VNavigationDrawer:Vx,VNoSsr:Cx,VNumberInput:Mx,VOtpInput:Kx,VOverlay:Xc,VPagination:ly,VParallax:lV,VProgressCircular:An,VProgressLinear:Mn,VRadio:rV,VRadioGroup:fV,VRangeSlider:SV,VRating:AV,VResponsive:fa,VRow:vw,VScaleTransition:qt,VScrollXReverseTransition:Xt,VScrollXTransition:Kt,VScrollYReverseTransition:Qt,VScrollYTransition:Jt,VSelect:Dv,VSelectionControl:Si,VSelectionControlGroup:ri,VSheet:ig,VSkeletonLoader:OV,VSlideGroup:_r,VSlideGroupItem:zV,VSlideXReverseTransition:ea,VSlideXTransition:Zt,VSlideYReverseTransition:aa,VSlideYTransition:ta,VSlider:Km,VSnackbar:tC,VSnackbarQueue:cC,VSpacer:pw,VSparkline:DC,VSpeedDial:OC,VStepper:g_,VStepperActions:WC,VStepperHeader:UC,VStepperItem:QC,VStepperWindow:n_,VStepperWindowItem:s_,VSvgIcon:je,VSwitch:V_,VSystemBar:A_,VTab:F_,VTable:ab,VTabs:tI,VTabsWindow:W_,VTabsWindowItem:q_,VTextField:Kd,VTextarea:hI,VThemeProvider:wI,VTimeline:DI,VTimelineItem:PI,VToolbar:il,VToolbarItems:FI,VToolbarTitle:It,VTooltip:YI,VValidation:qI,VVirtualScroll:hv,VWindow:Tf,VWindowItem:Kf},Symbol.toStringTag,{value:"Module"}));function XI(e,t){e._mutate?.[t.instance.$.uid]&&(e._mutate[t.instance.$.uid].observer.disconnect(),delete e._mutate[t.instance.$.uid])}const JI={mounted:function(e,t){const a=t.modifiers||{},l=t.value,{once:n,immediate:o,...i}=a,r=!Object.keys(i).length,{handler:s,options:u}="object"==typeof l?l:{handler:l,options:{attributes:i?.attr??r,characterData:i?.char??r,childList:i?.child??r,subtree:i?.sub??r}},c=new MutationObserver(function(){let a=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],l=arguments.length>1?arguments[1]:void 0;s?.(a,l),n&&XI(e,t)});o&&s?.([],c),e._mutate=Object(e._mutate),e._mutate[t.instance.$.uid]={observer:c},c.observe(e,u)},unmounted:XI};const QI={mounted:function(e,t){const a=t.value,l={passive:!t.modifiers?.active};window.addEventListener("resize",a,l),e._onResize=Object(e._onResize),e._onResize[t.instance.$.uid]={handler:a,options:l},t.modifiers?.quiet||a()},unmounted:function(e,t){if(!e._onResize?.[t.instance.$.uid])return;const{handler:a,options:l}=e._onResize[t.instance.$.uid];window.removeEventListener("resize",a,l),delete e._onResize[t.instance.$.uid]}};function ZI(e,t){const{self:a=!1}=t.modifiers??{},l=t.value,n="object"==typeof l&&l.options||{passive:!0},o="function"==typeof l||"handleEvent"in l?l:l.handler,i=a?e:t.arg?document.querySelector(t.arg):window;i&&(i.addEventListener("scroll",o,n),e._onScroll=Object(e._onScroll),e._onScroll[t.instance.$.uid]={handler:o,options:n,target:a?void 0:i})}function eB(e,t){if(!e._onScroll?.[t.instance.$.uid])return;const{handler:a,options:l,target:n=e}=e._onScroll[t.instance.$.uid];n.removeEventListener("scroll",a,l),delete e._onScroll[t.instance.$.uid]}const tB={mounted:ZI,unmounted:eB,updated:function(e,t){t.value!==t.oldValue&&(eB(e,t),ZI(e,t))}},{h:aB,mergeProps:lB,render:nB,resolveComponent:oB}=await e("vue");const iB=function(e,t){const a=function(e,t){return function(a,l,n){const o="function"==typeof t?t(l):t,i=l.value?.text??l.value??o?.text,r=w(l.value)?l.value:{},s=()=>i??a.textContent,u=(n.ctx===l.instance.$?function(e,t){const a=new Set,l=t=>{for(const n of t){if(!n)continue;if(n===e||n.el&&e.el&&n.el===e.el)return!0;let t;if(a.add(n),n.suspense?t=l([n.ssContent]):Array.isArray(n.children)?t=l(n.children):n.component?.vnode&&(t=l([n.component?.subTree])),t)return t;a.delete(n)}return!1};if(!l([t.subTree]))return X("Could not find original vnode, component will not inherit provides"),t;const n=Array.from(a).reverse();for(const o of n)if(o.component)return o.component;return t}(n,l.instance.$)?.provides:n.ctx?.provides)??l.instance.$.provides,c=aB(e,lB(o,r),s);c.appContext=Object.assign(Object.create(null),l.instance.$.appContext,{provides:u}),nB(c,a)}}("string"==typeof e?oB(e):e,t);return{mounted:a,updated:a,unmounted(e){nB(null,e)}}}(YI,e=>({activator:"parent",location:e.arg?.replace("-"," "),text:"boolean"==typeof e.value?void 0:e.value})),rB=Object.freeze(Object.defineProperty({__proto__:null,ClickOutside:Dc,Intersect:Aa,Mutate:JI,Resize:QI,Ripple:Vo,Scroll:tB,Tooltip:iB,Touch:bf},Symbol.toStringTag,{value:"Module"})),{defineComponent:sB,ref:uB,shallowRef:cB,onMounted:dB,onBeforeUnmount:vB}=await e("vue"),pB=sB({name:"App",setup(){const e=cB(Ue),t=uB(null),a=a=>{a.data&&"api"===a.data.type&&(t.value=a.data.data,console.log("收到API:",t.value)),a.data&&"showConfig"===a.data.type&&(e.value=Ge)};return dB(()=>{window.addEventListener("message",a),window.parent&&window.parent.postMessage&&window.parent.postMessage({type:"ready"},"*")}),vB(()=>{window.removeEventListener("message",a)}),{currentComponent:e,api:t,switchComponent:()=>{e.value=e.value===Ue?Ge:Ue},closeModal:()=>{window.parent&&window.parent.postMessage&&window.parent.postMessage({type:"close"},"*")},saveConfig:t=>{window.parent&&window.parent.postMessage&&window.parent.postMessage({type:"save",data:t},"*"),e.value=Ue}}}}),{resolveDynamicComponent:fB,openBlock:mB,createBlock:gB,createElementVNode:hB,resolveComponent:yB,withCtx:bB}=await e("vue"),wB={class:"plugin-app"};const SB=Ye(pB,[["render",function(e,t,a,l,n,o){const i=yB("v-app");return mB(),gB(i,null,{default:bB(()=>[hB("div",wB,[(mB(),gB(fB(e.currentComponent),{api:e.api,onSwitch:e.switchComponent,onClose:e.closeModal,onSave:e.saveConfig},null,40,["api","onSwitch","onClose","onSave"]))])]),_:1})}]]),{createApp:kB}=await e("vue"),{createVuetify:xB}=await e("vuetify"),VB=xB({components:KI,directives:rB,icons:{defaultSet:"mdi",aliases:We,sets:{mdi:He}}}),CB=kB(SB);CB.use(VB),CB.mount("#app");
+import{importShared as e}from"./__federation_fn_import-B6DyUTOO.js";import{p as t,i as a,a as l,e as n,g as o,b as i,c as r,d as s,u,m as c,f as d,h as v,j as p,k as f,l as m,n as g,o as h,q as y,r as b,s as w,S,t as k,v as x,w as V,x as C,y as _,z as I,A as B,B as P,C as A,D as N,E as T,I as E,F as D,G as R,H as $,J as L,K as F,L as M,M as O,N as z,O as j,P as H,Q as W,R as U,T as G,U as Y,V as q,W as K,X,Y as J,Z as Q,_ as Z,$ as ee,a0 as te,a1 as ae,a2 as le,a3 as ne,a4 as oe,a5 as ie,a6 as re,a7 as se,a8 as ue,a9 as ce,aa as de,ab as ve,ac as pe,ad as fe,ae as me,af as ge,ag as he,ah as ye,ai as be,aj as we,ak as Se,al as ke,am as xe,an as Ve,ao as Ce,ap as _e,aq as Ie,ar as Be,as as Pe,at as Ae,au as Ne,av as Te,aw as Ee,ax as De,ay as Re,az as $e,aA as Le,aB as Fe,aC as Me,aD as Oe,aE as ze,aF as je,aG as He,aH as We}from"./date-CpfvPJBx.js";import Ue from"./__federation_expose_Page-v_n3LYYG.js";import Ge from"./__federation_expose_Config-aKEDjOk-.js";import{_ as Ye}from"./_plugin-vue_export-helper-BCo6x5W8.js";!function(){const e=document.createElement("link").relList;if(!(e&&e.supports&&e.supports("modulepreload"))){for(const e of document.querySelectorAll('link[rel="modulepreload"]'))t(e);new MutationObserver(e=>{for(const a of e)if("childList"===a.type)for(const e of a.addedNodes)"LINK"===e.tagName&&"modulepreload"===e.rel&&t(e)}).observe(document,{childList:!0,subtree:!0})}function t(e){if(e.ep)return;e.ep=!0;const t=function(e){const t={};return e.integrity&&(t.integrity=e.integrity),e.referrerPolicy&&(t.referrerPolicy=e.referrerPolicy),"use-credentials"===e.crossOrigin?t.credentials="include":"anonymous"===e.crossOrigin?t.credentials="omit":t.credentials="same-origin",t}(e);fetch(e.href,t)}}();const qe=t({class:[String,Array,Object],style:{type:[String,Array,Object],default:null}},"component"),Ke=["top","bottom"],Xe=["start","end","left","right"];function Je(e,t){let[l,n]=e.split(" ");return n||(n=a(Ke,l)?"start":a(Xe,l)?"top":"center"),{side:Qe(l,t),align:Qe(n,t)}}function Qe(e,t){return"start"===e?t?"right":"left":"end"===e?t?"left":"right":e}function Ze(e){return{side:{center:"center",top:"bottom",bottom:"top",left:"right",right:"left"}[e.side],align:e.align}}function et(e){return{side:e.side,align:{center:"center",top:"bottom",bottom:"top",left:"right",right:"left"}[e.align]}}function tt(e){return{side:e.align,align:e.side}}function at(e){return a(Ke,e.side)?"y":"x"}class lt{constructor(e){let{x:t,y:a,width:l,height:n}=e;this.x=t,this.y=a,this.width=l,this.height=n}get top(){return this.y}get bottom(){return this.y+this.height}get left(){return this.x}get right(){return this.x+this.width}}function nt(e,t){return{x:{before:Math.max(0,t.left-e.left),after:Math.max(0,e.right-t.right)},y:{before:Math.max(0,t.top-e.top),after:Math.max(0,e.bottom-t.bottom)}}}function ot(e){return Array.isArray(e)?new lt({x:e[0],y:e[1],width:0,height:0}):e.getBoundingClientRect()}function it(e){const t=e.getBoundingClientRect(),a=getComputedStyle(e),l=a.transform;if(l){let n,o,i,r,s;if(l.startsWith("matrix3d("))n=l.slice(9,-1).split(/, /),o=Number(n[0]),i=Number(n[5]),r=Number(n[12]),s=Number(n[13]);else{if(!l.startsWith("matrix("))return new lt(t);n=l.slice(7,-1).split(/, /),o=Number(n[0]),i=Number(n[3]),r=Number(n[4]),s=Number(n[5])}const u=a.transformOrigin,c=t.x-r-(1-o)*parseFloat(u),d=t.y-s-(1-i)*parseFloat(u.slice(u.indexOf(" ")+1)),v=o?t.width/o:e.offsetWidth+1,p=i?t.height/i:e.offsetHeight+1;return new lt({x:c,y:d,width:v,height:p})}return new lt(t)}function rt(e,t,a){if(void 0===e.animate)return{finished:Promise.resolve()};let l;try{l=e.animate(t,a)}catch(n){return{finished:Promise.resolve()}}return void 0===l.finished&&(l.finished=new Promise(e=>{l.onfinish=()=>{e(l)}})),l}const st=new WeakMap;const{camelize:ut,capitalize:ct,h:dt}=await e("vue");function vt(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"div",a=arguments.length>2?arguments[2]:void 0;return o()({name:a??ct(ut(e.replace(/__/g,"-"))),props:{tag:{type:String,default:t},...qe()},setup(t,a){let{slots:l}=a;return()=>dt(t.tag,{class:[e,t.class],style:t.style},l.default?.())}})}function pt(e){if("function"!=typeof e.getRootNode){for(;e.parentNode;)e=e.parentNode;return e!==document?null:document}const t=e.getRootNode();return t!==document&&t.getRootNode({composed:!0})!==document?null:t}const ft="cubic-bezier(0.4, 0, 0.2, 1)";function mt(e,t,a){return Object.keys(e).filter(e=>l(e)&&e.endsWith(t)).reduce((l,n)=>(l[n.slice(0,-t.length)]=t=>e[n](t,a(t)),l),{})}function gt(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];for(;e;){if(t?bt(e):yt(e))return e;e=e.parentElement}return document.scrollingElement}function ht(e,t){const a=[];if(t&&e&&!t.contains(e))return a;for(;e&&(yt(e)&&a.push(e),e!==t);)e=e.parentElement;return a}function yt(e){if(!e||e.nodeType!==Node.ELEMENT_NODE)return!1;const t=window.getComputedStyle(e);return"scroll"===t.overflowY||"auto"===t.overflowY&&e.scrollHeight>e.clientHeight}function bt(e){if(!e||e.nodeType!==Node.ELEMENT_NODE)return!1;const t=window.getComputedStyle(e);return["scroll","auto"].includes(t.overflowY)}function wt(e){i("useRender").render=e}const{createVNode:St}=await e("vue"),kt=t({...qe(),...d({fullHeight:!0}),...c()},"VApp"),xt=o()({name:"VApp",props:kt(),setup(e,t){let{slots:a}=t;const l=r(e),{layoutClasses:n,getLayoutItem:o,items:i,layoutRef:c}=s(e),{rtlClasses:d}=u();return wt(()=>St("div",{ref:c,class:["v-application",l.themeClasses.value,n.value,d.value,e.class],style:[e.style]},[St("div",{class:"v-application__wrap"},[a.default?.()])])),{getLayoutItem:o,items:i,theme:l}}}),Vt=t({tag:{type:[String,Object,Function],default:"div"}},"tag"),{createVNode:Ct}=await e("vue"),_t=t({text:String,...qe(),...Vt()},"VToolbarTitle"),It=o()({name:"VToolbarTitle",props:_t(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=!!(a.default||a.text||e.text);return Ct(e.tag,{class:["v-toolbar-title",e.class],style:e.style},{default:()=>[t&&Ct("div",{class:"v-toolbar-title__placeholder"},[a.text?a.text():e.text,a.default?.()])]})}),{}}}),{h:Bt,Transition:Pt,TransitionGroup:At}=await e("vue"),Nt=t({disabled:Boolean,group:Boolean,hideOnLeave:Boolean,leaveAbsolute:Boolean,mode:String,origin:String},"transition");function Tt(e,t,a){return o()({name:e,props:Nt({mode:a,origin:t}),setup(t,a){let{slots:l}=a;const n={onBeforeEnter(e){t.origin&&(e.style.transformOrigin=t.origin)},onLeave(e){if(t.leaveAbsolute){const{offsetTop:t,offsetLeft:a,offsetWidth:l,offsetHeight:n}=e;e._transitionInitialStyles={position:e.style.position,top:e.style.top,left:e.style.left,width:e.style.width,height:e.style.height},e.style.position="absolute",e.style.top=`${t}px`,e.style.left=`${a}px`,e.style.width=`${l}px`,e.style.height=`${n}px`}t.hideOnLeave&&e.style.setProperty("display","none","important")},onAfterLeave(e){if(t.leaveAbsolute&&e?._transitionInitialStyles){const{position:t,top:a,left:l,width:n,height:o}=e._transitionInitialStyles;delete e._transitionInitialStyles,e.style.position=t||"",e.style.top=a||"",e.style.left=l||"",e.style.width=n||"",e.style.height=o||""}}};return()=>{const a=t.group?At:Pt;return Bt(a,{name:t.disabled?"":e,css:!t.disabled,...t.group?void 0:{mode:t.mode},...t.disabled?{}:n},l.default)}}})}function Et(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"in-out";return o()({name:e,props:{mode:{type:String,default:a},disabled:Boolean,group:Boolean},setup(a,l){let{slots:n}=l;const o=a.group?At:Pt;return()=>Bt(o,{name:a.disabled?"":e,css:!a.disabled,...a.disabled?{}:t},n.default)}})}const{camelize:Dt}=await e("vue");function Rt(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"";const t=arguments.length>1&&void 0!==arguments[1]&&arguments[1]?"width":"height",a=Dt(`offset-${t}`);return{onBeforeEnter(e){e._parent=e.parentNode,e._initialStyle={transition:e.style.transition,overflow:e.style.overflow,[t]:e.style[t]}},onEnter(l){const n=l._initialStyle;if(!n)return;l.style.setProperty("transition","none","important"),l.style.overflow="hidden";const o=`${l[a]}px`;l.style[t]="0",l.offsetHeight,l.style.transition=n.transition,e&&l._parent&&l._parent.classList.add(e),requestAnimationFrame(()=>{l.style[t]=o})},onAfterEnter:n,onEnterCancelled:n,onLeave(e){e._initialStyle={transition:"",overflow:e.style.overflow,[t]:e.style[t]},e.style.overflow="hidden",e.style[t]=`${e[a]}px`,e.offsetHeight,requestAnimationFrame(()=>e.style[t]="0")},onAfterLeave:l,onLeaveCancelled:l};function l(t){e&&t._parent&&t._parent.classList.remove(e),n(t)}function n(e){if(!e._initialStyle)return;const a=e._initialStyle[t];e.style.overflow=e._initialStyle.overflow,null!=a&&(e.style[t]=a),delete e._initialStyle}}const{Transition:$t,mergeProps:Lt,createVNode:Ft}=await e("vue"),Mt=t({target:[Object,Array]},"v-dialog-transition"),Ot=new WeakMap,zt=o()({name:"VDialogTransition",props:Mt(),setup(e,t){let{slots:a}=t;const l={onBeforeEnter(e){e.style.pointerEvents="none",e.style.visibility="hidden"},async onEnter(t,a){await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>requestAnimationFrame(e)),t.style.visibility="";const l=Ht(e.target,t),{x:n,y:o,sx:i,sy:r,speed:s}=l;Ot.set(t,l);const u=rt(t,[{transform:`translate(${n}px, ${o}px) scale(${i}, ${r})`,opacity:0},{}],{duration:225*s,easing:"cubic-bezier(0.0, 0, 0.2, 1)"});jt(t)?.forEach(e=>{rt(e,[{opacity:0},{opacity:0,offset:.33},{}],{duration:450*s,easing:ft})}),u.finished.then(()=>a())},onAfterEnter(e){e.style.removeProperty("pointer-events")},onBeforeLeave(e){e.style.pointerEvents="none"},async onLeave(t,a){let l;await new Promise(e=>requestAnimationFrame(e)),l=!Ot.has(t)||Array.isArray(e.target)||e.target.offsetParent||e.target.getClientRects().length?Ht(e.target,t):Ot.get(t);const{x:n,y:o,sx:i,sy:r,speed:s}=l;rt(t,[{},{transform:`translate(${n}px, ${o}px) scale(${i}, ${r})`,opacity:0}],{duration:125*s,easing:"cubic-bezier(0.4, 0, 1, 1)"}).finished.then(()=>a()),jt(t)?.forEach(e=>{rt(e,[{},{opacity:0,offset:.2},{opacity:0}],{duration:250*s,easing:ft})})},onAfterLeave(e){e.style.removeProperty("pointer-events")}};return()=>e.target?Ft($t,Lt({name:"dialog-transition"},l,{css:!1}),a):Ft($t,{name:"dialog-transition"},a)}});function jt(e){const t=e.querySelector(":scope > .v-card, :scope > .v-sheet, :scope > .v-list")?.children;return t&&[...t]}function Ht(e,t){const a=ot(e),l=it(t),[n,o]=getComputedStyle(t).transformOrigin.split(" ").map(e=>parseFloat(e)),[i,r]=getComputedStyle(t).getPropertyValue("--v-overlay-anchor-origin").split(" ");let s=a.left+a.width/2;"left"===i||"left"===r?s-=a.width/2:"right"!==i&&"right"!==r||(s+=a.width/2);let u=a.top+a.height/2;"top"===i||"top"===r?u-=a.height/2:"bottom"!==i&&"bottom"!==r||(u+=a.height/2);const c=a.width/l.width,d=a.height/l.height,v=Math.max(1,c,d),p=c/v||0,f=d/v||0,m=l.width*l.height/(window.innerWidth*window.innerHeight),g=m>.12?Math.min(1.5,10*(m-.12)+1):1;return{x:s-(n+l.left),y:u-(o+l.top),sx:p,sy:f,speed:g}}const Wt=Tt("fab-transition","center center","out-in"),Ut=Tt("dialog-bottom-transition"),Gt=Tt("dialog-top-transition"),Yt=Tt("fade-transition"),qt=Tt("scale-transition"),Kt=Tt("scroll-x-transition"),Xt=Tt("scroll-x-reverse-transition"),Jt=Tt("scroll-y-transition"),Qt=Tt("scroll-y-reverse-transition"),Zt=Tt("slide-x-transition"),ea=Tt("slide-x-reverse-transition"),ta=Tt("slide-y-transition"),aa=Tt("slide-y-reverse-transition"),la=Et("expand-transition",Rt()),na=Et("expand-x-transition",Rt("",!0)),{toRefs:oa}=await e("vue"),ia=t({defaults:Object,disabled:Boolean,reset:[Number,String],root:[Boolean,String],scoped:Boolean},"VDefaultsProvider"),ra=o(!1)({name:"VDefaultsProvider",props:ia(),setup(e,t){let{slots:a}=t;const{defaults:l,disabled:n,reset:o,root:i,scoped:r}=oa(e);return v(l,{reset:o,root:i,scoped:r,disabled:n}),()=>a.default?.()}}),{computed:sa}=await e("vue"),ua=t({height:[Number,String],maxHeight:[Number,String],maxWidth:[Number,String],minHeight:[Number,String],minWidth:[Number,String],width:[Number,String]},"dimension");function ca(e){return{dimensionStyles:sa(()=>{const t={},a=p(e.height),l=p(e.maxHeight),n=p(e.maxWidth),o=p(e.minHeight),i=p(e.minWidth),r=p(e.width);return null!=a&&(t.height=a),null!=l&&(t.maxHeight=l),null!=n&&(t.maxWidth=n),null!=o&&(t.minHeight=o),null!=i&&(t.minWidth=i),null!=r&&(t.width=r),t})}}const{createVNode:da}=await e("vue"),{computed:va}=await e("vue");const pa=t({aspectRatio:[String,Number],contentClass:null,inline:Boolean,...qe(),...ua()},"VResponsive"),fa=o()({name:"VResponsive",props:pa(),setup(e,t){let{slots:a}=t;const{aspectStyles:l}=function(e){return{aspectStyles:va(()=>{const t=Number(e.aspectRatio);return t?{paddingBottom:String(1/t*100)+"%"}:void 0})}}(e),{dimensionStyles:n}=ca(e);return wt(()=>da("div",{class:["v-responsive",{"v-responsive--inline":e.inline},e.class],style:[n.value,e.style]},[da("div",{class:"v-responsive__sizer",style:l.value},null),a.additional?.(),a.default&&da("div",{class:["v-responsive__content",e.contentClass]},[a.default()])])),{}}}),{toValue:ma}=await e("vue");function ga(e){return f(()=>{const t=ma(e),a=[],l={};if(t.background)if(m(t.background)){if(l.backgroundColor=t.background,!t.text&&g(t.background)){const e=h(t.background);if(null==e.a||1===e.a){const t=y(e);l.color=t,l.caretColor=t}}}else a.push(`bg-${t.background}`);return t.text&&(m(t.text)?(l.color=t.text,l.caretColor=t.text):a.push(`text-${t.text}`)),{colorClasses:a,colorStyles:l}})}function ha(e){const{colorClasses:t,colorStyles:a}=ga(()=>({text:ma(e)}));return{textColorClasses:t,textColorStyles:a}}function ya(e){const{colorClasses:t,colorStyles:a}=ga(()=>({background:ma(e)}));return{backgroundColorClasses:t,backgroundColorStyles:a}}const{computed:ba,isRef:wa}=await e("vue"),Sa=t({rounded:{type:[Boolean,Number,String],default:void 0},tile:Boolean},"rounded");function ka(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{roundedClasses:ba(()=>{const a=wa(e)?e.value:e.rounded,l=wa(e)?e.value:e.tile,n=[];if(!0===a||""===a)n.push(`${t}--rounded`);else if("string"==typeof a||0===a)for(const e of String(a).split(" "))n.push(`rounded-${e}`);else(l||!1===a)&&n.push("rounded-0");return n})}}const{h:xa,mergeProps:Va,Transition:Ca,TransitionGroup:_a}=await e("vue"),Ia=t({transition:{type:null,default:"fade-transition",validator:e=>!0!==e}},"transition"),Ba=(e,t)=>{let{slots:a}=t;const{transition:l,disabled:n,group:o,...i}=e,{component:r=(o?_a:Ca),...s}=w(l)?l:{};let u;return u=w(l)?Va(s,JSON.parse(JSON.stringify({disabled:n,group:o})),i):Va({name:n||!l?"":l},i),xa(r,u,a)};function Pa(e,t){const a=e._observe?.[t.instance.$.uid];a&&(a.observer.unobserve(e),delete e._observe[t.instance.$.uid])}const Aa={mounted:function(e,t){if(!S)return;const a=t.modifiers||{},l=t.value,{handler:n,options:o}="object"==typeof l?l:{handler:l,options:{}},i=new IntersectionObserver(function(){let l=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],o=arguments.length>1?arguments[1]:void 0;const i=e._observe?.[t.instance.$.uid];if(!i)return;const r=l.some(e=>e.isIntersecting);!n||a.quiet&&!i.init||a.once&&!r&&!i.init||n(r,l,o),r&&a.once?Pa(e,t):i.init=!0},o);e._observe=Object(e._observe),e._observe[t.instance.$.uid]={init:!1,observer:i},i.observe(e)},unmounted:Pa},{createVNode:Na,Fragment:Ta,resolveDirective:Ea,mergeProps:Da,withDirectives:Ra}=await e("vue"),{computed:$a,nextTick:La,onBeforeMount:Fa,onBeforeUnmount:Ma,ref:Oa,shallowRef:za,toRef:ja,vShow:Ha,watch:Wa,withDirectives:Ua}=await e("vue"),Ga=t({absolute:Boolean,alt:String,cover:Boolean,color:String,draggable:{type:[Boolean,String],default:void 0},eager:Boolean,gradient:String,lazySrc:String,options:{type:Object,default:()=>({root:void 0,rootMargin:void 0,threshold:void 0})},sizes:String,src:{type:[String,Object],default:""},crossorigin:String,referrerpolicy:String,srcset:String,position:String,...pa(),...qe(),...Sa(),...Ia()},"VImg"),Ya=o()({name:"VImg",directives:{intersect:Aa},props:Ga(),emits:{loadstart:e=>!0,load:e=>!0,error:e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{roundedClasses:r}=ka(e),s=i("VImg"),u=za(""),c=Oa(),d=za(e.eager?"loading":"idle"),v=za(),f=za(),m=$a(()=>e.src&&"object"==typeof e.src?{src:e.src.src,srcset:e.srcset||e.src.srcset,lazySrc:e.lazySrc||e.src.lazySrc,aspect:Number(e.aspectRatio||e.src.aspect||0)}:{src:e.src,srcset:e.srcset,lazySrc:e.lazySrc,aspect:Number(e.aspectRatio||0)}),g=$a(()=>m.value.aspect||v.value/f.value||0);function h(t){if((!e.eager||!t)&&(!S||t||e.eager)){if(d.value="loading",m.value.lazySrc){const e=new Image;e.src=m.value.lazySrc,x(e,null)}m.value.src&&La(()=>{a("loadstart",c.value?.currentSrc||m.value.src),setTimeout(()=>{if(!s.isUnmounted)if(c.value?.complete){if(c.value.naturalWidth||b(),"error"===d.value)return;g.value||x(c.value,null),"loading"===d.value&&y()}else g.value||x(c.value),w()})})}}function y(){s.isUnmounted||(w(),x(c.value),d.value="loaded",a("load",c.value?.currentSrc||m.value.src))}function b(){s.isUnmounted||(d.value="error",a("error",c.value?.currentSrc||m.value.src))}function w(){const e=c.value;e&&(u.value=e.currentSrc||e.src)}Wa(()=>e.src,()=>{h("idle"!==d.value)}),Wa(g,(e,t)=>{!e&&t&&c.value&&x(c.value)}),Fa(()=>h());let k=-1;function x(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:100;const a=()=>{if(clearTimeout(k),s.isUnmounted)return;const{naturalHeight:l,naturalWidth:n}=e;l||n?(v.value=n,f.value=l):e.complete||"loading"!==d.value||null==t?(e.currentSrc.endsWith(".svg")||e.currentSrc.startsWith("data:image/svg+xml"))&&(v.value=1,f.value=1):k=window.setTimeout(a,t)};a()}Ma(()=>{clearTimeout(k)});const V=ja(()=>({"v-img__img--cover":e.cover,"v-img__img--contain":!e.cover})),C=()=>{if(!m.value.src||"idle"===d.value)return null;const t=Na("img",{class:["v-img__img",V.value],style:{objectPosition:e.position},crossorigin:e.crossorigin,src:m.value.src,srcset:m.value.srcset,alt:e.alt,referrerpolicy:e.referrerpolicy,draggable:e.draggable,sizes:e.sizes,ref:c,onLoad:y,onError:b},null),a=l.sources?.();return Na(Ba,{transition:e.transition,appear:!0},{default:()=>[Ua(a?Na("picture",{class:"v-img__picture"},[a,t]):t,[[Ha,"loaded"===d.value]])]})},_=()=>Na(Ba,{transition:e.transition},{default:()=>[m.value.lazySrc&&"loaded"!==d.value&&Na("img",{class:["v-img__img","v-img__img--preload",V.value],style:{objectPosition:e.position},crossorigin:e.crossorigin,src:m.value.lazySrc,alt:e.alt,referrerpolicy:e.referrerpolicy,draggable:e.draggable},null)]}),I=()=>l.placeholder?Na(Ba,{transition:e.transition,appear:!0},{default:()=>[("loading"===d.value||"error"===d.value&&!l.error)&&Na("div",{class:"v-img__placeholder"},[l.placeholder()])]}):null,B=()=>l.error?Na(Ba,{transition:e.transition,appear:!0},{default:()=>["error"===d.value&&Na("div",{class:"v-img__error"},[l.error()])]}):null,P=()=>e.gradient?Na("div",{class:"v-img__gradient",style:{backgroundImage:`linear-gradient(${e.gradient})`}},null):null,A=za(!1);{const e=Wa(g,t=>{t&&(requestAnimationFrame(()=>{requestAnimationFrame(()=>{A.value=!0})}),e())})}return wt(()=>{const t=fa.filterProps(e);return Ra(Na(fa,Da({class:["v-img",{"v-img--absolute":e.absolute,"v-img--booting":!A.value},n.value,r.value,e.class],style:[{width:p("auto"===e.width?v.value:e.width)},o.value,e.style]},t,{aspectRatio:g.value,"aria-label":e.alt,role:e.alt?"img":void 0}),{additional:()=>Na(Ta,null,[Na(C,null,null),Na(_,null,null),Na(P,null,null),Na(I,null,null),Na(B,null,null)]),default:l.default}),[[Ea("intersect"),{handler:h,options:e.options},null,{once:!0}]])}),{currentSrc:u,image:c,state:d,naturalWidth:v,naturalHeight:f}}}),{computed:qa}=await e("vue"),Ka=t({border:[Boolean,Number,String]},"border");function Xa(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{borderClasses:qa(()=>{const a=e.border;return!0===a||""===a?`${t}--border`:"string"==typeof a||0===a?String(a).split(" ").map(e=>`border-${e}`):[]})}}const{isRef:Ja,toRef:Qa}=await e("vue"),Za=t({elevation:{type:[Number,String],validator(e){const t=parseInt(e);return!isNaN(t)&&t>=0&&t<=24}}},"elevation");function el(e){return{elevationClasses:Qa(()=>{const t=Ja(e)?e.value:e.elevation;return null==t?[]:[`elevation-${t}`]})}}const{createVNode:tl}=await e("vue"),{computed:al,shallowRef:ll}=await e("vue"),nl=[null,"prominent","default","comfortable","compact"],ol=t({absolute:Boolean,collapse:Boolean,color:String,density:{type:String,default:"default",validator:e=>nl.includes(e)},extended:Boolean,extensionHeight:{type:[Number,String],default:48},flat:Boolean,floating:Boolean,height:{type:[Number,String],default:64},image:String,title:String,...Ka(),...qe(),...Za(),...Sa(),...Vt({tag:"header"}),...c()},"VToolbar"),il=o()({name:"VToolbar",props:ol(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.color),{borderClasses:o}=Xa(e),{elevationClasses:i}=el(e),{roundedClasses:s}=ka(e),{themeClasses:c}=r(e),{rtlClasses:d}=u(),f=ll(!(!e.extended&&!a.extension?.())),m=al(()=>parseInt(Number(e.height)+("prominent"===e.density?Number(e.height):0)-("comfortable"===e.density?8:0)-("compact"===e.density?16:0),10)),g=al(()=>f.value?parseInt(Number(e.extensionHeight)+("prominent"===e.density?Number(e.extensionHeight):0)-("comfortable"===e.density?4:0)-("compact"===e.density?8:0),10):0);return v({VBtn:{variant:"text"}}),wt(()=>{const t=!(!e.title&&!a.title),r=!(!a.image&&!e.image),u=a.extension?.();return f.value=!(!e.extended&&!u),tl(e.tag,{class:["v-toolbar",{"v-toolbar--absolute":e.absolute,"v-toolbar--collapse":e.collapse,"v-toolbar--flat":e.flat,"v-toolbar--floating":e.floating,[`v-toolbar--density-${e.density}`]:!0},l.value,o.value,i.value,s.value,c.value,d.value,e.class],style:[n.value,e.style]},{default:()=>[r&&tl("div",{key:"image",class:"v-toolbar__image"},[a.image?tl(ra,{key:"image-defaults",disabled:!e.image,defaults:{VImg:{cover:!0,src:e.image}}},a.image):tl(Ya,{key:"image-img",cover:!0,src:e.image},null)]),tl(ra,{defaults:{VTabs:{height:p(m.value)}}},{default:()=>[tl("div",{class:"v-toolbar__content",style:{height:p(m.value)}},[a.prepend&&tl("div",{class:"v-toolbar__prepend"},[a.prepend?.()]),t&&tl(It,{key:"title",text:e.title},{text:a.title}),a.default?.(),a.append&&tl("div",{class:"v-toolbar__append"},[a.append?.()])])]}),tl(ra,{defaults:{VTabs:{height:p(g.value)}}},{default:()=>[tl(la,null,{default:()=>[f.value&&tl("div",{class:"v-toolbar__extension",style:{height:p(g.value)}},[u])]})]})]})}),{contentHeight:m,extensionHeight:g}}}),{computed:rl,onBeforeUnmount:sl,onMounted:ul,ref:cl,shallowRef:dl,watch:vl}=await e("vue"),pl=t({scrollTarget:{type:String},scrollThreshold:{type:[String,Number],default:300}},"scroll");const{onMounted:fl,readonly:ml,shallowRef:gl,toRef:hl}=await e("vue");function yl(){const e=gl(!1);fl(()=>{window.requestAnimationFrame(()=>{e.value=!0})});return{ssrBootStyles:hl(()=>e.value?void 0:{transition:"none !important"}),isBooted:ml(e)}}const{mergeProps:bl,createVNode:wl}=await e("vue"),{computed:Sl,ref:kl,shallowRef:xl,toRef:Vl,watchEffect:Cl}=await e("vue"),_l=t({scrollBehavior:String,modelValue:{type:Boolean,default:!0},location:{type:String,default:"top",validator:e=>["top","bottom"].includes(e)},...ol(),...I(),...pl(),height:{type:[Number,String],default:64}},"VAppBar"),Il=o()({name:"VAppBar",props:_l(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=kl(),n=V(e,"modelValue"),o=Sl(()=>{const t=new Set(e.scrollBehavior?.split(" ")??[]);return{hide:t.has("hide"),fullyHide:t.has("fully-hide"),inverted:t.has("inverted"),collapse:t.has("collapse"),elevate:t.has("elevate"),fadeImage:t.has("fade-image")}}),i=Sl(()=>{const e=o.value;return e.hide||e.fullyHide||e.inverted||e.collapse||e.elevate||e.fadeImage||!n.value}),{currentScroll:r,scrollThreshold:s,isScrollingUp:u,scrollRatio:c}=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{canScroll:a}=t;let l=0,n=0;const o=cl(null),i=dl(0),r=dl(0),s=dl(0),u=dl(!1),c=dl(!1),d=rl(()=>Number(e.scrollThreshold)),v=rl(()=>k((d.value-i.value)/d.value||0)),p=()=>{const e=o.value;if(!e||a&&!a.value)return;l=i.value,i.value="window"in e?e.pageYOffset:e.scrollTop;const t=e instanceof Window?document.documentElement.scrollHeight:e.scrollHeight;n===t?(c.value=i.value<l,s.value=Math.abs(i.value-d.value)):n=t};return vl(c,()=>{r.value=r.value||i.value}),vl(u,()=>{r.value=0}),ul(()=>{vl(()=>e.scrollTarget,e=>{const t=e?document.querySelector(e):window;t?t!==o.value&&(o.value?.removeEventListener("scroll",p),o.value=t,o.value.addEventListener("scroll",p,{passive:!0})):x(`Unable to locate element with identifier ${e}`)},{immediate:!0})}),sl(()=>{o.value?.removeEventListener("scroll",p)}),a&&vl(a,p,{immediate:!0}),{scrollThreshold:d,currentScroll:i,currentThreshold:s,isScrollActive:u,scrollRatio:v,isScrollingUp:c,savedScroll:r}}(e,{canScroll:i}),d=Vl(()=>o.value.hide||o.value.fullyHide),v=Sl(()=>e.collapse||o.value.collapse&&(o.value.inverted?c.value>0:0===c.value)),p=Sl(()=>e.flat||o.value.fullyHide&&!n.value||o.value.elevate&&(o.value.inverted?r.value>0:0===r.value)),f=Sl(()=>o.value.fadeImage?o.value.inverted?1-c.value:c.value:void 0),m=Sl(()=>{if(o.value.hide&&o.value.inverted)return 0;const e=l.value?.contentHeight??0,t=l.value?.extensionHeight??0;return d.value?r.value<s.value||o.value.fullyHide?e+t:e:e+t});C(()=>!!e.scrollBehavior,()=>{Cl(()=>{d.value?o.value.inverted?n.value=r.value>s.value:n.value=u.value||r.value<s.value:n.value=!0})});const{ssrBootStyles:g}=yl(),{layoutItemStyles:h}=_({id:e.name,order:Sl(()=>parseInt(e.order,10)),position:Vl(()=>e.location),layoutSize:m,elementSize:xl(void 0),active:n,absolute:Vl(()=>e.absolute)});return wt(()=>{const t=il.filterProps(e);return wl(il,bl({ref:l,class:["v-app-bar",{"v-app-bar--bottom":"bottom"===e.location},e.class],style:[{...h.value,"--v-toolbar-image-opacity":f.value,height:void 0,...g.value},e.style]},t,{collapse:v.value,flat:p.value}),a)}),{}}}),{toRef:Bl}=await e("vue"),Pl=[null,"default","comfortable","compact"],Al=t({density:{type:String,default:"default",validator:e=>Pl.includes(e)}},"density");function Nl(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{densityClasses:Bl(()=>`${t}--density-${e.density}`)}}const{Fragment:Tl,createVNode:El}=await e("vue"),{toRef:Dl,toValue:Rl}=await e("vue"),$l=["elevated","flat","tonal","outlined","text","plain"];function Ll(e,t){return El(Tl,null,[e&&El("span",{key:"overlay",class:`${t}__overlay`},null),El("span",{key:"underlay",class:`${t}__underlay`},null)])}const Fl=t({color:String,variant:{type:String,default:"elevated",validator:e=>$l.includes(e)}},"variant");function Ml(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();const a=Dl(()=>{const{variant:a}=Rl(e);return`${t}--variant-${a}`}),{colorClasses:l,colorStyles:n}=ga(()=>{const{variant:t,color:a}=Rl(e);return{[["elevated","flat"].includes(t)?"background":"text"]:a}});return{colorClasses:l,colorStyles:n,variantClasses:a}}const{createVNode:Ol}=await e("vue"),{toRef:zl}=await e("vue"),jl=t({baseColor:String,divided:Boolean,...Ka(),...qe(),...Al(),...Za(),...Sa(),...Vt(),...c(),...Fl()},"VBtnGroup"),Hl=o()({name:"VBtnGroup",props:jl(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{densityClasses:n}=Nl(e),{borderClasses:o}=Xa(e),{elevationClasses:i}=el(e),{roundedClasses:s}=ka(e);v({VBtn:{height:"auto",baseColor:zl(()=>e.baseColor),color:zl(()=>e.color),density:zl(()=>e.density),flat:!0,variant:zl(()=>e.variant)}}),wt(()=>Ol(e.tag,{class:["v-btn-group",{"v-btn-group--divided":e.divided},l.value,o.value,n.value,i.value,s.value,e.class],style:e.style},a))}}),{computed:Wl,inject:Ul,onBeforeUnmount:Gl,onMounted:Yl,onUpdated:ql,provide:Kl,reactive:Xl,toRef:Jl,unref:Ql,useId:Zl,watch:en}=await e("vue"),tn=t({modelValue:{type:null,default:void 0},multiple:Boolean,mandatory:[Boolean,String],max:Number,selectedClass:String,disabled:Boolean},"group"),an=t({value:null,disabled:Boolean,selectedClass:String},"group-item");function ln(e,t){let a=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];const l=i("useGroupItem");if(!l)throw new Error("[Vuetify] useGroupItem composable must be used inside a component setup function");const n=Zl();Kl(Symbol.for(`${t.description}:id`),n);const o=Ul(t,null);if(!o){if(!a)return o;throw new Error(`[Vuetify] Could not find useGroup injection with symbol ${t.description}`)}const r=Jl(()=>e.value),s=Wl(()=>!(!o.disabled.value&&!e.disabled));o.register({id:n,value:r,disabled:s},l),Gl(()=>{o.unregister(n)});const u=Wl(()=>o.isSelected(n)),c=Wl(()=>o.items.value[0].id===n),d=Wl(()=>o.items.value[o.items.value.length-1].id===n),v=Wl(()=>u.value&&[o.selectedClass.value,e.selectedClass]);return en(u,e=>{l.emit("group:selected",{value:e})},{flush:"sync"}),{id:n,isSelected:u,isFirst:c,isLast:d,toggle:()=>o.select(n,!u.value),select:e=>o.select(n,e),selectedClass:v,value:r,disabled:s,group:o}}function nn(e,t){let a=!1;const l=Xl([]),n=V(e,"modelValue",[],e=>null==e?[]:on(l,P(e)),t=>{const a=function(e,t){const a=[];return t.forEach(t=>{const l=e.findIndex(e=>e.id===t);if(~l){const t=e[l];a.push(null!=t.value?t.value:l)}}),a}(l,t);return e.multiple?a:a[0]}),o=i("useGroup");function r(){const t=l.find(e=>!e.disabled);t&&"force"===e.mandatory&&!n.value.length&&(n.value=[t.id])}function s(t){if(e.multiple&&x('This method is not supported when using "multiple" prop'),n.value.length){const e=n.value[0],a=l.findIndex(t=>t.id===e);let o=(a+t)%l.length,i=l[o];for(;i.disabled&&o!==a;)o=(o+t)%l.length,i=l[o];if(i.disabled)return;n.value=[l[o].id]}else{const e=l.find(e=>!e.disabled);e&&(n.value=[e.id])}}Yl(()=>{r()}),Gl(()=>{a=!0}),ql(()=>{for(let e=0;e<l.length;e++)l[e].useIndexAsValue&&(l[e].value=e)});const u={register:function(e,a){const n=e,i=Symbol.for(`${t.description}:id`),r=A(i,o?.vnode).indexOf(a);null==Ql(n.value)&&(n.value=r,n.useIndexAsValue=!0),r>-1?l.splice(r,0,n):l.push(n)},unregister:function(e){if(a)return;r();const t=l.findIndex(t=>t.id===e);l.splice(t,1)},selected:n,select:function(t,a){const o=l.find(e=>e.id===t);if(!a||!o?.disabled)if(e.multiple){const l=n.value.slice(),o=l.findIndex(e=>e===t),i=~o;if(a=a??!i,i&&e.mandatory&&l.length<=1)return;if(!i&&null!=e.max&&l.length+1>e.max)return;o<0&&a?l.push(t):o>=0&&!a&&l.splice(o,1),n.value=l}else{const l=n.value.includes(t);if(e.mandatory&&l)return;n.value=a??!l?[t]:[]}},disabled:Jl(()=>e.disabled),prev:()=>s(l.length-1),next:()=>s(1),isSelected:e=>n.value.includes(e),selectedClass:Jl(()=>e.selectedClass),items:Jl(()=>l),getItemIndex:e=>function(e,t){const a=on(e,[t]);return a.length?e.findIndex(e=>e.id===a[0]):-1}(l,e)};return Kl(t,u),u}function on(e,t){const a=[];return t.forEach(t=>{const l=e.find(e=>B(t,e.value)),n=e[t];null!=l?.value?a.push(l.id):null!=n&&a.push(n.id)}),a}const{mergeProps:rn,createVNode:sn}=await e("vue"),un=Symbol.for("vuetify:v-btn-toggle"),cn=t({...jl(),...tn()},"VBtnToggle"),dn=o()({name:"VBtnToggle",props:cn(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{isSelected:l,next:n,prev:o,select:i,selected:r}=nn(e,un);return wt(()=>{const t=Hl.filterProps(e);return sn(Hl,rn({class:["v-btn-toggle",e.class]},t,{style:e.style}),{default:()=>[a.default?.({isSelected:l,next:n,prev:o,select:i,selected:r})]})}),{next:n,prev:o,select:i}}}),vn=["x-small","small","default","large","x-large"],pn=t({size:{type:[String,Number],default:"default"}},"size");function fn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return f(()=>{const l=e.size;let n,o;return a(vn,l)?n=`${t}--size-${l}`:l&&(o={width:p(l),height:p(l)}),{sizeClasses:n,sizeStyles:o}})}const{createVNode:mn}=await e("vue"),{shallowRef:gn,Text:hn}=await e("vue"),yn=t({color:String,disabled:Boolean,start:Boolean,end:Boolean,icon:E,opacity:[String,Number],...qe(),...pn(),...Vt({tag:"i"}),...c()},"VIcon"),bn=o()({name:"VIcon",props:yn(),setup(e,t){let{attrs:a,slots:l}=t;const n=gn(),{themeClasses:o}=N(),{iconData:i}=T(()=>n.value||e.icon),{sizeClasses:r}=fn(e),{textColorClasses:s,textColorStyles:u}=ha(()=>e.color);return wt(()=>{const t=l.default?.();t&&(n.value=D(t).filter(e=>e.type===hn&&e.children&&"string"==typeof e.children)[0]?.children);const c=!(!a.onClick&&!a.onClickOnce);return mn(i.value.component,{tag:e.tag,icon:i.value.icon,class:["v-icon","notranslate",o.value,r.value,s.value,{"v-icon--clickable":c,"v-icon--disabled":e.disabled,"v-icon--start":e.start,"v-icon--end":e.end},e.class],style:[{"--v-icon-opacity":e.opacity},r.value?void 0:{fontSize:p(e.size),height:p(e.size),width:p(e.size)},u.value,e.style],role:c?"button":void 0,"aria-hidden":!c,tabindex:c?e.disabled?-1:0:void 0},{default:()=>[t]})}),{}}}),{onBeforeUnmount:wn,ref:Sn,shallowRef:kn,watch:xn}=await e("vue");function Vn(e,t){const a=Sn(),l=kn(!1);if(S){const e=new IntersectionObserver(e=>{l.value=!!e.find(e=>e.isIntersecting)},t);wn(()=>{e.disconnect()}),xn(a,(t,a)=>{a&&(e.unobserve(a),l.value=!1),t&&e.observe(t)},{flush:"post"})}return{intersectionRef:a,isIntersecting:l}}const{createVNode:Cn}=await e("vue"),{ref:_n,toRef:In,watchEffect:Bn}=await e("vue"),Pn=t({bgColor:String,color:String,indeterminate:[Boolean,String],modelValue:{type:[Number,String],default:0},rotate:{type:[Number,String],default:0},width:{type:[Number,String],default:4},...qe(),...pn(),...Vt({tag:"div"}),...c()},"VProgressCircular"),An=o()({name:"VProgressCircular",props:Pn(),setup(e,t){let{slots:a}=t;const l=2*Math.PI*20,n=_n(),{themeClasses:o}=r(e),{sizeClasses:i,sizeStyles:s}=fn(e),{textColorClasses:u,textColorStyles:c}=ha(()=>e.color),{textColorClasses:d,textColorStyles:v}=ha(()=>e.bgColor),{intersectionRef:f,isIntersecting:m}=Vn(),{resizeRef:g,contentRect:h}=R(),y=In(()=>Math.max(0,Math.min(100,parseFloat(e.modelValue)))),b=In(()=>Number(e.width)),w=In(()=>s.value?Number(e.size):h.value?h.value.width:Math.max(b.value,32)),S=In(()=>20/(1-b.value/w.value)*2),k=In(()=>b.value/w.value*S.value),x=In(()=>p((100-y.value)/100*l));return Bn(()=>{f.value=n.value,g.value=n.value}),wt(()=>Cn(e.tag,{ref:n,class:["v-progress-circular",{"v-progress-circular--indeterminate":!!e.indeterminate,"v-progress-circular--visible":m.value,"v-progress-circular--disable-shrink":"disable-shrink"===e.indeterminate},o.value,i.value,u.value,e.class],style:[s.value,c.value,e.style],role:"progressbar","aria-valuemin":"0","aria-valuemax":"100","aria-valuenow":e.indeterminate?void 0:y.value},{default:()=>[Cn("svg",{style:{transform:`rotate(calc(-90deg + ${Number(e.rotate)}deg))`},xmlns:"http://www.w3.org/2000/svg",viewBox:`0 0 ${S.value} ${S.value}`},[Cn("circle",{class:["v-progress-circular__underlay",d.value],style:v.value,fill:"transparent",cx:"50%",cy:"50%",r:20,"stroke-width":k.value,"stroke-dasharray":l,"stroke-dashoffset":0},null),Cn("circle",{class:"v-progress-circular__overlay",fill:"transparent",cx:"50%",cy:"50%",r:20,"stroke-width":k.value,"stroke-dasharray":l,"stroke-dashoffset":x.value},null)]),a.default&&Cn("div",{class:"v-progress-circular__content"},[a.default({value:y.value})])]})),{}}}),{computed:Nn}=await e("vue"),Tn={center:"center",top:"bottom",bottom:"top",left:"right",right:"left"},En=t({location:String},"location");function Dn(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],a=arguments.length>2?arguments[2]:void 0;const{isRtl:l}=u(),n=Nn(()=>{if(!e.location)return{};const{side:n,align:o}=Je(e.location.split(" ").length>1?e.location:`${e.location} center`,l.value);function i(e){return a?a(e):0}const r={};return"center"!==n&&(t?r[Tn[n]]=`calc(100% - ${i(n)}px)`:r[n]=0),"center"!==o?t?r[Tn[o]]=`calc(100% - ${i(o)}px)`:r[o]=0:("center"===n?r.top=r.left="50%":r[{top:"left",bottom:"left",left:"top",right:"top"}[n]]="50%",r.transform={top:"translateX(-50%)",bottom:"translateX(-50%)",left:"translateY(-50%)",right:"translateY(-50%)",center:"translate(-50%, -50%)"}[n]),r});return{locationStyles:n}}const{createVNode:Rn}=await e("vue"),{computed:$n,Transition:Ln}=await e("vue"),Fn=t({absolute:Boolean,active:{type:Boolean,default:!0},bgColor:String,bgOpacity:[Number,String],bufferValue:{type:[Number,String],default:0},bufferColor:String,bufferOpacity:[Number,String],clickable:Boolean,color:String,height:{type:[Number,String],default:4},indeterminate:Boolean,max:{type:[Number,String],default:100},modelValue:{type:[Number,String],default:0},opacity:[Number,String],reverse:Boolean,stream:Boolean,striped:Boolean,roundedBar:Boolean,...qe(),...En({location:"top"}),...Sa(),...Vt(),...c()},"VProgressLinear"),Mn=o()({name:"VProgressLinear",props:Fn(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{isRtl:n,rtlClasses:o}=u(),{themeClasses:i}=r(e),{locationStyles:s}=Dn(e),{textColorClasses:c,textColorStyles:d}=ha(()=>e.color),{backgroundColorClasses:v,backgroundColorStyles:f}=ya(()=>e.bgColor||e.color),{backgroundColorClasses:m,backgroundColorStyles:g}=ya(()=>e.bufferColor||e.bgColor||e.color),{backgroundColorClasses:h,backgroundColorStyles:y}=ya(()=>e.color),{roundedClasses:b}=ka(e),{intersectionRef:w,isIntersecting:S}=Vn(),x=$n(()=>parseFloat(e.max)),C=$n(()=>parseFloat(e.height)),_=$n(()=>k(parseFloat(e.bufferValue)/x.value*100,0,100)),I=$n(()=>k(parseFloat(l.value)/x.value*100,0,100)),B=$n(()=>n.value!==e.reverse),P=$n(()=>e.indeterminate?"fade-transition":"slide-x-transition"),A=$&&window.matchMedia?.("(forced-colors: active)").matches;function N(e){if(!w.value)return;const{left:t,right:a,width:n}=w.value.getBoundingClientRect(),o=B.value?n-e.clientX+(a-n):e.clientX-t;l.value=Math.round(o/n*x.value)}return wt(()=>Rn(e.tag,{ref:w,class:["v-progress-linear",{"v-progress-linear--absolute":e.absolute,"v-progress-linear--active":e.active&&S.value,"v-progress-linear--reverse":B.value,"v-progress-linear--rounded":e.rounded,"v-progress-linear--rounded-bar":e.roundedBar,"v-progress-linear--striped":e.striped},b.value,i.value,o.value,e.class],style:[{bottom:"bottom"===e.location?0:void 0,top:"top"===e.location?0:void 0,height:e.active?p(C.value):0,"--v-progress-linear-height":p(C.value),...e.absolute?s.value:{}},e.style],role:"progressbar","aria-hidden":e.active?"false":"true","aria-valuemin":"0","aria-valuemax":e.max,"aria-valuenow":e.indeterminate?void 0:Math.min(parseFloat(l.value),x.value),onClick:e.clickable&&N},{default:()=>[e.stream&&Rn("div",{key:"stream",class:["v-progress-linear__stream",c.value],style:{...d.value,[B.value?"left":"right"]:p(-C.value),borderTop:`${p(C.value/2)} dotted`,opacity:parseFloat(e.bufferOpacity),top:`calc(50% - ${p(C.value/4)})`,width:p(100-_.value,"%"),"--v-progress-linear-stream-to":p(C.value*(B.value?1:-1))}},null),Rn("div",{class:["v-progress-linear__background",A?void 0:v.value],style:[f.value,{opacity:parseFloat(e.bgOpacity),width:e.stream?0:void 0}]},null),Rn("div",{class:["v-progress-linear__buffer",A?void 0:m.value],style:[g.value,{opacity:parseFloat(e.bufferOpacity),width:p(_.value,"%")}]},null),Rn(Ln,{name:P.value},{default:()=>[e.indeterminate?Rn("div",{class:"v-progress-linear__indeterminate"},[["long","short"].map(e=>Rn("div",{key:e,class:["v-progress-linear__indeterminate",e,A?void 0:h.value],style:y.value},null))]):Rn("div",{class:["v-progress-linear__determinate",A?void 0:h.value],style:[y.value,{width:p(I.value,"%")}]},null)]}),a.default&&Rn("div",{class:"v-progress-linear__content"},[a.default({value:I.value,buffer:_.value})])]})),{}}}),{createVNode:On}=await e("vue"),{toRef:zn}=await e("vue"),jn=t({loading:[Boolean,String]},"loader");function Hn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{loaderClasses:zn(()=>({[`${t}--loading`]:e.loading}))}}function Wn(e,t){let{slots:a}=t;return On("div",{class:`${e.name}__loader`},[a.default?.({color:e.color,isActive:e.active})||On(Mn,{absolute:e.absolute,active:e.active,color:e.color,height:"2",indeterminate:!0},null)])}const{toRef:Un}=await e("vue"),Gn=["static","relative","fixed","absolute","sticky"],Yn=t({position:{type:String,validator:e=>Gn.includes(e)}},"position");function qn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();return{positionClasses:Un(()=>e.position?`${t}--${e.position}`:void 0)}}const{computed:Kn,nextTick:Xn,onScopeDispose:Jn,reactive:Qn,resolveDynamicComponent:Zn,toRef:eo}=await e("vue");function to(){return i("useRouter")?.proxy?.$router}function ao(e,t){const a=Zn("RouterLink"),l=eo(()=>!(!e.href&&!e.to)),n=Kn(()=>l?.value||L(t,"click")||L(e,"click"));if("string"==typeof a||!("useLink"in a)){const t=eo(()=>e.href);return{isLink:l,isClickable:n,href:t,linkProps:Qn({href:t})}}const o=a.useLink({to:eo(()=>e.to||""),replace:eo(()=>e.replace)}),r=Kn(()=>e.to?o:void 0),s=function(){const e=i("useRoute");return Kn(()=>e?.proxy?.$route)}(),u=Kn(()=>!!r.value&&(e.exact?s.value?r.value.isExactActive?.value&&B(r.value.route.value.query,s.value.query):r.value.isExactActive?.value??!1:r.value.isActive?.value??!1)),c=Kn(()=>e.to?r.value?.route.value.href:e.href);return{isLink:l,isClickable:n,isActive:u,route:r.value?.route,navigate:r.value?.navigate,href:c,linkProps:Qn({href:c,"aria-current":eo(()=>u.value?"page":void 0)})}}const lo=t({href:String,replace:Boolean,to:[String,Object],exact:Boolean},"router");let no=!1;const{nextTick:oo,watch:io}=await e("vue");const ro=Symbol("rippleStop");function so(e,t){e.style.transform=t,e.style.webkitTransform=t}function uo(e){return"TouchEvent"===e.constructor.name}function co(e){return"KeyboardEvent"===e.constructor.name}const vo={show(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(!t?._ripple?.enabled)return;const l=document.createElement("span"),n=document.createElement("span");l.appendChild(n),l.className="v-ripple__container",a.class&&(l.className+=` ${a.class}`);const{radius:o,scale:i,x:r,y:s,centerX:u,centerY:c}=function(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},l=0,n=0;if(!co(e)){const a=t.getBoundingClientRect(),o=uo(e)?e.touches[e.touches.length-1]:e;l=o.clientX-a.left,n=o.clientY-a.top}let o=0,i=.3;t._ripple?.circle?(i=.15,o=t.clientWidth/2,o=a.center?o:o+Math.sqrt((l-o)**2+(n-o)**2)/4):o=Math.sqrt(t.clientWidth**2+t.clientHeight**2)/2;const r=(t.clientWidth-2*o)/2+"px",s=(t.clientHeight-2*o)/2+"px";return{radius:o,scale:i,x:a.center?r:l-o+"px",y:a.center?s:n-o+"px",centerX:r,centerY:s}}(e,t,a),d=2*o+"px";n.className="v-ripple__animation",n.style.width=d,n.style.height=d,t.appendChild(l);const v=window.getComputedStyle(t);v&&"static"===v.position&&(t.style.position="relative",t.dataset.previousPosition="static"),n.classList.add("v-ripple__animation--enter"),n.classList.add("v-ripple__animation--visible"),so(n,`translate(${r}, ${s}) scale3d(${i},${i},${i})`),n.dataset.activated=String(performance.now()),requestAnimationFrame(()=>{requestAnimationFrame(()=>{n.classList.remove("v-ripple__animation--enter"),n.classList.add("v-ripple__animation--in"),so(n,`translate(${u}, ${c}) scale3d(1,1,1)`)})})},hide(e){if(!e?._ripple?.enabled)return;const t=e.getElementsByClassName("v-ripple__animation");if(0===t.length)return;const a=t[t.length-1];if(a.dataset.isHiding)return;a.dataset.isHiding="true";const l=performance.now()-Number(a.dataset.activated),n=Math.max(250-l,0);setTimeout(()=>{a.classList.remove("v-ripple__animation--in"),a.classList.add("v-ripple__animation--out"),setTimeout(()=>{1===e.getElementsByClassName("v-ripple__animation").length&&e.dataset.previousPosition&&(e.style.position=e.dataset.previousPosition,delete e.dataset.previousPosition),a.parentNode?.parentNode===e&&e.removeChild(a.parentNode)},300)},n)}};function po(e){return void 0===e||!!e}function fo(e){const t={},a=e.currentTarget;if(a?._ripple&&!a._ripple.touched&&!e[ro]){if(e[ro]=!0,uo(e))a._ripple.touched=!0,a._ripple.isTouch=!0;else if(a._ripple.isTouch)return;if(t.center=a._ripple.centered||co(e),a._ripple.class&&(t.class=a._ripple.class),uo(e)){if(a._ripple.showTimerCommit)return;a._ripple.showTimerCommit=()=>{vo.show(e,a,t)},a._ripple.showTimer=window.setTimeout(()=>{a?._ripple?.showTimerCommit&&(a._ripple.showTimerCommit(),a._ripple.showTimerCommit=null)},80)}else vo.show(e,a,t)}}function mo(e){e[ro]=!0}function go(e){const t=e.currentTarget;if(t?._ripple){if(window.clearTimeout(t._ripple.showTimer),"touchend"===e.type&&t._ripple.showTimerCommit)return t._ripple.showTimerCommit(),t._ripple.showTimerCommit=null,void(t._ripple.showTimer=window.setTimeout(()=>{go(e)}));window.setTimeout(()=>{t._ripple&&(t._ripple.touched=!1)}),vo.hide(t)}}function ho(e){const t=e.currentTarget;t?._ripple&&(t._ripple.showTimerCommit&&(t._ripple.showTimerCommit=null),window.clearTimeout(t._ripple.showTimer))}let yo=!1;function bo(e){yo||e.keyCode!==F.enter&&e.keyCode!==F.space||(yo=!0,fo(e))}function wo(e){yo=!1,go(e)}function So(e){yo&&(yo=!1,go(e))}function ko(e,t,a){const{value:l,modifiers:n}=t,o=po(l);if(o||vo.hide(e),e._ripple=e._ripple??{},e._ripple.enabled=o,e._ripple.centered=n.center,e._ripple.circle=n.circle,w(l)&&l.class&&(e._ripple.class=l.class),o&&!a){if(n.stop)return e.addEventListener("touchstart",mo,{passive:!0}),void e.addEventListener("mousedown",mo);e.addEventListener("touchstart",fo,{passive:!0}),e.addEventListener("touchend",go,{passive:!0}),e.addEventListener("touchmove",ho,{passive:!0}),e.addEventListener("touchcancel",go),e.addEventListener("mousedown",fo),e.addEventListener("mouseup",go),e.addEventListener("mouseleave",go),e.addEventListener("keydown",bo),e.addEventListener("keyup",wo),e.addEventListener("blur",So),e.addEventListener("dragstart",go,{passive:!0})}else!o&&a&&xo(e)}function xo(e){e.removeEventListener("mousedown",fo),e.removeEventListener("touchstart",fo),e.removeEventListener("touchend",go),e.removeEventListener("touchmove",ho),e.removeEventListener("touchcancel",go),e.removeEventListener("mouseup",go),e.removeEventListener("mouseleave",go),e.removeEventListener("keydown",bo),e.removeEventListener("keyup",wo),e.removeEventListener("dragstart",go),e.removeEventListener("blur",So)}const Vo={mounted:function(e,t){ko(e,t,!1)},unmounted:function(e){delete e._ripple,xo(e)},updated:function(e,t){if(t.value===t.oldValue)return;ko(e,t,po(t.oldValue))}},{createVNode:Co,mergeProps:_o}=await e("vue"),{computed:Io,toDisplayString:Bo,toRef:Po,withDirectives:Ao}=await e("vue"),No=t({active:{type:Boolean,default:void 0},activeColor:String,baseColor:String,symbol:{type:null,default:un},flat:Boolean,icon:[Boolean,String,Function,Object],prependIcon:E,appendIcon:E,block:Boolean,readonly:Boolean,slim:Boolean,stacked:Boolean,ripple:{type:[Boolean,Object],default:!0},text:{type:[String,Number,Boolean],default:void 0},...Ka(),...qe(),...Al(),...ua(),...Za(),...an(),...jn(),...En(),...Yn(),...Sa(),...lo(),...pn(),...Vt({tag:"button"}),...c(),...Fl({variant:"elevated"})},"VBtn"),To=o()({name:"VBtn",props:No(),emits:{"group:selected":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{themeClasses:n}=r(e),{borderClasses:o}=Xa(e),{densityClasses:i}=Nl(e),{dimensionStyles:s}=ca(e),{elevationClasses:u}=el(e),{loaderClasses:c}=Hn(e),{locationStyles:d}=Dn(e),{positionClasses:v}=qn(e),{roundedClasses:p}=ka(e),{sizeClasses:f,sizeStyles:m}=fn(e),g=ln(e,e.symbol,!1),h=ao(e,a),y=Io(()=>void 0!==e.active?e.active:h.isLink.value?h.isActive?.value:g?.isSelected.value),b=Po(()=>y.value?e.activeColor??e.color:e.color),w=Io(()=>({color:g?.isSelected.value&&(!h.isLink.value||h.isActive?.value)||!g||h.isActive?.value?b.value??e.baseColor:e.baseColor,variant:e.variant})),{colorClasses:S,colorStyles:k,variantClasses:x}=Ml(w),V=Io(()=>g?.disabled.value||e.disabled),C=Po(()=>"elevated"===e.variant&&!(e.disabled||e.flat||e.border)),_=Io(()=>{if(void 0!==e.value&&"symbol"!=typeof e.value)return Object(e.value)===e.value?JSON.stringify(e.value,null,0):e.value});function I(e){V.value||h.isLink.value&&(e.metaKey||e.ctrlKey||e.shiftKey||0!==e.button||"_blank"===a.target)||(h.navigate?.(e),g?.toggle())}return function(e,t){io(()=>e.isActive?.value,a=>{e.isLink.value&&a&&t&&oo(()=>{t(!0)})},{immediate:!0})}(h,g?.select),wt(()=>{const t=h.isLink.value?"a":e.tag,a=!(!e.prependIcon&&!l.prepend),r=!(!e.appendIcon&&!l.append),b=!(!e.icon||!0===e.icon);return Ao(Co(t,_o({type:"a"===t?void 0:"button",class:["v-btn",g?.selectedClass.value,{"v-btn--active":y.value,"v-btn--block":e.block,"v-btn--disabled":V.value,"v-btn--elevated":C.value,"v-btn--flat":e.flat,"v-btn--icon":!!e.icon,"v-btn--loading":e.loading,"v-btn--readonly":e.readonly,"v-btn--slim":e.slim,"v-btn--stacked":e.stacked},n.value,o.value,S.value,i.value,u.value,c.value,v.value,p.value,f.value,x.value,e.class],style:[k.value,s.value,d.value,m.value,e.style],"aria-busy":!!e.loading||void 0,disabled:V.value||void 0,tabindex:e.loading||e.readonly?-1:void 0,onClick:I,value:_.value},h.linkProps),{default:()=>[Ll(!0,"v-btn"),!e.icon&&a&&Co("span",{key:"prepend",class:"v-btn__prepend"},[l.prepend?Co(ra,{key:"prepend-defaults",disabled:!e.prependIcon,defaults:{VIcon:{icon:e.prependIcon}}},l.prepend):Co(bn,{key:"prepend-icon",icon:e.prependIcon},null)]),Co("span",{class:"v-btn__content","data-no-activator":""},[!l.default&&b?Co(bn,{key:"content-icon",icon:e.icon},null):Co(ra,{key:"content-defaults",disabled:!b,defaults:{VIcon:{icon:e.icon}}},{default:()=>[l.default?.()??Bo(e.text)]})]),!e.icon&&r&&Co("span",{key:"append",class:"v-btn__append"},[l.append?Co(ra,{key:"append-defaults",disabled:!e.appendIcon,defaults:{VIcon:{icon:e.appendIcon}}},l.append):Co(bn,{key:"append-icon",icon:e.appendIcon},null)]),!!e.loading&&Co("span",{key:"loader",class:"v-btn__loader"},[l.loader?.()??Co(An,{color:"boolean"==typeof e.loading?void 0:e.loading,indeterminate:!0,width:"2"},null)])]}),[[Vo,!V.value&&e.ripple,"",{center:!!e.icon}]])}),{group:g}}}),{mergeProps:Eo,createVNode:Do}=await e("vue"),Ro=t({...No({icon:"$menu",variant:"text"})},"VAppBarNavIcon"),$o=o()({name:"VAppBarNavIcon",props:Ro(),setup(e,t){let{slots:a}=t;return wt(()=>Do(To,Eo(e,{class:["v-app-bar-nav-icon"]}),a)),{}}}),{mergeProps:Lo,createVNode:Fo}=await e("vue"),Mo=o()({name:"VAppBarTitle",props:_t(),setup(e,t){let{slots:a}=t;return wt(()=>Fo(It,Lo(e,{class:"v-app-bar-title"}),a)),{}}}),Oo=vt("v-alert-title"),{createVNode:zo,mergeProps:jo}=await e("vue"),{toRef:Ho}=await e("vue"),Wo=["success","info","warning","error"],Uo=t({border:{type:[Boolean,String],validator:e=>"boolean"==typeof e||["top","end","bottom","start"].includes(e)},borderColor:String,closable:Boolean,closeIcon:{type:E,default:"$close"},closeLabel:{type:String,default:"$vuetify.close"},icon:{type:[Boolean,String,Function,Object],default:null},modelValue:{type:Boolean,default:!0},prominent:Boolean,title:String,text:String,type:{type:String,validator:e=>Wo.includes(e)},...qe(),...Al(),...ua(),...Za(),...En(),...Yn(),...Sa(),...Vt(),...c(),...Fl({variant:"flat"})},"VAlert"),Go=o()({name:"VAlert",props:Uo(),emits:{"click:close":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=V(e,"modelValue"),o=Ho(()=>{if(!1!==e.icon)return e.type?e.icon??`$${e.type}`:e.icon}),{themeClasses:i}=r(e),{colorClasses:s,colorStyles:u,variantClasses:c}=Ml(()=>({color:e.color??e.type,variant:e.variant})),{densityClasses:d}=Nl(e),{dimensionStyles:v}=ca(e),{elevationClasses:p}=el(e),{locationStyles:f}=Dn(e),{positionClasses:m}=qn(e),{roundedClasses:g}=ka(e),{textColorClasses:h,textColorStyles:y}=ha(()=>e.borderColor),{t:b}=M(),w=Ho(()=>({"aria-label":b(e.closeLabel),onClick(e){n.value=!1,a("click:close",e)}}));return()=>{const t=!(!l.prepend&&!o.value),a=!(!l.title&&!e.title),r=!(!l.close&&!e.closable);return n.value&&zo(e.tag,{class:["v-alert",e.border&&{"v-alert--border":!!e.border,[`v-alert--border-${!0===e.border?"start":e.border}`]:!0},{"v-alert--prominent":e.prominent},i.value,s.value,d.value,p.value,m.value,g.value,c.value,e.class],style:[u.value,v.value,f.value,e.style],role:"alert"},{default:()=>[Ll(!1,"v-alert"),e.border&&zo("div",{key:"border",class:["v-alert__border",h.value],style:y.value},null),t&&zo("div",{key:"prepend",class:"v-alert__prepend"},[l.prepend?zo(ra,{key:"prepend-defaults",disabled:!o.value,defaults:{VIcon:{density:e.density,icon:o.value,size:e.prominent?44:28}}},l.prepend):zo(bn,{key:"prepend-icon",density:e.density,icon:o.value,size:e.prominent?44:28},null)]),zo("div",{class:"v-alert__content"},[a&&zo(Oo,{key:"title"},{default:()=>[l.title?.()??e.title]}),l.text?.()??e.text,l.default?.()]),l.append&&zo("div",{key:"append",class:"v-alert__append"},[l.append()]),r&&zo("div",{key:"close",class:"v-alert__close"},[l.close?zo(ra,{key:"close-defaults",defaults:{VBtn:{icon:e.closeIcon,size:"x-small",variant:"text"}}},{default:()=>[l.close?.({props:w.value})]}):zo(To,jo({key:"close-btn",icon:e.closeIcon,size:"x-small",variant:"text"},w.value),null)])]})}}}),{createVNode:Yo}=await e("vue"),qo=t({start:Boolean,end:Boolean,icon:E,image:String,text:String,...Ka(),...qe(),...Al(),...Sa(),...pn(),...Vt(),...c(),...Fl({variant:"flat"})},"VAvatar"),Ko=o()({name:"VAvatar",props:qo(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{borderClasses:n}=Xa(e),{colorClasses:o,colorStyles:i,variantClasses:s}=Ml(e),{densityClasses:u}=Nl(e),{roundedClasses:c}=ka(e),{sizeClasses:d,sizeStyles:v}=fn(e);return wt(()=>Yo(e.tag,{class:["v-avatar",{"v-avatar--start":e.start,"v-avatar--end":e.end},l.value,n.value,o.value,u.value,c.value,d.value,s.value,e.class],style:[i.value,v.value,e.style]},{default:()=>[a.default?Yo(ra,{key:"content-defaults",defaults:{VImg:{cover:!0,src:e.image},VIcon:{icon:e.icon}}},{default:()=>[a.default()]}):e.image?Yo(Ya,{key:"image",src:e.image,alt:"",cover:!0},null):e.icon?Yo(bn,{key:"icon",icon:e.icon},null):e.text,Ll(!1,"v-avatar")]})),{}}}),{createVNode:Xo}=await e("vue"),Jo=t({text:String,onClick:O(),...qe(),...c()},"VLabel"),Qo=o()({name:"VLabel",props:Jo(),setup(e,t){let{slots:a}=t;return wt(()=>Xo("label",{class:["v-label",{"v-label--clickable":!!e.onClick},e.class],style:e.style,onClick:e.onClick},[e.text,a.default?.()])),{}}}),{createVNode:Zo}=await e("vue"),{onScopeDispose:ei,provide:ti,toRef:ai,useId:li}=await e("vue"),ni=Symbol.for("vuetify:selection-control-group"),oi=t({color:String,disabled:{type:Boolean,default:null},defaultsTarget:String,error:Boolean,id:String,inline:Boolean,falseIcon:E,trueIcon:E,ripple:{type:[Boolean,Object],default:!0},multiple:{type:Boolean,default:null},name:String,readonly:{type:Boolean,default:null},modelValue:null,type:String,valueComparator:{type:Function,default:B},...qe(),...Al(),...c()},"SelectionControlGroup"),ii=t({...oi({defaultsTarget:"VSelectionControl"})},"VSelectionControlGroup"),ri=o()({name:"VSelectionControlGroup",props:ii(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),n=li(),o=ai(()=>e.id||`v-selection-control-group-${n}`),i=ai(()=>e.name||o.value),r=new Set;return ti(ni,{modelValue:l,forceUpdate:()=>{r.forEach(e=>e())},onForceUpdate:e=>{r.add(e),ei(()=>{r.delete(e)})}}),v({[e.defaultsTarget]:{color:ai(()=>e.color),disabled:ai(()=>e.disabled),density:ai(()=>e.density),error:ai(()=>e.error),inline:ai(()=>e.inline),modelValue:l,multiple:ai(()=>!!e.multiple||null==e.multiple&&Array.isArray(l.value)),name:i,falseIcon:ai(()=>e.falseIcon),trueIcon:ai(()=>e.trueIcon),readonly:ai(()=>e.readonly),ripple:ai(()=>e.ripple),type:ai(()=>e.type),valueComparator:ai(()=>e.valueComparator)}}),wt(()=>Zo("div",{class:["v-selection-control-group",{"v-selection-control-group--inline":e.inline},e.class],style:e.style,role:"radio"===e.type?"radiogroup":void 0},[a.default?.()])),{}}}),{mergeProps:si,createVNode:ui,Fragment:ci,resolveDirective:di,withDirectives:vi}=await e("vue"),{computed:pi,inject:fi,nextTick:mi,ref:gi,shallowRef:hi,toRef:yi,useId:bi}=await e("vue"),wi=t({label:String,baseColor:String,trueValue:null,falseValue:null,value:null,...qe(),...oi()},"VSelectionControl");const Si=o()({name:"VSelectionControl",directives:{Ripple:Vo},inheritAttrs:!1,props:wi(),emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{group:n,densityClasses:o,icon:i,model:r,textColorClasses:s,textColorStyles:u,backgroundColorClasses:c,backgroundColorStyles:d,trueValue:v}=function(e){const t=fi(ni,void 0),{densityClasses:a}=Nl(e),l=V(e,"modelValue"),n=pi(()=>void 0!==e.trueValue?e.trueValue:void 0===e.value||e.value),o=pi(()=>void 0!==e.falseValue&&e.falseValue),i=pi(()=>!!e.multiple||null==e.multiple&&Array.isArray(l.value)),r=pi({get(){const a=t?t.modelValue.value:l.value;return i.value?P(a).some(t=>e.valueComparator(t,n.value)):e.valueComparator(a,n.value)},set(a){if(e.readonly)return;const r=a?n.value:o.value;let s=r;i.value&&(s=a?[...P(l.value),r]:P(l.value).filter(t=>!e.valueComparator(t,n.value))),t?t.modelValue.value=s:l.value=s}}),{textColorClasses:s,textColorStyles:u}=ha(()=>{if(!e.error&&!e.disabled)return r.value?e.color:e.baseColor}),{backgroundColorClasses:c,backgroundColorStyles:d}=ya(()=>!r.value||e.error||e.disabled?e.baseColor:e.color),v=pi(()=>r.value?e.trueIcon:e.falseIcon);return{group:t,densityClasses:a,trueValue:n,falseValue:o,model:r,textColorClasses:s,textColorStyles:u,backgroundColorClasses:c,backgroundColorStyles:d,icon:v}}(e),p=bi(),f=hi(!1),m=hi(!1),g=gi(),h=yi(()=>e.id||`input-${p}`),y=yi(()=>!e.disabled&&!e.readonly);function b(e){y.value&&(f.value=!0,!1!==j(e.target,":focus-visible")&&(m.value=!0))}function w(){f.value=!1,m.value=!1}function S(e){e.stopPropagation()}function k(t){y.value?(e.readonly&&n&&mi(()=>n.forceUpdate()),r.value=t.target.checked):g.value&&(g.value.checked=r.value)}return n?.onForceUpdate(()=>{g.value&&(g.value.checked=r.value)}),wt(()=>{const t=l.label?l.label({label:e.label,props:{for:h.value}}):e.label,[n,p]=z(a),y=ui("input",si({ref:g,checked:r.value,disabled:!!e.disabled,id:h.value,onBlur:w,onFocus:b,onInput:k,"aria-disabled":!!e.disabled,"aria-label":e.label,type:e.type,value:v.value,name:e.name,"aria-checked":"checkbox"===e.type?r.value:void 0},p),null);return ui("div",si({class:["v-selection-control",{"v-selection-control--dirty":r.value,"v-selection-control--disabled":e.disabled,"v-selection-control--error":e.error,"v-selection-control--focused":f.value,"v-selection-control--focus-visible":m.value,"v-selection-control--inline":e.inline},o.value,e.class]},n,{style:e.style}),[ui("div",{class:["v-selection-control__wrapper",s.value],style:u.value},[l.default?.({backgroundColorClasses:c,backgroundColorStyles:d}),vi(ui("div",{class:["v-selection-control__input"]},[l.input?.({model:r,textColorClasses:s,textColorStyles:u,backgroundColorClasses:c,backgroundColorStyles:d,inputNode:y,icon:i.value,props:{onFocus:b,onBlur:w,id:h.value}})??ui(ci,null,[i.value&&ui(bn,{key:"icon",icon:i.value},null),y])]),[[di("ripple"),e.ripple&&[!e.disabled&&!e.readonly,null,["center","circle"]]]])]),t&&ui(Qo,{for:h.value,onClick:S},{default:()=>[t]})])}),{isFocused:f,input:g}}}),{mergeProps:ki,createVNode:xi}=await e("vue"),{toRef:Vi}=await e("vue"),Ci=t({indeterminate:Boolean,indeterminateIcon:{type:E,default:"$checkboxIndeterminate"},...wi({falseIcon:"$checkboxOff",trueIcon:"$checkboxOn"})},"VCheckboxBtn"),_i=o()({name:"VCheckboxBtn",props:Ci(),emits:{"update:modelValue":e=>!0,"update:indeterminate":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"indeterminate"),n=V(e,"modelValue");function o(e){l.value&&(l.value=!1)}const i=Vi(()=>l.value?e.indeterminateIcon:e.falseIcon),r=Vi(()=>l.value?e.indeterminateIcon:e.trueIcon);return wt(()=>{const t=H(Si.filterProps(e),["modelValue"]);return xi(Si,ki(t,{modelValue:n.value,"onUpdate:modelValue":[e=>n.value=e,o],class:["v-checkbox-btn",e.class],style:e.style,type:"checkbox",falseIcon:i.value,trueIcon:r.value,"aria-checked":l.value?"mixed":void 0}),a)}),{}}}),{createVNode:Ii}=await e("vue");function Bi(e){const{t:t}=M();return{InputIcon:function(a){let{name:l,color:n}=a;const o={prepend:"prependAction",prependInner:"prependAction",append:"appendAction",appendInner:"appendAction",clear:"clear"}[l],i=e[`onClick:${l}`],r=i&&o?t(`$vuetify.input.${o}`,e.label??""):void 0;return Ii(bn,{icon:e[`${l}Icon`],"aria-label":r,onClick:i,onKeydown:function(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),W(i,new PointerEvent("click",e)))},color:n},null)}}}const{createVNode:Pi}=await e("vue"),{computed:Ai}=await e("vue"),Ni=t({active:Boolean,color:String,messages:{type:[Array,String],default:()=>[]},...qe(),...Ia({transition:{component:ta,leaveAbsolute:!0,group:!0}})},"VMessages"),Ti=o()({name:"VMessages",props:Ni(),setup(e,t){let{slots:a}=t;const l=Ai(()=>P(e.messages)),{textColorClasses:n,textColorStyles:o}=ha(()=>e.color);return wt(()=>Pi(Ba,{transition:e.transition,tag:"div",class:["v-messages",n.value,e.class],style:[o.value,e.style]},{default:()=>[e.active&&l.value.map((e,t)=>Pi("div",{class:"v-messages__message",key:`${t}-${l.value}`},[a.message?a.message({message:e}):e]))]})),{}}}),{toRef:Ei}=await e("vue"),Di=t({focused:Boolean,"onUpdate:focused":O()},"focus");function Ri(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b();const a=V(e,"focused");return{focusClasses:Ei(()=>({[`${t}--focused`]:a.value})),isFocused:a,focus:function(){a.value=!0},blur:function(){a.value=!1}}}const{computed:$i,inject:Li,markRaw:Fi,provide:Mi,ref:Oi,shallowRef:zi,toRef:ji,watch:Hi}=await e("vue"),Wi=Symbol.for("vuetify:form"),Ui=t({disabled:Boolean,fastFail:Boolean,readonly:Boolean,modelValue:{type:Boolean,default:null},validateOn:{type:String,default:"input"}},"form");function Gi(e){const t=Li(Wi,null);return{...t,isReadonly:$i(()=>!!(e?.readonly??t?.isReadonly.value)),isDisabled:$i(()=>!!(e?.disabled??t?.isDisabled.value))}}const{computed:Yi,nextTick:qi,onBeforeMount:Ki,onBeforeUnmount:Xi,onMounted:Ji,ref:Qi,shallowRef:Zi,unref:er,useId:tr,watch:ar}=await e("vue"),lr=t({disabled:{type:Boolean,default:null},error:Boolean,errorMessages:{type:[Array,String],default:()=>[]},maxErrors:{type:[Number,String],default:1},name:String,label:String,readonly:{type:Boolean,default:null},rules:{type:Array,default:()=>[]},modelValue:null,validateOn:String,validationValue:null,...Di()},"validation");function nr(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:b(),a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:tr();const l=V(e,"modelValue"),n=Yi(()=>void 0===e.validationValue?l.value:e.validationValue),o=Gi(e),r=Qi([]),s=Zi(!0),u=Yi(()=>!(!P(""===l.value?null:l.value).length&&!P(""===n.value?null:n.value).length)),c=Yi(()=>e.errorMessages?.length?P(e.errorMessages).concat(r.value).slice(0,Math.max(0,Number(e.maxErrors))):r.value),d=Yi(()=>{let t=(e.validateOn??o.validateOn?.value)||"input";"lazy"===t&&(t="input lazy"),"eager"===t&&(t="input eager");const a=new Set(t?.split(" ")??[]);return{input:a.has("input"),blur:a.has("blur")||a.has("input")||a.has("invalid-input"),invalidInput:a.has("invalid-input"),lazy:a.has("lazy"),eager:a.has("eager")}}),v=Yi(()=>!e.error&&!e.errorMessages?.length&&(!e.rules.length||(s.value?!r.value.length&&!d.value.lazy||null:!r.value.length))),p=Zi(!1),f=Yi(()=>({[`${t}--error`]:!1===v.value,[`${t}--dirty`]:u.value,[`${t}--disabled`]:o.isDisabled.value,[`${t}--readonly`]:o.isReadonly.value})),m=i("validation"),g=Yi(()=>e.name??er(a));async function h(){l.value=null,await qi(),await y()}async function y(){s.value=!0,d.value.lazy?r.value=[]:await w(!d.value.eager)}async function w(){let t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];const a=[];p.value=!0;for(const l of e.rules){if(a.length>=Number(e.maxErrors??1))break;const t="function"==typeof l?l:()=>l,o=await t(n.value);!0!==o&&(!1===o||"string"==typeof o?a.push(o||""):console.warn(`${o} is not a valid value. Rule functions must return boolean true or a string.`))}return r.value=a,p.value=!1,s.value=t,r.value}return Ki(()=>{o.register?.({id:g.value,vm:m,validate:w,reset:h,resetValidation:y})}),Xi(()=>{o.unregister?.(g.value)}),Ji(async()=>{d.value.lazy||await w(!d.value.eager),o.update?.(g.value,v.value,c.value)}),C(()=>d.value.input||d.value.invalidInput&&!1===v.value,()=>{ar(n,()=>{if(null!=n.value)w();else if(e.focused){const t=ar(()=>e.focused,e=>{e||w(),t()})}})}),C(()=>d.value.blur,()=>{ar(()=>e.focused,e=>{e||w()})}),ar([v,c],()=>{o.update?.(g.value,v.value,c.value)}),{errorMessages:c,isDirty:u,isDisabled:o.isDisabled,isReadonly:o.isReadonly,isPristine:s,isValid:v,isValidating:p,reset:h,resetValidation:y,validate:w,validationClasses:f}}const{createVNode:or}=await e("vue"),{computed:ir,toRef:rr,useId:sr}=await e("vue"),ur=t({id:String,appendIcon:E,baseColor:String,centerAffix:{type:Boolean,default:!0},color:String,glow:Boolean,iconColor:[Boolean,String],prependIcon:E,hideDetails:[Boolean,String],hideSpinButtons:Boolean,hint:String,persistentHint:Boolean,messages:{type:[Array,String],default:()=>[]},direction:{type:String,default:"horizontal",validator:e=>["horizontal","vertical"].includes(e)},"onClick:prepend":O(),"onClick:append":O(),...qe(),...Al(),...U(ua(),["maxWidth","minWidth","width"]),...c(),...lr()},"VInput"),cr=o()({name:"VInput",props:{...ur()},emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l,emit:n}=t;const{densityClasses:o}=Nl(e),{dimensionStyles:i}=ca(e),{themeClasses:s}=r(e),{rtlClasses:c}=u(),{InputIcon:d}=Bi(e),v=sr(),p=ir(()=>e.id||`input-${v}`),f=ir(()=>`${p.value}-messages`),{errorMessages:m,isDirty:g,isDisabled:h,isReadonly:y,isPristine:b,isValid:w,isValidating:S,reset:k,resetValidation:x,validate:V,validationClasses:C}=nr(e,"v-input",p),_=ir(()=>({id:p,messagesId:f,isDirty:g,isDisabled:h,isReadonly:y,isPristine:b,isValid:w,isValidating:S,reset:k,resetValidation:x,validate:V})),I=rr(()=>e.error||e.disabled?void 0:e.focused?e.color:e.baseColor),B=rr(()=>{if(e.iconColor)return!0===e.iconColor?I.value:e.iconColor}),P=ir(()=>e.errorMessages?.length||!b.value&&m.value.length?m.value:e.hint&&(e.persistentHint||e.focused)?e.hint:e.messages);return wt(()=>{const t=!(!l.prepend&&!e.prependIcon),a=!(!l.append&&!e.appendIcon),n=P.value.length>0,r=!e.hideDetails||"auto"===e.hideDetails&&(n||!!l.details);return or("div",{class:["v-input",`v-input--${e.direction}`,{"v-input--center-affix":e.centerAffix,"v-input--focused":e.focused,"v-input--glow":e.glow,"v-input--hide-spin-buttons":e.hideSpinButtons},o.value,s.value,c.value,C.value,e.class],style:[i.value,e.style]},[t&&or("div",{key:"prepend",class:"v-input__prepend"},[l.prepend?.(_.value),e.prependIcon&&or(d,{key:"prepend-icon",name:"prepend",color:B.value},null)]),l.default&&or("div",{class:"v-input__control"},[l.default?.(_.value)]),a&&or("div",{key:"append",class:"v-input__append"},[e.appendIcon&&or(d,{key:"append-icon",name:"append",color:B.value},null),l.append?.(_.value)]),r&&or("div",{id:f.value,class:"v-input__details",role:"alert","aria-live":"polite"},[or(Ti,{active:n,messages:P.value},{message:l.message}),l.details?.(_.value)])])}),{reset:k,resetValidation:x,validate:V,isValid:w,errorMessages:m}}}),{mergeProps:dr,createVNode:vr}=await e("vue"),{useId:pr}=await e("vue"),fr=t({...ur(),...H(Ci(),["inline"])},"VCheckbox"),mr=o()({name:"VCheckbox",inheritAttrs:!1,props:fr(),emits:{"update:modelValue":e=>!0,"update:focused":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=V(e,"modelValue"),{isFocused:o,focus:i,blur:r}=Ri(e),s=pr();return wt(()=>{const[t,u]=z(a),c=cr.filterProps(e),d=_i.filterProps(e);return vr(cr,dr({class:["v-checkbox",e.class]},t,c,{modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,id:e.id||`checkbox-${s}`,focused:o.value,style:e.style}),{...l,default:e=>{let{id:t,messagesId:a,isDisabled:o,isReadonly:s,isValid:c}=e;return vr(_i,dr(d,{id:t.value,"aria-describedby":a.value,disabled:o.value,readonly:s.value},u,{error:!1===c.value,modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,onFocus:i,onBlur:r}),l)}})}),{}}});function gr(e,t){const a=e?"scrollWidth":"scrollHeight";return t?.[a]||0}function hr(e,t,a){if(!a)return 0;const{scrollLeft:l,offsetWidth:n,scrollWidth:o}=a;return e?t?o-n+l:l:a.scrollTop}function yr(e,t){const a=e?"offsetWidth":"offsetHeight";return t?.[a]||0}function br(e,t){const a=e?"offsetLeft":"offsetTop";return t?.[a]||0}const{createVNode:wr}=await e("vue"),{computed:Sr,shallowRef:kr,watch:xr}=await e("vue"),Vr=Symbol.for("vuetify:v-slide-group"),Cr=t({centerActive:Boolean,direction:{type:String,default:"horizontal"},symbol:{type:null,default:Vr},nextIcon:{type:E,default:"$next"},prevIcon:{type:E,default:"$prev"},showArrows:{type:[Boolean,String],validator:e=>"boolean"==typeof e||["always","desktop","mobile"].includes(e)},...qe(),...q({mobile:null}),...Vt(),...tn({selectedClass:"v-slide-group-item--active"})},"VSlideGroup"),_r=o()({name:"VSlideGroup",props:Cr(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{isRtl:l}=u(),{displayClasses:n,mobile:o}=G(e),i=nn(e,e.symbol),r=kr(!1),s=kr(0),c=kr(0),d=kr(0),v=Sr(()=>"horizontal"===e.direction),{resizeRef:p,contentRect:f}=R(),{resizeRef:m,contentRect:g}=R(),h=Y(),y=Sr(()=>({container:p.el,duration:200,easing:"easeOutQuart"})),b=Sr(()=>i.selected.value.length?i.items.value.findIndex(e=>e.id===i.selected.value[0]):-1),w=Sr(()=>i.selected.value.length?i.items.value.findIndex(e=>e.id===i.selected.value[i.selected.value.length-1]):-1);if($){let t=-1;xr(()=>[i.selected.value,f.value,g.value,v.value],()=>{cancelAnimationFrame(t),t=requestAnimationFrame(()=>{if(f.value&&g.value){const e=v.value?"width":"height";c.value=f.value[e],d.value=g.value[e],r.value=c.value+1<d.value}if(b.value>=0&&m.el){k(m.el.children[w.value],e.centerActive)}})})}const S=kr(!1);function k(e,t){let a=0;a=t?function(e){let{selectedElement:t,containerElement:a,isHorizontal:l}=e;const n=yr(l,a);return br(l,t)-n/2+yr(l,t)/2}({containerElement:p.el,isHorizontal:v.value,selectedElement:e}):function(e){let{selectedElement:t,containerElement:a,isRtl:l,isHorizontal:n}=e;const o=yr(n,a),i=hr(n,l,a),r=yr(n,t),s=br(n,t),u=.4*r;return i>s?s-u:i+o<s+r?s-o+r+u:i}({containerElement:p.el,isHorizontal:v.value,isRtl:l.value,selectedElement:e}),x(a)}function x(e){if(!$||!p.el)return;const t=yr(v.value,p.el),a=hr(v.value,l.value,p.el);if(!(gr(v.value,p.el)<=t||Math.abs(e-a)<16)){if(v.value&&l.value&&p.el){const{scrollWidth:t,offsetWidth:a}=p.el;e=t-a-e}v.value?h.horizontal(e,y.value):h(e,y.value)}}function V(e){const{scrollTop:t,scrollLeft:a}=e.target;s.value=v.value?a:t}function C(e){if(S.value=!0,r.value&&m.el)for(const t of e.composedPath())for(const e of m.el.children)if(e===t)return void k(e)}function _(e){S.value=!1}let I=!1;function B(e){I||S.value||e.relatedTarget&&m.el?.contains(e.relatedTarget)||T(),I=!1}function P(){I=!0}function A(e){function t(t){e.preventDefault(),T(t)}m.el&&(v.value?"ArrowRight"===e.key?t(l.value?"prev":"next"):"ArrowLeft"===e.key&&t(l.value?"next":"prev"):"ArrowDown"===e.key?t("next"):"ArrowUp"===e.key&&t("prev"),"Home"===e.key?t("first"):"End"===e.key&&t("last"))}function N(e,t){if(!e)return;let a=e;do{a=a?.["next"===t?"nextElementSibling":"previousElementSibling"]}while(a?.hasAttribute("disabled"));return a}function T(e){if(!m.el)return;let t;if(e)if("next"===e){if(t=N(m.el.querySelector(":focus"),e),!t)return T("first")}else if("prev"===e){if(t=N(m.el.querySelector(":focus"),e),!t)return T("last")}else"first"===e?(t=m.el.firstElementChild,t?.hasAttribute("disabled")&&(t=N(t,"next"))):"last"===e&&(t=m.el.lastElementChild,t?.hasAttribute("disabled")&&(t=N(t,"prev")));else{t=K(m.el)[0]}t&&t.focus({preventScroll:!0})}function E(e){const t=v.value&&l.value?-1:1,a=("prev"===e?-t:t)*c.value;let n=s.value+a;if(v.value&&l.value&&p.el){const{scrollWidth:e,offsetWidth:t}=p.el;n+=e-t}x(n)}const D=Sr(()=>({next:i.next,prev:i.prev,select:i.select,isSelected:i.isSelected})),L=Sr(()=>{switch(e.showArrows){case"always":return!0;case"desktop":return!o.value;case!0:return r.value||Math.abs(s.value)>0;case"mobile":return o.value||r.value||Math.abs(s.value)>0;default:return!o.value&&(r.value||Math.abs(s.value)>0)}}),F=Sr(()=>Math.abs(s.value)>1),M=Sr(()=>{if(!p.value)return!1;const e=gr(v.value,p.el),t=function(e,t){const a=e?"clientWidth":"clientHeight";return t?.[a]||0}(v.value,p.el);return e-t-Math.abs(s.value)>1});return wt(()=>wr(e.tag,{class:["v-slide-group",{"v-slide-group--vertical":!v.value,"v-slide-group--has-affixes":L.value,"v-slide-group--is-overflowing":r.value},n.value,e.class],style:e.style,tabindex:S.value||i.selected.value.length?-1:0,onFocus:B},{default:()=>[L.value&&wr("div",{key:"prev",class:["v-slide-group__prev",{"v-slide-group__prev--disabled":!F.value}],onMousedown:P,onClick:()=>F.value&&E("prev")},[a.prev?.(D.value)??wr(Yt,null,{default:()=>[wr(bn,{icon:l.value?e.nextIcon:e.prevIcon},null)]})]),wr("div",{key:"container",ref:p,class:"v-slide-group__container",onScroll:V},[wr("div",{ref:m,class:"v-slide-group__content",onFocusin:C,onFocusout:_,onKeydown:A},[a.default?.(D.value)])]),L.value&&wr("div",{key:"next",class:["v-slide-group__next",{"v-slide-group__next--disabled":!M.value}],onMousedown:P,onClick:()=>M.value&&E("next")},[a.next?.(D.value)??wr(Yt,null,{default:()=>[wr(bn,{icon:l.value?e.prevIcon:e.nextIcon},null)]})])]})),{selected:i.selected,scrollTo:E,scrollOffset:s,focus:T,hasPrev:F,hasNext:M}}}),{mergeProps:Ir,createVNode:Br}=await e("vue"),{toRef:Pr}=await e("vue"),Ar=Symbol.for("vuetify:v-chip-group"),Nr=t({baseColor:String,column:Boolean,filter:Boolean,valueComparator:{type:Function,default:B},...Cr(),...qe(),...tn({selectedClass:"v-chip--selected"}),...Vt(),...c(),...Fl({variant:"tonal"})},"VChipGroup"),Tr=o()({name:"VChipGroup",props:Nr(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{isSelected:n,select:o,next:i,prev:s,selected:u}=nn(e,Ar);return v({VChip:{baseColor:Pr(()=>e.baseColor),color:Pr(()=>e.color),disabled:Pr(()=>e.disabled),filter:Pr(()=>e.filter),variant:Pr(()=>e.variant)}}),wt(()=>{const t=_r.filterProps(e);return Br(_r,Ir(t,{class:["v-chip-group",{"v-chip-group--column":e.column},l.value,e.class],style:e.style}),{default:()=>[a.default?.({isSelected:n,select:o,next:i,prev:s,selected:u.value})]})}),{}}}),{createVNode:Er,vShow:Dr,withDirectives:Rr,Fragment:$r,mergeProps:Lr,resolveDirective:Fr}=await e("vue"),{computed:Mr,toDisplayString:Or,toRef:zr}=await e("vue"),jr=t({activeClass:String,appendAvatar:String,appendIcon:E,baseColor:String,closable:Boolean,closeIcon:{type:E,default:"$delete"},closeLabel:{type:String,default:"$vuetify.close"},draggable:Boolean,filter:Boolean,filterIcon:{type:E,default:"$complete"},label:Boolean,link:{type:Boolean,default:void 0},pill:Boolean,prependAvatar:String,prependIcon:E,ripple:{type:[Boolean,Object],default:!0},text:{type:[String,Number,Boolean],default:void 0},modelValue:{type:Boolean,default:!0},onClick:O(),onClickOnce:O(),...Ka(),...qe(),...Al(),...Za(),...an(),...Sa(),...lo(),...pn(),...Vt({tag:"span"}),...c(),...Fl({variant:"tonal"})},"VChip"),Hr=o()({name:"VChip",directives:{Ripple:Vo},props:jr(),emits:{"click:close":e=>!0,"update:modelValue":e=>!0,"group:selected":e=>!0,click:e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{t:o}=M(),{borderClasses:i}=Xa(e),{densityClasses:s}=Nl(e),{elevationClasses:u}=el(e),{roundedClasses:c}=ka(e),{sizeClasses:d}=fn(e),{themeClasses:v}=r(e),p=V(e,"modelValue"),f=ln(e,Ar,!1),m=ao(e,a),g=zr(()=>!1!==e.link&&m.isLink.value),h=Mr(()=>!e.disabled&&!1!==e.link&&(!!f||e.link||m.isClickable.value)),y=zr(()=>({"aria-label":o(e.closeLabel),onClick(e){e.preventDefault(),e.stopPropagation(),p.value=!1,l("click:close",e)}})),{colorClasses:b,colorStyles:w,variantClasses:S}=Ml(()=>({color:!f||f.isSelected.value?e.color??e.baseColor:e.baseColor,variant:e.variant}));function k(e){l("click",e),h.value&&(m.navigate?.(e),f?.toggle())}function x(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),k(e))}return()=>{const t=m.isLink.value?"a":e.tag,a=!(!e.appendIcon&&!e.appendAvatar),l=!(!a&&!n.append),o=!(!n.close&&!e.closable),r=!(!n.filter&&!e.filter)&&f,V=!(!e.prependIcon&&!e.prependAvatar),C=!(!V&&!n.prepend);return p.value&&Rr(Er(t,Lr({class:["v-chip",{"v-chip--disabled":e.disabled,"v-chip--label":e.label,"v-chip--link":h.value,"v-chip--filter":r,"v-chip--pill":e.pill,[`${e.activeClass}`]:e.activeClass&&m.isActive?.value},v.value,i.value,b.value,s.value,u.value,c.value,d.value,S.value,f?.selectedClass.value,e.class],style:[w.value,e.style],disabled:e.disabled||void 0,draggable:e.draggable,tabindex:h.value?0:void 0,onClick:k,onKeydown:h.value&&!g.value&&x},m.linkProps),{default:()=>[Ll(h.value,"v-chip"),r&&Er(na,{key:"filter"},{default:()=>[Rr(Er("div",{class:"v-chip__filter"},[n.filter?Er(ra,{key:"filter-defaults",disabled:!e.filterIcon,defaults:{VIcon:{icon:e.filterIcon}}},n.filter):Er(bn,{key:"filter-icon",icon:e.filterIcon},null)]),[[Dr,f.isSelected.value]])]}),C&&Er("div",{key:"prepend",class:"v-chip__prepend"},[n.prepend?Er(ra,{key:"prepend-defaults",disabled:!V,defaults:{VAvatar:{image:e.prependAvatar,start:!0},VIcon:{icon:e.prependIcon,start:!0}}},n.prepend):Er($r,null,[e.prependIcon&&Er(bn,{key:"prepend-icon",icon:e.prependIcon,start:!0},null),e.prependAvatar&&Er(Ko,{key:"prepend-avatar",image:e.prependAvatar,start:!0},null)])]),Er("div",{class:"v-chip__content","data-no-activator":""},[n.default?.({isSelected:f?.isSelected.value,selectedClass:f?.selectedClass.value,select:f?.select,toggle:f?.toggle,value:f?.value.value,disabled:e.disabled})??Or(e.text)]),l&&Er("div",{key:"append",class:"v-chip__append"},[n.append?Er(ra,{key:"append-defaults",disabled:!a,defaults:{VAvatar:{end:!0,image:e.appendAvatar},VIcon:{end:!0,icon:e.appendIcon}}},n.append):Er($r,null,[e.appendIcon&&Er(bn,{key:"append-icon",end:!0,icon:e.appendIcon},null),e.appendAvatar&&Er(Ko,{key:"append-avatar",end:!0,image:e.appendAvatar},null)])]),o&&Er("button",Lr({key:"close",class:"v-chip__close",type:"button","data-testid":"close-chip"},y.value),[n.close?Er(ra,{key:"close-defaults",defaults:{VIcon:{icon:e.closeIcon,size:"x-small"}}},n.close):Er(bn,{key:"close-icon",icon:e.closeIcon,size:"x-small"},null)])]}),[[Fr("ripple"),h.value&&e.ripple,null]])}}}),{computed:Wr,inject:Ur,provide:Gr,shallowRef:Yr}=await e("vue"),qr=Symbol.for("vuetify:list");function Kr(){const e=Ur(qr,{hasPrepend:Yr(!1),updateHasPrepend:()=>null}),t={hasPrepend:Yr(!1),updateHasPrepend:e=>{e&&(t.hasPrepend.value=e)}};return Gr(qr,t),e}function Xr(){return Ur(qr,null)}const{toRaw:Jr}=await e("vue"),Qr=e=>{const t={activate:t=>{let{id:a,value:l,activated:n}=t;return a=Jr(a),e&&!l&&1===n.size&&n.has(a)||(l?n.add(a):n.delete(a)),n},in:(e,a,l)=>{let n=new Set;if(null!=e)for(const o of P(e))n=t.activate({id:o,value:!0,activated:new Set(n),children:a,parents:l});return n},out:e=>Array.from(e)};return t},Zr=e=>{const t=Qr(e);return{activate:e=>{let{activated:a,id:l,...n}=e;l=Jr(l);const o=a.has(l)?new Set([l]):new Set;return t.activate({...n,id:l,activated:o})},in:(e,a,l)=>{let n=new Set;if(null!=e){const o=P(e);o.length&&(n=t.in(o.slice(0,1),a,l))}return n},out:(e,a,l)=>t.out(e,a,l)}},es={open:e=>{let{id:t,value:a,opened:l,parents:n}=e;if(a){const e=new Set;e.add(t);let a=n.get(t);for(;null!=a;)e.add(a),a=n.get(a);return e}return l.delete(t),l},select:()=>null},ts={open:e=>{let{id:t,value:a,opened:l,parents:n}=e;if(a){let e=n.get(t);for(l.add(t);null!=e&&e!==t;)l.add(e),e=n.get(e);return l}return l.delete(t),l},select:()=>null},as={open:ts.open,select:e=>{let{id:t,value:a,opened:l,parents:n}=e;if(!a)return l;const o=[];let i=n.get(t);for(;null!=i;)o.push(i),i=n.get(i);return new Set(o)}},{toRaw:ls}=await e("vue"),ns=e=>{const t={select:t=>{let{id:a,value:l,selected:n}=t;if(a=ls(a),e&&!l){const e=Array.from(n.entries()).reduce((e,t)=>{let[a,l]=t;return"on"===l&&e.push(a),e},[]);if(1===e.length&&e[0]===a)return n}return n.set(a,l?"on":"off"),n},in:(e,a,l)=>{const n=new Map;for(const o of e||[])t.select({id:o,value:!0,selected:n,children:a,parents:l});return n},out:e=>{const t=[];for(const[a,l]of e.entries())"on"===l&&t.push(a);return t}};return t},os=e=>{const t=ns(e);return{select:e=>{let{selected:a,id:l,...n}=e;l=ls(l);const o=a.has(l)?new Map([[l,a.get(l)]]):new Map;return t.select({...n,id:l,selected:o})},in:(e,a,l)=>e?.length?t.in(e.slice(0,1),a,l):new Map,out:(e,a,l)=>t.out(e,a,l)}},is=e=>{const t={select:t=>{let{id:a,value:l,selected:n,children:o,parents:i}=t;a=ls(a);const r=new Map(n),s=[a];for(;s.length;){const e=s.shift();n.set(ls(e),l?"on":"off"),o.has(e)&&s.push(...o.get(e))}let u=ls(i.get(a));for(;u;){const e=o.get(u),t=e.every(e=>"on"===n.get(ls(e))),a=e.every(e=>!n.has(ls(e))||"off"===n.get(ls(e)));n.set(u,t?"on":a?"off":"indeterminate"),u=ls(i.get(u))}if(e&&!l){const e=Array.from(n.entries()).reduce((e,t)=>{let[a,l]=t;return"on"===l&&e.push(a),e},[]);if(0===e.length)return r}return n},in:(e,a,l)=>{let n=new Map;for(const o of e||[])n=t.select({id:o,value:!0,selected:n,children:a,parents:l});return n},out:(e,t)=>{const a=[];for(const[l,n]of e.entries())"on"!==n||t.has(l)||a.push(l);return a}};return t},{computed:rs,inject:ss,onBeforeMount:us,onBeforeUnmount:cs,provide:ds,ref:vs,shallowRef:ps,toRaw:fs,toRef:ms,toValue:gs}=await e("vue"),hs=Symbol.for("vuetify:nested"),ys={id:ps(),root:{register:()=>null,unregister:()=>null,parents:vs(new Map),children:vs(new Map),open:()=>null,openOnSelect:()=>null,activate:()=>null,select:()=>null,activatable:vs(!1),selectable:vs(!1),opened:vs(new Set),activated:vs(new Set),selected:vs(new Map),selectedValues:vs([]),getPath:()=>[]}},bs=t({activatable:Boolean,selectable:Boolean,activeStrategy:[String,Function,Object],selectStrategy:[String,Function,Object],openStrategy:[String,Object],opened:null,activated:null,selected:null,mandatory:Boolean},"nested"),ws=e=>{let t=!1;const a=vs(new Map),l=vs(new Map),n=V(e,"opened",e.opened,e=>new Set(e),e=>[...e.values()]),o=rs(()=>{if("object"==typeof e.activeStrategy)return e.activeStrategy;if("function"==typeof e.activeStrategy)return e.activeStrategy(e.mandatory);switch(e.activeStrategy){case"leaf":return(e=>{const t=Qr(e);return{activate:e=>{let{id:a,activated:l,children:n,...o}=e;return a=Jr(a),n.has(a)?l:t.activate({id:a,activated:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"single-leaf":return(e=>{const t=Zr(e);return{activate:e=>{let{id:a,activated:l,children:n,...o}=e;return a=Jr(a),n.has(a)?l:t.activate({id:a,activated:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"independent":return Qr(e.mandatory);default:return Zr(e.mandatory)}}),r=rs(()=>{if("object"==typeof e.selectStrategy)return e.selectStrategy;if("function"==typeof e.selectStrategy)return e.selectStrategy(e.mandatory);switch(e.selectStrategy){case"single-leaf":return(e=>{const t=os(e);return{select:e=>{let{id:a,selected:l,children:n,...o}=e;return a=ls(a),n.has(a)?l:t.select({id:a,selected:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"leaf":return(e=>{const t=ns(e);return{select:e=>{let{id:a,selected:l,children:n,...o}=e;return a=ls(a),n.has(a)?l:t.select({id:a,selected:l,children:n,...o})},in:t.in,out:t.out}})(e.mandatory);case"independent":return ns(e.mandatory);case"single-independent":return os(e.mandatory);case"trunk":return(e=>{const t=is(e);return{select:t.select,in:t.in,out:(e,t,a)=>{const l=[];for(const[n,o]of e.entries())if("on"===o){if(a.has(n)){const t=a.get(n);if("on"===e.get(t))continue}l.push(n)}return l}}})(e.mandatory);default:return is(e.mandatory)}}),s=rs(()=>{if("object"==typeof e.openStrategy)return e.openStrategy;switch(e.openStrategy){case"list":return as;case"single":return es;default:return ts}}),u=V(e,"activated",e.activated,e=>o.value.in(e,a.value,l.value),e=>o.value.out(e,a.value,l.value)),c=V(e,"selected",e.selected,e=>r.value.in(e,a.value,l.value),e=>r.value.out(e,a.value,l.value));function d(e){const t=[];let a=e;for(;null!=a;)t.unshift(a),a=l.value.get(a);return t}cs(()=>{t=!0});const v=i("nested"),p=new Set,f={id:ps(),root:{opened:n,activatable:ms(()=>e.activatable),selectable:ms(()=>e.selectable),activated:u,selected:c,selectedValues:rs(()=>{const e=[];for(const[t,a]of c.value.entries())"on"===a&&e.push(t);return e}),register:(e,t,n)=>{if(p.has(e)){const a=d(e).map(String).join(" -> "),l=d(t).concat(e).map(String).join(" -> ");return void X(`Multiple nodes with the same ID\n\t${a}\n\t${l}`)}p.add(e),t&&e!==t&&l.value.set(e,t),n&&a.value.set(e,[]),null!=t&&a.value.set(t,[...a.value.get(t)||[],e])},unregister:e=>{if(t)return;p.delete(e),a.value.delete(e);const n=l.value.get(e);if(n){const t=a.value.get(n)??[];a.value.set(n,t.filter(t=>t!==e))}l.value.delete(e)},open:(e,t,o)=>{v.emit("click:open",{id:e,value:t,path:d(e),event:o});const i=s.value.open({id:e,value:t,opened:new Set(n.value),children:a.value,parents:l.value,event:o});i&&(n.value=i)},openOnSelect:(e,t,o)=>{const i=s.value.select({id:e,value:t,selected:new Map(c.value),opened:new Set(n.value),children:a.value,parents:l.value,event:o});i&&(n.value=i)},select:(e,t,n)=>{v.emit("click:select",{id:e,value:t,path:d(e),event:n});const o=r.value.select({id:e,value:t,selected:new Map(c.value),children:a.value,parents:l.value,event:n});o&&(c.value=o),f.root.openOnSelect(e,t,n)},activate:(t,n,i)=>{if(!e.activatable)return f.root.select(t,!0,i);v.emit("click:activate",{id:t,value:n,path:d(t),event:i});const r=o.value.activate({id:t,value:n,activated:new Set(u.value),children:a.value,parents:l.value,event:i});if(r.size!==u.value.size)u.value=r;else{for(const e of r)if(!u.value.has(e))return void(u.value=r);for(const e of u.value)if(!r.has(e))return void(u.value=r)}},children:a,parents:l,getPath:d}};return ds(hs,f),f.root},Ss=(e,t)=>{const a=ss(hs,ys),l=Symbol("nested item"),n=rs(()=>gs(e)??l),o={...a,id:n,open:(e,t)=>a.root.open(n.value,e,t),openOnSelect:(e,t)=>a.root.openOnSelect(n.value,e,t),isOpen:rs(()=>a.root.opened.value.has(n.value)),parent:rs(()=>a.root.parents.value.get(n.value)),activate:(e,t)=>a.root.activate(n.value,e,t),isActivated:rs(()=>a.root.activated.value.has(fs(n.value))),select:(e,t)=>a.root.select(n.value,e,t),isSelected:rs(()=>"on"===a.root.selected.value.get(fs(n.value))),isIndeterminate:rs(()=>"indeterminate"===a.root.selected.value.get(fs(n.value))),isLeaf:rs(()=>!a.root.children.value.get(n.value)),isGroupActivator:a.isGroupActivator};return us(()=>{!a.isGroupActivator&&a.root.register(n.value,a.id.value,t)}),cs(()=>{!a.isGroupActivator&&a.root.unregister(n.value)}),t&&ds(hs,o),o},{createVNode:ks,vShow:xs,withDirectives:Vs}=await e("vue"),{computed:Cs}=await e("vue"),_s=J({name:"VListGroupActivator",setup(e,t){let{slots:a}=t;return(()=>{const e=ss(hs,ys);ds(hs,{...e,isGroupActivator:!0})})(),()=>a.default?.()}}),Is=t({activeColor:String,baseColor:String,color:String,collapseIcon:{type:E,default:"$collapse"},expandIcon:{type:E,default:"$expand"},prependIcon:E,appendIcon:E,fluid:Boolean,subgroup:Boolean,title:String,value:null,...qe(),...Vt()},"VListGroup"),Bs=o()({name:"VListGroup",props:Is(),setup(e,t){let{slots:a}=t;const{isOpen:l,open:n,id:o}=Ss(()=>e.value,!0),i=Cs(()=>`v-list-group--id-${String(o.value)}`),r=Xr(),{isBooted:s}=yl();function u(e){e.stopPropagation(),["INPUT","TEXTAREA"].includes(e.target?.tagName)||n(!l.value,e)}const c=Cs(()=>({onClick:u,class:"v-list-group__header",id:i.value})),d=Cs(()=>l.value?e.collapseIcon:e.expandIcon),v=Cs(()=>({VListItem:{active:l.value,activeColor:e.activeColor,baseColor:e.baseColor,color:e.color,prependIcon:e.prependIcon||e.subgroup&&d.value,appendIcon:e.appendIcon||!e.subgroup&&d.value,title:e.title,value:e.value}}));return wt(()=>ks(e.tag,{class:["v-list-group",{"v-list-group--prepend":r?.hasPrepend.value,"v-list-group--fluid":e.fluid,"v-list-group--subgroup":e.subgroup,"v-list-group--open":l.value},e.class],style:e.style},{default:()=>[a.activator&&ks(ra,{defaults:v.value},{default:()=>[ks(_s,null,{default:()=>[a.activator({props:c.value,isOpen:l.value})]})]}),ks(Ba,{transition:{component:la},disabled:!s.value},{default:()=>[Vs(ks("div",{class:"v-list-group__items",role:"group","aria-labelledby":i.value},[a.default?.()]),[[xs,l.value]])]})]})),{isOpen:l}}}),{createVNode:Ps}=await e("vue"),As=t({opacity:[Number,String],...qe(),...Vt()},"VListItemSubtitle"),Ns=o()({name:"VListItemSubtitle",props:As(),setup(e,t){let{slots:a}=t;return wt(()=>Ps(e.tag,{class:["v-list-item-subtitle",e.class],style:[{"--v-list-item-subtitle-opacity":e.opacity},e.style]},a)),{}}}),Ts=vt("v-list-item-title"),{Fragment:Es,createVNode:Ds,resolveDirective:Rs,mergeProps:$s,withDirectives:Ls}=await e("vue"),{computed:Fs,onBeforeMount:Ms,toDisplayString:Os,toRef:zs,watch:js}=await e("vue"),Hs=t({active:{type:Boolean,default:void 0},activeClass:String,activeColor:String,appendAvatar:String,appendIcon:E,baseColor:String,disabled:Boolean,lines:[Boolean,String],link:{type:Boolean,default:void 0},nav:Boolean,prependAvatar:String,prependIcon:E,ripple:{type:[Boolean,Object],default:!0},slim:Boolean,subtitle:{type:[String,Number,Boolean],default:void 0},title:{type:[String,Number,Boolean],default:void 0},value:null,onClick:O(),onClickOnce:O(),...Ka(),...qe(),...Al(),...ua(),...Za(),...Sa(),...lo(),...Vt(),...c(),...Fl({variant:"text"})},"VListItem"),Ws=o()({name:"VListItem",directives:{Ripple:Vo},props:Hs(),emits:{click:e=>!0},setup(e,t){let{attrs:a,slots:l,emit:n}=t;const o=ao(e,a),i=Fs(()=>void 0===e.value?o.href.value:e.value),{activate:s,isActivated:u,select:c,isOpen:d,isSelected:v,isIndeterminate:p,isGroupActivator:f,root:m,parent:g,openOnSelect:h,id:y}=Ss(i,!1),b=Xr(),w=Fs(()=>!1!==e.active&&(e.active||o.isActive?.value||(m.activatable.value?u.value:v.value))),S=zs(()=>!1!==e.link&&o.isLink.value),k=Fs(()=>!!b&&(m.selectable.value||m.activatable.value||null!=e.value)),x=Fs(()=>!e.disabled&&!1!==e.link&&(e.link||o.isClickable.value||k.value)),V=zs(()=>e.rounded||e.nav),C=zs(()=>e.color??e.activeColor),_=zs(()=>({color:w.value?C.value??e.baseColor:e.baseColor,variant:e.variant}));function I(){null!=g.value&&m.open(g.value,!0),h(!0)}js(()=>o.isActive?.value,e=>{e&&I()}),Ms(()=>{o.isActive?.value&&I()});const{themeClasses:B}=r(e),{borderClasses:P}=Xa(e),{colorClasses:A,colorStyles:N,variantClasses:T}=Ml(_),{densityClasses:E}=Nl(e),{dimensionStyles:D}=ca(e),{elevationClasses:R}=el(e),{roundedClasses:$}=ka(V),L=zs(()=>e.lines?`v-list-item--${e.lines}-line`:void 0),F=Fs(()=>({isActive:w.value,select:c,isOpen:d.value,isSelected:v.value,isIndeterminate:p.value}));function M(t){n("click",t),["INPUT","TEXTAREA"].includes(t.target?.tagName)||x.value&&(o.navigate?.(t),f||(m.activatable.value?s(!u.value,t):(m.selectable.value||null!=e.value)&&c(!v.value,t)))}function O(e){const t=e.target;["INPUT","TEXTAREA"].includes(t.tagName)||"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.target.dispatchEvent(new MouseEvent("click",e)))}return wt(()=>{const t=S.value?"a":e.tag,a=l.title||null!=e.title,n=l.subtitle||null!=e.subtitle,i=!(!e.appendAvatar&&!e.appendIcon),r=!(!i&&!l.append),s=!(!e.prependAvatar&&!e.prependIcon),c=!(!s&&!l.prepend);return b?.updateHasPrepend(c),e.activeColor&&Q("active-color",["color","base-color"]),Ls(Ds(t,$s({class:["v-list-item",{"v-list-item--active":w.value,"v-list-item--disabled":e.disabled,"v-list-item--link":x.value,"v-list-item--nav":e.nav,"v-list-item--prepend":!c&&b?.hasPrepend.value,"v-list-item--slim":e.slim,[`${e.activeClass}`]:e.activeClass&&w.value},B.value,P.value,A.value,E.value,R.value,L.value,$.value,T.value,e.class],style:[N.value,D.value,e.style],tabindex:x.value?b?-2:0:void 0,"aria-selected":k.value?m.activatable.value?u.value:m.selectable.value?v.value:w.value:void 0,onClick:M,onKeydown:x.value&&!S.value&&O},o.linkProps),{default:()=>[Ll(x.value||w.value,"v-list-item"),c&&Ds("div",{key:"prepend",class:"v-list-item__prepend"},[l.prepend?Ds(ra,{key:"prepend-defaults",disabled:!s,defaults:{VAvatar:{density:e.density,image:e.prependAvatar},VIcon:{density:e.density,icon:e.prependIcon},VListItemAction:{start:!0}}},{default:()=>[l.prepend?.(F.value)]}):Ds(Es,null,[e.prependAvatar&&Ds(Ko,{key:"prepend-avatar",density:e.density,image:e.prependAvatar},null),e.prependIcon&&Ds(bn,{key:"prepend-icon",density:e.density,icon:e.prependIcon},null)]),Ds("div",{class:"v-list-item__spacer"},null)]),Ds("div",{class:"v-list-item__content","data-no-activator":""},[a&&Ds(Ts,{key:"title"},{default:()=>[l.title?.({title:e.title})??Os(e.title)]}),n&&Ds(Ns,{key:"subtitle"},{default:()=>[l.subtitle?.({subtitle:e.subtitle})??Os(e.subtitle)]}),l.default?.(F.value)]),r&&Ds("div",{key:"append",class:"v-list-item__append"},[l.append?Ds(ra,{key:"append-defaults",disabled:!i,defaults:{VAvatar:{density:e.density,image:e.appendAvatar},VIcon:{density:e.density,icon:e.appendIcon},VListItemAction:{end:!0}}},{default:()=>[l.append?.(F.value)]}):Ds(Es,null,[e.appendIcon&&Ds(bn,{key:"append-icon",density:e.density,icon:e.appendIcon},null),e.appendAvatar&&Ds(Ko,{key:"append-avatar",density:e.density,image:e.appendAvatar},null)]),Ds("div",{class:"v-list-item__spacer"},null)])]}),[[Rs("ripple"),x.value&&e.ripple]])}),{activate:s,isActivated:u,isGroupActivator:f,isSelected:v,list:b,select:c,root:m,id:y,link:o}}}),{createVNode:Us}=await e("vue"),Gs=t({color:String,inset:Boolean,sticky:Boolean,title:String,...qe(),...Vt()},"VListSubheader"),Ys=o()({name:"VListSubheader",props:Gs(),setup(e,t){let{slots:a}=t;const{textColorClasses:l,textColorStyles:n}=ha(()=>e.color);return wt(()=>{const t=!(!a.default&&!e.title);return Us(e.tag,{class:["v-list-subheader",{"v-list-subheader--inset":e.inset,"v-list-subheader--sticky":e.sticky},l.value,e.class],style:[{textColorStyles:n},e.style]},{default:()=>[t&&Us("div",{class:"v-list-subheader__text"},[a.default?.()??e.title])]})}),{}}}),{createVNode:qs}=await e("vue"),{computed:Ks}=await e("vue"),Xs=t({color:String,inset:Boolean,length:[Number,String],opacity:[Number,String],thickness:[Number,String],vertical:Boolean,...qe(),...c()},"VDivider"),Js=o()({name:"VDivider",props:Xs(),setup(e,t){let{attrs:a,slots:l}=t;const{themeClasses:n}=r(e),{textColorClasses:o,textColorStyles:i}=ha(()=>e.color),s=Ks(()=>{const t={};return e.length&&(t[e.vertical?"height":"width"]=p(e.length)),e.thickness&&(t[e.vertical?"borderRightWidth":"borderTopWidth"]=p(e.thickness)),t});return wt(()=>{const t=qs("hr",{class:[{"v-divider":!0,"v-divider--inset":e.inset,"v-divider--vertical":e.vertical},n.value,o.value,e.class],style:[s.value,i.value,{"--v-border-opacity":e.opacity},e.style],"aria-orientation":a.role&&"separator"!==a.role?void 0:e.vertical?"vertical":"horizontal",role:`${a.role||"separator"}`},null);return l.default?qs("div",{class:["v-divider__wrapper",{"v-divider__wrapper--vertical":e.vertical,"v-divider__wrapper--inset":e.inset}]},[t,qs("div",{class:"v-divider__content"},[l.default()]),t]):t}),{}}}),{createVNode:Qs,mergeProps:Zs}=await e("vue"),eu=t({items:Array,returnObject:Boolean},"VListChildren"),tu=o()({name:"VListChildren",props:eu(),setup(e,t){let{slots:a}=t;return Kr(),()=>a.default?.()??e.items?.map(t=>{let{children:l,props:n,type:o,raw:i}=t;if("divider"===o)return a.divider?.({props:n})??Qs(Js,n,null);if("subheader"===o)return a.subheader?.({props:n})??Qs(Ys,n,null);const r={subtitle:a.subtitle?e=>a.subtitle?.({...e,item:i}):void 0,prepend:a.prepend?e=>a.prepend?.({...e,item:i}):void 0,append:a.append?e=>a.append?.({...e,item:i}):void 0,title:a.title?e=>a.title?.({...e,item:i}):void 0},s=Bs.filterProps(n);return l?Qs(Bs,Zs({value:n?.value},s),{activator:t=>{let{props:l}=t;const o={...n,...l,value:e.returnObject?i:n.value};return a.header?a.header({props:o}):Qs(Ws,o,r)},default:()=>Qs(tu,{items:l,returnObject:e.returnObject},a)}):a.item?a.item({props:n}):Qs(Ws,Zs(n,{value:e.returnObject?i:n.value}),r)})}}),{computed:au,shallowRef:lu,watchEffect:nu}=await e("vue"),ou=t({items:{type:Array,default:()=>[]},itemTitle:{type:[String,Array,Function],default:"title"},itemValue:{type:[String,Array,Function],default:"value"},itemChildren:{type:[Boolean,String,Array,Function],default:"children"},itemProps:{type:[Boolean,String,Array,Function],default:"props"},returnObject:Boolean,valueComparator:Function},"list-items");function iu(e,t){const a=ee(t,e.itemTitle,t),l=ee(t,e.itemValue,a),n=ee(t,e.itemChildren),o={title:a,value:l,...!0===e.itemProps?"object"!=typeof t||null==t||Array.isArray(t)?void 0:"children"in t?H(t,["children"]):t:ee(t,e.itemProps)};return{title:String(o.title??""),value:o.value,props:o,children:Array.isArray(n)?ru(e,n):void 0,raw:t}}function ru(e,t){const a=U(e,["itemTitle","itemValue","itemChildren","itemProps","returnObject","valueComparator"]),l=[];for(const n of t)l.push(iu(a,n));return l}function su(e){const t=au(()=>ru(e,e.items)),a=au(()=>t.value.some(e=>null===e.value)),l=lu(new Map),n=lu([]);return nu(()=>{const e=t.value,a=new Map,o=[];for(let t=0;t<e.length;t++){const l=e[t];if(Z(l.value)||null===l.value){let e=a.get(l.value);e||(e=[],a.set(l.value,e)),e.push(l)}else o.push(l)}l.value=a,n.value=o}),{items:t,transformIn:function(o){const i=l.value,r=t.value,s=n.value,u=a.value,c=e.returnObject,d=!!e.valueComparator,v=e.valueComparator||B,p=U(e,["itemTitle","itemValue","itemChildren","itemProps","returnObject","valueComparator"]),f=[];e:for(const e of o){if(!u&&null===e)continue;if(c&&"string"==typeof e){f.push(iu(p,e));continue}const t=i.get(e);if(!d&&t)f.push(...t);else{for(const t of d?r:s)if(v(e,t.value)){f.push(t);continue e}f.push(iu(p,e))}}return f},transformOut:function(t){return e.returnObject?t.map(e=>{let{raw:t}=e;return t}):t.map(e=>{let{value:t}=e;return t})}}}const{createVNode:uu}=await e("vue"),{computed:cu,ref:du,shallowRef:vu,toRef:pu}=await e("vue");function fu(e,t){const a=ee(t,e.itemType,"item"),l=Z(t)?t:ee(t,e.itemTitle),n=ee(t,e.itemValue,void 0),o=ee(t,e.itemChildren),i={title:l,value:n,...!0===e.itemProps?H(t,["children"]):ee(t,e.itemProps)};return{type:a,title:i.title,value:i.value,props:i,children:"item"===a&&o?mu(e,o):void 0,raw:t}}function mu(e,t){const a=[];for(const l of t)a.push(fu(e,l));return a}const gu=t({baseColor:String,activeColor:String,activeClass:String,bgColor:String,disabled:Boolean,expandIcon:E,collapseIcon:E,lines:{type:[Boolean,String],default:"one"},slim:Boolean,nav:Boolean,"onClick:open":O(),"onClick:select":O(),"onUpdate:opened":O(),...bs({selectStrategy:"single-leaf",openStrategy:"list"}),...Ka(),...qe(),...Al(),...ua(),...Za(),itemType:{type:String,default:"type"},...ou(),...Sa(),...Vt(),...c(),...Fl({variant:"text"})},"VList"),hu=o()({name:"VList",props:gu(),emits:{"update:selected":e=>!0,"update:activated":e=>!0,"update:opened":e=>!0,"click:open":e=>!0,"click:activate":e=>!0,"click:select":e=>!0},setup(e,t){let{slots:a}=t;const{items:l}=function(e){return{items:cu(()=>mu(e,e.items))}}(e),{themeClasses:n}=r(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.bgColor),{borderClasses:s}=Xa(e),{densityClasses:u}=Nl(e),{dimensionStyles:c}=ca(e),{elevationClasses:d}=el(e),{roundedClasses:p}=ka(e),{children:f,open:m,parents:g,select:h,getPath:y}=ws(e),b=pu(()=>e.lines?`v-list--${e.lines}-line`:void 0),w=pu(()=>e.activeColor),S=pu(()=>e.baseColor),k=pu(()=>e.color);Kr(),v({VListGroup:{activeColor:w,baseColor:S,color:k,expandIcon:pu(()=>e.expandIcon),collapseIcon:pu(()=>e.collapseIcon)},VListItem:{activeClass:pu(()=>e.activeClass),activeColor:w,baseColor:S,color:k,density:pu(()=>e.density),disabled:pu(()=>e.disabled),lines:pu(()=>e.lines),nav:pu(()=>e.nav),slim:pu(()=>e.slim),variant:pu(()=>e.variant)}});const x=vu(!1),V=du();function C(e){x.value=!0}function _(e){x.value=!1}function I(e){x.value||e.relatedTarget&&V.value?.contains(e.relatedTarget)||A()}function B(e){const t=e.target;if(V.value&&!["INPUT","TEXTAREA"].includes(t.tagName)){if("ArrowDown"===e.key)A("next");else if("ArrowUp"===e.key)A("prev");else if("Home"===e.key)A("first");else{if("End"!==e.key)return;A("last")}e.preventDefault()}}function P(e){x.value=!0}function A(e){if(V.value)return te(V.value,e)}return wt(()=>uu(e.tag,{ref:V,class:["v-list",{"v-list--disabled":e.disabled,"v-list--nav":e.nav,"v-list--slim":e.slim},n.value,o.value,s.value,u.value,d.value,b.value,p.value,e.class],style:[i.value,c.value,e.style],tabindex:e.disabled?-1:0,role:"listbox","aria-activedescendant":void 0,onFocusin:C,onFocusout:_,onFocus:I,onKeydown:B,onMousedown:P},{default:()=>[uu(tu,{items:l.value,returnObject:e.returnObject},a)]})),{open:m,select:h,focus:A,children:f,parents:g,getPath:y}}}),yu=vt("v-list-img"),{createVNode:bu}=await e("vue"),wu=t({start:Boolean,end:Boolean,...qe(),...Vt()},"VListItemAction"),Su=o()({name:"VListItemAction",props:wu(),setup(e,t){let{slots:a}=t;return wt(()=>bu(e.tag,{class:["v-list-item-action",{"v-list-item-action--start":e.start,"v-list-item-action--end":e.end},e.class],style:e.style},a)),{}}}),{createVNode:ku}=await e("vue"),xu=t({start:Boolean,end:Boolean,...qe(),...Vt()},"VListItemMedia"),Vu=o()({name:"VListItemMedia",props:xu(),setup(e,t){let{slots:a}=t;return wt(()=>ku(e.tag,{class:["v-list-item-media",{"v-list-item-media--start":e.start,"v-list-item-media--end":e.end},e.class],style:e.style},a)),{}}});function Cu(e,t){return{x:e.x+t.x,y:e.y+t.y}}function _u(e,t){if("top"===e.side||"bottom"===e.side){const{side:a,align:l}=e;return Cu({x:"left"===l?0:"center"===l?t.width/2:"right"===l?t.width:l,y:"top"===a?0:"bottom"===a?t.height:a},t)}if("left"===e.side||"right"===e.side){const{side:a,align:l}=e;return Cu({x:"left"===a?0:"right"===a?t.width:a,y:"top"===l?0:"center"===l?t.height/2:"bottom"===l?t.height:l},t)}return Cu({x:t.width/2,y:t.height/2},t)}const{computed:Iu,nextTick:Bu,onScopeDispose:Pu,ref:Au,watch:Nu}=await e("vue"),Tu={static:function(){},connected:function(e,t,a){(Array.isArray(e.target.value)||function(e){for(;e;){if("fixed"===window.getComputedStyle(e).position)return!0;e=e.offsetParent}return!1}(e.target.value))&&Object.assign(a.value,{position:"fixed",top:0,[e.isRtl.value?"right":"left"]:0});const{preferredAnchor:l,preferredOrigin:n}=f(()=>{const a=Je(t.location,e.isRtl.value),l="overlap"===t.origin?a:"auto"===t.origin?Ze(a):Je(t.origin,e.isRtl.value);return a.side===l.side&&a.align===et(l).align?{preferredAnchor:tt(a),preferredOrigin:tt(l)}:{preferredAnchor:a,preferredOrigin:l}}),[o,i,r,s]=["minWidth","minHeight","maxWidth","maxHeight"].map(e=>Iu(()=>{const a=parseFloat(t[e]);return isNaN(a)?1/0:a})),u=Iu(()=>{if(Array.isArray(t.offset))return t.offset;if("string"==typeof t.offset){const e=t.offset.split(" ").map(parseFloat);return e.length<2&&e.push(0),e}return"number"==typeof t.offset?[t.offset,0]:[0,0]});let c=!1,d=-1;const v=new ae(4),m=new ResizeObserver(()=>{if(!c)return;if(requestAnimationFrame(e=>{e!==d&&v.clear(),requestAnimationFrame(e=>{d=e})}),v.isFull){const e=v.values();if(B(e.at(-1),e.at(-3)))return}const e=h();e&&v.push(e.flipped)});Nu([e.target,e.contentEl],(e,t)=>{let[a,l]=e,[n,o]=t;n&&!Array.isArray(n)&&m.unobserve(n),a&&!Array.isArray(a)&&m.observe(a),o&&m.unobserve(o),l&&m.observe(l)},{immediate:!0}),Pu(()=>{m.disconnect()});let g=new lt({x:0,y:0,width:0,height:0});function h(){if(c=!1,requestAnimationFrame(()=>c=!0),!e.target.value||!e.contentEl.value)return;(Array.isArray(e.target.value)||e.target.value.offsetParent||e.target.value.getClientRects().length)&&(g=ot(e.target.value));const t=function(e,t){const a=it(e);t?a.x+=parseFloat(e.style.right||0):a.x-=parseFloat(e.style.left||0);return a.y-=parseFloat(e.style.top||0),a}(e.contentEl.value,e.isRtl.value),d=ht(e.contentEl.value);d.length||(d.push(document.documentElement),e.contentEl.value.style.top&&e.contentEl.value.style.left||(t.x-=parseFloat(document.documentElement.style.getPropertyValue("--v-body-scroll-x")||0),t.y-=parseFloat(document.documentElement.style.getPropertyValue("--v-body-scroll-y")||0)));const v=d.reduce((e,t)=>{const a=t.getBoundingClientRect(),l=new lt({x:t===document.documentElement?0:a.x,y:t===document.documentElement?0:a.y,width:t.clientWidth,height:t.clientHeight});return e?new lt({x:Math.max(e.left,l.left),y:Math.max(e.top,l.top),width:Math.min(e.right,l.right)-Math.max(e.left,l.left),height:Math.min(e.bottom,l.bottom)-Math.max(e.top,l.top)}):l},void 0);v.x+=12,v.y+=12,v.width-=24,v.height-=24;let f={anchor:l.value,origin:n.value};function m(e){const a=new lt(t),l=_u(e.anchor,g),n=_u(e.origin,a);let{x:o,y:i}=(d=n,{x:(c=l).x-d.x,y:c.y-d.y});var c,d;switch(e.anchor.side){case"top":i-=u.value[0];break;case"bottom":i+=u.value[0];break;case"left":o-=u.value[0];break;case"right":o+=u.value[0]}switch(e.anchor.align){case"top":i-=u.value[1];break;case"bottom":i+=u.value[1];break;case"left":o-=u.value[1];break;case"right":o+=u.value[1]}a.x+=o,a.y+=i,a.width=Math.min(a.width,r.value),a.height=Math.min(a.height,s.value);return{overflows:nt(a,v),x:o,y:i}}let h=0,y=0;const b={x:0,y:0},w={x:!1,y:!1};let S=-1;for(;;){if(S++>10){X("Infinite loop detected in connectedLocationStrategy");break}const{x:e,y:a,overflows:l}=m(f);h+=e,y+=a,t.x+=e,t.y+=a;{const e=at(f.anchor),t=l.x.before||l.x.after,a=l.y.before||l.y.after;let n=!1;if(["x","y"].forEach(o=>{if("x"===o&&t&&!w.x||"y"===o&&a&&!w.y){const t={anchor:{...f.anchor},origin:{...f.origin}},a="x"===o?"y"===e?et:Ze:"y"===e?Ze:et;t.anchor=a(t.anchor),t.origin=a(t.origin);const{overflows:i}=m(t);(i[o].before<=l[o].before&&i[o].after<=l[o].after||i[o].before+i[o].after<(l[o].before+l[o].after)/2)&&(f=t,n=w[o]=!0)}}),n)continue}l.x.before&&(h+=l.x.before,t.x+=l.x.before),l.x.after&&(h-=l.x.after,t.x-=l.x.after),l.y.before&&(y+=l.y.before,t.y+=l.y.before),l.y.after&&(y-=l.y.after,t.y-=l.y.after);{const e=nt(t,v);b.x=v.width-e.x.before-e.x.after,b.y=v.height-e.y.before-e.y.after,h+=e.x.before,t.x+=e.x.before,y+=e.y.before,t.y+=e.y.before}break}const x=at(f.anchor);return Object.assign(a.value,{"--v-overlay-anchor-origin":`${f.anchor.side} ${f.anchor.align}`,transformOrigin:`${f.origin.side} ${f.origin.align}`,top:p(Du(y)),left:e.isRtl.value?void 0:p(Du(h)),right:e.isRtl.value?p(Du(-h)):void 0,minWidth:p("y"===x?Math.min(o.value,g.width):o.value),maxWidth:p(Ru(k(b.x,o.value===1/0?0:o.value,r.value))),maxHeight:p(Ru(k(b.y,i.value===1/0?0:i.value,s.value)))}),{available:b,contentBox:t,flipped:w}}return Nu(()=>[l.value,n.value,t.offset,t.minWidth,t.minHeight,t.maxWidth,t.maxHeight],()=>h()),Bu(()=>{const e=h();if(!e)return;const{available:t,contentBox:a}=e;a.height>t.y&&requestAnimationFrame(()=>{h(),requestAnimationFrame(()=>{h()})})}),{updateLocation:h}}},Eu=t({locationStrategy:{type:[String,Function],default:"static",validator:e=>"function"==typeof e||e in Tu},location:{type:String,default:"bottom"},origin:{type:String,default:"auto"},offset:[Number,String,Array]},"VOverlay-location-strategies");function Du(e){return Math.round(e*devicePixelRatio)/devicePixelRatio}function Ru(e){return Math.ceil(e*devicePixelRatio)/devicePixelRatio}let $u=!0;const Lu=[];let Fu=-1;function Mu(){cancelAnimationFrame(Fu),Fu=requestAnimationFrame(()=>{const e=Lu.shift();e&&e(),Lu.length?Mu():$u=!0})}const{effectScope:Ou,onScopeDispose:zu,watchEffect:ju}=await e("vue"),Hu={none:null,close:function(e){Uu(e.targetEl.value??e.contentEl.value,function(t){e.isActive.value=!1})},block:function(e,t){const a=e.root.value?.offsetParent,l=[...new Set([...ht(e.targetEl.value,t.contained?a:void 0),...ht(e.contentEl.value,t.contained?a:void 0)])].filter(e=>!e.classList.contains("v-overlay-scroll-blocked")),n=window.innerWidth-document.documentElement.offsetWidth,o=(i=a||document.documentElement,yt(i)&&i);var i;o&&e.root.value.classList.add("v-overlay--scroll-blocked");l.forEach((e,t)=>{e.style.setProperty("--v-body-scroll-x",p(-e.scrollLeft)),e.style.setProperty("--v-body-scroll-y",p(-e.scrollTop)),e!==document.documentElement&&e.style.setProperty("--v-scrollbar-offset",p(n)),e.classList.add("v-overlay-scroll-blocked")}),zu(()=>{l.forEach((e,t)=>{const a=parseFloat(e.style.getPropertyValue("--v-body-scroll-x")),l=parseFloat(e.style.getPropertyValue("--v-body-scroll-y")),n=e.style.scrollBehavior;e.style.scrollBehavior="auto",e.style.removeProperty("--v-body-scroll-x"),e.style.removeProperty("--v-body-scroll-y"),e.style.removeProperty("--v-scrollbar-offset"),e.classList.remove("v-overlay-scroll-blocked"),e.scrollLeft=-a,e.scrollTop=-l,e.style.scrollBehavior=n}),o&&e.root.value.classList.remove("v-overlay--scroll-blocked")})},reposition:function(e,t,a){let l=!1,n=-1,o=-1;function i(t){var a;a=()=>{const a=performance.now();e.updateLocation.value?.(t);const n=performance.now()-a;l=n/(1e3/60)>2},!$u||Lu.length?(Lu.push(a),Mu()):($u=!1,a(),Mu())}o=("undefined"==typeof requestIdleCallback?e=>e():requestIdleCallback)(()=>{a.run(()=>{Uu(e.targetEl.value??e.contentEl.value,e=>{l?(cancelAnimationFrame(n),n=requestAnimationFrame(()=>{n=requestAnimationFrame(()=>{i(e)})})):i(e)})})}),zu(()=>{"undefined"!=typeof cancelIdleCallback&&cancelIdleCallback(o),cancelAnimationFrame(n)})}},Wu=t({scrollStrategy:{type:[String,Function],default:"block",validator:e=>"function"==typeof e||e in Hu}},"VOverlay-scroll-strategies");function Uu(e,t){const a=[document,...ht(e)];a.forEach(e=>{e.addEventListener("scroll",t,{passive:!0})}),zu(()=>{a.forEach(e=>{e.removeEventListener("scroll",t)})})}const Gu=Symbol.for("vuetify:v-menu"),Yu=t({closeDelay:[Number,String],openDelay:[Number,String]},"delay");function qu(e,t){let a=()=>{};function l(l){a?.();const n=Number(l?e.openDelay:e.closeDelay);return new Promise(e=>{a=le(n,()=>{t?.(l),e(l)})})}return{clearDelay:a,runOpenDelay:function(){return l(!0)},runCloseDelay:function(){return l(!1)}}}const{computed:Ku,effectScope:Xu,inject:Ju,mergeProps:Qu,nextTick:Zu,onScopeDispose:ec,ref:tc,watch:ac,watchEffect:lc}=await e("vue"),nc=t({target:[String,Object],activator:[String,Object],activatorProps:{type:Object,default:()=>({})},openOnClick:{type:Boolean,default:void 0},openOnHover:Boolean,openOnFocus:{type:Boolean,default:void 0},closeOnContentClick:Boolean,...Yu()},"VOverlay-activator");function oc(e,t){let{isActive:a,isTop:o,contentEl:r}=t;const s=i("useActivator"),u=tc();let c=!1,d=!1,v=!0;const p=Ku(()=>e.openOnFocus||null==e.openOnFocus&&e.openOnHover),f=Ku(()=>e.openOnClick||null==e.openOnClick&&!e.openOnHover&&!p.value),{runOpenDelay:m,runCloseDelay:g}=qu(e,t=>{t!==(e.openOnHover&&c||p.value&&d)||e.openOnHover&&a.value&&!o.value||(a.value!==t&&(v=!0),a.value=t)}),h=tc(),y=e=>{e.stopPropagation(),u.value=e.currentTarget||e.target,a.value||(h.value=[e.clientX,e.clientY]),a.value=!a.value},b=e=>{e.sourceCapabilities?.firesTouchEvents||(c=!0,u.value=e.currentTarget||e.target,m())},w=e=>{c=!1,g()},S=e=>{!1!==j(e.target,":focus-visible")&&(d=!0,e.stopPropagation(),u.value=e.currentTarget||e.target,m())},k=e=>{d=!1,e.stopPropagation(),g()},x=Ku(()=>{const t={};return f.value&&(t.onClick=y),e.openOnHover&&(t.onMouseenter=b,t.onMouseleave=w),p.value&&(t.onFocus=S,t.onBlur=k),t}),V=Ku(()=>{const t={};if(e.openOnHover&&(t.onMouseenter=()=>{c=!0,m()},t.onMouseleave=()=>{c=!1,g()}),p.value&&(t.onFocusin=()=>{d=!0,m()},t.onFocusout=()=>{d=!1,g()}),e.closeOnContentClick){const e=Ju(Gu,null);t.onClick=()=>{a.value=!1,e?.closeParents()}}return t}),C=Ku(()=>{const t={};return e.openOnHover&&(t.onMouseenter=()=>{v&&(c=!0,v=!1,m())},t.onMouseleave=()=>{c=!1,g()}),t});ac(o,t=>{!t||(!e.openOnHover||c||p.value&&d)&&(!p.value||d||e.openOnHover&&c)||r.value?.contains(document.activeElement)||(a.value=!1)}),ac(a,e=>{e||setTimeout(()=>{h.value=void 0})},{flush:"post"});const _=ne();lc(()=>{_.value&&Zu(()=>{u.value=_.el})});const I=ne(),B=Ku(()=>"cursor"===e.target&&h.value?h.value:I.value?I.el:ic(e.target,s)||u.value),P=Ku(()=>Array.isArray(B.value)?void 0:B.value);let A;return ac(()=>!!e.activator,t=>{t&&$?(A=Xu(),A.run(()=>{!function(e,t,a){let{activatorEl:o,activatorEvents:i}=a;function r(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:u(),a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.activatorProps;t&&function(e,t){Object.keys(t).forEach(a=>{if(l(a)){const l=n(a),o=st.get(e);if(null==t[a])o?.forEach(t=>{const[a,n]=t;a===l&&(e.removeEventListener(l,n),o.delete(t))});else if(!o||![...o]?.some(e=>e[0]===l&&e[1]===t[a])){e.addEventListener(l,t[a]);const n=o||new Set;n.add([l,t[a]]),st.has(e)||st.set(e,n)}}else null==t[a]?e.removeAttribute(a):e.setAttribute(a,t[a])})}(t,Qu(i.value,a))}function s(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:u(),a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.activatorProps;t&&function(e,t){Object.keys(t).forEach(t=>{if(l(t)){const a=n(t),l=st.get(e);l?.forEach(t=>{const[n,o]=t;n===a&&(e.removeEventListener(a,o),l.delete(t))})}else e.removeAttribute(t)})}(t,Qu(i.value,a))}function u(){const a=ic(arguments.length>0&&void 0!==arguments[0]?arguments[0]:e.activator,t);return o.value=a?.nodeType===Node.ELEMENT_NODE?a:void 0,o.value}ac(()=>e.activator,(e,t)=>{if(t&&e!==t){const e=u(t);e&&s(e)}e&&Zu(()=>r())},{immediate:!0}),ac(()=>e.activatorProps,()=>{r()}),ec(()=>{s()})}(e,s,{activatorEl:u,activatorEvents:x})})):A&&A.stop()},{flush:"post",immediate:!0}),ec(()=>{A?.stop()}),{activatorEl:u,activatorRef:_,target:B,targetEl:P,targetRef:I,activatorEvents:x,contentEvents:V,scrimEvents:C}}function ic(e,t){if(!e)return;let a;if("parent"===e){let e=t?.proxy?.$el?.parentNode;for(;e?.hasAttribute("data-no-activator");)e=e.parentNode;a=e}else a="string"==typeof e?document.querySelector(e):"$el"in e?e.$el:e;return a}const{onMounted:rc,shallowRef:sc}=await e("vue");function uc(){if(!$)return sc(!1);const{ssr:e}=G();if(e){const e=sc(!1);return rc(()=>{e.value=!0}),e}return sc(!0)}const{shallowRef:cc,toRef:dc,watch:vc}=await e("vue"),pc=t({eager:Boolean},"lazy");function fc(e,t){const a=cc(!1),l=dc(()=>a.value||e.eager||t.value);return vc(t,()=>a.value=!0),{isBooted:a,hasContent:l,onAfterLeave:function(){e.eager||(a.value=!1)}}}function mc(){const e=i("useScopeId").vnode.scopeId;return{scopeId:e?{[e]:""}:void 0}}const{inject:gc,onScopeDispose:hc,provide:yc,reactive:bc,readonly:wc,shallowRef:Sc,toRaw:kc,toRef:xc,toValue:Vc,watchEffect:Cc}=await e("vue"),_c=Symbol.for("vuetify:stack"),Ic=bc([]);const{computed:Bc,warn:Pc}=await e("vue");function Ac(){return!0}function Nc(e,t,a){if(!e||!1===Tc(e,a))return!1;const l=pt(t);if("undefined"!=typeof ShadowRoot&&l instanceof ShadowRoot&&l.host===e.target)return!1;const n=("object"==typeof a.value&&a.value.include||(()=>[]))();return n.push(t),!n.some(t=>t?.contains(e.target))}function Tc(e,t){return("object"==typeof t.value&&t.value.closeConditional||Ac)(e)}function Ec(e,t){const a=pt(e);t(document),"undefined"!=typeof ShadowRoot&&a instanceof ShadowRoot&&t(a)}const Dc={mounted(e,t){const a=a=>function(e,t,a){const l="function"==typeof a.value?a.value:a.value.handler;e.shadowTarget=e.target,t._clickOutside.lastMousedownWasOutside&&Nc(e,t,a)&&setTimeout(()=>{Tc(e,a)&&l&&l(e)},0)}(a,e,t),l=a=>{e._clickOutside.lastMousedownWasOutside=Nc(a,e,t)};Ec(e,e=>{e.addEventListener("click",a,!0),e.addEventListener("mousedown",l,!0)}),e._clickOutside||(e._clickOutside={lastMousedownWasOutside:!1}),e._clickOutside[t.instance.$.uid]={onClick:a,onMousedown:l}},beforeUnmount(e,t){e._clickOutside&&(Ec(e,a=>{if(!a||!e._clickOutside?.[t.instance.$.uid])return;const{onClick:l,onMousedown:n}=e._clickOutside[t.instance.$.uid];a.removeEventListener("click",l,!0),a.removeEventListener("mousedown",n,!0)}),delete e._clickOutside[t.instance.$.uid])}},{mergeProps:Rc,createVNode:$c,Fragment:Lc,vShow:Fc,resolveDirective:Mc,withDirectives:Oc}=await e("vue"),{computed:zc,mergeProps:jc,onBeforeUnmount:Hc,ref:Wc,Teleport:Uc,Transition:Gc,watch:Yc}=await e("vue");function qc(e){const{modelValue:t,color:a,...l}=e;return $c(Gc,{name:"fade-transition",appear:!0},{default:()=>[e.modelValue&&$c("div",Rc({class:["v-overlay__scrim",e.color.backgroundColorClasses.value],style:e.color.backgroundColorStyles.value},l),null)]})}const Kc=t({absolute:Boolean,attach:[Boolean,String,Object],closeOnBack:{type:Boolean,default:!0},contained:Boolean,contentClass:null,contentProps:null,disabled:Boolean,opacity:[Number,String],noClickAnimation:Boolean,modelValue:Boolean,persistent:Boolean,scrim:{type:[Boolean,String],default:!0},zIndex:{type:[Number,String],default:2e3},...nc(),...qe(),...ua(),...pc(),...Eu(),...Wu(),...c(),...Ia()},"VOverlay"),Xc=o()({name:"VOverlay",directives:{ClickOutside:Dc},inheritAttrs:!1,props:{_disableGlobalStack:Boolean,...Kc()},emits:{"click:outside":e=>!0,"update:modelValue":e=>!0,keydown:e=>!0,afterEnter:()=>!0,afterLeave:()=>!0},setup(e,t){let{slots:a,attrs:l,emit:n}=t;const o=i("VOverlay"),s=Wc(),c=Wc(),d=Wc(),v=V(e,"modelValue"),f=zc({get:()=>v.value,set:t=>{t&&e.disabled||(v.value=t)}}),{themeClasses:m}=r(e),{rtlClasses:g,isRtl:h}=u(),{hasContent:y,onAfterLeave:b}=fc(e,f),w=ya(()=>"string"==typeof e.scrim?e.scrim:null),{globalTop:S,localTop:k,stackStyles:x}=function(e,t,a){const l=i("useStack"),n=!a,o=gc(_c,void 0),r=bc({activeChildren:new Set});yc(_c,r);const s=Sc(Number(Vc(t)));C(e,()=>{const e=Ic.at(-1)?.[1];s.value=e?e+10:Number(Vc(t)),n&&Ic.push([l.uid,s.value]),o?.activeChildren.add(l.uid),hc(()=>{if(n){const e=kc(Ic).findIndex(e=>e[0]===l.uid);Ic.splice(e,1)}o?.activeChildren.delete(l.uid)})});const u=Sc(!0);n&&Cc(()=>{const e=Ic.at(-1)?.[0]===l.uid;setTimeout(()=>u.value=e)});const c=xc(()=>!r.activeChildren.size);return{globalTop:wc(u),localTop:c,stackStyles:xc(()=>({zIndex:s.value}))}}(f,()=>e.zIndex,e._disableGlobalStack),{activatorEl:_,activatorRef:I,target:B,targetEl:P,targetRef:A,activatorEvents:N,contentEvents:T,scrimEvents:E}=oc(e,{isActive:f,isTop:k,contentEl:d}),{teleportTarget:D}=function(e){return{teleportTarget:Bc(()=>{const t=e();if(!0===t||!$)return;const a=!1===t?document.body:"string"==typeof t?document.querySelector(t):t;if(null==a)return void Pc(`Unable to locate target ${t}`);let l=[...a.children].find(e=>e.matches(".v-overlay-container"));return l||(l=document.createElement("div"),l.className="v-overlay-container",a.appendChild(l)),l})}}(()=>{const t=e.attach||e.contained;if(t)return t;const a=_?.value?.getRootNode()||o.proxy?.$el?.getRootNode();return a instanceof ShadowRoot&&a}),{dimensionStyles:R}=ca(e),L=uc(),{scopeId:F}=mc();Yc(()=>e.disabled,e=>{e&&(f.value=!1)});const{contentStyles:M,updateLocation:O}=function(e,t){const a=Au({}),l=Au();function n(e){l.value?.(e)}return $&&C(()=>!(!t.isActive.value||!e.locationStrategy),o=>{Nu(()=>e.locationStrategy,o),Pu(()=>{window.removeEventListener("resize",n),l.value=void 0}),window.addEventListener("resize",n,{passive:!0}),"function"==typeof e.locationStrategy?l.value=e.locationStrategy(t,e,a)?.updateLocation:l.value=Tu[e.locationStrategy](t,e,a)?.updateLocation}),{contentStyles:a,updateLocation:l}}(e,{isRtl:h,contentEl:d,target:B,isActive:f});function z(t){n("click:outside",t),e.persistent?Y():f.value=!1}function j(t){return f.value&&S.value&&(!e.scrim||t.target===c.value||t instanceof MouseEvent&&t.shadowTarget===c.value)}function H(t){"Escape"===t.key&&S.value&&(d.value?.contains(document.activeElement)||n("keydown",t),e.persistent?Y():(f.value=!1,d.value?.contains(document.activeElement)&&_.value?.focus()))}function W(e){("Escape"!==e.key||S.value)&&n("keydown",e)}!function(e,t){if(!$)return;let a;ju(async()=>{a?.stop(),t.isActive.value&&e.scrollStrategy&&(a=Ou(),await new Promise(e=>setTimeout(e)),a.active&&a.run(()=>{"function"==typeof e.scrollStrategy?e.scrollStrategy(t,e,a):Hu[e.scrollStrategy]?.(t,e,a)}))}),zu(()=>{a?.stop()})}(e,{root:s,contentEl:d,targetEl:P,isActive:f,updateLocation:O}),$&&Yc(f,e=>{e?window.addEventListener("keydown",H):window.removeEventListener("keydown",H)},{immediate:!0}),Hc(()=>{$&&window.removeEventListener("keydown",H)});const U=to();C(()=>e.closeOnBack,()=>{!function(e,t){let a,l,n=!1;function o(e){e.state?.replaced||(n=!0,setTimeout(()=>n=!1))}$&&e?.beforeEach&&(Xn(()=>{window.addEventListener("popstate",o),a=e.beforeEach((e,a,l)=>{no?n?t(l):l():setTimeout(()=>n?t(l):l()),no=!0}),l=e?.afterEach(()=>{no=!1})}),Jn(()=>{window.removeEventListener("popstate",o),a?.(),l?.()}))}(U,t=>{S.value&&f.value?(t(!1),e.persistent?Y():f.value=!1):t()})});const G=Wc();function Y(){e.noClickAnimation||d.value&&rt(d.value,[{transformOrigin:"center"},{transform:"scale(1.03)"},{transformOrigin:"center"}],{duration:150,easing:ft})}function q(){n("afterEnter")}function K(){b(),n("afterLeave")}return Yc(()=>f.value&&(e.absolute||e.contained)&&null==D.value,e=>{if(e){const e=gt(s.value);e&&e!==document.scrollingElement&&(G.value=e.scrollTop)}}),wt(()=>$c(Lc,null,[a.activator?.({isActive:f.value,targetRef:A,props:jc({ref:I},N.value,e.activatorProps)}),L.value&&y.value&&$c(Uc,{disabled:!D.value,to:D.value},{default:()=>[$c("div",Rc({class:["v-overlay",{"v-overlay--absolute":e.absolute||e.contained,"v-overlay--active":f.value,"v-overlay--contained":e.contained},m.value,g.value,e.class],style:[x.value,{"--v-overlay-opacity":e.opacity,top:p(G.value)},e.style],ref:s,onKeydown:W},F,l),[$c(qc,Rc({color:w,modelValue:f.value&&!!e.scrim,ref:c},E.value),null),$c(Ba,{appear:!0,persisted:!0,transition:e.transition,target:B.value,onAfterEnter:q,onAfterLeave:K},{default:()=>[Oc($c("div",Rc({ref:d,class:["v-overlay__content",e.contentClass],style:[R.value,M.value]},T.value,e.contentProps),[a.default?.({isActive:f})]),[[Fc,f.value],[Mc("click-outside"),{handler:z,closeConditional:j,include:()=>[_.value]}]])]})])]})])),{activatorEl:_,scrimEl:c,target:B,animateClick:Y,contentEl:d,globalTop:S,localTop:k,updateLocation:O}}}),Jc=Symbol("Forwarded refs");function Qc(e,t){let a=e;for(;a;){const e=Reflect.getOwnPropertyDescriptor(a,t);if(e)return e;a=Object.getPrototypeOf(a)}}function Zc(e){for(var t=arguments.length,a=new Array(t>1?t-1:0),l=1;l<t;l++)a[l-1]=arguments[l];return e[Jc]=a,new Proxy(e,{get(e,t){if(Reflect.has(e,t))return Reflect.get(e,t);if("symbol"!=typeof t&&!t.startsWith("$")&&!t.startsWith("__"))for(const l of a)if(l.value&&Reflect.has(l.value,t)){const e=Reflect.get(l.value,t);return"function"==typeof e?e.bind(l.value):e}},has(e,t){if(Reflect.has(e,t))return!0;if("symbol"==typeof t||t.startsWith("$")||t.startsWith("__"))return!1;for(const l of a)if(l.value&&Reflect.has(l.value,t))return!0;return!1},set(e,t,l){if(Reflect.has(e,t))return Reflect.set(e,t,l);if("symbol"==typeof t||t.startsWith("$")||t.startsWith("__"))return!1;for(const n of a)if(n.value&&Reflect.has(n.value,t))return Reflect.set(n.value,t,l);return!1},getOwnPropertyDescriptor(e,t){const l=Reflect.getOwnPropertyDescriptor(e,t);if(l)return l;if("symbol"!=typeof t&&!t.startsWith("$")&&!t.startsWith("__")){for(const e of a){if(!e.value)continue;const a=Qc(e.value,t)??("_"in e.value?Qc(e.value._?.setupState,t):void 0);if(a)return a}for(const e of a){const a=e.value&&e.value[Jc];if(!a)continue;const l=a.slice();for(;l.length;){const e=l.shift(),a=Qc(e.value,t);if(a)return a;const n=e.value&&e.value[Jc];n&&l.push(...n)}}}}})}const{createVNode:ed,mergeProps:td}=await e("vue"),{computed:ad,inject:ld,mergeProps:nd,nextTick:od,onBeforeUnmount:id,onDeactivated:rd,provide:sd,ref:ud,shallowRef:cd,toRef:dd,useId:vd,watch:pd}=await e("vue"),fd=t({id:String,submenu:Boolean,...H(Kc({closeDelay:250,closeOnContentClick:!0,locationStrategy:"connected",location:void 0,openDelay:300,scrim:!1,scrollStrategy:"reposition",transition:{component:zt}}),["absolute"])},"VMenu"),md=o()({name:"VMenu",props:fd(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{scopeId:n}=mc(),{isRtl:o}=u(),i=vd(),r=dd(()=>e.id||`v-menu-${i}`),s=ud(),c=ld(Gu,null),d=cd(new Set);async function v(e){const t=e.relatedTarget,a=e.target;if(await od(),l.value&&t!==a&&s.value?.contentEl&&s.value?.globalTop&&![document,s.value.contentEl].includes(a)&&!s.value.contentEl.contains(a)){const e=K(s.value.contentEl);e[0]?.focus()}}function p(e){c?.closeParents(e)}function f(t){if(!e.disabled)if("Tab"===t.key||"Enter"===t.key&&!e.closeOnContentClick){if("Enter"===t.key&&(t.target instanceof HTMLTextAreaElement||t.target instanceof HTMLInputElement&&t.target.closest("form")))return;"Enter"===t.key&&t.preventDefault();ie(K(s.value?.contentEl,!1),t.shiftKey?"prev":"next",e=>e.tabIndex>=0)||(l.value=!1,s.value?.activatorEl?.focus())}else e.submenu&&t.key===(o.value?"ArrowRight":"ArrowLeft")&&(l.value=!1,s.value?.activatorEl?.focus())}function m(t){if(e.disabled)return;const a=s.value?.contentEl;a&&l.value?"ArrowDown"===t.key?(t.preventDefault(),t.stopImmediatePropagation(),te(a,"next")):"ArrowUp"===t.key?(t.preventDefault(),t.stopImmediatePropagation(),te(a,"prev")):e.submenu&&(t.key===(o.value?"ArrowRight":"ArrowLeft")?l.value=!1:t.key===(o.value?"ArrowLeft":"ArrowRight")&&(t.preventDefault(),te(a,"first"))):(e.submenu?t.key===(o.value?"ArrowLeft":"ArrowRight"):["ArrowDown","ArrowUp"].includes(t.key))&&(l.value=!0,t.preventDefault(),setTimeout(()=>setTimeout(()=>m(t))))}sd(Gu,{register(){d.value.add(i)},unregister(){d.value.delete(i)},closeParents(t){setTimeout(()=>{d.value.size||e.persistent||null!=t&&(!s.value?.contentEl||oe(t,s.value.contentEl))||(l.value=!1,c?.closeParents())},40)}}),id(()=>{c?.unregister(),document.removeEventListener("focusin",v)}),rd(()=>l.value=!1),pd(l,e=>{e?(c?.register(),$&&document.addEventListener("focusin",v,{once:!0})):(c?.unregister(),$&&document.removeEventListener("focusin",v))},{immediate:!0});const g=ad(()=>nd({"aria-haspopup":"menu","aria-expanded":String(l.value),"aria-controls":r.value,onKeydown:m},e.activatorProps));return wt(()=>{const t=Xc.filterProps(e);return ed(Xc,td({ref:s,id:r.value,class:["v-menu",e.class],style:e.style},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,absolute:!0,activatorProps:g.value,location:e.location??(e.submenu?"end":"bottom"),"onClick:outside":p,onKeydown:f},n),{activator:a.activator,default:function(){for(var e=arguments.length,t=new Array(e),l=0;l<e;l++)t[l]=arguments[l];return ed(ra,{root:"VMenu"},{default:()=>[a.default?.(...t)]})}})}),Zc({id:r,"ΨopenChildren":d},s)}}),{vShow:gd,createVNode:hd,withDirectives:yd}=await e("vue"),{toRef:bd}=await e("vue"),wd=t({active:Boolean,disabled:Boolean,max:[Number,String],value:{type:[Number,String],default:0},...qe(),...Ia({transition:{component:ta}})},"VCounter"),Sd=o()({name:"VCounter",functional:!0,props:wd(),setup(e,t){let{slots:a}=t;const l=bd(()=>e.max?`${e.value} / ${e.max}`:String(e.value));return wt(()=>hd(Ba,{transition:e.transition},{default:()=>[yd(hd("div",{class:["v-counter",{"text-error":e.max&&!e.disabled&&parseFloat(e.value)>parseFloat(e.max)},e.class],style:e.style},[a.default?a.default({counter:l.value,max:e.max,value:e.value}):l.value]),[[gd,e.active]])]})),{}}}),{createVNode:kd}=await e("vue"),xd=t({floating:Boolean,...qe()},"VFieldLabel"),Vd=o()({name:"VFieldLabel",props:xd(),setup(e,t){let{slots:a}=t;return wt(()=>kd(Qo,{class:["v-field-label",{"v-field-label--floating":e.floating},e.class],style:e.style,"aria-hidden":e.floating||void 0},a)),{}}}),{createVNode:Cd,vShow:_d,withDirectives:Id,Fragment:Bd,mergeProps:Pd}=await e("vue"),{computed:Ad,ref:Nd,toRef:Td,useId:Ed,watch:Dd}=await e("vue"),Rd=["underlined","outlined","filled","solo","solo-inverted","solo-filled","plain"],$d=t({appendInnerIcon:E,bgColor:String,clearable:Boolean,clearIcon:{type:E,default:"$clear"},active:Boolean,centerAffix:{type:Boolean,default:void 0},color:String,baseColor:String,dirty:Boolean,disabled:{type:Boolean,default:null},glow:Boolean,error:Boolean,flat:Boolean,iconColor:[Boolean,String],label:String,persistentClear:Boolean,prependInnerIcon:E,reverse:Boolean,singleLine:Boolean,variant:{type:String,default:"filled",validator:e=>Rd.includes(e)},"onClick:clear":O(),"onClick:appendInner":O(),"onClick:prependInner":O(),...qe(),...jn(),...Sa(),...c()},"VField"),Ld=o()({name:"VField",inheritAttrs:!1,props:{id:String,...Di(),...$d()},emits:{"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{themeClasses:o}=r(e),{loaderClasses:i}=Hn(e),{focusClasses:s,isFocused:c,focus:d,blur:v}=Ri(e),{InputIcon:f}=Bi(e),{roundedClasses:m}=ka(e),{rtlClasses:g}=u(),h=Td(()=>e.dirty||e.active),y=Td(()=>!(!e.label&&!n.label)),b=Td(()=>!e.singleLine&&y.value),w=Ed(),S=Ad(()=>e.id||`input-${w}`),k=Td(()=>`${S.value}-messages`),x=Nd(),V=Nd(),C=Nd(),_=Ad(()=>["plain","underlined"].includes(e.variant)),I=Ad(()=>e.error||e.disabled?void 0:h.value&&c.value?e.color:e.baseColor),B=Ad(()=>{if(e.iconColor&&(!e.glow||c.value))return!0===e.iconColor?I.value:e.iconColor}),{backgroundColorClasses:P,backgroundColorStyles:A}=ya(()=>e.bgColor),{textColorClasses:N,textColorStyles:T}=ha(I);Dd(h,e=>{if(b.value){const t=x.value.$el,a=V.value.$el;requestAnimationFrame(()=>{const l=it(t),n=a.getBoundingClientRect(),o=n.x-l.x,i=n.y-l.y-(l.height/2-n.height/2),r=n.width/.75,s=Math.abs(r-l.width)>1?{maxWidth:p(r)}:void 0,u=getComputedStyle(t),c=getComputedStyle(a),d=1e3*parseFloat(u.transitionDuration)||150,v=parseFloat(c.getPropertyValue("--v-field-label-scale")),f=c.getPropertyValue("color");t.style.visibility="visible",a.style.visibility="hidden",rt(t,{transform:`translate(${o}px, ${i}px) scale(${v})`,color:f,...s},{duration:d,easing:ft,direction:e?"normal":"reverse"}).finished.then(()=>{t.style.removeProperty("visibility"),a.style.removeProperty("visibility")})})}},{flush:"post"});const E=Ad(()=>({isActive:h,isFocused:c,controlRef:C,blur:v,focus:d}));function D(e){e.target!==document.activeElement&&e.preventDefault()}return wt(()=>{const t="outlined"===e.variant,l=!(!n["prepend-inner"]&&!e.prependInnerIcon),r=!(!e.clearable&&!n.clear||e.disabled),u=!!(n["append-inner"]||e.appendInnerIcon||r),c=()=>n.label?n.label({...E.value,label:e.label,props:{for:S.value}}):e.label;return Cd("div",Pd({class:["v-field",{"v-field--active":h.value,"v-field--appended":u,"v-field--center-affix":e.centerAffix??!_.value,"v-field--disabled":e.disabled,"v-field--dirty":e.dirty,"v-field--error":e.error,"v-field--glow":e.glow,"v-field--flat":e.flat,"v-field--has-background":!!e.bgColor,"v-field--persistent-clear":e.persistentClear,"v-field--prepended":l,"v-field--reverse":e.reverse,"v-field--single-line":e.singleLine,"v-field--no-label":!c(),[`v-field--variant-${e.variant}`]:!0},o.value,P.value,s.value,i.value,m.value,g.value,e.class],style:[A.value,e.style],onClick:D},a),[Cd("div",{class:"v-field__overlay"},null),Cd(Wn,{name:"v-field",active:!!e.loading,color:e.error?"error":"string"==typeof e.loading?e.loading:e.color},{default:n.loader}),l&&Cd("div",{key:"prepend",class:"v-field__prepend-inner"},[e.prependInnerIcon&&Cd(f,{key:"prepend-icon",name:"prependInner",color:B.value},null),n["prepend-inner"]?.(E.value)]),Cd("div",{class:"v-field__field","data-no-activator":""},[["filled","solo","solo-inverted","solo-filled"].includes(e.variant)&&b.value&&Cd(Vd,{key:"floating-label",ref:V,class:[N.value],floating:!0,for:S.value,style:T.value},{default:()=>[c()]}),y.value&&Cd(Vd,{key:"label",ref:x,for:S.value},{default:()=>[c()]}),n.default?.({...E.value,props:{id:S.value,class:"v-field__input","aria-describedby":k.value},focus:d,blur:v})??Cd("div",{id:S.value,class:"v-field__input","aria-describedby":k.value},null)]),r&&Cd(na,{key:"clear"},{default:()=>[Id(Cd("div",{class:"v-field__clearable",onMousedown:e=>{e.preventDefault(),e.stopPropagation()}},[Cd(ra,{defaults:{VIcon:{icon:e.clearIcon}}},{default:()=>[n.clear?n.clear({...E.value,props:{onFocus:d,onBlur:v,onClick:e["onClick:clear"]}}):Cd(f,{name:"clear",onFocus:d,onBlur:v},null)]})]),[[_d,e.dirty]])]}),u&&Cd("div",{key:"append",class:"v-field__append-inner"},[n["append-inner"]?.(E.value),e.appendInnerIcon&&Cd(f,{key:"append-icon",name:"appendInner",color:B.value},null)]),Cd("div",{class:["v-field__outline",N.value],style:T.value},[t&&Cd(Bd,null,[Cd("div",{class:"v-field__outline__start"},null),b.value&&Cd("div",{class:"v-field__outline__notch"},[Cd(Vd,{ref:V,floating:!0,for:S.value},{default:()=>[c()]})]),Cd("div",{class:"v-field__outline__end"},null)]),_.value&&b.value&&Cd(Vd,{ref:V,floating:!0,for:S.value},{default:()=>[c()]})])])}),{controlRef:C,fieldIconColor:B}}}),{resolveDirective:Fd,mergeProps:Md,createVNode:Od,withDirectives:zd,Fragment:jd}=await e("vue"),{cloneVNode:Hd,computed:Wd,nextTick:Ud,ref:Gd}=await e("vue"),Yd=["color","file","time","date","datetime-local","week","month"],qd=t({autofocus:Boolean,counter:[Boolean,Number,String],counterValue:[Number,Function],prefix:String,placeholder:String,persistentPlaceholder:Boolean,persistentCounter:Boolean,suffix:String,role:String,type:{type:String,default:"text"},modelModifiers:Object,...ur(),...$d()},"VTextField"),Kd=o()({name:"VTextField",directives:{Intersect:Aa},inheritAttrs:!1,props:qd(),emits:{"click:control":e=>!0,"mousedown:control":e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const o=V(e,"modelValue"),{isFocused:i,focus:r,blur:s}=Ri(e),u=Wd(()=>"function"==typeof e.counterValue?e.counterValue(o.value):"number"==typeof e.counterValue?e.counterValue:(o.value??"").toString().length),c=Wd(()=>a.maxlength?a.maxlength:!e.counter||"number"!=typeof e.counter&&"string"!=typeof e.counter?void 0:e.counter),d=Wd(()=>["plain","underlined"].includes(e.variant));function v(t,a){e.autofocus&&t&&a[0].target?.focus?.()}const p=Gd(),f=Gd(),m=Gd(),g=Wd(()=>Yd.includes(e.type)||e.persistentPlaceholder||i.value||e.active);function h(){m.value!==document.activeElement&&m.value?.focus(),i.value||r()}function y(e){l("mousedown:control",e),e.target!==m.value&&(h(),e.preventDefault())}function b(e){h(),l("click:control",e)}function w(t){const a=t.target;if(o.value=a.value,e.modelModifiers?.trim&&["text","search","password","tel","url"].includes(e.type)){const e=[a.selectionStart,a.selectionEnd];Ud(()=>{a.selectionStart=e[0],a.selectionEnd=e[1]})}}return wt(()=>{const t=!!(n.counter||!1!==e.counter&&null!=e.counter),l=!(!t&&!n.details),[r,S]=z(a),{modelValue:k,...x}=cr.filterProps(e),V=Ld.filterProps(e);return Od(cr,Md({ref:p,modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-text-field",{"v-text-field--prefixed":e.prefix,"v-text-field--suffixed":e.suffix,"v-input--plain-underlined":d.value},e.class],style:e.style},r,x,{centerAffix:!d.value,focused:i.value}),{...n,default:t=>{let{id:a,isDisabled:l,isDirty:r,isReadonly:u,isValid:c,reset:d}=t;return Od(Ld,Md({ref:f,onMousedown:y,onClick:b,"onClick:clear":t=>function(t,a){t.stopPropagation(),h(),Ud(()=>{o.value=null,a(),W(e["onClick:clear"],t)})}(t,d),"onClick:prependInner":e["onClick:prependInner"],"onClick:appendInner":e["onClick:appendInner"],role:e.role},V,{id:a.value,active:g.value||r.value,dirty:r.value||e.dirty,disabled:l.value,focused:i.value,error:!1===c.value}),{...n,default:t=>{let{props:{class:a,...i}}=t;const r=zd(Od("input",Md({ref:m,value:o.value,onInput:w,autofocus:e.autofocus,readonly:u.value,disabled:l.value,name:e.name,placeholder:e.placeholder,size:1,type:e.type,onFocus:h,onBlur:s},i,S),null),[[Fd("intersect"),{handler:v},null,{once:!0}]]);return Od(jd,null,[e.prefix&&Od("span",{class:"v-text-field__prefix"},[Od("span",{class:"v-text-field__prefix__text"},[e.prefix])]),n.default?Od("div",{class:a,"data-no-activator":""},[n.default(),r]):Hd(r,{class:a}),e.suffix&&Od("span",{class:"v-text-field__suffix"},[Od("span",{class:"v-text-field__suffix__text"},[e.suffix])])])}})},details:l?a=>Od(jd,null,[n.details?.(a),t&&Od(jd,null,[Od("span",null,null),Od(Sd,{active:e.persistentCounter||i.value,value:u.value,max:c.value,disabled:e.disabled},n.counter)])]):void 0})}),Zc({},p,f,m)}}),{Fragment:Xd,createVNode:Jd,mergeProps:Qd}=await e("vue"),{watch:Zd}=await e("vue"),ev=t({renderless:Boolean,...qe()},"VVirtualScrollItem"),tv=o()({name:"VVirtualScrollItem",inheritAttrs:!1,props:ev(),emits:{"update:height":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{resizeRef:o,contentRect:i}=R(void 0,"border");Zd(()=>i.value?.height,e=>{null!=e&&l("update:height",e)}),wt(()=>e.renderless?Jd(Xd,null,[n.default?.({itemRef:o})]):Jd("div",Qd({ref:o,class:["v-virtual-scroll__item",e.class],style:e.style},a),[n.default?.()]))}}),{computed:av,nextTick:lv,onScopeDispose:nv,ref:ov,shallowRef:iv,watch:rv,watchEffect:sv}=await e("vue"),uv=t({itemHeight:{type:[Number,String],default:null},itemKey:{type:[String,Array,Function],default:null},height:[Number,String]},"virtual");function cv(e,t){const a=G(),l=iv(0);sv(()=>{l.value=parseFloat(e.itemHeight||0)});const n=iv(0),o=iv(Math.ceil((parseInt(e.height)||a.height.value)/(l.value||16))||1),i=iv(0),r=iv(0),s=ov(),u=ov();let c=0;const{resizeRef:d,contentRect:v}=R();sv(()=>{d.value=s.value});const p=av(()=>s.value===document.documentElement?a.height.value:v.value?.height||parseInt(e.height)||0),f=av(()=>!!(s.value&&u.value&&p.value&&l.value));let m=Array.from({length:t.value.length}),g=Array.from({length:t.value.length});const h=iv(0);let y=-1;function b(e){return m[e]||l.value}const w=re(()=>{const e=performance.now();g[0]=0;const a=t.value.length;for(let t=1;t<=a-1;t++)g[t]=(g[t-1]||0)+b(t-1);h.value=Math.max(h.value,performance.now()-e)},h),S=rv(f,e=>{e&&(S(),c=u.value.offsetTop,w.immediate(),N(),~y&&lv(()=>{$&&window.requestAnimationFrame(()=>{E(y),y=-1})}))});function x(e){return e=k(e,0,t.value.length-1),g[e]||0}function V(e){return function(e,t){let a=e.length-1,l=0,n=0,o=null,i=-1;if(e[a]<t)return a;for(;l<=a;)if(n=l+a>>1,o=e[n],o>t)a=n-1;else{if(!(o<t))return o===t?n:l;i=n,l=n+1}return i}(g,e)}nv(()=>{w.clear()});let C=0,_=0,I=0;rv(p,(e,t)=>{t&&(N(),e<t&&requestAnimationFrame(()=>{_=0,N()}))});let B=-1;function P(){s.value&&u.value&&(_=0,I=0,window.clearTimeout(B),N())}let A=-1;function N(){cancelAnimationFrame(A),A=requestAnimationFrame(T)}function T(){if(!s.value||!p.value)return;const e=C-c,a=Math.sign(_),l=Math.max(0,e-100),u=k(V(l),0,t.value.length),d=e+p.value+100,v=k(V(d)+1,u+1,t.value.length);if((-1!==a||u<n.value)&&(1!==a||v>o.value)){const e=x(n.value)-x(u),a=x(v)-x(o.value);Math.max(e,a)>100?(n.value=u,o.value=v):(u<=0&&(n.value=u),v>=t.value.length&&(o.value=v))}i.value=x(n.value),r.value=x(t.value.length)-x(o.value)}function E(e){const t=x(e);!s.value||e&&!t?y=e:s.value.scrollTop=t}const D=av(()=>t.value.slice(n.value,o.value).map((t,a)=>{const l=a+n.value;return{raw:t,index:l,key:ee(t,e.itemKey,l)}}));return rv(t,()=>{m=Array.from({length:t.value.length}),g=Array.from({length:t.value.length}),w.immediate(),N()},{deep:1}),{calculateVisibleItems:N,containerRef:s,markerRef:u,computedItems:D,paddingTop:i,paddingBottom:r,scrollToIndex:E,handleScroll:function(){if(!s.value||!u.value)return;const e=s.value.scrollTop,t=performance.now();t-I>500?(_=Math.sign(e-C),c=u.value.offsetTop):_=e-C,C=e,I=t,window.clearTimeout(B),B=window.setTimeout(P,500),N()},handleScrollend:P,handleItemResize:function(e,t){const a=m[e],n=l.value;l.value=n?Math.min(l.value,t):t,a===t&&n===l.value||(m[e]=t,w())}}}const{createVNode:dv,Fragment:vv}=await e("vue"),{onMounted:pv,onScopeDispose:fv,toRef:mv}=await e("vue"),gv=t({items:{type:Array,default:()=>[]},renderless:Boolean,...uv(),...qe(),...ua()},"VVirtualScroll"),hv=o()({name:"VVirtualScroll",props:gv(),setup(e,t){let{slots:a}=t;const l=i("VVirtualScroll"),{dimensionStyles:n}=ca(e),{calculateVisibleItems:o,containerRef:r,markerRef:s,handleScroll:u,handleScrollend:c,handleItemResize:d,scrollToIndex:v,paddingTop:f,paddingBottom:m,computedItems:g}=cv(e,mv(()=>e.items));return C(()=>e.renderless,()=>{function e(){const e=arguments.length>0&&void 0!==arguments[0]&&arguments[0]?"addEventListener":"removeEventListener";r.value===document.documentElement?(document[e]("scroll",u,{passive:!0}),document[e]("scrollend",c)):(r.value?.[e]("scroll",u,{passive:!0}),r.value?.[e]("scrollend",c))}pv(()=>{r.value=gt(l.vnode.el,!0),e(!0)}),fv(e)}),wt(()=>{const t=g.value.map(t=>dv(tv,{key:t.key,renderless:e.renderless,"onUpdate:height":e=>d(t.index,e)},{default:e=>a.default?.({item:t.raw,index:t.index,...e})}));return e.renderless?dv(vv,null,[dv("div",{ref:s,class:"v-virtual-scroll__spacer",style:{paddingTop:p(f.value)}},null),t,dv("div",{class:"v-virtual-scroll__spacer",style:{paddingBottom:p(m.value)}},null)]):dv("div",{ref:r,class:["v-virtual-scroll",e.class],onScrollPassive:u,onScrollend:c,style:[n.value,e.style]},[dv("div",{ref:s,class:"v-virtual-scroll__container",style:{paddingTop:p(f.value),paddingBottom:p(m.value)}},[t])])}),{calculateVisibleItems:o,scrollToIndex:v}}}),{shallowRef:yv,watch:bv}=await e("vue");function wv(e,t){const a=yv(!1);let l;return{onScrollPassive:function(e){cancelAnimationFrame(l),a.value=!0,l=requestAnimationFrame(()=>{l=requestAnimationFrame(()=>{a.value=!1})})},onKeydown:async function(l){if("Tab"===l.key&&t.value?.focus(),!["PageDown","PageUp","Home","End"].includes(l.key))return;const n=e.value?.$el;if(!n)return;"Home"!==l.key&&"End"!==l.key||n.scrollTo({top:"Home"===l.key?0:n.scrollHeight,behavior:"smooth"}),await async function(){await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>requestAnimationFrame(e)),await new Promise(e=>{if(a.value){const t=bv(a,()=>{t(),e()})}else e()})}();const o=n.querySelectorAll(":scope > :not(.v-virtual-scroll__spacer)");if("PageDown"===l.key||"Home"===l.key){const e=n.getBoundingClientRect().top;for(const t of o)if(t.getBoundingClientRect().top>=e){t.focus();break}}else{const e=n.getBoundingClientRect().bottom;for(const t of[...o].reverse())if(t.getBoundingClientRect().bottom<=e){t.focus();break}}}}}const{Fragment:Sv,createVNode:kv,mergeProps:xv,createTextVNode:Vv}=await e("vue"),{computed:Cv,mergeProps:_v,nextTick:Iv,ref:Bv,shallowRef:Pv,toRef:Av,watch:Nv}=await e("vue"),Tv=t({chips:Boolean,closableChips:Boolean,closeText:{type:String,default:"$vuetify.close"},openText:{type:String,default:"$vuetify.open"},eager:Boolean,hideNoData:Boolean,hideSelected:Boolean,listProps:{type:Object},menu:Boolean,menuIcon:{type:E,default:"$dropdown"},menuProps:{type:Object},multiple:Boolean,noDataText:{type:String,default:"$vuetify.noDataText"},openOnClear:Boolean,itemColor:String,...ou({itemChildren:!1})},"Select"),Ev=t({...Tv(),...H(qd({modelValue:null,role:"combobox"}),["validationValue","dirty","appendInnerIcon"]),...Ia({transition:{component:zt}})},"VSelect"),Dv=o()({name:"VSelect",props:Ev(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,"update:menu":e=>!0},setup(e,t){let{slots:a}=t;const{t:l}=M(),n=Bv(),o=Bv(),i=Bv(),{items:r,transformIn:s,transformOut:u}=su(e),c=V(e,"modelValue",[],e=>s(null===e?[null]:P(e)),t=>{const a=u(t);return e.multiple?a:a[0]??null}),d=Cv(()=>"function"==typeof e.counterValue?e.counterValue(c.value):"number"==typeof e.counterValue?e.counterValue:c.value.length),v=Gi(e),p=Cv(()=>c.value.map(e=>e.value)),f=Pv(!1);let m,g="";const h=Cv(()=>e.hideSelected?r.value.filter(t=>!c.value.some(a=>(e.valueComparator||B)(a,t))):r.value),y=Cv(()=>e.hideNoData&&!h.value.length||v.isReadonly.value||v.isDisabled.value),b=V(e,"menu"),w=Cv({get:()=>b.value,set:e=>{b.value&&!e&&o.value?.ΨopenChildren.size||e&&y.value||(b.value=e)}}),S=Av(()=>w.value?e.closeText:e.openText),k=Cv(()=>({...e.menuProps,activatorProps:{...e.menuProps?.activatorProps||{},"aria-haspopup":"listbox"}})),x=Bv(),C=wv(x,n);function _(t){e.openOnClear&&(w.value=!0)}function I(){y.value||(w.value=!w.value)}function A(e){ue(e)&&N(e)}function N(e){if(!e.key||v.isReadonly.value)return;["Enter"," ","ArrowDown","ArrowUp","Home","End"].includes(e.key)&&e.preventDefault(),["Enter","ArrowDown"," "].includes(e.key)&&(w.value=!0),["Escape","Tab"].includes(e.key)&&(w.value=!1),"Home"===e.key?x.value?.focus("first"):"End"===e.key&&x.value?.focus("last");if(!ue(e))return;const t=performance.now();t-m>1e3&&(g=""),g+=e.key.toLowerCase(),m=t;const a=r.value.find(e=>e.title.toLowerCase().startsWith(g));if(void 0!==a){c.value=[a];const e=h.value.indexOf(a);$&&window.requestAnimationFrame(()=>{e>=0&&i.value?.scrollToIndex(e)})}}function T(t){let a=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(!t.props.disabled)if(e.multiple){const l=c.value.findIndex(a=>(e.valueComparator||B)(a.value,t.value)),n=null==a?!~l:a;if(~l){const e=n?[...c.value,t]:[...c.value];e.splice(l,1),c.value=e}else n&&(c.value=[...c.value,t])}else{const e=!1!==a;c.value=e?[t]:[],Iv(()=>{w.value=!1})}}function E(e){x.value?.$el.contains(e.relatedTarget)||(w.value=!1)}function D(){e.eager&&i.value?.calculateVisibleItems()}function R(){f.value&&n.value?.focus()}function L(e){f.value=!0}function F(e){if(null==e)c.value=[];else if(j(n.value,":autofill")||j(n.value,":-webkit-autofill")){const t=r.value.find(t=>t.title===e);t&&T(t)}else n.value&&(n.value.value="")}return Nv(w,()=>{if(!e.hideSelected&&w.value&&c.value.length){const t=h.value.findIndex(t=>c.value.some(a=>(e.valueComparator||B)(a.value,t.value)));$&&window.requestAnimationFrame(()=>{t>=0&&i.value?.scrollToIndex(t)})}}),Nv(()=>e.items,(e,t)=>{w.value||f.value&&!t.length&&e.length&&(w.value=!0)}),wt(()=>{const t=!(!e.chips&&!a.chip),r=!!(!e.hideNoData||h.value.length||a["prepend-item"]||a["append-item"]||a["no-data"]),s=c.value.length>0,u=Kd.filterProps(e),v=s||!f.value&&e.label&&!e.persistentPlaceholder?void 0:e.placeholder;return kv(Kd,xv({ref:n},u,{modelValue:c.value.map(e=>e.props.value).join(", "),"onUpdate:modelValue":F,focused:f.value,"onUpdate:focused":e=>f.value=e,validationValue:c.externalValue,counterValue:d.value,dirty:s,class:["v-select",{"v-select--active-menu":w.value,"v-select--chips":!!e.chips,["v-select--"+(e.multiple?"multiple":"single")]:!0,"v-select--selected":c.value.length,"v-select--selection-slot":!!a.selection},e.class],style:e.style,inputmode:"none",placeholder:v,"onClick:clear":_,"onMousedown:control":I,onBlur:E,onKeydown:N,"aria-label":l(S.value),title:l(S.value)}),{...a,default:()=>kv(Sv,null,[kv(md,xv({ref:o,modelValue:w.value,"onUpdate:modelValue":e=>w.value=e,activator:"parent",contentClass:"v-select__content",disabled:y.value,eager:e.eager,maxHeight:310,openOnClick:!1,closeOnContentClick:!1,transition:e.transition,onAfterEnter:D,onAfterLeave:R},k.value),{default:()=>[r&&kv(hu,xv({ref:x,selected:p.value,selectStrategy:e.multiple?"independent":"single-independent",onMousedown:e=>e.preventDefault(),onKeydown:A,onFocusin:L,tabindex:"-1","aria-live":"polite","aria-label":`${e.label}-list`,color:e.itemColor??e.color},C,e.listProps),{default:()=>[a["prepend-item"]?.(),!h.value.length&&!e.hideNoData&&(a["no-data"]?.()??kv(Ws,{key:"no-data",title:l(e.noDataText)},null)),kv(hv,{ref:i,renderless:!0,items:h.value,itemKey:"value"},{default:t=>{let{item:l,index:n,itemRef:o}=t;const i=_v(l.props,{ref:o,key:l.value,onClick:()=>T(l,null)});return a.item?.({item:l,index:n,props:i})??kv(Ws,xv(i,{role:"option"}),{prepend:t=>{let{isSelected:a}=t;return kv(Sv,null,[e.multiple&&!e.hideSelected?kv(_i,{key:l.value,modelValue:a,ripple:!1,tabindex:"-1"},null):void 0,l.props.prependAvatar&&kv(Ko,{image:l.props.prependAvatar},null),l.props.prependIcon&&kv(bn,{icon:l.props.prependIcon},null)])}})}}),a["append-item"]?.()]})]}),c.value.map((l,n)=>{function o(e){e.stopPropagation(),e.preventDefault(),T(l,!1)}const i={"onClick:close":o,onKeydown(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),o(e))},onMousedown(e){e.preventDefault(),e.stopPropagation()},modelValue:!0,"onUpdate:modelValue":void 0},r=t?!!a.chip:!!a.selection,s=r?se(t?a.chip({item:l,index:n,props:i}):a.selection({item:l,index:n})):void 0;if(!r||s)return kv("div",{key:l.value,class:"v-select__selection"},[t?a.chip?kv(ra,{key:"chip-defaults",defaults:{VChip:{closable:e.closableChips,size:"small",text:l.title}}},{default:()=>[s]}):kv(Hr,xv({key:"chip",closable:e.closableChips,size:"small",text:l.title,disabled:l.props.disabled},i),null):s??kv("span",{class:"v-select__selection-text"},[l.title,e.multiple&&n<c.value.length-1&&kv("span",{class:"v-select__selection-comma"},[Vv(",")])])])})]),"append-inner":function(){for(var t=arguments.length,l=new Array(t),o=0;o<t;o++)l[o]=arguments[o];return kv(Sv,null,[a["append-inner"]?.(...l),e.menuIcon?kv(bn,{class:"v-select__menu-icon",color:n.value?.fieldIconColor,icon:e.menuIcon},null):void 0])}})}),Zc({isFocused:f,menu:w,select:T},n)}}),{computed:Rv,shallowRef:$v,unref:Lv,watchEffect:Fv,createVNode:Mv,Fragment:Ov}=await e("vue"),zv=(e,t,a)=>{if(null==e||null==t)return-1;if(!t.length)return 0;e=e.toString().toLocaleLowerCase(),t=t.toString().toLocaleLowerCase();const l=[];let n=e.indexOf(t);for(;~n;)l.push([n,n+t.length]),n=e.indexOf(t,n+t.length);return l.length?l:-1};function jv(e,t){if(null!=e&&"boolean"!=typeof e&&-1!==e)return"number"==typeof e?[[e,e+t.length]]:Array.isArray(e[0])?e:[e]}const Hv=t({customFilter:Function,customKeyFilter:Object,filterKeys:[Array,String],filterMode:{type:String,default:"intersection"},noFilter:Boolean},"filter");function Wv(e,t,a,l){const n=$v([]),o=$v(new Map),i=Rv(()=>l?.transform?Lv(t).map(e=>[e,l.transform(e)]):Lv(t));return Fv(()=>{const r="function"==typeof a?a():Lv(a),s="string"!=typeof r&&"number"!=typeof r?"":String(r),u=function(e,t,a){const l=[],n=a?.default??zv,o=!!a?.filterKeys&&P(a.filterKeys),i=Object.keys(a?.customKeyFilter??{}).length;if(!e?.length)return l;e:for(let r=0;r<e.length;r++){const[s,u=s]=P(e[r]),c={},d={};let v=-1;if((t||i>0)&&!a?.noFilter){if("object"==typeof s){const e=o||Object.keys(u);for(const l of e){const e=ee(u,l),o=a?.customKeyFilter?.[l];if(v=o?o(e,t,s):n(e,t,s),-1!==v&&!1!==v)o?c[l]=jv(v,t):d[l]=jv(v,t);else if("every"===a?.filterMode)continue e}}else v=n(s,t,s),-1!==v&&!1!==v&&(d.title=jv(v,t));const e=Object.keys(d).length,l=Object.keys(c).length;if(!e&&!l)continue;if("union"===a?.filterMode&&l!==i&&!e)continue;if("intersection"===a?.filterMode&&(l!==i||!e))continue}l.push({index:r,matches:{...d,...c}})}return l}(i.value,s,{customKeyFilter:{...e.customKeyFilter,...Lv(l?.customKeyFilter)},default:e.customFilter,filterKeys:e.filterKeys,filterMode:e.filterMode,noFilter:e.noFilter}),c=Lv(t),d=[],v=new Map;u.forEach(e=>{let{index:t,matches:a}=e;const l=c[t];d.push(l),v.set(l.value,a)}),n.value=d,o.value=v}),{filteredItems:n,filteredMatches:o,getMatches:function(e){return o.value.get(e.value)}}}function Uv(e,t,a){return null!=a&&a.length?a.map((l,n)=>{const o=0===n?0:a[n-1][1],i=[Mv("span",{class:`${e}__unmask`},[t.slice(o,l[0])]),Mv("span",{class:`${e}__mask`},[t.slice(l[0],l[1])])];return n===a.length-1&&i.push(Mv("span",{class:`${e}__unmask`},[t.slice(l[1])])),Mv(Ov,null,[i])}):t}const{Fragment:Gv,createVNode:Yv,mergeProps:qv,createTextVNode:Kv}=await e("vue"),{computed:Xv,mergeProps:Jv,nextTick:Qv,ref:Zv,shallowRef:ep,watch:tp}=await e("vue"),ap=t({autoSelectFirst:{type:[Boolean,String]},clearOnSelect:Boolean,search:String,...Hv({filterKeys:["title"]}),...Tv(),...H(qd({modelValue:null,role:"combobox"}),["validationValue","dirty","appendInnerIcon"]),...Ia({transition:!1})},"VAutocomplete"),lp=o()({name:"VAutocomplete",props:ap(),emits:{"update:focused":e=>!0,"update:search":e=>!0,"update:modelValue":e=>!0,"update:menu":e=>!0},setup(e,t){let{slots:a}=t;const{t:l}=M(),n=Zv(),o=ep(!1),i=ep(!0),r=ep(!1),s=Zv(),u=Zv(),c=ep(-1),{items:d,transformIn:v,transformOut:p}=su(e),{textColorClasses:f,textColorStyles:m}=ha(()=>n.value?.color),g=V(e,"search",""),h=V(e,"modelValue",[],e=>v(null===e?[null]:P(e)),t=>{const a=p(t);return e.multiple?a:a[0]??null}),y=Xv(()=>"function"==typeof e.counterValue?e.counterValue(h.value):"number"==typeof e.counterValue?e.counterValue:h.value.length),b=Gi(e),{filteredItems:w,getMatches:S}=Wv(e,d,()=>i.value?"":g.value),k=Xv(()=>e.hideSelected?w.value.filter(e=>!h.value.some(t=>t.value===e.value)):w.value),x=Xv(()=>!(!e.chips&&!a.chip)),C=Xv(()=>x.value||!!a.selection),_=Xv(()=>h.value.map(e=>e.props.value)),I=Xv(()=>(!0===e.autoSelectFirst||"exact"===e.autoSelectFirst&&g.value===k.value[0]?.title)&&k.value.length>0&&!i.value&&!r.value),A=Xv(()=>e.hideNoData&&!k.value.length||b.isReadonly.value||b.isDisabled.value),N=V(e,"menu"),T=Xv({get:()=>N.value,set:e=>{N.value&&!e&&s.value?.ΨopenChildren.size||e&&A.value||(N.value=e)}}),E=Xv(()=>T.value?e.closeText:e.openText),D=Zv(),R=wv(D,n);function L(t){e.openOnClear&&(T.value=!0),g.value=""}function F(){A.value||(T.value=!0)}function O(e){A.value||(o.value&&(e.preventDefault(),e.stopPropagation()),T.value=!T.value)}function z(e){" "!==e.key&&ue(e)&&n.value?.focus()}function H(t){if(b.isReadonly.value)return;const a=n.value?.selectionStart,l=h.value.length;if(["Enter","ArrowDown","ArrowUp"].includes(t.key)&&t.preventDefault(),["Enter","ArrowDown"].includes(t.key)&&(T.value=!0),["Escape"].includes(t.key)&&(T.value=!1),I.value&&["Enter","Tab"].includes(t.key)&&!h.value.some(e=>{let{value:t}=e;return t===k.value[0].value})&&J(k.value[0]),"ArrowDown"===t.key&&I.value&&D.value?.focus("next"),["Backspace","Delete"].includes(t.key)){if(!e.multiple&&C.value&&h.value.length>0&&!g.value)return J(h.value[0],!1);if(~c.value){t.preventDefault();const e=c.value;J(h.value[c.value],!1),c.value=e>=l-1?l-2:e}else"Backspace"!==t.key||g.value||(c.value=l-1)}else if(e.multiple)if("ArrowLeft"===t.key){if(c.value<0&&a&&a>0)return;const e=c.value>-1?c.value-1:l-1;if(h.value[e])c.value=e;else{const e=g.value?.length??null;c.value=-1,n.value?.setSelectionRange(e,e)}}else if("ArrowRight"===t.key){if(c.value<0)return;const e=c.value+1;h.value[e]?c.value=e:(c.value=-1,n.value?.setSelectionRange(0,0))}else~c.value&&ue(t)&&(c.value=-1)}function W(e){if(j(n.value,":autofill")||j(n.value,":-webkit-autofill")){const t=d.value.find(t=>t.title===e.target.value);t&&J(t)}}function U(){e.eager&&u.value?.calculateVisibleItems()}function G(){o.value&&(i.value=!0,n.value?.focus())}function Y(e){o.value=!0,setTimeout(()=>{r.value=!0})}function q(e){r.value=!1}function K(t){null!=t&&(""!==t||e.multiple||C.value)||(h.value=[])}const X=ep(!1);function J(t){let a=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(t&&!t.props.disabled)if(e.multiple){const l=h.value.findIndex(a=>(e.valueComparator||B)(a.value,t.value)),n=null==a?!~l:a;if(~l){const e=n?[...h.value,t]:[...h.value];e.splice(l,1),h.value=e}else n&&(h.value=[...h.value,t]);e.clearOnSelect&&(g.value="")}else{const e=!1!==a;h.value=e?[t]:[],g.value=e&&!C.value?t.title:"",Qv(()=>{T.value=!1,i.value=!0})}}return tp(o,(t,a)=>{t!==a&&(t?(X.value=!0,g.value=e.multiple||C.value?"":String(h.value.at(-1)?.props.title??""),i.value=!0,Qv(()=>X.value=!1)):(e.multiple||null!=g.value||(h.value=[]),T.value=!1,(e.multiple||C.value)&&(g.value=""),c.value=-1))}),tp(g,e=>{o.value&&!X.value&&(e&&(T.value=!0),i.value=!e)}),tp(T,()=>{if(!e.hideSelected&&T.value&&h.value.length){const e=k.value.findIndex(e=>h.value.some(t=>e.value===t.value));$&&window.requestAnimationFrame(()=>{e>=0&&u.value?.scrollToIndex(e)})}}),tp(()=>e.items,(e,t)=>{T.value||o.value&&!t.length&&e.length&&(T.value=!0)}),tp(h,t=>{e.multiple||C.value||(g.value=t[0]?.title??"")}),wt(()=>{const t=!!(!e.hideNoData||k.value.length||a["prepend-item"]||a["append-item"]||a["no-data"]),r=h.value.length>0,d=Kd.filterProps(e);return Yv(Kd,qv({ref:n},d,{modelValue:g.value,"onUpdate:modelValue":[e=>g.value=e,K],focused:o.value,"onUpdate:focused":e=>o.value=e,validationValue:h.externalValue,counterValue:y.value,dirty:r,onChange:W,class:["v-autocomplete","v-autocomplete--"+(e.multiple?"multiple":"single"),{"v-autocomplete--active-menu":T.value,"v-autocomplete--chips":!!e.chips,"v-autocomplete--selection-slot":!!C.value,"v-autocomplete--selecting-index":c.value>-1},e.class],style:e.style,readonly:b.isReadonly.value,placeholder:r?void 0:e.placeholder,"onClick:clear":L,"onMousedown:control":F,onKeydown:H}),{...a,default:()=>Yv(Gv,null,[Yv(md,qv({ref:s,modelValue:T.value,"onUpdate:modelValue":e=>T.value=e,activator:"parent",contentClass:"v-autocomplete__content",disabled:A.value,eager:e.eager,maxHeight:310,openOnClick:!1,closeOnContentClick:!1,transition:e.transition,onAfterEnter:U,onAfterLeave:G},e.menuProps),{default:()=>[t&&Yv(hu,qv({ref:D,selected:_.value,selectStrategy:e.multiple?"independent":"single-independent",onMousedown:e=>e.preventDefault(),onKeydown:z,onFocusin:Y,onFocusout:q,tabindex:"-1","aria-live":"polite",color:e.itemColor??e.color},R,e.listProps),{default:()=>[a["prepend-item"]?.(),!k.value.length&&!e.hideNoData&&(a["no-data"]?.()??Yv(Ws,{key:"no-data",title:l(e.noDataText)},null)),Yv(hv,{ref:u,renderless:!0,items:k.value,itemKey:"value"},{default:t=>{let{item:l,index:n,itemRef:o}=t;const r=Jv(l.props,{ref:o,key:l.value,active:!(!I.value||0!==n)||void 0,onClick:()=>J(l,null)});return a.item?.({item:l,index:n,props:r})??Yv(Ws,qv(r,{role:"option"}),{prepend:t=>{let{isSelected:a}=t;return Yv(Gv,null,[e.multiple&&!e.hideSelected?Yv(_i,{key:l.value,modelValue:a,ripple:!1,tabindex:"-1"},null):void 0,l.props.prependAvatar&&Yv(Ko,{image:l.props.prependAvatar},null),l.props.prependIcon&&Yv(bn,{icon:l.props.prependIcon},null)])},title:()=>i.value?l.title:Uv("v-autocomplete",l.title,S(l)?.title)})}}),a["append-item"]?.()]})]}),h.value.map((t,l)=>{function n(e){e.stopPropagation(),e.preventDefault(),J(t,!1)}const o={"onClick:close":n,onKeydown(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),n(e))},onMousedown(e){e.preventDefault(),e.stopPropagation()},modelValue:!0,"onUpdate:modelValue":void 0},i=x.value?!!a.chip:!!a.selection,r=i?se(x.value?a.chip({item:t,index:l,props:o}):a.selection({item:t,index:l})):void 0;if(!i||r)return Yv("div",{key:t.value,class:["v-autocomplete__selection",l===c.value&&["v-autocomplete__selection--selected",f.value]],style:l===c.value?m.value:{}},[x.value?a.chip?Yv(ra,{key:"chip-defaults",defaults:{VChip:{closable:e.closableChips,size:"small",text:t.title}}},{default:()=>[r]}):Yv(Hr,qv({key:"chip",closable:e.closableChips,size:"small",text:t.title,disabled:t.props.disabled},o),null):r??Yv("span",{class:"v-autocomplete__selection-text"},[t.title,e.multiple&&l<h.value.length-1&&Yv("span",{class:"v-autocomplete__selection-comma"},[Kv(",")])])])})]),"append-inner":function(){for(var t=arguments.length,o=new Array(t),i=0;i<t;i++)o[i]=arguments[i];return Yv(Gv,null,[a["append-inner"]?.(...o),e.menuIcon?Yv(bn,{class:"v-autocomplete__menu-icon",color:n.value?.fieldIconColor,icon:e.menuIcon,onMousedown:O,onClick:ce,"aria-label":l(E.value),title:l(E.value),tabindex:"-1"},null):void 0])}})}),Zc({isFocused:o,isPristine:i,menu:T,search:g,filteredItems:w,select:J},n)}}),{createVNode:np,vShow:op,mergeProps:ip,withDirectives:rp}=await e("vue"),sp=t({bordered:Boolean,color:String,content:[Number,String],dot:Boolean,floating:Boolean,icon:E,inline:Boolean,label:{type:String,default:"$vuetify.badge"},max:[Number,String],modelValue:{type:Boolean,default:!0},offsetX:[Number,String],offsetY:[Number,String],textColor:String,...qe(),...En({location:"top end"}),...Sa(),...Vt(),...c(),...Ia({transition:"scale-rotate-transition"})},"VBadge"),up=o()({name:"VBadge",inheritAttrs:!1,props:sp(),setup(e,t){const{backgroundColorClasses:a,backgroundColorStyles:l}=ya(()=>e.color),{roundedClasses:n}=ka(e),{t:o}=M(),{textColorClasses:i,textColorStyles:r}=ha(()=>e.textColor),{themeClasses:s}=N(),{locationStyles:u}=Dn(e,!0,t=>(e.floating?e.dot?2:4:e.dot?8:12)+(["top","bottom"].includes(t)?Number(e.offsetY??0):["left","right"].includes(t)?Number(e.offsetX??0):0));return wt(()=>{const c=Number(e.content),d=!e.max||isNaN(c)?e.content:c<=Number(e.max)?c:`${e.max}+`,[v,p]=de(t.attrs,["aria-atomic","aria-label","aria-live","role","title"]);return np(e.tag,ip({class:["v-badge",{"v-badge--bordered":e.bordered,"v-badge--dot":e.dot,"v-badge--floating":e.floating,"v-badge--inline":e.inline},e.class]},p,{style:e.style}),{default:()=>[np("div",{class:"v-badge__wrapper"},[t.slots.default?.(),np(Ba,{transition:e.transition},{default:()=>[rp(np("span",ip({class:["v-badge__badge",s.value,a.value,n.value,i.value],style:[l.value,r.value,e.inline?{}:u.value],"aria-atomic":"true","aria-label":o(e.label,c),"aria-live":"polite",role:"status"},v),[e.dot?void 0:t.slots.badge?t.slots.badge?.():e.icon?np(bn,{icon:e.icon},null):d]),[[op,e.modelValue]])]})])]})}),{}}}),{createVNode:cp}=await e("vue"),dp=t({color:String,density:String,...qe()},"VBannerActions"),vp=o()({name:"VBannerActions",props:dp(),setup(e,t){let{slots:a}=t;return v({VBtn:{color:e.color,density:e.density,slim:!0,variant:"text"}}),wt(()=>cp("div",{class:["v-banner-actions",e.class],style:e.style},[a.default?.()])),{}}}),pp=vt("v-banner-text"),{createVNode:fp}=await e("vue"),{toRef:mp}=await e("vue"),gp=t({avatar:String,bgColor:String,color:String,icon:E,lines:String,stacked:Boolean,sticky:Boolean,text:String,...Ka(),...qe(),...Al(),...ua(),...q({mobile:null}),...Za(),...En(),...Yn(),...Sa(),...Vt(),...c()},"VBanner"),hp=o()({name:"VBanner",props:gp(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.bgColor),{borderClasses:o}=Xa(e),{densityClasses:i}=Nl(e),{displayClasses:s,mobile:u}=G(e),{dimensionStyles:c}=ca(e),{elevationClasses:d}=el(e),{locationStyles:p}=Dn(e),{positionClasses:f}=qn(e),{roundedClasses:m}=ka(e),{themeClasses:g}=r(e),h=mp(()=>e.color),y=mp(()=>e.density);v({VBannerActions:{color:h,density:y}}),wt(()=>{const t=!(!e.text&&!a.text),r=!(!e.avatar&&!e.icon),v=!(!r&&!a.prepend);return fp(e.tag,{class:["v-banner",{"v-banner--stacked":e.stacked||u.value,"v-banner--sticky":e.sticky,[`v-banner--${e.lines}-line`]:!!e.lines},g.value,l.value,o.value,i.value,s.value,d.value,f.value,m.value,e.class],style:[n.value,c.value,p.value,e.style],role:"banner"},{default:()=>[v&&fp("div",{key:"prepend",class:"v-banner__prepend"},[a.prepend?fp(ra,{key:"prepend-defaults",disabled:!r,defaults:{VAvatar:{color:h.value,density:y.value,icon:e.icon,image:e.avatar}}},a.prepend):fp(Ko,{key:"prepend-avatar",color:h.value,density:y.value,icon:e.icon,image:e.avatar},null)]),fp("div",{class:"v-banner__content"},[t&&fp(pp,{key:"text"},{default:()=>[a.text?.()??e.text]}),a.default?.()]),a.actions&&fp(vp,{key:"actions"},a.actions)]})})}}),{createVNode:yp}=await e("vue"),{computed:bp,toRef:wp}=await e("vue"),Sp=t({baseColor:String,bgColor:String,color:String,grow:Boolean,mode:{type:String,validator:e=>!e||["horizontal","shift"].includes(e)},height:{type:[Number,String],default:56},active:{type:Boolean,default:!0},...Ka(),...qe(),...Al(),...Za(),...Sa(),...I({name:"bottom-navigation"}),...Vt({tag:"header"}),...tn({selectedClass:"v-btn--selected"}),...c()},"VBottomNavigation"),kp=o()({name:"VBottomNavigation",props:Sp(),emits:{"update:active":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=N(),{borderClasses:n}=Xa(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.bgColor),{densityClasses:r}=Nl(e),{elevationClasses:s}=el(e),{roundedClasses:u}=ka(e),{ssrBootStyles:c}=yl(),d=bp(()=>Number(e.height)-("comfortable"===e.density?8:0)-("compact"===e.density?16:0)),f=V(e,"active",e.active),{layoutItemStyles:m}=_({id:e.name,order:bp(()=>parseInt(e.order,10)),position:wp(()=>"bottom"),layoutSize:wp(()=>f.value?d.value:0),elementSize:d,active:f,absolute:wp(()=>e.absolute)});return nn(e,un),v({VBtn:{baseColor:wp(()=>e.baseColor),color:wp(()=>e.color),density:wp(()=>e.density),stacked:wp(()=>"horizontal"!==e.mode),variant:"text"}},{scoped:!0}),wt(()=>yp(e.tag,{class:["v-bottom-navigation",{"v-bottom-navigation--active":f.value,"v-bottom-navigation--grow":e.grow,"v-bottom-navigation--shift":"shift"===e.mode},l.value,o.value,n.value,r.value,s.value,u.value,e.class],style:[i.value,m.value,{height:p(d.value)},c.value,e.style]},{default:()=>[a.default&&yp("div",{class:"v-bottom-navigation__content"},[a.default()])]})),{}}}),{createVNode:xp,mergeProps:Vp}=await e("vue"),{mergeProps:Cp,nextTick:_p,onBeforeUnmount:Ip,ref:Bp,watch:Pp}=await e("vue"),Ap=t({fullscreen:Boolean,retainFocus:{type:Boolean,default:!0},scrollable:Boolean,...Kc({origin:"center center",scrollStrategy:"block",transition:{component:zt},zIndex:2400})},"VDialog"),Np=o()({name:"VDialog",props:Ap(),emits:{"update:modelValue":e=>!0,afterEnter:()=>!0,afterLeave:()=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=V(e,"modelValue"),{scopeId:o}=mc(),i=Bp();function r(e){const t=e.relatedTarget,a=e.target;if(t!==a&&i.value?.contentEl&&i.value?.globalTop&&![document,i.value.contentEl].includes(a)&&!i.value.contentEl.contains(a)){const e=K(i.value.contentEl);if(!e.length)return;const a=e[0],l=e[e.length-1];t===a?l.focus():a.focus()}}function s(){a("afterEnter"),(e.scrim||e.retainFocus)&&i.value?.contentEl&&!i.value.contentEl.contains(document.activeElement)&&i.value.contentEl.focus({preventScroll:!0})}function u(){a("afterLeave")}return Ip(()=>{document.removeEventListener("focusin",r)}),$&&Pp(()=>n.value&&e.retainFocus,e=>{e?document.addEventListener("focusin",r):document.removeEventListener("focusin",r)},{immediate:!0}),Pp(n,async e=>{e||(await _p(),i.value.activatorEl?.focus({preventScroll:!0}))}),wt(()=>{const t=Xc.filterProps(e),a=Cp({"aria-haspopup":"dialog"},e.activatorProps),r=Cp({tabindex:-1},e.contentProps);return xp(Xc,Vp({ref:i,class:["v-dialog",{"v-dialog--fullscreen":e.fullscreen,"v-dialog--scrollable":e.scrollable},e.class],style:e.style},t,{modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,"aria-modal":"true",activatorProps:a,contentProps:r,height:e.fullscreen?void 0:e.height,width:e.fullscreen?void 0:e.width,maxHeight:e.fullscreen?void 0:e.maxHeight,maxWidth:e.fullscreen?void 0:e.maxWidth,role:"dialog",onAfterEnter:s,onAfterLeave:u},o),{activator:l.activator,default:function(){for(var e=arguments.length,t=new Array(e),a=0;a<e;a++)t[a]=arguments[a];return xp(ra,{root:"VDialog"},{default:()=>[l.default?.(...t)]})}})}),Zc({},i)}}),{mergeProps:Tp,createVNode:Ep}=await e("vue"),Dp=t({inset:Boolean,...Ap({transition:"bottom-sheet-transition"})},"VBottomSheet"),Rp=o()({name:"VBottomSheet",props:Dp(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue");return wt(()=>{const t=Np.filterProps(e);return Ep(Np,Tp(t,{contentClass:["v-bottom-sheet__content",e.contentClass],modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,class:["v-bottom-sheet",{"v-bottom-sheet--inset":e.inset},e.class],style:e.style}),a)}),{}}}),{createVNode:$p}=await e("vue"),Lp=t({divider:[Number,String],...qe()},"VBreadcrumbsDivider"),Fp=o()({name:"VBreadcrumbsDivider",props:Lp(),setup(e,t){let{slots:a}=t;return wt(()=>$p("li",{"aria-hidden":"true",class:["v-breadcrumbs-divider",e.class],style:e.style},[a?.default?.()??e.divider])),{}}}),{mergeProps:Mp,createVNode:Op}=await e("vue"),{computed:zp}=await e("vue"),jp=t({active:Boolean,activeClass:String,activeColor:String,color:String,disabled:Boolean,title:String,...qe(),...lo(),...Vt({tag:"li"})},"VBreadcrumbsItem"),Hp=o()({name:"VBreadcrumbsItem",props:jp(),setup(e,t){let{slots:a,attrs:l}=t;const n=ao(e,l),o=zp(()=>e.active||n.isActive?.value),{textColorClasses:i,textColorStyles:r}=ha(()=>o.value?e.activeColor:e.color);return wt(()=>Op(e.tag,{class:["v-breadcrumbs-item",{"v-breadcrumbs-item--active":o.value,"v-breadcrumbs-item--disabled":e.disabled,[`${e.activeClass}`]:o.value&&e.activeClass},i.value,e.class],style:[r.value,e.style],"aria-current":o.value?"page":void 0},{default:()=>[n.isLink.value?Op("a",Mp({class:"v-breadcrumbs-item--link",onClick:n.navigate},n.linkProps),[a.default?.()??e.title]):a.default?.()??e.title]})),{}}}),{createVNode:Wp,Fragment:Up,mergeProps:Gp}=await e("vue"),{computed:Yp,toRef:qp}=await e("vue"),Kp=t({activeClass:String,activeColor:String,bgColor:String,color:String,disabled:Boolean,divider:{type:String,default:"/"},icon:E,items:{type:Array,default:()=>[]},...qe(),...Al(),...Sa(),...Vt({tag:"ul"})},"VBreadcrumbs"),Xp=o()({name:"VBreadcrumbs",props:Kp(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.bgColor),{densityClasses:o}=Nl(e),{roundedClasses:i}=ka(e);v({VBreadcrumbsDivider:{divider:qp(()=>e.divider)},VBreadcrumbsItem:{activeClass:qp(()=>e.activeClass),activeColor:qp(()=>e.activeColor),color:qp(()=>e.color),disabled:qp(()=>e.disabled)}});const r=Yp(()=>e.items.map(e=>"string"==typeof e?{item:{title:e},raw:e}:{item:e,raw:e}));return wt(()=>{const t=!(!a.prepend&&!e.icon);return Wp(e.tag,{class:["v-breadcrumbs",l.value,o.value,i.value,e.class],style:[n.value,e.style]},{default:()=>[t&&Wp("li",{key:"prepend",class:"v-breadcrumbs__prepend"},[a.prepend?Wp(ra,{key:"prepend-defaults",disabled:!e.icon,defaults:{VIcon:{icon:e.icon,start:!0}}},a.prepend):Wp(bn,{key:"prepend-icon",start:!0,icon:e.icon},null)]),r.value.map((e,t,l)=>{let{item:n,raw:o}=e;return Wp(Up,null,[a.item?.({item:n,index:t})??Wp(Hp,Gp({key:t,disabled:t>=l.length-1},"string"==typeof n?{title:n}:n),{default:a.title?()=>a.title?.({item:n,index:t}):void 0}),t<l.length-1&&Wp(Fp,null,{default:a.divider?()=>a.divider?.({item:o,index:t}):void 0})])}),a.default?.()]})}),{}}}),{createVNode:Jp}=await e("vue"),Qp=o()({name:"VCardActions",props:qe(),setup(e,t){let{slots:a}=t;return v({VBtn:{slim:!0,variant:"text"}}),wt(()=>Jp("div",{class:["v-card-actions",e.class],style:e.style},[a.default?.()])),{}}}),{createVNode:Zp}=await e("vue"),ef=t({opacity:[Number,String],...qe(),...Vt()},"VCardSubtitle"),tf=o()({name:"VCardSubtitle",props:ef(),setup(e,t){let{slots:a}=t;return wt(()=>Zp(e.tag,{class:["v-card-subtitle",e.class],style:[{"--v-card-subtitle-opacity":e.opacity},e.style]},a)),{}}}),af=vt("v-card-title"),{Fragment:lf,createVNode:nf}=await e("vue"),{toDisplayString:of}=await e("vue"),rf=t({appendAvatar:String,appendIcon:E,prependAvatar:String,prependIcon:E,subtitle:{type:[String,Number,Boolean],default:void 0},title:{type:[String,Number,Boolean],default:void 0},...qe(),...Al()},"VCardItem"),sf=o()({name:"VCardItem",props:rf(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=!(!e.prependAvatar&&!e.prependIcon),l=!(!t&&!a.prepend),n=!(!e.appendAvatar&&!e.appendIcon),o=!(!n&&!a.append),i=!(null==e.title&&!a.title),r=!(null==e.subtitle&&!a.subtitle);return nf("div",{class:["v-card-item",e.class],style:e.style},[l&&nf("div",{key:"prepend",class:"v-card-item__prepend"},[a.prepend?nf(ra,{key:"prepend-defaults",disabled:!t,defaults:{VAvatar:{density:e.density,image:e.prependAvatar},VIcon:{density:e.density,icon:e.prependIcon}}},a.prepend):nf(lf,null,[e.prependAvatar&&nf(Ko,{key:"prepend-avatar",density:e.density,image:e.prependAvatar},null),e.prependIcon&&nf(bn,{key:"prepend-icon",density:e.density,icon:e.prependIcon},null)])]),nf("div",{class:"v-card-item__content"},[i&&nf(af,{key:"title"},{default:()=>[a.title?.()??of(e.title)]}),r&&nf(tf,{key:"subtitle"},{default:()=>[a.subtitle?.()??of(e.subtitle)]}),a.default?.()]),o&&nf("div",{key:"append",class:"v-card-item__append"},[a.append?nf(ra,{key:"append-defaults",disabled:!n,defaults:{VAvatar:{density:e.density,image:e.appendAvatar},VIcon:{density:e.density,icon:e.appendIcon}}},a.append):nf(lf,null,[e.appendIcon&&nf(bn,{key:"append-icon",density:e.density,icon:e.appendIcon},null),e.appendAvatar&&nf(Ko,{key:"append-avatar",density:e.density,image:e.appendAvatar},null)])])])}),{}}}),{createVNode:uf}=await e("vue"),cf=t({opacity:[Number,String],...qe(),...Vt()},"VCardText"),df=o()({name:"VCardText",props:cf(),setup(e,t){let{slots:a}=t;return wt(()=>uf(e.tag,{class:["v-card-text",e.class],style:[{"--v-card-text-opacity":e.opacity},e.style]},a)),{}}}),{createVNode:vf,resolveDirective:pf,mergeProps:ff,withDirectives:mf}=await e("vue"),gf=t({appendAvatar:String,appendIcon:E,disabled:Boolean,flat:Boolean,hover:Boolean,image:String,link:{type:Boolean,default:void 0},prependAvatar:String,prependIcon:E,ripple:{type:[Boolean,Object],default:!0},subtitle:{type:[String,Number,Boolean],default:void 0},text:{type:[String,Number,Boolean],default:void 0},title:{type:[String,Number,Boolean],default:void 0},...Ka(),...qe(),...Al(),...ua(),...Za(),...jn(),...En(),...Yn(),...Sa(),...lo(),...Vt(),...c(),...Fl({variant:"elevated"})},"VCard"),hf=o()({name:"VCard",directives:{Ripple:Vo},props:gf(),setup(e,t){let{attrs:a,slots:l}=t;const{themeClasses:n}=r(e),{borderClasses:o}=Xa(e),{colorClasses:i,colorStyles:s,variantClasses:u}=Ml(e),{densityClasses:c}=Nl(e),{dimensionStyles:d}=ca(e),{elevationClasses:v}=el(e),{loaderClasses:p}=Hn(e),{locationStyles:f}=Dn(e),{positionClasses:m}=qn(e),{roundedClasses:g}=ka(e),h=ao(e,a);return wt(()=>{const t=!1!==e.link&&h.isLink.value,a=!e.disabled&&!1!==e.link&&(e.link||h.isClickable.value),r=t?"a":e.tag,y=!(!l.title&&null==e.title),b=!(!l.subtitle&&null==e.subtitle),w=y||b,S=!!(l.append||e.appendAvatar||e.appendIcon),k=!!(l.prepend||e.prependAvatar||e.prependIcon),x=!(!l.image&&!e.image),V=w||k||S,C=!(!l.text&&null==e.text);return mf(vf(r,ff({class:["v-card",{"v-card--disabled":e.disabled,"v-card--flat":e.flat,"v-card--hover":e.hover&&!(e.disabled||e.flat),"v-card--link":a},n.value,o.value,i.value,c.value,v.value,p.value,m.value,g.value,u.value,e.class],style:[s.value,d.value,f.value,e.style],onClick:a&&h.navigate,tabindex:e.disabled?-1:void 0},h.linkProps),{default:()=>[x&&vf("div",{key:"image",class:"v-card__image"},[l.image?vf(ra,{key:"image-defaults",disabled:!e.image,defaults:{VImg:{cover:!0,src:e.image}}},l.image):vf(Ya,{key:"image-img",cover:!0,src:e.image},null)]),vf(Wn,{name:"v-card",active:!!e.loading,color:"boolean"==typeof e.loading?void 0:e.loading},{default:l.loader}),V&&vf(sf,{key:"item",prependAvatar:e.prependAvatar,prependIcon:e.prependIcon,title:e.title,subtitle:e.subtitle,appendAvatar:e.appendAvatar,appendIcon:e.appendIcon},{default:l.item,prepend:l.prepend,title:l.title,subtitle:l.subtitle,append:l.append}),C&&vf(df,{key:"text"},{default:()=>[l.text?.()??e.text]}),l.default?.(),l.actions&&vf(Qp,null,{default:l.actions}),Ll(a,"v-card")]}),[[pf("ripple"),a&&e.ripple]])}),{}}});function yf(e,t){const a=e.changedTouches[0];t.touchendX=a.clientX,t.touchendY=a.clientY,t.end?.({originalEvent:e,...t}),(e=>{const{touchstartX:t,touchendX:a,touchstartY:l,touchendY:n}=e;e.offsetX=a-t,e.offsetY=n-l,Math.abs(e.offsetY)<.5*Math.abs(e.offsetX)&&(e.left&&a<t-16&&e.left(e),e.right&&a>t+16&&e.right(e)),Math.abs(e.offsetX)<.5*Math.abs(e.offsetY)&&(e.up&&n<l-16&&e.up(e),e.down&&n>l+16&&e.down(e))})(t)}const bf={mounted:function(e,t){const a=t.value,l=a?.parent?e.parentElement:e,n=a?.options??{passive:!0},o=t.instance?.$.uid;if(!l||!o)return;const i=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const t={touchstartX:0,touchstartY:0,touchendX:0,touchendY:0,touchmoveX:0,touchmoveY:0,offsetX:0,offsetY:0,left:e.left,right:e.right,up:e.up,down:e.down,start:e.start,move:e.move,end:e.end};return{touchstart:e=>function(e,t){const a=e.changedTouches[0];t.touchstartX=a.clientX,t.touchstartY=a.clientY,t.start?.({originalEvent:e,...t})}(e,t),touchend:e=>yf(e,t),touchmove:e=>function(e,t){const a=e.changedTouches[0];t.touchmoveX=a.clientX,t.touchmoveY=a.clientY,t.move?.({originalEvent:e,...t})}(e,t)}}(t.value);l._touchHandlers=l._touchHandlers??Object.create(null),l._touchHandlers[o]=i,ve(i).forEach(e=>{l.addEventListener(e,i[e],n)})},unmounted:function(e,t){const a=t.value?.parent?e.parentElement:e,l=t.instance?.$.uid;if(!a?._touchHandlers||!l)return;const n=a._touchHandlers[l];ve(n).forEach(e=>{a.removeEventListener(e,n[e])}),delete a._touchHandlers[l]}},{createVNode:wf,resolveDirective:Sf,withDirectives:kf}=await e("vue"),{computed:xf,provide:Vf,ref:Cf,shallowRef:_f,toRef:If,watch:Bf}=await e("vue"),Pf=Symbol.for("vuetify:v-window"),Af=Symbol.for("vuetify:v-window-group"),Nf=t({continuous:Boolean,nextIcon:{type:[Boolean,String,Function,Object],default:"$next"},prevIcon:{type:[Boolean,String,Function,Object],default:"$prev"},reverse:Boolean,showArrows:{type:[Boolean,String],validator:e=>"boolean"==typeof e||"hover"===e},touch:{type:[Object,Boolean],default:void 0},direction:{type:String,default:"horizontal"},modelValue:null,disabled:Boolean,selectedClass:{type:String,default:"v-window-item--active"},mandatory:{type:[Boolean,String],default:"force"},...qe(),...Vt(),...c()},"VWindow"),Tf=o()({name:"VWindow",directives:{Touch:bf},props:Nf(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{isRtl:n}=u(),{t:o}=M(),i=nn(e,Af),s=Cf(),c=xf(()=>n.value?!e.reverse:e.reverse),d=_f(!1),v=xf(()=>`v-window-${"vertical"===e.direction?"y":"x"}${(c.value?!d.value:d.value)?"-reverse":""}-transition`),p=_f(0),f=Cf(void 0),m=xf(()=>i.items.value.findIndex(e=>i.selected.value.includes(e.id)));Bf(m,(e,t)=>{const a=i.items.value.length,l=a-1;d.value=a<=2?e<t:e===l&&0===t||(0!==e||t!==l)&&e<t}),Vf(Pf,{transition:v,isReversed:d,transitionCount:p,transitionHeight:f,rootRef:s});const g=If(()=>e.continuous||0!==m.value),h=If(()=>e.continuous||m.value!==i.items.value.length-1);function y(){g.value&&i.prev()}function b(){h.value&&i.next()}const w=xf(()=>{const t=[],l={icon:n.value?e.nextIcon:e.prevIcon,class:"v-window__"+(c.value?"right":"left"),onClick:i.prev,"aria-label":o("$vuetify.carousel.prev")};t.push(g.value?a.prev?a.prev({props:l}):wf(To,l,null):wf("div",null,null));const r={icon:n.value?e.prevIcon:e.nextIcon,class:"v-window__"+(c.value?"left":"right"),onClick:i.next,"aria-label":o("$vuetify.carousel.next")};return t.push(h.value?a.next?a.next({props:r}):wf(To,r,null):wf("div",null,null)),t}),S=xf(()=>{if(!1===e.touch)return e.touch;return{...{left:()=>{c.value?y():b()},right:()=>{c.value?b():y()},start:e=>{let{originalEvent:t}=e;t.stopPropagation()}},...!0===e.touch?{}:e.touch}});return wt(()=>kf(wf(e.tag,{ref:s,class:["v-window",{"v-window--show-arrows-on-hover":"hover"===e.showArrows},l.value,e.class],style:e.style},{default:()=>[wf("div",{class:"v-window__container",style:{height:f.value}},[a.default?.({group:i}),!1!==e.showArrows&&wf("div",{class:"v-window__controls"},[w.value])]),a.additional?.({group:i})]}),[[Sf("touch"),S.value]])),{group:i}}}),{Fragment:Ef,mergeProps:Df,createVNode:Rf}=await e("vue"),{onMounted:$f,ref:Lf,watch:Ff}=await e("vue"),Mf=t({color:String,cycle:Boolean,delimiterIcon:{type:E,default:"$delimiter"},height:{type:[Number,String],default:500},hideDelimiters:Boolean,hideDelimiterBackground:Boolean,interval:{type:[Number,String],default:6e3,validator:e=>Number(e)>0},progress:[Boolean,String],verticalDelimiters:[Boolean,String],...Nf({continuous:!0,mandatory:"force",showArrows:!0})},"VCarousel"),Of=o()({name:"VCarousel",props:Mf(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{t:n}=M(),o=Lf();let i=-1;function r(){e.cycle&&o.value&&(i=window.setTimeout(o.value.group.next,Number(e.interval)>0?Number(e.interval):6e3))}function s(){window.clearTimeout(i),window.requestAnimationFrame(r)}return Ff(l,s),Ff(()=>e.interval,s),Ff(()=>e.cycle,e=>{e?s():window.clearTimeout(i)}),$f(r),wt(()=>{const t=Tf.filterProps(e);return Rf(Tf,Df({ref:o},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,class:["v-carousel",{"v-carousel--hide-delimiter-background":e.hideDelimiterBackground,"v-carousel--vertical-delimiters":e.verticalDelimiters},e.class],style:[{height:p(e.height)},e.style]}),{default:a.default,additional:t=>{let{group:o}=t;return Rf(Ef,null,[!e.hideDelimiters&&Rf("div",{class:"v-carousel__controls",style:{left:"left"===e.verticalDelimiters&&e.verticalDelimiters?0:"auto",right:"right"===e.verticalDelimiters?0:"auto"}},[o.items.value.length>0&&Rf(ra,{defaults:{VBtn:{color:e.color,icon:e.delimiterIcon,size:"x-small",variant:"text"}},scoped:!0},{default:()=>[o.items.value.map((e,t)=>{const l={id:`carousel-item-${e.id}`,"aria-label":n("$vuetify.carousel.ariaLabel.delimiter",t+1,o.items.value.length),class:["v-carousel__controls__item",o.isSelected(e.id)&&"v-btn--active"],onClick:()=>o.select(e.id,!0)};return a.item?a.item({props:l,item:e}):Rf(To,Df(e,l),null)})]})]),e.progress&&Rf(Mn,{class:"v-carousel__progress",color:"string"==typeof e.progress?e.progress:void 0,modelValue:(o.getItemIndex(l.value)+1)/o.items.value.length*100},null)])},prev:a.prev,next:a.next})}),{}}}),{vShow:zf,createVNode:jf,withDirectives:Hf}=await e("vue"),{computed:Wf,inject:Uf,nextTick:Gf,shallowRef:Yf}=await e("vue"),qf=t({reverseTransition:{type:[Boolean,String],default:void 0},transition:{type:[Boolean,String],default:void 0},...qe(),...an(),...pc()},"VWindowItem"),Kf=o()({name:"VWindowItem",directives:{Touch:bf},props:qf(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=Uf(Pf),n=ln(e,Af),{isBooted:o}=yl();if(!l||!n)throw new Error("[Vuetify] VWindowItem must be used inside VWindow");const i=Yf(!1),r=Wf(()=>o.value&&(l.isReversed.value?!1!==e.reverseTransition:!1!==e.transition));function s(){i.value&&l&&(i.value=!1,l.transitionCount.value>0&&(l.transitionCount.value-=1,0===l.transitionCount.value&&(l.transitionHeight.value=void 0)))}function u(){!i.value&&l&&(i.value=!0,0===l.transitionCount.value&&(l.transitionHeight.value=p(l.rootRef.value?.clientHeight)),l.transitionCount.value+=1)}function c(){s()}function d(e){i.value&&Gf(()=>{r.value&&i.value&&l&&(l.transitionHeight.value=p(e.clientHeight))})}const v=Wf(()=>{const t=l.isReversed.value?e.reverseTransition:e.transition;return!!r.value&&{name:"string"!=typeof t?l.transition.value:t,onBeforeEnter:u,onAfterEnter:s,onEnterCancelled:c,onBeforeLeave:u,onAfterLeave:s,onLeaveCancelled:c,onEnter:d}}),{hasContent:f}=fc(e,n.isSelected);return wt(()=>jf(Ba,{transition:v.value,disabled:!o.value},{default:()=>[Hf(jf("div",{class:["v-window-item",n.selectedClass.value,e.class],style:e.style},[f.value&&a.default?.()]),[[zf,n.isSelected.value]])]})),{groupItem:n}}}),{mergeProps:Xf,createVNode:Jf}=await e("vue"),Qf=t({...Ga(),...qf()},"VCarouselItem"),Zf=o()({name:"VCarouselItem",inheritAttrs:!1,props:Qf(),setup(e,t){let{slots:a,attrs:l}=t;wt(()=>{const t=Ya.filterProps(e),n=Kf.filterProps(e);return Jf(Kf,Xf({class:["v-carousel-item",e.class]},n),{default:()=>[Jf(Ya,Xf(l,t),a)]})})}}),em=vt("v-code","code"),{createVNode:tm}=await e("vue"),{computed:am,onMounted:lm,ref:nm,shallowRef:om,watch:im}=await e("vue"),rm=J({name:"VColorPickerCanvas",props:t({color:{type:Object},disabled:Boolean,dotSize:{type:[Number,String],default:10},height:{type:[Number,String],default:150},width:{type:[Number,String],default:300},...qe()},"VColorPickerCanvas")(),emits:{"update:color":e=>!0,"update:position":e=>!0},setup(e,t){let{emit:a}=t;const l=om(!1),n=nm(),o=om(parseFloat(e.width)),i=om(parseFloat(e.height)),r=nm({x:0,y:0}),s=am({get:()=>r.value,set(t){if(!n.value)return;const{x:l,y:s}=t;r.value=t,a("update:color",{h:e.color?.h??0,s:k(l,0,o.value)/o.value,v:1-k(s,0,i.value)/i.value,a:e.color?.a??1})}}),u=am(()=>{const{x:t,y:a}=s.value,l=parseInt(e.dotSize,10)/2;return{width:p(e.dotSize),height:p(e.dotSize),transform:`translate(${p(t-l)}, ${p(a-l)})`}}),{resizeRef:c}=R(e=>{if(!c.el?.offsetParent)return;const{width:t,height:a}=e[0].contentRect;o.value=t,i.value=a});function d(t){"mousedown"===t.type&&t.preventDefault(),e.disabled||(v(t),window.addEventListener("mousemove",v),window.addEventListener("mouseup",f),window.addEventListener("touchmove",v),window.addEventListener("touchend",f))}function v(t){if(e.disabled||!n.value)return;l.value=!0;const a=pe(t);!function(e,t,a){const{left:l,top:n,width:o,height:i}=a;s.value={x:k(e-l,0,o),y:k(t-n,0,i)}}(a.clientX,a.clientY,n.value.getBoundingClientRect())}function f(){window.removeEventListener("mousemove",v),window.removeEventListener("mouseup",f),window.removeEventListener("touchmove",v),window.removeEventListener("touchend",f)}function m(){if(!n.value)return;const t=n.value,a=t.getContext("2d");if(!a)return;const l=a.createLinearGradient(0,0,t.width,0);l.addColorStop(0,"hsla(0, 0%, 100%, 1)"),l.addColorStop(1,`hsla(${e.color?.h??0}, 100%, 50%, 1)`),a.fillStyle=l,a.fillRect(0,0,t.width,t.height);const o=a.createLinearGradient(0,0,0,t.height);o.addColorStop(0,"hsla(0, 0%, 0%, 0)"),o.addColorStop(1,"hsla(0, 0%, 0%, 1)"),a.fillStyle=o,a.fillRect(0,0,t.width,t.height)}return im(()=>e.color?.h,m,{immediate:!0}),im(()=>[o.value,i.value],(e,t)=>{m(),r.value={x:s.value.x*e[0]/t[0],y:s.value.y*e[1]/t[1]}},{flush:"post"}),im(()=>e.color,()=>{l.value?l.value=!1:r.value=e.color?{x:e.color.s*o.value,y:(1-e.color.v)*i.value}:{x:0,y:0}},{deep:!0,immediate:!0}),lm(()=>m()),wt(()=>tm("div",{ref:c,class:["v-color-picker-canvas",e.class],style:e.style,onMousedown:d,onTouchstartPassive:d},[tm("canvas",{ref:n,width:o.value,height:i.value},null),e.color&&tm("div",{class:["v-color-picker-canvas__dot",{"v-color-picker-canvas__dot--disabled":e.disabled}],style:u.value},null)])),{}}});const sm={h:0,s:0,v:0,a:1},um={inputProps:{type:"number",min:0},inputs:[{label:"R",max:255,step:1,getValue:e=>Math.round(e.r),getColor:(e,t)=>({...e,r:Number(t)})},{label:"G",max:255,step:1,getValue:e=>Math.round(e.g),getColor:(e,t)=>({...e,g:Number(t)})},{label:"B",max:255,step:1,getValue:e=>Math.round(e.b),getColor:(e,t)=>({...e,b:Number(t)})},{label:"A",max:1,step:.01,getValue:e=>{let{a:t}=e;return null!=t?Math.round(100*t)/100:1},getColor:(e,t)=>({...e,a:Number(t)})}],to:be,from:ye},cm={...um,inputs:um.inputs?.slice(0,3)},dm={inputProps:{type:"number",min:0},inputs:[{label:"H",max:360,step:1,getValue:e=>Math.round(e.h),getColor:(e,t)=>({...e,h:Number(t)})},{label:"S",max:1,step:.01,getValue:e=>Math.round(100*e.s)/100,getColor:(e,t)=>({...e,s:Number(t)})},{label:"L",max:1,step:.01,getValue:e=>Math.round(100*e.l)/100,getColor:(e,t)=>({...e,l:Number(t)})},{label:"A",max:1,step:.01,getValue:e=>{let{a:t}=e;return null!=t?Math.round(100*t)/100:1},getColor:(e,t)=>({...e,a:Number(t)})}],to:he,from:ge},vm={...dm,inputs:dm.inputs.slice(0,3)},pm={inputProps:{type:"text"},inputs:[{label:"HEXA",getValue:e=>e,getColor:(e,t)=>t}],to:me,from:fe},fm={rgb:cm,rgba:um,hsl:vm,hsla:dm,hex:{...pm,inputs:[{label:"HEX",getValue:e=>e.slice(0,7),getColor:(e,t)=>t}]},hexa:pm},{createVNode:mm}=await e("vue"),{computed:gm}=await e("vue"),hm=e=>{let{label:t,...a}=e;return mm("div",{class:"v-color-picker-edit__input"},[mm("input",a,null),mm("span",null,[t])])},ym=J({name:"VColorPickerEdit",props:t({color:Object,disabled:Boolean,mode:{type:String,default:"rgba",validator:e=>Object.keys(fm).includes(e)},modes:{type:Array,default:()=>Object.keys(fm),validator:e=>Array.isArray(e)&&e.every(e=>Object.keys(fm).includes(e))},...qe()},"VColorPickerEdit")(),emits:{"update:color":e=>!0,"update:mode":e=>!0},setup(e,t){let{emit:a}=t;const l=gm(()=>e.modes.map(e=>({...fm[e],name:e}))),n=gm(()=>{const t=l.value.find(t=>t.name===e.mode);if(!t)return[];const n=e.color?t.to(e.color):null;return t.inputs?.map(l=>{let{getValue:o,getColor:i,...r}=l;return{...t.inputProps,...r,disabled:e.disabled,value:n&&o(n),onChange:e=>{const l=e.target;l&&a("update:color",t.from(i(n??t.to(sm),l.value)))}}})});return wt(()=>mm("div",{class:["v-color-picker-edit",e.class],style:e.style},[n.value?.map(e=>mm(hm,e,null)),l.value.length>1&&mm(To,{icon:"$unfold",size:"x-small",variant:"plain",onClick:()=>{const t=l.value.findIndex(t=>t.name===e.mode);a("update:mode",l.value[(t+1)%l.value.length].name)}},null)])),{}}}),{computed:bm,nextTick:wm,provide:Sm,ref:km,shallowRef:xm,toRef:Vm}=await e("vue"),Cm=Symbol.for("vuetify:v-slider");function _m(e,t,a){const l="vertical"===a,n=t.getBoundingClientRect(),o="touches"in e?e.touches[0]:e;return l?o.clientY-(n.top+n.height/2):o.clientX-(n.left+n.width/2)}const Im=t({disabled:{type:Boolean,default:null},error:Boolean,readonly:{type:Boolean,default:null},max:{type:[Number,String],default:100},min:{type:[Number,String],default:0},step:{type:[Number,String],default:0},thumbColor:String,thumbLabel:{type:[Boolean,String],default:void 0,validator:e=>"boolean"==typeof e||"always"===e},thumbSize:{type:[Number,String],default:20},showTicks:{type:[Boolean,String],default:!1,validator:e=>"boolean"==typeof e||"always"===e},ticks:{type:[Array,Object]},tickSize:{type:[Number,String],default:2},color:String,trackColor:String,trackFillColor:String,trackSize:{type:[Number,String],default:4},direction:{type:String,default:"horizontal",validator:e=>["vertical","horizontal"].includes(e)},reverse:Boolean,...Sa(),...Za({elevation:2}),ripple:{type:Boolean,default:!0}},"Slider"),Bm=e=>{const t=bm(()=>parseFloat(e.min)),a=bm(()=>parseFloat(e.max)),l=bm(()=>Number(e.step)>0?parseFloat(e.step):0),n=bm(()=>Math.max(Se(l.value),Se(t.value)));return{min:t,max:a,step:l,decimals:n,roundValue:function(e){if(e=parseFloat(e),l.value<=0)return e;const o=k(e,t.value,a.value),i=t.value%l.value,r=Math.round((o-i)/l.value)*l.value+i;return parseFloat(Math.min(r,a.value).toFixed(n.value))}}},Pm=e=>{let{props:t,steps:a,onSliderStart:l,onSliderMove:n,onSliderEnd:o,getActiveThumb:i}=e;const{isRtl:r}=u(),s=Vm(()=>t.reverse),c=bm(()=>"vertical"===t.direction),d=bm(()=>c.value!==s.value),{min:v,max:p,step:f,decimals:m,roundValue:g}=a,h=bm(()=>parseInt(t.thumbSize,10)),y=bm(()=>parseInt(t.tickSize,10)),b=bm(()=>parseInt(t.trackSize,10)),w=bm(()=>(p.value-v.value)/f.value),S=Vm(()=>t.disabled),x=bm(()=>t.error||t.disabled?void 0:t.thumbColor??t.color),V=bm(()=>t.error||t.disabled?void 0:t.trackColor??t.color),C=bm(()=>t.error||t.disabled?void 0:t.trackFillColor??t.color),_=xm(!1),I=xm(0),B=km(),P=km();function A(e){const a=B.value?.$el;if(!a)return;const l="vertical"===t.direction,n=l?"top":"left",o=l?"height":"width",i=l?"clientY":"clientX",{[n]:s,[o]:u}=a.getBoundingClientRect(),c=function(e,t){return"touches"in e&&e.touches.length?e.touches[0][t]:"changedTouches"in e&&e.changedTouches.length?e.changedTouches[0][t]:e[t]}(e,i);let f=Math.min(Math.max((c-s-I.value)/u,0),1)||0;return(l?d.value:d.value!==r.value)&&(f=1-f),g(v.value+f*(p.value-v.value))}const N=e=>{const t=A(e);null!=t&&o({value:t}),_.value=!1,I.value=0},T=e=>{const a=A(e);P.value=i(e),P.value&&(_.value=!0,P.value.contains(e.target)?I.value=_m(e,P.value,t.direction):(I.value=0,null!=a&&n({value:a})),null!=a&&l({value:a}),wm(()=>P.value?.focus()))},E={passive:!0,capture:!0};function D(e){const t=A(e);null!=t&&n({value:t})}function R(e){e.stopPropagation(),e.preventDefault(),N(e),window.removeEventListener("mousemove",D,E),window.removeEventListener("mouseup",R)}function $(e){N(e),window.removeEventListener("touchmove",D,E),e.target?.removeEventListener("touchend",$)}const L=e=>{const t=(e-v.value)/(p.value-v.value)*100;return k(isNaN(t)?0:t,0,100)},F=Vm(()=>t.showTicks),M=bm(()=>F.value?t.ticks?Array.isArray(t.ticks)?t.ticks.map(e=>({value:e,position:L(e),label:e.toString()})):Object.keys(t.ticks).map(e=>({value:parseFloat(e),position:L(parseFloat(e)),label:t.ticks[e]})):w.value!==1/0?ke(w.value+1).map(e=>{const t=v.value+e*f.value;return{value:t,position:L(t)}}):[]:[]),O=bm(()=>M.value.some(e=>{let{label:t}=e;return!!t})),z={activeThumbRef:P,color:Vm(()=>t.color),decimals:m,disabled:S,direction:Vm(()=>t.direction),elevation:Vm(()=>t.elevation),hasLabels:O,isReversed:s,indexFromEnd:d,min:v,max:p,mousePressed:_,numTicks:w,onSliderMousedown:function(e){0===e.button&&(e.preventDefault(),T(e),window.addEventListener("mousemove",D,E),window.addEventListener("mouseup",R,{passive:!1}))},onSliderTouchstart:function(e){T(e),window.addEventListener("touchmove",D,E),e.target?.addEventListener("touchend",$,{passive:!1})},parsedTicks:M,parseMouseMove:A,position:L,readonly:Vm(()=>t.readonly),rounded:Vm(()=>t.rounded),roundValue:g,showTicks:F,startOffset:I,step:f,thumbSize:h,thumbColor:x,thumbLabel:Vm(()=>t.thumbLabel),ticks:Vm(()=>t.ticks),tickSize:y,trackColor:V,trackContainerRef:B,trackFillColor:C,trackSize:b,vertical:c};return Sm(Cm,z),z},{createVNode:Am,resolveDirective:Nm,withDirectives:Tm,vShow:Em}=await e("vue"),{computed:Dm,inject:Rm}=await e("vue"),$m=t({focused:Boolean,max:{type:Number,required:!0},min:{type:Number,required:!0},modelValue:{type:Number,required:!0},position:{type:Number,required:!0},ripple:{type:[Boolean,Object],default:!0},name:String,...qe()},"VSliderThumb"),Lm=o()({name:"VSliderThumb",directives:{Ripple:Vo},props:$m(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=Rm(Cm),{isRtl:o,rtlClasses:i}=u();if(!n)throw new Error("[Vuetify] v-slider-thumb must be used inside v-slider or v-range-slider");const{thumbColor:r,step:s,disabled:c,thumbSize:d,thumbLabel:v,direction:f,isReversed:m,vertical:g,readonly:h,elevation:y,mousePressed:b,decimals:w,indexFromEnd:S}=n,k=Dm(()=>c.value?void 0:y.value),{elevationClasses:x}=el(k),{textColorClasses:V,textColorStyles:C}=ha(r),{pageup:_,pagedown:I,end:B,home:P,left:A,right:N,down:T,up:E}=xe,D=[_,I,B,P,A,N,T,E],R=Dm(()=>s.value?[1,2,3]:[1,5,10]);function $(t){const a=function(t,a){if(!D.includes(t.key))return;t.preventDefault();const l=s.value||.1,n=(e.max-e.min)/l;if([A,N,T,E].includes(t.key)){const e=(g.value?[o.value?A:N,m.value?T:E]:S.value!==o.value?[A,E]:[N,E]).includes(t.key)?1:-1,n=t.shiftKey?2:t.ctrlKey?1:0;a+=e*l*R.value[n]}else t.key===P?a=e.min:t.key===B?a=e.max:a-=(t.key===I?1:-1)*l*(n>100?n/10:10);return Math.max(e.min,Math.min(e.max,a))}(t,e.modelValue);null!=a&&l("update:modelValue",a)}return wt(()=>{const t=p(S.value?100-e.position:e.position,"%");return Am("div",{class:["v-slider-thumb",{"v-slider-thumb--focused":e.focused,"v-slider-thumb--pressed":e.focused&&b.value},e.class,i.value],style:[{"--v-slider-thumb-position":t,"--v-slider-thumb-size":p(d.value)},e.style],role:"slider",tabindex:c.value?-1:0,"aria-label":e.name,"aria-valuemin":e.min,"aria-valuemax":e.max,"aria-valuenow":e.modelValue,"aria-readonly":!!h.value,"aria-orientation":f.value,onKeydown:h.value?void 0:$},[Am("div",{class:["v-slider-thumb__surface",V.value,x.value],style:{...C.value}},null),Tm(Am("div",{class:["v-slider-thumb__ripple",V.value],style:C.value},null),[[Nm("ripple"),e.ripple,null,{circle:!0,center:!0}]]),Am(qt,{origin:"bottom center"},{default:()=>[Tm(Am("div",{class:"v-slider-thumb__label-container"},[Am("div",{class:["v-slider-thumb__label"]},[Am("div",null,[a["thumb-label"]?.({modelValue:e.modelValue})??e.modelValue.toFixed(s.value?w.value:1)])])]),[[Em,v.value&&e.focused||"always"===v.value]])]})])}),{}}}),{createVNode:Fm}=await e("vue"),{computed:Mm,inject:Om}=await e("vue"),zm=t({start:{type:Number,required:!0},stop:{type:Number,required:!0},...qe()},"VSliderTrack"),jm=o()({name:"VSliderTrack",props:zm(),emits:{},setup(e,t){let{slots:a}=t;const l=Om(Cm);if(!l)throw new Error("[Vuetify] v-slider-track must be inside v-slider or v-range-slider");const{color:n,parsedTicks:o,rounded:i,showTicks:r,tickSize:s,trackColor:u,trackFillColor:c,trackSize:d,vertical:v,min:f,max:m,indexFromEnd:g}=l,{roundedClasses:h}=ka(i),{backgroundColorClasses:y,backgroundColorStyles:b}=ya(c),{backgroundColorClasses:w,backgroundColorStyles:S}=ya(u),k=Mm(()=>`inset-${v.value?"block":"inline"}-${g.value?"end":"start"}`),x=Mm(()=>v.value?"height":"width"),V=Mm(()=>({[k.value]:"0%",[x.value]:"100%"})),C=Mm(()=>e.stop-e.start),_=Mm(()=>({[k.value]:p(e.start,"%"),[x.value]:p(C.value,"%")})),I=Mm(()=>{if(!r.value)return[];return(v.value?o.value.slice().reverse():o.value).map((t,l)=>{const n=t.value!==f.value&&t.value!==m.value?p(t.position,"%"):void 0;return Fm("div",{key:t.value,class:["v-slider-track__tick",{"v-slider-track__tick--filled":t.position>=e.start&&t.position<=e.stop,"v-slider-track__tick--first":t.value===f.value,"v-slider-track__tick--last":t.value===m.value}],style:{[k.value]:n}},[(t.label||a["tick-label"])&&Fm("div",{class:"v-slider-track__tick-label"},[a["tick-label"]?.({tick:t,index:l})??t.label])])})});return wt(()=>Fm("div",{class:["v-slider-track",h.value,e.class],style:[{"--v-slider-track-size":p(d.value),"--v-slider-tick-size":p(s.value)},e.style]},[Fm("div",{class:["v-slider-track__background",w.value,{"v-slider-track__background--opacity":!!n.value||!c.value}],style:{...V.value,...S.value}},null),Fm("div",{class:["v-slider-track__fill",y.value],style:{..._.value,...b.value}},null),r.value&&Fm("div",{class:["v-slider-track__ticks",{"v-slider-track__ticks--always-show":"always"===r.value}]},[I.value])])),{}}}),{Fragment:Hm,createVNode:Wm,mergeProps:Um}=await e("vue"),{computed:Gm,ref:Ym}=await e("vue"),qm=t({...Di(),...Im(),...ur(),modelValue:{type:[Number,String],default:0}},"VSlider"),Km=o()({name:"VSlider",props:qm(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,start:e=>!0,end:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=Ym(),{rtlClasses:o}=u(),i=Bm(e),r=V(e,"modelValue",void 0,e=>i.roundValue(null==e?i.min.value:e)),{min:s,max:c,mousePressed:d,roundValue:v,onSliderMousedown:p,onSliderTouchstart:f,trackContainerRef:m,position:g,hasLabels:h,readonly:y}=Pm({props:e,steps:i,onSliderStart:()=>{l("start",r.value)},onSliderEnd:e=>{let{value:t}=e;const a=v(t);r.value=a,l("end",a)},onSliderMove:e=>{let{value:t}=e;return r.value=v(t)},getActiveThumb:()=>n.value?.$el}),{isFocused:b,focus:w,blur:S}=Ri(e),k=Gm(()=>g(r.value));return wt(()=>{const t=cr.filterProps(e),l=!!(e.label||a.label||a.prepend);return Wm(cr,Um({class:["v-slider",{"v-slider--has-labels":!!a["tick-label"]||h.value,"v-slider--focused":b.value,"v-slider--pressed":d.value,"v-slider--disabled":e.disabled},o.value,e.class],style:e.style},t,{focused:b.value}),{...a,prepend:l?t=>Wm(Hm,null,[a.label?.(t)??(e.label?Wm(Qo,{id:t.id.value,class:"v-slider__label",text:e.label},null):void 0),a.prepend?.(t)]):void 0,default:t=>{let{id:l,messagesId:o}=t;return Wm("div",{class:"v-slider__container",onMousedown:y.value?void 0:p,onTouchstartPassive:y.value?void 0:f},[Wm("input",{id:l.value,name:e.name||l.value,disabled:!!e.disabled,readonly:!!e.readonly,tabindex:"-1",value:r.value},null),Wm(jm,{ref:m,start:0,stop:k.value},{"tick-label":a["tick-label"]}),Wm(Lm,{ref:n,"aria-describedby":o.value,focused:b.value,min:s.value,max:c.value,modelValue:r.value,"onUpdate:modelValue":e=>r.value=e,position:k.value,elevation:e.elevation,onFocus:w,onBlur:S,ripple:e.ripple,name:e.name},{"thumb-label":a["thumb-label"]})])}})}),{}}}),{createVNode:Xm}=await e("vue"),{onUnmounted:Jm}=await e("vue"),Qm=J({name:"VColorPickerPreview",props:t({color:{type:Object},disabled:Boolean,hideAlpha:Boolean,...qe()},"VColorPickerPreview")(),emits:{"update:color":e=>!0},setup(e,t){let{emit:a}=t;const l=new AbortController;async function n(){if(!Ve||e.disabled)return;const t=new window.EyeDropper;try{const n=await t.open({signal:l.signal}),o=ye(h(n.sRGBHex));a("update:color",{...e.color??sm,...o})}catch(n){}}return Jm(()=>l.abort()),wt(()=>Xm("div",{class:["v-color-picker-preview",{"v-color-picker-preview--hide-alpha":e.hideAlpha},e.class],style:e.style},[Ve&&Xm("div",{class:"v-color-picker-preview__eye-dropper",key:"eyeDropper"},[Xm(To,{density:"comfortable",disabled:e.disabled,icon:"$eyeDropper",variant:"plain",onClick:n},null)]),Xm("div",{class:"v-color-picker-preview__dot"},[Xm("div",{style:{background:Ce(e.color??sm)}},null)]),Xm("div",{class:"v-color-picker-preview__sliders"},[Xm(Km,{class:"v-color-picker-preview__track v-color-picker-preview__hue",modelValue:e.color?.h,"onUpdate:modelValue":t=>a("update:color",{...e.color??sm,h:t}),step:0,min:0,max:360,disabled:e.disabled,thumbSize:14,trackSize:8,trackFillColor:"white",hideDetails:!0},null),!e.hideAlpha&&Xm(Km,{class:"v-color-picker-preview__track v-color-picker-preview__alpha",modelValue:e.color?.a??1,"onUpdate:modelValue":t=>a("update:color",{...e.color??sm,a:t}),step:1/256,min:0,max:1,disabled:e.disabled,thumbSize:14,trackSize:8,trackFillColor:"white",hideDetails:!0},null)])])),{}}}),Zm={red:{base:"#f44336",lighten5:"#ffebee",lighten4:"#ffcdd2",lighten3:"#ef9a9a",lighten2:"#e57373",lighten1:"#ef5350",darken1:"#e53935",darken2:"#d32f2f",darken3:"#c62828",darken4:"#b71c1c",accent1:"#ff8a80",accent2:"#ff5252",accent3:"#ff1744",accent4:"#d50000"},pink:{base:"#e91e63",lighten5:"#fce4ec",lighten4:"#f8bbd0",lighten3:"#f48fb1",lighten2:"#f06292",lighten1:"#ec407a",darken1:"#d81b60",darken2:"#c2185b",darken3:"#ad1457",darken4:"#880e4f",accent1:"#ff80ab",accent2:"#ff4081",accent3:"#f50057",accent4:"#c51162"},purple:{base:"#9c27b0",lighten5:"#f3e5f5",lighten4:"#e1bee7",lighten3:"#ce93d8",lighten2:"#ba68c8",lighten1:"#ab47bc",darken1:"#8e24aa",darken2:"#7b1fa2",darken3:"#6a1b9a",darken4:"#4a148c",accent1:"#ea80fc",accent2:"#e040fb",accent3:"#d500f9",accent4:"#aa00ff"},deepPurple:{base:"#673ab7",lighten5:"#ede7f6",lighten4:"#d1c4e9",lighten3:"#b39ddb",lighten2:"#9575cd",lighten1:"#7e57c2",darken1:"#5e35b1",darken2:"#512da8",darken3:"#4527a0",darken4:"#311b92",accent1:"#b388ff",accent2:"#7c4dff",accent3:"#651fff",accent4:"#6200ea"},indigo:{base:"#3f51b5",lighten5:"#e8eaf6",lighten4:"#c5cae9",lighten3:"#9fa8da",lighten2:"#7986cb",lighten1:"#5c6bc0",darken1:"#3949ab",darken2:"#303f9f",darken3:"#283593",darken4:"#1a237e",accent1:"#8c9eff",accent2:"#536dfe",accent3:"#3d5afe",accent4:"#304ffe"},blue:{base:"#2196f3",lighten5:"#e3f2fd",lighten4:"#bbdefb",lighten3:"#90caf9",lighten2:"#64b5f6",lighten1:"#42a5f5",darken1:"#1e88e5",darken2:"#1976d2",darken3:"#1565c0",darken4:"#0d47a1",accent1:"#82b1ff",accent2:"#448aff",accent3:"#2979ff",accent4:"#2962ff"},lightBlue:{base:"#03a9f4",lighten5:"#e1f5fe",lighten4:"#b3e5fc",lighten3:"#81d4fa",lighten2:"#4fc3f7",lighten1:"#29b6f6",darken1:"#039be5",darken2:"#0288d1",darken3:"#0277bd",darken4:"#01579b",accent1:"#80d8ff",accent2:"#40c4ff",accent3:"#00b0ff",accent4:"#0091ea"},cyan:{base:"#00bcd4",lighten5:"#e0f7fa",lighten4:"#b2ebf2",lighten3:"#80deea",lighten2:"#4dd0e1",lighten1:"#26c6da",darken1:"#00acc1",darken2:"#0097a7",darken3:"#00838f",darken4:"#006064",accent1:"#84ffff",accent2:"#18ffff",accent3:"#00e5ff",accent4:"#00b8d4"},teal:{base:"#009688",lighten5:"#e0f2f1",lighten4:"#b2dfdb",lighten3:"#80cbc4",lighten2:"#4db6ac",lighten1:"#26a69a",darken1:"#00897b",darken2:"#00796b",darken3:"#00695c",darken4:"#004d40",accent1:"#a7ffeb",accent2:"#64ffda",accent3:"#1de9b6",accent4:"#00bfa5"},green:{base:"#4caf50",lighten5:"#e8f5e9",lighten4:"#c8e6c9",lighten3:"#a5d6a7",lighten2:"#81c784",lighten1:"#66bb6a",darken1:"#43a047",darken2:"#388e3c",darken3:"#2e7d32",darken4:"#1b5e20",accent1:"#b9f6ca",accent2:"#69f0ae",accent3:"#00e676",accent4:"#00c853"},lightGreen:{base:"#8bc34a",lighten5:"#f1f8e9",lighten4:"#dcedc8",lighten3:"#c5e1a5",lighten2:"#aed581",lighten1:"#9ccc65",darken1:"#7cb342",darken2:"#689f38",darken3:"#558b2f",darken4:"#33691e",accent1:"#ccff90",accent2:"#b2ff59",accent3:"#76ff03",accent4:"#64dd17"},lime:{base:"#cddc39",lighten5:"#f9fbe7",lighten4:"#f0f4c3",lighten3:"#e6ee9c",lighten2:"#dce775",lighten1:"#d4e157",darken1:"#c0ca33",darken2:"#afb42b",darken3:"#9e9d24",darken4:"#827717",accent1:"#f4ff81",accent2:"#eeff41",accent3:"#c6ff00",accent4:"#aeea00"},yellow:{base:"#ffeb3b",lighten5:"#fffde7",lighten4:"#fff9c4",lighten3:"#fff59d",lighten2:"#fff176",lighten1:"#ffee58",darken1:"#fdd835",darken2:"#fbc02d",darken3:"#f9a825",darken4:"#f57f17",accent1:"#ffff8d",accent2:"#ffff00",accent3:"#ffea00",accent4:"#ffd600"},amber:{base:"#ffc107",lighten5:"#fff8e1",lighten4:"#ffecb3",lighten3:"#ffe082",lighten2:"#ffd54f",lighten1:"#ffca28",darken1:"#ffb300",darken2:"#ffa000",darken3:"#ff8f00",darken4:"#ff6f00",accent1:"#ffe57f",accent2:"#ffd740",accent3:"#ffc400",accent4:"#ffab00"},orange:{base:"#ff9800",lighten5:"#fff3e0",lighten4:"#ffe0b2",lighten3:"#ffcc80",lighten2:"#ffb74d",lighten1:"#ffa726",darken1:"#fb8c00",darken2:"#f57c00",darken3:"#ef6c00",darken4:"#e65100",accent1:"#ffd180",accent2:"#ffab40",accent3:"#ff9100",accent4:"#ff6d00"},deepOrange:{base:"#ff5722",lighten5:"#fbe9e7",lighten4:"#ffccbc",lighten3:"#ffab91",lighten2:"#ff8a65",lighten1:"#ff7043",darken1:"#f4511e",darken2:"#e64a19",darken3:"#d84315",darken4:"#bf360c",accent1:"#ff9e80",accent2:"#ff6e40",accent3:"#ff3d00",accent4:"#dd2c00"},brown:{base:"#795548",lighten5:"#efebe9",lighten4:"#d7ccc8",lighten3:"#bcaaa4",lighten2:"#a1887f",lighten1:"#8d6e63",darken1:"#6d4c41",darken2:"#5d4037",darken3:"#4e342e",darken4:"#3e2723"},blueGrey:{base:"#607d8b",lighten5:"#eceff1",lighten4:"#cfd8dc",lighten3:"#b0bec5",lighten2:"#90a4ae",lighten1:"#78909c",darken1:"#546e7a",darken2:"#455a64",darken3:"#37474f",darken4:"#263238"},grey:{base:"#9e9e9e",lighten5:"#fafafa",lighten4:"#f5f5f5",lighten3:"#eeeeee",lighten2:"#e0e0e0",lighten1:"#bdbdbd",darken1:"#757575",darken2:"#616161",darken3:"#424242",darken4:"#212121"},shades:{black:"#000000",white:"#ffffff",transparent:"#ffffff00"}},{createVNode:eg}=await e("vue"),tg=t({swatches:{type:Array,default:()=>function(e){return Object.keys(e).map(t=>{const a=e[t];return a.base?[a.base,a.darken4,a.darken3,a.darken2,a.darken1,a.lighten1,a.lighten2,a.lighten3,a.lighten4,a.lighten5]:[a.black,a.white,a.transparent]})}(Zm)},disabled:Boolean,color:Object,maxHeight:[Number,String],...qe()},"VColorPickerSwatches");const ag=J({name:"VColorPickerSwatches",props:tg(),emits:{"update:color":e=>!0},setup(e,t){let{emit:a}=t;return wt(()=>eg("div",{class:["v-color-picker-swatches",e.class],style:[{maxHeight:p(e.maxHeight)},e.style]},[eg("div",null,[e.swatches.map(t=>eg("div",{class:"v-color-picker-swatches__swatch"},[t.map(t=>{const l=h(t),n=ye(l),o=_e(l);return eg("div",{class:"v-color-picker-swatches__color",onClick:()=>n&&a("update:color",n)},[eg("div",{style:{background:o}},[e.color&&B(e.color,n)?eg(bn,{size:"x-small",icon:"$success",color:Ie(t,"#FFFFFF")>2?"white":"black"},null):void 0])])})]))])])),{}}}),lg=vt("v-picker-title"),{createVNode:ng}=await e("vue"),og=t({color:String,...Ka(),...qe(),...ua(),...Za(),...En(),...Yn(),...Sa(),...Vt(),...c()},"VSheet"),ig=o()({name:"VSheet",props:og(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{borderClasses:i}=Xa(e),{dimensionStyles:s}=ca(e),{elevationClasses:u}=el(e),{locationStyles:c}=Dn(e),{positionClasses:d}=qn(e),{roundedClasses:v}=ka(e);return wt(()=>ng(e.tag,{class:["v-sheet",l.value,n.value,i.value,u.value,d.value,v.value,e.class],style:[o.value,s.value,c.value,e.style]},a)),{}}}),{createVNode:rg,mergeProps:sg}=await e("vue"),ug=t({bgColor:String,divided:Boolean,landscape:Boolean,title:String,hideHeader:Boolean,...og()},"VPicker"),cg=o()({name:"VPicker",props:ug(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.color);return wt(()=>{const t=ig.filterProps(e),o=!(!e.title&&!a.title);return rg(ig,sg(t,{color:e.bgColor,class:["v-picker",{"v-picker--divided":e.divided,"v-picker--landscape":e.landscape,"v-picker--with-actions":!!a.actions},e.class],style:e.style}),{default:()=>[!e.hideHeader&&rg("div",{key:"header",class:[l.value],style:[n.value]},[o&&rg(lg,{key:"picker-title"},{default:()=>[a.title?.()??e.title]}),a.header&&rg("div",{class:"v-picker__header"},[a.header()])]),rg("div",{class:"v-picker__body"},[a.default?.()]),a.actions&&rg(ra,{defaults:{VBtn:{slim:!0,variant:"text"}}},{default:()=>[rg("div",{class:"v-picker__actions"},[a.actions()])]})]})}),{}}}),{Fragment:dg,createVNode:vg,mergeProps:pg}=await e("vue"),{computed:fg,onBeforeMount:mg,ref:gg,watch:hg}=await e("vue"),yg=J({name:"VColorPicker",props:t({canvasHeight:{type:[String,Number],default:150},disabled:Boolean,dotSize:{type:[Number,String],default:10},hideCanvas:Boolean,hideSliders:Boolean,hideInputs:Boolean,mode:{type:String,default:"rgba",validator:e=>Object.keys(fm).includes(e)},modes:{type:Array,default:()=>Object.keys(fm),validator:e=>Array.isArray(e)&&e.every(e=>Object.keys(fm).includes(e))},showSwatches:Boolean,swatches:Array,swatchesMaxHeight:{type:[Number,String],default:150},modelValue:{type:[Object,String]},...ug({hideHeader:!0})},"VColorPicker")(),emits:{"update:modelValue":e=>!0,"update:mode":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"mode"),n=gg(null),o=V(e,"modelValue",void 0,e=>{if(null==e||""===e)return null;let t;try{t=ye(h(e))}catch(a){return x(a),null}return t},t=>t?function(e,t){if(null==t||"string"==typeof t){const a=1!==e.a;if(t?.startsWith("rgb(")){const{r:t,g:l,b:n,a:o}=be(e);return`rgb(${t} ${l} ${n}`+(a?` / ${o})`:")")}if(t?.startsWith("hsl(")){const{h:t,s:l,l:n,a:o}=he(e);return`hsl(${t} ${Math.round(100*l)} ${Math.round(100*n)}`+(a?` / ${o})`:")")}const l=me(e);return 1===e.a?l.slice(0,7):l}if("object"==typeof t){let a;return we(t,["r","g","b"])?a=be(e):we(t,["h","s","l"])?a=he(e):we(t,["h","s","v"])&&(a=e),function(e,t){if(t){const{a:t,...a}=e;return a}return e}(a,!we(t,["a"])&&1===e.a)}return e}(t,e.modelValue):null),i=fg(()=>o.value?{...o.value,h:n.value??o.value.h}:null),{rtlClasses:r}=u();let s=!0;hg(o,e=>{s?e&&(n.value=e.h):s=!0},{immediate:!0});const c=e=>{s=!1,n.value=e.h,o.value=e};return mg(()=>{e.modes.includes(l.value)||(l.value=e.modes[0])}),v({VSlider:{color:void 0,trackColor:void 0,trackFillColor:void 0}}),wt(()=>{const t=cg.filterProps(e);return vg(cg,pg(t,{class:["v-color-picker",r.value,e.class],style:[{"--v-color-picker-color-hsv":Ce({...i.value??sm,a:1})},e.style]}),{...a,default:()=>vg(dg,null,[!e.hideCanvas&&vg(rm,{key:"canvas",color:i.value,"onUpdate:color":c,disabled:e.disabled,dotSize:e.dotSize,width:e.width,height:e.canvasHeight},null),(!e.hideSliders||!e.hideInputs)&&vg("div",{key:"controls",class:"v-color-picker__controls"},[!e.hideSliders&&vg(Qm,{key:"preview",color:i.value,"onUpdate:color":c,hideAlpha:!l.value.endsWith("a"),disabled:e.disabled},null),!e.hideInputs&&vg(ym,{key:"edit",modes:e.modes,mode:l.value,"onUpdate:mode":e=>l.value=e,color:i.value,"onUpdate:color":c,disabled:e.disabled},null)]),e.showSwatches&&vg(ag,{key:"swatches",color:i.value,"onUpdate:color":c,maxHeight:e.swatchesMaxHeight,swatches:e.swatches,disabled:e.disabled},null)])})}),{}}}),{Fragment:bg,createVNode:wg,mergeProps:Sg,createTextVNode:kg}=await e("vue"),{computed:xg,mergeProps:Vg,nextTick:Cg,ref:_g,shallowRef:Ig,toRef:Bg,watch:Pg}=await e("vue"),Ag=t({autoSelectFirst:{type:[Boolean,String]},clearOnSelect:{type:Boolean,default:!0},delimiters:Array,...Hv({filterKeys:["title"]}),...Tv({hideNoData:!0,returnObject:!0}),...H(qd({modelValue:null,role:"combobox"}),["validationValue","dirty","appendInnerIcon"]),...Ia({transition:!1})},"VCombobox"),Ng=o()({name:"VCombobox",props:Ag(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,"update:search":e=>!0,"update:menu":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{t:n}=M(),o=_g(),i=Ig(!1),r=Ig(!0),s=Ig(!1),u=_g(),c=_g(),d=Ig(-1);let v=!1;const{items:p,transformIn:f,transformOut:m}=su(e),{textColorClasses:g,textColorStyles:h}=ha(()=>o.value?.color),y=V(e,"modelValue",[],e=>f(P(e)),t=>{const a=m(t);return e.multiple?a:a[0]??null}),b=Gi(e),w=xg(()=>!(!e.chips&&!l.chip)),S=xg(()=>w.value||!!l.selection),k=Ig(e.multiple||S.value?"":y.value[0]?.title??""),x=xg({get:()=>k.value,set:t=>{if(k.value=t??"",e.multiple||S.value||(y.value=[iu(e,t)]),t&&e.multiple&&e.delimiters?.length){const a=t.split(new RegExp(`(?:${e.delimiters.join("|")})+`));a.length>1&&(a.forEach(t=>{(t=t.trim())&&q(iu(e,t))}),k.value="")}t||(d.value=-1),r.value=!t}}),C=xg(()=>"function"==typeof e.counterValue?e.counterValue(y.value):"number"==typeof e.counterValue?e.counterValue:e.multiple?y.value.length:x.value.length),{filteredItems:_,getMatches:I}=Wv(e,p,()=>r.value?"":x.value),A=xg(()=>e.hideSelected?_.value.filter(e=>!y.value.some(t=>t.value===e.value)):_.value),N=xg(()=>e.hideNoData&&!A.value.length||b.isReadonly.value||b.isDisabled.value),T=V(e,"menu"),E=xg({get:()=>T.value,set:e=>{T.value&&!e&&u.value?.ΨopenChildren.size||e&&N.value||(T.value=e)}}),D=Bg(()=>E.value?e.closeText:e.openText);Pg(k,e=>{v?Cg(()=>v=!1):i.value&&!E.value&&(E.value=!0),a("update:search",e)}),Pg(y,t=>{e.multiple||S.value||(k.value=t[0]?.title??"")});const R=xg(()=>y.value.map(e=>e.value)),L=xg(()=>(!0===e.autoSelectFirst||"exact"===e.autoSelectFirst&&x.value===A.value[0]?.title)&&A.value.length>0&&!r.value&&!s.value),F=_g(),O=wv(F,o);function z(t){v=!0,e.openOnClear&&(E.value=!0)}function j(){N.value||(E.value=!0)}function H(e){N.value||(i.value&&(e.preventDefault(),e.stopPropagation()),E.value=!E.value)}function W(e){" "!==e.key&&ue(e)&&o.value?.focus()}function U(t){if(Be(t)||b.isReadonly.value)return;const a=o.value?.selectionStart,l=y.value.length;if(["Enter","ArrowDown","ArrowUp"].includes(t.key)&&t.preventDefault(),["Enter","ArrowDown"].includes(t.key)&&(E.value=!0),["Escape"].includes(t.key)&&(E.value=!1),["Enter","Escape","Tab"].includes(t.key)&&(L.value&&["Enter","Tab"].includes(t.key)&&!y.value.some(e=>{let{value:t}=e;return t===A.value[0].value})&&q(_.value[0]),r.value=!0),"ArrowDown"===t.key&&L.value&&F.value?.focus("next"),"Enter"===t.key&&x.value&&(q(iu(e,x.value)),S.value&&(k.value="")),["Backspace","Delete"].includes(t.key)){if(!e.multiple&&S.value&&y.value.length>0&&!x.value)return q(y.value[0],!1);if(~d.value){t.preventDefault();const e=d.value;q(y.value[d.value],!1),d.value=e>=l-1?l-2:e}else"Backspace"!==t.key||x.value||(d.value=l-1)}else if(e.multiple)if("ArrowLeft"===t.key){if(d.value<0&&a&&a>0)return;const e=d.value>-1?d.value-1:l-1;y.value[e]?d.value=e:(d.value=-1,o.value?.setSelectionRange(x.value.length,x.value.length))}else if("ArrowRight"===t.key){if(d.value<0)return;const e=d.value+1;y.value[e]?d.value=e:(d.value=-1,o.value?.setSelectionRange(0,0))}else~d.value&&ue(t)&&(d.value=-1)}function G(){e.eager&&c.value?.calculateVisibleItems()}function Y(){i.value&&(r.value=!0,o.value?.focus())}function q(t){let a=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(t&&!t.props.disabled)if(e.multiple){const l=y.value.findIndex(a=>(e.valueComparator||B)(a.value,t.value)),n=null==a?!~l:a;if(~l){const e=n?[...y.value,t]:[...y.value];e.splice(l,1),y.value=e}else n&&(y.value=[...y.value,t]);e.clearOnSelect&&(x.value="")}else{const e=!1!==a;y.value=e?[t]:[],k.value=e&&!S.value?t.title:"",Cg(()=>{E.value=!1,r.value=!0})}}function K(e){i.value=!0,setTimeout(()=>{s.value=!0})}function X(e){s.value=!1}function J(t){null!=t&&(""!==t||e.multiple||S.value)||(y.value=[])}return Pg(i,(t,a)=>{if(!t&&t!==a&&(d.value=-1,E.value=!1,x.value)){if(e.multiple)return void q(iu(e,x.value));if(!S.value)return;y.value.some(e=>{let{title:t}=e;return t===x.value})?k.value="":q(iu(e,x.value))}}),Pg(E,()=>{if(!e.hideSelected&&E.value&&y.value.length){const t=A.value.findIndex(t=>y.value.some(a=>(e.valueComparator||B)(a.value,t.value)));$&&window.requestAnimationFrame(()=>{t>=0&&c.value?.scrollToIndex(t)})}}),Pg(()=>e.items,(e,t)=>{E.value||i.value&&!t.length&&e.length&&(E.value=!0)}),wt(()=>{const t=!!(!e.hideNoData||A.value.length||l["prepend-item"]||l["append-item"]||l["no-data"]),a=y.value.length>0,s=Kd.filterProps(e);return wg(Kd,Sg({ref:o},s,{modelValue:x.value,"onUpdate:modelValue":[e=>x.value=e,J],focused:i.value,"onUpdate:focused":e=>i.value=e,validationValue:y.externalValue,counterValue:C.value,dirty:a,class:["v-combobox",{"v-combobox--active-menu":E.value,"v-combobox--chips":!!e.chips,"v-combobox--selection-slot":!!S.value,"v-combobox--selecting-index":d.value>-1,["v-combobox--"+(e.multiple?"multiple":"single")]:!0},e.class],style:e.style,readonly:b.isReadonly.value,placeholder:a?void 0:e.placeholder,"onClick:clear":z,"onMousedown:control":j,onKeydown:U}),{...l,default:()=>wg(bg,null,[wg(md,Sg({ref:u,modelValue:E.value,"onUpdate:modelValue":e=>E.value=e,activator:"parent",contentClass:"v-combobox__content",disabled:N.value,eager:e.eager,maxHeight:310,openOnClick:!1,closeOnContentClick:!1,transition:e.transition,onAfterEnter:G,onAfterLeave:Y},e.menuProps),{default:()=>[t&&wg(hu,Sg({ref:F,selected:R.value,selectStrategy:e.multiple?"independent":"single-independent",onMousedown:e=>e.preventDefault(),onKeydown:W,onFocusin:K,onFocusout:X,tabindex:"-1","aria-live":"polite",color:e.itemColor??e.color},O,e.listProps),{default:()=>[l["prepend-item"]?.(),!A.value.length&&!e.hideNoData&&(l["no-data"]?.()??wg(Ws,{key:"no-data",title:n(e.noDataText)},null)),wg(hv,{ref:c,renderless:!0,items:A.value,itemKey:"value"},{default:t=>{let{item:a,index:n,itemRef:o}=t;const i=Vg(a.props,{ref:o,key:a.value,active:!(!L.value||0!==n)||void 0,onClick:()=>q(a,null)});return l.item?.({item:a,index:n,props:i})??wg(Ws,Sg(i,{role:"option"}),{prepend:t=>{let{isSelected:l}=t;return wg(bg,null,[e.multiple&&!e.hideSelected?wg(_i,{key:a.value,modelValue:l,ripple:!1,tabindex:"-1"},null):void 0,a.props.prependAvatar&&wg(Ko,{image:a.props.prependAvatar},null),a.props.prependIcon&&wg(bn,{icon:a.props.prependIcon},null)])},title:()=>r.value?a.title:Uv("v-combobox",a.title,I(a)?.title)})}}),l["append-item"]?.()]})]}),y.value.map((t,a)=>{function n(e){e.stopPropagation(),e.preventDefault(),q(t,!1)}const o={"onClick:close":n,onKeydown(e){"Enter"!==e.key&&" "!==e.key||(e.preventDefault(),e.stopPropagation(),n(e))},onMousedown(e){e.preventDefault(),e.stopPropagation()},modelValue:!0,"onUpdate:modelValue":void 0},i=w.value?!!l.chip:!!l.selection,r=i?se(w.value?l.chip({item:t,index:a,props:o}):l.selection({item:t,index:a})):void 0;if(!i||r)return wg("div",{key:t.value,class:["v-combobox__selection",a===d.value&&["v-combobox__selection--selected",g.value]],style:a===d.value?h.value:{}},[w.value?l.chip?wg(ra,{key:"chip-defaults",defaults:{VChip:{closable:e.closableChips,size:"small",text:t.title}}},{default:()=>[r]}):wg(Hr,Sg({key:"chip",closable:e.closableChips,size:"small",text:t.title,disabled:t.props.disabled},o),null):r??wg("span",{class:"v-combobox__selection-text"},[t.title,e.multiple&&a<y.value.length-1&&wg("span",{class:"v-combobox__selection-comma"},[kg(",")])])])})]),"append-inner":function(){for(var t=arguments.length,a=new Array(t),i=0;i<t;i++)a[i]=arguments[i];return wg(bg,null,[l["append-inner"]?.(...a),e.hideNoData&&!e.items.length||!e.menuIcon?void 0:wg(bn,{class:"v-combobox__menu-icon",color:o.value?.fieldIconColor,icon:e.menuIcon,onMousedown:H,onClick:ce,"aria-label":n(D.value),title:n(D.value),tabindex:"-1"},null)])}})}),Zc({isFocused:i,isPristine:r,menu:E,search:x,selectionIndex:d,filteredItems:_,select:q},o)}}),{Fragment:Tg,mergeProps:Eg,createVNode:Dg}=await e("vue"),{computed:Rg,ref:$g,toRaw:Lg,watchEffect:Fg}=await e("vue"),Mg=t({modelValue:null,color:String,cancelText:{type:String,default:"$vuetify.confirmEdit.cancel"},okText:{type:String,default:"$vuetify.confirmEdit.ok"},disabled:{type:[Boolean,Array],default:void 0},hideActions:Boolean},"VConfirmEdit"),Og=o()({name:"VConfirmEdit",props:Mg(),emits:{cancel:()=>!0,save:e=>!0,"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=V(e,"modelValue"),o=$g();Fg(()=>{o.value=structuredClone(Lg(n.value))});const{t:i}=M(),r=Rg(()=>B(n.value,o.value));function s(t){return"boolean"==typeof e.disabled?e.disabled:Array.isArray(e.disabled)?e.disabled.includes(t):r.value}const u=Rg(()=>s("save")),c=Rg(()=>s("cancel"));function d(){n.value=o.value,a("save",o.value)}function v(){o.value=structuredClone(Lg(n.value)),a("cancel")}function p(t){return Dg(Tg,null,[Dg(To,Eg({disabled:c.value,variant:"text",color:e.color,onClick:v,text:i(e.cancelText)},t),null),Dg(To,Eg({disabled:u.value,variant:"text",color:e.color,onClick:d,text:i(e.okText)},t),null)])}let f=!1;return wt(()=>Dg(Tg,null,[l.default?.({model:o,save:d,cancel:v,isPristine:r.value,get actions(){return f=!0,p}}),!e.hideActions&&!f&&p()])),{save:d,cancel:v,isPristine:r}}}),{inject:zg,provide:jg,toRef:Hg}=await e("vue"),Wg=t({expandOnClick:Boolean,showExpand:Boolean,expanded:{type:Array,default:()=>[]}},"DataTable-expand"),Ug=Symbol.for("vuetify:datatable:expanded");function Gg(e){const t=Hg(()=>e.expandOnClick),a=V(e,"expanded",e.expanded,e=>new Set(e),e=>[...e.values()]);function l(e,t){const l=new Set(a.value);t?l.add(e.value):l.delete(e.value),a.value=l}function n(e){return a.value.has(e.value)}const o={expand:l,expanded:a,expandOnClick:t,isExpanded:n,toggleExpand:function(e){l(e,!n(e))}};return jg(Ug,o),o}function Yg(){const e=zg(Ug);if(!e)throw new Error("foo");return e}const{computed:qg,inject:Kg,provide:Xg,ref:Jg}=await e("vue"),Qg=t({groupBy:{type:Array,default:()=>[]}},"DataTable-group"),Zg=Symbol.for("vuetify:data-table-group");function eh(e){return{groupBy:V(e,"groupBy")}}function th(e){const{disableSort:t,groupBy:a,sortBy:l}=e,n=Jg(new Set);function o(e){return n.value.has(e.id)}const i={sortByWithGroups:qg(()=>a.value.map(e=>({...e,order:e.order??!1})).concat(t?.value?[]:l.value)),toggleGroup:function(e){const t=new Set(n.value);o(e)?t.delete(e.id):t.add(e.id),n.value=t},opened:n,groupBy:a,extractRows:function(e){return function e(t){const a=[];for(const l of t.items)"type"in l&&"group"===l.type?a.push(...e(l)):a.push(l);return[...new Set(a)]}({items:e})},isGroupOpen:o};return Xg(Zg,i),i}function ah(){const e=Kg(Zg);if(!e)throw new Error("Missing group!");return e}function lh(e,t){let a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,l=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"root";if(!t.length)return[];const n=function(e,t){if(!e.length)return[];const a=new Map;for(const l of e){const e=Pe(l.raw,t);a.has(e)||a.set(e,[]),a.get(e).push(l)}return a}(e,t[0]),o=[],i=t.slice(1);return n.forEach((e,n)=>{const r=t[0],s=`${l}_${r}_${n}`;o.push({depth:a,id:s,key:r,value:n,items:i.length?lh(e,i,a+1,s):e,type:"group"})}),o}function nh(e,t){const a=[];for(const l of e)"type"in l&&"group"===l.type?(null!=l.value&&a.push(l),(t.has(l.id)||null==l.value)&&a.push(...nh(l.items,t))):a.push(l);return a}function oh(e,t,a){return{flatItems:qg(()=>{if(!t.value.length)return e.value;return nh(lh(e.value,t.value.map(e=>e.key)),a.value)})}}const{watch:ih}=await e("vue");function rh(e){let{page:t,itemsPerPage:a,sortBy:l,groupBy:n,search:o}=e;const r=i("VDataTable");let s=null;ih(()=>({page:t.value,itemsPerPage:a.value,sortBy:l.value,groupBy:n.value,search:o.value}),e=>{B(s,e)||(s&&s.search!==e.search&&(t.value=1),r.emit("update:options",e),s=e)},{deep:!0,immediate:!0})}const{computed:sh,inject:uh,provide:ch,watch:dh}=await e("vue"),vh=t({page:{type:[Number,String],default:1},itemsPerPage:{type:[Number,String],default:10}},"DataTable-paginate"),ph=Symbol.for("vuetify:data-table-pagination");function fh(e){return{page:V(e,"page",void 0,e=>Number(e??1)),itemsPerPage:V(e,"itemsPerPage",void 0,e=>Number(e??10))}}function mh(e){const{page:t,itemsPerPage:a,itemsLength:l}=e,n=sh(()=>-1===a.value?0:a.value*(t.value-1)),o=sh(()=>-1===a.value?l.value:Math.min(l.value,n.value+a.value)),i=sh(()=>-1===a.value||0===l.value?1:Math.ceil(l.value/a.value));dh([t,i],()=>{t.value>i.value&&(t.value=i.value)});const r={page:t,itemsPerPage:a,startIndex:n,stopIndex:o,pageCount:i,itemsLength:l,nextPage:function(){t.value=k(t.value+1,1,i.value)},prevPage:function(){t.value=k(t.value-1,1,i.value)},setPage:function(e){t.value=k(e,1,i.value)},setItemsPerPage:function(e){a.value=e,t.value=1}};return ch(ph,r),r}function gh(e){const t=i("usePaginatedItems"),{items:a,startIndex:l,stopIndex:n,itemsPerPage:o}=e,r=sh(()=>o.value<=0?a.value:a.value.slice(l.value,n.value));return dh(r,e=>{t.emit("update:currentItems",e)},{immediate:!0}),{paginatedItems:r}}const{computed:hh,inject:yh,provide:bh,shallowRef:wh,toRef:Sh}=await e("vue"),kh={showSelectAll:!1,allSelected:()=>[],select:e=>{let{items:t,value:a}=e;return new Set(a?[t[0]?.value]:[])},selectAll:e=>{let{selected:t}=e;return t}},xh={showSelectAll:!0,allSelected:e=>{let{currentPage:t}=e;return t},select:e=>{let{items:t,value:a,selected:l}=e;for(const n of t)a?l.add(n.value):l.delete(n.value);return l},selectAll:e=>{let{value:t,currentPage:a,selected:l}=e;return xh.select({items:a,value:t,selected:l})}},Vh={showSelectAll:!0,allSelected:e=>{let{allItems:t}=e;return t},select:e=>{let{items:t,value:a,selected:l}=e;for(const n of t)a?l.add(n.value):l.delete(n.value);return l},selectAll:e=>{let{value:t,allItems:a,selected:l}=e;return Vh.select({items:a,value:t,selected:l})}},Ch=t({showSelect:Boolean,selectStrategy:{type:[String,Object],default:"page"},modelValue:{type:Array,default:()=>[]},valueComparator:{type:Function,default:B}},"DataTable-select"),_h=Symbol.for("vuetify:data-table-selection");function Ih(e,t){let{allItems:a,currentPage:l}=t;const n=V(e,"modelValue",e.modelValue,t=>new Set(P(t).map(t=>a.value.find(a=>e.valueComparator(t,a.value))?.value??t)),e=>[...e.values()]),o=hh(()=>a.value.filter(e=>e.selectable)),i=hh(()=>l.value.filter(e=>e.selectable)),r=hh(()=>{if("object"==typeof e.selectStrategy)return e.selectStrategy;switch(e.selectStrategy){case"single":return kh;case"all":return Vh;default:return xh}}),s=wh(null);function u(e){return P(e).every(e=>n.value.has(e.value))}function c(e,t){const a=r.value.select({items:e,value:t,selected:new Set(n.value)});n.value=a}const d=hh(()=>n.value.size>0),v=hh(()=>{const e=r.value.allSelected({allItems:o.value,currentPage:i.value});return!!e.length&&u(e)}),p={toggleSelect:function(t,a,n){const o=[];if(a=a??l.value.findIndex(e=>e.value===t.value),"single"!==e.selectStrategy&&n?.shiftKey&&null!==s.value){const[e,t]=[s.value,a].sort((e,t)=>e-t);o.push(...l.value.slice(e,t+1).filter(e=>e.selectable))}else o.push(t),s.value=a;c(o,!u([t]))},select:c,selectAll:function(e){const t=r.value.selectAll({value:e,allItems:o.value,currentPage:i.value,selected:new Set(n.value)});n.value=t},isSelected:u,isSomeSelected:function(e){return P(e).some(e=>n.value.has(e.value))},someSelected:d,allSelected:v,showSelectAll:Sh(()=>r.value.showSelectAll),lastSelectedIndex:s,selectStrategy:r};return bh(_h,p),p}function Bh(){const e=yh(_h);if(!e)throw new Error("Missing selection!");return e}const{computed:Ph,inject:Ah,provide:Nh,toRef:Th}=await e("vue"),Eh=t({sortBy:{type:Array,default:()=>[]},customKeySort:Object,multiSort:Boolean,mustSort:Boolean},"DataTable-sort"),Dh=Symbol.for("vuetify:data-table-sort");function Rh(e){return{sortBy:V(e,"sortBy"),mustSort:Th(()=>e.mustSort),multiSort:Th(()=>e.multiSort)}}function $h(e){const{sortBy:t,mustSort:a,multiSort:l,page:n}=e;const o={sortBy:t,toggleSort:e=>{if(null==e.key)return;let o=t.value.map(e=>({...e}))??[];const i=o.find(t=>t.key===e.key);i?"desc"===i.order?a.value&&1===o.length?i.order="asc":o=o.filter(t=>t.key!==e.key):i.order="desc":l.value?o.push({key:e.key,order:"asc"}):o=[{key:e.key,order:"asc"}],t.value=o,n&&(n.value=1)},isSorted:function(e){return!!t.value.find(t=>t.key===e.key)}};return Nh(Dh,o),o}function Lh(){const e=Ah(Dh);if(!e)throw new Error("Missing sort!");return e}function Fh(e,t,a,l){const n=M(),o=Ph(()=>a.value.length?function(e,t,a,l){const n=new Intl.Collator(a,{sensitivity:"accent",usage:"sort"}),o=e.map(e=>[e,l?.transform?l.transform(e):e]);return o.sort((e,a)=>{for(let o=0;o<t.length;o++){let i=!1;const r=t[o].key,s=t[o].order??"asc";if(!1===s)continue;let u=Pe(e[1],r),c=Pe(a[1],r),d=e[0].raw,v=a[0].raw;if("desc"===s&&([u,c]=[c,u],[d,v]=[v,d]),l?.sortRawFunctions?.[r]){const e=l.sortRawFunctions[r](d,v);if(null==e)continue;if(i=!0,e)return e}if(l?.sortFunctions?.[r]){const e=l.sortFunctions[r](u,c);if(null==e)continue;if(i=!0,e)return e}if(!i){if(u instanceof Date&&c instanceof Date)return u.getTime()-c.getTime();if([u,c]=[u,c].map(e=>null!=e?e.toString().toLocaleLowerCase():e),u!==c)return Ae(u)&&Ae(c)?0:Ae(u)?-1:Ae(c)?1:isNaN(u)||isNaN(c)?n.compare(u,c):Number(u)-Number(c)}}return 0}).map(e=>{let[t]=e;return t})}(t.value,a.value,n.current.value,{transform:l?.transform,sortFunctions:{...e.customKeySort,...l?.sortFunctions?.value},sortRawFunctions:l?.sortRawFunctions?.value}):t.value);return{sortedItems:o}}const{computed:Mh}=await e("vue"),Oh=t({items:{type:Array,default:()=>[]},itemValue:{type:[String,Array,Function],default:"id"},itemSelectable:{type:[String,Array,Function],default:null},returnObject:Boolean},"DataIterator-items");function zh(e,t){return{type:"item",value:e.returnObject?t:ee(t,e.itemValue),selectable:ee(t,e.itemSelectable,!0),raw:t}}function jh(e){const t=Mh(()=>function(e,t){const a=[];for(const l of t)a.push(zh(e,l));return a}(e,e.items));return{items:t}}const{createVNode:Hh}=await e("vue"),{computed:Wh,toRef:Uh}=await e("vue"),Gh=t({search:String,loading:Boolean,...qe(),...Oh(),...Ch(),...Eh(),...vh({itemsPerPage:5}),...Wg(),...Qg(),...Hv(),...Vt(),...Ia({transition:{component:Yt,hideOnLeave:!0}})},"VDataIterator"),Yh=o()({name:"VDataIterator",props:Gh(),emits:{"update:modelValue":e=>!0,"update:groupBy":e=>!0,"update:page":e=>!0,"update:itemsPerPage":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:expanded":e=>!0,"update:currentItems":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"groupBy"),n=Uh(()=>e.search),{items:o}=jh(e),{filteredItems:i}=Wv(e,o,n,{transform:e=>e.raw}),{sortBy:r,multiSort:s,mustSort:u}=Rh(e),{page:c,itemsPerPage:d}=fh(e),{toggleSort:v}=$h({sortBy:r,multiSort:s,mustSort:u,page:c}),{sortByWithGroups:p,opened:f,extractRows:m,isGroupOpen:g,toggleGroup:h}=th({groupBy:l,sortBy:r}),{sortedItems:y}=Fh(e,i,p,{transform:e=>e.raw}),{flatItems:b}=oh(y,l,f),w=Uh(()=>b.value.length),{startIndex:S,stopIndex:k,pageCount:x,prevPage:C,nextPage:_,setItemsPerPage:I,setPage:B}=mh({page:c,itemsPerPage:d,itemsLength:w}),{paginatedItems:P}=gh({items:b,startIndex:S,stopIndex:k,itemsPerPage:d}),A=Wh(()=>m(P.value)),{isSelected:N,select:T,selectAll:E,toggleSelect:D}=Ih(e,{allItems:o,currentPage:A}),{isExpanded:R,toggleExpand:$}=Gg(e);rh({page:c,itemsPerPage:d,sortBy:r,groupBy:l,search:n});const L=Wh(()=>({page:c.value,itemsPerPage:d.value,sortBy:r.value,pageCount:x.value,toggleSort:v,prevPage:C,nextPage:_,setPage:B,setItemsPerPage:I,isSelected:N,select:T,selectAll:E,toggleSelect:D,isExpanded:R,toggleExpand:$,isGroupOpen:g,toggleGroup:h,items:A.value,groupedItems:P.value}));return wt(()=>Hh(e.tag,{class:["v-data-iterator",{"v-data-iterator--loading":e.loading},e.class],style:e.style},{default:()=>[a.header?.(L.value),Hh(Ba,{transition:e.transition},{default:()=>[e.loading?Hh(Wn,{key:"loader",name:"v-data-iterator",active:!0},{default:e=>a.loader?.(e)}):Hh("div",{key:"items"},[P.value.length?a.default?.(L.value):a["no-data"]?.()])]}),a.footer?.(L.value)]})),{}}}),{onBeforeUpdate:qh,ref:Kh}=await e("vue");const{mergeProps:Xh,createVNode:Jh}=await e("vue"),{computed:Qh,nextTick:Zh,shallowRef:ey,toRef:ty}=await e("vue"),ay=t({activeColor:String,start:{type:[Number,String],default:1},modelValue:{type:Number,default:e=>e.start},disabled:Boolean,length:{type:[Number,String],default:1,validator:e=>e%1==0},totalVisible:[Number,String],firstIcon:{type:E,default:"$first"},prevIcon:{type:E,default:"$prev"},nextIcon:{type:E,default:"$next"},lastIcon:{type:E,default:"$last"},ariaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.root"},pageAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.page"},currentPageAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.currentPage"},firstAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.first"},previousAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.previous"},nextAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.next"},lastAriaLabel:{type:String,default:"$vuetify.pagination.ariaLabel.last"},ellipsis:{type:String,default:"..."},showFirstLastPage:Boolean,...Ka(),...qe(),...Al(),...Za(),...Sa(),...pn(),...Vt({tag:"nav"}),...c(),...Fl({variant:"text"})},"VPagination"),ly=o()({name:"VPagination",props:ay(),emits:{"update:modelValue":e=>!0,first:e=>!0,prev:e=>!0,next:e=>!0,last:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=V(e,"modelValue"),{t:o,n:i}=M(),{isRtl:s}=u(),{themeClasses:c}=r(e),{width:d}=G(),p=ey(-1);v(void 0,{scoped:!0});const{resizeRef:f}=R(e=>{if(!e.length)return;const{target:t,contentRect:a}=e[0],l=t.querySelector(".v-pagination__list > *");if(!l)return;const n=a.width,o=l.offsetWidth+2*parseFloat(getComputedStyle(l).marginRight);p.value=y(n,o)}),m=Qh(()=>parseInt(e.length,10)),g=Qh(()=>parseInt(e.start,10)),h=Qh(()=>null!=e.totalVisible?parseInt(e.totalVisible,10):p.value>=0?p.value:y(d.value,58));function y(t,a){const l=e.showFirstLastPage?5:3;return Math.max(0,Math.floor(Number(((t-a*l)/a).toFixed(2))))}const b=Qh(()=>{if(m.value<=0||isNaN(m.value)||m.value>Number.MAX_SAFE_INTEGER)return[];if(h.value<=0)return[];if(1===h.value)return[n.value];if(m.value<=h.value)return ke(m.value,g.value);const t=h.value%2==0,a=t?h.value/2:Math.floor(h.value/2),l=t?a:a+1,o=m.value-a;if(l-n.value>=0)return[...ke(Math.max(1,h.value-1),g.value),e.ellipsis,m.value];if(n.value-o>=(t?1:0)){const t=h.value-1,a=m.value-t+g.value;return[g.value,e.ellipsis,...ke(t,a)]}{const t=Math.max(1,h.value-2),a=1===t?n.value:n.value-Math.ceil(t/2)+g.value;return[g.value,e.ellipsis,...ke(t,a),e.ellipsis,m.value]}});function w(e,t,a){e.preventDefault(),n.value=t,a&&l(a,t)}const{refs:S,updateRef:k}=function(){const e=Kh([]);return qh(()=>e.value=[]),{refs:e,updateRef:function(t,a){e.value[a]=t}}}();v({VPaginationBtn:{color:ty(()=>e.color),border:ty(()=>e.border),density:ty(()=>e.density),size:ty(()=>e.size),variant:ty(()=>e.variant),rounded:ty(()=>e.rounded),elevation:ty(()=>e.elevation)}});const x=Qh(()=>b.value.map((t,a)=>{const l=e=>k(e,a);if("string"==typeof t)return{isActive:!1,key:`ellipsis-${a}`,page:t,props:{ref:l,ellipsis:!0,icon:!0,disabled:!0}};{const a=t===n.value;return{isActive:a,key:t,page:i(t),props:{ref:l,ellipsis:!1,icon:!0,disabled:!!e.disabled||Number(e.length)<2,color:a?e.activeColor:e.color,"aria-current":a,"aria-label":o(a?e.currentPageAriaLabel:e.pageAriaLabel,t),onClick:e=>w(e,t)}}}})),C=Qh(()=>{const t=!!e.disabled||n.value<=g.value,a=!!e.disabled||n.value>=g.value+m.value-1;return{first:e.showFirstLastPage?{icon:s.value?e.lastIcon:e.firstIcon,onClick:e=>w(e,g.value,"first"),disabled:t,"aria-label":o(e.firstAriaLabel),"aria-disabled":t}:void 0,prev:{icon:s.value?e.nextIcon:e.prevIcon,onClick:e=>w(e,n.value-1,"prev"),disabled:t,"aria-label":o(e.previousAriaLabel),"aria-disabled":t},next:{icon:s.value?e.prevIcon:e.nextIcon,onClick:e=>w(e,n.value+1,"next"),disabled:a,"aria-label":o(e.nextAriaLabel),"aria-disabled":a},last:e.showFirstLastPage?{icon:s.value?e.firstIcon:e.lastIcon,onClick:e=>w(e,g.value+m.value-1,"last"),disabled:a,"aria-label":o(e.lastAriaLabel),"aria-disabled":a}:void 0}});function _(){const e=n.value-g.value;S.value[e]?.$el.focus()}function I(t){t.key===xe.left&&!e.disabled&&n.value>Number(e.start)?(n.value=n.value-1,Zh(_)):t.key===xe.right&&!e.disabled&&n.value<g.value+m.value-1&&(n.value=n.value+1,Zh(_))}return wt(()=>Jh(e.tag,{ref:f,class:["v-pagination",c.value,e.class],style:e.style,role:"navigation","aria-label":o(e.ariaLabel),onKeydown:I,"data-test":"v-pagination-root"},{default:()=>[Jh("ul",{class:"v-pagination__list"},[e.showFirstLastPage&&Jh("li",{key:"first",class:"v-pagination__first","data-test":"v-pagination-first"},[a.first?a.first(C.value.first):Jh(To,Xh({_as:"VPaginationBtn"},C.value.first),null)]),Jh("li",{key:"prev",class:"v-pagination__prev","data-test":"v-pagination-prev"},[a.prev?a.prev(C.value.prev):Jh(To,Xh({_as:"VPaginationBtn"},C.value.prev),null)]),x.value.map((e,t)=>Jh("li",{key:e.key,class:["v-pagination__item",{"v-pagination__item--is-active":e.isActive}],"data-test":"v-pagination-item"},[a.item?a.item(e):Jh(To,Xh({_as:"VPaginationBtn"},e.props),{default:()=>[e.page]})])),Jh("li",{key:"next",class:"v-pagination__next","data-test":"v-pagination-next"},[a.next?a.next(C.value.next):Jh(To,Xh({_as:"VPaginationBtn"},C.value.next),null)]),e.showFirstLastPage&&Jh("li",{key:"last",class:"v-pagination__last","data-test":"v-pagination-last"},[a.last?a.last(C.value.last):Jh(To,Xh({_as:"VPaginationBtn"},C.value.last),null)])])]})),{}}}),{createVNode:ny,mergeProps:oy}=await e("vue"),{computed:iy}=await e("vue"),ry=t({prevIcon:{type:E,default:"$prev"},nextIcon:{type:E,default:"$next"},firstIcon:{type:E,default:"$first"},lastIcon:{type:E,default:"$last"},itemsPerPageText:{type:String,default:"$vuetify.dataFooter.itemsPerPageText"},pageText:{type:String,default:"$vuetify.dataFooter.pageText"},firstPageLabel:{type:String,default:"$vuetify.dataFooter.firstPage"},prevPageLabel:{type:String,default:"$vuetify.dataFooter.prevPage"},nextPageLabel:{type:String,default:"$vuetify.dataFooter.nextPage"},lastPageLabel:{type:String,default:"$vuetify.dataFooter.lastPage"},itemsPerPageOptions:{type:Array,default:()=>[{value:10,title:"10"},{value:25,title:"25"},{value:50,title:"50"},{value:100,title:"100"},{value:-1,title:"$vuetify.dataFooter.itemsPerPageAll"}]},showCurrentPage:Boolean},"VDataTableFooter"),sy=o()({name:"VDataTableFooter",props:ry(),setup(e,t){let{slots:a}=t;const{t:l}=M(),{page:n,pageCount:o,startIndex:i,stopIndex:r,itemsLength:s,itemsPerPage:u,setItemsPerPage:c}=function(){const e=uh(ph);if(!e)throw new Error("Missing pagination!");return e}(),d=iy(()=>e.itemsPerPageOptions.map(e=>"number"==typeof e?{value:e,title:-1===e?l("$vuetify.dataFooter.itemsPerPageAll"):String(e)}:{...e,title:isNaN(Number(e.title))?l(e.title):e.title}));return wt(()=>{const t=ly.filterProps(e);return ny("div",{class:"v-data-table-footer"},[a.prepend?.(),ny("div",{class:"v-data-table-footer__items-per-page"},[ny("span",null,[l(e.itemsPerPageText)]),ny(Dv,{items:d.value,modelValue:u.value,"onUpdate:modelValue":e=>c(Number(e)),density:"compact",variant:"outlined","hide-details":!0},null)]),ny("div",{class:"v-data-table-footer__info"},[ny("div",null,[l(e.pageText,s.value?i.value+1:0,r.value,s.value)])]),ny("div",{class:"v-data-table-footer__pagination"},[ny(ly,oy({modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,density:"comfortable","first-aria-label":e.firstPageLabel,"last-aria-label":e.lastPageLabel,length:o.value,"next-aria-label":e.nextPageLabel,"previous-aria-label":e.prevPageLabel,rounded:!0,"show-first-last-page":!0,"total-visible":e.showCurrentPage?1:0,variant:"plain"},t),null)])])}),{}}}),{createVNode:uy}=await e("vue"),cy=Ne({align:{type:String,default:"start"},fixed:Boolean,fixedOffset:[Number,String],height:[Number,String],lastFixed:Boolean,noPadding:Boolean,tag:String,width:[Number,String],maxWidth:[Number,String],nowrap:Boolean},(e,t)=>{let{slots:a}=t;const l=e.tag??"td";return uy(l,{class:["v-data-table__td",{"v-data-table-column--fixed":e.fixed,"v-data-table-column--last-fixed":e.lastFixed,"v-data-table-column--no-padding":e.noPadding,"v-data-table-column--nowrap":e.nowrap},`v-data-table-column--align-${e.align}`],style:{height:p(e.height),width:p(e.width),maxWidth:p(e.maxWidth),left:p(e.fixedOffset||null)}},{default:()=>[a.default?.()]})}),{capitalize:dy,inject:vy,provide:py,ref:fy,watchEffect:my}=await e("vue"),gy=t({headers:Array},"DataTable-header"),hy=Symbol.for("vuetify:data-table-headers"),yy={title:"",sortable:!1},by={...yy,width:48};function wy(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];if(e.children)for(const a of e.children)wy(a,t);else t.push(e);return t}function Sy(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Set;for(const a of e)a.key&&t.add(a.key),a.children&&Sy(a.children,t);return t}function ky(e){if(e.key)return"data-table-group"===e.key?yy:["data-table-expand","data-table-select"].includes(e.key)?by:void 0}function xy(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return e.children?Math.max(t,...e.children.map(e=>xy(e,t+1))):t}function Vy(e,t){const a=[];let l=0;const n=function(){const e=(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).map(e=>({element:e,priority:0}));return{enqueue:(t,a)=>{let l=!1;for(let n=0;n<e.length;n++)if(e[n].priority>a){e.splice(n,0,{element:t,priority:a}),l=!0;break}l||e.push({element:t,priority:a})},size:()=>e.length,count:()=>{let t=0;if(!e.length)return 0;const a=Math.floor(e[0].priority);for(let l=0;l<e.length;l++)Math.floor(e[l].priority)===a&&(t+=1);return t},dequeue:()=>e.shift()}}(e);for(;n.size()>0;){let e=n.count();const o=[];let i=1;for(;e>0;){const{element:a,priority:r}=n.dequeue(),s=t-l-xy(a);if(o.push({...a,rowspan:s??1,colspan:a.children?wy(a).length:1}),a.children)for(const e of a.children){const t=r%1+i/Math.pow(10,l+2);n.enqueue(e,l+s+t)}i+=1,e-=1}l+=1,a.push(o)}return{columns:e.map(e=>wy(e)).flat(),headers:a}}function Cy(e){const t=[];for(const a of e){const e={...ky(a),...a},l=e.key??("string"==typeof e.value?e.value:null),n=e.value??l??null,o={...e,key:l,value:n,sortable:e.sortable??(null!=e.key||!!e.sort),children:e.children?Cy(e.children):void 0};t.push(o)}return t}function _y(e,t){const a=fy([]),l=fy([]),n=fy({}),o=fy({}),i=fy({});my(()=>{const r=(e.headers||Object.keys(e.items[0]??{}).map(e=>({key:e,title:dy(e)}))).slice(),s=Sy(r);t?.groupBy?.value.length&&!s.has("data-table-group")&&r.unshift({key:"data-table-group",title:"Group"}),t?.showSelect?.value&&!s.has("data-table-select")&&r.unshift({key:"data-table-select"}),t?.showExpand?.value&&!s.has("data-table-expand")&&r.push({key:"data-table-expand"});const u=Cy(r);!function(e){let t=!1;function a(e){if(e)if(arguments.length>1&&void 0!==arguments[1]&&arguments[1]&&(e.fixed=!0),e.fixed)if(e.children)for(let t=e.children.length-1;t>=0;t--)a(e.children[t],!0);else t?isNaN(Number(e.width))?X(`Multiple fixed columns should have a static width (key: ${e.key})`):e.minWidth=Math.max(Number(e.width)||0,Number(e.minWidth)||0):e.lastFixed=!0,t=!0;else if(e.children)for(let t=e.children.length-1;t>=0;t--)a(e.children[t]);else t=!1}for(let o=e.length-1;o>=0;o--)a(e[o]);function l(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(!e)return t;if(e.children){e.fixedOffset=t;for(const a of e.children)t=l(a,t)}else e.fixed&&(e.fixedOffset=t,t+=parseFloat(e.width||"0")||0);return t}let n=0;for(const o of e)n=l(o,n)}(u);const c=Math.max(...u.map(e=>xy(e)))+1,d=Vy(u,c);a.value=d.headers,l.value=d.columns;const v=d.headers.flat(1);for(const e of v)e.key&&(e.sortable&&(e.sort&&(n.value[e.key]=e.sort),e.sortRaw&&(o.value[e.key]=e.sortRaw)),e.filter&&(i.value[e.key]=e.filter))});const r={headers:a,columns:l,sortFunctions:n,sortRawFunctions:o,filterFunctions:i};return py(hy,r),r}function Iy(){const e=vy(hy);if(!e)throw new Error("Missing headers!");return e}const{createVNode:By,mergeProps:Py,Fragment:Ay}=await e("vue"),{computed:Ny,mergeProps:Ty}=await e("vue"),Ey=t({color:String,disableSort:Boolean,fixedHeader:Boolean,multiSort:Boolean,sortAscIcon:{type:E,default:"$sortAsc"},sortDescIcon:{type:E,default:"$sortDesc"},headerProps:{type:Object},sticky:Boolean,...q(),...jn()},"VDataTableHeaders"),Dy=o()({name:"VDataTableHeaders",props:Ey(),setup(e,t){let{slots:a}=t;const{t:l}=M(),{toggleSort:n,sortBy:o,isSorted:i}=Lh(),{someSelected:r,allSelected:s,selectAll:u,showSelectAll:c}=Bh(),{columns:d,headers:v}=Iy(),{loaderClasses:f}=Hn(e);function m(t,a){if(e.sticky||e.fixedHeader||t.fixed)return{position:"sticky",left:t.fixed?p(t.fixedOffset):void 0,top:e.sticky||e.fixedHeader?`calc(var(--v-table-header-height) * ${a})`:void 0}}function g(t){const a=o.value.find(e=>e.key===t.key);return a?"asc"===a.order?e.sortAscIcon:e.sortDescIcon:e.sortAscIcon}const{backgroundColorClasses:h,backgroundColorStyles:y}=ya(()=>e.color),{displayClasses:b,mobile:w}=G(e),S=Ny(()=>({headers:v.value,columns:d.value,toggleSort:n,isSorted:i,sortBy:o.value,someSelected:r.value,allSelected:s.value,selectAll:u,getSortIcon:g})),k=Ny(()=>["v-data-table__th",{"v-data-table__th--sticky":e.sticky||e.fixedHeader},b.value,f.value]),x=t=>{let{column:l,x:d,y:v}=t;const f="data-table-select"===l.key||"data-table-expand"===l.key,b=Ty(e.headerProps??{},l.headerProps??{});return By(cy,Py({tag:"th",align:l.align,class:[{"v-data-table__th--sortable":l.sortable&&!e.disableSort,"v-data-table__th--sorted":i(l),"v-data-table__th--fixed":l.fixed},...k.value],style:{width:p(l.width),minWidth:p(l.minWidth),maxWidth:p(l.maxWidth),...m(l,v)},colspan:l.colspan,rowspan:l.rowspan,onClick:l.sortable?()=>n(l):void 0,fixed:l.fixed,nowrap:l.nowrap,lastFixed:l.lastFixed,noPadding:f},b),{default:()=>{const t=`header.${l.key}`,d={column:l,selectAll:u,isSorted:i,toggleSort:n,sortBy:o.value,someSelected:r.value,allSelected:s.value,getSortIcon:g};return a[t]?a[t](d):"data-table-select"===l.key?a["header.data-table-select"]?.(d)??(c.value&&By(_i,{modelValue:s.value,indeterminate:r.value&&!s.value,"onUpdate:modelValue":u},null)):By("div",{class:"v-data-table-header__content"},[By("span",null,[l.title]),l.sortable&&!e.disableSort&&By(bn,{key:"icon",class:"v-data-table-header__sort-icon",icon:g(l)},null),e.multiSort&&i(l)&&By("div",{key:"badge",class:["v-data-table-header__sort-badge",...h.value],style:y.value},[o.value.findIndex(e=>e.key===l.key)+1])])}})},V=()=>{const t=Ny(()=>d.value.filter(t=>t?.sortable&&!e.disableSort)),c=Ny(()=>{if(null!=d.value.find(e=>"data-table-select"===e.key))return s.value?"$checkboxOn":r.value?"$checkboxIndeterminate":"$checkboxOff"});return By(cy,Py({tag:"th",class:[...k.value],colspan:v.value.length+1},e.headerProps),{default:()=>[By("div",{class:"v-data-table-header__content"},[By(Dv,{chips:!0,class:"v-data-table__td-sort-select",clearable:!0,density:"default",items:t.value,label:l("$vuetify.dataTable.sortBy"),multiple:e.multiSort,variant:"underlined","onClick:clear":()=>o.value=[],appendIcon:c.value,"onClick:append":()=>u(!s.value)},{...a,chip:e=>By(Hr,{onClick:e.item.raw?.sortable?()=>n(e.item.raw):void 0,onMousedown:e=>{e.preventDefault(),e.stopPropagation()}},{default:()=>[e.item.title,By(bn,{class:["v-data-table__td-sort-icon",i(e.item.raw)&&"v-data-table__td-sort-icon-active"],icon:g(e.item.raw),size:"small"},null)]})})])]})};wt(()=>w.value?By("tr",null,[By(V,null,null)]):By(Ay,null,[a.headers?a.headers(S.value):v.value.map((e,t)=>By("tr",null,[e.map((e,a)=>By(x,{column:e,x:a,y:t},null))])),e.loading&&By("tr",{class:"v-data-table-progress"},[By("th",{colspan:d.value.length},[By(Wn,{name:"v-data-table-progress",absolute:!0,active:!0,color:"boolean"==typeof e.loading?void 0:e.loading,indeterminate:!0},{default:a.loader})])])]))}}),{createVNode:Ry,createTextVNode:$y}=await e("vue"),{computed:Ly}=await e("vue"),Fy=t({item:{type:Object,required:!0}},"VDataTableGroupHeaderRow"),My=o()({name:"VDataTableGroupHeaderRow",props:Fy(),setup(e,t){let{slots:a}=t;const{isGroupOpen:l,toggleGroup:n,extractRows:o}=ah(),{isSelected:i,isSomeSelected:r,select:s}=Bh(),{columns:u}=Iy(),c=Ly(()=>o([e.item]));return()=>Ry("tr",{class:"v-data-table-group-header-row",style:{"--v-data-table-group-header-row-depth":e.item.depth}},[u.value.map(t=>{if("data-table-group"===t.key){const t=l(e.item)?"$expand":"$next",o=()=>n(e.item);return a["data-table-group"]?.({item:e.item,count:c.value.length,props:{icon:t,onClick:o}})??Ry(cy,{class:"v-data-table-group-header-row__column"},{default:()=>[Ry(To,{size:"small",variant:"text",icon:t,onClick:o},null),Ry("span",null,[e.item.value]),Ry("span",null,[$y("("),c.value.length,$y(")")])]})}if("data-table-select"===t.key){const e=i(c.value),t=r(c.value)&&!e,l=e=>s(c.value,e);return a["data-table-select"]?.({props:{modelValue:e,indeterminate:t,"onUpdate:modelValue":l}})??Ry("td",null,[Ry(_i,{modelValue:e,indeterminate:t,"onUpdate:modelValue":l},null)])}return Ry("td",null,null)})])}}),{createVNode:Oy,Fragment:zy,mergeProps:jy}=await e("vue"),{toDisplayString:Hy,withModifiers:Wy}=await e("vue"),Uy=t({index:Number,item:Object,cellProps:[Object,Function],onClick:O(),onContextmenu:O(),onDblclick:O(),...q()},"VDataTableRow"),Gy=o()({name:"VDataTableRow",props:Uy(),setup(e,t){let{slots:a}=t;const{displayClasses:l,mobile:n}=G(e,"v-data-table__tr"),{isSelected:o,toggleSelect:i,someSelected:r,allSelected:s,selectAll:u}=Bh(),{isExpanded:c,toggleExpand:d}=Yg(),{toggleSort:v,sortBy:p,isSorted:f}=Lh(),{columns:m}=Iy();wt(()=>Oy("tr",{class:["v-data-table__tr",{"v-data-table__tr--clickable":!!(e.onClick||e.onContextmenu||e.onDblclick)},l.value],onClick:e.onClick,onContextmenu:e.onContextmenu,onDblclick:e.onDblclick},[e.item&&m.value.map((t,l)=>{const m=e.item,g=`item.${t.key}`,h=`header.${t.key}`,y={index:e.index,item:m.raw,internalItem:m,value:Pe(m.columns,t.key),column:t,isSelected:o,toggleSelect:i,isExpanded:c,toggleExpand:d},b={column:t,selectAll:u,isSorted:f,toggleSort:v,sortBy:p.value,someSelected:r.value,allSelected:s.value,getSortIcon:()=>""},w="function"==typeof e.cellProps?e.cellProps({index:y.index,item:y.item,internalItem:y.internalItem,value:y.value,column:t}):e.cellProps,S="function"==typeof t.cellProps?t.cellProps({index:y.index,item:y.item,internalItem:y.internalItem,value:y.value}):t.cellProps;return Oy(cy,jy({align:t.align,class:{"v-data-table__td--expanded-row":"data-table-expand"===t.key,"v-data-table__td--select-row":"data-table-select"===t.key},fixed:t.fixed,fixedOffset:t.fixedOffset,lastFixed:t.lastFixed,maxWidth:n.value?void 0:t.maxWidth,noPadding:"data-table-select"===t.key||"data-table-expand"===t.key,nowrap:t.nowrap,width:n.value?void 0:t.width},w,S),{default:()=>{if("data-table-select"===t.key)return a["item.data-table-select"]?.({...y,props:{disabled:!m.selectable,modelValue:o([m]),onClick:Wy(()=>i(m),["stop"])}})??Oy(_i,{disabled:!m.selectable,modelValue:o([m]),onClick:Wy(t=>i(m,e.index,t),["stop"])},null);if("data-table-expand"===t.key)return a["item.data-table-expand"]?.({...y,props:{icon:c(m)?"$collapse":"$expand",size:"small",variant:"text",onClick:Wy(()=>d(m),["stop"])}})??Oy(To,{icon:c(m)?"$collapse":"$expand",size:"small",variant:"text",onClick:Wy(()=>d(m),["stop"])},null);if(a[g]&&!n.value)return a[g](y);const l=Hy(y.value);return n.value?Oy(zy,null,[Oy("div",{class:"v-data-table__td-title"},[a[h]?.(b)??t.title]),Oy("div",{class:"v-data-table__td-value"},[a[g]?.(y)??l])]):l}})})]))}}),{createVNode:Yy,Fragment:qy,mergeProps:Ky}=await e("vue"),{Fragment:Xy,mergeProps:Jy}=await e("vue"),Qy=t({loading:[Boolean,String],loadingText:{type:String,default:"$vuetify.dataIterator.loadingText"},hideNoData:Boolean,items:{type:Array,default:()=>[]},noDataText:{type:String,default:"$vuetify.noDataText"},rowProps:[Object,Function],cellProps:[Object,Function],...q()},"VDataTableRows"),Zy=o()({name:"VDataTableRows",inheritAttrs:!1,props:Qy(),setup(e,t){let{attrs:a,slots:l}=t;const{columns:n}=Iy(),{expandOnClick:o,toggleExpand:i,isExpanded:r}=Yg(),{isSelected:s,toggleSelect:u}=Bh(),{toggleGroup:c,isGroupOpen:d}=ah(),{t:v}=M(),{mobile:p}=G(e);return wt(()=>!e.loading||e.items.length&&!l.loading?e.loading||e.items.length||e.hideNoData?Yy(qy,null,[e.items.map((t,v)=>{if("group"===t.type){const e={index:v,item:t,columns:n.value,isExpanded:r,toggleExpand:i,isSelected:s,toggleSelect:u,toggleGroup:c,isGroupOpen:d};return l["group-header"]?l["group-header"](e):Yy(My,Ky({key:`group-header_${t.id}`,item:t},mt(a,":group-header",()=>e)),l)}const f={index:v,item:t.raw,internalItem:t,columns:n.value,isExpanded:r,toggleExpand:i,isSelected:s,toggleSelect:u},m={...f,props:Jy({key:`item_${t.key??t.index}`,onClick:o.value?()=>{i(t)}:void 0,index:v,item:t,cellProps:e.cellProps,mobile:p.value},mt(a,":row",()=>f),"function"==typeof e.rowProps?e.rowProps({item:f.item,index:f.index,internalItem:f.internalItem}):e.rowProps)};return Yy(qy,{key:m.props.key},[l.item?l.item(m):Yy(Gy,m.props,l),r(t)&&l["expanded-row"]?.(f)])})]):Yy("tr",{class:"v-data-table-rows-no-data",key:"no-data"},[Yy("td",{colspan:n.value.length},[l["no-data"]?.()??v(e.noDataText)])]):Yy("tr",{class:"v-data-table-rows-loading",key:"loading"},[Yy("td",{colspan:n.value.length},[l.loading?.()??v(e.loadingText)])])),{}}}),{createVNode:eb}=await e("vue"),tb=t({fixedHeader:Boolean,fixedFooter:Boolean,height:[Number,String],hover:Boolean,...qe(),...Al(),...Vt(),...c()},"VTable"),ab=o()({name:"VTable",props:tb(),setup(e,t){let{slots:a,emit:l}=t;const{themeClasses:n}=r(e),{densityClasses:o}=Nl(e);return wt(()=>eb(e.tag,{class:["v-table",{"v-table--fixed-height":!!e.height,"v-table--fixed-header":e.fixedHeader,"v-table--fixed-footer":e.fixedFooter,"v-table--has-top":!!a.top,"v-table--has-bottom":!!a.bottom,"v-table--hover":e.hover},n.value,o.value,e.class],style:e.style},{default:()=>[a.top?.(),a.default?eb("div",{class:"v-table__wrapper",style:{height:p(e.height)}},[eb("table",null,[a.default()])]):a.wrapper?.(),a.bottom?.()]})),{}}}),{computed:lb}=await e("vue"),nb=t({items:{type:Array,default:()=>[]},itemValue:{type:[String,Array,Function],default:"id"},itemSelectable:{type:[String,Array,Function],default:null},rowProps:[Object,Function],cellProps:[Object,Function],returnObject:Boolean},"DataTable-items");function ob(e,t,a){return t.map((t,l)=>function(e,t,a,l){const n=e.returnObject?t:ee(t,e.itemValue),o=ee(t,e.itemSelectable,!0),i=l.reduce((e,a)=>(null!=a.key&&(e[a.key]=ee(t,a.value)),e),{});return{type:"item",key:e.returnObject?ee(t,e.itemValue):n,index:a,value:n,selectable:o,columns:i,raw:t}}(e,t,l,a))}function ib(e,t){return{items:lb(()=>ob(e,e.items,t.value))}}const{Fragment:rb,createVNode:sb,mergeProps:ub}=await e("vue"),{computed:cb,toRef:db,toRefs:vb}=await e("vue"),pb=t({...Qy(),hideDefaultBody:Boolean,hideDefaultFooter:Boolean,hideDefaultHeader:Boolean,width:[String,Number],search:String,...Wg(),...Qg(),...gy(),...nb(),...Ch(),...Eh(),...Ey(),...tb()},"DataTable"),fb=t({...vh(),...pb(),...Hv(),...ry()},"VDataTable"),mb=o()({name:"VDataTable",props:fb(),emits:{"update:modelValue":e=>!0,"update:page":e=>!0,"update:itemsPerPage":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:groupBy":e=>!0,"update:expanded":e=>!0,"update:currentItems":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{groupBy:n}=eh(e),{sortBy:o,multiSort:i,mustSort:r}=Rh(e),{page:s,itemsPerPage:u}=fh(e),{disableSort:c}=vb(e),{columns:d,headers:p,sortFunctions:f,sortRawFunctions:m,filterFunctions:g}=_y(e,{groupBy:n,showSelect:db(()=>e.showSelect),showExpand:db(()=>e.showExpand)}),{items:h}=ib(e,d),y=db(()=>e.search),{filteredItems:b}=Wv(e,h,y,{transform:e=>e.columns,customKeyFilter:g}),{toggleSort:w}=$h({sortBy:o,multiSort:i,mustSort:r,page:s}),{sortByWithGroups:S,opened:k,extractRows:x,isGroupOpen:V,toggleGroup:C}=th({groupBy:n,sortBy:o,disableSort:c}),{sortedItems:_}=Fh(e,b,S,{transform:e=>({...e.raw,...e.columns}),sortFunctions:f,sortRawFunctions:m}),{flatItems:I}=oh(_,n,k),B=cb(()=>I.value.length),{startIndex:P,stopIndex:A,pageCount:N,setItemsPerPage:T}=mh({page:s,itemsPerPage:u,itemsLength:B}),{paginatedItems:E}=gh({items:I,startIndex:P,stopIndex:A,itemsPerPage:u}),D=cb(()=>x(E.value)),{isSelected:R,select:$,selectAll:L,toggleSelect:F,someSelected:M,allSelected:O}=Ih(e,{allItems:h,currentPage:D}),{isExpanded:z,toggleExpand:j}=Gg(e);rh({page:s,itemsPerPage:u,sortBy:o,groupBy:n,search:y}),v({VDataTableRows:{hideNoData:db(()=>e.hideNoData),noDataText:db(()=>e.noDataText),loading:db(()=>e.loading),loadingText:db(()=>e.loadingText)}});const H=cb(()=>({page:s.value,itemsPerPage:u.value,sortBy:o.value,pageCount:N.value,toggleSort:w,setItemsPerPage:T,someSelected:M.value,allSelected:O.value,isSelected:R,select:$,selectAll:L,toggleSelect:F,isExpanded:z,toggleExpand:j,isGroupOpen:V,toggleGroup:C,items:D.value.map(e=>e.raw),internalItems:D.value,groupedItems:E.value,columns:d.value,headers:p.value}));return wt(()=>{const t=sy.filterProps(e),n=Dy.filterProps(e),o=Zy.filterProps(e),i=ab.filterProps(e);return sb(ab,ub({class:["v-data-table",{"v-data-table--show-select":e.showSelect,"v-data-table--loading":e.loading},e.class],style:e.style},i,{fixedHeader:e.fixedHeader||e.sticky}),{top:()=>l.top?.(H.value),default:()=>l.default?l.default(H.value):sb(rb,null,[l.colgroup?.(H.value),!e.hideDefaultHeader&&sb("thead",{key:"thead"},[sb(Dy,n,l)]),l.thead?.(H.value),!e.hideDefaultBody&&sb("tbody",null,[l["body.prepend"]?.(H.value),l.body?l.body(H.value):sb(Zy,ub(a,o,{items:E.value}),l),l["body.append"]?.(H.value)]),l.tbody?.(H.value),l.tfoot?.(H.value)]),bottom:()=>l.bottom?l.bottom(H.value):!e.hideDefaultFooter&&sb(rb,null,[sb(Js,null,null),sb(sy,t,{prepend:l["footer.prepend"]})])})}),{}}}),{createVNode:gb,mergeProps:hb}=await e("vue"),{computed:yb,shallowRef:bb,toRef:wb,toRefs:Sb}=await e("vue"),kb=t({...H(pb(),["hideDefaultFooter"]),...Qg(),...uv(),...Hv()},"VDataTableVirtual"),xb=o()({name:"VDataTableVirtual",props:kb(),emits:{"update:modelValue":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:groupBy":e=>!0,"update:expanded":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{groupBy:n}=eh(e),{sortBy:o,multiSort:i,mustSort:r}=Rh(e),{disableSort:s}=Sb(e),{columns:u,headers:c,filterFunctions:d,sortFunctions:f,sortRawFunctions:m}=_y(e,{groupBy:n,showSelect:wb(()=>e.showSelect),showExpand:wb(()=>e.showExpand)}),{items:g}=ib(e,u),h=wb(()=>e.search),{filteredItems:y}=Wv(e,g,h,{transform:e=>e.columns,customKeyFilter:d}),{toggleSort:b}=$h({sortBy:o,multiSort:i,mustSort:r}),{sortByWithGroups:w,opened:S,extractRows:k,isGroupOpen:x,toggleGroup:V}=th({groupBy:n,sortBy:o,disableSort:s}),{sortedItems:C}=Fh(e,y,w,{transform:e=>({...e.raw,...e.columns}),sortFunctions:f,sortRawFunctions:m}),{flatItems:_}=oh(C,n,S),I=yb(()=>k(_.value)),{isSelected:B,select:P,selectAll:A,toggleSelect:N,someSelected:T,allSelected:E}=Ih(e,{allItems:I,currentPage:I}),{isExpanded:D,toggleExpand:R}=Gg(e),{containerRef:$,markerRef:L,paddingTop:F,paddingBottom:M,computedItems:O,handleItemResize:z,handleScroll:j,handleScrollend:H,calculateVisibleItems:W,scrollToIndex:U}=cv(e,_),G=yb(()=>O.value.map(e=>e.raw));rh({sortBy:o,page:bb(1),itemsPerPage:bb(-1),groupBy:n,search:h}),v({VDataTableRows:{hideNoData:wb(()=>e.hideNoData),noDataText:wb(()=>e.noDataText),loading:wb(()=>e.loading),loadingText:wb(()=>e.loadingText)}});const Y=yb(()=>({sortBy:o.value,toggleSort:b,someSelected:T.value,allSelected:E.value,isSelected:B,select:P,selectAll:A,toggleSelect:N,isExpanded:D,toggleExpand:R,isGroupOpen:x,toggleGroup:V,items:I.value.map(e=>e.raw),internalItems:I.value,groupedItems:_.value,columns:u.value,headers:c.value}));return wt(()=>{const t=Dy.filterProps(e),n=Zy.filterProps(e),o=ab.filterProps(e);return gb(ab,hb({class:["v-data-table",{"v-data-table--loading":e.loading},e.class],style:e.style},o,{fixedHeader:e.fixedHeader||e.sticky}),{top:()=>l.top?.(Y.value),wrapper:()=>gb("div",{ref:$,onScrollPassive:j,onScrollend:H,class:"v-table__wrapper",style:{height:p(e.height)}},[gb("table",null,[l.colgroup?.(Y.value),!e.hideDefaultHeader&&gb("thead",{key:"thead"},[gb(Dy,t,l)]),l.thead?.(Y.value),!e.hideDefaultBody&&gb("tbody",{key:"tbody"},[gb("tr",{ref:L,style:{height:p(F.value),border:0}},[gb("td",{colspan:u.value.length,style:{height:0,border:0}},null)]),l["body.prepend"]?.(Y.value),gb(Zy,hb(a,n,{items:G.value}),{...l,item:e=>gb(tv,{key:e.internalItem.index,renderless:!0,"onUpdate:height":t=>z(e.internalItem.index,t)},{default:t=>{let{itemRef:a}=t;return l.item?.({...e,itemRef:a})??gb(Gy,hb(e.props,{ref:a,key:e.internalItem.index,index:e.internalItem.index}),l)}})}),l["body.append"]?.(Y.value),gb("tr",{style:{height:p(M.value),border:0}},[gb("td",{colspan:u.value.length,style:{height:0,border:0}},null)])]),l.tbody?.(Y.value),l.tfoot?.(Y.value)])]),bottom:()=>l.bottom?.(Y.value)})}),{calculateVisibleItems:W,scrollToIndex:U}}}),{Fragment:Vb,createVNode:Cb,mergeProps:_b}=await e("vue"),{computed:Ib,provide:Bb,toRef:Pb,toRefs:Ab}=await e("vue"),Nb=t({itemsLength:{type:[Number,String],required:!0},...vh(),...pb(),...ry()},"VDataTableServer"),Tb=o()({name:"VDataTableServer",props:Nb(),emits:{"update:modelValue":e=>!0,"update:page":e=>!0,"update:itemsPerPage":e=>!0,"update:sortBy":e=>!0,"update:options":e=>!0,"update:expanded":e=>!0,"update:groupBy":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const{groupBy:n}=eh(e),{sortBy:o,multiSort:i,mustSort:r}=Rh(e),{page:s,itemsPerPage:u}=fh(e),{disableSort:c}=Ab(e),d=Ib(()=>parseInt(e.itemsLength,10)),{columns:p,headers:f}=_y(e,{groupBy:n,showSelect:Pb(()=>e.showSelect),showExpand:Pb(()=>e.showExpand)}),{items:m}=ib(e,p),{toggleSort:g}=$h({sortBy:o,multiSort:i,mustSort:r,page:s}),{opened:h,isGroupOpen:y,toggleGroup:b,extractRows:w}=th({groupBy:n,sortBy:o,disableSort:c}),{pageCount:S,setItemsPerPage:k}=mh({page:s,itemsPerPage:u,itemsLength:d}),{flatItems:x}=oh(m,n,h),{isSelected:V,select:C,selectAll:_,toggleSelect:I,someSelected:B,allSelected:P}=Ih(e,{allItems:m,currentPage:m}),{isExpanded:A,toggleExpand:N}=Gg(e),T=Ib(()=>w(m.value));rh({page:s,itemsPerPage:u,sortBy:o,groupBy:n,search:Pb(()=>e.search)}),Bb("v-data-table",{toggleSort:g,sortBy:o}),v({VDataTableRows:{hideNoData:Pb(()=>e.hideNoData),noDataText:Pb(()=>e.noDataText),loading:Pb(()=>e.loading),loadingText:Pb(()=>e.loadingText)}});const E=Ib(()=>({page:s.value,itemsPerPage:u.value,sortBy:o.value,pageCount:S.value,toggleSort:g,setItemsPerPage:k,someSelected:B.value,allSelected:P.value,isSelected:V,select:C,selectAll:_,toggleSelect:I,isExpanded:A,toggleExpand:N,isGroupOpen:y,toggleGroup:b,items:T.value.map(e=>e.raw),internalItems:T.value,groupedItems:x.value,columns:p.value,headers:f.value}));wt(()=>{const t=sy.filterProps(e),n=Dy.filterProps(e),o=Zy.filterProps(e),i=ab.filterProps(e);return Cb(ab,_b({class:["v-data-table",{"v-data-table--loading":e.loading},e.class],style:e.style},i,{fixedHeader:e.fixedHeader||e.sticky}),{top:()=>l.top?.(E.value),default:()=>l.default?l.default(E.value):Cb(Vb,null,[l.colgroup?.(E.value),!e.hideDefaultHeader&&Cb("thead",{key:"thead",class:"v-data-table__thead",role:"rowgroup"},[Cb(Dy,n,l)]),l.thead?.(E.value),!e.hideDefaultBody&&Cb("tbody",{class:"v-data-table__tbody",role:"rowgroup"},[l["body.prepend"]?.(E.value),l.body?l.body(E.value):Cb(Zy,_b(a,o,{items:x.value}),l),l["body.append"]?.(E.value)]),l.tbody?.(E.value),l.tfoot?.(E.value)]),bottom:()=>l.bottom?l.bottom(E.value):!e.hideDefaultFooter&&Cb(Vb,null,[Cb(Js,null,null),Cb(sy,t,{prepend:l["footer.prepend"]})])})})}}),{createVNode:Eb}=await e("vue"),Db=t({fluid:{type:Boolean,default:!1},...qe(),...ua(),...Vt()},"VContainer"),Rb=o()({name:"VContainer",props:Db(),setup(e,t){let{slots:a}=t;const{rtlClasses:l}=u(),{dimensionStyles:n}=ca(e);return wt(()=>Eb(e.tag,{class:["v-container",{"v-container--fluid":e.fluid},l.value,e.class],style:[n.value,e.style]},a)),{}}}),{capitalize:$b,computed:Lb,h:Fb}=await e("vue"),Mb=Te.reduce((e,t)=>(e[t]={type:[Boolean,String,Number],default:!1},e),{}),Ob=Te.reduce((e,t)=>(e["offset"+$b(t)]={type:[String,Number],default:null},e),{}),zb=Te.reduce((e,t)=>(e["order"+$b(t)]={type:[String,Number],default:null},e),{}),jb={col:Object.keys(Mb),offset:Object.keys(Ob),order:Object.keys(zb)};function Hb(e,t,a){let l=e;if(null!=a&&!1!==a){if(t){l+=`-${t.replace(e,"")}`}return"col"===e&&(l="v-"+l),"col"!==e||""!==a&&!0!==a?(l+=`-${a}`,l.toLowerCase()):l.toLowerCase()}}const Wb=["auto","start","end","center","baseline","stretch"],Ub=t({cols:{type:[Boolean,String,Number],default:!1},...Mb,offset:{type:[String,Number],default:null},...Ob,order:{type:[String,Number],default:null},...zb,alignSelf:{type:String,default:null,validator:e=>Wb.includes(e)},...qe(),...Vt()},"VCol"),Gb=o()({name:"VCol",props:Ub(),setup(e,t){let{slots:a}=t;const l=Lb(()=>{const t=[];let a;for(a in jb)jb[a].forEach(l=>{const n=e[l],o=Hb(a,l,n);o&&t.push(o)});const l=t.some(e=>e.startsWith("v-col-"));return t.push({"v-col":!l||!e.cols,[`v-col-${e.cols}`]:e.cols,[`offset-${e.offset}`]:e.offset,[`order-${e.order}`]:e.order,[`align-self-${e.alignSelf}`]:e.alignSelf}),t});return()=>Fb(e.tag,{class:[l.value,e.class],style:e.style},a.default?.())}}),{capitalize:Yb,computed:qb,h:Kb}=await e("vue"),Xb=["start","end","center"],Jb=["space-between","space-around","space-evenly"];function Qb(e,t){return Te.reduce((a,l)=>(a[e+Yb(l)]=t(),a),{})}const Zb=[...Xb,"baseline","stretch"],ew=e=>Zb.includes(e),tw=Qb("align",()=>({type:String,default:null,validator:ew})),aw=[...Xb,...Jb],lw=e=>aw.includes(e),nw=Qb("justify",()=>({type:String,default:null,validator:lw})),ow=[...Xb,...Jb,"stretch"],iw=e=>ow.includes(e),rw=Qb("alignContent",()=>({type:String,default:null,validator:iw})),sw={align:Object.keys(tw),justify:Object.keys(nw),alignContent:Object.keys(rw)},uw={align:"align",justify:"justify",alignContent:"align-content"};function cw(e,t,a){let l=uw[e];if(null!=a){if(t){l+=`-${t.replace(e,"")}`}return l+=`-${a}`,l.toLowerCase()}}const dw=t({dense:Boolean,noGutters:Boolean,align:{type:String,default:null,validator:ew},...tw,justify:{type:String,default:null,validator:lw},...nw,alignContent:{type:String,default:null,validator:iw},...rw,...qe(),...Vt()},"VRow"),vw=o()({name:"VRow",props:dw(),setup(e,t){let{slots:a}=t;const l=qb(()=>{const t=[];let a;for(a in sw)sw[a].forEach(l=>{const n=e[l],o=cw(a,l,n);o&&t.push(o)});return t.push({"v-row--no-gutters":e.noGutters,"v-row--dense":e.dense,[`align-${e.align}`]:e.align,[`justify-${e.justify}`]:e.justify,[`align-content-${e.alignContent}`]:e.alignContent}),t});return()=>Kb(e.tag,{class:["v-row",l.value,e.class],style:e.style},a.default?.())}}),pw=vt("v-spacer","div","VSpacer"),{createVNode:fw}=await e("vue"),{computed:mw}=await e("vue"),gw=t({active:{type:[String,Array],default:void 0},controlHeight:[Number,String],disabled:{type:[Boolean,String,Array],default:null},nextIcon:{type:E,default:"$next"},prevIcon:{type:E,default:"$prev"},modeIcon:{type:E,default:"$subgroup"},text:String,viewMode:{type:String,default:"month"}},"VDatePickerControls"),hw=o()({name:"VDatePickerControls",props:gw(),emits:{"click:year":()=>!0,"click:month":()=>!0,"click:prev":()=>!0,"click:next":()=>!0,"click:text":()=>!0},setup(e,t){let{emit:a}=t;const l=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("text"):!!e.disabled),n=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("mode"):!!e.disabled),o=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("prev"):!!e.disabled),i=mw(()=>Array.isArray(e.disabled)?e.disabled.includes("next"):!!e.disabled);function r(){a("click:prev")}function s(){a("click:next")}function u(){a("click:year")}function c(){a("click:month")}return wt(()=>fw("div",{class:["v-date-picker-controls"],style:{"--v-date-picker-controls-height":p(e.controlHeight)}},[fw(To,{class:"v-date-picker-controls__month-btn","data-testid":"month-btn",disabled:l.value,text:e.text,variant:"text",rounded:!0,onClick:c},null),fw(To,{class:"v-date-picker-controls__mode-btn","data-testid":"year-btn",disabled:n.value,density:"comfortable",icon:e.modeIcon,variant:"text",onClick:u},null),fw(pw,null,null),fw("div",{class:"v-date-picker-controls__month"},[fw(To,{"data-testid":"prev-month",disabled:o.value,density:"comfortable",icon:e.prevIcon,variant:"text",onClick:r},null),fw(To,{"data-testid":"next-month",disabled:i.value,icon:e.nextIcon,density:"comfortable",variant:"text",onClick:s},null)])])),{}}}),{createVNode:yw}=await e("vue"),bw=t({appendIcon:E,color:String,header:String,transition:String,onClick:O()},"VDatePickerHeader"),ww=o()({name:"VDatePickerHeader",props:bw(),emits:{click:()=>!0,"click:append":()=>!0},setup(e,t){let{emit:a,slots:l}=t;const{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color);function i(){a("click")}function r(){a("click:append")}return wt(()=>{const t=!(!l.default&&!e.header),a=!(!l.append&&!e.appendIcon);return yw("div",{class:["v-date-picker-header",{"v-date-picker-header--clickable":!!e.onClick},n.value],style:o.value,onClick:i},[l.prepend&&yw("div",{key:"prepend",class:"v-date-picker-header__prepend"},[l.prepend()]),t&&yw(Ba,{key:"content",name:e.transition},{default:()=>[yw("div",{key:e.header,class:"v-date-picker-header__content"},[l.default?.()??e.header])]}),a&&yw("div",{class:"v-date-picker-header__append"},[l.append?yw(ra,{key:"append-defaults",disabled:!e.appendIcon,defaults:{VBtn:{icon:e.appendIcon,variant:"text"}}},{default:()=>[l.append?.()]}):yw(To,{key:"append-btn",icon:e.appendIcon,variant:"text",onClick:r},null)])])}),{}}}),{computed:Sw}=await e("vue"),kw=t({allowedDates:[Array,Function],disabled:{type:Boolean,default:null},displayValue:null,modelValue:Array,month:[Number,String],max:null,min:null,showAdjacentMonths:Boolean,year:[Number,String],weekdays:{type:Array,default:()=>[0,1,2,3,4,5,6]},weeksInMonth:{type:String,default:"dynamic"},firstDayOfWeek:{type:[Number,String],default:void 0}},"calendar");const{createTextVNode:xw,createVNode:Vw}=await e("vue"),{computed:Cw,ref:_w,shallowRef:Iw,toRef:Bw,watch:Pw}=await e("vue"),Aw=t({color:String,hideWeekdays:Boolean,multiple:[Boolean,Number,String],showWeek:Boolean,transition:{type:String,default:"picker-transition"},reverseTransition:{type:String,default:"picker-reverse-transition"},...H(kw(),["displayValue"])},"VDatePickerMonth"),Nw=o()({name:"VDatePickerMonth",props:Aw(),emits:{"update:modelValue":e=>!0,"update:month":e=>!0,"update:year":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=_w(),{daysInMonth:o,model:i,weekNumbers:r}=function(e){const t=Ee(),a=V(e,"modelValue",[],e=>P(e).map(e=>t.date(e))),l=Sw(()=>e.displayValue?t.date(e.displayValue):a.value.length>0?t.date(a.value[0]):e.min?t.date(e.min):Array.isArray(e.allowedDates)?t.date(e.allowedDates[0]):t.date()),n=V(e,"year",void 0,e=>{const a=null!=e?Number(e):t.getYear(l.value);return t.startOfYear(t.setYear(t.date(),a))},e=>t.getYear(e)),o=V(e,"month",void 0,e=>{const a=null!=e?Number(e):t.getMonth(l.value),o=t.setYear(t.startOfMonth(t.date()),t.getYear(n.value));return t.setMonth(o,a)},e=>t.getMonth(e)),i=Sw(()=>{const a=t.toJsDate(t.startOfWeek(t.date(),e.firstDayOfWeek)).getDay();return[0,1,2,3,4,5,6].map(e=>(e+a)%7)}),r=Sw(()=>{const a=t.getWeekArray(o.value,e.firstDayOfWeek),l=a.flat();if("static"===e.weeksInMonth&&l.length<42){const e=l[l.length-1];let n=[];for(let o=1;o<=42-l.length;o++)n.push(t.addDays(e,o)),o%7==0&&(a.push(n),n=[])}return a});function s(l,n){return l.filter(e=>i.value.includes(t.toJsDate(e).getDay())).map((l,i)=>{const r=t.toISO(l),s=!t.isSameMonth(l,o.value),u=t.isSameDay(l,t.startOfMonth(o.value)),c=t.isSameDay(l,t.endOfMonth(o.value)),d=t.isSameDay(l,o.value);return{date:l,formatted:t.format(l,"keyboardDate"),isAdjacent:s,isDisabled:v(l),isEnd:c,isHidden:s&&!e.showAdjacentMonths,isSame:d,isSelected:a.value.some(e=>t.isSameDay(l,e)),isStart:u,isToday:t.isSameDay(l,n),isWeekEnd:i%7==6,isWeekStart:i%7==0,isoDate:r,localized:t.format(l,"dayOfMonth"),month:t.getMonth(l),year:t.getYear(l)}})}const u=Sw(()=>{const a=t.startOfWeek(l.value,e.firstDayOfWeek),n=[];for(let e=0;e<=6;e++)n.push(t.addDays(a,e));return s(n,t.date())}),c=Sw(()=>s(r.value.flat(),t.date())),d=Sw(()=>r.value.map(a=>a.length?t.getWeek(a[0],e.firstDayOfWeek):null));function v(a){if(e.disabled)return!0;const l=t.date(a);return!((!e.min||!t.isAfter(t.date(e.min),l))&&(!e.max||!t.isAfter(l,t.date(e.max)))&&(Array.isArray(e.allowedDates)&&e.allowedDates.length>0?e.allowedDates.some(e=>t.isSameDay(t.date(e),l)):"function"==typeof e.allowedDates?e.allowedDates(l):e.weekdays.includes(t.toJsDate(l).getDay())))}return{displayValue:l,daysInMonth:c,daysInWeek:u,genDays:s,model:a,weeksInMonth:r,weekDays:i,weekNumbers:d}}(e),s=Ee(),u=Iw(),c=Iw(),d=Iw(!1),v=Bw(()=>d.value?e.reverseTransition:e.transition);"range"===e.multiple&&i.value.length>0&&(u.value=i.value[0],i.value.length>1&&(c.value=i.value[i.value.length-1]));const p=Cw(()=>{const t=["number","string"].includes(typeof e.multiple)?Number(e.multiple):1/0;return i.value.length>=t});function f(t){"range"===e.multiple?function(e){const t=s.startOfDay(e);if(0===i.value.length?u.value=void 0:1===i.value.length&&(u.value=i.value[0],c.value=void 0),u.value)if(c.value)u.value=e,c.value=void 0,i.value=[u.value];else{if(s.isSameDay(t,u.value))return u.value=void 0,void(i.value=[]);s.isBefore(t,u.value)?(c.value=s.endOfDay(u.value),u.value=t):c.value=s.endOfDay(t);const e=s.getDiff(c.value,u.value,"days"),a=[u.value];for(let t=1;t<e;t++){const e=s.addDays(u.value,t);a.push(e)}a.push(c.value),i.value=a}else u.value=t,i.value=[u.value]}(t):e.multiple?function(e){const t=i.value.findIndex(t=>s.isSameDay(t,e));if(-1===t)i.value=[...i.value,e];else{const e=[...i.value];e.splice(t,1),i.value=e}}(t):i.value=[t]}Pw(o,(e,t)=>{t&&(d.value=s.isBefore(e[0].date,t[0].date))}),wt(()=>Vw("div",{class:"v-date-picker-month"},[e.showWeek&&Vw("div",{key:"weeks",class:"v-date-picker-month__weeks"},[!e.hideWeekdays&&Vw("div",{key:"hide-week-days",class:"v-date-picker-month__day"},[xw(" ")]),r.value.map(e=>Vw("div",{class:["v-date-picker-month__day","v-date-picker-month__day--adjacent"]},[e]))]),Vw(Ba,{name:v.value},{default:()=>[Vw("div",{ref:n,key:o.value[0].date?.toString(),class:"v-date-picker-month__days"},[!e.hideWeekdays&&s.getWeekdays(e.firstDayOfWeek).map(e=>Vw("div",{class:["v-date-picker-month__day","v-date-picker-month__weekday"]},[e])),o.value.map((t,a)=>{const n={props:{class:"v-date-picker-month__day-btn",color:t.isSelected||t.isToday?e.color:void 0,disabled:t.isDisabled,icon:!0,ripple:!1,text:t.localized,variant:t.isSelected?"flat":t.isToday?"outlined":"text",onClick:()=>f(t.date)},item:t,i:a};return p.value&&!t.isSelected&&(t.isDisabled=!0),Vw("div",{class:["v-date-picker-month__day",{"v-date-picker-month__day--adjacent":t.isAdjacent,"v-date-picker-month__day--hide-adjacent":t.isHidden,"v-date-picker-month__day--selected":t.isSelected,"v-date-picker-month__day--week-end":t.isWeekEnd,"v-date-picker-month__day--week-start":t.isWeekStart}],"data-v-date":t.isDisabled?void 0:t.isoDate},[(e.showAdjacentMonths||!t.isAdjacent)&&(l.day?.(n)??Vw(To,n.props,null))])})])]})]))}}),{mergeProps:Tw,createVNode:Ew}=await e("vue"),{computed:Dw,watchEffect:Rw}=await e("vue"),$w=t({color:String,height:[String,Number],min:null,max:null,modelValue:Number,year:Number},"VDatePickerMonths"),Lw=o()({name:"VDatePickerMonths",props:$w(),emits:{"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=Ee(),o=V(e,"modelValue"),i=Dw(()=>{let t=n.startOfYear(n.date());return e.year&&(t=n.setYear(t,e.year)),ke(12).map(a=>{const l=n.format(t,"monthShort"),o=!!(e.min&&n.isAfter(n.startOfMonth(n.date(e.min)),t)||e.max&&n.isAfter(t,n.startOfMonth(n.date(e.max))));return t=n.getNextMonth(t),{isDisabled:o,text:l,value:a}})});return Rw(()=>{o.value=o.value??n.getMonth(n.date())}),wt(()=>Ew("div",{class:"v-date-picker-months",style:{height:p(e.height)}},[Ew("div",{class:"v-date-picker-months__content"},[i.value.map((t,n)=>{const i={active:o.value===n,color:o.value===n?e.color:void 0,disabled:t.isDisabled,rounded:!0,text:t.text,variant:o.value===t.value?"flat":"text",onClick:()=>function(e){if(o.value===e)return void a("update:modelValue",o.value);o.value=e}(n)};return l.month?.({month:t,i:n,props:i})??Ew(To,Tw({key:"month"},i),null)})])])),{}}}),{mergeProps:Fw,createVNode:Mw}=await e("vue"),{computed:Ow,nextTick:zw,onMounted:jw,watchEffect:Hw}=await e("vue"),Ww=t({color:String,height:[String,Number],min:null,max:null,modelValue:Number},"VDatePickerYears"),Uw=o()({name:"VDatePickerYears",props:Ww(),emits:{"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=Ee(),o=V(e,"modelValue"),i=Ow(()=>{const t=n.getYear(n.date());let a=t-100,l=t+52;e.min&&(a=n.getYear(n.date(e.min))),e.max&&(l=n.getYear(n.date(e.max)));let o=n.startOfYear(n.date());return o=n.setYear(o,a),ke(l-a+1,a).map(e=>{const t=n.format(o,"year");return o=n.setYear(o,n.getYear(o)+1),{text:t,value:e}})});Hw(()=>{o.value=o.value??n.getYear(n.date())});const r=ne();return jw(async()=>{await zw(),r.el?.scrollIntoView({block:"center"})}),wt(()=>Mw("div",{class:"v-date-picker-years",style:{height:p(e.height)}},[Mw("div",{class:"v-date-picker-years__content"},[i.value.map((t,n)=>{const i={ref:o.value===t.value?r:void 0,active:o.value===t.value,color:o.value===t.value?e.color:void 0,rounded:!0,text:t.text,variant:o.value===t.value?"flat":"text",onClick:()=>{o.value!==t.value?o.value=t.value:a("update:modelValue",o.value)}};return l.year?.({year:t,i:n,props:i})??Mw(To,Fw({key:"month"},i),null)})])])),{}}}),{createVNode:Gw,mergeProps:Yw,Fragment:qw}=await e("vue"),{computed:Kw,ref:Xw,shallowRef:Jw,toRef:Qw,watch:Zw}=await e("vue"),eS=t({header:{type:String,default:"$vuetify.datePicker.header"},headerColor:String,...gw(),...Aw({weeksInMonth:"static"}),...H($w(),["modelValue"]),...H(Ww(),["modelValue"]),...ug({title:"$vuetify.datePicker.title"}),modelValue:null},"VDatePicker"),tS=o()({name:"VDatePicker",props:eS(),emits:{"update:modelValue":e=>!0,"update:month":e=>!0,"update:year":e=>!0,"update:viewMode":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const n=Ee(),{t:o}=M(),{rtlClasses:i}=u(),r=V(e,"modelValue",void 0,e=>P(e).map(e=>n.date(e)),t=>e.multiple?t:t[0]),s=V(e,"viewMode"),c=Kw(()=>{const t=n.date(e.min);return e.min&&n.isValid(t)?t:null}),d=Kw(()=>{const t=n.date(e.max);return e.max&&n.isValid(t)?t:null}),v=Kw(()=>{const e=n.date();let t=e;return r.value?.[0]?t=n.date(r.value[0]):c.value&&n.isBefore(e,c.value)?t=c.value:d.value&&n.isAfter(e,d.value)&&(t=d.value),t&&n.isValid(t)?t:e}),p=Qw(()=>e.headerColor??e.color),f=Xw(Number(e.month??n.getMonth(n.startOfMonth(v.value)))),m=Xw(Number(e.year??n.getYear(n.startOfYear(n.setMonth(v.value,f.value))))),g=Jw(!1),h=Kw(()=>e.multiple&&r.value.length>1?o("$vuetify.datePicker.itemsSelected",r.value.length):r.value[0]&&n.isValid(r.value[0])?n.format(n.date(r.value[0]),"normalDateWithWeekday"):o(e.header)),y=Kw(()=>{let e=n.date();return e=n.setDate(e,1),e=n.setMonth(e,f.value),e=n.setYear(e,m.value),n.format(e,"monthAndYear")}),b=Qw(()=>`date-picker-header${g.value?"-reverse":""}-transition`),w=Kw(()=>{if(e.disabled)return!0;const t=[];if("month"!==s.value)t.push("prev","next");else{let e=n.date();if(e=n.startOfMonth(e),e=n.setMonth(e,f.value),e=n.setYear(e,m.value),c.value){const a=n.addDays(n.startOfMonth(e),-1);n.isAfter(c.value,a)&&t.push("prev")}if(d.value){const a=n.addDays(n.endOfMonth(e),1);n.isAfter(a,d.value)&&t.push("next")}}return t});function S(){f.value<11?f.value++:(m.value++,f.value=0,B(m.value)),I(f.value)}function k(){f.value>0?f.value--:(m.value--,f.value=11,B(m.value)),I(f.value)}function x(){s.value="month"}function C(){s.value="months"===s.value?"month":"months"}function _(){s.value="year"===s.value?"month":"year"}function I(e){"months"===s.value&&C(),a("update:month",e)}function B(e){"year"===s.value&&_(),a("update:year",e)}return Zw(r,(e,t)=>{const a=P(t),l=P(e);if(!l.length)return;const o=n.date(a[a.length-1]),i=n.date(l[l.length-1]),r=n.getMonth(i),s=n.getYear(i);r!==f.value&&(f.value=r,I(f.value)),s!==m.value&&(m.value=s,B(m.value)),g.value=n.isBefore(o,i)}),wt(()=>{const t=cg.filterProps(e),a=hw.filterProps(e),n=ww.filterProps(e),u=Nw.filterProps(e),v=H(Lw.filterProps(e),["modelValue"]),g=H(Uw.filterProps(e),["modelValue"]),V={color:p.value,header:h.value,transition:b.value};return Gw(cg,Yw(t,{color:p.value,class:["v-date-picker",`v-date-picker--${s.value}`,{"v-date-picker--show-week":e.showWeek},i.value,e.class],style:e.style}),{title:()=>l.title?.()??Gw("div",{class:"v-date-picker__title"},[o(e.title)]),header:()=>l.header?Gw(ra,{defaults:{VDatePickerHeader:{...V}}},{default:()=>[l.header?.(V)]}):Gw(ww,Yw({key:"header"},n,V,{onClick:"month"!==s.value?x:void 0}),{...l,default:void 0}),default:()=>Gw(qw,null,[Gw(hw,Yw(a,{disabled:w.value,text:y.value,"onClick:next":S,"onClick:prev":k,"onClick:month":C,"onClick:year":_}),null),Gw(Yt,{hideOnLeave:!0},{default:()=>["months"===s.value?Gw(Lw,Yw({key:"date-picker-months"},v,{modelValue:f.value,"onUpdate:modelValue":[e=>f.value=e,I],min:c.value,max:d.value,year:m.value}),null):"year"===s.value?Gw(Uw,Yw({key:"date-picker-years"},g,{modelValue:m.value,"onUpdate:modelValue":[e=>m.value=e,B],min:c.value,max:d.value}),null):Gw(Nw,Yw({key:"date-picker-month"},u,{modelValue:r.value,"onUpdate:modelValue":e=>r.value=e,month:f.value,"onUpdate:month":[e=>f.value=e,I],year:m.value,"onUpdate:year":[e=>m.value=e,B],min:c.value,max:d.value}),null)]})]),actions:l.actions})}),{}}}),{Fragment:aS,createVNode:lS}=await e("vue"),nS=t({actionText:String,bgColor:String,color:String,icon:E,image:String,justify:{type:String,default:"center"},headline:String,title:String,text:String,textWidth:{type:[Number,String],default:500},href:String,to:String,...qe(),...ua(),...pn({size:void 0}),...c()},"VEmptyState"),oS=o()({name:"VEmptyState",props:nS(),emits:{"click:action":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{themeClasses:n}=r(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.bgColor),{dimensionStyles:s}=ca(e),{displayClasses:u}=G();function c(e){a("click:action",e)}return wt(()=>{const t=!(!l.actions&&!e.actionText),a=!(!l.headline&&!e.headline),r=!(!l.title&&!e.title),d=!(!l.text&&!e.text),v=!!(l.media||e.image||e.icon),f=e.size||(e.image?200:96);return lS("div",{class:["v-empty-state",{[`v-empty-state--${e.justify}`]:!0},n.value,o.value,u.value,e.class],style:[i.value,s.value,e.style]},[v&&lS("div",{key:"media",class:"v-empty-state__media"},[l.media?lS(ra,{key:"media-defaults",defaults:{VImg:{src:e.image,height:f},VIcon:{size:f,icon:e.icon}}},{default:()=>[l.media()]}):lS(aS,null,[e.image?lS(Ya,{key:"image",src:e.image,height:f},null):e.icon?lS(bn,{key:"icon",color:e.color,size:f,icon:e.icon},null):void 0])]),a&&lS("div",{key:"headline",class:"v-empty-state__headline"},[l.headline?.()??e.headline]),r&&lS("div",{key:"title",class:"v-empty-state__title"},[l.title?.()??e.title]),d&&lS("div",{key:"text",class:"v-empty-state__text",style:{maxWidth:p(e.textWidth)}},[l.text?.()??e.text]),l.default&&lS("div",{key:"content",class:"v-empty-state__content"},[l.default()]),t&&lS("div",{key:"actions",class:"v-empty-state__actions"},[lS(ra,{defaults:{VBtn:{class:"v-empty-state__action-btn",color:e.color??"surface-variant",href:e.href,text:e.actionText,to:e.to}}},{default:()=>[l.actions?.({props:{onClick:c}})??lS(To,{onClick:c},null)]})])])}),{}}}),iS=Symbol.for("vuetify:v-expansion-panel"),{createVNode:rS,vShow:sS,withDirectives:uS}=await e("vue"),{inject:cS}=await e("vue"),dS=t({...qe(),...pc()},"VExpansionPanelText"),vS=o()({name:"VExpansionPanelText",props:dS(),setup(e,t){let{slots:a}=t;const l=cS(iS);if(!l)throw new Error("[Vuetify] v-expansion-panel-text needs to be placed inside v-expansion-panel");const{hasContent:n,onAfterLeave:o}=fc(e,l.isSelected);return wt(()=>rS(la,{onAfterLeave:o},{default:()=>[uS(rS("div",{class:["v-expansion-panel-text",e.class],style:e.style},[a.default&&n.value&&rS("div",{class:"v-expansion-panel-text__wrapper"},[a.default?.()])]),[[sS,l.isSelected.value]])]})),{}}}),{createVNode:pS,resolveDirective:fS,withDirectives:mS}=await e("vue"),{computed:gS,inject:hS,toRef:yS}=await e("vue"),bS=t({color:String,expandIcon:{type:E,default:"$expand"},collapseIcon:{type:E,default:"$collapse"},hideActions:Boolean,focusable:Boolean,static:Boolean,ripple:{type:[Boolean,Object],default:!1},readonly:Boolean,...qe(),...ua()},"VExpansionPanelTitle"),wS=o()({name:"VExpansionPanelTitle",directives:{Ripple:Vo},props:bS(),setup(e,t){let{slots:a}=t;const l=hS(iS);if(!l)throw new Error("[Vuetify] v-expansion-panel-title needs to be placed inside v-expansion-panel");const{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{dimensionStyles:i}=ca(e),r=gS(()=>({collapseIcon:e.collapseIcon,disabled:l.disabled.value,expanded:l.isSelected.value,expandIcon:e.expandIcon,readonly:e.readonly})),s=yS(()=>l.isSelected.value?e.collapseIcon:e.expandIcon);return wt(()=>mS(pS("button",{class:["v-expansion-panel-title",{"v-expansion-panel-title--active":l.isSelected.value,"v-expansion-panel-title--focusable":e.focusable,"v-expansion-panel-title--static":e.static},n.value,e.class],style:[o.value,i.value,e.style],type:"button",tabindex:l.disabled.value?-1:void 0,disabled:l.disabled.value,"aria-expanded":l.isSelected.value,onClick:e.readonly?void 0:l.toggle},[pS("span",{class:"v-expansion-panel-title__overlay"},null),a.default?.(r.value),!e.hideActions&&pS(ra,{defaults:{VIcon:{icon:s.value}}},{default:()=>[pS("span",{class:"v-expansion-panel-title__icon"},[a.actions?.(r.value)??pS(bn,null,null)])]})]),[[fS("ripple"),e.ripple]])),{}}}),{createVNode:SS}=await e("vue"),{computed:kS,provide:xS,toRef:VS}=await e("vue"),CS=t({title:String,text:String,bgColor:String,...Za(),...an(),...Sa(),...Vt(),...bS(),...dS()},"VExpansionPanel"),_S=o()({name:"VExpansionPanel",props:CS(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=ln(e,iS),{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.bgColor),{elevationClasses:i}=el(e),{roundedClasses:r}=ka(e),s=VS(()=>l?.disabled.value||e.disabled),u=kS(()=>l.group.items.value.reduce((e,t,a)=>(l.group.selected.value.includes(t.id)&&e.push(a),e),[])),c=kS(()=>{const e=l.group.items.value.findIndex(e=>e.id===l.id);return!l.isSelected.value&&u.value.some(t=>t-e===1)}),d=kS(()=>{const e=l.group.items.value.findIndex(e=>e.id===l.id);return!l.isSelected.value&&u.value.some(t=>t-e===-1)});return xS(iS,l),wt(()=>{const t=!(!a.text&&!e.text),u=!(!a.title&&!e.title),v=wS.filterProps(e),p=vS.filterProps(e);return SS(e.tag,{class:["v-expansion-panel",{"v-expansion-panel--active":l.isSelected.value,"v-expansion-panel--before-active":c.value,"v-expansion-panel--after-active":d.value,"v-expansion-panel--disabled":s.value},r.value,n.value,e.class],style:[o.value,e.style]},{default:()=>[SS("div",{class:["v-expansion-panel__shadow",...i.value]},null),SS(ra,{defaults:{VExpansionPanelTitle:{...v},VExpansionPanelText:{...p}}},{default:()=>[u&&SS(wS,{key:"title"},{default:()=>[a.title?a.title():e.title]}),t&&SS(vS,{key:"text"},{default:()=>[a.text?a.text():e.text]}),a.default?.()]})]})}),{groupItem:l}}}),{createVNode:IS}=await e("vue"),{toRef:BS}=await e("vue"),PS=["default","accordion","inset","popout"],AS=t({flat:Boolean,...tn(),...U(CS(),["bgColor","collapseIcon","color","eager","elevation","expandIcon","focusable","hideActions","readonly","ripple","rounded","tile","static"]),...c(),...qe(),...Vt(),variant:{type:String,default:"default",validator:e=>PS.includes(e)}},"VExpansionPanels"),NS=o()({name:"VExpansionPanels",props:AS(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{next:l,prev:n}=nn(e,iS),{themeClasses:o}=r(e),i=BS(()=>e.variant&&`v-expansion-panels--variant-${e.variant}`);return v({VExpansionPanel:{bgColor:BS(()=>e.bgColor),collapseIcon:BS(()=>e.collapseIcon),color:BS(()=>e.color),eager:BS(()=>e.eager),elevation:BS(()=>e.elevation),expandIcon:BS(()=>e.expandIcon),focusable:BS(()=>e.focusable),hideActions:BS(()=>e.hideActions),readonly:BS(()=>e.readonly),ripple:BS(()=>e.ripple),rounded:BS(()=>e.rounded),static:BS(()=>e.static)}}),wt(()=>IS(e.tag,{class:["v-expansion-panels",{"v-expansion-panels--flat":e.flat,"v-expansion-panels--tile":e.tile},o.value,i.value,e.class],style:e.style},{default:()=>[a.default?.({prev:n,next:l})]})),{next:l,prev:n}}}),{vShow:TS,mergeProps:ES,createVNode:DS,withDirectives:RS}=await e("vue"),{computed:$S,ref:LS,shallowRef:FS,toRef:MS,watchEffect:OS}=await e("vue"),zS=t({app:Boolean,appear:Boolean,extended:Boolean,layout:Boolean,offset:Boolean,modelValue:{type:Boolean,default:!0},...H(No({active:!0}),["location"]),...I(),...En(),...Ia({transition:"fab-transition"})},"VFab"),jS=o()({name:"VFab",props:zS(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),n=FS(56),o=LS(),{resizeRef:i}=R(e=>{e.length&&(n.value=e[0].target.clientHeight)}),r=MS(()=>e.app||e.absolute),s=$S(()=>!!r.value&&(e.location?.split(" ").shift()??"bottom")),u=$S(()=>!!r.value&&(e.location?.split(" ")[1]??"end"));C(()=>e.app,()=>{const t=_({id:e.name,order:$S(()=>parseInt(e.order,10)),position:s,layoutSize:$S(()=>e.layout?n.value+24:0),elementSize:$S(()=>n.value+24),active:$S(()=>e.app&&l.value),absolute:MS(()=>e.absolute)});OS(()=>{o.value=t.layoutItemStyles.value})});const c=LS();return wt(()=>{const t=To.filterProps(e);return DS("div",{ref:c,class:["v-fab",{"v-fab--absolute":e.absolute,"v-fab--app":!!e.app,"v-fab--extended":e.extended,"v-fab--offset":e.offset,[`v-fab--${s.value}`]:r.value,[`v-fab--${u.value}`]:r.value},e.class],style:[e.app?{...o.value}:{height:e.absolute?"100%":"inherit"},e.style]},[DS("div",{class:"v-fab__container"},[DS(Ba,{appear:e.appear,transition:e.transition},{default:()=>[RS(DS(To,ES({ref:i},t,{active:void 0,location:void 0}),a),[[TS,e.active]])]})])])}),{}}}),{Fragment:HS,mergeProps:WS,createVNode:US}=await e("vue"),{computed:GS,nextTick:YS,ref:qS,shallowRef:KS,toRef:XS,watch:JS}=await e("vue"),QS=t({chips:Boolean,counter:Boolean,counterSizeString:{type:String,default:"$vuetify.fileInput.counterSize"},counterString:{type:String,default:"$vuetify.fileInput.counter"},hideInput:Boolean,multiple:Boolean,showSize:{type:[Boolean,Number,String],default:!1,validator:e=>"boolean"==typeof e||[1e3,1024].includes(Number(e))},...ur({prependIcon:"$file"}),modelValue:{type:[Array,Object],default:e=>e.multiple?[]:null,validator:e=>P(e).every(e=>null!=e&&"object"==typeof e)},...$d({clearable:!0})},"VFileInput"),ZS=o()({name:"VFileInput",inheritAttrs:!1,props:QS(),emits:{"click:control":e=>!0,"mousedown:control":e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{t:o}=M(),i=V(e,"modelValue",e.modelValue,e=>P(e),t=>!e.multiple&&Array.isArray(t)?t[0]:t),{isFocused:r,focus:s,blur:u}=Ri(e),c=GS(()=>"boolean"!=typeof e.showSize?e.showSize:void 0),d=GS(()=>(i.value??[]).reduce((e,t)=>{let{size:a=0}=t;return e+a},0)),v=GS(()=>De(d.value,c.value)),p=GS(()=>(i.value??[]).map(t=>{const{name:a="",size:l=0}=t;return e.showSize?`${a} (${De(l,c.value)})`:a})),f=GS(()=>{const t=i.value?.length??0;return e.showSize?o(e.counterSizeString,t,v.value):o(e.counterString,t)}),m=qS(),g=qS(),h=qS(),y=XS(()=>r.value||e.active),b=GS(()=>["plain","underlined"].includes(e.variant)),w=KS(!1);function S(){h.value!==document.activeElement&&h.value?.focus(),r.value||s()}function k(e){h.value?.click()}function x(e){l("mousedown:control",e)}function C(e){h.value?.click(),l("click:control",e)}function _(t){t.stopPropagation(),S(),YS(()=>{i.value=[],W(e["onClick:clear"],t)})}function I(e){e.preventDefault(),e.stopImmediatePropagation(),w.value=!0}function B(e){e.preventDefault(),w.value=!1}function A(e){if(e.preventDefault(),e.stopImmediatePropagation(),w.value=!1,!e.dataTransfer?.files?.length||!h.value)return;const t=new DataTransfer;for(const a of e.dataTransfer.files)t.items.add(a);h.value.files=t.files,h.value.dispatchEvent(new Event("change",{bubbles:!0}))}return JS(i,e=>{(!Array.isArray(e)||!e.length)&&h.value&&(h.value.value="")}),wt(()=>{const t=!(!n.counter&&!e.counter),l=!(!t&&!n.details),[o,s]=z(a),{modelValue:c,...V}=cr.filterProps(e),P=Ld.filterProps(e);return US(cr,WS({ref:m,modelValue:e.multiple?i.value:i.value[0],class:["v-file-input",{"v-file-input--chips":!!e.chips,"v-file-input--dragging":w.value,"v-file-input--hide":e.hideInput,"v-input--plain-underlined":b.value},e.class],style:e.style,"onClick:prepend":k},o,V,{centerAffix:!b.value,focused:r.value}),{...n,default:t=>{let{id:a,isDisabled:l,isDirty:o,isReadonly:c,isValid:f}=t;return US(Ld,WS({ref:g,"prepend-icon":e.prependIcon,onMousedown:x,onClick:C,"onClick:clear":_,"onClick:prependInner":e["onClick:prependInner"],"onClick:appendInner":e["onClick:appendInner"]},P,{id:a.value,active:y.value||o.value,dirty:o.value||e.dirty,disabled:l.value,focused:r.value,error:!1===f.value,onDragover:I,onDrop:A}),{...n,default:t=>{let{props:{class:a,...o}}=t;return US(HS,null,[US("input",WS({ref:h,type:"file",readonly:c.value,disabled:l.value,multiple:e.multiple,name:e.name,onClick:e=>{e.stopPropagation(),c.value&&e.preventDefault(),S()},onChange:e=>{if(!e.target)return;const t=e.target;i.value=[...t.files??[]]},onDragleave:B,onFocus:S,onBlur:u},o,s),null),US("div",{class:a},[!!i.value?.length&&!e.hideInput&&(n.selection?n.selection({fileNames:p.value,totalBytes:d.value,totalBytesReadable:v.value}):e.chips?p.value.map(e=>US(Hr,{key:e,size:"small",text:e},null)):p.value.join(", "))])])}})},details:l?a=>US(HS,null,[n.details?.(a),t&&US(HS,null,[US("span",null,null),US(Sd,{active:!!i.value?.length,value:f.value,disabled:e.disabled},n.counter)])]):void 0})}),Zc({},m,g,h)}}),{createVNode:ek}=await e("vue"),{computed:tk,ref:ak,shallowRef:lk,toRef:nk,watchEffect:ok}=await e("vue"),ik=t({app:Boolean,color:String,height:{type:[Number,String],default:"auto"},...Ka(),...qe(),...Za(),...I(),...Sa(),...Vt({tag:"footer"}),...c()},"VFooter"),rk=o()({name:"VFooter",props:ik(),setup(e,t){let{slots:a}=t;const l=ak(),{themeClasses:n}=r(e),{backgroundColorClasses:o,backgroundColorStyles:i}=ya(()=>e.color),{borderClasses:s}=Xa(e),{elevationClasses:u}=el(e),{roundedClasses:c}=ka(e),d=lk(32),{resizeRef:v}=R(e=>{e.length&&(d.value=e[0].target.clientHeight)}),f=tk(()=>"auto"===e.height?d.value:parseInt(e.height,10));return C(()=>e.app,()=>{const t=_({id:e.name,order:tk(()=>parseInt(e.order,10)),position:nk(()=>"bottom"),layoutSize:f,elementSize:tk(()=>"auto"===e.height?void 0:f.value),active:nk(()=>e.app),absolute:nk(()=>e.absolute)});ok(()=>{l.value=t.layoutItemStyles.value})}),wt(()=>ek(e.tag,{ref:v,class:["v-footer",n.value,o.value,s.value,u.value,c.value,e.class],style:[i.value,e.app?l.value:{height:p(e.height)},e.style]},a)),{}}}),{createVNode:sk}=await e("vue"),{ref:uk}=await e("vue"),ck=t({...qe(),...Ui()},"VForm"),dk=o()({name:"VForm",props:ck(),emits:{"update:modelValue":e=>!0,submit:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=function(e){const t=V(e,"modelValue"),a=ji(()=>e.disabled),l=ji(()=>e.readonly),n=zi(!1),o=Oi([]),i=Oi([]);return Hi(o,()=>{let e=0,a=0;const l=[];for(const t of o.value)!1===t.isValid?(a++,l.push({id:t.id,errorMessages:t.errorMessages})):!0===t.isValid&&e++;i.value=l,t.value=!(a>0)&&(e===o.value.length||null)},{deep:!0,flush:"post"}),Mi(Wi,{register:e=>{let{id:t,vm:a,validate:l,reset:n,resetValidation:i}=e;o.value.some(e=>e.id===t)&&x(`Duplicate input name "${t}"`),o.value.push({id:t,validate:l,reset:n,resetValidation:i,vm:Fi(a),isValid:null,errorMessages:[]})},unregister:e=>{o.value=o.value.filter(t=>t.id!==e)},update:(e,t,a)=>{const l=o.value.find(t=>t.id===e);l&&(l.isValid=t,l.errorMessages=a)},isDisabled:a,isReadonly:l,isValidating:n,isValid:t,items:o,validateOn:ji(()=>e.validateOn)}),{errors:i,isDisabled:a,isReadonly:l,isValidating:n,isValid:t,items:o,validate:async function(){const t=[];let a=!0;i.value=[],n.value=!0;for(const l of o.value){const n=await l.validate();if(n.length>0&&(a=!1,t.push({id:l.id,errorMessages:n})),!a&&e.fastFail)break}return i.value=t,n.value=!1,{valid:a,errors:i.value}},reset:function(){o.value.forEach(e=>e.reset())},resetValidation:function(){o.value.forEach(e=>e.resetValidation())}}}(e),o=uk();function i(e){e.preventDefault(),n.reset()}function r(e){const t=e,a=n.validate();t.then=a.then.bind(a),t.catch=a.catch.bind(a),t.finally=a.finally.bind(a),l("submit",t),t.defaultPrevented||a.then(e=>{let{valid:t}=e;t&&o.value?.submit()}),t.preventDefault()}return wt(()=>sk("form",{ref:o,class:["v-form",e.class],style:e.style,novalidate:!0,onReset:i,onSubmit:r},[a.default?.(n)])),Zc(n,o)}}),vk=t({disabled:Boolean,modelValue:{type:Boolean,default:null},...Yu()},"VHover"),pk=o()({name:"VHover",props:vk(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{runOpenDelay:n,runCloseDelay:o}=qu(e,t=>!e.disabled&&(l.value=t));return()=>a.default?.({isHovering:l.value,props:{onMouseenter:n,onMouseleave:o}})}}),{createTextVNode:fk,createVNode:mk}=await e("vue"),{computed:gk,nextTick:hk,onMounted:yk,ref:bk,shallowRef:wk,watch:Sk}=await e("vue"),kk=t({color:String,direction:{type:String,default:"vertical",validator:e=>["vertical","horizontal"].includes(e)},side:{type:String,default:"end",validator:e=>["start","end","both"].includes(e)},mode:{type:String,default:"intersect",validator:e=>["intersect","manual"].includes(e)},margin:[Number,String],loadMoreText:{type:String,default:"$vuetify.infiniteScroll.loadMore"},emptyText:{type:String,default:"$vuetify.infiniteScroll.empty"},...ua(),...Vt()},"VInfiniteScroll"),xk=J({name:"VInfiniteScrollIntersect",props:{side:{type:String,required:!0},rootMargin:String},emits:{intersect:(e,t)=>!0},setup(e,t){let{emit:a}=t;const{intersectionRef:l,isIntersecting:n}=Vn();return Sk(n,async t=>{a("intersect",e.side,t)}),wt(()=>mk("div",{class:"v-infinite-scroll-intersect",style:{"--v-infinite-margin-size":e.rootMargin},ref:l},[fk(" ")])),{}}}),Vk=o()({name:"VInfiniteScroll",props:kk(),emits:{load:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=bk(),o=wk("ok"),i=wk("ok"),r=gk(()=>p(e.margin)),s=wk(!1);function u(t){if(!n.value)return;const a="vertical"===e.direction?"scrollTop":"scrollLeft";n.value[a]=t}function c(){if(!n.value)return 0;const t="vertical"===e.direction?"scrollHeight":"scrollWidth";return n.value[t]}function d(e,t){"start"===e?o.value=t:"end"===e&&(i.value=t)}yk(()=>{n.value&&("start"===e.side?u(c()):"both"===e.side&&u(c()/2-function(){if(!n.value)return 0;const t="vertical"===e.direction?"clientHeight":"clientWidth";return n.value[t]}()/2))});let v=0;function f(e,t){s.value=t,s.value&&m(e)}function m(t){if("manual"!==e.mode&&!s.value)return;const a=function(e){return"start"===e?o.value:i.value}(t);n.value&&!["empty","loading"].includes(a)&&(v=c(),d(t,"loading"),l("load",{side:t,done:function(a){d(t,a),hk(()=>{"empty"!==a&&"error"!==a&&("ok"===a&&"start"===t&&u(c()-v+function(){if(!n.value)return 0;const t="vertical"===e.direction?"scrollTop":"scrollLeft";return n.value[t]}()),"manual"!==e.mode&&hk(()=>{window.requestAnimationFrame(()=>{window.requestAnimationFrame(()=>{window.requestAnimationFrame(()=>{m(t)})})})}))})}}))}const{t:g}=M();function h(t,l){if(e.side!==t&&"both"!==e.side)return;const n=()=>m(t),o={side:t,props:{onClick:n,color:e.color}};return"error"===l?a.error?.(o):"empty"===l?a.empty?.(o)??mk("div",null,[g(e.emptyText)]):"manual"===e.mode?"loading"===l?a.loading?.(o)??mk(An,{indeterminate:!0,color:e.color},null):a["load-more"]?.(o)??mk(To,{variant:"outlined",color:e.color,onClick:n},{default:()=>[g(e.loadMoreText)]}):a.loading?.(o)??mk(An,{indeterminate:!0,color:e.color},null)}const{dimensionStyles:y}=ca(e);wt(()=>{const t=e.tag,l="start"===e.side||"both"===e.side,s="end"===e.side||"both"===e.side,u="intersect"===e.mode;return mk(t,{ref:n,class:["v-infinite-scroll",`v-infinite-scroll--${e.direction}`,{"v-infinite-scroll--start":l,"v-infinite-scroll--end":s}],style:y.value},{default:()=>[mk("div",{class:"v-infinite-scroll__side"},[h("start",o.value)]),l&&u&&mk(xk,{key:"start",side:"start",onIntersect:f,rootMargin:r.value},null),a.default?.(),s&&u&&mk(xk,{key:"end",side:"end",onIntersect:f,rootMargin:r.value},null),mk("div",{class:"v-infinite-scroll__side"},[h("end",i.value)])]})})}}),{createVNode:Ck}=await e("vue"),_k=Symbol.for("vuetify:v-item-group"),Ik=t({...qe(),...tn({selectedClass:"v-item--selected"}),...Vt(),...c()},"VItemGroup"),Bk=o()({name:"VItemGroup",props:Ik(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{isSelected:n,select:o,next:i,prev:s,selected:u}=nn(e,_k);return()=>Ck(e.tag,{class:["v-item-group",l.value,e.class],style:e.style},{default:()=>[a.default?.({isSelected:n,select:o,next:i,prev:s,selected:u.value})]})}}),Pk=o()({name:"VItem",props:an(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const{isSelected:l,select:n,toggle:o,selectedClass:i,value:r,disabled:s}=ln(e,_k);return()=>a.default?.({isSelected:l.value,selectedClass:i.value,select:n,toggle:o,value:r.value,disabled:s.value})}}),Ak=vt("v-kbd","kbd"),{createVNode:Nk}=await e("vue"),Tk=t({...qe(),...ua(),...d()},"VLayout"),Ek=o()({name:"VLayout",props:Tk(),setup(e,t){let{slots:a}=t;const{layoutClasses:l,layoutStyles:n,getLayoutItem:o,items:i,layoutRef:r}=s(e),{dimensionStyles:u}=ca(e);return wt(()=>Nk("div",{ref:r,class:[l.value,e.class],style:[u.value,n.value,e.style]},[a.default?.()])),{getLayoutItem:o,items:i}}}),{createVNode:Dk}=await e("vue"),{computed:Rk,toRef:$k}=await e("vue"),Lk=t({position:{type:String,required:!0},size:{type:[Number,String],default:300},modelValue:Boolean,...qe(),...I()},"VLayoutItem"),Fk=o()({name:"VLayoutItem",props:Lk(),setup(e,t){let{slots:a}=t;const{layoutItemStyles:l}=_({id:e.name,order:Rk(()=>parseInt(e.order,10)),position:$k(()=>e.position),elementSize:$k(()=>e.size),layoutSize:$k(()=>e.size),active:$k(()=>e.modelValue),absolute:$k(()=>e.absolute)});return()=>Dk("div",{class:["v-layout-item",e.class],style:[l.value,e.style]},[a.default?.()])}}),{createVNode:Mk,resolveDirective:Ok,withDirectives:zk}=await e("vue"),jk=t({modelValue:Boolean,options:{type:Object,default:()=>({root:void 0,rootMargin:void 0,threshold:void 0})},...qe(),...ua(),...Vt(),...Ia({transition:"fade-transition"})},"VLazy"),Hk=o()({name:"VLazy",directives:{intersect:Aa},props:jk(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{dimensionStyles:l}=ca(e),n=V(e,"modelValue");function o(e){n.value||(n.value=e)}return wt(()=>zk(Mk(e.tag,{class:["v-lazy",e.class],style:[l.value,e.style]},{default:()=>[n.value&&Mk(Ba,{transition:e.transition,appear:!0},{default:()=>[a.default?.()]})]}),[[Ok("intersect"),{handler:o,options:e.options},null]])),{}}}),{createVNode:Wk}=await e("vue"),Uk=t({locale:String,fallbackLocale:String,messages:Object,rtl:{type:Boolean,default:void 0},...qe()},"VLocaleProvider"),Gk=o()({name:"VLocaleProvider",props:Uk(),setup(e,t){let{slots:a}=t;const{rtlClasses:l}=Re(e);return wt(()=>Wk("div",{class:["v-locale-provider",l.value,e.class],style:e.style},[a.default?.()])),{}}}),{createVNode:Yk}=await e("vue"),qk=t({scrollable:Boolean,...qe(),...ua(),...Vt({tag:"main"})},"VMain"),Kk=o()({name:"VMain",props:qk(),setup(e,t){let{slots:a}=t;const{dimensionStyles:l}=ca(e),{mainStyles:n}=$e(),{ssrBootStyles:o}=yl();return wt(()=>Yk(e.tag,{class:["v-main",{"v-main--scrollable":e.scrollable},e.class],style:[n.value,o.value,l.value,e.style]},{default:()=>[e.scrollable?Yk("div",{class:"v-main__scroller"},[a.default?.()]):a.default?.()]})),{}}}),{computed:Xk,onBeforeUnmount:Jk,onMounted:Qk,shallowRef:Zk,watch:ex}=await e("vue");function tx(e){return(e<0?-1:1)*Math.sqrt(Math.abs(e))*1.41421356237}function ax(e){if(e.length<2)return 0;if(2===e.length)return e[1].t===e[0].t?0:(e[1].d-e[0].d)/(e[1].t-e[0].t);let t=0;for(let a=e.length-1;a>0;a--){if(e[a].t===e[a-1].t)continue;const l=tx(t),n=(e[a].d-e[a-1].d)/(e[a].t-e[a-1].t);t+=(n-l)*Math.abs(n),a===e.length-1&&(t*=.5)}return 1e3*tx(t)}function lx(){const e={};return{addMovement:function(t){Array.from(t.changedTouches).forEach(a=>{(e[a.identifier]??(e[a.identifier]=new ae(20))).push([t.timeStamp,a])})},endTouch:function(t){Array.from(t.changedTouches).forEach(t=>{delete e[t.identifier]})},getVelocity:function(t){const a=e[t]?.values().reverse();if(!a)throw new Error(`No samples for touch id ${t}`);const l=a[0],n=[],o=[];for(const e of a){if(l[0]-e[0]>100)break;n.push({t:e[0],d:e[1].clientX}),o.push({t:e[0],d:e[1].clientY})}return{x:ax(n),y:ax(o),get direction(){const{x:e,y:t}=this,[a,l]=[Math.abs(e),Math.abs(t)];return a>l&&e>=0?"right":a>l&&e<=0?"left":l>a&&t>=0?"down":l>a&&t<=0?"up":function(){throw new Error}()}}}}}const{computed:nx,onBeforeUnmount:ox,onMounted:ix,onScopeDispose:rx,shallowRef:sx,watchEffect:ux}=await e("vue");function cx(){throw new Error}const{Fragment:dx,createVNode:vx,mergeProps:px}=await e("vue"),{computed:fx,nextTick:mx,readonly:gx,ref:hx,shallowRef:yx,toRef:bx,Transition:wx,watch:Sx}=await e("vue"),kx=["start","end","left","right","top","bottom"],xx=t({color:String,disableResizeWatcher:Boolean,disableRouteWatcher:Boolean,expandOnHover:Boolean,floating:Boolean,modelValue:{type:Boolean,default:null},permanent:Boolean,rail:{type:Boolean,default:null},railWidth:{type:[Number,String],default:56},scrim:{type:[Boolean,String],default:!0},image:String,temporary:Boolean,persistent:Boolean,touchless:Boolean,width:{type:[Number,String],default:256},location:{type:String,default:"start",validator:e=>kx.includes(e)},sticky:Boolean,...Ka(),...qe(),...Yu(),...q({mobile:null}),...Za(),...I(),...Sa(),...Vt({tag:"nav"}),...c()},"VNavigationDrawer"),Vx=o()({name:"VNavigationDrawer",props:xx(),emits:{"update:modelValue":e=>!0,"update:rail":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{isRtl:o}=u(),{themeClasses:i}=r(e),{borderClasses:s}=Xa(e),{backgroundColorClasses:c,backgroundColorStyles:d}=ya(()=>e.color),{elevationClasses:f}=el(e),{displayClasses:m,mobile:g}=G(e),{roundedClasses:h}=ka(e),y=to(),b=V(e,"modelValue",null,e=>!!e),{ssrBootStyles:w}=yl(),{scopeId:S}=mc(),k=hx(),x=yx(!1),{runOpenDelay:I,runCloseDelay:B}=qu(e,e=>{x.value=e}),P=fx(()=>e.rail&&e.expandOnHover&&x.value?Number(e.width):Number(e.rail?e.railWidth:e.width)),A=fx(()=>Qe(e.location,o.value)),N=bx(()=>e.persistent),T=fx(()=>!e.permanent&&(g.value||e.temporary)),E=fx(()=>e.sticky&&!T.value&&"bottom"!==A.value);C(()=>e.expandOnHover&&null!=e.rail,()=>{Sx(x,e=>l("update:rail",!e))}),C(()=>!e.disableResizeWatcher,()=>{Sx(T,t=>!e.permanent&&mx(()=>b.value=!t))}),C(()=>!e.disableRouteWatcher&&!!y,()=>{Sx(y.currentRoute,()=>T.value&&(b.value=!1))}),Sx(()=>e.permanent,e=>{e&&(b.value=!0)}),null!=e.modelValue||T.value||(b.value=e.permanent||!g.value);const{isDragging:D,dragProgress:R}=function(e){let{el:t,isActive:a,isTemporary:l,width:n,touchless:o,position:i}=e;ix(()=>{window.addEventListener("touchstart",y,{passive:!0}),window.addEventListener("touchmove",b,{passive:!1}),window.addEventListener("touchend",w,{passive:!0})}),ox(()=>{window.removeEventListener("touchstart",y),window.removeEventListener("touchmove",b),window.removeEventListener("touchend",w)});const r=nx(()=>["left","right"].includes(i.value)),{addMovement:s,endTouch:u,getVelocity:c}=lx();let d=!1;const v=sx(!1),p=sx(0),f=sx(0);let m;function g(e,t){return("left"===i.value?e:"right"===i.value?document.documentElement.clientWidth-e:"top"===i.value?e:"bottom"===i.value?document.documentElement.clientHeight-e:cx())-(t?n.value:0)}function h(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const a="left"===i.value?(e-f.value)/n.value:"right"===i.value?(document.documentElement.clientWidth-e-f.value)/n.value:"top"===i.value?(e-f.value)/n.value:"bottom"===i.value?(document.documentElement.clientHeight-e-f.value)/n.value:cx();return t?Math.max(0,Math.min(1,a)):a}function y(e){if(o.value)return;const t=e.changedTouches[0].clientX,c=e.changedTouches[0].clientY,v="left"===i.value?t<25:"right"===i.value?t>document.documentElement.clientWidth-25:"top"===i.value?c<25:"bottom"===i.value?c>document.documentElement.clientHeight-25:cx(),y=a.value&&("left"===i.value?t<n.value:"right"===i.value?t>document.documentElement.clientWidth-n.value:"top"===i.value?c<n.value:"bottom"===i.value?c>document.documentElement.clientHeight-n.value:cx());(v||y||a.value&&l.value)&&(m=[t,c],f.value=g(r.value?t:c,a.value),p.value=h(r.value?t:c),d=f.value>-20&&f.value<80,u(e),s(e))}function b(e){const t=e.changedTouches[0].clientX,a=e.changedTouches[0].clientY;if(d){if(!e.cancelable)return void(d=!1);const l=Math.abs(t-m[0]),n=Math.abs(a-m[1]);(r.value?l>n&&l>3:n>l&&n>3)?(v.value=!0,d=!1):(r.value?n:l)>3&&(d=!1)}if(!v.value)return;e.preventDefault(),s(e);const l=h(r.value?t:a,!1);p.value=Math.max(0,Math.min(1,l)),l>1?f.value=g(r.value?t:a,!0):l<0&&(f.value=g(r.value?t:a,!1))}function w(e){if(d=!1,!v.value)return;s(e),v.value=!1;const t=c(e.changedTouches[0].identifier),l=Math.abs(t.x),n=Math.abs(t.y),o=r.value?l>n&&l>400:n>l&&n>3;a.value=o?t.direction===({left:"right",right:"left",top:"down",bottom:"up"}[i.value]||cx()):p.value>.5}const S=nx(()=>v.value?{transform:"left"===i.value?`translateX(calc(-100% + ${p.value*n.value}px))`:"right"===i.value?`translateX(calc(100% - ${p.value*n.value}px))`:"top"===i.value?`translateY(calc(-100% + ${p.value*n.value}px))`:"bottom"===i.value?`translateY(calc(100% - ${p.value*n.value}px))`:cx(),transition:"none"}:void 0);return C(v,()=>{const e=t.value?.style.transform??null,a=t.value?.style.transition??null;ux(()=>{t.value?.style.setProperty("transform",S.value?.transform||"none"),t.value?.style.setProperty("transition",S.value?.transition||null)}),rx(()=>{t.value?.style.setProperty("transform",e),t.value?.style.setProperty("transition",a)})}),{isDragging:v,dragProgress:p,dragStyles:S}}({el:k,isActive:b,isTemporary:T,width:P,touchless:bx(()=>e.touchless),position:A}),$=fx(()=>{const t=T.value?0:e.rail&&e.expandOnHover?Number(e.railWidth):P.value;return D.value?t*R.value:t}),{layoutItemStyles:L,layoutItemScrimStyles:F}=_({id:e.name,order:fx(()=>parseInt(e.order,10)),position:A,layoutSize:$,elementSize:P,active:gx(b),disableTransitions:bx(()=>D.value),absolute:fx(()=>e.absolute||E.value&&"string"!=typeof M.value)}),{isStuck:M,stickyStyles:O}=function(e){let{rootEl:t,isSticky:a,layoutItemStyles:l}=e;const n=Zk(!1),o=Zk(0),i=Xk(()=>{const e="boolean"==typeof n.value?"top":n.value;return[a.value?{top:"auto",bottom:"auto",height:void 0}:void 0,n.value?{[e]:p(o.value)}:{top:l.value.top}]});Qk(()=>{ex(a,e=>{e?window.addEventListener("scroll",s,{passive:!0}):window.removeEventListener("scroll",s)},{immediate:!0})}),Jk(()=>{window.removeEventListener("scroll",s)});let r=0;function s(){const e=r>window.scrollY?"up":"down",a=t.value.getBoundingClientRect(),i=parseFloat(l.value.top??0),s=window.scrollY-Math.max(0,o.value-i),u=a.height+Math.max(o.value,i)-window.scrollY-window.innerHeight,c=parseFloat(getComputedStyle(t.value).getPropertyValue("--v-body-scroll-y"))||0;a.height<window.innerHeight-i?(n.value="top",o.value=i):"up"===e&&"bottom"===n.value||"down"===e&&"top"===n.value?(o.value=window.scrollY+a.top-c,n.value=!0):"down"===e&&u<=0?(o.value=0,n.value="bottom"):"up"===e&&s<=0&&(c?"top"!==n.value&&(o.value=-s+c+i,n.value="top"):(o.value=a.top+s,n.value="top")),r=window.scrollY}return{isStuck:n,stickyStyles:i}}({rootEl:k,isSticky:E,layoutItemStyles:L}),z=ya(()=>"string"==typeof e.scrim?e.scrim:null),j=fx(()=>({...D.value?{opacity:.2*R.value,transition:"none"}:void 0,...F.value}));return v({VList:{bgColor:"transparent"}}),wt(()=>{const t=n.image||e.image;return vx(dx,null,[vx(e.tag,px({ref:k,onMouseenter:I,onMouseleave:B,class:["v-navigation-drawer",`v-navigation-drawer--${A.value}`,{"v-navigation-drawer--expand-on-hover":e.expandOnHover,"v-navigation-drawer--floating":e.floating,"v-navigation-drawer--is-hovering":x.value,"v-navigation-drawer--rail":e.rail,"v-navigation-drawer--temporary":T.value,"v-navigation-drawer--persistent":N.value,"v-navigation-drawer--active":b.value,"v-navigation-drawer--sticky":E.value},i.value,c.value,s.value,m.value,f.value,h.value,e.class],style:[d.value,L.value,w.value,O.value,e.style]},S,a),{default:()=>[t&&vx("div",{key:"image",class:"v-navigation-drawer__img"},[n.image?vx(ra,{key:"image-defaults",disabled:!e.image,defaults:{VImg:{alt:"",cover:!0,height:"inherit",src:e.image}}},n.image):vx(Ya,{key:"image-img",alt:"",cover:!0,height:"inherit",src:e.image},null)]),n.prepend&&vx("div",{class:"v-navigation-drawer__prepend"},[n.prepend?.()]),vx("div",{class:"v-navigation-drawer__content"},[n.default?.()]),n.append&&vx("div",{class:"v-navigation-drawer__append"},[n.append?.()])]}),vx(wx,{name:"fade-transition"},{default:()=>[T.value&&(D.value||b.value)&&!!e.scrim&&vx("div",px({class:["v-navigation-drawer__scrim",z.backgroundColorClasses.value],style:[j.value,z.backgroundColorStyles.value],onClick:()=>{N.value||(b.value=!1)}},S),null)]})])}),{isStuck:M}}}),Cx=J({name:"VNoSsr",setup(e,t){let{slots:a}=t;const l=uc();return()=>l.value&&a.default?.()}}),{onScopeDispose:_x}=await e("vue");const{createVNode:Ix,Fragment:Bx,mergeProps:Px}=await e("vue"),{computed:Ax,nextTick:Nx,onMounted:Tx,ref:Ex,shallowRef:Dx,toRef:Rx,watch:$x,watchEffect:Lx}=await e("vue"),Fx=t({controlVariant:{type:String,default:"default"},inset:Boolean,hideInput:Boolean,modelValue:{type:Number,default:null},min:{type:Number,default:Number.MIN_SAFE_INTEGER},max:{type:Number,default:Number.MAX_SAFE_INTEGER},step:{type:Number,default:1},precision:{type:Number,default:0},...H(qd(),["modelValue","validationValue"])},"VNumberInput"),Mx=o()({name:"VNumberInput",props:{...Fx()},emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=Ex(),{holdStart:n,holdStop:o}=function(e){let{toggleUpDown:t}=e,a=-1,l=-1;function n(){window.clearTimeout(a),window.clearInterval(l)}function o(e){t("up"===e)}return _x(n),{holdStart:function(e){n(),o(e),a=window.setTimeout(()=>{l=window.setInterval(()=>o(e),50)},500)},holdStop:n}}({toggleUpDown:I}),i=Gi(e),r=Ax(()=>i.isDisabled.value||i.isReadonly.value),{isFocused:s,focus:u,blur:c}=Ri(e);function d(t){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:e.precision;const l=null==a?String(t):t.toFixed(a);return s.value?Number(l).toString():l}const v=V(e,"modelValue",null,e=>e??null,t=>null==t?t??null:k(Number(t),e.min,e.max)),p=Dx(null);Lx(()=>{s.value&&!r.value||(null==v.value?p.value=null:isNaN(v.value)||(p.value=d(v.value)))});const f=Ax({get:()=>p.value,set(t){null===t||""===t?(v.value=null,p.value=null):!isNaN(Number(t))&&Number(t)<=e.max&&Number(t)>=e.min&&(v.value=Number(t),p.value=t)}}),m=Ax(()=>!r.value&&(v.value??0)+e.step<=e.max),g=Ax(()=>!r.value&&(v.value??0)-e.step>=e.min),h=Ax(()=>e.hideInput?"stacked":e.controlVariant),y=Rx(()=>"split"===h.value?"$plus":"$collapse"),b=Rx(()=>"split"===h.value?"$minus":"$expand"),w=Rx(()=>"split"===h.value?"default":"small"),S=Rx(()=>"stacked"===h.value?"auto":"100%"),x={props:{onClick:A,onPointerup:N,onPointerdown:T}},C={props:{onClick:A,onPointerup:N,onPointerdown:E}};function _(e){if(null==e)return 0;const t=e.toString(),a=t.indexOf(".");return~a?t.length-a:0}function I(){let t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];if(r.value)return;if(null==v.value)return void(f.value=d(k(0,e.min,e.max)));let a=Math.max(_(v.value),_(e.step));null!=e.precision&&(a=Math.max(a,e.precision)),t?m.value&&(f.value=d(v.value+e.step,a)):g.value&&(f.value=d(v.value-e.step,a))}function B(t){if(!t.data)return;const a=t.target?.value,l=t.target?.selectionStart,n=t.target?.selectionEnd,o=a?a.slice(0,l)+t.data+a.slice(n):t.data;/^-?(\d+(\.\d*)?|(\.\d+)|\d*|\.)$/.test(o)||t.preventDefault(),null!=e.precision&&(o.split(".")[1]?.length>e.precision&&t.preventDefault(),0===e.precision&&o.includes(".")&&t.preventDefault())}async function P(e){["Enter","ArrowLeft","ArrowRight","Backspace","Delete","Tab"].includes(e.key)||e.ctrlKey||["ArrowDown","ArrowUp"].includes(e.key)&&(e.preventDefault(),D(),await Nx(),"ArrowDown"===e.key?I(!1):I())}function A(e){e.stopPropagation()}function N(e){const t=e.currentTarget;t?.releasePointerCapture(e.pointerId),e.preventDefault(),e.stopPropagation(),o()}function T(e){const t=e.currentTarget;t?.setPointerCapture(e.pointerId),e.preventDefault(),e.stopPropagation(),n("up")}function E(e){const t=e.currentTarget;t?.setPointerCapture(e.pointerId),e.preventDefault(),e.stopPropagation(),n("down")}function D(){if(r.value)return;if(!l.value)return;const t=l.value.value;t&&!isNaN(Number(t))?f.value=d(k(Number(t),e.min,e.max)):f.value=null}function R(){u(),r.value||(null===v.value||isNaN(v.value)?f.value=null:f.value=v.value.toString())}function $(){c(),D()}return $x(()=>e.precision,()=>function(){if(r.value)return;if(null===v.value||isNaN(v.value))return void(f.value=null);f.value=null==e.precision?String(v.value):v.value.toFixed(e.precision)}()),Tx(()=>{D()}),wt(()=>{const{modelValue:t,...n}=Kd.filterProps(e);function o(){return a.increment?Ix(ra,{key:"increment-defaults",defaults:{VBtn:{disabled:!m.value,flat:!0,height:S.value,size:w.value,icon:y.value}}},{default:()=>[a.increment(x)]}):Ix(To,{disabled:!m.value,flat:!0,key:"increment-btn",height:S.value,"data-testid":"increment","aria-hidden":"true",icon:y.value,onClick:A,onPointerup:N,onPointerdown:T,size:w.value,tabindex:"-1"},null)}function i(){return a.decrement?Ix(ra,{key:"decrement-defaults",defaults:{VBtn:{disabled:!g.value,flat:!0,height:S.value,size:w.value,icon:b.value}}},{default:()=>[a.decrement(C)]}):Ix(To,{disabled:!g.value,flat:!0,key:"decrement-btn",height:S.value,"data-testid":"decrement","aria-hidden":"true",icon:b.value,size:w.value,tabindex:"-1",onClick:A,onPointerup:N,onPointerdown:E},null)}function r(){return Ix("div",{class:"v-number-input__control"},[i(),Ix(Js,{vertical:"stacked"!==h.value},null),o()])}function s(){return e.hideInput||e.inset?void 0:Ix(Js,{vertical:!0},null)}const u="split"===h.value?Ix("div",{class:"v-number-input__control"},[Ix(Js,{vertical:!0},null),o()]):e.reverse||"hidden"===h.value?void 0:Ix(Bx,null,[s(),r()]),c=a["append-inner"]||u,d="split"===h.value?Ix("div",{class:"v-number-input__control"},[i(),Ix(Js,{vertical:!0},null)]):e.reverse&&"hidden"!==h.value?Ix(Bx,null,[r(),s()]):void 0,p=a["prepend-inner"]||d;return Ix(Kd,Px({ref:l,modelValue:f.value,"onUpdate:modelValue":e=>f.value=e,validationValue:v.value,onBeforeinput:B,onFocus:R,onBlur:$,onKeydown:P,class:["v-number-input",{"v-number-input--default":"default"===h.value,"v-number-input--hide-input":e.hideInput,"v-number-input--inset":e.inset,"v-number-input--reverse":e.reverse,"v-number-input--split":"split"===h.value,"v-number-input--stacked":"stacked"===h.value},e.class]},n,{style:e.style,inputmode:"decimal"}),{...a,"append-inner":c?function(){for(var e=arguments.length,t=new Array(e),l=0;l<e;l++)t[l]=arguments[l];return Ix(Bx,null,[a["append-inner"]?.(...t),u])}:void 0,"prepend-inner":p?function(){for(var e=arguments.length,t=new Array(e),l=0;l<e;l++)t[l]=arguments[l];return Ix(Bx,null,[d,a["prepend-inner"]?.(...t)])}:void 0})}),Zc({},l)}}),{Fragment:Ox,createVNode:zx,mergeProps:jx}=await e("vue"),{computed:Hx,nextTick:Wx,ref:Ux,toRef:Gx,watch:Yx}=await e("vue"),qx=t({autofocus:Boolean,divider:String,focusAll:Boolean,label:{type:String,default:"$vuetify.input.otp"},length:{type:[Number,String],default:6},modelValue:{type:[Number,String],default:void 0},placeholder:String,type:{type:String,default:"number"},...ua(),...Di(),...U($d({variant:"outlined"}),["baseColor","bgColor","class","color","disabled","error","loading","rounded","style","theme","variant"])},"VOtpInput"),Kx=o()({name:"VOtpInput",props:qx(),emits:{finish:e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const{dimensionStyles:o}=ca(e),{isFocused:i,focus:r,blur:s}=Ri(e),u=V(e,"modelValue","",e=>null==e?[]:String(e).split(""),e=>e.join("")),{t:c}=M(),d=Hx(()=>Number(e.length)),p=Hx(()=>Array(d.value).fill(0)),f=Ux(-1),m=Ux(),g=Ux([]),h=Hx(()=>g.value[f.value]);function y(){if(S(h.value.value))return void(h.value.value="");const e=u.value.slice(),t=h.value.value;e[f.value]=t;let a=null;f.value>u.value.length?a=u.value.length+1:f.value+1!==d.value&&(a="next"),u.value=e,a&&te(m.value,a)}function b(e){const t=u.value.slice(),a=f.value;let l=null;["ArrowLeft","ArrowRight","Backspace","Delete"].includes(e.key)&&(e.preventDefault(),"ArrowLeft"===e.key?l="prev":"ArrowRight"===e.key?l="next":["Backspace","Delete"].includes(e.key)&&(t[f.value]="",u.value=t,f.value>0&&"Backspace"===e.key?l="prev":requestAnimationFrame(()=>{g.value[a]?.select()})),requestAnimationFrame(()=>{null!=l&&te(m.value,l)}))}function w(){s(),f.value=-1}function S(t){return"number"===e.type&&/[^0-9]/g.test(t)}return v({VField:{color:Gx(()=>e.color),bgColor:Gx(()=>e.color),baseColor:Gx(()=>e.baseColor),disabled:Gx(()=>e.disabled),error:Gx(()=>e.error),variant:Gx(()=>e.variant)}},{scoped:!0}),Yx(u,e=>{e.length===d.value&&l("finish",e.join(""))},{deep:!0}),Yx(f,e=>{e<0||Wx(()=>{g.value[e]?.select()})}),wt(()=>{const[t,l]=z(a);return zx("div",jx({class:["v-otp-input",{"v-otp-input--divided":!!e.divider},e.class],style:[e.style]},t),[zx("div",{ref:m,class:"v-otp-input__content",style:[o.value]},[p.value.map((t,a)=>zx(Ox,null,[e.divider&&0!==a&&zx("span",{class:"v-otp-input__divider"},[e.divider]),zx(Ld,{focused:i.value&&e.focusAll||f.value===a,key:a},{...n,loader:void 0,default:()=>zx("input",{ref:e=>g.value[a]=e,"aria-label":c(e.label,a+1),autofocus:0===a&&e.autofocus,autocomplete:"one-time-code",class:["v-otp-input__field"],disabled:e.disabled,inputmode:"number"===e.type?"numeric":"text",min:"number"===e.type?0:void 0,maxlength:0===a?d.value:"1",placeholder:e.placeholder,type:"number"===e.type?"text":e.type,value:u.value[a],onInput:y,onFocus:e=>{return t=a,r(),void(f.value=t);var t},onBlur:w,onKeydown:b,onPaste:e=>function(e,t){t.preventDefault(),t.stopPropagation();const a=t?.clipboardData?.getData("Text").slice(0,d.value)??"";S(a)||(u.value=a.split(""),g.value?.[e].blur())}(a,e)},null)})])),zx("input",jx({class:"v-otp-input-input",type:"hidden"},l,{value:u.value.join("")}),null),zx(Xc,{contained:!0,"content-class":"v-otp-input__loader","model-value":!!e.loading,persistent:!0},{default:()=>[n.loader?.()??zx(An,{color:"boolean"==typeof e.loading?void 0:e.loading,indeterminate:!0,size:"24",width:"2"},null)]}),n.default?.()])])}),{blur:()=>{g.value?.some(e=>e.blur())},focus:()=>{g.value?.[0].focus()},reset:function(){u.value=[]},isFocused:i}}}),{createVNode:Xx}=await e("vue"),{computed:Jx,onBeforeUnmount:Qx,ref:Zx,watch:eV,watchEffect:tV}=await e("vue");const aV=t({scale:{type:[Number,String],default:.5},...qe()},"VParallax"),lV=o()({name:"VParallax",props:aV(),setup(e,t){let{slots:a}=t;const{intersectionRef:l,isIntersecting:n}=Vn(),{resizeRef:o,contentRect:i}=R(),{height:r}=G(),s=Zx();let u;tV(()=>{l.value=o.value=s.value?.$el}),eV(n,e=>{e?(u=gt(l.value),u=u===document.scrollingElement?document:u,u.addEventListener("scroll",v,{passive:!0}),v()):u.removeEventListener("scroll",v)}),Qx(()=>{u?.removeEventListener("scroll",v)}),eV(r,v),eV(()=>i.value?.height,v);const c=Jx(()=>1-k(Number(e.scale)));let d=-1;function v(){n.value&&(cancelAnimationFrame(d),d=requestAnimationFrame(()=>{const e=(s.value?.$el).querySelector(".v-img__img");if(!e)return;const t=u instanceof Document?document.documentElement.clientHeight:u.clientHeight,a=u instanceof Document?window.scrollY:u.scrollTop,n=l.value.getBoundingClientRect().top+a,o=i.value.height,r=(d=(a-(n+(o-t)/2))*c.value,Math.floor(Math.abs(d))*Math.sign(d));var d;const v=Math.max(1,(c.value*(t-o)+o)/o);e.style.setProperty("transform",`translateY(${r}px) scale(${v})`)}))}return wt(()=>Xx(Ya,{class:["v-parallax",{"v-parallax--active":n.value},e.class],style:e.style,ref:s,cover:!0,onLoadstart:v,onLoad:v},a)),{}}}),{mergeProps:nV,createVNode:oV}=await e("vue"),iV=t({...wi({falseIcon:"$radioOff",trueIcon:"$radioOn"})},"VRadio"),rV=o()({name:"VRadio",props:iV(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=Si.filterProps(e);return oV(Si,nV(t,{class:["v-radio",e.class],style:e.style,type:"radio"}),a)}),{}}}),{Fragment:sV,createVNode:uV,mergeProps:cV}=await e("vue"),{computed:dV,useId:vV}=await e("vue"),pV=t({height:{type:[Number,String],default:"auto"},...ur(),...H(oi(),["multiple"]),trueIcon:{type:E,default:"$radioOn"},falseIcon:{type:E,default:"$radioOff"},type:{type:String,default:"radio"}},"VRadioGroup"),fV=o()({name:"VRadioGroup",inheritAttrs:!1,props:pV(),emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=vV(),o=dV(()=>e.id||`radio-group-${n}`),i=V(e,"modelValue");return wt(()=>{const[t,n]=z(a),r=cr.filterProps(e),s=Si.filterProps(e),u=l.label?l.label({label:e.label,props:{for:o.value}}):e.label;return uV(cr,cV({class:["v-radio-group",e.class],style:e.style},t,r,{modelValue:i.value,"onUpdate:modelValue":e=>i.value=e,id:o.value}),{...l,default:t=>{let{id:a,messagesId:o,isDisabled:r,isReadonly:c}=t;return uV(sV,null,[u&&uV(Qo,{id:a.value},{default:()=>[u]}),uV(ri,cV(s,{id:a.value,"aria-describedby":o.value,defaultsTarget:"VRadio",trueIcon:e.trueIcon,falseIcon:e.falseIcon,type:e.type,disabled:r.value,readonly:c.value,"aria-labelledby":u?a.value:void 0,multiple:!1},n,{modelValue:i.value,"onUpdate:modelValue":e=>i.value=e}),l)])}})}),{}}}),{Fragment:mV,createVNode:gV,mergeProps:hV}=await e("vue"),{computed:yV,ref:bV}=await e("vue"),wV=t({...Di(),...ur(),...Im(),strict:Boolean,modelValue:{type:Array,default:()=>[0,0]}},"VRangeSlider"),SV=o()({name:"VRangeSlider",props:wV(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,end:e=>!0,start:e=>!0},setup(e,t){let{slots:a,emit:l}=t;const n=bV(),o=bV(),i=bV(),{rtlClasses:r}=u();const s=Bm(e),c=V(e,"modelValue",void 0,e=>e?.length?e.map(e=>s.roundValue(e)):[0,0]),{activeThumbRef:d,hasLabels:v,max:p,min:f,mousePressed:m,onSliderMousedown:g,onSliderTouchstart:h,position:y,trackContainerRef:b,readonly:w}=Pm({props:e,steps:s,onSliderStart:()=>{l("start",c.value)},onSliderEnd:t=>{let{value:a}=t;const o=d.value===n.value?.$el?[a,c.value[1]]:[c.value[0],a];!e.strict&&o[0]<o[1]&&(c.value=o),l("end",c.value)},onSliderMove:t=>{let{value:a}=t;const[l,i]=c.value;e.strict||l!==i||l===f.value||(d.value=a>l?o.value?.$el:n.value?.$el,d.value?.focus()),d.value===n.value?.$el?c.value=[Math.min(a,i),i]:c.value=[l,Math.max(l,a)]},getActiveThumb:function(t){if(!n.value||!o.value)return;const a=_m(t,n.value.$el,e.direction),l=_m(t,o.value.$el,e.direction),i=Math.abs(a),r=Math.abs(l);return i<r||i===r&&a<0?n.value.$el:o.value.$el}}),{isFocused:S,focus:k,blur:x}=Ri(e),C=yV(()=>y(c.value[0])),_=yV(()=>y(c.value[1]));return wt(()=>{const t=cr.filterProps(e),l=!!(e.label||a.label||a.prepend);return gV(cr,hV({class:["v-slider","v-range-slider",{"v-slider--has-labels":!!a["tick-label"]||v.value,"v-slider--focused":S.value,"v-slider--pressed":m.value,"v-slider--disabled":e.disabled},r.value,e.class],style:e.style,ref:i},t,{focused:S.value}),{...a,prepend:l?t=>gV(mV,null,[a.label?.(t)??(e.label?gV(Qo,{class:"v-slider__label",text:e.label},null):void 0),a.prepend?.(t)]):void 0,default:t=>{let{id:l,messagesId:i}=t;return gV("div",{class:"v-slider__container",onMousedown:w.value?void 0:g,onTouchstartPassive:w.value?void 0:h},[gV("input",{id:`${l.value}_start`,name:e.name||l.value,disabled:!!e.disabled,readonly:!!e.readonly,tabindex:"-1",value:c.value[0]},null),gV("input",{id:`${l.value}_stop`,name:e.name||l.value,disabled:!!e.disabled,readonly:!!e.readonly,tabindex:"-1",value:c.value[1]},null),gV(jm,{ref:b,start:C.value,stop:_.value},{"tick-label":a["tick-label"]}),gV(Lm,{ref:n,"aria-describedby":i.value,focused:S&&d.value===n.value?.$el,modelValue:c.value[0],"onUpdate:modelValue":e=>c.value=[e,c.value[1]],onFocus:e=>{k(),d.value=n.value?.$el,p.value!==f.value&&c.value[0]===c.value[1]&&c.value[1]===f.value&&e.relatedTarget!==o.value?.$el&&(n.value?.$el.blur(),o.value?.$el.focus())},onBlur:()=>{x(),d.value=void 0},min:f.value,max:c.value[1],position:C.value,ripple:e.ripple},{"thumb-label":a["thumb-label"]}),gV(Lm,{ref:o,"aria-describedby":i.value,focused:S&&d.value===o.value?.$el,modelValue:c.value[1],"onUpdate:modelValue":e=>c.value=[c.value[0],e],onFocus:e=>{k(),d.value=o.value?.$el,p.value!==f.value&&c.value[0]===c.value[1]&&c.value[0]===p.value&&e.relatedTarget!==n.value?.$el&&(o.value?.$el.blur(),n.value?.$el.focus())},onBlur:()=>{x(),d.value=void 0},min:c.value[0],max:p.value,position:_.value,ripple:e.ripple},{"thumb-label":a["thumb-label"]})])}})}),{}}}),{Fragment:kV,createVNode:xV,mergeProps:VV,createTextVNode:CV}=await e("vue"),{computed:_V,shallowRef:IV,useId:BV}=await e("vue"),PV=t({name:String,itemAriaLabel:{type:String,default:"$vuetify.rating.ariaLabel.item"},activeColor:String,color:String,clearable:Boolean,disabled:Boolean,emptyIcon:{type:E,default:"$ratingEmpty"},fullIcon:{type:E,default:"$ratingFull"},halfIncrements:Boolean,hover:Boolean,length:{type:[Number,String],default:5},readonly:Boolean,modelValue:{type:[Number,String],default:0},itemLabels:Array,itemLabelPosition:{type:String,default:"top",validator:e=>["top","bottom"].includes(e)},ripple:Boolean,...qe(),...Al(),...pn(),...Vt(),...c()},"VRating"),AV=o()({name:"VRating",props:PV(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{t:l}=M(),{themeClasses:n}=r(e),o=V(e,"modelValue"),i=_V(()=>k(parseFloat(o.value),0,Number(e.length))),s=_V(()=>ke(Number(e.length),1)),u=_V(()=>s.value.flatMap(t=>e.halfIncrements?[t-.5,t]:[t])),c=IV(-1),d=_V(()=>u.value.map(t=>{const a=e.hover&&c.value>-1,l=i.value>=t,n=c.value>=t,o=(a?n:l)?e.fullIcon:e.emptyIcon,r=e.activeColor??e.color;return{isFilled:l,isHovered:n,icon:o,color:l||n?r:e.color}})),v=_V(()=>[0,...u.value].map(t=>({onMouseenter:e.hover?function(){c.value=t}:void 0,onMouseleave:e.hover?function(){c.value=-1}:void 0,onClick:function(){e.disabled||e.readonly||(o.value=i.value===t&&e.clearable?0:t)}}))),p=BV(),f=_V(()=>e.name??`v-rating-${p}`);function m(t){let{value:n,index:o,showStar:r=!0}=t;const{onMouseenter:s,onMouseleave:u,onClick:c}=v.value[o+1],p=`${f.value}-${String(n).replace(".","-")}`,m={color:d.value[o]?.color,density:e.density,disabled:e.disabled,icon:d.value[o]?.icon,ripple:e.ripple,size:e.size,variant:"plain"};return xV(kV,null,[xV("label",{for:p,class:{"v-rating__item--half":e.halfIncrements&&n%1>0,"v-rating__item--full":e.halfIncrements&&n%1==0},onMouseenter:s,onMouseleave:u,onClick:c},[xV("span",{class:"v-rating__hidden"},[l(e.itemAriaLabel,n,e.length)]),r?a.item?a.item({...d.value[o],props:m,value:n,index:o,rating:i.value}):xV(To,VV({"aria-label":l(e.itemAriaLabel,n,e.length)},m),null):void 0]),xV("input",{class:"v-rating__hidden",name:f.value,id:p,type:"radio",value:n,checked:i.value===n,tabindex:-1,readonly:e.readonly,disabled:e.disabled},null)])}function g(e){return a["item-label"]?a["item-label"](e):e.label?xV("span",null,[e.label]):xV("span",null,[CV(" ")])}return wt(()=>{const t=!!e.itemLabels?.length||a["item-label"];return xV(e.tag,{class:["v-rating",{"v-rating--hover":e.hover,"v-rating--readonly":e.readonly},n.value,e.class],style:e.style},{default:()=>[xV(m,{value:0,index:-1,showStar:!1},null),s.value.map((a,l)=>xV("div",{class:"v-rating__wrapper"},[t&&"top"===e.itemLabelPosition?g({value:a,index:l,label:e.itemLabels?.[l]}):void 0,xV("div",{class:"v-rating__item"},[e.halfIncrements?xV(kV,null,[xV(m,{value:a-.5,index:2*l},null),xV(m,{value:a,index:2*l+1},null)]):xV(m,{value:a,index:l},null)]),t&&"bottom"===e.itemLabelPosition?g({value:a,index:l,label:e.itemLabels?.[l]}):void 0]))]})}),{}}}),{createVNode:NV,mergeProps:TV}=await e("vue"),{computed:EV}=await e("vue"),DV={actions:"button@2",article:"heading, paragraph",avatar:"avatar",button:"button",card:"image, heading","card-avatar":"image, list-item-avatar",chip:"chip","date-picker":"list-item, heading, divider, date-picker-options, date-picker-days, actions","date-picker-options":"text, avatar@2","date-picker-days":"avatar@28",divider:"divider",heading:"heading",image:"image","list-item":"text","list-item-avatar":"avatar, text","list-item-two-line":"sentences","list-item-avatar-two-line":"avatar, sentences","list-item-three-line":"paragraph","list-item-avatar-three-line":"avatar, paragraph",ossein:"ossein",paragraph:"text@3",sentences:"text@2",subtitle:"text",table:"table-heading, table-thead, table-tbody, table-tfoot","table-heading":"chip, text","table-thead":"heading@6","table-tbody":"table-row-divider@6","table-row-divider":"table-row, divider","table-row":"text@6","table-tfoot":"text@2, avatar@2",text:"text"};function RV(e){return NV("div",{class:["v-skeleton-loader__bone",`v-skeleton-loader__${e}`]},[arguments.length>1&&void 0!==arguments[1]?arguments[1]:[]])}function $V(e){const[t,a]=e.split("@");return Array.from({length:a}).map(()=>LV(t))}function LV(e){let t=[];if(!e)return t;const a=DV[e];if(e===a);else{if(e.includes(","))return FV(e);if(e.includes("@"))return $V(e);a.includes(",")?t=FV(a):a.includes("@")?t=$V(a):a&&t.push(LV(a))}return[RV(e,t)]}function FV(e){return e.replace(/\s/g,"").split(",").map(LV)}const MV=t({boilerplate:Boolean,color:String,loading:Boolean,loadingText:{type:String,default:"$vuetify.loading"},type:{type:[String,Array],default:"ossein"},...ua(),...Za(),...c()},"VSkeletonLoader"),OV=o()({name:"VSkeletonLoader",props:MV(),setup(e,t){let{slots:a}=t;const{backgroundColorClasses:l,backgroundColorStyles:n}=ya(()=>e.color),{dimensionStyles:o}=ca(e),{elevationClasses:i}=el(e),{themeClasses:s}=r(e),{t:u}=M(),c=EV(()=>LV(P(e.type).join(",")));return wt(()=>{const t=!a.default||e.loading,r=e.boilerplate||!t?{}:{ariaLive:"polite",ariaLabel:u(e.loadingText),role:"alert"};return NV("div",TV({class:["v-skeleton-loader",{"v-skeleton-loader--boilerplate":e.boilerplate},s.value,l.value,i.value],style:[n.value,t?o.value:{}]},r),[t?c.value:a.default?.()])}),{}}}),zV=o()({name:"VSlideGroupItem",props:an(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=ln(e,Vr);return()=>a.default?.({isSelected:l.isSelected.value,select:l.select,toggle:l.toggle,selectedClass:l.selectedClass.value})}}),{createVNode:jV,mergeProps:HV}=await e("vue"),{computed:WV,inject:UV,mergeProps:GV,nextTick:YV,onMounted:qV,onScopeDispose:KV,ref:XV,shallowRef:JV,watch:QV,watchEffect:ZV}=await e("vue");const eC=t({multiLine:Boolean,text:String,timer:[Boolean,String],timeout:{type:[Number,String],default:5e3},vertical:Boolean,...En({location:"bottom"}),...Yn(),...Sa(),...Fl(),...c(),...H(Kc({transition:"v-snackbar-transition"}),["persistent","noClickAnimation","scrim","scrollStrategy"])},"VSnackbar"),tC=o()({name:"VSnackbar",props:eC(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{positionClasses:n}=qn(e),{scopeId:o}=mc(),{themeClasses:i}=r(e),{colorClasses:s,colorStyles:u,variantClasses:c}=Ml(e),{roundedClasses:d}=ka(e),v=function(e){const t=JV(e());let a=-1;function l(){clearInterval(a)}return KV(l),{clear:l,time:t,start:function(n){const o=n?getComputedStyle(n):{transitionDuration:.2},i=1e3*parseFloat(o.transitionDuration)||200;if(l(),t.value<=0)return;const r=performance.now();a=window.setInterval(()=>{const a=performance.now()-r+i;t.value=Math.max(e()-a,0),t.value<=0&&l()},i)},reset:function(){l(),YV(()=>t.value=e())}}}(()=>Number(e.timeout)),p=XV(),f=XV(),m=JV(!1),g=JV(0),h=XV(),y=UV(Le,void 0);C(()=>!!y,()=>{const e=$e();ZV(()=>{h.value=e.mainStyles.value})}),QV(l,w),QV(()=>e.timeout,w),qV(()=>{l.value&&w()});let b=-1;function w(){v.reset(),window.clearTimeout(b);const t=Number(e.timeout);if(!l.value||-1===t)return;const a=Fe(f.value);v.start(a),b=window.setTimeout(()=>{l.value=!1},t)}function S(){m.value=!0,v.reset(),window.clearTimeout(b)}function k(){m.value=!1,w()}function x(e){g.value=e.touches[0].clientY}function _(e){Math.abs(g.value-e.changedTouches[0].clientY)>50&&(l.value=!1)}function I(){m.value&&k()}const B=WV(()=>e.location.split(" ").reduce((e,t)=>(e[`v-snackbar--${t}`]=!0,e),{}));return wt(()=>{const t=Xc.filterProps(e),r=!!(a.default||a.text||e.text);return jV(Xc,HV({ref:p,class:["v-snackbar",{"v-snackbar--active":l.value,"v-snackbar--multi-line":e.multiLine&&!e.vertical,"v-snackbar--timer":!!e.timer,"v-snackbar--vertical":e.vertical},B.value,n.value,e.class],style:[h.value,e.style]},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,contentProps:GV({class:["v-snackbar__wrapper",i.value,s.value,d.value,c.value],style:[u.value],onPointerenter:S,onPointerleave:k},t.contentProps),persistent:!0,noClickAnimation:!0,scrim:!1,scrollStrategy:"none",_disableGlobalStack:!0,onTouchstartPassive:x,onTouchend:_,onAfterLeave:I},o),{default:()=>[Ll(!1,"v-snackbar"),e.timer&&!m.value&&jV("div",{key:"timer",class:"v-snackbar__timer"},[jV(Mn,{ref:f,color:"string"==typeof e.timer?e.timer:"info",max:e.timeout,"model-value":v.time.value},null)]),r&&jV("div",{key:"content",class:"v-snackbar__content",role:"status","aria-live":"polite"},[a.text?.()??e.text,a.default?.()]),a.actions&&jV(ra,{defaults:{VBtn:{variant:"text",ripple:!1,slim:!0}}},{default:()=>[jV("div",{class:"v-snackbar__actions"},[a.actions({isActive:l})])]})],activator:a.activator})}),Zc({},p)}}),{Fragment:aC,createVNode:lC,mergeProps:nC}=await e("vue"),{computed:oC,nextTick:iC,shallowRef:rC,watch:sC}=await e("vue"),uC=t({closable:[Boolean,String],closeText:{type:String,default:"$vuetify.dismiss"},modelValue:{type:Array,default:()=>[]},...H(eC(),["modelValue"])},"VSnackbarQueue"),cC=o()({name:"VSnackbarQueue",props:uC(),emits:{"update:modelValue":e=>!0},setup(e,t){let{emit:a,slots:l}=t;const{t:n}=M(),o=rC(!1),i=rC(!1),r=rC();function s(){e.modelValue.length?u():(r.value=void 0,i.value=!1)}function u(){const[t,...l]=e.modelValue;a("update:modelValue",l),r.value="string"==typeof t?{text:t}:t,iC(()=>{o.value=!0})}function c(){o.value=!1}sC(()=>e.modelValue.length,(e,t)=>{!i.value&&e>t&&u()}),sC(o,e=>{e&&(i.value=!0)});const d=oC(()=>({color:"string"==typeof e.closable?e.closable:void 0,text:n(e.closeText)}));wt(()=>{const t=!(!e.closable&&!l.actions),{modelValue:a,...n}=tC.filterProps(e);return lC(aC,null,[i.value&&!!r.value&&(l.default?lC(ra,{defaults:{VSnackbar:r.value}},{default:()=>[l.default({item:r.value})]}):lC(tC,nC(n,r.value,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,onAfterLeave:s}),{text:l.text?()=>l.text?.({item:r.value}):void 0,actions:t?()=>lC(aC,null,[l.actions?lC(ra,{defaults:{VBtn:d.value}},{default:()=>[l.actions({item:r.value,props:{onClick:c}})]}):lC(To,nC(d.value,{onClick:c}),null)]):void 0}))])})}}),dC=t({autoDraw:Boolean,autoDrawDuration:[Number,String],autoDrawEasing:{type:String,default:"ease"},color:String,gradient:{type:Array,default:()=>[]},gradientDirection:{type:String,validator:e=>["top","bottom","left","right"].includes(e),default:"top"},height:{type:[String,Number],default:75},labels:{type:Array,default:()=>[]},labelSize:{type:[Number,String],default:7},lineWidth:{type:[String,Number],default:4},id:String,itemValue:{type:String,default:"value"},modelValue:{type:Array,default:()=>[]},min:[String,Number],max:[String,Number],padding:{type:[String,Number],default:8},showLabels:Boolean,smooth:[Boolean,String,Number],width:{type:[Number,String],default:300}},"Line"),{computed:vC,useId:pC,createVNode:fC,Fragment:mC}=await e("vue"),gC=t({autoLineWidth:Boolean,...dC()},"VBarline"),hC=o()({name:"VBarline",props:gC(),setup(e,t){let{slots:a}=t;const l=pC(),n=vC(()=>e.id||`barline-${l}`),o=vC(()=>Number(e.autoDrawDuration)||500),i=vC(()=>Boolean(e.showLabels||e.labels.length>0||!!a?.label)),r=vC(()=>parseFloat(e.lineWidth)||4),s=vC(()=>Math.max(e.modelValue.length*r.value,Number(e.width))),u=vC(()=>({minX:0,maxX:s.value,minY:0,maxY:parseInt(e.height,10)})),c=vC(()=>e.modelValue.map(t=>ee(t,e.itemValue,t)));function d(t,a){const{minX:l,maxX:n,minY:o,maxY:i}=a,r=t.length;let s=null!=e.max?Number(e.max):Math.max(...t),u=null!=e.min?Number(e.min):Math.min(...t);u>0&&null==e.min&&(u=0),s<0&&null==e.max&&(s=0);const c=n/r,d=(i-o)/(s-u||1),v=i-Math.abs(u*d);return t.map((e,t)=>{const a=Math.abs(d*e);return{x:l+t*c,y:v-a+Number(e<0)*a,height:a,value:e}})}const v=vC(()=>{const t=[],a=d(c.value,u.value),l=a.length;for(let n=0;t.length<l;n++){const l=a[n];let o=e.labels[n];o||(o="object"==typeof l?l.value:l),t.push({x:l.x,value:String(o)})}return t}),p=vC(()=>d(c.value,u.value)),f=vC(()=>(Math.abs(p.value[0].x-p.value[1].x)-r.value)/2),m=vC(()=>"boolean"==typeof e.smooth?e.smooth?2:0:Number(e.smooth));wt(()=>{const t=e.gradient.slice().length?e.gradient.slice().reverse():[""];return fC("svg",{display:"block"},[fC("defs",null,[fC("linearGradient",{id:n.value,gradientUnits:"userSpaceOnUse",x1:"left"===e.gradientDirection?"100%":"0",y1:"top"===e.gradientDirection?"100%":"0",x2:"right"===e.gradientDirection?"100%":"0",y2:"bottom"===e.gradientDirection?"100%":"0"},[t.map((e,a)=>fC("stop",{offset:a/Math.max(t.length-1,1),"stop-color":e||"currentColor"},null))])]),fC("clipPath",{id:`${n.value}-clip`},[p.value.map(t=>fC("rect",{x:t.x+f.value,y:t.y,width:r.value,height:t.height,rx:m.value,ry:m.value},[e.autoDraw&&fC(mC,null,[fC("animate",{attributeName:"y",from:t.y+t.height,to:t.y,dur:`${o.value}ms`,fill:"freeze"},null),fC("animate",{attributeName:"height",from:"0",to:t.height,dur:`${o.value}ms`,fill:"freeze"},null)])]))]),i.value&&fC("g",{key:"labels",style:{textAnchor:"middle",dominantBaseline:"mathematical",fill:"currentColor"}},[v.value.map((t,l)=>fC("text",{x:t.x+f.value+r.value/2,y:parseInt(e.height,10)-2+(parseInt(e.labelSize,10)||5.25),"font-size":Number(e.labelSize)||7},[a.label?.({index:l,value:t.value})??t.value]))]),fC("g",{"clip-path":`url(#${n.value}-clip)`,fill:`url(#${n.value})`},[fC("rect",{x:0,y:0,width:Math.max(e.modelValue.length*r.value,Number(e.width)),height:e.height},null)])])})}});function yC(e,t){let a=arguments.length>2&&void 0!==arguments[2]&&arguments[2],l=arguments.length>3&&void 0!==arguments[3]?arguments[3]:75;if(0===e.length)return"";const n=e.shift(),o=e[e.length-1];return(a?`M${n.x} ${l-n.x+2} L${n.x} ${n.y}`:`M${n.x} ${n.y}`)+e.map((a,l)=>{const o=e[l+1],i=e[l-1]||n,r=o&&(u=a,c=i,bC((s=o).x+c.x)===bC(2*u.x)&&bC(s.y+c.y)===bC(2*u.y));var s,u,c;if(!o||r)return`L${a.x} ${a.y}`;const d=Math.min(wC(i,a),wC(o,a)),v=d/2<t?d/2:t,p=SC(i,a,v),f=SC(o,a,v);return`L${p.x} ${p.y}S${a.x} ${a.y} ${f.x} ${f.y}`}).join("")+(a?`L${o.x} ${l-n.x+2} Z`:"")}function bC(e){return parseInt(e,10)}function wC(e,t){return Math.sqrt(Math.pow(t.x-e.x,2)+Math.pow(t.y-e.y,2))}function SC(e,t,a){const l=e.x-t.x,n=e.y-t.y,o=Math.sqrt(l*l+n*n),i=l/o,r=n/o;return{x:t.x+i*a,y:t.y+r*a}}const{computed:kC,nextTick:xC,ref:VC,useId:CC,watch:_C,createVNode:IC}=await e("vue"),BC=t({fill:Boolean,...dC()},"VTrendline"),PC=o()({name:"VTrendline",props:BC(),setup(e,t){let{slots:a}=t;const l=CC(),n=kC(()=>e.id||`trendline-${l}`),o=kC(()=>Number(e.autoDrawDuration)||(e.fill?500:2e3)),i=VC(0),r=VC(null);function s(t,a){const{minX:l,maxX:n,minY:o,maxY:i}=a,r=t.length,s=null!=e.max?Number(e.max):Math.max(...t),u=null!=e.min?Number(e.min):Math.min(...t),c=(n-l)/(r-1),d=(i-o)/(s-u||1);return t.map((e,t)=>({x:l+t*c,y:i-(e-u)*d,value:e}))}const u=kC(()=>Boolean(e.showLabels||e.labels.length>0||!!a?.label)),c=kC(()=>parseFloat(e.lineWidth)||4),d=kC(()=>Number(e.width)),v=kC(()=>{const t=Number(e.padding);return{minX:t,maxX:d.value-t,minY:t,maxY:parseInt(e.height,10)-t}}),p=kC(()=>e.modelValue.map(t=>ee(t,e.itemValue,t))),f=kC(()=>{const t=[],a=s(p.value,v.value),l=a.length;for(let n=0;t.length<l;n++){const l=a[n];let o=e.labels[n];o||(o="object"==typeof l?l.value:l),t.push({x:l.x,value:String(o)})}return t});function m(t){const a="boolean"==typeof e.smooth?e.smooth?8:0:Number(e.smooth);return yC(s(p.value,v.value),a,t,parseInt(e.height,10))}_C(()=>e.modelValue,async()=>{if(await xC(),!e.autoDraw||!r.value)return;const t=r.value,a=t.getTotalLength();e.fill?(t.style.transformOrigin="bottom center",t.style.transition="none",t.style.transform="scaleY(0)",t.getBoundingClientRect(),t.style.transition=`transform ${o.value}ms ${e.autoDrawEasing}`,t.style.transform="scaleY(1)"):(t.style.strokeDasharray=`${a}`,t.style.strokeDashoffset=`${a}`,t.getBoundingClientRect(),t.style.transition=`stroke-dashoffset ${o.value}ms ${e.autoDrawEasing}`,t.style.strokeDashoffset="0"),i.value=a},{immediate:!0}),wt(()=>{const t=e.gradient.slice().length?e.gradient.slice().reverse():[""];return IC("svg",{display:"block","stroke-width":parseFloat(e.lineWidth)??4},[IC("defs",null,[IC("linearGradient",{id:n.value,gradientUnits:"userSpaceOnUse",x1:"left"===e.gradientDirection?"100%":"0",y1:"top"===e.gradientDirection?"100%":"0",x2:"right"===e.gradientDirection?"100%":"0",y2:"bottom"===e.gradientDirection?"100%":"0"},[t.map((e,a)=>IC("stop",{offset:a/Math.max(t.length-1,1),"stop-color":e||"currentColor"},null))])]),u.value&&IC("g",{key:"labels",style:{textAnchor:"middle",dominantBaseline:"mathematical",fill:"currentColor"}},[f.value.map((t,l)=>IC("text",{x:t.x+c.value/2+c.value/2,y:parseInt(e.height,10)-4+(parseInt(e.labelSize,10)||5.25),"font-size":Number(e.labelSize)||7},[a.label?.({index:l,value:t.value})??t.value]))]),IC("path",{ref:r,d:m(e.fill),fill:e.fill?`url(#${n.value})`:"none",stroke:e.fill?"none":`url(#${n.value})`},null),e.fill&&IC("path",{d:m(!1),fill:"none",stroke:e.color??e.gradient?.[0]},null)])})}}),{mergeProps:AC,createVNode:NC}=await e("vue"),{computed:TC}=await e("vue"),EC=t({type:{type:String,default:"trend"},...gC(),...BC()},"VSparkline"),DC=o()({name:"VSparkline",props:EC(),setup(e,t){let{slots:a}=t;const{textColorClasses:l,textColorStyles:n}=ha(()=>e.color),o=TC(()=>Boolean(e.showLabels||e.labels.length>0||!!a?.label)),i=TC(()=>{let t=parseInt(e.height,10);return o.value&&(t+=1.5*parseInt(e.labelSize,10)),t});wt(()=>{const t="trend"===e.type?PC:hC,o="trend"===e.type?PC.filterProps(e):hC.filterProps(e);return NC(t,AC({key:e.type,class:l.value,style:n.value,viewBox:`0 0 ${e.width} ${parseInt(i.value,10)}`},o),a)})}}),{createVNode:RC,mergeProps:$C}=await e("vue"),{computed:LC,ref:FC}=await e("vue"),MC=t({...qe(),...fd({offset:8,minWidth:0,openDelay:0,closeDelay:100,location:"top center",transition:"scale-transition"})},"VSpeedDial"),OC=o()({name:"VSpeedDial",props:MC(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),n=FC(),o=LC(()=>{const[t,a="center"]=e.location?.split(" ")??[];return`${t} ${a}`}),i=LC(()=>({[`v-speed-dial__content--${o.value.replace(" ","-")}`]:!0}));return wt(()=>{const t=md.filterProps(e);return RC(md,$C(t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,class:e.class,style:e.style,contentClass:["v-speed-dial__content",i.value,e.contentClass],location:o.value,ref:n,transition:"fade-transition"}),{...a,default:t=>RC(ra,{defaults:{VBtn:{size:"small"}}},{default:()=>[RC(Ba,{appear:!0,group:!0,transition:e.transition},{default:()=>[a.default?.(t)]})]})})}),{}}}),zC=Symbol.for("vuetify:v-stepper"),{createVNode:jC}=await e("vue"),HC=t({color:String,disabled:{type:[Boolean,String],default:!1},prevText:{type:String,default:"$vuetify.stepper.prev"},nextText:{type:String,default:"$vuetify.stepper.next"}},"VStepperActions"),WC=o()({name:"VStepperActions",props:HC(),emits:{"click:prev":()=>!0,"click:next":()=>!0},setup(e,t){let{emit:a,slots:l}=t;const{t:n}=M();function o(){a("click:prev")}function i(){a("click:next")}return wt(()=>{const t={onClick:o},a={onClick:i};return jC("div",{class:"v-stepper-actions"},[jC(ra,{defaults:{VBtn:{disabled:["prev",!0].includes(e.disabled),text:n(e.prevText),variant:"text"}}},{default:()=>[l.prev?.({props:t})??jC(To,t,null)]}),jC(ra,{defaults:{VBtn:{color:e.color,disabled:["next",!0].includes(e.disabled),text:n(e.nextText),variant:"tonal"}}},{default:()=>[l.next?.({props:a})??jC(To,a,null)]})])}),{}}}),UC=vt("v-stepper-header"),{createVNode:GC,resolveDirective:YC,withDirectives:qC}=await e("vue"),{computed:KC}=await e("vue"),XC=t({color:String,title:String,subtitle:String,complete:Boolean,completeIcon:{type:E,default:"$complete"},editable:Boolean,editIcon:{type:E,default:"$edit"},error:Boolean,errorIcon:{type:E,default:"$error"},icon:E,ripple:{type:[Boolean,Object],default:!0},rules:{type:Array,default:()=>[]}},"StepperItem"),JC=t({...XC(),...an()},"VStepperItem"),QC=o()({name:"VStepperItem",directives:{Ripple:Vo},props:JC(),emits:{"group:selected":e=>!0},setup(e,t){let{slots:a}=t;const l=ln(e,zC,!0),n=KC(()=>l?.value.value??e.value),o=KC(()=>e.rules.every(e=>!0===e())),i=KC(()=>!e.disabled&&e.editable),r=KC(()=>!e.disabled&&e.editable),s=KC(()=>e.error||!o.value),u=KC(()=>e.complete||e.rules.length>0&&o.value),c=KC(()=>s.value?e.errorIcon:u.value?e.completeIcon:l.isSelected.value&&e.editable?e.editIcon:e.icon),d=KC(()=>({canEdit:r.value,hasError:s.value,hasCompleted:u.value,title:e.title,subtitle:e.subtitle,step:n.value,value:e.value}));return wt(()=>{const t=(!l||l.isSelected.value||u.value||r.value)&&!s.value&&!e.disabled,o=!(null==e.title&&!a.title),v=!(null==e.subtitle&&!a.subtitle);return qC(GC("button",{class:["v-stepper-item",{"v-stepper-item--complete":u.value,"v-stepper-item--disabled":e.disabled,"v-stepper-item--error":s.value},l?.selectedClass.value],disabled:!e.editable,type:"button",onClick:function(){l?.toggle()}},[i.value&&Ll(!0,"v-stepper-item"),GC(Ko,{key:"stepper-avatar",class:"v-stepper-item__avatar",color:t?e.color:void 0,size:24},{default:()=>[a.icon?.(d.value)??(c.value?GC(bn,{icon:c.value},null):n.value)]}),GC("div",{class:"v-stepper-item__content"},[o&&GC("div",{key:"title",class:"v-stepper-item__title"},[a.title?.(d.value)??e.title]),v&&GC("div",{key:"subtitle",class:"v-stepper-item__subtitle"},[a.subtitle?.(d.value)??e.subtitle]),a.default?.(d.value)])]),[[YC("ripple"),e.ripple&&e.editable,null]])}),{}}}),{mergeProps:ZC,createVNode:e_}=await e("vue"),{computed:t_,inject:a_}=await e("vue"),l_=t({...H(Nf(),["continuous","nextIcon","prevIcon","showArrows","touch","mandatory"])},"VStepperWindow"),n_=o()({name:"VStepperWindow",props:l_(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=a_(zC,null),n=V(e,"modelValue"),o=t_({get:()=>null==n.value&&l?l.items.value.find(e=>l.selected.value.includes(e.id))?.value:n.value,set(e){n.value=e}});return wt(()=>{const t=Tf.filterProps(e);return e_(Tf,ZC({_as:"VStepperWindow"},t,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-stepper-window",e.class],style:e.style,mandatory:!1,touch:!1}),a)}),{}}}),{mergeProps:o_,createVNode:i_}=await e("vue"),r_=t({...qf()},"VStepperWindowItem"),s_=o()({name:"VStepperWindowItem",props:r_(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=Kf.filterProps(e);return i_(Kf,o_({_as:"VStepperWindowItem"},t,{class:["v-stepper-window-item",e.class],style:e.style}),a)}),{}}}),{Fragment:u_,createVNode:c_,mergeProps:d_}=await e("vue"),{computed:v_,toRefs:p_}=await e("vue"),f_=t({altLabels:Boolean,bgColor:String,completeIcon:E,editIcon:E,editable:Boolean,errorIcon:E,hideActions:Boolean,items:{type:Array,default:()=>[]},itemTitle:{type:String,default:"title"},itemValue:{type:String,default:"value"},nonLinear:Boolean,flat:Boolean,...q()},"Stepper"),m_=t({...f_(),...tn({mandatory:"force",selectedClass:"v-stepper-item--selected"}),...og(),...U(HC(),["prevText","nextText"])},"VStepper"),g_=o()({name:"VStepper",props:m_(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const{items:l,next:n,prev:o,selected:i}=nn(e,zC),{displayClasses:r,mobile:s}=G(e),{completeIcon:u,editIcon:c,errorIcon:d,color:p,editable:f,prevText:m,nextText:g}=p_(e),h=v_(()=>e.items.map((t,a)=>({title:ee(t,e.itemTitle,t),value:ee(t,e.itemValue,a+1),raw:t}))),y=v_(()=>l.value.findIndex(e=>i.value.includes(e.id))),b=v_(()=>e.disabled?e.disabled:0===y.value?"prev":y.value===l.value.length-1&&"next");return v({VStepperItem:{editable:f,errorIcon:d,completeIcon:u,editIcon:c,prevText:m,nextText:g},VStepperActions:{color:p,disabled:b,prevText:m,nextText:g}}),wt(()=>{const t=ig.filterProps(e),l=!(!a.header&&!e.items.length),i=e.items.length>0,u=!(e.hideActions||!i&&!a.actions);return c_(ig,d_(t,{color:e.bgColor,class:["v-stepper",{"v-stepper--alt-labels":e.altLabels,"v-stepper--flat":e.flat,"v-stepper--non-linear":e.nonLinear,"v-stepper--mobile":s.value},r.value,e.class],style:e.style}),{default:()=>[l&&c_(UC,{key:"stepper-header"},{default:()=>[h.value.map((e,t)=>{let{raw:l,...n}=e;return c_(u_,null,[!!t&&c_(Js,null,null),c_(QC,n,{default:a[`header-item.${n.value}`]??a.header,icon:a.icon,title:a.title,subtitle:a.subtitle})])})]}),i&&c_(n_,{key:"stepper-window"},{default:()=>[h.value.map(e=>c_(s_,{value:e.value},{default:()=>a[`item.${e.value}`]?.(e)??a.item?.(e)}))]}),a.default?.({prev:o,next:n}),u&&(a.actions?.({next:n,prev:o})??c_(WC,{key:"stepper-actions","onClick:prev":o,"onClick:next":n},a))]})}),{prev:o,next:n}}}),{createVNode:h_,Fragment:y_,mergeProps:b_}=await e("vue"),{ref:w_,toRef:S_,useId:k_}=await e("vue"),x_=t({indeterminate:Boolean,inset:Boolean,flat:Boolean,loading:{type:[Boolean,String],default:!1},...ur(),...wi()},"VSwitch"),V_=o()({name:"VSwitch",inheritAttrs:!1,props:x_(),emits:{"update:focused":e=>!0,"update:modelValue":e=>!0,"update:indeterminate":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=V(e,"indeterminate"),o=V(e,"modelValue"),{loaderClasses:i}=Hn(e),{isFocused:r,focus:s,blur:u}=Ri(e),c=w_(),d=$&&window.matchMedia("(forced-colors: active)").matches,v=S_(()=>"string"==typeof e.loading&&""!==e.loading?e.loading:e.color),p=k_(),f=S_(()=>e.id||`switch-${p}`);function m(){n.value&&(n.value=!1)}function g(e){e.stopPropagation(),e.preventDefault(),c.value?.input?.click()}return wt(()=>{const[t,p]=z(a),h=cr.filterProps(e),y=Si.filterProps(e);return h_(cr,b_({class:["v-switch",{"v-switch--flat":e.flat},{"v-switch--inset":e.inset},{"v-switch--indeterminate":n.value},i.value,e.class]},t,h,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,id:f.value,focused:r.value,style:e.style}),{...l,default:t=>{let{id:a,messagesId:i,isDisabled:r,isReadonly:f,isValid:h}=t;const b={model:o,isValid:h};return h_(Si,b_({ref:c},y,{modelValue:o.value,"onUpdate:modelValue":[e=>o.value=e,m],id:a.value,"aria-describedby":i.value,type:"checkbox","aria-checked":n.value?"mixed":void 0,disabled:r.value,readonly:f.value,onFocus:s,onBlur:u},p),{...l,default:e=>{let{backgroundColorClasses:t,backgroundColorStyles:a}=e;return h_("div",{class:["v-switch__track",d?void 0:t.value],style:a.value,onClick:g},[l["track-true"]&&h_("div",{key:"prepend",class:"v-switch__track-true"},[l["track-true"](b)]),l["track-false"]&&h_("div",{key:"append",class:"v-switch__track-false"},[l["track-false"](b)])])},input:t=>{let{inputNode:a,icon:n,backgroundColorClasses:o,backgroundColorStyles:i}=t;return h_(y_,null,[a,h_("div",{class:["v-switch__thumb",{"v-switch__thumb--filled":n||e.loading},e.inset||d?void 0:o.value],style:e.inset?void 0:i.value},[l.thumb?h_(ra,{defaults:{VIcon:{icon:n,size:"x-small"}}},{default:()=>[l.thumb({...b,icon:n})]}):h_(qt,null,{default:()=>[e.loading?h_(Wn,{name:"v-switch",active:!0,color:!1===h.value?void 0:v.value},{default:e=>l.loader?l.loader(e):h_(An,{active:e.isActive,color:e.color,indeterminate:!0,size:"16",width:"2"},null)}):n&&h_(bn,{key:String(n),icon:n,size:"x-small"},null)]})])])}})}})}),{}}}),{createVNode:C_}=await e("vue"),{computed:__,shallowRef:I_,toRef:B_}=await e("vue"),P_=t({color:String,height:[Number,String],window:Boolean,...qe(),...Za(),...I(),...Sa(),...Vt(),...c()},"VSystemBar"),A_=o()({name:"VSystemBar",props:P_(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{backgroundColorClasses:n,backgroundColorStyles:o}=ya(()=>e.color),{elevationClasses:i}=el(e),{roundedClasses:s}=ka(e),{ssrBootStyles:u}=yl(),c=__(()=>e.height??(e.window?32:24)),{layoutItemStyles:d}=_({id:e.name,order:__(()=>parseInt(e.order,10)),position:I_("top"),layoutSize:c,elementSize:c,active:__(()=>!0),absolute:B_(()=>e.absolute)});return wt(()=>C_(e.tag,{class:["v-system-bar",{"v-system-bar--window":e.window},l.value,n.value,i.value,s.value,e.class],style:[o.value,d.value,u.value,e.style]},a)),{}}}),N_=Symbol.for("vuetify:v-tabs"),{Fragment:T_,createVNode:E_,mergeProps:D_}=await e("vue"),{computed:R_,ref:$_}=await e("vue"),L_=t({fixed:Boolean,sliderColor:String,hideSlider:Boolean,direction:{type:String,default:"horizontal"},...H(No({selectedClass:"v-tab--selected",variant:"text"}),["active","block","flat","location","position","symbol"])},"VTab"),F_=o()({name:"VTab",props:L_(),setup(e,t){let{slots:a,attrs:l}=t;const{textColorClasses:n,textColorStyles:o}=ha(()=>e.sliderColor),i=$_(),r=$_(),s=R_(()=>"horizontal"===e.direction),u=R_(()=>i.value?.group?.isSelected.value??!1);function c(e){let{value:t}=e;if(t){const e=i.value?.$el.parentElement?.querySelector(".v-tab--selected .v-tab__slider"),t=r.value;if(!e||!t)return;const a=getComputedStyle(e).color,l=e.getBoundingClientRect(),n=t.getBoundingClientRect(),o=s.value?"x":"y",u=s.value?"X":"Y",c=s.value?"right":"bottom",d=s.value?"width":"height",v=l[o]>n[o]?l[c]-n[c]:l[o]-n[o],p=Math.sign(v)>0?s.value?"right":"bottom":Math.sign(v)<0?s.value?"left":"top":"center",f=(Math.abs(v)+(Math.sign(v)<0?l[d]:n[d]))/Math.max(l[d],n[d])||0,m=1.5;rt(t,{backgroundColor:[a,"currentcolor"],transform:[`translate${u}(${v}px) scale${u}(${l[d]/n[d]||0})`,`translate${u}(${v/m}px) scale${u}(${(f-1)/m+1})`,"none"],transformOrigin:Array(3).fill(p)},{duration:225,easing:ft})}}return wt(()=>{const t=To.filterProps(e);return E_(To,D_({symbol:N_,ref:i,class:["v-tab",e.class],style:e.style,tabindex:u.value?0:-1,role:"tab","aria-selected":String(u.value),active:!1},t,l,{block:e.fixed,maxWidth:e.fixed?300:void 0,"onGroup:selected":c}),{...a,default:()=>E_(T_,null,[a.default?.()??e.text,!e.hideSlider&&E_("div",{ref:r,class:["v-tab__slider",n.value],style:o.value},null)])})}),Zc({},i)}}),{mergeProps:M_,createVNode:O_}=await e("vue"),{computed:z_,inject:j_}=await e("vue"),H_=t({...H(Nf(),["continuous","nextIcon","prevIcon","showArrows","touch","mandatory"])},"VTabsWindow"),W_=o()({name:"VTabsWindow",props:H_(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=j_(N_,null),n=V(e,"modelValue"),o=z_({get:()=>null==n.value&&l?l.items.value.find(e=>l.selected.value.includes(e.id))?.value:n.value,set(e){n.value=e}});return wt(()=>{const t=Tf.filterProps(e);return O_(Tf,M_({_as:"VTabsWindow"},t,{modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-tabs-window",e.class],style:e.style,mandatory:!1,touch:!1}),a)}),{}}}),{mergeProps:U_,createVNode:G_}=await e("vue"),Y_=t({...qf()},"VTabsWindowItem"),q_=o()({name:"VTabsWindowItem",props:Y_(),setup(e,t){let{slots:a}=t;return wt(()=>{const t=Kf.filterProps(e);return G_(Kf,U_({_as:"VTabsWindowItem"},t,{class:["v-tabs-window-item",e.class],style:e.style}),a)}),{}}}),{Fragment:K_,mergeProps:X_,createVNode:J_}=await e("vue"),{computed:Q_,toRef:Z_}=await e("vue");const eI=t({alignTabs:{type:String,default:"start"},color:String,fixedTabs:Boolean,items:{type:Array,default:()=>[]},stacked:Boolean,bgColor:String,grow:Boolean,height:{type:[Number,String],default:void 0},hideSlider:Boolean,sliderColor:String,...Cr({mandatory:"force",selectedClass:"v-tab-item--selected"}),...Al(),...Vt()},"VTabs"),tI=o()({name:"VTabs",props:eI(),emits:{"update:modelValue":e=>!0},setup(e,t){let{attrs:a,slots:l}=t;const n=V(e,"modelValue"),o=Q_(()=>function(e){return e?e.map(e=>w(e)?e:{text:e,value:e}):[]}(e.items)),{densityClasses:i}=Nl(e),{backgroundColorClasses:r,backgroundColorStyles:s}=ya(()=>e.bgColor),{scopeId:u}=mc();return v({VTab:{color:Z_(()=>e.color),direction:Z_(()=>e.direction),stacked:Z_(()=>e.stacked),fixed:Z_(()=>e.fixedTabs),sliderColor:Z_(()=>e.sliderColor),hideSlider:Z_(()=>e.hideSlider)}}),wt(()=>{const t=_r.filterProps(e),c=!!(l.window||e.items.length>0);return J_(K_,null,[J_(_r,X_(t,{modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,class:["v-tabs",`v-tabs--${e.direction}`,`v-tabs--align-tabs-${e.alignTabs}`,{"v-tabs--fixed-tabs":e.fixedTabs,"v-tabs--grow":e.grow,"v-tabs--stacked":e.stacked},i.value,r.value,e.class],style:[{"--v-tabs-height":p(e.height)},s.value,e.style],role:"tablist",symbol:N_},u,a),{default:()=>[l.default?.()??o.value.map(e=>l.tab?.({item:e})??J_(F_,X_(e,{key:e.text,value:e.value}),{default:l[`tab.${e.value}`]?()=>l[`tab.${e.value}`]?.({item:e}):void 0}))]}),c&&J_(W_,X_({modelValue:n.value,"onUpdate:modelValue":e=>n.value=e,key:"tabs-window"},u),{default:()=>[o.value.map(e=>l.item?.({item:e})??J_(q_,{value:e.value},{default:()=>l[`item.${e.value}`]?.({item:e})})),l.window?.()]})])}),{}}}),{Fragment:aI,createVNode:lI,resolveDirective:nI,mergeProps:oI,withDirectives:iI,vModelText:rI}=await e("vue"),{computed:sI,nextTick:uI,onBeforeUnmount:cI,onMounted:dI,ref:vI,shallowRef:pI,watch:fI,watchEffect:mI}=await e("vue"),gI=t({autoGrow:Boolean,autofocus:Boolean,counter:[Boolean,Number,String],counterValue:Function,prefix:String,placeholder:String,persistentPlaceholder:Boolean,persistentCounter:Boolean,noResize:Boolean,rows:{type:[Number,String],default:5,validator:e=>!isNaN(parseFloat(e))},maxRows:{type:[Number,String],validator:e=>!isNaN(parseFloat(e))},suffix:String,modelModifiers:Object,...ur(),...$d()},"VTextarea"),hI=o()({name:"VTextarea",directives:{Intersect:Aa},inheritAttrs:!1,props:gI(),emits:{"click:control":e=>!0,"mousedown:control":e=>!0,"update:focused":e=>!0,"update:modelValue":e=>!0},setup(e,t){let{attrs:a,emit:l,slots:n}=t;const o=V(e,"modelValue"),{isFocused:i,focus:r,blur:s}=Ri(e),u=sI(()=>"function"==typeof e.counterValue?e.counterValue(o.value):(o.value||"").toString().length),c=sI(()=>a.maxlength?a.maxlength:!e.counter||"number"!=typeof e.counter&&"string"!=typeof e.counter?void 0:e.counter);function d(t,a){e.autofocus&&t&&a[0].target?.focus?.()}const v=vI(),f=vI(),m=pI(""),g=vI(),h=sI(()=>e.persistentPlaceholder||i.value||e.active);function y(){g.value!==document.activeElement&&g.value?.focus(),i.value||r()}function b(e){y(),l("click:control",e)}function w(e){l("mousedown:control",e)}function S(t){t.stopPropagation(),y(),uI(()=>{o.value="",W(e["onClick:clear"],t)})}function x(t){const a=t.target;if(o.value=a.value,e.modelModifiers?.trim){const e=[a.selectionStart,a.selectionEnd];uI(()=>{a.selectionStart=e[0],a.selectionEnd=e[1]})}}const C=vI(),_=vI(Number(e.rows)),I=sI(()=>["plain","underlined"].includes(e.variant));function B(){e.autoGrow&&uI(()=>{if(!C.value||!f.value)return;const t=getComputedStyle(C.value),a=getComputedStyle(f.value.$el),l=parseFloat(t.getPropertyValue("--v-field-padding-top"))+parseFloat(t.getPropertyValue("--v-input-padding-top"))+parseFloat(t.getPropertyValue("--v-field-padding-bottom")),n=C.value.scrollHeight,o=parseFloat(t.lineHeight),i=Math.max(parseFloat(e.rows)*o+l,parseFloat(a.getPropertyValue("--v-input-control-height"))),r=parseFloat(e.maxRows)*o+l||1/0,s=k(n??0,i,r);_.value=Math.floor((s-l)/o),m.value=p(s)})}let P;return mI(()=>{e.autoGrow||(_.value=Number(e.rows))}),dI(B),fI(o,B),fI(()=>e.rows,B),fI(()=>e.maxRows,B),fI(()=>e.density,B),fI(C,e=>{e?(P=new ResizeObserver(B),P.observe(C.value)):P?.disconnect()}),cI(()=>{P?.disconnect()}),wt(()=>{const t=!!(n.counter||e.counter||e.counterValue),l=!(!t&&!n.details),[r,p]=z(a),{modelValue:k,...V}=cr.filterProps(e),B=Ld.filterProps(e);return lI(cr,oI({ref:v,modelValue:o.value,"onUpdate:modelValue":e=>o.value=e,class:["v-textarea v-text-field",{"v-textarea--prefixed":e.prefix,"v-textarea--suffixed":e.suffix,"v-text-field--prefixed":e.prefix,"v-text-field--suffixed":e.suffix,"v-textarea--auto-grow":e.autoGrow,"v-textarea--no-resize":e.noResize||e.autoGrow,"v-input--plain-underlined":I.value},e.class],style:e.style},r,V,{centerAffix:1===_.value&&!I.value,focused:i.value}),{...n,default:t=>{let{id:a,isDisabled:l,isDirty:r,isReadonly:u,isValid:c}=t;return lI(Ld,oI({ref:f,style:{"--v-textarea-control-height":m.value},onClick:b,onMousedown:w,"onClick:clear":S,"onClick:prependInner":e["onClick:prependInner"],"onClick:appendInner":e["onClick:appendInner"]},B,{id:a.value,active:h.value||r.value,centerAffix:1===_.value&&!I.value,dirty:r.value||e.dirty,disabled:l.value,focused:i.value,error:!1===c.value}),{...n,default:t=>{let{props:{class:a,...n}}=t;return lI(aI,null,[e.prefix&&lI("span",{class:"v-text-field__prefix"},[e.prefix]),iI(lI("textarea",oI({ref:g,class:a,value:o.value,onInput:x,autofocus:e.autofocus,readonly:u.value,disabled:l.value,placeholder:e.placeholder,rows:e.rows,name:e.name,onFocus:y,onBlur:s},n,p),null),[[nI("intersect"),{handler:d},null,{once:!0}]]),e.autoGrow&&iI(lI("textarea",{class:[a,"v-textarea__sizer"],id:`${n.id}-sizer`,"onUpdate:modelValue":e=>o.value=e,ref:C,readonly:!0,"aria-hidden":"true"},null),[[rI,o.value]]),e.suffix&&lI("span",{class:"v-text-field__suffix"},[e.suffix])])}})},details:l?a=>lI(aI,null,[n.details?.(a),t&&lI(aI,null,[lI("span",null,null),lI(Sd,{active:e.persistentCounter||i.value,value:u.value,max:c.value,disabled:e.disabled},n.counter)])]):void 0})}),Zc({},v,f,g)}}),{createVNode:yI}=await e("vue"),bI=t({withBackground:Boolean,...qe(),...c(),...Vt()},"VThemeProvider"),wI=o()({name:"VThemeProvider",props:bI(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e);return()=>e.withBackground?yI(e.tag,{class:["v-theme-provider",l.value,e.class],style:e.style},{default:()=>[a.default?.()]}):a.default?.()}}),{createVNode:SI}=await e("vue"),kI=t({dotColor:String,fillDot:Boolean,hideDot:Boolean,icon:E,iconColor:String,lineColor:String,...qe(),...Sa(),...pn(),...Za()},"VTimelineDivider"),xI=o()({name:"VTimelineDivider",props:kI(),setup(e,t){let{slots:a}=t;const{sizeClasses:l,sizeStyles:n}=fn(e,"v-timeline-divider__dot"),{backgroundColorStyles:o,backgroundColorClasses:i}=ya(()=>e.dotColor),{roundedClasses:r}=ka(e,"v-timeline-divider__dot"),{elevationClasses:s}=el(e),{backgroundColorClasses:u,backgroundColorStyles:c}=ya(()=>e.lineColor);return wt(()=>SI("div",{class:["v-timeline-divider",{"v-timeline-divider--fill-dot":e.fillDot},e.class],style:e.style},[SI("div",{class:["v-timeline-divider__before",u.value],style:c.value},null),!e.hideDot&&SI("div",{key:"dot",class:["v-timeline-divider__dot",s.value,r.value,l.value],style:n.value},[SI("div",{class:["v-timeline-divider__inner-dot",i.value,r.value],style:o.value},[a.default?SI(ra,{key:"icon-defaults",disabled:!e.icon,defaults:{VIcon:{color:e.iconColor,icon:e.icon,size:e.size}}},a.default):SI(bn,{key:"icon",color:e.iconColor,icon:e.icon,size:e.size},null)])]),SI("div",{class:["v-timeline-divider__after",u.value],style:c.value},null)])),{}}}),{createVNode:VI}=await e("vue"),{ref:CI,shallowRef:_I,watch:II}=await e("vue"),BI=t({density:String,dotColor:String,fillDot:Boolean,hideDot:Boolean,hideOpposite:{type:Boolean,default:void 0},icon:E,iconColor:String,lineInset:[Number,String],side:{type:String,validator:e=>null==e||["start","end"].includes(e)},...qe(),...ua(),...Za(),...Sa(),...pn(),...Vt()},"VTimelineItem"),PI=o()({name:"VTimelineItem",props:BI(),setup(e,t){let{slots:a}=t;const{dimensionStyles:l}=ca(e),n=_I(0),o=CI();return II(o,e=>{e&&(n.value=e.$el.querySelector(".v-timeline-divider__dot")?.getBoundingClientRect().width??0)},{flush:"post"}),wt(()=>VI("div",{class:["v-timeline-item",{"v-timeline-item--fill-dot":e.fillDot,"v-timeline-item--side-start":"start"===e.side,"v-timeline-item--side-end":"end"===e.side},e.class],style:[{"--v-timeline-dot-size":p(n.value),"--v-timeline-line-inset":e.lineInset?`calc(var(--v-timeline-dot-size) / 2 + ${p(e.lineInset)})`:p(0)},e.style]},[VI("div",{class:"v-timeline-item__body",style:l.value},[a.default?.()]),VI(xI,{ref:o,hideDot:e.hideDot,icon:e.icon,iconColor:e.iconColor,size:e.size,elevation:e.elevation,dotColor:e.dotColor,fillDot:e.fillDot,rounded:e.rounded},{default:a.icon}),"compact"!==e.density&&VI("div",{class:"v-timeline-item__opposite"},[!e.hideOpposite&&a.opposite?.()])])),{}}}),{createVNode:AI}=await e("vue"),{computed:NI,toRef:TI}=await e("vue"),EI=t({align:{type:String,default:"center",validator:e=>["center","start"].includes(e)},direction:{type:String,default:"vertical",validator:e=>["vertical","horizontal"].includes(e)},justify:{type:String,default:"auto",validator:e=>["auto","center"].includes(e)},side:{type:String,validator:e=>null==e||["start","end"].includes(e)},lineThickness:{type:[String,Number],default:2},lineColor:String,truncateLine:{type:String,validator:e=>["start","end","both"].includes(e)},...U(BI({lineInset:0}),["dotColor","fillDot","hideOpposite","iconColor","lineInset","size"]),...qe(),...Al(),...Vt(),...c()},"VTimeline"),DI=o()({name:"VTimeline",props:EI(),setup(e,t){let{slots:a}=t;const{themeClasses:l}=r(e),{densityClasses:n}=Nl(e),{rtlClasses:o}=u();v({VTimelineDivider:{lineColor:TI(()=>e.lineColor)},VTimelineItem:{density:TI(()=>e.density),dotColor:TI(()=>e.dotColor),fillDot:TI(()=>e.fillDot),hideOpposite:TI(()=>e.hideOpposite),iconColor:TI(()=>e.iconColor),lineColor:TI(()=>e.lineColor),lineInset:TI(()=>e.lineInset),size:TI(()=>e.size)}});const i=NI(()=>{const t=e.side?e.side:"default"!==e.density?"end":null;return t&&`v-timeline--side-${t}`}),s=NI(()=>{const t=["v-timeline--truncate-line-start","v-timeline--truncate-line-end"];switch(e.truncateLine){case"both":return t;case"start":return t[0];case"end":return t[1];default:return null}});return wt(()=>AI(e.tag,{class:["v-timeline",`v-timeline--${e.direction}`,`v-timeline--align-${e.align}`,`v-timeline--justify-${e.justify}`,s.value,{"v-timeline--inset-line":!!e.lineInset},l.value,n.value,i.value,o.value,e.class],style:[{"--v-timeline-line-thickness":p(e.lineThickness)},e.style]},a)),{}}}),{createVNode:RI}=await e("vue"),{toRef:$I}=await e("vue"),LI=t({...qe(),...Fl({variant:"text"})},"VToolbarItems"),FI=o()({name:"VToolbarItems",props:LI(),setup(e,t){let{slots:a}=t;return v({VBtn:{color:$I(()=>e.color),height:"inherit",variant:$I(()=>e.variant)}}),wt(()=>RI("div",{class:["v-toolbar-items",e.class],style:e.style},[a.default?.()])),{}}}),{mergeProps:MI,createVNode:OI}=await e("vue"),{computed:zI,mergeProps:jI,ref:HI,toRef:WI,useId:UI}=await e("vue"),GI=t({id:String,interactive:Boolean,text:String,...H(Kc({closeOnBack:!1,location:"end",locationStrategy:"connected",eager:!0,minWidth:0,offset:10,openOnClick:!1,openOnHover:!0,origin:"auto",scrim:!1,scrollStrategy:"reposition",transition:null}),["absolute","persistent"])},"VTooltip"),YI=o()({name:"VTooltip",props:GI(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=V(e,"modelValue"),{scopeId:n}=mc(),o=UI(),i=WI(()=>e.id||`v-tooltip-${o}`),r=HI(),s=zI(()=>e.location.split(" ").length>1?e.location:e.location+" center"),u=zI(()=>"auto"===e.origin||"overlap"===e.origin||e.origin.split(" ").length>1||e.location.split(" ").length>1?e.origin:e.origin+" center"),c=WI(()=>null!=e.transition?e.transition:l.value?"scale-transition":"fade-transition"),d=zI(()=>jI({"aria-describedby":i.value},e.activatorProps));return wt(()=>{const t=Xc.filterProps(e);return OI(Xc,MI({ref:r,class:["v-tooltip",{"v-tooltip--interactive":e.interactive},e.class],style:e.style,id:i.value},t,{modelValue:l.value,"onUpdate:modelValue":e=>l.value=e,transition:c.value,absolute:!0,location:s.value,origin:u.value,persistent:!0,role:"tooltip",activatorProps:d.value,_disableGlobalStack:!0},n),{activator:a.activator,default:function(){for(var t=arguments.length,l=new Array(t),n=0;n<t;n++)l[n]=arguments[n];return a.default?.(...l)??e.text}})}),Zc({},r)}}),qI=o()({name:"VValidation",props:lr(),emits:{"update:modelValue":e=>!0},setup(e,t){let{slots:a}=t;const l=nr(e,"validation");return()=>a.default?.(l)}}),KI=Object.freeze(Object.defineProperty({__proto__:null,VAlert:Go,VAlertTitle:Oo,VApp:xt,VAppBar:Il,VAppBarNavIcon:$o,VAppBarTitle:Mo,VAutocomplete:lp,VAvatar:Ko,VBadge:up,VBanner:hp,VBannerActions:vp,VBannerText:pp,VBottomNavigation:kp,VBottomSheet:Rp,VBreadcrumbs:Xp,VBreadcrumbsDivider:Fp,VBreadcrumbsItem:Hp,VBtn:To,VBtnGroup:Hl,VBtnToggle:dn,VCard:hf,VCardActions:Qp,VCardItem:sf,VCardSubtitle:tf,VCardText:df,VCardTitle:af,VCarousel:Of,VCarouselItem:Zf,VCheckbox:mr,VCheckboxBtn:_i,VChip:Hr,VChipGroup:Tr,VClassIcon:Me,VCode:em,VCol:Gb,VColorPicker:yg,VCombobox:Ng,VComponentIcon:Oe,VConfirmEdit:Og,VContainer:Rb,VCounter:Sd,VDataIterator:Yh,VDataTable:mb,VDataTableFooter:sy,VDataTableHeaders:Dy,VDataTableRow:Gy,VDataTableRows:Zy,VDataTableServer:Tb,VDataTableVirtual:xb,VDatePicker:tS,VDatePickerControls:hw,VDatePickerHeader:ww,VDatePickerMonth:Nw,VDatePickerMonths:Lw,VDatePickerYears:Uw,VDefaultsProvider:ra,VDialog:Np,VDialogBottomTransition:Ut,VDialogTopTransition:Gt,VDialogTransition:zt,VDivider:Js,VEmptyState:oS,VExpandTransition:la,VExpandXTransition:na,VExpansionPanel:_S,VExpansionPanelText:vS,VExpansionPanelTitle:wS,VExpansionPanels:NS,VFab:jS,VFabTransition:Wt,VFadeTransition:Yt,VField:Ld,VFieldLabel:Vd,VFileInput:ZS,VFooter:rk,VForm:dk,VHover:pk,VIcon:bn,VImg:Ya,VInfiniteScroll:Vk,VInput:cr,VItem:Pk,VItemGroup:Bk,VKbd:Ak,VLabel:Qo,VLayout:Ek,VLayoutItem:Fk,VLazy:Hk,VLigatureIcon:ze,VList:hu,VListGroup:Bs,VListImg:yu,VListItem:Ws,VListItemAction:Su,VListItemMedia:Vu,VListItemSubtitle:Ns,VListItemTitle:Ts,VListSubheader:Ys,VLocaleProvider:Gk,VMain:Kk,VMenu:md,VMessages:Ti,VNavigationDrawer:Vx,VNoSsr:Cx,VNumberInput:Mx,VOtpInput:Kx,VOverlay:Xc,VPagination:ly,VParallax:lV,VProgressCircular:An,VProgressLinear:Mn,VRadio:rV,VRadioGroup:fV,VRangeSlider:SV,VRating:AV,VResponsive:fa,VRow:vw,VScaleTransition:qt,VScrollXReverseTransition:Xt,VScrollXTransition:Kt,VScrollYReverseTransition:Qt,VScrollYTransition:Jt,VSelect:Dv,VSelectionControl:Si,VSelectionControlGroup:ri,VSheet:ig,VSkeletonLoader:OV,VSlideGroup:_r,VSlideGroupItem:zV,VSlideXReverseTransition:ea,VSlideXTransition:Zt,VSlideYReverseTransition:aa,VSlideYTransition:ta,VSlider:Km,VSnackbar:tC,VSnackbarQueue:cC,VSpacer:pw,VSparkline:DC,VSpeedDial:OC,VStepper:g_,VStepperActions:WC,VStepperHeader:UC,VStepperItem:QC,VStepperWindow:n_,VStepperWindowItem:s_,VSvgIcon:je,VSwitch:V_,VSystemBar:A_,VTab:F_,VTable:ab,VTabs:tI,VTabsWindow:W_,VTabsWindowItem:q_,VTextField:Kd,VTextarea:hI,VThemeProvider:wI,VTimeline:DI,VTimelineItem:PI,VToolbar:il,VToolbarItems:FI,VToolbarTitle:It,VTooltip:YI,VValidation:qI,VVirtualScroll:hv,VWindow:Tf,VWindowItem:Kf},Symbol.toStringTag,{value:"Module"}));function XI(e,t){e._mutate?.[t.instance.$.uid]&&(e._mutate[t.instance.$.uid].observer.disconnect(),delete e._mutate[t.instance.$.uid])}const JI={mounted:function(e,t){const a=t.modifiers||{},l=t.value,{once:n,immediate:o,...i}=a,r=!Object.keys(i).length,{handler:s,options:u}="object"==typeof l?l:{handler:l,options:{attributes:i?.attr??r,characterData:i?.char??r,childList:i?.child??r,subtree:i?.sub??r}},c=new MutationObserver(function(){let a=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],l=arguments.length>1?arguments[1]:void 0;s?.(a,l),n&&XI(e,t)});o&&s?.([],c),e._mutate=Object(e._mutate),e._mutate[t.instance.$.uid]={observer:c},c.observe(e,u)},unmounted:XI};const QI={mounted:function(e,t){const a=t.value,l={passive:!t.modifiers?.active};window.addEventListener("resize",a,l),e._onResize=Object(e._onResize),e._onResize[t.instance.$.uid]={handler:a,options:l},t.modifiers?.quiet||a()},unmounted:function(e,t){if(!e._onResize?.[t.instance.$.uid])return;const{handler:a,options:l}=e._onResize[t.instance.$.uid];window.removeEventListener("resize",a,l),delete e._onResize[t.instance.$.uid]}};function ZI(e,t){const{self:a=!1}=t.modifiers??{},l=t.value,n="object"==typeof l&&l.options||{passive:!0},o="function"==typeof l||"handleEvent"in l?l:l.handler,i=a?e:t.arg?document.querySelector(t.arg):window;i&&(i.addEventListener("scroll",o,n),e._onScroll=Object(e._onScroll),e._onScroll[t.instance.$.uid]={handler:o,options:n,target:a?void 0:i})}function eB(e,t){if(!e._onScroll?.[t.instance.$.uid])return;const{handler:a,options:l,target:n=e}=e._onScroll[t.instance.$.uid];n.removeEventListener("scroll",a,l),delete e._onScroll[t.instance.$.uid]}const tB={mounted:ZI,unmounted:eB,updated:function(e,t){t.value!==t.oldValue&&(eB(e,t),ZI(e,t))}},{h:aB,mergeProps:lB,render:nB,resolveComponent:oB}=await e("vue");const iB=function(e,t){const a=function(e,t){return function(a,l,n){const o="function"==typeof t?t(l):t,i=l.value?.text??l.value??o?.text,r=w(l.value)?l.value:{},s=()=>i??a.textContent,u=(n.ctx===l.instance.$?function(e,t){const a=new Set,l=t=>{for(const n of t){if(!n)continue;if(n===e||n.el&&e.el&&n.el===e.el)return!0;let t;if(a.add(n),n.suspense?t=l([n.ssContent]):Array.isArray(n.children)?t=l(n.children):n.component?.vnode&&(t=l([n.component?.subTree])),t)return t;a.delete(n)}return!1};if(!l([t.subTree]))return X("Could not find original vnode, component will not inherit provides"),t;const n=Array.from(a).reverse();for(const o of n)if(o.component)return o.component;return t}(n,l.instance.$)?.provides:n.ctx?.provides)??l.instance.$.provides,c=aB(e,lB(o,r),s);c.appContext=Object.assign(Object.create(null),l.instance.$.appContext,{provides:u}),nB(c,a)}}("string"==typeof e?oB(e):e,t);return{mounted:a,updated:a,unmounted(e){nB(null,e)}}}(YI,e=>({activator:"parent",location:e.arg?.replace("-"," "),text:"boolean"==typeof e.value?void 0:e.value})),rB=Object.freeze(Object.defineProperty({__proto__:null,ClickOutside:Dc,Intersect:Aa,Mutate:JI,Resize:QI,Ripple:Vo,Scroll:tB,Tooltip:iB,Touch:bf},Symbol.toStringTag,{value:"Module"})),{defineComponent:sB,ref:uB,shallowRef:cB,onMounted:dB,onBeforeUnmount:vB}=await e("vue"),pB=sB({name:"App",setup(){const e=cB(Ue),t=uB(null),a=a=>{a.data&&"api"===a.data.type&&(t.value=a.data.data,console.log("收到API:",t.value)),a.data&&"showConfig"===a.data.type&&(e.value=Ge)};return dB(()=>{window.addEventListener("message",a),window.parent&&window.parent.postMessage&&window.parent.postMessage({type:"ready"},"*")}),vB(()=>{window.removeEventListener("message",a)}),{currentComponent:e,api:t,switchComponent:()=>{e.value=e.value===Ue?Ge:Ue},closeModal:()=>{window.parent&&window.parent.postMessage&&window.parent.postMessage({type:"close"},"*")},saveConfig:t=>{window.parent&&window.parent.postMessage&&window.parent.postMessage({type:"save",data:t},"*"),e.value=Ue}}}}),{resolveDynamicComponent:fB,openBlock:mB,createBlock:gB,createElementVNode:hB,resolveComponent:yB,withCtx:bB}=await e("vue"),wB={class:"plugin-app"};const SB=Ye(pB,[["render",function(e,t,a,l,n,o){const i=yB("v-app");return mB(),gB(i,null,{default:bB(()=>[hB("div",wB,[(mB(),gB(fB(e.currentComponent),{api:e.api,onSwitch:e.switchComponent,onClose:e.closeModal,onSave:e.saveConfig},null,40,["api","onSwitch","onClose","onSave"]))])]),_:1})}]]),{createApp:kB}=await e("vue"),{createVuetify:xB}=await e("vuetify"),VB=xB({components:KI,directives:rB,icons:{defaultSet:"mdi",aliases:We,sets:{mdi:He}}}),CB=kB(SB);CB.use(VB),CB.mount("#app");
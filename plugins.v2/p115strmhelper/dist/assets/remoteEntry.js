@@ -1 +1 @@
-const e={},t=new Set(["Module","__esModule","default","_export_sfc"]);let o={"./Page":()=>(n(["__federation_expose_Page-BxCW201s.css"],!1,"./Page"),r("./__federation_expose_Page-Bhr85p8x.js").then(e=>Object.keys(e).every(e=>t.has(e))?()=>e.default:()=>e)),"./Config":()=>(n(["__federation_expose_Config-Cx6sIPg-.css"],!1,"./Config"),r("./__federation_expose_Config-CPCf08ib.js").then(e=>Object.keys(e).every(e=>t.has(e))?()=>e.default:()=>e)),"./Dashboard":()=>(n(["__federation_expose_Dashboard-Cr3gA7ui.css"],!1,"./Dashboard"),r("./__federation_expose_Dashboard-CuvW_beu.js").then(e=>Object.keys(e).every(e=>t.has(e))?()=>e.default:()=>e))};const s={},n=(e,t,o)=>{const n=import.meta.url;if(void 0===n)return void console.warn('The remote style takes effect only when the build.target option in the vite.config.ts file is higher than that of "es2020".');const r=n.substring(0,n.lastIndexOf("remoteEntry.js")),i='/';'assets',e.forEach(e=>{let n="";const _=i||r;if(_){const t={trailing:e=>e.endsWith("/")?e.slice(0,-1):e,leading:e=>e.startsWith("/")?e.slice(1):e},o=e=>e.startsWith("http")||e.startsWith("//"),s=t.trailing(_),i=t.leading(e),a=t.trailing(r);n=o(_)?[s,i].filter(Boolean).join("/"):a.includes(s)?[a,i].filter(Boolean).join("/"):[a+s,i].filter(Boolean).join("/")}else n=e;if(t){const e="css__115strmhelper__"+o;return window[e]=window[e]||[],void window[e].push(n)}if(n in s)return;s[n]=!0;const a=document.createElement("link");a.rel="stylesheet",a.href=n,document.head.appendChild(a)})};async function r(t){return e[t]??=import(t),e[t]}const i=e=>{if(!o[e])throw new Error("Can not find remote module "+e);return o[e]()},_=e=>{globalThis.__federation_shared__=globalThis.__federation_shared__||{},Object.entries(e).forEach(([e,t])=>{for(const[o,s]of Object.entries(t)){const t=s.scope||"default";globalThis.__federation_shared__[t]=globalThis.__federation_shared__[t]||{};const n=globalThis.__federation_shared__[t];(n[e]=n[e]||{})[o]=s}})};export{n as dynamicLoadingCss,i as get,_ as init};
+const e={},t=new Set(["Module","__esModule","default","_export_sfc"]);let o={"./Page":()=>(n(["__federation_expose_Page-BxCW201s.css"],!1,"./Page"),r("./__federation_expose_Page-v_n3LYYG.js").then(e=>Object.keys(e).every(e=>t.has(e))?()=>e.default:()=>e)),"./Config":()=>(n(["__federation_expose_Config-Cx6sIPg-.css"],!1,"./Config"),r("./__federation_expose_Config-aKEDjOk-.js").then(e=>Object.keys(e).every(e=>t.has(e))?()=>e.default:()=>e)),"./Dashboard":()=>(n(["__federation_expose_Dashboard-Cr3gA7ui.css"],!1,"./Dashboard"),r("./__federation_expose_Dashboard-CuvW_beu.js").then(e=>Object.keys(e).every(e=>t.has(e))?()=>e.default:()=>e))};const s={},n=(e,t,o)=>{const n=import.meta.url;if(void 0===n)return void console.warn('The remote style takes effect only when the build.target option in the vite.config.ts file is higher than that of "es2020".');const r=n.substring(0,n.lastIndexOf("remoteEntry.js")),i='/';'assets',e.forEach(e=>{let n="";const _=i||r;if(_){const t={trailing:e=>e.endsWith("/")?e.slice(0,-1):e,leading:e=>e.startsWith("/")?e.slice(1):e},o=e=>e.startsWith("http")||e.startsWith("//"),s=t.trailing(_),i=t.leading(e),a=t.trailing(r);n=o(_)?[s,i].filter(Boolean).join("/"):a.includes(s)?[a,i].filter(Boolean).join("/"):[a+s,i].filter(Boolean).join("/")}else n=e;if(t){const e="css__115strmhelper__"+o;return window[e]=window[e]||[],void window[e].push(n)}if(n in s)return;s[n]=!0;const a=document.createElement("link");a.rel="stylesheet",a.href=n,document.head.appendChild(a)})};async function r(t){return e[t]??=import(t),e[t]}const i=e=>{if(!o[e])throw new Error("Can not find remote module "+e);return o[e]()},_=e=>{globalThis.__federation_shared__=globalThis.__federation_shared__||{},Object.entries(e).forEach(([e,t])=>{for(const[o,s]of Object.entries(t)){const t=s.scope||"default";globalThis.__federation_shared__[t]=globalThis.__federation_shared__[t]||{};const n=globalThis.__federation_shared__[t];(n[e]=n[e]||{})[o]=s}})};export{n as dynamicLoadingCss,i as get,_ as init};
@@ -1,20 +1,25 @@
 import shutil
 import time
 from collections import defaultdict
-from threading import Timer
-from typing import Dict, Optional, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from random import uniform
+from queue import Queue
+from threading import Event, Lock, Thread, Timer
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 from pathlib import Path
-from itertools import batched, chain
+from itertools import batched, chain, groupby
 
 from ..core.config import configer
 from ..core.message import post_message
 from ..core.scrape import media_scrape_metadata
 from ..core.cache import idpathcacher, pantransfercacher, lifeeventcacher
 from ..core.i18n import i18n
+from ..utils.http import LatencyRecorder
+from ..utils.metrics import error_code
 from ..utils.path import PathUtils
 from ..utils.sentry import sentry_manager
 from ..utils.strm import StrmUrlGetter, StrmGenerater
-from ..db_manager.oper import FileDbHelper
+from ..db_manager.oper import FileDbHelper, FileDbBatchWriter
 from ..helper.mediainfo_download import MediaInfoDownloader
 from ..helper.mediasyncdel import MediaSyncDelHelper
 
@@ -38,6 +43,195 @@ from app.chain.transfer import TransferChain
 from app.chain.media import MediaChain
 
 
+class LifeEventCursor:
+    """
+    生活事件拉取游标
+
+    每处理完一组事件即推进到该组最后一个事件并写入插件数据，同时保存最近已处理的事件 ID；
+    异常退出后只会重放未提交的事件，与游标边界重叠的已处理事件直接跳过
+    """
+
+    # 插件数据 key
+    key = "monitor_life_strm_files"
+    # 保留的已处理事件 ID 数量
+    journal_size = 2000
+
+    def __init__(
+        self,
+        from_time: float = 0,
+        from_id: int = 0,
+        journal: Optional[Iterable[int]] = None,
+    ):
+        """
+        :param from_time: 拉取起始时间
+        :param from_id: 拉取起始事件 ID
+        :param journal: 已处理的事件 ID
+        """
+        self.from_time = from_time
+        self.from_id = from_id
+        self._journal: Dict[int, None] = dict.fromkeys(int(i) for i in journal or [])
+
+    @classmethod
+    def load(cls) -> Optional["LifeEventCursor"]:
+        """
+        读取上次保存的游标
+        """
+        data = configer.get_plugin_data(cls.key)
+        if not data:
+            return None
+        return cls(
+            from_time=data.get("from_time") or 0,
+            from_id=data.get("from_id") or 0,
+            journal=data.get("journal"),
+        )
+
+    def is_processed(self, event_id) -> bool:
+        """
+        事件是否已处理
+        """
+        return int(event_id) in self._journal
+
+    def mark_processed(self, event_ids: Iterable) -> None:
+        """
+        记录已处理的事件
+        """
+        for event_id in event_ids:
+            self._journal[int(event_id)] = None
+        while len(self._journal) > self.journal_size:
+            del self._journal[next(iter(self._journal))]
+
+    def advance(self, from_time: float, from_id: int) -> None:
+        """
+        推进游标
+        """
+        self.from_time = from_time
+        self.from_id = from_id
+
+    def save(self) -> None:
+        """
+        写入插件数据
+        """
+        configer.save_plugin_data(
+            self.key,
+            {
+                "from_time": self.from_time,
+                "from_id": self.from_id,
+                "journal": list(self._journal),
+            },
+        )
+
+
+class LifePollScheduler:
+    """
+    生活事件自适应轮询
+
+    拉取到事件后以最短间隔继续轮询，空闲时逐步放宽间隔直至上限；触发风控后按冷却时间暂停，
+    连续触发时冷却时间与翻页间隔成倍增加；每次等待都加入随机抖动，并可被提前唤醒
+    """
+
+    # 最短轮询间隔（秒）
+    min_interval = 2.0
+    # 最长轮询间隔（秒）
+    max_interval = 60.0
+    # 每次空闲轮询后间隔放大倍数
+    idle_factor = 1.5
+    # 随机抖动比例
+    jitter = 0.2
+    # 翻页间隔（秒）
+    base_cooldown = 2.0
+    max_cooldown = 16.0
+    # 风控冷却时间（秒）
+    risk_penalty = 120.0
+    max_risk_penalty = 1800.0
+
+    def __init__(self):
+        self.interval = self.min_interval
+        self.cooldown = self.base_cooldown
+        self.penalty = 0.0
+        self.polls = 0
+        self.active_polls = 0
+        self.risk_controls = 0
+        self._wake = Event()
+
+    @staticmethod
+    def is_risk_control(e: BaseException) -> bool:
+        """
+        判断异常是否为 115 风控
+        """
+        if error_code(e) == "405":
+            return True
+        response = getattr(e, "response", None)
+        if getattr(response, "status_code", None) == 405:
+            return True
+        message = str(e)
+        return "405 Not Allowed" in message or "频繁" in message
+
+    def on_pull(self, count: int) -> None:
+        """
+        记录一次成功拉取
+
+        :param count: 拉取到的事件数
+        """
+        self.polls += 1
+        if count:
+            self.active_polls += 1
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.idle_factor)
+        self.penalty = 0.0
+        self.cooldown = max(self.base_cooldown, self.cooldown / 2)
+
+    def on_risk_control(self) -> None:
+        """
+        记录一次风控
+        """
+        self.risk_controls += 1
+        self.penalty = min(
+            self.max_risk_penalty,
+            self.penalty * 2 if self.penalty else self.risk_penalty,
+        )
+        self.interval = self.penalty
+        self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+
+    def next_delay(self) -> float:
+        """
+        下一次轮询前的等待时间（秒）
+        """
+        return self.interval * uniform(1 - self.jitter, 1 + self.jitter)
+
+    def wait(self) -> float:
+        """
+        等待到下一次轮询，可被 wake 提前唤醒
+
+        :return: 等待时间（秒）
+        """
+        delay = self.next_delay()
+        self._wake.wait(delay)
+        self._wake.clear()
+        return delay
+
+    def wake(self) -> None:
+        """
+        提前唤醒等待中的轮询
+        """
+        self._wake.set()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        输出统计
+
+        :return: {interval, cooldown, penalty, polls, active_polls, risk_controls}
+        """
+        return {
+            "interval": self.interval,
+            "cooldown": self.cooldown,
+            "penalty": self.penalty,
+            "polls": self.polls,
+            "active_polls": self.active_polls,
+            "risk_controls": self.risk_controls,
+        }
+
+
 @sentry_manager.capture_all_class_exceptions
 class MonitorLife:
     """
@@ -65,9 +259,40 @@ class MonitorLife:
     注意: 目前没有重命名文件，复制文件的操作事件
     """
 
-    def __init__(self, client: P115Client, mediainfodownloader: MediaInfoDownloader):
+    # 新路径事件类型
+    CREATE_EVENT_TYPES = {1, 2, 5, 6, 14, 18}
+    # 创建文件夹事件类型
+    FOLDER_EVENT_TYPES = {17}
+    # 删除事件类型
+    REMOVE_EVENT_TYPES = {22}
+    # 文件夹事件生成 STRM 的线程数
+    strm_workers = 4
+    # 单组最多处理的事件数，达到后提交数据库并推进游标
+    commit_size = 500
+
+    def __init__(
+        self,
+        client: P115Client,
+        mediainfodownloader: MediaInfoDownloader,
+        stop_event: Optional[Event] = None,
+    ):
         self._client = client
         self.mediainfodownloader = mediainfodownloader
+        self._stop_event = stop_event or Event()
+
+        self.poller = LifePollScheduler()
+        # 整理完成时唤醒，用于等待 MoviePilot 整理队列清空
+        self._transfer_event = Event()
+        # 事件发生到生成 STRM 的耗时
+        self.latency = LatencyRecorder(maxlen=1024)
+        # 媒体信息文件下载队列，由后台线程处理，不阻塞事件监控
+        # 后台线程使用独立的下载器，避免与全量同步共享风控标记
+        self._mediainfo_downloader = MediaInfoDownloader(
+            cookie=mediainfodownloader.cookie
+        )
+        self._mediainfo_queue: Queue = Queue()
+        self._mediainfo_thread: Optional[Thread] = None
+        self._mediainfo_lock = Lock()
 
         self._monitor_life_notification_timer = None
         self._monitor_life_notification_queue = defaultdict(
@@ -78,6 +303,9 @@ class MonitorLife:
         self.rmt_mediaext_set: Set = set()
         self.download_mediaext_set: Set = set()
 
+        # 单次拉取内解析出的目录 ID 与路径
+        self._cid_paths: Dict[int, str] = {}
+
     def _schedule_notification(self):
         """
         安排通知发送，如果一分钟内没有新事件则发送
@@ -201,6 +429,8 @@ class MonitorLife:
         通过 cid 获取路径
         先从缓存获取，再从数据库获取，最后通过API获取
         """
+        if dir_path := self._cid_paths.get(cid):
+            return Path(dir_path)
         _databasehelper = FileDbHelper()
         dir_path = idpathcacher.get_dir_by_id(cid)
         if not dir_path:
@@ -221,14 +451,132 @@ class MonitorLife:
         logger.debug(f"获取 {cid} 路径（缓存）: {dir_path}")
         return Path(dir_path)
 
-    def media_transfer(self, event, file_path: Path, rmt_mediaext):
+    def wake(self):
+        """
+        唤醒所有等待，用于停止监控
+        """
+        self.poller.wake()
+        self._transfer_event.set()
+
+    def notify_transfer_complete(self):
+        """
+        MoviePilot 整理完成通知
+        """
+        self._transfer_event.set()
+
+    def _wait_transfer_queue(self):
+        """
+        等待 MoviePilot 整理队列清空
+
+        每次整理完成时被唤醒重新检查队列，超时兜底以防整理失败时没有通知
+        """
+        waited = False
+        while not self._stop_event.is_set():
+            self._transfer_event.clear()
+            if not TransferChain().get_queue_tasks():
+                break
+            if not waited:
+                logger.debug(
+                    "【监控生活事件】MoviePilot 整理运行中，等待整理完成后继续监控生活事件..."
+                )
+                waited = True
+            self._transfer_event.wait(20)
+
+    def _record_latency(self, event):
+        """
+        记录事件发生到生成 STRM 的耗时
+        """
+        update_time = event.get("update_time")
+        if update_time:
+            self.latency.record(
+                "event_to_strm", max(0.0, time.time() - int(update_time))
+            )
+
+    def _load_mediaext(self):
+        """
+        读取媒体文件与下载文件后缀名配置
+        """
+        self.rmt_mediaext = [
+            f".{ext.strip()}"
+            for ext in configer.get_config("user_rmt_mediaext")
+            .replace("，", ",")
+            .split(",")
+        ]
+        self.rmt_mediaext_set = set(self.rmt_mediaext)
+        self.download_mediaext_set = {
+            f".{ext.strip()}"
+            for ext in configer.get_config("user_download_mediaext")
+            .replace("，", ",")
+            .split(",")
+        }
+
+    def _prefetch_parent_paths(self, events: List[Dict], dbhelper: FileDbHelper) -> int:
+        """
+        批量解析事件父目录路径
+
+        先查缓存，未命中的目录通过单次数据库查询获取，剩余的目录去重后再通过 API 获取；
+        本批次内新建的文件夹在处理到时由其父目录路径推导，无需查询
+
+        :param events: 按时间顺序排列的事件
+        :param dbhelper: 数据库操作
+        :return: API 请求次数
+        """
+        created = {
+            int(event["file_id"])
+            for event in events
+            if int(event["type"]) not in self.REMOVE_EVENT_TYPES
+            and int(event.get("file_category", 1)) == 0
+        }
+        pending: Dict[int, None] = {}
+        for event in events:
+            if int(event["type"]) in self.REMOVE_EVENT_TYPES:
+                continue
+            cid = int(event["parent_id"])
+            if cid in self._cid_paths or cid in created or cid in pending:
+                continue
+            if dir_path := idpathcacher.get_dir_by_id(cid):
+                self._cid_paths[cid] = dir_path
+                continue
+            pending[cid] = None
+        if not pending:
+            return 0
+
+        api_count = 0
+        db_paths = dbhelper.get_folder_paths_by_ids(pending)
+        for cid in pending:
+            dir_path = db_paths.get(cid)
+            if not dir_path:
+                dir_path = get_path(client=self._client, cid=cid, root_id=None)
+                api_count += 1
+                if not dir_path:
+                    logger.error(f"获取 {cid} 路径失败")
+                    continue
+            self._cid_paths[cid] = str(dir_path)
+            idpathcacher.add_cache(id=cid, directory=str(dir_path))
+        return api_count
+
+    def _add_cid_path(self, cid: int, file_path: Path):
+        """
+        记录本批次新出现的文件夹路径
+        """
+        self._cid_paths[cid] = str(file_path)
+        idpathcacher.add_cache(id=cid, directory=str(file_path))
+
+    def media_transfer(
+        self,
+        event,
+        file_path: Path,
+        rmt_mediaext,
+        dbhelper: Optional[FileDbHelper] = None,
+    ):
         """
         运行媒体文件整理
         :param event: 事件
         :param file_path: 文件路径
         :param rmt_mediaext: 媒体文件后缀名
+        :param dbhelper: 数据库操作，批量处理时传入批量写入对象
         """
-        _databasehelper = FileDbHelper()
+        _databasehelper = dbhelper or FileDbHelper()
         transferchain = TransferChain()
         file_category = event["file_category"]
         file_id = event["file_id"]
@@ -348,158 +696,238 @@ class MonitorLife:
                 )
                 logger.info(f"【网盘整理】{file_path} 加入整理列队")
 
-    def creata_strm(self, event, file_path):
+    def _scrape_and_refresh(self, new_file_path: Path, original_file_name: str):
         """
-        创建 STRM 文件
+        刮削新生成的 STRM 文件并刷新媒体服务器
         """
-        _databasehelper = FileDbHelper()
+        scrape_metadata = True
+        if configer.get_config("monitor_life_scrape_metadata_enabled"):
+            if configer.get_config("monitor_life_scrape_metadata_exclude_paths"):
+                if PathUtils.get_scrape_metadata_exclude_path(
+                    configer.get_config("monitor_life_scrape_metadata_exclude_paths"),
+                    str(new_file_path),
+                ):
+                    logger.debug(
+                        f"【监控生活事件】匹配到刮削排除目录，不进行刮削: {new_file_path}"
+                    )
+                    scrape_metadata = False
+            if scrape_metadata:
+                media_scrape_metadata(
+                    path=new_file_path,
+                )
+        # 刷新媒体服务器
+        self.refresh_mediaserver(str(new_file_path), str(original_file_name))
 
-        _get_url = StrmUrlGetter()
+    def _write_folder_strm(
+        self, event, new_file_path: Path, strm_url: str, original_file_name: str
+    ) -> bool:
+        """
+        写入文件夹遍历得到的单个 STRM 文件，在线程池中执行
 
-        pickcode = event["pick_code"]
-        file_category = event["file_category"]
-        file_id = event["file_id"]
-        status, target_dir, pan_media_dir = PathUtils.get_media_path(
-            configer.get_config("monitor_life_paths"), file_path
+        :return: 是否生成成功
+        """
+        try:
+            new_file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(new_file_path, "w", encoding="utf-8") as file:
+                file.write(strm_url)
+            logger.info(
+                "【监控生活事件】生成 STRM 文件成功: %s",
+                str(new_file_path),
+            )
+            self._record_latency(event)
+            self._scrape_and_refresh(new_file_path, original_file_name)
+            return True
+        except Exception as e:
+            logger.error(f"【监控生活事件】生成 STRM 文件失败: {new_file_path} {e}")
+            return False
+
+    def _creata_folder_strm(
+        self,
+        event,
+        file_path,
+        target_dir: str,
+        pan_media_dir: str,
+        dbhelper: FileDbHelper,
+        url_getter: StrmUrlGetter,
+    ):
+        """
+        遍历文件夹生成 STRM 文件
+
+        数据库记录按 ID 去重后分批写入，STRM 写入与刮削交由线程池处理，
+        媒体信息文件在遍历结束后加入后台下载队列
+        """
+        creata = "creata" in configer.get_config("monitor_life_event_modes")  # pylint: disable=E1135
+        download_enabled = configer.get_config(
+            "monitor_life_auto_download_mediainfo_enabled"
         )
-        if not status:
-            return
-        logger.debug("【监控生活事件】匹配到网盘文件夹路径: %s", str(pan_media_dir))
+        download_mediainfo_list: List[Dict] = []
+        strm_count = 0
 
-        if file_category == 0:
-            # 文件夹情况，遍历文件夹
-            mediainfo_count = 0
-            strm_count = 0
-            _databasehelper.upsert_batch(
-                _databasehelper.process_life_dir_item(event=event, file_path=file_path)
-            )
+        dbhelper.upsert_batch(
+            dbhelper.process_life_dir_item(event=event, file_path=file_path)
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.strm_workers, thread_name_prefix="life_strm"
+        ) as executor:
             for batch in batched(
-                iter_files_with_path(self._client, cid=int(file_id), cooldown=2),
+                iter_files_with_path(
+                    self._client, cid=int(event["file_id"]), cooldown=2
+                ),
                 7_000,
             ):
-                processed = []
+                processed: Dict[Tuple[str, int], Dict] = {}
+                futures = []
                 for item in batch:
-                    _process_item = _databasehelper.process_item(item)
-                    if _process_item not in processed:
-                        processed.extend(_process_item)
-                    if item["is_dir"]:
+                    for entry in dbhelper.process_item(item):
+                        processed[(entry["table"], int(entry["data"]["id"]))] = entry
+                    if item["is_dir"] or not creata:
                         continue
-                    if "creata" in configer.get_config("monitor_life_event_modes"):  # pylint: disable=E1135
-                        file_path = item["path"]
-                        file_path = Path(target_dir) / Path(file_path).relative_to(
-                            pan_media_dir
-                        )
-                        file_target_dir = file_path.parent
-                        original_file_name = file_path.name
-                        file_name = file_path.stem + ".strm"
-                        new_file_path = file_target_dir / file_name
-
-                        if configer.get_config(
-                            "monitor_life_auto_download_mediainfo_enabled"
-                        ):
-                            if file_path.suffix.lower() in self.download_mediaext_set:
-                                pickcode = item["pickcode"]
-                                if not pickcode:
-                                    logger.error(
-                                        f"【监控生活事件】{original_file_name} 不存在 pickcode 值，无法下载该文件"
-                                    )
-                                    continue
-                                download_url = (
-                                    self.mediainfodownloader.get_download_url(
-                                        pickcode=pickcode
-                                    )
-                                )
-
-                                if not download_url:
-                                    logger.error(
-                                        f"【监控生活事件】{original_file_name} 下载链接获取失败，无法下载该文件"
-                                    )
-                                    continue
-
-                                self.mediainfodownloader.save_mediainfo_file(
-                                    file_path=Path(file_path),
-                                    file_name=original_file_name,
-                                    download_url=download_url,
-                                )
-                                mediainfo_count += 1
-                                continue
-
-                        if file_path.suffix.lower() not in self.rmt_mediaext_set:
-                            logger.warn(
-                                "【监控生活事件】跳过网盘路径: %s",
-                                item["path"],
-                            )
-                            continue
-
-                        if not (
-                            result := StrmGenerater.should_generate_strm(
-                                original_file_name, "life", item.get("size", None)
-                            )
-                        )[1]:
-                            logger.warn(
-                                f"【监控生活事件】{result[0]}，跳过网盘路径: {item['path']}"
-                            )
-                            continue
-
-                        pickcode = item["pickcode"]
-                        if not pickcode:
-                            pickcode = item["pick_code"]
 
-                        new_file_path.parent.mkdir(parents=True, exist_ok=True)
+                    item_path = Path(target_dir) / Path(item["path"]).relative_to(
+                        pan_media_dir
+                    )
+                    original_file_name = item_path.name
+                    new_file_path = item_path.parent / (item_path.stem + ".strm")
 
-                        if not pickcode:
-                            logger.error(
-                                f"【监控生活事件】{original_file_name} 不存在 pickcode 值，无法生成 STRM 文件"
-                            )
-                            continue
-                        if not (len(pickcode) == 17 and str(pickcode).isalnum()):
+                    if (
+                        download_enabled
+                        and item_path.suffix.lower() in self.download_mediaext_set
+                    ):
+                        if not item["pickcode"]:
                             logger.error(
-                                f"【监控生活事件】错误的 pickcode 值 {pickcode}，无法生成 STRM 文件"
+                                f"【监控生活事件】{original_file_name} 不存在 pickcode 值，无法下载该文件"
                             )
                             continue
+                        download_mediainfo_list.append(
+                            {
+                                "type": "local",
+                                "pickcode": item["pickcode"],
+                                "path": item_path,
+                            }
+                        )
+                        continue
+
+                    if item_path.suffix.lower() not in self.rmt_mediaext_set:
+                        logger.warn(
+                            "【监控生活事件】跳过网盘路径: %s",
+                            item["path"],
+                        )
+                        continue
 
-                        strm_url = _get_url.get_strm_url(pickcode, original_file_name)
+                    if not (
+                        result := StrmGenerater.should_generate_strm(
+                            original_file_name, "life", item.get("size", None)
+                        )
+                    )[1]:
+                        logger.warn(
+                            f"【监控生活事件】{result[0]}，跳过网盘路径: {item['path']}"
+                        )
+                        continue
 
-                        with open(new_file_path, "w", encoding="utf-8") as file:
-                            file.write(strm_url)
-                        logger.info(
-                            "【监控生活事件】生成 STRM 文件成功: %s",
-                            str(new_file_path),
+                    pickcode = item["pickcode"] or item.get("pick_code")
+                    if not pickcode:
+                        logger.error(
+                            f"【监控生活事件】{original_file_name} 不存在 pickcode 值，无法生成 STRM 文件"
+                        )
+                        continue
+                    if not (len(pickcode) == 17 and str(pickcode).isalnum()):
+                        logger.error(
+                            f"【监控生活事件】错误的 pickcode 值 {pickcode}，无法生成 STRM 文件"
                         )
-                        strm_count += 1
-                        scrape_metadata = True
-                        if configer.get_config("monitor_life_scrape_metadata_enabled"):
-                            if configer.get_config(
-                                "monitor_life_scrape_metadata_exclude_paths"
-                            ):
-                                if PathUtils.get_scrape_metadata_exclude_path(
-                                    configer.get_config(
-                                        "monitor_life_scrape_metadata_exclude_paths"
-                                    ),
-                                    str(new_file_path),
-                                ):
-                                    logger.debug(
-                                        f"【监控生活事件】匹配到刮削排除目录，不进行刮削: {new_file_path}"
-                                    )
-                                    scrape_metadata = False
-                            if scrape_metadata:
-                                media_scrape_metadata(
-                                    path=new_file_path,
-                                )
-                        # 刷新媒体服务器
-                        self.refresh_mediaserver(
-                            str(new_file_path), str(original_file_name)
+                        continue
+
+                    futures.append(
+                        executor.submit(
+                            self._write_folder_strm,
+                            event,
+                            new_file_path,
+                            url_getter.get_strm_url(pickcode, original_file_name),
+                            original_file_name,
                         )
-                _databasehelper.upsert_batch(processed)
-            if configer.get_config("notify"):
-                if strm_count > 0 or mediainfo_count > 0:
-                    self._monitor_life_notification_queue["life"]["strm_count"] += (
-                        strm_count
                     )
-                    self._monitor_life_notification_queue["life"][
-                        "mediainfo_count"
-                    ] += mediainfo_count
-                    self._schedule_notification()
+                dbhelper.upsert_batch(list(processed.values()))
+                # 每批等待写入完成，避免遍历速度远超写入时积压过多任务
+                strm_count += sum(1 for future in futures if future.result())
+
+        if download_mediainfo_list:
+            self._queue_mediainfo(download_mediainfo_list)
+
+        if configer.get_config("notify") and strm_count > 0:
+            self._monitor_life_notification_queue["life"]["strm_count"] += strm_count
+            self._schedule_notification()
+
+    def _queue_mediainfo(self, downloads_list: List[Dict]):
+        """
+        将媒体信息文件加入后台下载队列
+        """
+        with self._mediainfo_lock:
+            self._mediainfo_queue.put(downloads_list)
+            if self._mediainfo_thread is None:
+                self._mediainfo_thread = Thread(
+                    target=self._mediainfo_worker, daemon=True
+                )
+                self._mediainfo_thread.start()
+        logger.info(
+            f"【监控生活事件】{len(downloads_list)} 个媒体信息文件加入下载队列，"
+            f"待处理批次 {self._mediainfo_queue.qsize()} 个"
+        )
+
+    def _mediainfo_worker(self):
+        """
+        后台依次下载队列中的媒体信息文件，队列清空后退出
+        """
+        while True:
+            with self._mediainfo_lock:
+                if self._mediainfo_queue.empty():
+                    self._mediainfo_thread = None
+                    return
+                downloads_list = self._mediainfo_queue.get()
+            try:
+                mediainfo_count, _, mediainfo_fail_dict = (
+                    self._mediainfo_downloader.auto_downloader(
+                        downloads_list=downloads_list
+                    )
+                )
+            except Exception as e:
+                logger.error(f"【监控生活事件】媒体信息文件下载失败: {e}")
+                continue
+            for path in mediainfo_fail_dict:
+                logger.warn(f"【监控生活事件】{path} 下载错误")
+            if configer.get_config("notify") and mediainfo_count > 0:
+                self._monitor_life_notification_queue["life"]["mediainfo_count"] += (
+                    mediainfo_count
+                )
+                self._schedule_notification()
+
+    def creata_strm(self, event, file_path, dbhelper: Optional[FileDbHelper] = None):
+        """
+        创建 STRM 文件
+
+        :param dbhelper: 数据库操作，批量处理时传入批量写入对象
+        """
+        _databasehelper = dbhelper or FileDbHelper()
+
+        _get_url = StrmUrlGetter()
+
+        pickcode = event["pick_code"]
+        file_category = event["file_category"]
+        status, target_dir, pan_media_dir = PathUtils.get_media_path(
+            configer.get_config("monitor_life_paths"), file_path
+        )
+        if not status:
+            return
+        logger.debug("【监控生活事件】匹配到网盘文件夹路径: %s", str(pan_media_dir))
+
+        if file_category == 0:
+            # 文件夹情况，遍历文件夹
+            self._creata_folder_strm(
+                event=event,
+                file_path=file_path,
+                target_dir=target_dir,
+                pan_media_dir=pan_media_dir,
+                dbhelper=_databasehelper,
+                url_getter=_get_url,
+            )
         else:
             _databasehelper.upsert_batch(
                 _databasehelper.process_life_file_item(event=event, file_path=file_path)
@@ -521,20 +949,14 @@ class MonitorLife:
                                 f"【监控生活事件】{original_file_name} 不存在 pickcode 值，无法下载该文件"
                             )
                             return
-                        download_url = self.mediainfodownloader.get_download_url(
-                            pickcode=pickcode
-                        )
-
-                        if not download_url:
-                            logger.error(
-                                f"【监控生活事件】{original_file_name} 下载链接获取失败，无法下载该文件"
-                            )
-                            return
-
-                        self.mediainfodownloader.save_mediainfo_file(
-                            file_path=Path(file_path),
-                            file_name=original_file_name,
-                            download_url=download_url,
+                        self._queue_mediainfo(
+                            [
+                                {
+                                    "type": "local",
+                                    "pickcode": pickcode,
+                                    "path": Path(file_path),
+                                }
+                            ]
                         )
                         # 下载的元数据写入缓存，与整理事件对比
                         lifeeventcacher.create_strm_file_dict[str(event["file_id"])] = [
@@ -542,11 +964,6 @@ class MonitorLife:
                             target_dir,
                             pan_media_dir,
                         ]
-                        if configer.get_config("notify"):
-                            self._monitor_life_notification_queue["life"][
-                                "mediainfo_count"
-                            ] += 1
-                            self._schedule_notification()
                         return
 
                 if file_path.suffix.lower() not in self.rmt_mediaext_set:
@@ -586,6 +1003,7 @@ class MonitorLife:
                 logger.info(
                     "【监控生活事件】生成 STRM 文件成功: %s", str(new_file_path)
                 )
+                self._record_latency(event)
                 # 生成的STRM写入缓存，与整理事件对比
                 lifeeventcacher.create_strm_file_dict[str(event["file_id"])] = [
                     event["file_name"],
@@ -595,31 +1013,13 @@ class MonitorLife:
                 if configer.get_config("notify"):
                     self._monitor_life_notification_queue["life"]["strm_count"] += 1
                     self._schedule_notification()
-                scrape_metadata = True
-                if configer.get_config("monitor_life_scrape_metadata_enabled"):
-                    if configer.get_config(
-                        "monitor_life_scrape_metadata_exclude_paths"
-                    ):
-                        if PathUtils.get_scrape_metadata_exclude_path(
-                            configer.get_config(
-                                "monitor_life_scrape_metadata_exclude_paths"
-                            ),
-                            str(new_file_path),
-                        ):
-                            logger.debug(
-                                f"【监控生活事件】匹配到刮削排除目录，不进行刮削: {new_file_path}"
-                            )
-                            scrape_metadata = False
-                    if scrape_metadata:
-                        media_scrape_metadata(
-                            path=new_file_path,
-                        )
-                # 刷新媒体服务器
-                self.refresh_mediaserver(str(new_file_path), str(original_file_name))
+                self._scrape_and_refresh(new_file_path, original_file_name)
 
-    def remove_strm(self, event):
+    def remove_strm(self, event, dbhelper: Optional[FileDbHelper] = None):
         """
         删除 STRM 文件
+
+        :param dbhelper: 数据库操作，批量处理时传入批量写入对象
         """
 
         def __remove_parent_dir(file_path: Path):
@@ -671,7 +1071,7 @@ class MonitorLife:
         #                 return None
         #     return None
 
-        _databasehelper = FileDbHelper()
+        _databasehelper = dbhelper or FileDbHelper()
 
         file_path = None
         file_category = event["file_category"]
@@ -786,14 +1186,20 @@ class MonitorLife:
         except Exception as e:
             logger.error(f"【监控生活事件】{file_path} 删除失败: {e}")
 
-    def new_creata_path(self, event):
+    def new_creata_path(self, event, dbhelper: Optional[FileDbHelper] = None):
         """
         处理新出现的路径
+
+        :param dbhelper: 数据库操作，批量处理时传入批量写入对象
         """
         # 1.获取绝对文件路径
         file_name = event["file_name"]
         dir_path = self._get_path_by_cid(int(event["parent_id"]))
+        if not dir_path:
+            return
         file_path = Path(dir_path) / file_name
+        if int(event["file_category"]) == 0:
+            self._add_cid_path(int(event["file_id"]), file_path)
         # 匹配逻辑 整理路径目录 > 生成STRM文件路径目录
         # 2.匹配是否为整理路径目录
         if configer.get_config("pan_transfer_enabled") and configer.get_config(
@@ -807,6 +1213,7 @@ class MonitorLife:
                     event=event,
                     file_path=Path(file_path),
                     rmt_mediaext=self.rmt_mediaext,
+                    dbhelper=dbhelper,
                 )
                 return
         # 3.匹配是否为生成STRM文件路径目录
@@ -817,22 +1224,145 @@ class MonitorLife:
                 # 检查是否命中缓存
                 pantransfercacher.creata_pan_transfer_list.remove(str(event["file_id"]))
                 if "transfer" in configer.get_config("monitor_life_event_modes"):  # pylint: disable=E1135
-                    self.creata_strm(event=event, file_path=file_path)
+                    self.creata_strm(
+                        event=event, file_path=file_path, dbhelper=dbhelper
+                    )
             else:
-                self.creata_strm(event=event, file_path=file_path)
+                self.creata_strm(event=event, file_path=file_path, dbhelper=dbhelper)
 
-    def once_pull(self, from_time, from_id):
+    def remove_path(self, event, dbhelper: Optional[FileDbHelper] = None):
         """
-        单次拉取
+        处理删除的路径
+
+        :param dbhelper: 数据库操作，批量处理时传入批量写入对象
         """
-        while True:
-            if not TransferChain().get_queue_tasks():
-                break
+        if str(event["file_id"]) in pantransfercacher.delete_pan_transfer_list:
+            # 检查是否命中删除文件夹缓存，命中则无需处理
+            pantransfercacher.delete_pan_transfer_list.remove(str(event["file_id"]))
+        else:
+            if (
+                configer.get_config("monitor_life_enabled")
+                and configer.get_config("monitor_life_paths")
+                and "remove" in configer.get_config("monitor_life_event_modes")  # pylint: disable=E1135
+            ):
+                self.remove_strm(event=event, dbhelper=dbhelper)
+
+    def new_folder(self, event, dbhelper: FileDbHelper):
+        """
+        处理创建文件夹事件，直接写入数据库
+        """
+        dir_path = self._get_path_by_cid(int(event["parent_id"]))
+        if not dir_path:
+            return
+        file_path = Path(dir_path) / event["file_name"]
+        self._add_cid_path(int(event["file_id"]), file_path)
+        dbhelper.upsert_batch(
+            dbhelper.process_life_dir_item(event=event, file_path=file_path)
+        )
+
+    def process_events(
+        self, events: List[Dict], cursor: Optional[LifeEventCursor] = None
+    ):
+        """
+        批量处理一次拉取的事件
+
+        事件按时间顺序划分为连续的同类分组（每组最多 commit_size 个）依次处理，每个分组产生的
+        数据库写入与删除在分组结束时于单个事务中提交，删除分组开始前之前的写入均已提交，
+        保证删除时能从数据库读取到路径
+
+        :param events: 按时间顺序排列的事件
+        :param cursor: 拉取游标，传入时跳过已处理的事件，并在每组提交后记录
+        """
+        start = time.perf_counter()
+        self._load_mediaext()
+        writer = FileDbBatchWriter()
+
+        handled_types = (
+            self.CREATE_EVENT_TYPES | self.FOLDER_EVENT_TYPES | self.REMOVE_EVENT_TYPES
+        )
+        handled = []
+        skipped = 0
+        for event in events:
             logger.debug(
-                "【监控生活事件】MoviePilot 整理运行中，等待整理完成后继续监控生活事件..."
+                f"【监控生活事件】{BEHAVIOR_TYPE_TO_NAME[event['type']]}: {event}"
             )
-            time.sleep(20)
+            if int(event["type"]) not in handled_types:
+                continue
+            if cursor and cursor.is_processed(event["id"]):
+                skipped += 1
+                continue
+            handled.append(event)
 
+        counts: Dict[str, int] = defaultdict(int)
+        elapsed: Dict[str, float] = defaultdict(float)
+        db_ops = 0
+        try:
+            t = time.perf_counter()
+            api_count = self._prefetch_parent_paths(handled, writer)
+            elapsed["resolve"] = time.perf_counter() - t
+
+            groups = (
+                (is_remove, chunk)
+                for is_remove, group in groupby(
+                    handled, key=lambda e: int(e["type"]) in self.REMOVE_EVENT_TYPES
+                )
+                for chunk in batched(group, self.commit_size)
+            )
+            for is_remove, group in groups:
+                t = time.perf_counter()
+                for event in group:
+                    event_type = int(event["type"])
+                    if event_type in self.CREATE_EVENT_TYPES:
+                        # 新路径事件处理
+                        counts["create"] += 1
+                        self.new_creata_path(event=event, dbhelper=writer)
+                    elif event_type in self.FOLDER_EVENT_TYPES:
+                        # 对于创建文件夹事件直接写入数据库
+                        counts["folder"] += 1
+                        self.new_folder(event=event, dbhelper=writer)
+                    else:
+                        # 删除文件/文件夹事件处理
+                        counts["remove"] += 1
+                        self.remove_path(event=event, dbhelper=writer)
+                elapsed["remove" if is_remove else "create"] += time.perf_counter() - t
+
+                t = time.perf_counter()
+                db_ops += writer.flush()
+                elapsed["db"] += time.perf_counter() - t
+
+                if cursor:
+                    cursor.mark_processed(event["id"] for event in group)
+                    # 游标推进到本组最后一个事件，异常退出后只需重放之后的事件
+                    last = group[-1]
+                    cursor.advance(int(last["update_time"]), int(last["id"]))
+                    cursor.save()
+        finally:
+            self._cid_paths.clear()
+
+        logger.info(
+            f"【监控生活事件】处理 {len(handled)}/{len(events)} 个事件"
+            f"（新路径 {counts['create']}，新建文件夹 {counts['folder']}，删除 {counts['remove']}，"
+            f"已处理跳过 {skipped}），"
+            f"路径解析 {elapsed['resolve']:.2f}s（API {api_count} 次），"
+            f"新路径处理 {elapsed['create']:.2f}s，删除处理 {elapsed['remove']:.2f}s，"
+            f"数据库写入 {elapsed['db']:.2f}s（{db_ops} 项），"
+            f"总耗时 {time.perf_counter() - start:.2f}s"
+        )
+
+    def once_pull(self, cursor: LifeEventCursor) -> int:
+        """
+        单次拉取
+
+        处理完成后推进游标并保存，再按自适应间隔等待下一次拉取
+
+        :param cursor: 拉取游标
+        :return: 拉取到的事件数
+        """
+        self._wait_transfer_queue()
+        if self._stop_event.is_set():
+            return 0
+
+        from_time, from_id = cursor.from_time, cursor.from_id
         events_batch: List = []
         return_from_time: int = from_time
         return_from_id: int = from_id
@@ -849,7 +1379,7 @@ class MonitorLife:
                     from_time=from_time,
                     from_id=from_id,
                     app="web",
-                    cooldown=2,
+                    cooldown=self.poller.cooldown,
                 )
 
                 try:
@@ -868,6 +1398,13 @@ class MonitorLife:
                 events_batch.extend(list(events_iterator))
                 break
             except Exception as e:
+                if self.poller.is_risk_control(e):
+                    self.poller.on_risk_control()
+                    logger.warn(
+                        f"【监控生活事件】拉取数据触发风控，{self.poller.interval:.0f}s 后重试：{e}"
+                    )
+                    self.poller.wait()
+                    return 0
                 if attempt <= 0:
                     logger.error("【监控生活事件】拉取数据失败：%s", e)
                     raise
@@ -876,79 +1413,13 @@ class MonitorLife:
                 )
                 time.sleep(2)
 
-        if not events_batch:
-            time.sleep(20)
-            return from_time, from_id
-
-        for event in reversed(events_batch):
-            self.rmt_mediaext = [
-                f".{ext.strip()}"
-                for ext in configer.get_config("user_rmt_mediaext")
-                .replace("，", ",")
-                .split(",")
-            ]
-            self.rmt_mediaext_set = set(self.rmt_mediaext)
-            self.download_mediaext_set = {
-                f".{ext.strip()}"
-                for ext in configer.get_config("user_download_mediaext")
-                .replace("，", ",")
-                .split(",")
-            }
-
-            logger.debug(
-                f"【监控生活事件】{BEHAVIOR_TYPE_TO_NAME[event['type']]}: {event}"
-            )
-
-            if (
-                int(event["type"]) != 1
-                and int(event["type"]) != 2
-                and int(event["type"]) != 5
-                and int(event["type"]) != 6
-                and int(event["type"]) != 14
-                and int(event["type"]) != 17
-                and int(event["type"]) != 18
-                and int(event["type"]) != 22
-            ):
-                continue
-
-            if (
-                int(event["type"]) == 1
-                or int(event["type"]) == 2
-                or int(event["type"]) == 5
-                or int(event["type"]) == 6
-                or int(event["type"]) == 14
-                or int(event["type"]) == 18
-            ):
-                # 新路径事件处理
-                self.new_creata_path(event=event)
-
-            if int(event["type"]) == 22:
-                # 删除文件/文件夹事件处理
-                if str(event["file_id"]) in pantransfercacher.delete_pan_transfer_list:
-                    # 检查是否命中删除文件夹缓存，命中则无需处理
-                    pantransfercacher.delete_pan_transfer_list.remove(
-                        str(event["file_id"])
-                    )
-                else:
-                    if (
-                        configer.get_config("monitor_life_enabled")
-                        and configer.get_config("monitor_life_paths")
-                        and "remove" in configer.get_config("monitor_life_event_modes")  # pylint: disable=E1135
-                    ):
-                        self.remove_strm(event=event)
-
-            if int(event["type"]) == 17:
-                # 对于创建文件夹事件直接写入数据库
-                _databasehelper = FileDbHelper()
-                file_name = event["file_name"]
-                dir_path = self._get_path_by_cid(int(event["parent_id"]))
-                file_path = Path(dir_path) / file_name
-                _databasehelper.upsert_batch(
-                    _databasehelper.process_life_dir_item(
-                        event=event, file_path=file_path
-                    )
-                )
-        return return_from_time, return_from_id
+        if events_batch:
+            self.process_events(list(reversed(events_batch)), cursor)
+            cursor.advance(return_from_time, return_from_id)
+            cursor.save()
+        self.poller.on_pull(len(events_batch))
+        self.poller.wait()
+        return len(events_batch)
 
     def check_status(self):
         """
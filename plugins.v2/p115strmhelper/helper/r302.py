@@ -1,24 +1,43 @@
+import asyncio
 from collections.abc import Mapping
+from time import perf_counter
 from typing import cast, Dict, Optional
 from errno import EIO, ENOENT
 from urllib.parse import parse_qsl, unquote, urlsplit, urlencode
-from threading import Timer
 
-import requests
 from orjson import dumps, loads
 from p115client import P115Client
-from p115client import check_response as p115_check_response
-from p115pickcode import to_id
 from p115rsacipher import encrypt, decrypt
 
 from app.log import logger
 
 from ..core.u115_open import U115OpenHelper
 from ..core.config import configer
-from ..core.cache import r302cacher
-from ..utils.http import check_response
+from ..core.cache import r302cacher, shareresolvecacher
+from ..utils.http import (
+    check_response,
+    AsyncPooledHttpClient,
+    LatencyRecorder,
+    PooledHttpClient,
+)
+from ..utils.metrics import RequestMetrics
+from ..utils.pipeline import AsyncLimiter
+from ..utils.singleflight import AsyncSingleFlight, SingleFlight
 from ..utils.url import Url
 from ..utils.sentry import sentry_manager
+from .r302_copy import CopyPool
+
+
+# 302 跳转共享的连接池客户端
+r302_http_client = PooledHttpClient()
+# 302 跳转相同文件并发请求合并
+r302_singleflight = SingleFlight()
+# 异步 302 跳转使用的客户端、请求合并与并发限制
+r302_async_http_client = AsyncPooledHttpClient(r302_http_client)
+r302_async_singleflight = AsyncSingleFlight()
+r302_async_limiter = AsyncLimiter(limit=64, recorder=LatencyRecorder())
+# 302 跳转缓存命中与处理耗时统计，类型为 cookie/open/share
+r302_metrics = RequestMetrics()
 
 
 @sentry_manager.capture_all_class_exceptions
@@ -30,8 +49,23 @@ class Redirect:
     def __init__(self, client: P115Client, pid: Optional[int] = None):
         self.client = client
         self.u115openhelper = U115OpenHelper()
+        self.http_client = r302_http_client
 
         self.pid = pid
+        self.copy_pool = CopyPool(client, pid) if pid else None
+        if self.copy_pool:
+            self.copy_pool.start()
+
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        通过共享连接池发送请求
+        """
+        return self.http_client.request(
+            method,
+            url,
+            http2=configer.get_config("link_redirect_http2_enabled"),
+            **kwargs,
+        )
 
     @staticmethod
     def get_first(m: Mapping, *keys, default=None):
@@ -40,26 +74,26 @@ class Redirect:
                 return m[k]
         return default
 
-    def get_pickcode_for_copy(self, pickcode: str) -> Optional[str]:
+    def get_pickcode_for_copy(self, pickcode: str, user_agent: str = "") -> str:
         """
-        通过复制文件获取二次 PickCode
+        获取供当前 UA 使用的副本 PickCode，未开启多端播放时返回原 PickCode
         """
-        if not self.pid:
-            return None
-        resp = self.client.fs_copy(to_id(pickcode), pid=self.pid)
-        p115_check_response(resp)
-        payload = {"cid": self.pid, "o": "user_ptime", "asc": 0}
-        resp = self.client.fs_files(payload)
-        p115_check_response(resp)
-        data = resp.get("data")[0]
-        return data.get("pc", None)
+        if not self.copy_pool:
+            return pickcode
+        start = perf_counter()
+        try:
+            return self.copy_pool.acquire(pickcode, user_agent or "NoUA")
+        finally:
+            self.http_client.recorder.record(
+                "same_playback_copy", perf_counter() - start
+            )
 
-    def delayed_remove(self, pickcode: str) -> None:
+    def stop(self) -> None:
         """
-        延迟删除
+        停止后台任务
         """
-        self.client.fs_delete(to_id(pickcode))
-        logger.debug(f"【302跳转服务】清理 {pickcode} 文件")
+        if self.copy_pool:
+            self.copy_pool.stop()
 
     def share_get_id_for_name(
         self,
@@ -69,7 +103,21 @@ class Redirect:
         parent_id: int = 0,
     ) -> int:
         """
-        分享通过名字获取ID
+        分享通过名字获取ID，优先使用本地索引
+        """
+        if not parent_id and (file_id := shareresolvecacher.get_id(share_code, name)):
+            return file_id
+        return self._search_id_for_name(share_code, receive_code, name, parent_id)
+
+    def _search_id_for_name(
+        self,
+        share_code: str,
+        receive_code: str,
+        name: str,
+        parent_id: int = 0,
+    ) -> int:
+        """
+        分享搜索文件名获取ID
         """
         api = "http://web.api.115.com/share/search"
         payload = {
@@ -83,7 +131,8 @@ class Redirect:
         suffix = name.rpartition(".")[-1]
         if suffix.isalnum():
             payload["suffix"] = suffix
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{api}?{urlencode(payload)}",
             headers={"Cookie": configer.get_config("cookies")},
         )
@@ -91,7 +140,8 @@ class Redirect:
         json = loads(cast(bytes, resp.content))
         if self.get_first(json, "errno", "errNo") == 20021:
             payload.pop("suffix")
-            resp = requests.get(
+            resp = self._request(
+                "GET",
                 f"{api}?{urlencode(payload)}",
                 headers={"Cookie": configer.get_config("cookies")},
             )
@@ -103,13 +153,24 @@ class Redirect:
         if info["n"] != name:
             raise FileNotFoundError(ENOENT, f"name not found: {name!r}")
         id = int(info["fid"])
+        if not parent_id:
+            shareresolvecacher.add_id(share_code, name, id)
         return id
 
     def get_receive_code(self, share_code: str) -> str:
         """
-        获取接收码
+        获取接收码，优先使用本地索引
         """
-        resp = requests.get(
+        if receive_code := shareresolvecacher.get_receive_code(share_code):
+            return receive_code
+        return self._fetch_receive_code(share_code)
+
+    def _fetch_receive_code(self, share_code: str) -> str:
+        """
+        请求上游获取接收码，并覆盖本地索引中的接收码
+        """
+        resp = self._request(
+            "GET",
             f"http://web.api.115.com/share/shareinfo?share_code={share_code}",
             headers={"Cookie": configer.get_config("cookies")},
         )
@@ -118,6 +179,7 @@ class Redirect:
         if not json["state"]:
             raise FileNotFoundError(ENOENT, json)
         receive_code = json["data"]["receive_code"]
+        shareresolvecacher.add_receive_code(share_code, receive_code)
         return receive_code
 
     def get_downurl_cookie(
@@ -133,9 +195,38 @@ class Redirect:
         else:
             cache_ua = user_agent
 
-        if r302cacher.get(pickcode, cache_ua):
-            cache_url = r302cacher.get(pickcode, cache_ua)
+        if cache_url := r302cacher.get(pickcode, cache_ua):
             logger.debug(f"【302跳转服务】缓存获取 {pickcode} {cache_ua} {cache_url}")
+            r302_metrics.hit("cookie")
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+
+        url = self.resolve_downurl_cookie(pickcode, user_agent)
+        r302_metrics.miss("cookie")
+        return url
+
+    def resolve_downurl_cookie(self, pickcode: str, user_agent: str = "") -> Url:
+        """
+        获取下载链接（Cookie），不计入命中统计
+        """
+        cache_ua = user_agent or "NoUA"
+        return r302_singleflight.do(
+            ("cookie", pickcode, cache_ua),
+            lambda: self._fetch_downurl_cookie(pickcode, cache_ua, user_agent),
+        )
+
+    def _fetch_downurl_cookie(
+        self, pickcode: str, cache_ua: str, user_agent: str, refresh: bool = False
+    ) -> Url:
+        """
+        请求上游获取下载链接（Cookie）
+
+        :param refresh: 刷新模式，忽略已有缓存
+        """
+        # 合并等待期间其它请求可能已经写入缓存
+        if not refresh and (cache_url := r302cacher.get(pickcode, cache_ua)):
             return Url.of(
                 cache_url,
                 {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
@@ -143,13 +234,15 @@ class Redirect:
 
         post_pickcode = pickcode
         if (
-            configer.get_config("same_playback")
+            not refresh
+            and configer.get_config("same_playback")
             and r302cacher.count_by_pick_code(pickcode) > 0
         ):
-            post_pickcode = self.get_pickcode_for_copy(pickcode)
+            post_pickcode = self.get_pickcode_for_copy(pickcode, cache_ua)
             logger.debug(f"【302跳转服务】多端播放开启 {pickcode} -> {post_pickcode}")
 
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             "http://proapi.115.com/android/2.0/ufile/download",
             data={
                 "data": encrypt(f'{{"pick_code":"{post_pickcode}"}}').decode("utf-8")
@@ -159,6 +252,15 @@ class Redirect:
                 "Cookie": configer.get_config("cookies"),
             },
         )
+        url = self._cache_downurl_cookie(resp, pickcode, cache_ua)
+
+        return url
+
+    @staticmethod
+    def _cache_downurl_cookie(resp, pickcode: str, cache_ua: str) -> Url:
+        """
+        解析 Cookie 方式下载接口的响应并写入缓存
+        """
         check_response(resp)
         json = loads(cast(bytes, resp.content))
         if not json["state"]:
@@ -174,16 +276,191 @@ class Redirect:
         logger.debug(
             f"【302跳转服务】添加至缓存 {pickcode} {cache_ua} {url} {expires_time}"
         )
+        return url
+
+    async def get_downurl_cookie_async(
+        self,
+        pickcode: str,
+        user_agent: str = "",
+    ) -> Url:
+        """
+        获取下载链接（异步）
+        """
+        if not user_agent:
+            cache_ua = "NoUA"
+        else:
+            cache_ua = user_agent
+
+        if cache_url := r302cacher.get(pickcode, cache_ua):
+            logger.debug(f"【302跳转服务】缓存获取 {pickcode} {cache_ua} {cache_url}")
+            r302_metrics.hit("cookie")
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+
+        url = await r302_async_singleflight.do(
+            ("cookie", pickcode, cache_ua),
+            lambda: r302_async_limiter.run(
+                lambda: self._fetch_downurl_cookie_async(pickcode, cache_ua, user_agent)
+            ),
+        )
+        r302_metrics.miss("cookie")
+        return url
+
+    async def _fetch_downurl_cookie_async(
+        self, pickcode: str, cache_ua: str, user_agent: str
+    ) -> Url:
+        """
+        请求上游获取下载链接（Cookie，异步）
+        """
+        if cache_url := r302cacher.get(pickcode, cache_ua):
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+
+        post_pickcode = pickcode
+        if (
+            configer.get_config("same_playback")
+            and r302cacher.count_by_pick_code(pickcode) > 0
+        ):
+            post_pickcode = await asyncio.to_thread(
+                self.get_pickcode_for_copy, pickcode, cache_ua
+            )
+            logger.debug(f"【302跳转服务】多端播放开启 {pickcode} -> {post_pickcode}")
+
+        resp = await r302_async_http_client.request(
+            "POST",
+            "http://proapi.115.com/android/2.0/ufile/download",
+            http2=configer.get_config("link_redirect_http2_enabled"),
+            data={
+                "data": encrypt(f'{{"pick_code":"{post_pickcode}"}}').decode("utf-8")
+            },
+            headers={
+                "User-Agent": user_agent,
+                "Cookie": configer.get_config("cookies"),
+            },
+        )
+        url = self._cache_downurl_cookie(resp, pickcode, cache_ua)
+
+        return url
 
-        if post_pickcode != pickcode:
-            Timer(
-                5.0,
-                self.delayed_remove,
-                args=(post_pickcode,),
-            ).start()
+    async def get_downurl_open_async(
+        self,
+        pickcode: str,
+        user_agent: str = "",
+    ) -> Url:
+        """
+        获取下载链接（异步，OpenAPI 客户端为同步实现，在线程中执行）
+        """
+        if cache_url := r302cacher.get(pickcode, user_agent or "NoUA"):
+            r302_metrics.hit("open")
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+        url = await r302_async_singleflight.do(
+            ("open", pickcode, user_agent or "NoUA"),
+            lambda: r302_async_limiter.run(
+                lambda: asyncio.to_thread(
+                    self.resolve_downurl_open, pickcode, user_agent
+                )
+            ),
+        )
+        r302_metrics.miss("open")
+        return url
 
+    async def get_share_downurl_async(
+        self, share_code: str, receive_code: str, file_id: int, user_agent: str = ""
+    ) -> Url:
+        """
+        获取分享下载链接（异步，在线程中执行）
+        """
+        if cache_url := r302cacher.get(
+            f"{share_code}{receive_code}{file_id}", user_agent or "NoUA"
+        ):
+            r302_metrics.hit("share")
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+        url = await r302_async_singleflight.do(
+            ("share", share_code, receive_code, file_id, user_agent or "NoUA"),
+            lambda: r302_async_limiter.run(
+                lambda: asyncio.to_thread(
+                    self.resolve_share_downurl,
+                    share_code,
+                    receive_code,
+                    file_id,
+                    user_agent,
+                )
+            ),
+        )
+        r302_metrics.miss("share")
         return url
 
+    async def get_receive_code_async(self, share_code: str) -> str:
+        """
+        获取接收码（异步，在线程中执行）
+        """
+        if receive_code := shareresolvecacher.get_receive_code(share_code):
+            return receive_code
+        return await r302_async_limiter.run(
+            lambda: asyncio.to_thread(self._fetch_receive_code, share_code)
+        )
+
+    async def share_get_id_for_name_async(
+        self,
+        share_code: str,
+        receive_code: str,
+        name: str,
+        parent_id: int = 0,
+    ) -> int:
+        """
+        分享通过名字获取ID（异步，在线程中执行）
+        """
+        if not parent_id and (file_id := shareresolvecacher.get_id(share_code, name)):
+            return file_id
+        return await r302_async_limiter.run(
+            lambda: asyncio.to_thread(
+                self._search_id_for_name, share_code, receive_code, name, parent_id
+            )
+        )
+
+    def refresh_downurl(self, mode: str, pickcode: str, user_agent: str = "") -> bool:
+        """
+        在缓存过期前重新获取下载链接
+
+        多端播放开启且存在其它 UA 的缓存时跳过，避免与其它设备争用同一文件
+
+        :param mode: 302 跳转方式 cookie/open
+        :param pickcode: 文件 PickCode
+        :param user_agent: 客户端 UA
+        :return: 是否已刷新
+        """
+        cache_ua = user_agent or "NoUA"
+        if (
+            configer.get_config("same_playback")
+            and r302cacher.count_by_pick_code(pickcode) > 1
+        ):
+            return False
+        if mode == "cookie":
+            r302_singleflight.do(
+                ("cookie", pickcode, cache_ua),
+                lambda: self._fetch_downurl_cookie(
+                    pickcode, cache_ua, user_agent, refresh=True
+                ),
+            )
+        else:
+            r302_singleflight.do(
+                ("open", pickcode, cache_ua),
+                lambda: self._fetch_downurl_open(
+                    pickcode, cache_ua, user_agent, refresh=True
+                ),
+            )
+        return True
+
     def get_downurl_open(
         self,
         pickcode: str,
@@ -197,9 +474,38 @@ class Redirect:
         else:
             cache_ua = user_agent
 
-        if r302cacher.get(pickcode, cache_ua):
-            cache_url = r302cacher.get(pickcode, cache_ua)
+        if cache_url := r302cacher.get(pickcode, cache_ua):
             logger.debug(f"【302跳转服务】缓存获取 {pickcode} {cache_ua} {cache_url}")
+            r302_metrics.hit("open")
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+
+        url = self.resolve_downurl_open(pickcode, user_agent)
+        r302_metrics.miss("open")
+        return url
+
+    def resolve_downurl_open(self, pickcode: str, user_agent: str = "") -> Url:
+        """
+        获取下载链接（OpenAPI），不计入命中统计
+        """
+        cache_ua = user_agent or "NoUA"
+        return r302_singleflight.do(
+            ("open", pickcode, cache_ua),
+            lambda: self._fetch_downurl_open(pickcode, cache_ua, user_agent),
+        )
+
+    def _fetch_downurl_open(
+        self, pickcode: str, cache_ua: str, user_agent: str, refresh: bool = False
+    ) -> Url:
+        """
+        请求上游获取下载链接（OpenAPI）
+
+        :param refresh: 刷新模式，忽略已有缓存
+        """
+        # 合并等待期间其它请求可能已经写入缓存
+        if not refresh and (cache_url := r302cacher.get(pickcode, cache_ua)):
             return Url.of(
                 cache_url,
                 {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
@@ -207,15 +513,22 @@ class Redirect:
 
         post_pickcode = pickcode
         if (
-            configer.get_config("same_playback")
+            not refresh
+            and configer.get_config("same_playback")
             and r302cacher.count_by_pick_code(pickcode) > 0
         ):
-            post_pickcode = self.get_pickcode_for_copy(pickcode)
+            post_pickcode = self.get_pickcode_for_copy(pickcode, cache_ua)
             logger.debug(f"【302跳转服务】多端播放开启 {pickcode} -> {post_pickcode}")
 
+        start = perf_counter()
         resp_url = self.u115openhelper.get_download_url(
             pickcode=post_pickcode, user_agent=user_agent
         )
+        self.http_client.recorder.record(
+            "proapi.115.com/open/ufile/downurl",
+            perf_counter() - start,
+            error=not resp_url,
+        )
         data: Dict = {}
         data["file_name"] = unquote(urlsplit(resp_url).path.rpartition("/")[-1])
 
@@ -228,13 +541,6 @@ class Redirect:
             f"【302跳转服务】添加至缓存 {pickcode} {cache_ua} {resp_url} {expires_time}"
         )
 
-        if post_pickcode != pickcode:
-            Timer(
-                5.0,
-                self.delayed_remove,
-                args=(post_pickcode,),
-            ).start()
-
         return Url.of(resp_url, data)
 
     def get_share_downurl(
@@ -248,11 +554,46 @@ class Redirect:
         else:
             cache_ua = user_agent
 
-        if r302cacher.get(f"{share_code}{receive_code}{file_id}", cache_ua):
-            cache_url = r302cacher.get(f"{share_code}{receive_code}{file_id}", cache_ua)
+        if cache_url := r302cacher.get(
+            f"{share_code}{receive_code}{file_id}", cache_ua
+        ):
             logger.debug(
                 f"【302跳转服务】分享缓存获取 {share_code} {receive_code} {file_id} {cache_ua} {cache_url}"
             )
+            r302_metrics.hit("share")
+            return Url.of(
+                cache_url,
+                {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
+            )
+
+        url = self.resolve_share_downurl(share_code, receive_code, file_id, user_agent)
+        r302_metrics.miss("share")
+        return url
+
+    def resolve_share_downurl(
+        self, share_code: str, receive_code: str, file_id: int, user_agent: str = ""
+    ) -> Url:
+        """
+        获取分享下载链接，不计入命中统计
+        """
+        cache_ua = user_agent or "NoUA"
+        return r302_singleflight.do(
+            ("share", share_code, receive_code, file_id, cache_ua),
+            lambda: self._fetch_share_downurl(
+                share_code, receive_code, file_id, cache_ua
+            ),
+        )
+
+    def _fetch_share_downurl(
+        self, share_code: str, receive_code: str, file_id: int, cache_ua: str
+    ) -> Url:
+        """
+        请求上游获取分享下载链接
+        """
+        # 合并等待期间其它请求可能已经写入缓存
+        if cache_url := r302cacher.get(
+            f"{share_code}{receive_code}{file_id}", cache_ua
+        ):
             return Url.of(
                 cache_url,
                 {"file_name": unquote(urlsplit(cache_url).path.rpartition("/")[-1])},
@@ -263,7 +604,8 @@ class Redirect:
             "receive_code": receive_code,
             "file_id": file_id,
         }
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             "http://proapi.115.com/app/share/downurl",
             data={"data": encrypt(dumps(payload)).decode("utf-8")},
             headers={"Cookie": configer.get_config("cookies")},
@@ -272,8 +614,13 @@ class Redirect:
         json = loads(cast(bytes, resp.content))
         if not json["state"]:
             if json.get("errno") == 4100008:
-                receive_code = self.get_receive_code(share_code)
-                return self.get_share_downurl(share_code, receive_code, file_id)
+                # 接收码已变更，绕过本地索引重新获取并覆盖缓存
+                new_receive_code = self._fetch_receive_code(share_code)
+                if new_receive_code == receive_code:
+                    raise OSError(EIO, json)
+                return self.resolve_share_downurl(
+                    share_code, new_receive_code, file_id, cache_ua
+                )
             raise OSError(EIO, json)
         data = json["data"] = loads(decrypt(json["data"]))
         if not (data and (url_info := data["url"])):
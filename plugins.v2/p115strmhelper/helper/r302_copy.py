@@ -0,0 +1,217 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from time import time
+from typing import Dict, List, Optional
+
+from p115client import P115Client
+from p115client import check_response as p115_check_response
+from p115pickcode import to_id
+
+from app.log import logger
+
+from ..db_manager.oper import FileDbHelper
+from ..utils.sentry import sentry_manager
+
+
+@dataclass
+class _Copy:
+    """
+    多端播放副本
+    """
+
+    id: int
+    pickcode: str
+    last_used: float
+
+
+@sentry_manager.capture_all_class_exceptions
+class CopyPool:
+    """
+    多端播放副本池
+
+    每个源文件按客户端 UA 租用副本，同一 UA 再次播放时复用原副本；
+    闲置超时的副本由后台线程定时批量删除
+    """
+
+    # 副本闲置超时（秒）
+    idle_ttl = 600
+    # 回收检查间隔（秒）
+    gc_interval = 60
+    # 每个源文件最多保留的副本数，超出时直接使用源文件
+    max_copies = 4
+    # 查找新副本时读取的目录条目数
+    list_limit = 32
+
+    def __init__(self, client: P115Client, pid: int):
+        """
+        :param client: 115 客户端
+        :param pid: 存放副本的目录 ID
+        """
+        self.client = client
+        self.pid = pid
+        # 源 pickcode -> {UA -> 副本}，内层按使用时间排序
+        self._pool: Dict[str, OrderedDict[str, _Copy]] = {}
+        self._known_ids = set()
+        # 删除失败待重试的副本 ID
+        self._pending_delete: List[int] = []
+        self._lock = Lock()
+        # 副本创建需串行，保证目录中最新的条目即为本次复制结果
+        self._create_lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self.created = 0
+        self.reused = 0
+        self.deleted = 0
+        self.overflow = 0
+
+    def start(self) -> None:
+        """
+        启动后台回收
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._gc_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        停止后台回收并删除所有副本
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.gc(force=True)
+
+    def acquire(self, pickcode: str, user_agent: str) -> str:
+        """
+        获取供指定 UA 使用的副本 pickcode
+
+        :param pickcode: 源文件 pickcode
+        :param user_agent: 客户端 UA
+        :return: 副本 pickcode，创建失败时返回源 pickcode
+        """
+        now = time()
+        with self._lock:
+            leases = self._pool.get(pickcode)
+            if leases is not None:
+                copy = leases.get(user_agent)
+                if copy is not None:
+                    copy.last_used = now
+                    leases.move_to_end(user_agent)
+                    self.reused += 1
+                    return copy.pickcode
+                if len(leases) >= self.max_copies:
+                    # 其它副本可能仍在播放，不能转租，直接使用源文件
+                    self.overflow += 1
+                    logger.debug(
+                        f"【302跳转服务】多端播放副本数已达上限，使用源文件 {pickcode}"
+                    )
+                    return pickcode
+
+        try:
+            copy = self._create_copy(pickcode)
+        except Exception as e:
+            logger.error(f"【302跳转服务】多端播放创建副本失败 {pickcode}: {e}")
+            return pickcode
+        if copy is None:
+            return pickcode
+
+        with self._lock:
+            self._pool.setdefault(pickcode, OrderedDict())[user_agent] = copy
+            self._known_ids.add(copy.id)
+            self.created += 1
+        logger.debug(f"【302跳转服务】多端播放创建副本 {pickcode} -> {copy.pickcode}")
+        return copy.pickcode
+
+    def _create_copy(self, pickcode: str) -> Optional[_Copy]:
+        """
+        复制源文件到副本目录，并找到新副本
+        """
+        source = FileDbHelper().get_by_id(to_id(pickcode))
+        sha1 = (source or {}).get("sha1") or ""
+        with self._create_lock:
+            resp = self.client.fs_copy(to_id(pickcode), pid=self.pid)
+            p115_check_response(resp)
+            payload = {
+                "cid": self.pid,
+                "o": "user_ptime",
+                "asc": 0,
+                "limit": self.list_limit,
+            }
+            resp = self.client.fs_files(payload)
+            p115_check_response(resp)
+            with self._lock:
+                known_ids = set(self._known_ids)
+            candidates = [
+                item
+                for item in resp.get("data", [])
+                if item.get("pc") and int(item.get("fid", 0)) not in known_ids
+            ]
+            if sha1:
+                candidates = [
+                    item
+                    for item in candidates
+                    if (item.get("sha") or "").upper() == sha1.upper()
+                ] or candidates
+        if not candidates:
+            return None
+        item = candidates[0]
+        return _Copy(id=int(item["fid"]), pickcode=item["pc"], last_used=time())
+
+    def gc(self, force: bool = False) -> None:
+        """
+        批量删除闲置副本
+
+        :param force: 删除所有副本
+        """
+        deadline = time() - self.idle_ttl
+        with self._lock:
+            ids, self._pending_delete = self._pending_delete, []
+            for pickcode in list(self._pool):
+                leases = self._pool[pickcode]
+                for user_agent in [
+                    ua for ua, c in leases.items() if force or c.last_used <= deadline
+                ]:
+                    ids.append(leases.pop(user_agent).id)
+                if not leases:
+                    del self._pool[pickcode]
+        if not ids:
+            return
+        try:
+            p115_check_response(self.client.fs_delete(ids))
+        except Exception as e:
+            logger.error(f"【302跳转服务】多端播放清理副本失败: {e}")
+            # 下次回收时重试
+            with self._lock:
+                self._pending_delete.extend(ids)
+            return
+        with self._lock:
+            self._known_ids.difference_update(ids)
+            self.deleted += len(ids)
+        logger.debug(f"【302跳转服务】多端播放清理 {len(ids)} 个副本")
+
+    def _gc_loop(self) -> None:
+        """
+        定时回收
+        """
+        while not self._stop_event.wait(self.gc_interval):
+            self.gc()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        输出统计
+
+        :return: {copies, created, reused, deleted, overflow}
+        """
+        with self._lock:
+            copies = sum(len(leases) for leases in self._pool.values())
+        return {
+            "copies": copies,
+            "created": self.created,
+            "reused": self.reused,
+            "deleted": self.deleted,
+            "overflow": self.overflow,
+        }
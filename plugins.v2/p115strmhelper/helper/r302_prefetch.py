@@ -0,0 +1,196 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+from time import time
+from typing import Dict, Optional, Tuple
+
+from p115pickcode import to_id
+
+from app.log import logger
+
+from ..core.cache import r302cacher
+from ..core.config import configer
+from ..db_manager.oper import FileDbHelper
+from ..utils.pipeline import RateLimiter
+from ..utils.sentry import sentry_manager
+
+
+@sentry_manager.capture_all_class_exceptions
+class R302Prefetcher:
+    """
+    302 跳转下载链接预取
+
+    后台刷新最近播放文件即将过期的下载链接，并可在播放剧集时预取同目录下一集的下载链接，
+    所有上游请求共享同一个限速器
+    """
+
+    # 后台检查间隔（秒）
+    check_interval = 30
+    # 距离缓存过期不足该时间（秒）时刷新
+    refresh_ahead = 120
+    # 最近该时间（秒）内播放过的文件视为热点
+    hot_window = 60 * 60 * 3
+    # 热点记录上限
+    hot_maxsize = 512
+
+    def __init__(self, redirect):
+        """
+        :param redirect: 302 跳转模块
+        """
+        self.redirect = redirect
+        self.limiter = RateLimiter(
+            rate=max(1, int(configer.get_config("link_redirect_prefetch_rate"))) / 60,
+            burst=3,
+        )
+        self._hot: OrderedDict[Tuple[str, str, str], float] = OrderedDict()
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="r302_prefetch"
+        )
+        self._prefetching = set()
+        self.refreshed = 0
+        self.refresh_errors = 0
+        self.prefetched = 0
+        self.prefetch_errors = 0
+
+    def start(self) -> None:
+        """
+        启动后台刷新
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._refresh_loop, daemon=True)
+        self._thread.start()
+        logger.info("【302跳转服务】下载链接后台刷新已启动")
+
+    def stop(self) -> None:
+        """
+        停止后台刷新与预取
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def on_resolved(self, mode: str, pickcode: str, user_agent: str = "") -> None:
+        """
+        记录一次播放，并按配置预取下一集
+
+        :param mode: 302 跳转方式 cookie/open
+        :param pickcode: 文件 PickCode
+        :param user_agent: 客户端 UA
+        """
+        if self._stop_event.is_set():
+            return
+        if configer.get_config("link_redirect_refresh_enabled"):
+            with self._lock:
+                key = (mode, pickcode, user_agent)
+                self._hot[key] = time()
+                self._hot.move_to_end(key)
+                while len(self._hot) > self.hot_maxsize:
+                    self._hot.popitem(last=False)
+        if configer.get_config("link_redirect_prefetch_next_enabled"):
+            with self._lock:
+                key = (mode, pickcode, user_agent)
+                if key in self._prefetching:
+                    return
+                self._prefetching.add(key)
+            try:
+                self._executor.submit(self._prefetch_next, mode, pickcode, user_agent)
+            except RuntimeError:
+                # 执行器已关闭
+                with self._lock:
+                    self._prefetching.discard(key)
+
+    def _prefetch_next(self, mode: str, pickcode: str, user_agent: str) -> None:
+        """
+        预取同目录下一集的下载链接
+        """
+        try:
+            suffixes = {
+                s.strip().lower()
+                for s in configer.get_config("user_rmt_mediaext").split(",")
+                if s.strip()
+            }
+            item = FileDbHelper().get_next_sibling_file(to_id(pickcode), suffixes)
+            if not item or not item.get("pickcode"):
+                return
+            next_pickcode = item["pickcode"].lower()
+            if r302cacher.get_expires(next_pickcode, user_agent or "NoUA"):
+                return
+            if not self.limiter.acquire(self._stop_event):
+                return
+            if mode == "cookie":
+                self.redirect.resolve_downurl_cookie(next_pickcode, user_agent)
+            else:
+                self.redirect.resolve_downurl_open(next_pickcode, user_agent)
+            self.prefetched += 1
+            logger.debug(
+                f"【302跳转服务】预取下一集 {pickcode} -> {next_pickcode} {item.get('name')}"
+            )
+        except Exception as e:
+            self.prefetch_errors += 1
+            logger.debug(f"【302跳转服务】预取下一集失败 {pickcode}: {e}")
+        finally:
+            with self._lock:
+                self._prefetching.discard((mode, pickcode, user_agent))
+
+    def _refresh_loop(self) -> None:
+        """
+        定时检查热点文件并刷新即将过期的下载链接
+        """
+        while not self._stop_event.wait(self.check_interval):
+            try:
+                self._refresh_once()
+            except Exception as e:
+                logger.error(f"【302跳转服务】下载链接后台刷新出错: {e}")
+
+    def _refresh_once(self) -> None:
+        """
+        执行一轮刷新
+        """
+        now = time()
+        with self._lock:
+            while self._hot:
+                key, last_access = next(iter(self._hot.items()))
+                if now - last_access <= self.hot_window:
+                    break
+                self._hot.popitem(last=False)
+            hot = list(self._hot)
+
+        for mode, pickcode, user_agent in hot:
+            if self._stop_event.is_set():
+                return
+            expires = r302cacher.get_expires(pickcode, user_agent or "NoUA")
+            # 已过期的条目不再刷新，等待下一次播放重新获取
+            if expires is None or expires - time() > self.refresh_ahead:
+                continue
+            if not self.limiter.acquire(self._stop_event):
+                return
+            try:
+                if self.redirect.refresh_downurl(mode, pickcode, user_agent):
+                    self.refreshed += 1
+                    logger.debug(f"【302跳转服务】后台刷新下载链接 {pickcode}")
+            except Exception as e:
+                self.refresh_errors += 1
+                logger.debug(f"【302跳转服务】后台刷新下载链接失败 {pickcode}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        输出统计
+
+        :return: {hot, refreshed, refresh_errors, prefetched, prefetch_errors}
+        """
+        with self._lock:
+            hot = len(self._hot)
+        return {
+            "hot": hot,
+            "refreshed": self.refreshed,
+            "refresh_errors": self.refresh_errors,
+            "prefetched": self.prefetched,
+            "prefetch_errors": self.prefetch_errors,
+        }
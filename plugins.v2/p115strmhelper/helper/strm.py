@@ -3,11 +3,11 @@ import threading
 import shutil
 from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
-from itertools import batched
-import concurrent.futures
+from hashlib import md5
+from itertools import batched, islice
+from queue import Queue
 
 from sqlalchemy.orm.exc import MultipleResultsFound
-from orjson import dumps
 from p115client import P115Client
 from p115client.tool.export_dir import export_dir_parse_iter
 from p115client.tool.fs_files import iter_fs_files
@@ -17,11 +17,14 @@ from p115client.tool.iterdir import (
     share_iterdir,
 )
 
-from ..core.cache import idpathcacher
+from ..core.cache import idpathcacher, shareresolvecacher
 from ..core.config import configer
-from ..utils.tree import DirectoryTree
+from ..utils.tree import DirectoryTree, DirectoryManifest
+from ..utils.memory import MemorySampler
+from ..utils.pipeline import StageMetrics, timed_call
 from ..utils.sentry import sentry_manager
 from ..core.scrape import media_scrape_metadata
+from ..db_manager import ct_db_manager
 from ..db_manager.oper import FileDbHelper
 from ..utils.path import PathUtils
 from ..utils.strm import StrmUrlGetter, StrmGenerater
@@ -86,8 +89,15 @@ class IncrementSyncStrmHelper:
         self.pan_transfer_enabled = configer.get_config("pan_transfer_enabled")
         self.pan_transfer_paths = configer.get_config("pan_transfer_paths")
         self.strm_url_format = configer.get_config("strm_url_format")
+        self.tree_compare_mode = configer.get_config("increment_sync_tree_compare_mode")
+        self.local_manifest_enabled = configer.get_config(
+            "increment_sync_local_manifest_enabled"
+        )
         self.databasehelper = FileDbHelper()
         self.download_mediainfo_list = []
+        self.local_scan_stats: List[Dict] = []
+        self.local_manifest: Optional[DirectoryManifest] = None
+        self.touched_dirs: Set[str] = set()
 
         self.strmurlgetter = StrmUrlGetter()
 
@@ -303,6 +313,28 @@ class IncrementSyncStrmHelper:
                 else:
                     logger.warning(f"【增量STRM生成】{file_name} {name} 不支持刷新")
 
+    @staticmethod
+    def __get_manifest_file(target_dir: str) -> Path:
+        """
+        获取本地目录清单文件路径
+        """
+        return (
+            configer.get_config("PLUGIN_CONFIG_PATH")
+            / "manifest"
+            / f"increment_{md5(target_dir.encode('utf-8')).hexdigest()}.json"
+        )
+
+    @staticmethod
+    def __format_scan_stats(scan_stats: Dict) -> str:
+        """
+        格式化本地扫描统计，目录清单同步与完整扫描的统计项不同
+        """
+        if "rescanned_dirs" in scan_stats:
+            detail = f"目录 {scan_stats['dirs']} 个，重新列出 {scan_stats['rescanned_dirs']} 个"
+        else:
+            detail = f"扫描条目 {scan_stats['entries']} 个"
+        return f"{detail}，匹配文件 {scan_stats['files']} 个，耗时 {scan_stats['elapsed']:.2f} 秒"
+
     def __generate_local_tree(self, target_dir: str):
         """
         生成本地目录树
@@ -310,21 +342,49 @@ class IncrementSyncStrmHelper:
         if Path(self.local_tree).exists():
             Path(self.local_tree).unlink(missing_ok=True)
 
+        extensions = (
+            [".strm"]
+            if not self.auto_download_mediainfo
+            else [".strm"] + self.download_mediaext
+        )
+        self.touched_dirs = set()
+        self.local_manifest = None
+        if self.local_manifest_enabled:
+            self.local_manifest = DirectoryManifest(
+                manifest_file=self.__get_manifest_file(target_dir),
+                root_path=target_dir,
+                extensions=extensions,
+            )
+
         def background_task(target_dir, local_tree):
             """
             后台运行任务
             """
             logger.info(f"【增量STRM生成】开始扫描本地媒体库文件: {target_dir}")
-            DirectoryTree().scan_directory_to_tree(
-                root_path=target_dir,
-                output_file=local_tree,
-                append=False,
-                use_posix=True,
-                extensions=[".strm"]
-                if not self.auto_download_mediainfo
-                else [".strm"] + self.download_mediaext,
+            if self.local_manifest:
+                scan_stats = self.local_manifest.sync()
+                self.local_manifest.write_tree(
+                    local_tree,
+                    use_posix=True,
+                    with_hash=self.tree_compare_mode == "hash",
+                )
+                self.local_manifest.save()
+                logger.info(
+                    f"【增量STRM生成】本地目录清单同步方式 {scan_stats['mode']}，目录 {scan_stats['dirs']} 个，重新列出 {scan_stats['rescanned_dirs']} 个"
+                )
+            else:
+                scan_stats = DirectoryTree().scan_directory_to_tree(
+                    root_path=target_dir,
+                    output_file=local_tree,
+                    append=False,
+                    use_posix=True,
+                    extensions=extensions,
+                    with_hash=self.tree_compare_mode == "hash",
+                )
+            self.local_scan_stats.append(scan_stats)
+            logger.info(
+                f"【增量STRM生成】扫描本地媒体库文件完成: {target_dir}，{self.__format_scan_stats(scan_stats)}"
             )
-            logger.info(f"【增量STRM生成】扫描本地媒体库文件完成: {target_dir}")
 
         local_tree_task_thread = threading.Thread(
             target=background_task,
@@ -342,9 +402,10 @@ class IncrementSyncStrmHelper:
         """
         等待生成本地目录树运行完成
         """
+        thread.join(timeout=10)
         while thread.is_alive():
             logger.info("【增量STRM生成】扫描本地媒体库运行中...")
-            time.sleep(10)
+            thread.join(timeout=10)
 
     def __generate_pan_tree(self, pan_media_dir: str, target_dir: str):
         """
@@ -367,6 +428,24 @@ class IncrementSyncStrmHelper:
 
         logger.info(f"【增量STRM生成】网盘目录树生成完成: {pan_media_dir}")
 
+    def __iter_addition_paths(self):
+        """
+        按配置的目录树对比模式迭代新增路径
+        """
+        if self.tree_compare_mode == "external":
+            return DirectoryTree().compare_trees_aligned_external(
+                self.pan_to_local_tree,
+                self.local_tree,
+                self.pan_tree,
+                temp_dir=configer.get_config("PLUGIN_TEMP_PATH"),
+            )
+        return DirectoryTree().compare_trees_aligned(
+            self.pan_to_local_tree,
+            self.local_tree,
+            self.pan_tree,
+            use_hash=self.tree_compare_mode != "memory",
+        )
+
     def __handle_addition_path(self, pan_path: str, local_path: str):
         """
         处理新增路径
@@ -447,6 +526,7 @@ class IncrementSyncStrmHelper:
 
             with open(new_file_path, "w", encoding="utf-8") as file:
                 file.write(strm_url)
+            self.touched_dirs.add(str(new_file_path.parent))
             self.strm_count += 1
             logger.info(
                 "【增量STRM生成】生成 STRM 文件成功: %s",
@@ -514,20 +594,18 @@ class IncrementSyncStrmHelper:
                 self.__wait_generate_local_tree(local_tree_task_thread)
 
                 # 生成或者下载文件
-                for line in DirectoryTree().compare_trees_lines(
-                    self.pan_to_local_tree, self.local_tree
-                ):
-                    pan_path_str = DirectoryTree().get_path_by_line_number(
-                        self.pan_tree, line
-                    )
-                    local_path_str = DirectoryTree().get_path_by_line_number(
-                        self.pan_to_local_tree, line
-                    )
-                    if pan_path_str and local_path_str:
+                with MemorySampler() as sampler:
+                    for pan_path_str, local_path_str in self.__iter_addition_paths():
                         self.__handle_addition_path(
                             pan_path=pan_path_str,
                             local_path=local_path_str,
                         )
+                logger.info(
+                    f"【增量STRM生成】目录树对比模式 {self.tree_compare_mode}，{sampler.summary()}"
+                )
+                if self.local_manifest and self.touched_dirs:
+                    self.local_manifest.refresh_dirs(self.touched_dirs)
+                    self.local_manifest.save()
             except Exception as e:
                 sentry_manager.sentry_hub.capture_exception(e)
                 logger.error(f"【增量STRM生成】增量同步 STRM 文件失败: {e}")
@@ -554,6 +632,10 @@ class IncrementSyncStrmHelper:
             logger.warn(
                 f"【增量STRM生成】{self.strm_fail_count} 个 STRM 文件生成失败，{self.mediainfo_fail_count} 个媒体数据文件下载失败"
             )
+        for scan_stats in self.local_scan_stats:
+            logger.info(
+                f"【增量STRM生成】本地扫描 {scan_stats['root']}: {self.__format_scan_stats(scan_stats)}"
+            )
         logger.info(f"【增量STRM生成】API 请求次数 {self.api_count} 次")
 
     def get_generate_total(self):
@@ -599,6 +681,7 @@ class FullSyncStrmHelper:
         self.strm_fail_count = 0
         self.mediainfo_fail_count = 0
         self.remove_unless_strm_count = 0
+        self.strm_unchanged_count = 0
         self.strm_fail_dict: Dict[str, str] = {}
         self.mediainfo_fail_dict: List = []
         self.server_address = configer.moviepilot_address.rstrip("/")
@@ -607,8 +690,11 @@ class FullSyncStrmHelper:
         self.strm_url_format = configer.strm_url_format
         self.overwrite_mode = configer.full_sync_overwrite_mode
         self.remove_unless_strm = configer.full_sync_remove_unless_strm
+        self.tree_compare_mode = configer.full_sync_tree_compare_mode
         self.databasehelper = FileDbHelper()
         self.download_mediainfo_list = []
+        self.local_scan_stats: List[Dict] = []
+        self.pipeline_stats: List[Dict] = []
 
         self.strmurlgetter = StrmUrlGetter()
 
@@ -670,13 +756,16 @@ class FullSyncStrmHelper:
             后台运行任务
             """
             logger.info(f"【全量STRM生成】开始扫描本地媒体库文件: {_target_dir}")
-            DirectoryTree().scan_directory_to_tree(
+            scan_stats = DirectoryTree().scan_directory_to_tree(
                 root_path=_target_dir,
                 output_file=local_tree,
                 append=False,
                 extensions=[".strm"],
             )
-            logger.info(f"【全量STRM生成】扫描本地媒体库文件完成: {_target_dir}")
+            self.local_scan_stats.append(scan_stats)
+            logger.info(
+                f"【全量STRM生成】扫描本地媒体库文件完成: {_target_dir}，扫描条目 {scan_stats['entries']} 个，匹配文件 {scan_stats['files']} 个，耗时 {scan_stats['elapsed']:.2f} 秒"
+            )
 
         local_tree_task_thread = threading.Thread(
             target=background_task,
@@ -690,10 +779,16 @@ class FullSyncStrmHelper:
         return local_tree_task_thread
 
     def __process_db_item(
-        self, batch, seen_folder_ids: Set[str], seen_file_ids: Set[str]
+        self,
+        batch,
+        seen_folder_ids: Set[str],
+        seen_file_ids: Set[str],
+        databasehelper: Optional[FileDbHelper] = None,
     ) -> Tuple[Set[str], Set[str]]:
         """
         处理写入数据库的内容
+
+        :param databasehelper: 指定数据库操作对象（如绑定批量导入会话），默认使用实例自身的
         """
         files_list: List = []
         folders_list: List = []
@@ -728,13 +823,14 @@ class FullSyncStrmHelper:
                         "ctime": item.get("ctime", 0),
                         "mtime": item.get("mtime", 0),
                         "path": item.get("path", ""),
-                        "extra": dumps(item).decode("utf-8") if item else None,
+                        "extra": FileDbHelper.encode_extra(item),
                     }
                 )
                 seen_file_ids.add(file_id)
 
-        self.databasehelper.upsert_batch_by_list("files", files_list)
-        self.databasehelper.upsert_batch_by_list("folders", folders_list)
+        databasehelper = databasehelper or self.databasehelper
+        databasehelper.upsert_batch_by_list("files", files_list)
+        databasehelper.upsert_batch_by_list("folders", folders_list)
 
         return seen_folder_ids, seen_file_ids
 
@@ -783,7 +879,10 @@ class FullSyncStrmHelper:
             if self.auto_download_mediainfo:
                 if file_path.suffix.lower() in self.download_mediaext_set:
                     if file_path.exists():
-                        if self.overwrite_mode == "never":
+                        if self.overwrite_mode == "never" or (
+                            self.overwrite_mode == "changed"
+                            and file_path.stat().st_size == item.get("size")
+                        ):
                             self.__base_logger(
                                 "warn",
                                 "【全量STRM生成】%s 已存在，覆盖模式 %s，跳过此路径",
@@ -844,7 +943,7 @@ class FullSyncStrmHelper:
                         f"【全量STRM生成】{new_file_path} 已存在，覆盖模式 {self.overwrite_mode}，跳过此路径",
                     )
                     return path_entry
-                else:
+                elif self.overwrite_mode != "changed":
                     self.__base_logger(
                         "warn",
                         f"【全量STRM生成】{new_file_path} 已存在，覆盖模式 {self.overwrite_mode}",
@@ -875,6 +974,17 @@ class FullSyncStrmHelper:
 
             strm_url = self.strmurlgetter.get_strm_url(pickcode, original_file_name)
 
+            if self.overwrite_mode == "changed" and StrmGenerater.is_strm_unchanged(
+                new_file_path, strm_url
+            ):
+                self.strm_unchanged_count += 1
+                self.__base_logger(
+                    "info",
+                    "【全量STRM生成】%s 内容未变化，跳过写入",
+                    str(new_file_path),
+                )
+                return path_entry
+
             with open(new_file_path, "w", encoding="utf-8") as file:
                 file.write(strm_url)
             self.strm_count += 1
@@ -941,15 +1051,18 @@ class FullSyncStrmHelper:
                 start_time = time.perf_counter()
                 seen_folder_ids: Set[str] = set()
                 seen_file_ids: Set[str] = set()
-                for batch in batched(
-                    iter_func(self.client, **iter_kwargs),
-                    int(configer.get_config("full_sync_batch_num")),
-                ):
-                    seen_folder_ids, seen_file_ids = self.__process_db_item(
-                        batch,
-                        seen_folder_ids,
-                        seen_file_ids,
-                    )
+                with ct_db_manager.bulk_load_session() as db:
+                    databasehelper = FileDbHelper(db)
+                    for batch in batched(
+                        iter_func(self.client, **iter_kwargs),
+                        int(configer.get_config("full_sync_batch_num")),
+                    ):
+                        seen_folder_ids, seen_file_ids = self.__process_db_item(
+                            batch,
+                            seen_folder_ids,
+                            seen_file_ids,
+                            databasehelper,
+                        )
                 end_time = time.perf_counter()
                 self.elapsed_time += end_time - start_time
                 self.total_db_write_count += len(seen_file_ids) + len(seen_folder_ids)
@@ -968,6 +1081,156 @@ class FullSyncStrmHelper:
             f"【全量STRM生成】全量更新数据库完成，时间 {self.elapsed_time:.6f} 秒，数据库写入量 {self.total_db_write_count} 条"
         )
 
+    def __run_pipeline(
+        self, items, target_dir: Path, pan_media_dir: str
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        流水线处理网盘文件
+
+        拉取阶段（当前线程）持续迭代网盘文件，按批次投递到数据库队列，
+        逐条投递到 STRM 队列；常驻的 STRM 写入线程池与单个数据库写入线程
+        并行消费，队列有界以限制内存占用
+
+        :param items: 网盘文件迭代器
+        :param target_dir: 本地生成目录
+        :param pan_media_dir: 网盘媒体目录
+        :return: 已写入数据库的文件夹 ID 与文件 ID
+        """
+        batch_num = int(configer.get_config("full_sync_batch_num"))
+        process_num = int(configer.get_config("full_sync_process_num"))
+        strm_queue: Queue = Queue(maxsize=max(batch_num, process_num * 2))
+        db_queue: Queue = Queue(maxsize=4)
+        fetch_metrics = StageMetrics("fetch")
+        strm_metrics = StageMetrics("strm", strm_queue)
+        db_metrics = StageMetrics("db", db_queue)
+        seen_folder_ids: Set[str] = set()
+        seen_file_ids: Set[str] = set()
+        db_done = False
+        path_list: List[str] = []
+        path_lock = threading.Lock()
+
+        def flush_path_list():
+            """
+            将待比对路径追加写入网盘目录树
+            """
+            nonlocal path_list
+            if not self.remove_unless_strm:
+                return
+            with path_lock:
+                pending, path_list = path_list, []
+            if pending:
+                DirectoryTree().generate_tree_from_list(
+                    pending, self.pan_tree, append=True
+                )
+
+        def strm_worker():
+            """
+            STRM 写入线程
+            """
+            while True:
+                item = strm_queue.get()
+                if item is None:
+                    break
+                try:
+                    item_path = timed_call(
+                        strm_metrics,
+                        1,
+                        self.__process_single_item,
+                        item,
+                        target_dir,
+                        pan_media_dir,
+                    )
+                    if item_path:
+                        with path_lock:
+                            path_list.append(item_path)
+                except Exception as e:
+                    sentry_manager.sentry_hub.capture_exception(e)
+                    logger.error(f"【全量STRM生成】并发处理出错: {item} - {str(e)}")
+
+        def db_consume(databasehelper: FileDbHelper) -> None:
+            """
+            消费数据库队列直到收到结束标记
+            """
+            nonlocal seen_folder_ids, seen_file_ids, db_done
+            while not db_done:
+                batch = db_queue.get()
+                if batch is None:
+                    db_done = True
+                    break
+                try:
+                    seen_folder_ids, seen_file_ids = timed_call(
+                        db_metrics,
+                        len(batch),
+                        self.__process_db_item,
+                        batch,
+                        seen_folder_ids,
+                        seen_file_ids,
+                        databasehelper,
+                    )
+                except Exception as e:
+                    sentry_manager.sentry_hub.capture_exception(e)
+                    logger.error(f"【全量STRM生成】数据库处理并发处理出错: {str(e)}")
+
+        def db_worker():
+            """
+            数据库写入线程
+            """
+            try:
+                with ct_db_manager.bulk_load_session() as db:
+                    db_consume(FileDbHelper(db))
+            except Exception as e:
+                sentry_manager.sentry_hub.capture_exception(e)
+                logger.error(f"【全量STRM生成】批量导入会话出错: {str(e)}")
+            # 批量导入会话异常时退回普通会话，保证队列被消费完
+            db_consume(self.databasehelper)
+
+        workers = [
+            threading.Thread(
+                target=strm_worker, name=f"p115strmhelper_full_strm_{i}", daemon=True
+            )
+            for i in range(process_num)
+        ]
+        workers.append(
+            threading.Thread(
+                target=db_worker, name="p115strmhelper_full_db", daemon=True
+            )
+        )
+        for worker in workers:
+            worker.start()
+
+        start_time = time.perf_counter()
+        try:
+            iterator = iter(items)
+            while True:
+                fetch_start = time.perf_counter()
+                batch = tuple(islice(iterator, batch_num))
+                fetch_metrics.record(len(batch), time.perf_counter() - fetch_start)
+                if not batch:
+                    break
+                self.total_count += len(batch)
+                db_metrics.sample_depth()
+                db_queue.put(batch)
+                for item in batch:
+                    strm_queue.put(item)
+                strm_metrics.sample_depth()
+                flush_path_list()
+        finally:
+            for _ in range(process_num):
+                strm_queue.put(None)
+            db_queue.put(None)
+            for worker in workers:
+                worker.join()
+            flush_path_list()
+
+            wall = time.perf_counter() - start_time
+            stats = [
+                metrics.summary(wall)
+                for metrics in (fetch_metrics, strm_metrics, db_metrics)
+            ]
+            self.pipeline_stats.append({"root": str(target_dir), "stages": stats})
+
+        return seen_folder_ids, seen_file_ids
+
     def generate_strm_files(self, full_sync_strm_paths):
         """
         生成 STRM 文件
@@ -1016,63 +1279,11 @@ class FullSyncStrmHelper:
                     f"【全量STRM生成】迭代函数 {iter_func}; 参数 {iter_kwargs}"
                 )
                 start_time = time.perf_counter()
-                seen_folder_ids: Set[str] = set()
-                seen_file_ids: Set[str] = set()
-                for batch in batched(
+                seen_folder_ids, seen_file_ids = self.__run_pipeline(
                     iter_func(self.client, **iter_kwargs),
-                    int(configer.get_config("full_sync_batch_num")),
-                ):
-                    path_list: List = []
-
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=int(configer.get_config("full_sync_process_num"))
-                    ) as executor:
-                        db_task_future = executor.submit(
-                            self.__process_db_item,
-                            batch,
-                            seen_folder_ids,
-                            seen_file_ids,
-                        )
-
-                        target_dir_path = Path(target_dir)
-
-                        future_to_item = {
-                            executor.submit(
-                                self.__process_single_item,
-                                item,
-                                target_dir_path,
-                                pan_media_dir,
-                            ): item
-                            for item in batch
-                        }
-
-                        self.total_count += len(future_to_item)
-
-                        for future in concurrent.futures.as_completed(future_to_item):
-                            item = future_to_item[future]
-                            try:
-                                item_path = future.result()
-                                if item_path:
-                                    path_list.append(item_path)
-                            except Exception as e:
-                                sentry_manager.sentry_hub.capture_exception(e)
-                                logger.error(
-                                    f"【全量STRM生成】并发处理出错: {item} - {str(e)}"
-                                )
-
-                        try:
-                            seen_folder_ids, seen_file_ids = db_task_future.result()
-                        except Exception as e:
-                            sentry_manager.sentry_hub.capture_exception(e)
-                            logger.error(
-                                f"【全量STRM生成】数据库处理并发处理出错: {str(e)}"
-                            )
-
-                    if self.remove_unless_strm:
-                        DirectoryTree().generate_tree_from_list(
-                            path_list, self.pan_tree, append=True
-                        )
-
+                    Path(target_dir),
+                    pan_media_dir,
+                )
                 end_time = time.perf_counter()
                 self.elapsed_time += end_time - start_time
                 self.total_db_write_count += len(seen_file_ids) + len(seen_folder_ids)
@@ -1085,9 +1296,10 @@ class FullSyncStrmHelper:
                 return False
 
             if self.remove_unless_strm:
+                local_tree_task_thread.join(timeout=10)
                 while local_tree_task_thread.is_alive():
                     logger.info("【全量STRM生成】扫描本地媒体库运行中...")
-                    time.sleep(10)
+                    local_tree_task_thread.join(timeout=10)
                 if not self.strm_fail_dict:
                     try:
                         count = DirectoryTree().compare_file_lines(
@@ -1098,13 +1310,29 @@ class FullSyncStrmHelper:
                                 f"【全量STRM生成】本次将删除文件个数为 {count}，超过安全阈值不进行删除操作"
                             )
                             continue
-                        for path in DirectoryTree().compare_trees(
-                            self.local_tree, self.pan_tree
-                        ):
-                            logger.info(f"【全量STRM生成】清理无效 STRM 文件: {path}")
-                            Path(path).unlink(missing_ok=True)
-                            self.__remove_parent_dir(file_path=Path(path))
-                            self.remove_unless_strm_count += 1
+                        with MemorySampler() as sampler:
+                            if self.tree_compare_mode == "external":
+                                remove_paths = DirectoryTree().compare_trees_external(
+                                    self.local_tree,
+                                    self.pan_tree,
+                                    temp_dir=configer.PLUGIN_TEMP_PATH,
+                                )
+                            else:
+                                remove_paths = DirectoryTree().compare_trees(
+                                    self.local_tree,
+                                    self.pan_tree,
+                                    use_hash=self.tree_compare_mode != "memory",
+                                )
+                            for path in remove_paths:
+                                logger.info(
+                                    f"【全量STRM生成】清理无效 STRM 文件: {path}"
+                                )
+                                Path(path).unlink(missing_ok=True)
+                                self.__remove_parent_dir(file_path=Path(path))
+                                self.remove_unless_strm_count += 1
+                        logger.info(
+                            f"【全量STRM生成】目录树对比模式 {self.tree_compare_mode}，{sampler.summary()}"
+                        )
                     except Exception as e:
                         sentry_manager.sentry_hub.capture_exception(e)
                         logger.error(f"【全量STRM生成】清理无效 STRM 文件失败: {e}")
@@ -1148,6 +1376,19 @@ class FullSyncStrmHelper:
             logger.warn(
                 f"【全量STRM生成】清理 {self.remove_unless_strm_count} 个失效 STRM 文件"
             )
+        if self.strm_unchanged_count != 0:
+            logger.info(
+                f"【全量STRM生成】{self.strm_unchanged_count} 个 STRM 文件内容未变化，跳过写入"
+            )
+        for pipeline_stats in self.pipeline_stats:
+            for stage in pipeline_stats["stages"]:
+                logger.info(
+                    f"【全量STRM生成】流水线 {pipeline_stats['root']} 阶段 {stage['name']}: 处理 {stage['count']} 条，吞吐 {stage['throughput']:.1f} 条/秒，忙碌 {stage['busy']:.2f} 秒，队列平均深度 {stage['depth_avg']:.1f}/{stage['capacity']}，最大深度 {stage['depth_max']}"
+                )
+        for scan_stats in self.local_scan_stats:
+            logger.info(
+                f"【全量STRM生成】本地扫描 {scan_stats['root']}: 条目 {scan_stats['entries']} 个，文件 {scan_stats['files']} 个，耗时 {scan_stats['elapsed']:.2f} 秒"
+            )
 
     def get_generate_total(self):
         """
@@ -1282,6 +1523,7 @@ class ShareStrmHelper:
             strm_url = self.strmurlgetter.get_share_strm_url(
                 share_code, receive_code, file_id, pan_file_name
             )
+            shareresolvecacher.add_id(share_code, pan_file_name, file_id)
 
             with open(new_file_path, "w", encoding="utf-8") as file:
                 file.write(strm_url)
@@ -1308,6 +1550,7 @@ class ShareStrmHelper:
         """
         获取分享文件，生成 STRM
         """
+        shareresolvecacher.add_receive_code(share_code, receive_code)
         for item in share_iterdir(
             self.client, receive_code=receive_code, share_code=share_code, cid=int(cid)
         ):
@@ -1,5 +1,5 @@
 import logging
-from time import time, sleep
+from time import time
 from threading import Event, Thread
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,14 +14,17 @@ from aligo.core import set_config_folder
 
 from .core.i18n import i18n
 from .helper.mediainfo_download import MediaInfoDownloader
-from .helper.life import MonitorLife
+from .helper.life import LifeEventCursor, MonitorLife
 from .helper.strm import FullSyncStrmHelper, ShareStrmHelper, IncrementSyncStrmHelper
 from .helper.monitor import handle_file, FileMonitorHandler
 from .helper.offline import OfflineDownloadHelper
 from .helper.share import ShareTransferHelper
 from .helper.clean import Cleaner
-from .helper.r302 import Redirect
+from .helper.r302 import Redirect, r302_async_limiter, r302_http_client
+from .helper.r302_prefetch import R302Prefetcher
 from .core.config import configer
+from .core.cache import r302cacher, shareresolvecacher, R302CacheStore
+from .db_manager import ct_db_manager
 from .core.message import post_message
 from .core.aliyunpan import BAligo
 from .utils.sentry import sentry_manager
@@ -51,6 +54,7 @@ class ServiceHelper:
         self.offlinehelper = None
 
         self.redirect = None
+        self.r302_prefetcher = None
 
         self.scheduler = None
 
@@ -97,7 +101,9 @@ class ServiceHelper:
 
             # 生活事件监控初始化
             self.monitorlife = MonitorLife(
-                client=self.client, mediainfodownloader=self.mediainfodownloader
+                client=self.client,
+                mediainfodownloader=self.mediainfodownloader,
+                stop_event=self.monitor_stop_event,
             )
 
             # 分享转存初始化
@@ -117,7 +123,28 @@ class ServiceHelper:
                     pid = self.client.fs_mkdir(payload)["file_id"]
 
             # 302跳转初始化
+            if self.redirect:
+                self.redirect.stop()
             self.redirect = Redirect(client=self.client, pid=pid)
+            if configer.get_config("link_redirect_cache_persist_enabled"):
+                try:
+                    store = R302CacheStore(configer.PLUGIN_R302_CACHE_DB_PATH)
+                    r302cacher.attach_store(store)
+                    shareresolvecacher.attach_store(store)
+                except Exception as e:
+                    logger.error(f"【302跳转服务】缓存持久化初始化失败: {e}")
+            r302_async_limiter.set_limit(
+                int(configer.get_config("link_redirect_async_concurrency"))
+            )
+            if self.r302_prefetcher:
+                self.r302_prefetcher.stop()
+                self.r302_prefetcher = None
+            if configer.get_config(
+                "link_redirect_refresh_enabled"
+            ) or configer.get_config("link_redirect_prefetch_next_enabled"):
+                self.r302_prefetcher = R302Prefetcher(self.redirect)
+                if configer.get_config("link_redirect_refresh_enabled"):
+                    self.r302_prefetcher.start()
             return True
         except Exception as e:
             logger.error(f"服务项初始化失败: {e}")
@@ -130,38 +157,32 @@ class ServiceHelper:
         if not self.monitorlife.check_status():
             return
         logger.info("【监控生活事件】生活事件监控启动中...")
-        try:
-            pull_mode = configer.monitor_life_first_pull_mode
-            # latest 模式，从当前时间开始拉取数据
-            from_time = time()
-            from_id = 0
-            # all 模式，拉取所有数据
-            if pull_mode == "all":
-                from_time = 0
-                from_id = 0
-            # last 模式，从上次停止时间拉取后续数据
-            elif pull_mode == "last":
-                data = configer.get_plugin_data("monitor_life_strm_files")
-                if data:
-                    from_time = data.get("from_time")
-                    from_id = data.get("from_id")
-
-            while True:
-                if self.monitor_stop_event.is_set():
-                    logger.info("【监控生活事件】收到停止信号，退出上传事件监控")
-                    configer.save_plugin_data(
-                        "monitor_life_strm_files",
-                        {"from_time": from_time, "from_id": from_id},
-                    )
-                    break
-                from_time, from_id = self.monitorlife.once_pull(
-                    from_time=from_time, from_id=from_id
+        pull_mode = configer.monitor_life_first_pull_mode
+        # latest 模式，从当前时间开始拉取数据
+        cursor = LifeEventCursor(from_time=time(), from_id=0)
+        # all 模式，拉取所有数据
+        if pull_mode == "all":
+            cursor = LifeEventCursor(from_time=0, from_id=0)
+        # last 模式，从上次保存的游标拉取后续数据
+        elif pull_mode == "last":
+            cursor = LifeEventCursor.load() or cursor
+
+        retry_delay = 30
+        while not self.monitor_stop_event.is_set():
+            try:
+                self.monitorlife.once_pull(cursor)
+                retry_delay = 30
+            except Exception as e:
+                logger.error(f"【监控生活事件】生活事件监控运行失败: {e}")
+                logger.info(
+                    f"【监控生活事件】{retry_delay}s 后尝试重新启动生活事件监控"
                 )
-        except Exception as e:
-            logger.error(f"【监控生活事件】生活事件监控运行失败: {e}")
-            logger.info("【监控生活事件】30s 后尝试重新启动生活事件监控")
-            sleep(30)
-            self.monitor_life_strm_files()
+                if self.monitor_stop_event.wait(retry_delay):
+                    break
+                # 连续失败时逐步延长重试间隔
+                retry_delay = min(retry_delay * 2, 600)
+        logger.info("【监控生活事件】收到停止信号，退出上传事件监控")
+        cursor.save()
         logger.info("【监控生活事件】已退出生活事件监控")
         return
 
@@ -279,6 +300,40 @@ class ServiceHelper:
             self.scheduler.print_jobs()
             self.scheduler.start()
 
+    def compact_database(self):
+        """
+        压缩数据库
+        """
+        clear_extra = configer.get_config("DB_EXTRA_MODE") == "lean"
+        db_path = configer.get_config("PLUGIN_DB_PATH")
+        size = db_path.stat().st_size if db_path.exists() else 0
+        logger.info(f"【数据库压缩】开始压缩数据库，清空 extra 原始数据: {clear_extra}")
+        try:
+            ct_db_manager.compact_database(clear_extra=clear_extra)
+        except Exception as e:
+            logger.error(f"【数据库压缩】压缩数据库失败: {e}")
+            return
+        new_size = db_path.stat().st_size if db_path.exists() else 0
+        logger.info(
+            f"【数据库压缩】压缩完成，数据库大小 {size / 1024 / 1024:.2f}MB -> "
+            f"{new_size / 1024 / 1024:.2f}MB"
+        )
+
+    def start_compact_db(self):
+        """
+        启动数据库压缩
+        """
+        self.scheduler = BackgroundScheduler(timezone=settings.TZ)
+        self.scheduler.add_job(
+            func=self.compact_database,
+            trigger="date",
+            run_date=datetime.now(tz=pytz.timezone(settings.TZ)) + timedelta(seconds=3),
+            name="115网盘助手压缩数据库",
+        )
+        if self.scheduler.get_jobs():
+            self.scheduler.print_jobs()
+            self.scheduler.start()
+
     def share_strm_files(self):
         """
         分享生成STRM
@@ -485,6 +540,16 @@ class ServiceHelper:
                     self.scheduler.shutdown()
                 self.scheduler = None
             self.monitor_stop_event.set()
+            if self.monitorlife:
+                self.monitorlife.wake()
+            if self.r302_prefetcher:
+                self.r302_prefetcher.stop()
+                self.r302_prefetcher = None
+            if self.redirect:
+                self.redirect.stop()
+            shareresolvecacher.detach_store()
+            r302cacher.detach_store()
+            r302_http_client.close()
         except Exception as e:
             logger.error(f"发生错误: {e}")
 
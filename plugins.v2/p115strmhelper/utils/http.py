@@ -1,10 +1,20 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import httpx
 import requests
 from requests.exceptions import HTTPError
 
+from app.log import logger
+
 
 def check_response(
-    resp: requests.Response,
-) -> requests.Response:
+    resp: Union[requests.Response, httpx.Response],
+) -> Union[requests.Response, httpx.Response]:
     """
     检查 HTTP 响应，如果状态码 ≥ 400 则抛出 HTTPError
     """
@@ -14,3 +24,302 @@ def check_response(
             response=resp,
         )
     return resp
+
+
+class LatencyRecorder:
+    """
+    上游请求耗时统计
+
+    按上游分别保留最近若干次请求耗时，用于计算分位数
+    """
+
+    def __init__(self, maxlen: int = 2048):
+        """
+        :param maxlen: 每个上游保留的样本数
+        """
+        self.maxlen = maxlen
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._sums: Dict[str, float] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, upstream: str, elapsed: float, error: bool = False) -> None:
+        """
+        记录一次请求
+
+        :param upstream: 上游名称
+        :param elapsed: 耗时（秒）
+        :param error: 是否请求失败
+        """
+        with self._lock:
+            samples = self._samples.get(upstream)
+            if samples is None:
+                samples = self._samples[upstream] = deque(maxlen=self.maxlen)
+            samples.append(elapsed)
+            self._counts[upstream] = self._counts.get(upstream, 0) + 1
+            self._sums[upstream] = self._sums.get(upstream, 0.0) + elapsed
+            if error:
+                self._errors[upstream] = self._errors.get(upstream, 0) + 1
+
+    @staticmethod
+    def _percentile(sorted_samples, percent: float) -> float:
+        """
+        最近秩法计算分位数
+        """
+        index = max(0, min(len(sorted_samples) - 1, int(len(sorted_samples) * percent)))
+        return sorted_samples[index]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        输出各上游统计（毫秒）
+
+        :return: {上游: {count, errors, sum, p50, p90, p95, p99, max}}
+        """
+        with self._lock:
+            items = [
+                (
+                    upstream,
+                    sorted(samples),
+                    self._counts[upstream],
+                    self._sums[upstream],
+                )
+                for upstream, samples in self._samples.items()
+            ]
+            errors = dict(self._errors)
+        result = {}
+        for upstream, samples, count, total in items:
+            if not samples:
+                continue
+            result[upstream] = {
+                "count": count,
+                "errors": errors.get(upstream, 0),
+                "sum": round(total * 1000, 2),
+                "p50": round(self._percentile(samples, 0.5) * 1000, 2),
+                "p90": round(self._percentile(samples, 0.9) * 1000, 2),
+                "p95": round(self._percentile(samples, 0.95) * 1000, 2),
+                "p99": round(self._percentile(samples, 0.99) * 1000, 2),
+                "max": round(samples[-1] * 1000, 2),
+            }
+        return result
+
+    def clear(self) -> None:
+        """
+        清空统计
+        """
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._sums.clear()
+            self._errors.clear()
+
+
+class PooledHttpClient:
+    """
+    共享连接池的 HTTP 客户端
+
+    基于 httpx.Client，线程安全，保持长连接复用，可选 HTTP/2，
+    每次请求的耗时按上游（host + path）记录到 LatencyRecorder
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        recorder: Optional[LatencyRecorder] = None,
+    ):
+        """
+        :param timeout: 读写超时（秒）
+        :param connect_timeout: 连接超时（秒）
+        :param max_connections: 最大连接数
+        :param max_keepalive_connections: 最大保持的空闲连接数
+        :param keepalive_expiry: 空闲连接保持时间（秒）
+        :param recorder: 耗时统计
+        """
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.recorder = recorder or LatencyRecorder()
+        self._client: Optional[httpx.Client] = None
+        self._http2: Optional[bool] = None
+        self._lock = threading.Lock()
+
+    def get_client(self, http2: bool = False) -> httpx.Client:
+        """
+        获取底层客户端，HTTP/2 开关变化时重建
+
+        :param http2: 是否启用 HTTP/2（需要安装 h2）
+        """
+        client = self._client
+        if client is not None and self._http2 == http2:
+            return client
+        with self._lock:
+            if self._client is not None and self._http2 == http2:
+                return self._client
+            old_client = self._client
+            try:
+                self._client = httpx.Client(
+                    http2=http2,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    follow_redirects=True,
+                )
+            except ImportError:
+                logger.warning("【HTTP】未安装 h2 模块，回退使用 HTTP/1.1")
+                self._client = httpx.Client(
+                    timeout=self.timeout, limits=self.limits, follow_redirects=True
+                )
+            self._http2 = http2
+            if old_client is not None:
+                old_client.close()
+            return self._client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        http2: bool = False,
+        upstream: Optional[str] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        发送请求并记录耗时
+
+        :param method: 请求方法
+        :param url: 请求地址
+        :param http2: 是否启用 HTTP/2
+        :param upstream: 统计使用的上游名称，默认为 host + path
+        """
+        if upstream is None:
+            parts = urlsplit(url)
+            upstream = f"{parts.netloc}{parts.path}"
+        start = time.perf_counter()
+        try:
+            resp = self.get_client(http2).request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(upstream, time.perf_counter() - start, error=True)
+            raise
+        self.recorder.record(
+            upstream, time.perf_counter() - start, error=resp.status_code >= 400
+        )
+        return resp
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET 请求
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        """
+        POST 请求
+        """
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """
+        关闭连接池
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            self._client = None
+            self._http2 = None
+
+
+class AsyncPooledHttpClient:
+    """
+    共享连接池的异步 HTTP 客户端
+
+    基于 httpx.AsyncClient，与 PooledHttpClient 共用耗时统计；
+    客户端绑定创建时的事件循环，事件循环变化时重建
+    """
+
+    def __init__(self, sync_client: PooledHttpClient):
+        """
+        :param sync_client: 同步客户端，复用其超时、连接池限制与耗时统计
+        """
+        self.timeout = sync_client.timeout
+        self.limits = sync_client.limits
+        self.recorder = sync_client.recorder
+        self._client: Optional[httpx.AsyncClient] = None
+        self._http2: Optional[bool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_client(self, http2: bool = False) -> httpx.AsyncClient:
+        """
+        获取底层客户端
+
+        :param http2: 是否启用 HTTP/2（需要安装 h2）
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is not None
+            and self._http2 == http2
+            and self._loop is loop
+            and not self._client.is_closed
+        ):
+            return self._client
+        try:
+            client = httpx.AsyncClient(
+                http2=http2,
+                timeout=self.timeout,
+                limits=self.limits,
+                follow_redirects=True,
+            )
+        except ImportError:
+            logger.warning("【HTTP】未安装 h2 模块，回退使用 HTTP/1.1")
+            client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits, follow_redirects=True
+            )
+        old_client, old_loop = self._client, self._loop
+        self._client, self._http2, self._loop = client, http2, loop
+        if old_client is not None and old_loop is loop:
+            loop.create_task(old_client.aclose())
+        return client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        http2: bool = False,
+        upstream: Optional[str] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        发送请求并记录耗时
+
+        :param method: 请求方法
+        :param url: 请求地址
+        :param http2: 是否启用 HTTP/2
+        :param upstream: 统计使用的上游名称，默认为 host + path
+        """
+        if upstream is None:
+            parts = urlsplit(url)
+            upstream = f"{parts.netloc}{parts.path}"
+        start = time.perf_counter()
+        try:
+            resp = await self.get_client(http2).request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(upstream, time.perf_counter() - start, error=True)
+            raise
+        self.recorder.record(
+            upstream, time.perf_counter() - start, error=resp.status_code >= 400
+        )
+        return resp
+
+    async def aclose(self) -> None:
+        """
+        关闭连接池
+        """
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._http2 = None
+        self._loop = None
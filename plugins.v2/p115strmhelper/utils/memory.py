@@ -0,0 +1,79 @@
+import threading
+from typing import Optional
+
+import psutil
+
+from .string import StringUtils
+
+
+class MemorySampler:
+    """
+    任务内存采样
+
+    任务期间由后台线程定时采样当前进程常驻内存，记录任务期间的峰值以及相对任务开始时的增长；
+    与进程生命周期内的峰值（ru_maxrss）不同，可以反映单个任务或对比模式的内存占用
+    """
+
+    def __init__(self, interval: float = 0.05):
+        """
+        :param interval: 采样间隔（秒）
+        """
+        self.interval = interval
+        self.baseline: Optional[int] = None
+        self.peak: Optional[int] = None
+        self._process = psutil.Process()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        """
+        采样一次
+        """
+        try:
+            rss = self._process.memory_info().rss
+        except Exception:
+            return
+        if self.peak is None or rss > self.peak:
+            self.peak = rss
+
+    def _run(self) -> None:
+        """
+        定时采样
+        """
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "MemorySampler":
+        self._sample()
+        self.baseline = self.peak
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+
+    @property
+    def growth(self) -> Optional[int]:
+        """
+        任务期间峰值相对开始时的增长（字节）
+        """
+        if self.peak is None or self.baseline is None:
+            return None
+        return self.peak - self.baseline
+
+    def summary(self) -> str:
+        """
+        输出任务期间峰值内存与增长
+        """
+        if self.peak is None:
+            return "任务峰值内存 N/A"
+        return (
+            f"任务峰值内存 {StringUtils.format_size(self.peak)}"
+            f"（增长 {StringUtils.format_size(max(0, self.growth or 0))}）"
+        )
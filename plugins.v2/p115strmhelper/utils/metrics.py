@@ -0,0 +1,176 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .http import LatencyRecorder
+
+
+def error_code(e: BaseException) -> str:
+    """
+    提取异常的错误码
+
+    115 接口返回的错误信息作为 OSError 第二个参数时，优先使用其中的 errno/code
+    """
+    if isinstance(e, OSError) and len(e.args) > 1 and isinstance(e.args[1], dict):
+        code = e.args[1].get("errno") or e.args[1].get("code")
+        if code:
+            return str(code)
+    if isinstance(getattr(e, "errno", None), int):
+        return str(e.errno)
+    return type(e).__name__
+
+
+class RequestMetrics:
+    """
+    请求结果统计
+
+    按类型记录缓存命中、未命中、失败次数与错误码，以及完整处理耗时
+    """
+
+    def __init__(self, recorder: Optional[LatencyRecorder] = None):
+        """
+        :param recorder: 处理耗时统计
+        """
+        self.recorder = recorder or LatencyRecorder()
+        self._results: Dict[Tuple[str, str], int] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _incr(self, counter: Dict, key: Tuple[str, str]) -> None:
+        """
+        计数加一
+        """
+        with self._lock:
+            counter[key] = counter.get(key, 0) + 1
+
+    def hit(self, kind: str) -> None:
+        """
+        记录一次缓存命中
+        """
+        self._incr(self._results, (kind, "hit"))
+
+    def miss(self, kind: str) -> None:
+        """
+        记录一次缓存未命中且获取成功
+
+        获取失败只记录为 error，每个请求仅计入一种结果
+        """
+        self._incr(self._results, (kind, "miss"))
+
+    def error(self, kind: str, e: BaseException) -> None:
+        """
+        记录一次失败
+
+        :param kind: 请求类型
+        :param e: 异常
+        """
+        self._incr(self._results, (kind, "error"))
+        self._incr(self._errors, (kind, error_code(e)))
+
+    def observe(self, kind: str, elapsed: float) -> None:
+        """
+        记录一次完整处理耗时
+
+        :param kind: 请求类型
+        :param elapsed: 耗时（秒）
+        """
+        self.recorder.record(kind, elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        输出统计
+
+        :return: {results: {类型: {结果: 次数}}, errors: {类型: {错误码: 次数}}, latency}
+        """
+        with self._lock:
+            results = dict(self._results)
+            errors = dict(self._errors)
+        data: Dict[str, Any] = {"results": {}, "errors": {}}
+        for (kind, result), count in results.items():
+            data["results"].setdefault(kind, {})[result] = count
+        for (kind, code), count in errors.items():
+            data["errors"].setdefault(kind, {})[code] = count
+        data["latency"] = self.recorder.snapshot()
+        return data
+
+
+class PrometheusText:
+    """
+    Prometheus 文本格式输出
+    """
+
+    def __init__(self, prefix: str = ""):
+        """
+        :param prefix: 指标名前缀
+        """
+        self.prefix = prefix
+        self._lines: List[str] = []
+
+    @staticmethod
+    def _escape(value: Any) -> str:
+        """
+        转义标签值
+        """
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    def metric(self, name: str, metric_type: str, help_text: str) -> str:
+        """
+        声明指标
+
+        :param name: 指标名（不含前缀）
+        :param metric_type: counter/gauge/summary
+        :param help_text: 说明
+        :return: 完整指标名
+        """
+        full_name = f"{self.prefix}{name}"
+        self._lines.append(f"# HELP {full_name} {help_text}")
+        self._lines.append(f"# TYPE {full_name} {metric_type}")
+        return full_name
+
+    def sample(
+        self, name: str, value: float, labels: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        输出样本
+
+        :param name: 完整指标名
+        :param value: 值
+        :param labels: 标签
+        """
+        if labels:
+            label_text = ",".join(f'{k}="{self._escape(v)}"' for k, v in labels.items())
+            self._lines.append(f"{name}{{{label_text}}} {value}")
+        else:
+            self._lines.append(f"{name} {value}")
+
+    def summary(
+        self,
+        name: str,
+        help_text: str,
+        snapshot: Dict[str, Dict[str, float]],
+        label: str,
+    ) -> None:
+        """
+        将 LatencyRecorder 快照输出为 summary（秒）
+
+        :param name: 指标名（不含前缀）
+        :param help_text: 说明
+        :param snapshot: LatencyRecorder.snapshot() 结果
+        :param label: 快照键对应的标签名
+        """
+        full_name = self.metric(name, "summary", help_text)
+        for key, stats in snapshot.items():
+            for quantile in ("p50", "p90", "p95", "p99"):
+                if quantile in stats:
+                    self.sample(
+                        full_name,
+                        stats[quantile] / 1000,
+                        {label: key, "quantile": f"0.{quantile[1:]}"},
+                    )
+            self.sample(f"{full_name}_sum", stats["sum"] / 1000, {label: key})
+            self.sample(f"{full_name}_count", stats["count"], {label: key})
+
+    def render(self) -> str:
+        """
+        输出文本
+        """
+        return "\n".join(self._lines) + "\n"
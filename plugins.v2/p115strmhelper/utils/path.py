@@ -1,5 +1,73 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+
+
+class PathRuleMatcher:
+    """
+    路径规则匹配器
+
+    将多条路径规则按路径组件构建前缀树，查询时沿待匹配路径逐级向下，
+    复杂度只与路径深度有关；多条规则同时匹配时按配置顺序返回第一条
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, rules: List[Tuple[str, Any]]):
+        """
+        :param rules: [(规则路径, 附带数据)]，按优先级排列
+        """
+        # 前缀树节点: [子节点字典, (规则序号, 规则路径, 附带数据) | None]
+        self._root: List = [{}, None]
+        for index, (prefix, payload) in enumerate(rules):
+            node = self._root
+            for part in Path(prefix).parts:
+                children: Dict = node[0]
+                node = children.setdefault(part, [{}, None])
+            if node[1] is None:
+                node[1] = (index, prefix, payload)
+
+    def match(self, path) -> Optional[Tuple[str, Any]]:
+        """
+        查找匹配的规则
+
+        :param path: 待匹配路径
+        :return: (规则路径, 附带数据) | None
+        """
+        node = self._root
+        best = node[1]
+        for part in Path(path).parts:
+            node = node[0].get(part)
+            if node is None:
+                break
+            if node[1] is not None and (best is None or node[1][0] < best[0]):
+                best = node[1]
+        if best is None:
+            return None
+        return best[1], best[2]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile(paths: str, separator: Optional[str] = None) -> "PathRuleMatcher":
+        """
+        编译多行配置，相同配置复用已编译结果，配置变化时自动重新编译
+
+        :param paths: 多行配置
+        :param separator: 规则分隔符，为空时整行为匹配路径，否则取分隔后第二段为匹配路径，
+                          附带数据为 (第一段, 第二段)
+        """
+        rules = []
+        for path in paths.split("\n"):
+            if not path:
+                continue
+            if separator is None:
+                rules.append((path, None))
+                continue
+            parts = path.split(separator, 1)
+            if len(parts) != 2:
+                continue
+            rules.append((parts[1], (parts[0], parts[1])))
+        return PathRuleMatcher(rules)
 
 
 class PathUtils:
@@ -27,39 +95,29 @@ class PathUtils:
         """
         判断路径是否为整理路径
         """
-        transfer_paths = paths.split("\n")
-        for path in transfer_paths:
-            if not path:
-                continue
-            if PathUtils.has_prefix(transfer_path, path):
-                return True
-        return False
+        if not paths:
+            return False
+        return PathRuleMatcher.compile(paths).match(transfer_path) is not None
 
     @staticmethod
     def get_scrape_metadata_exclude_path(paths, scrape_path) -> bool:
         """
         检查目录是否在排除目录内
         """
-        exclude_path = paths.split("\n")
-        for path in exclude_path:
-            if not path:
-                continue
-            if PathUtils.has_prefix(scrape_path, path):
-                return True
-        return False
+        if not paths:
+            return False
+        return PathRuleMatcher.compile(paths).match(scrape_path) is not None
 
     @staticmethod
     def get_media_path(paths, media_path) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         获取媒体目录路径
         """
-        media_paths = paths.split("\n")
-        for path in media_paths:
-            if not path:
-                continue
-            parts = path.split("#", 1)
-            if PathUtils.has_prefix(media_path, parts[1]):
-                return True, parts[0], parts[1]
+        if not paths:
+            return False, None, None
+        if result := PathRuleMatcher.compile(paths, "#").match(media_path):
+            local_path, pan_path = result[1]
+            return True, local_path, pan_path
         return False, None, None
 
     @staticmethod
@@ -67,13 +125,11 @@ class PathUtils:
         """
         匹配全量目录，自动生成新的 paths
         """
-        media_paths = paths.split("\n")
-        for path in media_paths:
-            if not path:
-                continue
-            parts = path.split("#", 1)
-            if PathUtils.has_prefix(media_path, parts[1]):
-                local_path = Path(parts[0]) / Path(media_path).relative_to(parts[1])
-                final_paths = f"{local_path}#{media_path}"
-                return True, final_paths
+        if not paths:
+            return False, None
+        if result := PathRuleMatcher.compile(paths, "#").match(media_path):
+            local_path, pan_path = result[1]
+            local_path = Path(local_path) / Path(media_path).relative_to(pan_path)
+            final_paths = f"{local_path}#{media_path}"
+            return True, final_paths
         return False, None
@@ -0,0 +1,227 @@
+import asyncio
+import threading
+import time
+from queue import Queue
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class StageMetrics:
+    """
+    流水线阶段统计
+
+    记录阶段处理量、忙碌时间以及其输入队列的深度采样
+    """
+
+    def __init__(self, name: str, queue: Optional[Queue] = None):
+        """
+        :param name: 阶段名称
+        :param queue: 阶段的输入队列
+        """
+        self.name = name
+        self.queue = queue
+        self.count = 0
+        self.busy = 0.0
+        self.depth_max = 0
+        self.depth_sum = 0
+        self.depth_samples = 0
+        self._lock = threading.Lock()
+
+    def record(self, count: int, elapsed: float) -> None:
+        """
+        记录一次处理
+
+        :param count: 处理数量
+        :param elapsed: 处理耗时（秒）
+        """
+        with self._lock:
+            self.count += count
+            self.busy += elapsed
+
+    def sample_depth(self) -> None:
+        """
+        采样输入队列深度
+        """
+        if self.queue is None:
+            return
+        depth = self.queue.qsize()
+        with self._lock:
+            self.depth_samples += 1
+            self.depth_sum += depth
+            if depth > self.depth_max:
+                self.depth_max = depth
+
+    def summary(self, wall: float) -> Dict[str, Any]:
+        """
+        输出统计
+
+        :param wall: 流水线总运行时间（秒）
+        :return: {name, count, busy, throughput, depth_avg, depth_max, capacity}
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "count": self.count,
+                "busy": self.busy,
+                "throughput": self.count / wall if wall > 0 else 0.0,
+                "depth_avg": self.depth_sum / self.depth_samples
+                if self.depth_samples
+                else 0.0,
+                "depth_max": self.depth_max,
+                "capacity": self.queue.maxsize if self.queue is not None else 0,
+            }
+
+
+def timed_call(metrics: StageMetrics, count: int, func, *args, **kwargs):
+    """
+    调用函数并把耗时计入阶段统计
+
+    :param metrics: 阶段统计
+    :param count: 本次处理数量
+    :param func: 调用的函数
+    """
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        metrics.record(count, time.perf_counter() - start)
+
+
+class AsyncLimiter:
+    """
+    协程并发限制
+
+    超出并发上限的协程排队等待，记录排队时间与当前排队、执行数量
+    """
+
+    def __init__(self, limit: int, recorder, name: str = "queue"):
+        """
+        :param limit: 最大并发数
+        :param recorder: 排队耗时统计（LatencyRecorder）
+        :param name: 统计名称
+        """
+        self.limit = max(1, limit)
+        self.recorder = recorder
+        self.name = name
+        self.waiting = 0
+        self.active = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def set_limit(self, limit: int) -> None:
+        """
+        调整最大并发数，已在执行的协程不受影响
+
+        :param limit: 最大并发数
+        """
+        limit = max(1, limit)
+        if limit != self.limit:
+            self.limit = limit
+            self._semaphore = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        获取绑定当前事件循环的信号量
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        在并发限制内执行协程
+
+        :param func: 返回协程的函数
+        :return: 协程返回值
+        """
+        semaphore = self._get_semaphore()
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.recorder.record(self.name, time.perf_counter() - start)
+        self.active += 1
+        try:
+            return await func()
+        finally:
+            self.active -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        输出统计
+
+        :return: {limit, active, waiting, queue_time}
+        """
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "queue_time": self.recorder.snapshot().get(self.name, {}),
+        }
+
+
+class RateLimiter:
+    """
+    令牌桶限速
+
+    用于后台任务按固定速率请求上游，允许短时突发
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: 每秒产生的令牌数
+        :param burst: 令牌桶容量
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float) -> None:
+        """
+        调整速率
+
+        :param rate: 每秒产生的令牌数
+        """
+        with self._lock:
+            self.rate = rate
+
+    def _wait_time(self) -> float:
+        """
+        尝试取出一个令牌，返回还需等待的时间（秒），0 表示已取得
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            if self.rate <= 0:
+                return 1.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        阻塞直到取得令牌
+
+        :param stop_event: 停止事件，被设置时立即返回
+        :return: 是否取得令牌
+        """
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            wait = self._wait_time()
+            if wait <= 0:
+                return True
+            if stop_event is not None:
+                stop_event.wait(wait)
+            else:
+                time.sleep(wait)
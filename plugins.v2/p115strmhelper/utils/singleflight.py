@@ -0,0 +1,174 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """
+    正在进行中的调用
+    """
+
+    __slots__ = ("event", "result", "error", "owner")
+
+    def __init__(self):
+        self.event = threading.Event()
+        # 执行方线程
+        self.owner = threading.get_ident()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    相同键的并发调用合并
+
+    同一时刻相同键只会有一个调用真正执行，其余调用等待并共享其结果（或异常）；
+    等待超时或执行方线程递归调用相同键时直接执行，不再合并
+    """
+
+    def __init__(self, timeout: float = 30):
+        """
+        :param timeout: 等待方最长等待时间（秒）
+        """
+        self.timeout = timeout
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.total = 0
+        self.executed = 0
+        self.shared = 0
+        self.errors = 0
+        self.timeouts = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        执行调用，若相同键已有调用在进行则等待其结果
+
+        :param key: 合并键
+        :param func: 实际执行的函数
+        :return: 函数返回值
+        """
+        with self._lock:
+            self.total += 1
+            call = self._calls.get(key)
+            if call is not None and call.owner == threading.get_ident():
+                # 执行方递归调用相同键，等待自身会死锁，直接执行
+                self.executed += 1
+                reentrant = True
+            else:
+                reentrant = False
+                if call is not None:
+                    self.shared += 1
+                    leader = False
+                else:
+                    call = self._calls[key] = _Call()
+                    self.executed += 1
+                    leader = True
+
+        if reentrant:
+            return func()
+
+        if not leader:
+            if not call.event.wait(self.timeout):
+                with self._lock:
+                    self.timeouts += 1
+                return func()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """
+        当前进行中的调用数
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        输出统计
+
+        :return: {total, executed, shared, errors, timeouts, in_flight}，shared 即节省的上游调用次数
+        """
+        with self._lock:
+            return {
+                "total": self.total,
+                "executed": self.executed,
+                "shared": self.shared,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    相同键的并发协程调用合并
+
+    与 SingleFlight 相同，但等待方不占用线程；实际调用在独立任务中执行，
+    任一调用方（包括发起方）被取消都不会影响其它调用方
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.total = 0
+        self.executed = 0
+        self.shared = 0
+        self.errors = 0
+
+    def _done(self, key: Hashable, task: asyncio.Future) -> None:
+        """
+        调用结束，移除记录并统计失败
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if task.cancelled():
+            self.errors += 1
+        # 读取异常，没有等待方时避免 "exception was never retrieved" 警告
+        elif task.exception() is not None:
+            self.errors += 1
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行调用，若相同键已有调用在进行则等待其结果
+
+        :param key: 合并键
+        :param func: 返回协程的函数
+        :return: 协程返回值
+        """
+        self.total += 1
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda t: self._done(key, t))
+            self.executed += 1
+        # 调用方被取消时不影响实际调用与其它调用方
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        输出统计
+
+        :return: {total, executed, shared, errors, in_flight}，shared 即节省的上游调用次数
+        """
+        return {
+            "total": self.total,
+            "executed": self.executed,
+            "shared": self.shared,
+            "errors": self.errors,
+            "in_flight": len(self._calls),
+        }
@@ -171,3 +171,19 @@ class StrmGenerater:
             return "小于最小文件大小", False
 
         return "", True
+
+    @staticmethod
+    def is_strm_unchanged(file_path: Path, strm_url: str) -> bool:
+        """
+        判断已有 STRM 文件内容是否与待写入内容一致
+
+        先比较文件大小，大小一致时才读取文件内容比较
+        """
+        content = strm_url.encode("utf-8")
+        try:
+            if file_path.stat().st_size != len(content):
+                return False
+            with open(file_path, "rb") as file:
+                return file.read(len(content) + 1) == content
+        except OSError:
+            return False
@@ -1,4 +1,213 @@
+import heapq
+import mmap
+import os
+import struct
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from hashlib import blake2b
+from itertools import islice
 from pathlib import Path
+from queue import Queue
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from orjson import dumps, loads, JSONDecodeError
+
+
+def path_hash(path: str) -> int:
+    """
+    计算路径的 64 位哈希值（跨进程稳定）
+
+    :param path: 路径
+    :return: 64 位无符号整数
+    """
+    return int.from_bytes(
+        blake2b(path.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+class TreeIndex:
+    """
+    目录树偏移索引
+
+    索引文件为 <目录树文件>.idx，由文件头和定长 (8 字节) 行偏移数组组成；
+    可选的 <目录树文件>.hash 为逐行对应的 64 位路径哈希数组。
+    目录树文件通过 mmap 映射，按行号取路径为 O(1) 操作
+    """
+
+    MAGIC = b"P115TIDX"
+    HEADER = struct.Struct("<8sQQ")
+    INDEX_SUFFIX = ".idx"
+    HASH_SUFFIX = ".hash"
+
+    def __init__(self, tree_file):
+        """
+        打开已构建的索引
+
+        :param tree_file: 目录树文件
+        """
+        self.tree_file = Path(tree_file)
+        self._data_file = None
+        self._index_file = None
+        self._data: Optional[mmap.mmap] = None
+        self._index: Optional[mmap.mmap] = None
+        self._offsets: Optional[memoryview] = None
+        self.count = 0
+        self.data_size = 0
+        self._open()
+
+    @classmethod
+    def index_path(cls, tree_file) -> Path:
+        """
+        索引文件路径
+        """
+        return Path(f"{tree_file}{cls.INDEX_SUFFIX}")
+
+    @classmethod
+    def hash_path(cls, tree_file) -> Path:
+        """
+        哈希文件路径
+        """
+        return Path(f"{tree_file}{cls.HASH_SUFFIX}")
+
+    @classmethod
+    def build(cls, tree_file, with_hash: bool = False, chunk_size: int = 65536):
+        """
+        顺序扫描目录树文件构建索引
+
+        :param tree_file: 目录树文件
+        :param with_hash: 是否同时生成路径哈希文件
+        :param chunk_size: 每次写出的行数，限制构建时的内存占用
+        :return: TreeIndex
+        """
+        offsets = array("Q")
+        hashes = array("Q")
+        offset = 0
+        count = 0
+        hash_file = cls.hash_path(tree_file)
+        f_hash = open(hash_file, "wb") if with_hash else None
+        try:
+            with (
+                open(tree_file, "rb") as f,
+                open(cls.index_path(tree_file), "wb") as f_idx,
+            ):
+                f_idx.write(cls.HEADER.pack(cls.MAGIC, 0, 0))
+                for line in f:
+                    offsets.append(offset)
+                    offset += len(line)
+                    count += 1
+                    if f_hash:
+                        hashes.append(path_hash(line.decode("utf-8").strip()))
+                    if len(offsets) >= chunk_size:
+                        offsets.tofile(f_idx)
+                        offsets = array("Q")
+                        if f_hash:
+                            hashes.tofile(f_hash)
+                            hashes = array("Q")
+                offsets.tofile(f_idx)
+                if f_hash:
+                    hashes.tofile(f_hash)
+                f_idx.seek(0)
+                f_idx.write(cls.HEADER.pack(cls.MAGIC, offset, count))
+        finally:
+            if f_hash:
+                f_hash.close()
+        if not with_hash:
+            hash_file.unlink(missing_ok=True)
+        return cls(tree_file)
+
+    @classmethod
+    def load(cls, tree_file, with_hash: bool = False):
+        """
+        打开索引，不存在或已过期时重新构建
+
+        :param tree_file: 目录树文件
+        :param with_hash: 重新构建时是否生成路径哈希文件
+        :return: TreeIndex
+        """
+        try:
+            return cls(tree_file)
+        except (FileNotFoundError, ValueError):
+            return cls.build(tree_file, with_hash=with_hash)
+
+    def _open(self):
+        """
+        映射目录树文件与索引文件
+        """
+        index_file = self.index_path(self.tree_file)
+        tree_stat = self.tree_file.stat()
+        if index_file.stat().st_mtime_ns < tree_stat.st_mtime_ns:
+            raise ValueError(f"索引文件已过期: {index_file}")
+        self.data_size = tree_stat.st_size
+        self._index_file = open(index_file, "rb")
+        header = self._index_file.read(self.HEADER.size)
+        if len(header) != self.HEADER.size:
+            self.close()
+            raise ValueError(f"索引文件损坏: {index_file}")
+        magic, data_size, count = self.HEADER.unpack(header)
+        if magic != self.MAGIC or data_size != self.data_size:
+            self.close()
+            raise ValueError(f"索引文件与目录树文件不匹配: {index_file}")
+        self.count = count
+        if count:
+            self._index = mmap.mmap(
+                self._index_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self._offsets = memoryview(self._index)[
+                self.HEADER.size : self.HEADER.size + count * 8
+            ].cast("Q")
+        if self.data_size:
+            self._data_file = open(self.tree_file, "rb")
+            self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get(self, line_number: int) -> Optional[str]:
+        """
+        通过行号获取路径
+
+        :param line_number: 行号（从 1 开始）
+        :return: 文件路径
+        """
+        if line_number < 1 or line_number > self.count:
+            return None
+        start = self._offsets[line_number - 1]
+        end = self._offsets[line_number] if line_number < self.count else self.data_size
+        return self._data[start:end].decode("utf-8").strip()
+
+    def iter_hashes(self) -> Iterator[int]:
+        """
+        迭代所有行的路径哈希，优先读取哈希文件
+        """
+        hash_file = self.hash_path(self.tree_file)
+        if hash_file.exists() and hash_file.stat().st_size == self.count * 8:
+            with open(hash_file, "rb") as f:
+                while chunk := f.read(65536 * 8):
+                    yield from memoryview(chunk).cast("Q")
+            return
+        for line_number in range(1, self.count + 1):
+            yield path_hash(self.get(line_number))
+
+    def close(self):
+        """
+        释放映射与文件句柄
+        """
+        if self._offsets is not None:
+            self._offsets.release()
+            self._offsets = None
+        for attr in ("_index", "_data", "_index_file", "_data_file"):
+            obj = getattr(self, attr)
+            if obj is not None:
+                obj.close()
+                setattr(self, attr, None)
 
 
 class DirectoryTree:
@@ -6,19 +215,89 @@ class DirectoryTree:
     目录树
     """
 
+    @staticmethod
+    def _scan_subtree(
+        top: str,
+        extensions: Optional[Set[str]],
+        use_posix: bool,
+        out_queue: Queue,
+        batch_size: int = 10_000,
+    ) -> Tuple[int, int]:
+        """
+        使用 os.scandir 迭代遍历子目录，结果分批放入队列
+
+        复用 DirEntry 缓存的类型信息，不再对每个路径单独 stat；
+        与 Path.rglob 一致，不进入符号链接目录，无权限目录直接跳过
+
+        :return: (扫描条目数, 匹配文件数)
+        """
+        entries = 0
+        files = 0
+        batch: List[str] = []
+        stack = [top]
+        try:
+            while stack:
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            entries += 1
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append(entry.path)
+                                    continue
+                                if not entry.is_file():
+                                    continue
+                            except OSError:
+                                continue
+                            if (
+                                extensions is not None
+                                and os.path.splitext(entry.name)[1].lower()
+                                not in extensions
+                            ):
+                                continue
+                            path_str = entry.path
+                            if use_posix and os.sep != "/":
+                                path_str = path_str.replace(os.sep, "/")
+                            batch.append(f"{path_str}\n")
+                            files += 1
+                            if len(batch) >= batch_size:
+                                out_queue.put(batch)
+                                batch = []
+                except (PermissionError, FileNotFoundError, NotADirectoryError):
+                    continue
+            if batch:
+                out_queue.put(batch)
+        finally:
+            out_queue.put(None)
+        return entries, files
+
     @staticmethod
     def scan_directory_to_tree(
-        root_path, output_file, append=False, extensions=None, use_posix=False
-    ):
+        root_path,
+        output_file,
+        append=False,
+        extensions=None,
+        use_posix=False,
+        max_workers: int = 8,
+        with_hash: bool = False,
+    ) -> Dict[str, Any]:
         """
         扫描本地目录生成目录树到文件，可过滤指定后缀名文件
 
+        根目录下的各个一级子目录在线程池中并行遍历，
+        结果由调用线程通过单个带缓冲的写入器顺序写入目录树文件，覆盖模式下写入完成后构建偏移索引
+
         :param root_path: 要扫描的根目录
         :param output_file: 输出文件路径
         :param append: 是否追加模式 (默认覆盖)
         :param extensions: 要包含的文件后缀名列表
         :param use_posix: 是否强制使用 posix 风格（/）的路径分隔符
+        :param max_workers: 并行遍历子目录的线程数
+        :param with_hash: 是否同时生成路径哈希文件
+        :return: 扫描统计 {root, entries, files, elapsed}
         """
+        start_time = time.perf_counter()
         root = Path(root_path).resolve()
         mode = "a" if append else "w"
 
@@ -28,18 +307,91 @@ class DirectoryTree:
                 for ext in extensions
             }
 
-        with open(output_file, mode, encoding="utf-8") as f_out:
-            for path in root.rglob("*"):
-                if path.is_file():
-                    if extensions is None or path.suffix.lower() in extensions:
-                        path_str = path.as_posix() if use_posix else str(path)
+        out_queue: Queue = Queue(maxsize=max_workers * 4)
+        subtrees: List[str] = []
+        entries = 0
+        files = 0
+
+        with open(output_file, mode, encoding="utf-8", buffering=1048576) as f_out:
+            # 根目录本层直接处理，一级子目录交给线程池
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        entries += 1
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subtrees.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        if (
+                            extensions is not None
+                            and os.path.splitext(entry.name)[1].lower()
+                            not in extensions
+                        ):
+                            continue
+                        path_str = entry.path
+                        if use_posix and os.sep != "/":
+                            path_str = path_str.replace(os.sep, "/")
                         f_out.write(f"{path_str}\n")
+                        files += 1
+            except (PermissionError, FileNotFoundError, NotADirectoryError):
+                subtrees = []
+
+            if subtrees:
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(max_workers, len(subtrees))),
+                    thread_name_prefix="p115strmhelper_scan",
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            DirectoryTree._scan_subtree,
+                            top,
+                            extensions,
+                            use_posix,
+                            out_queue,
+                        )
+                        for top in subtrees
+                    ]
+                    pending = len(futures)
+                    write_error: Optional[Exception] = None
+                    while pending:
+                        batch = out_queue.get()
+                        if batch is None:
+                            pending -= 1
+                            continue
+                        # 写入失败后仍需消费队列，避免遍历线程阻塞
+                        if write_error is None:
+                            try:
+                                f_out.writelines(batch)
+                            except Exception as e:
+                                write_error = e
+                    if write_error is not None:
+                        raise write_error
+                    for future in futures:
+                        sub_entries, sub_files = future.result()
+                        entries += sub_entries
+                        files += sub_files
+
+        if not append:
+            DirectoryTree.build_index(output_file, with_hash=with_hash)
+
+        return {
+            "root": str(root),
+            "entries": entries,
+            "files": files,
+            "elapsed": time.perf_counter() - start_time,
+        }
 
     @staticmethod
     def generate_tree_from_list(file_list, output_file, append=False):
         """
         从文件列表生成目录树到文件
 
+        覆盖模式下写入完成后构建偏移索引，追加模式下索引在下次使用时重建
+
         :param file_list: 文件路径列表
         :param output_file: 输出文件路径
         :param append: 是否追加模式 (默认覆盖)
@@ -48,57 +400,272 @@ class DirectoryTree:
         buffer_size = 1048576
         with open(output_file, mode, encoding="utf-8", buffering=buffer_size) as f_out:
             f_out.writelines(f"{path}\n" for path in file_list)
+        if not append:
+            DirectoryTree.build_index(output_file)
 
     @staticmethod
-    def compare_trees(tree_file1, tree_file2):
+    def _load_tree_keys(tree_file, use_hash: bool = False) -> Set:
+        """
+        读取目录树文件为集合
+
+        :param tree_file: 目录树文件
+        :param use_hash: 是否以 64 位路径哈希代替路径字符串，可大幅降低内存占用
+        :return: 路径或路径哈希集合
+        """
+        if use_hash and TreeIndex.hash_path(tree_file).exists():
+            try:
+                with TreeIndex(tree_file) as index:
+                    return set(index.iter_hashes())
+            except (FileNotFoundError, ValueError):
+                pass
+        key = path_hash if use_hash else str
+        with open(tree_file, "r", encoding="utf-8") as f:
+            return set(key(line.strip()) for line in f)
+
+    @staticmethod
+    def compare_trees(tree_file1, tree_file2, use_hash: bool = False):
         """
         比较两个目录树文件，找出tree_file1有而tree_file2没有的文件
 
         :param tree_file1: 第一个目录树文件
         :param tree_file2: 第二个目录树文件
+        :param use_hash: 是否使用路径哈希比较
         :return: 差异文件列表
         """
         # 使用集合进行高效比较
-        with open(tree_file2, "r", encoding="utf-8") as f2:
-            tree2_set = set(line.strip() for line in f2)
+        tree2_set = DirectoryTree._load_tree_keys(tree_file2, use_hash)
+        key = path_hash if use_hash else str
 
         with open(tree_file1, "r", encoding="utf-8") as f1:
             for line in f1:
                 file_path = line.strip()
-                if file_path not in tree2_set:
+                if key(file_path) not in tree2_set:
                     yield file_path
 
     @staticmethod
-    def compare_trees_lines(tree_file1, tree_file2):
+    def compare_trees_lines(tree_file1, tree_file2, use_hash: bool = False):
         """
         比较两个目录树文件，找出tree_file1有而tree_file2没有的文件
 
         :param tree_file1: 第一个目录树文件
         :param tree_file2: 第二个目录树文件
+        :param use_hash: 是否使用路径哈希比较
         :return: 生成器，产生行号
         """
-        with open(tree_file2, "r", encoding="utf-8") as f2:
-            tree2_set = set(line.strip() for line in f2)
+        tree2_set = DirectoryTree._load_tree_keys(tree_file2, use_hash)
+        key = path_hash if use_hash else str
 
         with open(tree_file1, "r", encoding="utf-8") as f1:
             for line_num, line in enumerate(f1, start=1):
                 file_path = line.strip()
-                if file_path not in tree2_set:
+                if key(file_path) not in tree2_set:
                     yield line_num
 
+    @staticmethod
+    def compare_trees_aligned(
+        tree_file1, tree_file2, aligned_file, use_hash: bool = False
+    ):
+        """
+        比较两个目录树文件，找出tree_file1有而tree_file2没有的文件，
+        同时返回 aligned_file 中与之行号对齐的路径
+
+        tree_file1 与 aligned_file 同步顺序读取，只需遍历一次，
+        避免按行号反复从头扫描文件
+
+        :param tree_file1: 第一个目录树文件
+        :param tree_file2: 第二个目录树文件
+        :param aligned_file: 与 tree_file1 逐行对应的目录树文件
+        :param use_hash: 是否使用路径哈希比较
+        :return: 生成器，产生 (aligned_file 路径, tree_file1 路径)
+        """
+        tree2_set = DirectoryTree._load_tree_keys(tree_file2, use_hash)
+        key = path_hash if use_hash else str
+
+        with (
+            open(tree_file1, "r", encoding="utf-8") as f1,
+            open(aligned_file, "r", encoding="utf-8") as fa,
+        ):
+            for line, aligned_line in zip(f1, fa):
+                file_path = line.strip()
+                if key(file_path) not in tree2_set:
+                    aligned_path = aligned_line.strip()
+                    if aligned_path and file_path:
+                        yield aligned_path, file_path
+
+    @staticmethod
+    def external_sort(
+        tree_file,
+        output_file,
+        chunk_lines: int = 200_000,
+        temp_dir=None,
+    ) -> None:
+        """
+        外部排序目录树文件：按 chunk_lines 分块排序写入临时文件，再多路归并输出
+
+        内存占用只与 chunk_lines 相关，与目录树大小无关
+
+        :param tree_file: 目录树文件
+        :param output_file: 排序后输出文件
+        :param chunk_lines: 单个分块的行数
+        :param temp_dir: 临时分块文件目录，默认与输出文件同目录
+        """
+        output_file = Path(output_file)
+        temp_dir = Path(temp_dir) if temp_dir else output_file.parent
+        chunk_files = []
+        try:
+            with open(tree_file, "r", encoding="utf-8") as f:
+                while raw_lines := list(islice(f, chunk_lines)):
+                    lines = [path for line in raw_lines if (path := line.strip())]
+                    del raw_lines
+                    if not lines:
+                        continue
+                    lines.sort()
+                    chunk_file = (
+                        temp_dir / f"{output_file.name}.{len(chunk_files)}.chunk"
+                    )
+                    with open(chunk_file, "w", encoding="utf-8") as f_chunk:
+                        f_chunk.writelines(f"{path}\n" for path in lines)
+                    chunk_files.append(chunk_file)
+                    del lines
+
+            with ExitStack() as stack:
+                readers = [
+                    stack.enter_context(open(chunk_file, "r", encoding="utf-8"))
+                    for chunk_file in chunk_files
+                ]
+                with open(
+                    output_file, "w", encoding="utf-8", buffering=1048576
+                ) as f_out:
+                    f_out.writelines(
+                        heapq.merge(*readers, key=lambda line: line.rstrip("\n"))
+                    )
+        finally:
+            for chunk_file in chunk_files:
+                chunk_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _merge_difference(sorted_file1, sorted_file2, sep: Optional[str] = None):
+        """
+        归并比较两个已排序目录树文件，流式产出 sorted_file1 有而 sorted_file2 没有的行
+
+        :param sorted_file1: 第一个已排序目录树文件
+        :param sorted_file2: 第二个已排序目录树文件
+        :param sep: 若 sorted_file1 每行为 "路径{sep}附加数据"，仅比较路径部分
+        :return: 生成器，产生 sorted_file1 中的差异行
+        """
+        with (
+            open(sorted_file1, "r", encoding="utf-8") as f1,
+            open(sorted_file2, "r", encoding="utf-8") as f2,
+        ):
+            right = next(f2, None)
+            right = right.rstrip("\n") if right is not None else None
+            for line in f1:
+                line = line.rstrip("\n")
+                left = line.partition(sep)[0] if sep else line
+                while right is not None and right < left:
+                    right = next(f2, None)
+                    right = right.rstrip("\n") if right is not None else None
+                if right != left:
+                    yield line
+
+    @staticmethod
+    def compare_trees_external(
+        tree_file1, tree_file2, chunk_lines: int = 200_000, temp_dir=None
+    ):
+        """
+        外部排序 + 归并比较两个目录树文件，找出tree_file1有而tree_file2没有的文件
+
+        两个文件都不会整体载入内存，适合超大目录树
+
+        :param tree_file1: 第一个目录树文件
+        :param tree_file2: 第二个目录树文件
+        :param chunk_lines: 外部排序单个分块的行数
+        :param temp_dir: 临时文件目录
+        :return: 生成器，按路径排序产出差异文件
+        """
+        sorted_file1 = Path(f"{tree_file1}.sorted")
+        sorted_file2 = Path(f"{tree_file2}.sorted")
+        try:
+            DirectoryTree.external_sort(tree_file1, sorted_file1, chunk_lines, temp_dir)
+            DirectoryTree.external_sort(tree_file2, sorted_file2, chunk_lines, temp_dir)
+            yield from DirectoryTree._merge_difference(sorted_file1, sorted_file2)
+        finally:
+            sorted_file1.unlink(missing_ok=True)
+            sorted_file2.unlink(missing_ok=True)
+
+    @staticmethod
+    def compare_trees_aligned_external(
+        tree_file1,
+        tree_file2,
+        aligned_file,
+        chunk_lines: int = 200_000,
+        temp_dir=None,
+    ):
+        """
+        外部排序版本的 compare_trees_aligned
+
+        先将 tree_file1 与 aligned_file 逐行合并为 "路径\\0对齐路径"，再排序归并
+
+        :param tree_file1: 第一个目录树文件
+        :param tree_file2: 第二个目录树文件
+        :param aligned_file: 与 tree_file1 逐行对应的目录树文件
+        :param chunk_lines: 外部排序单个分块的行数
+        :param temp_dir: 临时文件目录
+        :return: 生成器，产生 (aligned_file 路径, tree_file1 路径)
+        """
+        sep = "\0"
+        pair_file = Path(f"{tree_file1}.pair")
+        sorted_pair_file = Path(f"{tree_file1}.pair.sorted")
+        sorted_file2 = Path(f"{tree_file2}.sorted")
+        try:
+            with (
+                open(tree_file1, "r", encoding="utf-8") as f1,
+                open(aligned_file, "r", encoding="utf-8") as fa,
+                open(pair_file, "w", encoding="utf-8", buffering=1048576) as f_out,
+            ):
+                for line, aligned_line in zip(f1, fa):
+                    file_path = line.strip()
+                    aligned_path = aligned_line.strip()
+                    if file_path and aligned_path:
+                        f_out.write(f"{file_path}{sep}{aligned_path}\n")
+            DirectoryTree.external_sort(
+                pair_file, sorted_pair_file, chunk_lines, temp_dir
+            )
+            pair_file.unlink(missing_ok=True)
+            DirectoryTree.external_sort(tree_file2, sorted_file2, chunk_lines, temp_dir)
+            for line in DirectoryTree._merge_difference(
+                sorted_pair_file, sorted_file2, sep=sep
+            ):
+                file_path, _, aligned_path = line.partition(sep)
+                yield aligned_path, file_path
+        finally:
+            pair_file.unlink(missing_ok=True)
+            sorted_pair_file.unlink(missing_ok=True)
+            sorted_file2.unlink(missing_ok=True)
+
+    @staticmethod
+    def build_index(tree_file, with_hash: bool = False) -> None:
+        """
+        为目录树文件构建偏移索引
+
+        :param tree_file: 目录树文件
+        :param with_hash: 是否同时生成路径哈希文件
+        """
+        TreeIndex.build(tree_file, with_hash=with_hash).close()
+
     @staticmethod
     def get_path_by_line_number(tree_file, line_number):
         """
         通过行号从目录树文件中获取路径
 
+        通过 mmap 与偏移索引直接定位，索引不存在或已过期时先重建
+
         :param tree_file: 目录树文件
         :param line_number: 行号
         :return: 字典 {行号: 文件路径}
         """
-        with open(tree_file, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                if line_num == line_number:
-                    return line.strip()
+        with TreeIndex.load(tree_file) as index:
+            return index.get(line_number)
 
     @staticmethod
     def compare_file_lines(
@@ -154,3 +721,272 @@ class DirectoryTree:
             return 0
 
         return abs(count_1 - count_2)
+
+
+class DirectoryManifest:
+    """
+    本地目录清单
+
+    持久化记录根目录下每个目录的 mtime 以及其中匹配后缀的文件。
+    再次同步时只 stat 各个目录，仅重新列出 mtime 发生变化的目录，
+    无需完整遍历整个媒体库即可得到与全量扫描一致的目录树
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_file, root_path, extensions=None):
+        """
+        :param manifest_file: 清单文件路径
+        :param root_path: 根目录
+        :param extensions: 要包含的文件后缀名列表
+        """
+        self.manifest_file = Path(manifest_file)
+        self.root = str(Path(root_path).resolve())
+        self.extensions: Optional[Set[str]] = None
+        if extensions is not None:
+            self.extensions = {
+                ext.lower() if ext.startswith(".") else f".{ext.lower()}"
+                for ext in extensions
+            }
+        # 目录路径 -> [mtime_ns, [文件名]]
+        self.dirs: Dict[str, List] = {}
+        # 父目录路径 -> {子目录路径}，用于定位子目录，避免遍历全部记录
+        self._children: Dict[str, Set[str]] = {}
+
+    def _build_children(self) -> None:
+        """
+        根据目录记录重建父子目录索引
+        """
+        self._children = {}
+        for path in self.dirs:
+            if path != self.root:
+                self._children.setdefault(os.path.dirname(path), set()).add(path)
+
+    def _add_dirs(self, dirs: Dict[str, List]) -> None:
+        """
+        添加目录记录并更新父子目录索引
+        """
+        self.dirs.update(dirs)
+        for path in dirs:
+            if path != self.root:
+                self._children.setdefault(os.path.dirname(path), set()).add(path)
+
+    def _match(self, name: str) -> bool:
+        """
+        文件名后缀是否匹配
+        """
+        return (
+            self.extensions is None
+            or os.path.splitext(name)[1].lower() in self.extensions
+        )
+
+    def load(self) -> bool:
+        """
+        读取清单文件，根目录或后缀配置不一致时视为无效
+
+        :return: 是否读取成功
+        """
+        try:
+            with open(self.manifest_file, "rb") as f:
+                data = loads(f.read())
+        except (FileNotFoundError, JSONDecodeError):
+            return False
+        if (
+            data.get("version") != self.VERSION
+            or data.get("root") != self.root
+            or data.get("extensions")
+            != (sorted(self.extensions) if self.extensions is not None else None)
+        ):
+            return False
+        self.dirs = data.get("dirs", {})
+        self._build_children()
+        return True
+
+    def save(self) -> None:
+        """
+        原子写入清单文件
+        """
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.manifest_file.with_name(f"{self.manifest_file.name}.tmp")
+        with open(temp_file, "wb") as f:
+            f.write(
+                dumps(
+                    {
+                        "version": self.VERSION,
+                        "root": self.root,
+                        "extensions": sorted(self.extensions)
+                        if self.extensions is not None
+                        else None,
+                        "dirs": self.dirs,
+                    }
+                )
+            )
+        os.replace(temp_file, self.manifest_file)
+
+    def _list_dir(self, path: str) -> Optional[Tuple[int, List[str], List[str]]]:
+        """
+        列出单个目录
+
+        :return: (mtime_ns, 匹配文件名列表, 子目录路径列表)，目录不可访问时返回 None
+        """
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file() and self._match(entry.name):
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            return None
+        return mtime, files, subdirs
+
+    def _walk(self, top: str) -> Dict[str, List]:
+        """
+        完整遍历子目录
+        """
+        dirs: Dict[str, List] = {}
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            result = self._list_dir(current)
+            if result is None:
+                continue
+            mtime, files, subdirs = result
+            dirs[current] = [mtime, files]
+            stack.extend(subdirs)
+        return dirs
+
+    def _remove_subtree(self, path: str) -> None:
+        """
+        移除目录及其所有子目录的记录
+        """
+        parent = self._children.get(os.path.dirname(path))
+        if parent is not None:
+            parent.discard(path)
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            self.dirs.pop(current, None)
+            stack.extend(self._children.pop(current, ()))
+
+    def _rescan_dir(self, path: str) -> int:
+        """
+        重新列出发生变化的目录，新出现的子目录完整遍历，消失的子目录移除
+
+        :return: 重新列出的目录数
+        """
+        result = self._list_dir(path)
+        if result is None:
+            self._remove_subtree(path)
+            return 1
+        mtime, files, subdirs = result
+        self._add_dirs({path: [mtime, files]})
+        rescanned = 1
+        current = set(subdirs)
+        for key in list(self._children.get(path, ())):
+            if key not in current:
+                self._remove_subtree(key)
+        for subdir in subdirs:
+            if subdir not in self.dirs:
+                walked = self._walk(subdir)
+                self._add_dirs(walked)
+                rescanned += len(walked)
+        return rescanned
+
+    def sync(self, max_workers: int = 8) -> Dict[str, Any]:
+        """
+        同步清单与磁盘状态
+
+        清单有效时仅对 mtime 变化的目录重新列出，否则并行完整遍历
+
+        :param max_workers: 完整遍历时并行的线程数
+        :return: 统计 {root, mode, dirs, rescanned_dirs, files, elapsed}
+        """
+        start_time = time.perf_counter()
+        if self.load():
+            mode = "manifest"
+            rescanned = 0
+            changed: List[str] = []
+            for path, (mtime, _) in list(self.dirs.items()):
+                try:
+                    if os.stat(path).st_mtime_ns != mtime:
+                        changed.append(path)
+                except OSError:
+                    changed.append(path)
+            # 父目录优先处理，子目录若已被移除则跳过
+            for path in sorted(changed, key=len):
+                if path in self.dirs:
+                    rescanned += self._rescan_dir(path)
+            if self.root not in self.dirs:
+                self._add_dirs(self._walk(self.root))
+        else:
+            mode = "full"
+            self.dirs = {}
+            result = self._list_dir(self.root)
+            if result is not None:
+                mtime, files, subdirs = result
+                self.dirs[self.root] = [mtime, files]
+                if subdirs:
+                    with ThreadPoolExecutor(
+                        max_workers=max(1, min(max_workers, len(subdirs))),
+                        thread_name_prefix="p115strmhelper_manifest",
+                    ) as executor:
+                        for walked in executor.map(self._walk, subdirs):
+                            self.dirs.update(walked)
+            self._build_children()
+            rescanned = len(self.dirs)
+        return {
+            "root": self.root,
+            "mode": mode,
+            "dirs": len(self.dirs),
+            "rescanned_dirs": rescanned,
+            "files": sum(len(files) for _, files in self.dirs.values()),
+            "elapsed": time.perf_counter() - start_time,
+        }
+
+    def refresh_dirs(self, paths) -> None:
+        """
+        重新列出指定目录（例如本次同步写入过文件的目录），使其 mtime 与清单一致
+
+        :param paths: 目录路径列表
+        """
+        prefix = self.root.rstrip(os.sep) + os.sep
+        paths = {
+            path
+            for path in (str(Path(p).resolve()) for p in paths)
+            if path == self.root or path.startswith(prefix)
+        }
+        for path in sorted(paths, key=len):
+            self._rescan_dir(path)
+        # 新建目录时其父目录 mtime 也会变化
+        parents = {os.path.dirname(path) for path in paths}
+        for path in sorted(parents, key=len):
+            if path in self.dirs:
+                result = self._list_dir(path)
+                if result is not None:
+                    self.dirs[path][0] = result[0]
+
+    def write_tree(
+        self, output_file, use_posix: bool = False, with_hash: bool = False
+    ) -> None:
+        """
+        将清单写出为目录树文件，并构建偏移索引
+
+        :param output_file: 输出文件路径
+        :param use_posix: 是否强制使用 posix 风格（/）的路径分隔符
+        :param with_hash: 是否同时生成路径哈希文件
+        """
+        with open(output_file, "w", encoding="utf-8", buffering=1048576) as f_out:
+            for path, (_, files) in self.dirs.items():
+                for name in files:
+                    path_str = os.path.join(path, name)
+                    if use_posix and os.sep != "/":
+                        path_str = path_str.replace(os.sep, "/")
+                    f_out.write(f"{path_str}\n")
+        DirectoryTree.build_index(output_file, with_hash=with_hash)
@@ -1 +1 @@
-VERSION = "2.0.56"
+VERSION = "2.0.57"
@@ -11,7 +11,6 @@ from apscheduler.triggers.cron import CronTrigger
 from fastapi import Request, HTTPException, Depends, Header
 from fastapi.responses import JSONResponse, RedirectResponse
 import requests
-from cachetools import cached, TTLCache
 from p123client import check_response
 from p123client.tool import iterdir, share_iterdir
 
@@ -30,7 +29,7 @@ from app.chain.media import MediaChain
 from app.schemas.types import EventType, MediaType
 from app.utils.system import SystemUtils
 
-from .tool import P123AutoClient
+from .tool import P123AutoClient, P123Redirect
 
 
 class MediaInfoDownloader:
@@ -479,6 +478,7 @@ class P123StrmHelperRemote(_PluginBase):
 
     # 私有属性
     _client = None
+    _redirect = None
     _scheduler = None
     _enabled = False
     _once_full_sync_strm = False
@@ -571,6 +571,7 @@ class P123StrmHelperRemote(_PluginBase):
 
         try:
             self._client = P123AutoClient(self._passport, self._password)
+            self._redirect = P123Redirect(self._client)
         except Exception as e:
             logger.error(f"123云盘客户端创建失败: {e}")
 
@@ -1657,7 +1658,6 @@ class P123StrmHelperRemote(_PluginBase):
 
         logger.info(f"【媒体刮削】{item_name} 刮削元数据完成")
 
-    @cached(cache=TTLCache(maxsize=1, ttl=2 * 60))
     def redirect_url(
         self,
         request: Request,
@@ -1669,49 +1669,22 @@ class P123StrmHelperRemote(_PluginBase):
         """
         123云盘302跳转
         """
-        if not s3_key_flag:
-            try:
-                resp = self._client.fs_mkdir("我的秒传")
-                check_response(resp)
-                resp = self._client.upload_file_fast(
-                    file_md5=md5,
-                    file_name=f"{md5}-{size}",
-                    file_size=size,
-                    parent_id=resp["data"]["Info"]["FileId"],
-                    duplicate=2,
-                )
-                check_response(resp)
-                payload = resp["data"]["Info"]
-                logger.info(
-                    f"【302跳转服务】转存 {name} 文件成功: {payload['S3KeyFlag']}"
-                )
-            except Exception as e:
-                logger.error(f"【302跳转服务】转存 {name} 文件失败: {e}")
-                return JSONResponse(
-                    {"state": False, "message": f"转存 {name} 文件失败: {e}"}, 500
-                )
-        else:
-            payload = {
-                "S3KeyFlag": s3_key_flag,
-                "FileName": name,
-                "Etag": md5,
-                "Size": size,
-            }
-
+        user_agent = request.headers.get("User-Agent") or ""
+        logger.debug(f"【302跳转服务】获取到客户端UA: {user_agent}")
         try:
-            user_agent = request.headers.get("User-Agent") or b""
-            logger.debug(f"【302跳转服务】获取到客户端UA: {user_agent}")
-            resp = self._client.download_info(
-                payload,
-                base_url="",
-                async_=False,
-                headers={"User-Agent": user_agent},
+            url = self._redirect.get_download_url(
+                name=name,
+                size=size,
+                md5=md5,
+                s3_key_flag=s3_key_flag,
+                user_agent=user_agent,
             )
-            check_response(resp)
-            url = resp["data"]["DownloadUrl"]
             logger.info(f"【302跳转服务】获取 123 下载地址成功: {url}")
         except Exception as e:
             logger.error(f"【302跳转服务】获取 123 下载地址失败: {e}")
+            return JSONResponse(
+                {"state": False, "message": f"获取 {name} 下载地址失败: {e}"}, 500
+            )
 
         return RedirectResponse(url, 302)
 
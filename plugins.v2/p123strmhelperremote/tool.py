@@ -1,4 +1,12 @@
-from p123client import P123Client
+from collections import OrderedDict
+from threading import Event, Lock
+from time import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from p123client import P123Client, check_response
+
+from app.log import logger
 
 
 class P123AutoClient:
@@ -33,3 +41,178 @@ class P123AutoClient:
             return result
 
         return wrapped
+
+
+class P123Redirect:
+    """
+    123云盘 302 跳转
+
+    下载链接按 (md5, 大小, UA) 缓存至链接过期前，秒传目录 ID 与文件 S3KeyFlag 缓存复用，
+    相同文件的并发请求合并为一次上游请求
+    """
+
+    # 无法从链接解析过期时间时的缓存时间（秒）
+    default_ttl = 2 * 60
+    # 提前过期时间（秒）
+    expire_margin = 60
+    # 下载链接缓存最大条目数
+    url_maxsize = 4096
+    # S3KeyFlag 缓存最大条目数
+    flag_maxsize = 65536
+    # 等待并发请求结果的超时时间（秒），超时后自行请求上游
+    wait_timeout = 30
+
+    def __init__(self, client):
+        """
+        :param client: 123云盘客户端
+        """
+        self.client = client
+        self._folder_id: Optional[int] = None
+        self._flags: OrderedDict[Tuple[str, int], Dict] = OrderedDict()
+        self._urls: OrderedDict[Tuple[str, int, str], Tuple[str, float]] = OrderedDict()
+        self._lock = Lock()
+        self._calls: Dict[Tuple, Tuple[Event, Dict]] = {}
+
+    @staticmethod
+    def parse_expires(url: str) -> Optional[float]:
+        """
+        从下载链接解析过期时间戳
+        """
+        for key, value in parse_qsl(urlsplit(url).query):
+            if key in ("t", "e", "expires", "expire_time") and value.isdigit():
+                return float(value)
+            if key == "auth_key":
+                # 形如 {timestamp}-{rand}-{uid}-{hash}
+                timestamp = value.split("-", 1)[0]
+                if timestamp.isdigit():
+                    return float(timestamp)
+        return None
+
+    def _get_folder_id(self) -> int:
+        """
+        获取秒传目录 ID
+        """
+        if self._folder_id is None:
+            resp = self.client.fs_mkdir("我的秒传")
+            check_response(resp)
+            self._folder_id = resp["data"]["Info"]["FileId"]
+        return self._folder_id
+
+    def _upload_file_fast(self, md5: str, size: int, parent_id: int) -> Dict:
+        """
+        秒传文件到秒传目录
+        """
+        resp = self.client.upload_file_fast(
+            file_md5=md5,
+            file_name=f"{md5}-{size}",
+            file_size=size,
+            parent_id=parent_id,
+            duplicate=2,
+        )
+        check_response(resp)
+        return resp
+
+    def _get_payload(self, name: str, size: int, md5: str, s3_key_flag: str) -> Dict:
+        """
+        获取下载请求参数，没有 S3KeyFlag 时通过秒传获取
+        """
+        if s3_key_flag:
+            return {
+                "S3KeyFlag": s3_key_flag,
+                "FileName": name,
+                "Etag": md5,
+                "Size": size,
+            }
+        key = (md5, size)
+        with self._lock:
+            if (payload := self._flags.get(key)) is not None:
+                self._flags.move_to_end(key)
+                return payload
+        folder_id = self._get_folder_id()
+        try:
+            resp = self._upload_file_fast(md5, size, folder_id)
+        except Exception:
+            # 秒传目录可能已被删除，重新获取目录 ID，仅在目录变化时重试
+            self._folder_id = None
+            if self._get_folder_id() == folder_id:
+                raise
+            logger.info(
+                f"【302跳转服务】秒传目录已变更: {folder_id} -> {self._folder_id}"
+            )
+            resp = self._upload_file_fast(md5, size, self._folder_id)
+        payload = resp["data"]["Info"]
+        logger.info(f"【302跳转服务】转存 {name} 文件成功: {payload['S3KeyFlag']}")
+        with self._lock:
+            self._flags[key] = payload
+            while len(self._flags) > self.flag_maxsize:
+                self._flags.popitem(last=False)
+        return payload
+
+    def _fetch_url(
+        self, name: str, size: int, md5: str, s3_key_flag: str, user_agent: str
+    ) -> str:
+        """
+        请求上游获取下载链接并写入缓存
+        """
+        payload = self._get_payload(name, size, md5, s3_key_flag)
+        resp = self.client.download_info(
+            payload,
+            base_url="",
+            async_=False,
+            headers={"User-Agent": user_agent},
+        )
+        check_response(resp)
+        url = resp["data"]["DownloadUrl"]
+        expires = self.parse_expires(url) or time() + self.default_ttl
+        expires -= self.expire_margin
+        if expires > time():
+            with self._lock:
+                self._urls[(md5, size, user_agent)] = (url, expires)
+                while len(self._urls) > self.url_maxsize:
+                    self._urls.popitem(last=False)
+        return url
+
+    def get_download_url(
+        self, name: str, size: int, md5: str, s3_key_flag: str, user_agent: str
+    ) -> str:
+        """
+        获取下载链接
+
+        :param name: 文件名
+        :param size: 文件大小
+        :param md5: 文件 MD5
+        :param s3_key_flag: 文件 S3KeyFlag，为空时通过秒传获取
+        :param user_agent: 客户端 UA
+        """
+        key = (md5, size, user_agent)
+        with self._lock:
+            if (entry := self._urls.get(key)) is not None:
+                if entry[1] > time():
+                    self._urls.move_to_end(key)
+                    logger.debug(f"【302跳转服务】缓存获取 {name} {entry[0]}")
+                    return entry[0]
+                del self._urls[key]
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = (Event(), {})
+
+        event, result = call
+        if not leader:
+            if not event.wait(self.wait_timeout):
+                logger.warn(f"【302跳转服务】等待并发请求超时，直接获取 {name}")
+                return self._fetch_url(name, size, md5, s3_key_flag, user_agent)
+            if "error" in result:
+                raise result["error"]
+            return result["url"]
+
+        try:
+            result["url"] = self._fetch_url(name, size, md5, s3_key_flag, user_agent)
+            return result["url"]
+        except Exception as e:
+            result["error"] = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            event.set()
@@ -1,5 +1,6 @@
 import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Dict, Any, Optional
 
@@ -22,6 +23,58 @@ from app.utils.system import SystemUtils
 from app.utils.http import RequestUtils
 
 
+class PathRuleMatcher:
+    """
+    路径规则匹配器
+
+    将多条路径规则按路径组件构建前缀树，查询复杂度只与路径深度有关；
+    多条规则同时匹配时按配置顺序返回第一条
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, rules: List[Tuple[str, List[str]]]):
+        """
+        :param rules: [(规则路径, 分隔后的规则)]，按优先级排列
+        """
+        # 前缀树节点: [子节点字典, (规则序号, 分隔后的规则) | None]
+        self._root: List = [{}, None]
+        for index, (prefix, payload) in enumerate(rules):
+            node = self._root
+            for part in Path(prefix).parts:
+                node = node[0].setdefault(part, [{}, None])
+            if node[1] is None:
+                node[1] = (index, payload)
+
+    def match(self, path) -> Optional[List[str]]:
+        """
+        查找匹配的规则，返回分隔后的规则副本
+        """
+        node = self._root
+        best = node[1]
+        for part in Path(path).parts:
+            node = node[0].get(part)
+            if node is None:
+                break
+            if node[1] is not None and (best is None or node[1][0] < best[0]):
+                best = node[1]
+        return list(best[1]) if best is not None else None
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def compile(paths: str, maxsplit: int) -> "PathRuleMatcher":
+        """
+        编译多行 "匹配路径#..." 配置，附带数据为分隔后的列表，配置变化时自动重新编译
+        """
+        rules = []
+        for path in paths.split("\n"):
+            if not path:
+                continue
+            parts = path.split("#", maxsplit)
+            rules.append((parts[0], parts))
+        return PathRuleMatcher(rules)
+
+
 class SaMediaSyncDel(_PluginBase):
     # 插件名称
     plugin_name = "神医媒体文件同步删除"
@@ -795,55 +848,37 @@ class SaMediaSyncDel(_PluginBase):
             }
         ]
 
-    def has_prefix(self, full_path, prefix_path):
-        """
-        判断路径是否包含
-        """
-        full = Path(full_path).parts
-        prefix = Path(prefix_path).parts
-
-        if len(prefix) > len(full):
-            return False
-
-        return full[: len(prefix)] == prefix
-
     def __get_local_media_path(self, media_path):
         """
         获取本地媒体目录路径
         """
-        media_paths = self._local_library_path.split("\n")
-        for path in media_paths:
-            if not path:
-                continue
-            parts = path.split("#", 1)
-            if self.has_prefix(media_path, parts[0]):
-                return True, parts
+        if not self._local_library_path:
+            return False, None
+        parts = PathRuleMatcher.compile(self._local_library_path, 1).match(media_path)
+        if parts is not None:
+            return True, parts
         return False, None
 
     def __get_p115_media_path(self, media_path):
         """
         获取115网盘媒体目录路径
         """
-        media_paths = self._p115_library_path.split("\n")
-        for path in media_paths:
-            if not path:
-                continue
-            parts = path.split("#", 2)
-            if self.has_prefix(media_path, parts[0]):
-                return True, parts
+        if not self._p115_library_path:
+            return False, None
+        parts = PathRuleMatcher.compile(self._p115_library_path, 2).match(media_path)
+        if parts is not None:
+            return True, parts
         return False, None
 
     def __get_p123_media_path(self, media_path):
         """
         获取123云盘媒体目录路径
         """
-        media_paths = self._p123_library_path.split("\n")
-        for path in media_paths:
-            if not path:
-                continue
-            parts = path.split("#", 2)
-            if self.has_prefix(media_path, parts[0]):
-                return True, parts
+        if not self._p123_library_path:
+            return False, None
+        parts = PathRuleMatcher.compile(self._p123_library_path, 2).match(media_path)
+        if parts is not None:
+            return True, parts
         return False, None
 
     @eventmanager.register(EventType.WebhookMessage)